@@ -1,5 +1,7 @@
 from compositor.error import CompositorError
 from compositor.layoutEngine import LayoutEngine
 from compositor.font import Font, Info, Glyph
+from compositor.fontRegistry import FontRegistry
+from compositor.profiler import Profiler
 
 version = "0.3b"
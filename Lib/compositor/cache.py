@@ -0,0 +1,108 @@
+"""
+A least recently used cache with weighted items.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+
+    """
+    A mapping that discards the least recently used
+    items when the total weight of the stored items
+    exceeds maxWeight. Each item has a weight of one
+    unless a weight is given when it is stored. If
+    maxWeight is None, nothing is ever discarded.
+
+        >>> cache = LRUCache(maxWeight=3)
+        >>> cache.set("a", 1, weight=2)
+        >>> cache.set("b", 2)
+        >>> cache.get("a")
+        1
+        >>> cache.set("c", 3)
+        >>> sorted(cache.keys())
+        ['a', 'c']
+        >>> cache.weight
+        3
+
+    An item that outweighs the cache on its own is
+    kept until the next item is stored.
+
+        >>> cache.set("d", 4, weight=10)
+        >>> list(cache.keys())
+        ['d']
+
+    A frozen cache is never modified. Retrieving items
+    doesn't change their order and storing items
+    is ignored.
+
+        >>> cache.frozen = True
+        >>> cache.set("e", 5)
+        >>> list(cache.keys())
+        ['d']
+    """
+
+    __slots__ = ["maxWeight", "weight", "frozen", "_items"]
+
+    def __init__(self, maxWeight=None):
+        self.maxWeight = maxWeight
+        self.weight = 0
+        self.frozen = False
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __getitem__(self, key):
+        value, weight = self._items[key]
+        if not self.frozen:
+            self._items.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        value, weight = self._items.pop(key)
+        self.weight -= weight
+
+    def get(self, key, default=None):
+        if key not in self._items:
+            return default
+        return self[key]
+
+    def set(self, key, value, weight=1):
+        if self.frozen:
+            return
+        if key in self._items:
+            del self[key]
+        self._items[key] = (value, weight)
+        self.weight += weight
+        self._evict()
+
+    def keys(self):
+        return self._items.keys()
+
+    def values(self):
+        return [value for value, weight in self._items.values()]
+
+    def clear(self):
+        self._items.clear()
+        self.weight = 0
+
+    def _evict(self):
+        maxWeight = self.maxWeight
+        if maxWeight is None:
+            return
+        items = self._items
+        while self.weight > maxWeight and len(items) > 1:
+            key, (value, weight) = items.popitem(last=False)
+            self.weight -= weight
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
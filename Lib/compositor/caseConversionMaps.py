@@ -2,2057 +2,224 @@
 # DO NOT EDIT!
 # ------------
 # This was generated by tools/UnicodeReferenceGenerator.py
-# Generated on: Sat, 08 Sep 2007 10:03:44
+# Generated on: Mon, 19 Oct 2026 17:16:24
 
-lowerToSingleUpper = {   97: 65,
-    98: 66,
-    99: 67,
-    100: 68,
-    101: 69,
-    102: 70,
-    103: 71,
-    104: 72,
-    105: 73,
-    106: 74,
-    107: 75,
-    108: 76,
-    109: 77,
-    110: 78,
-    111: 79,
-    112: 80,
-    113: 81,
-    114: 82,
-    115: 83,
-    116: 84,
-    117: 85,
-    118: 86,
-    119: 87,
-    120: 88,
-    121: 89,
-    122: 90,
-    181: 924,
-    224: 192,
-    225: 193,
-    226: 194,
-    227: 195,
-    228: 196,
-    229: 197,
-    230: 198,
-    231: 199,
-    232: 200,
-    233: 201,
-    234: 202,
-    235: 203,
-    236: 204,
-    237: 205,
-    238: 206,
-    239: 207,
-    240: 208,
-    241: 209,
-    242: 210,
-    243: 211,
-    244: 212,
-    245: 213,
-    246: 214,
-    248: 216,
-    249: 217,
-    250: 218,
-    251: 219,
-    252: 220,
-    253: 221,
-    254: 222,
-    255: 376,
-    257: 256,
-    259: 258,
-    261: 260,
-    263: 262,
-    265: 264,
-    267: 266,
-    269: 268,
-    271: 270,
-    273: 272,
-    275: 274,
-    277: 276,
-    279: 278,
-    281: 280,
-    283: 282,
-    285: 284,
-    287: 286,
-    289: 288,
-    291: 290,
-    293: 292,
-    295: 294,
-    297: 296,
-    299: 298,
-    301: 300,
-    303: 302,
-    305: 73,
-    307: 306,
-    309: 308,
-    311: 310,
-    314: 313,
-    316: 315,
-    318: 317,
-    320: 319,
-    322: 321,
-    324: 323,
-    326: 325,
-    328: 327,
-    331: 330,
-    333: 332,
-    335: 334,
-    337: 336,
-    339: 338,
-    341: 340,
-    343: 342,
-    345: 344,
-    347: 346,
-    349: 348,
-    351: 350,
-    353: 352,
-    355: 354,
-    357: 356,
-    359: 358,
-    361: 360,
-    363: 362,
-    365: 364,
-    367: 366,
-    369: 368,
-    371: 370,
-    373: 372,
-    375: 374,
-    378: 377,
-    380: 379,
-    382: 381,
-    383: 83,
-    384: 579,
-    387: 386,
-    389: 388,
-    392: 391,
-    396: 395,
-    402: 401,
-    405: 502,
-    409: 408,
-    410: 573,
-    414: 544,
-    417: 416,
-    419: 418,
-    421: 420,
-    424: 423,
-    429: 428,
-    432: 431,
-    436: 435,
-    438: 437,
-    441: 440,
-    445: 444,
-    447: 503,
-    453: 452,
-    454: 452,
-    456: 455,
-    457: 455,
-    459: 458,
-    460: 458,
-    462: 461,
-    464: 463,
-    466: 465,
-    468: 467,
-    470: 469,
-    472: 471,
-    474: 473,
-    476: 475,
-    477: 398,
-    479: 478,
-    481: 480,
-    483: 482,
-    485: 484,
-    487: 486,
-    489: 488,
-    491: 490,
-    493: 492,
-    495: 494,
-    498: 497,
-    499: 497,
-    501: 500,
-    505: 504,
-    507: 506,
-    509: 508,
-    511: 510,
-    513: 512,
-    515: 514,
-    517: 516,
-    519: 518,
-    521: 520,
-    523: 522,
-    525: 524,
-    527: 526,
-    529: 528,
-    531: 530,
-    533: 532,
-    535: 534,
-    537: 536,
-    539: 538,
-    541: 540,
-    543: 542,
-    547: 546,
-    549: 548,
-    551: 550,
-    553: 552,
-    555: 554,
-    557: 556,
-    559: 558,
-    561: 560,
-    563: 562,
-    572: 571,
-    578: 577,
-    583: 582,
-    585: 584,
-    587: 586,
-    589: 588,
-    591: 590,
-    595: 385,
-    596: 390,
-    598: 393,
-    599: 394,
-    601: 399,
-    603: 400,
-    608: 403,
-    611: 404,
-    616: 407,
-    617: 406,
-    619: 11362,
-    623: 412,
-    626: 413,
-    629: 415,
-    637: 11364,
-    640: 422,
-    643: 425,
-    648: 430,
-    649: 580,
-    650: 433,
-    651: 434,
-    652: 581,
-    658: 439,
-    837: 921,
-    891: 1021,
-    892: 1022,
-    893: 1023,
-    940: 902,
-    941: 904,
-    942: 905,
-    943: 906,
-    945: 913,
-    946: 914,
-    947: 915,
-    948: 916,
-    949: 917,
-    950: 918,
-    951: 919,
-    952: 920,
-    953: 921,
-    954: 922,
-    955: 923,
-    956: 924,
-    957: 925,
-    958: 926,
-    959: 927,
-    960: 928,
-    961: 929,
-    962: 931,
-    963: 931,
-    964: 932,
-    965: 933,
-    966: 934,
-    967: 935,
-    968: 936,
-    969: 937,
-    970: 938,
-    971: 939,
-    972: 908,
-    973: 910,
-    974: 911,
-    976: 914,
-    977: 920,
-    981: 934,
-    982: 928,
-    985: 984,
-    987: 986,
-    989: 988,
-    991: 990,
-    993: 992,
-    995: 994,
-    997: 996,
-    999: 998,
-    1001: 1000,
-    1003: 1002,
-    1005: 1004,
-    1007: 1006,
-    1008: 922,
-    1009: 929,
-    1010: 1017,
-    1013: 917,
-    1016: 1015,
-    1019: 1018,
-    1072: 1040,
-    1073: 1041,
-    1074: 1042,
-    1075: 1043,
-    1076: 1044,
-    1077: 1045,
-    1078: 1046,
-    1079: 1047,
-    1080: 1048,
-    1081: 1049,
-    1082: 1050,
-    1083: 1051,
-    1084: 1052,
-    1085: 1053,
-    1086: 1054,
-    1087: 1055,
-    1088: 1056,
-    1089: 1057,
-    1090: 1058,
-    1091: 1059,
-    1092: 1060,
-    1093: 1061,
-    1094: 1062,
-    1095: 1063,
-    1096: 1064,
-    1097: 1065,
-    1098: 1066,
-    1099: 1067,
-    1100: 1068,
-    1101: 1069,
-    1102: 1070,
-    1103: 1071,
-    1104: 1024,
-    1105: 1025,
-    1106: 1026,
-    1107: 1027,
-    1108: 1028,
-    1109: 1029,
-    1110: 1030,
-    1111: 1031,
-    1112: 1032,
-    1113: 1033,
-    1114: 1034,
-    1115: 1035,
-    1116: 1036,
-    1117: 1037,
-    1118: 1038,
-    1119: 1039,
-    1121: 1120,
-    1123: 1122,
-    1125: 1124,
-    1127: 1126,
-    1129: 1128,
-    1131: 1130,
-    1133: 1132,
-    1135: 1134,
-    1137: 1136,
-    1139: 1138,
-    1141: 1140,
-    1143: 1142,
-    1145: 1144,
-    1147: 1146,
-    1149: 1148,
-    1151: 1150,
-    1153: 1152,
-    1163: 1162,
-    1165: 1164,
-    1167: 1166,
-    1169: 1168,
-    1171: 1170,
-    1173: 1172,
-    1175: 1174,
-    1177: 1176,
-    1179: 1178,
-    1181: 1180,
-    1183: 1182,
-    1185: 1184,
-    1187: 1186,
-    1189: 1188,
-    1191: 1190,
-    1193: 1192,
-    1195: 1194,
-    1197: 1196,
-    1199: 1198,
-    1201: 1200,
-    1203: 1202,
-    1205: 1204,
-    1207: 1206,
-    1209: 1208,
-    1211: 1210,
-    1213: 1212,
-    1215: 1214,
-    1218: 1217,
-    1220: 1219,
-    1222: 1221,
-    1224: 1223,
-    1226: 1225,
-    1228: 1227,
-    1230: 1229,
-    1231: 1216,
-    1233: 1232,
-    1235: 1234,
-    1237: 1236,
-    1239: 1238,
-    1241: 1240,
-    1243: 1242,
-    1245: 1244,
-    1247: 1246,
-    1249: 1248,
-    1251: 1250,
-    1253: 1252,
-    1255: 1254,
-    1257: 1256,
-    1259: 1258,
-    1261: 1260,
-    1263: 1262,
-    1265: 1264,
-    1267: 1266,
-    1269: 1268,
-    1271: 1270,
-    1273: 1272,
-    1275: 1274,
-    1277: 1276,
-    1279: 1278,
-    1281: 1280,
-    1283: 1282,
-    1285: 1284,
-    1287: 1286,
-    1289: 1288,
-    1291: 1290,
-    1293: 1292,
-    1295: 1294,
-    1297: 1296,
-    1299: 1298,
-    1377: 1329,
-    1378: 1330,
-    1379: 1331,
-    1380: 1332,
-    1381: 1333,
-    1382: 1334,
-    1383: 1335,
-    1384: 1336,
-    1385: 1337,
-    1386: 1338,
-    1387: 1339,
-    1388: 1340,
-    1389: 1341,
-    1390: 1342,
-    1391: 1343,
-    1392: 1344,
-    1393: 1345,
-    1394: 1346,
-    1395: 1347,
-    1396: 1348,
-    1397: 1349,
-    1398: 1350,
-    1399: 1351,
-    1400: 1352,
-    1401: 1353,
-    1402: 1354,
-    1403: 1355,
-    1404: 1356,
-    1405: 1357,
-    1406: 1358,
-    1407: 1359,
-    1408: 1360,
-    1409: 1361,
-    1410: 1362,
-    1411: 1363,
-    1412: 1364,
-    1413: 1365,
-    1414: 1366,
-    7549: 11363,
-    7681: 7680,
-    7683: 7682,
-    7685: 7684,
-    7687: 7686,
-    7689: 7688,
-    7691: 7690,
-    7693: 7692,
-    7695: 7694,
-    7697: 7696,
-    7699: 7698,
-    7701: 7700,
-    7703: 7702,
-    7705: 7704,
-    7707: 7706,
-    7709: 7708,
-    7711: 7710,
-    7713: 7712,
-    7715: 7714,
-    7717: 7716,
-    7719: 7718,
-    7721: 7720,
-    7723: 7722,
-    7725: 7724,
-    7727: 7726,
-    7729: 7728,
-    7731: 7730,
-    7733: 7732,
-    7735: 7734,
-    7737: 7736,
-    7739: 7738,
-    7741: 7740,
-    7743: 7742,
-    7745: 7744,
-    7747: 7746,
-    7749: 7748,
-    7751: 7750,
-    7753: 7752,
-    7755: 7754,
-    7757: 7756,
-    7759: 7758,
-    7761: 7760,
-    7763: 7762,
-    7765: 7764,
-    7767: 7766,
-    7769: 7768,
-    7771: 7770,
-    7773: 7772,
-    7775: 7774,
-    7777: 7776,
-    7779: 7778,
-    7781: 7780,
-    7783: 7782,
-    7785: 7784,
-    7787: 7786,
-    7789: 7788,
-    7791: 7790,
-    7793: 7792,
-    7795: 7794,
-    7797: 7796,
-    7799: 7798,
-    7801: 7800,
-    7803: 7802,
-    7805: 7804,
-    7807: 7806,
-    7809: 7808,
-    7811: 7810,
-    7813: 7812,
-    7815: 7814,
-    7817: 7816,
-    7819: 7818,
-    7821: 7820,
-    7823: 7822,
-    7825: 7824,
-    7827: 7826,
-    7829: 7828,
-    7835: 7776,
-    7841: 7840,
-    7843: 7842,
-    7845: 7844,
-    7847: 7846,
-    7849: 7848,
-    7851: 7850,
-    7853: 7852,
-    7855: 7854,
-    7857: 7856,
-    7859: 7858,
-    7861: 7860,
-    7863: 7862,
-    7865: 7864,
-    7867: 7866,
-    7869: 7868,
-    7871: 7870,
-    7873: 7872,
-    7875: 7874,
-    7877: 7876,
-    7879: 7878,
-    7881: 7880,
-    7883: 7882,
-    7885: 7884,
-    7887: 7886,
-    7889: 7888,
-    7891: 7890,
-    7893: 7892,
-    7895: 7894,
-    7897: 7896,
-    7899: 7898,
-    7901: 7900,
-    7903: 7902,
-    7905: 7904,
-    7907: 7906,
-    7909: 7908,
-    7911: 7910,
-    7913: 7912,
-    7915: 7914,
-    7917: 7916,
-    7919: 7918,
-    7921: 7920,
-    7923: 7922,
-    7925: 7924,
-    7927: 7926,
-    7929: 7928,
-    7936: 7944,
-    7937: 7945,
-    7938: 7946,
-    7939: 7947,
-    7940: 7948,
-    7941: 7949,
-    7942: 7950,
-    7943: 7951,
-    7952: 7960,
-    7953: 7961,
-    7954: 7962,
-    7955: 7963,
-    7956: 7964,
-    7957: 7965,
-    7968: 7976,
-    7969: 7977,
-    7970: 7978,
-    7971: 7979,
-    7972: 7980,
-    7973: 7981,
-    7974: 7982,
-    7975: 7983,
-    7984: 7992,
-    7985: 7993,
-    7986: 7994,
-    7987: 7995,
-    7988: 7996,
-    7989: 7997,
-    7990: 7998,
-    7991: 7999,
-    8000: 8008,
-    8001: 8009,
-    8002: 8010,
-    8003: 8011,
-    8004: 8012,
-    8005: 8013,
-    8017: 8025,
-    8019: 8027,
-    8021: 8029,
-    8023: 8031,
-    8032: 8040,
-    8033: 8041,
-    8034: 8042,
-    8035: 8043,
-    8036: 8044,
-    8037: 8045,
-    8038: 8046,
-    8039: 8047,
-    8048: 8122,
-    8049: 8123,
-    8050: 8136,
-    8051: 8137,
-    8052: 8138,
-    8053: 8139,
-    8054: 8154,
-    8055: 8155,
-    8056: 8184,
-    8057: 8185,
-    8058: 8170,
-    8059: 8171,
-    8060: 8186,
-    8061: 8187,
-    8064: 8072,
-    8065: 8073,
-    8066: 8074,
-    8067: 8075,
-    8068: 8076,
-    8069: 8077,
-    8070: 8078,
-    8071: 8079,
-    8080: 8088,
-    8081: 8089,
-    8082: 8090,
-    8083: 8091,
-    8084: 8092,
-    8085: 8093,
-    8086: 8094,
-    8087: 8095,
-    8096: 8104,
-    8097: 8105,
-    8098: 8106,
-    8099: 8107,
-    8100: 8108,
-    8101: 8109,
-    8102: 8110,
-    8103: 8111,
-    8112: 8120,
-    8113: 8121,
-    8115: 8124,
-    8126: 921,
-    8131: 8140,
-    8144: 8152,
-    8145: 8153,
-    8160: 8168,
-    8161: 8169,
-    8165: 8172,
-    8179: 8188,
-    8526: 8498,
-    8560: 8544,
-    8561: 8545,
-    8562: 8546,
-    8563: 8547,
-    8564: 8548,
-    8565: 8549,
-    8566: 8550,
-    8567: 8551,
-    8568: 8552,
-    8569: 8553,
-    8570: 8554,
-    8571: 8555,
-    8572: 8556,
-    8573: 8557,
-    8574: 8558,
-    8575: 8559,
-    8580: 8579,
-    9424: 9398,
-    9425: 9399,
-    9426: 9400,
-    9427: 9401,
-    9428: 9402,
-    9429: 9403,
-    9430: 9404,
-    9431: 9405,
-    9432: 9406,
-    9433: 9407,
-    9434: 9408,
-    9435: 9409,
-    9436: 9410,
-    9437: 9411,
-    9438: 9412,
-    9439: 9413,
-    9440: 9414,
-    9441: 9415,
-    9442: 9416,
-    9443: 9417,
-    9444: 9418,
-    9445: 9419,
-    9446: 9420,
-    9447: 9421,
-    9448: 9422,
-    9449: 9423,
-    11312: 11264,
-    11313: 11265,
-    11314: 11266,
-    11315: 11267,
-    11316: 11268,
-    11317: 11269,
-    11318: 11270,
-    11319: 11271,
-    11320: 11272,
-    11321: 11273,
-    11322: 11274,
-    11323: 11275,
-    11324: 11276,
-    11325: 11277,
-    11326: 11278,
-    11327: 11279,
-    11328: 11280,
-    11329: 11281,
-    11330: 11282,
-    11331: 11283,
-    11332: 11284,
-    11333: 11285,
-    11334: 11286,
-    11335: 11287,
-    11336: 11288,
-    11337: 11289,
-    11338: 11290,
-    11339: 11291,
-    11340: 11292,
-    11341: 11293,
-    11342: 11294,
-    11343: 11295,
-    11344: 11296,
-    11345: 11297,
-    11346: 11298,
-    11347: 11299,
-    11348: 11300,
-    11349: 11301,
-    11350: 11302,
-    11351: 11303,
-    11352: 11304,
-    11353: 11305,
-    11354: 11306,
-    11355: 11307,
-    11356: 11308,
-    11357: 11309,
-    11358: 11310,
-    11361: 11360,
-    11365: 570,
-    11366: 574,
-    11368: 11367,
-    11370: 11369,
-    11372: 11371,
-    11382: 11381,
-    11393: 11392,
-    11395: 11394,
-    11397: 11396,
-    11399: 11398,
-    11401: 11400,
-    11403: 11402,
-    11405: 11404,
-    11407: 11406,
-    11409: 11408,
-    11411: 11410,
-    11413: 11412,
-    11415: 11414,
-    11417: 11416,
-    11419: 11418,
-    11421: 11420,
-    11423: 11422,
-    11425: 11424,
-    11427: 11426,
-    11429: 11428,
-    11431: 11430,
-    11433: 11432,
-    11435: 11434,
-    11437: 11436,
-    11439: 11438,
-    11441: 11440,
-    11443: 11442,
-    11445: 11444,
-    11447: 11446,
-    11449: 11448,
-    11451: 11450,
-    11453: 11452,
-    11455: 11454,
-    11457: 11456,
-    11459: 11458,
-    11461: 11460,
-    11463: 11462,
-    11465: 11464,
-    11467: 11466,
-    11469: 11468,
-    11471: 11470,
-    11473: 11472,
-    11475: 11474,
-    11477: 11476,
-    11479: 11478,
-    11481: 11480,
-    11483: 11482,
-    11485: 11484,
-    11487: 11486,
-    11489: 11488,
-    11491: 11490,
-    11520: 4256,
-    11521: 4257,
-    11522: 4258,
-    11523: 4259,
-    11524: 4260,
-    11525: 4261,
-    11526: 4262,
-    11527: 4263,
-    11528: 4264,
-    11529: 4265,
-    11530: 4266,
-    11531: 4267,
-    11532: 4268,
-    11533: 4269,
-    11534: 4270,
-    11535: 4271,
-    11536: 4272,
-    11537: 4273,
-    11538: 4274,
-    11539: 4275,
-    11540: 4276,
-    11541: 4277,
-    11542: 4278,
-    11543: 4279,
-    11544: 4280,
-    11545: 4281,
-    11546: 4282,
-    11547: 4283,
-    11548: 4284,
-    11549: 4285,
-    11550: 4286,
-    11551: 4287,
-    11552: 4288,
-    11553: 4289,
-    11554: 4290,
-    11555: 4291,
-    11556: 4292,
-    11557: 4293,
-    65345: 65313,
-    65346: 65314,
-    65347: 65315,
-    65348: 65316,
-    65349: 65317,
-    65350: 65318,
-    65351: 65319,
-    65352: 65320,
-    65353: 65321,
-    65354: 65322,
-    65355: 65323,
-    65356: 65324,
-    65357: 65325,
-    65358: 65326,
-    65359: 65327,
-    65360: 65328,
-    65361: 65329,
-    65362: 65330,
-    65363: 65331,
-    65364: 65332,
-    65365: 65333,
-    65366: 65334,
-    65367: 65335,
-    65368: 65336,
-    65369: 65337,
-    65370: 65338,
-    66600: 66560,
-    66601: 66561,
-    66602: 66562,
-    66603: 66563,
-    66604: 66564,
-    66605: 66565,
-    66606: 66566,
-    66607: 66567,
-    66608: 66568,
-    66609: 66569,
-    66610: 66570,
-    66611: 66571,
-    66612: 66572,
-    66613: 66573,
-    66614: 66574,
-    66615: 66575,
-    66616: 66576,
-    66617: 66577,
-    66618: 66578,
-    66619: 66579,
-    66620: 66580,
-    66621: 66581,
-    66622: 66582,
-    66623: 66583,
-    66624: 66584,
-    66625: 66585,
-    66626: 66586,
-    66627: 66587,
-    66628: 66588,
-    66629: 66589,
-    66630: 66590,
-    66631: 66591,
-    66632: 66592,
-    66633: 66593,
-    66634: 66594,
-    66635: 66595,
-    66636: 66596,
-    66637: 66597,
-    66638: 66598,
-    66639: 66599}
+from array import array
 
-upperToSingleLower = {   65: 97,
-    66: 98,
-    67: 99,
-    68: 100,
-    69: 101,
-    70: 102,
-    71: 103,
-    72: 104,
-    73: 105,
-    74: 106,
-    75: 107,
-    76: 108,
-    77: 109,
-    78: 110,
-    79: 111,
-    80: 112,
-    81: 113,
-    82: 114,
-    83: 115,
-    84: 116,
-    85: 117,
-    86: 118,
-    87: 119,
-    88: 120,
-    89: 121,
-    90: 122,
-    192: 224,
-    193: 225,
-    194: 226,
-    195: 227,
-    196: 228,
-    197: 229,
-    198: 230,
-    199: 231,
-    200: 232,
-    201: 233,
-    202: 234,
-    203: 235,
-    204: 236,
-    205: 237,
-    206: 238,
-    207: 239,
-    208: 240,
-    209: 241,
-    210: 242,
-    211: 243,
-    212: 244,
-    213: 245,
-    214: 246,
-    216: 248,
-    217: 249,
-    218: 250,
-    219: 251,
-    220: 252,
-    221: 253,
-    222: 254,
-    256: 257,
-    258: 259,
-    260: 261,
-    262: 263,
-    264: 265,
-    266: 267,
-    268: 269,
-    270: 271,
-    272: 273,
-    274: 275,
-    276: 277,
-    278: 279,
-    280: 281,
-    282: 283,
-    284: 285,
-    286: 287,
-    288: 289,
-    290: 291,
-    292: 293,
-    294: 295,
-    296: 297,
-    298: 299,
-    300: 301,
-    302: 303,
-    304: 105,
-    306: 307,
-    308: 309,
-    310: 311,
-    313: 314,
-    315: 316,
-    317: 318,
-    319: 320,
-    321: 322,
-    323: 324,
-    325: 326,
-    327: 328,
-    330: 331,
-    332: 333,
-    334: 335,
-    336: 337,
-    338: 339,
-    340: 341,
-    342: 343,
-    344: 345,
-    346: 347,
-    348: 349,
-    350: 351,
-    352: 353,
-    354: 355,
-    356: 357,
-    358: 359,
-    360: 361,
-    362: 363,
-    364: 365,
-    366: 367,
-    368: 369,
-    370: 371,
-    372: 373,
-    374: 375,
-    376: 255,
-    377: 378,
-    379: 380,
-    381: 382,
-    385: 595,
-    386: 387,
-    388: 389,
-    390: 596,
-    391: 392,
-    393: 598,
-    394: 599,
-    395: 396,
-    398: 477,
-    399: 601,
-    400: 603,
-    401: 402,
-    403: 608,
-    404: 611,
-    406: 617,
-    407: 616,
-    408: 409,
-    412: 623,
-    413: 626,
-    415: 629,
-    416: 417,
-    418: 419,
-    420: 421,
-    422: 640,
-    423: 424,
-    425: 643,
-    428: 429,
-    430: 648,
-    431: 432,
-    433: 650,
-    434: 651,
-    435: 436,
-    437: 438,
-    439: 658,
-    440: 441,
-    444: 445,
-    452: 454,
-    453: 454,
-    455: 457,
-    456: 457,
-    458: 460,
-    459: 460,
-    461: 462,
-    463: 464,
-    465: 466,
-    467: 468,
-    469: 470,
-    471: 472,
-    473: 474,
-    475: 476,
-    478: 479,
-    480: 481,
-    482: 483,
-    484: 485,
-    486: 487,
-    488: 489,
-    490: 491,
-    492: 493,
-    494: 495,
-    497: 499,
-    498: 499,
-    500: 501,
-    502: 405,
-    503: 447,
-    504: 505,
-    506: 507,
-    508: 509,
-    510: 511,
-    512: 513,
-    514: 515,
-    516: 517,
-    518: 519,
-    520: 521,
-    522: 523,
-    524: 525,
-    526: 527,
-    528: 529,
-    530: 531,
-    532: 533,
-    534: 535,
-    536: 537,
-    538: 539,
-    540: 541,
-    542: 543,
-    544: 414,
-    546: 547,
-    548: 549,
-    550: 551,
-    552: 553,
-    554: 555,
-    556: 557,
-    558: 559,
-    560: 561,
-    562: 563,
-    570: 11365,
-    571: 572,
-    573: 410,
-    574: 11366,
-    577: 578,
-    579: 384,
-    580: 649,
-    581: 652,
-    582: 583,
-    584: 585,
-    586: 587,
-    588: 589,
-    590: 591,
-    902: 940,
-    904: 941,
-    905: 942,
-    906: 943,
-    908: 972,
-    910: 973,
-    911: 974,
-    913: 945,
-    914: 946,
-    915: 947,
-    916: 948,
-    917: 949,
-    918: 950,
-    919: 951,
-    920: 952,
-    921: 953,
-    922: 954,
-    923: 955,
-    924: 956,
-    925: 957,
-    926: 958,
-    927: 959,
-    928: 960,
-    929: 961,
-    931: 963,
-    932: 964,
-    933: 965,
-    934: 966,
-    935: 967,
-    936: 968,
-    937: 969,
-    938: 970,
-    939: 971,
-    984: 985,
-    986: 987,
-    988: 989,
-    990: 991,
-    992: 993,
-    994: 995,
-    996: 997,
-    998: 999,
-    1000: 1001,
-    1002: 1003,
-    1004: 1005,
-    1006: 1007,
-    1012: 952,
-    1015: 1016,
-    1017: 1010,
-    1018: 1019,
-    1021: 891,
-    1022: 892,
-    1023: 893,
-    1024: 1104,
-    1025: 1105,
-    1026: 1106,
-    1027: 1107,
-    1028: 1108,
-    1029: 1109,
-    1030: 1110,
-    1031: 1111,
-    1032: 1112,
-    1033: 1113,
-    1034: 1114,
-    1035: 1115,
-    1036: 1116,
-    1037: 1117,
-    1038: 1118,
-    1039: 1119,
-    1040: 1072,
-    1041: 1073,
-    1042: 1074,
-    1043: 1075,
-    1044: 1076,
-    1045: 1077,
-    1046: 1078,
-    1047: 1079,
-    1048: 1080,
-    1049: 1081,
-    1050: 1082,
-    1051: 1083,
-    1052: 1084,
-    1053: 1085,
-    1054: 1086,
-    1055: 1087,
-    1056: 1088,
-    1057: 1089,
-    1058: 1090,
-    1059: 1091,
-    1060: 1092,
-    1061: 1093,
-    1062: 1094,
-    1063: 1095,
-    1064: 1096,
-    1065: 1097,
-    1066: 1098,
-    1067: 1099,
-    1068: 1100,
-    1069: 1101,
-    1070: 1102,
-    1071: 1103,
-    1120: 1121,
-    1122: 1123,
-    1124: 1125,
-    1126: 1127,
-    1128: 1129,
-    1130: 1131,
-    1132: 1133,
-    1134: 1135,
-    1136: 1137,
-    1138: 1139,
-    1140: 1141,
-    1142: 1143,
-    1144: 1145,
-    1146: 1147,
-    1148: 1149,
-    1150: 1151,
-    1152: 1153,
-    1162: 1163,
-    1164: 1165,
-    1166: 1167,
-    1168: 1169,
-    1170: 1171,
-    1172: 1173,
-    1174: 1175,
-    1176: 1177,
-    1178: 1179,
-    1180: 1181,
-    1182: 1183,
-    1184: 1185,
-    1186: 1187,
-    1188: 1189,
-    1190: 1191,
-    1192: 1193,
-    1194: 1195,
-    1196: 1197,
-    1198: 1199,
-    1200: 1201,
-    1202: 1203,
-    1204: 1205,
-    1206: 1207,
-    1208: 1209,
-    1210: 1211,
-    1212: 1213,
-    1214: 1215,
-    1216: 1231,
-    1217: 1218,
-    1219: 1220,
-    1221: 1222,
-    1223: 1224,
-    1225: 1226,
-    1227: 1228,
-    1229: 1230,
-    1232: 1233,
-    1234: 1235,
-    1236: 1237,
-    1238: 1239,
-    1240: 1241,
-    1242: 1243,
-    1244: 1245,
-    1246: 1247,
-    1248: 1249,
-    1250: 1251,
-    1252: 1253,
-    1254: 1255,
-    1256: 1257,
-    1258: 1259,
-    1260: 1261,
-    1262: 1263,
-    1264: 1265,
-    1266: 1267,
-    1268: 1269,
-    1270: 1271,
-    1272: 1273,
-    1274: 1275,
-    1276: 1277,
-    1278: 1279,
-    1280: 1281,
-    1282: 1283,
-    1284: 1285,
-    1286: 1287,
-    1288: 1289,
-    1290: 1291,
-    1292: 1293,
-    1294: 1295,
-    1296: 1297,
-    1298: 1299,
-    1329: 1377,
-    1330: 1378,
-    1331: 1379,
-    1332: 1380,
-    1333: 1381,
-    1334: 1382,
-    1335: 1383,
-    1336: 1384,
-    1337: 1385,
-    1338: 1386,
-    1339: 1387,
-    1340: 1388,
-    1341: 1389,
-    1342: 1390,
-    1343: 1391,
-    1344: 1392,
-    1345: 1393,
-    1346: 1394,
-    1347: 1395,
-    1348: 1396,
-    1349: 1397,
-    1350: 1398,
-    1351: 1399,
-    1352: 1400,
-    1353: 1401,
-    1354: 1402,
-    1355: 1403,
-    1356: 1404,
-    1357: 1405,
-    1358: 1406,
-    1359: 1407,
-    1360: 1408,
-    1361: 1409,
-    1362: 1410,
-    1363: 1411,
-    1364: 1412,
-    1365: 1413,
-    1366: 1414,
-    4256: 11520,
-    4257: 11521,
-    4258: 11522,
-    4259: 11523,
-    4260: 11524,
-    4261: 11525,
-    4262: 11526,
-    4263: 11527,
-    4264: 11528,
-    4265: 11529,
-    4266: 11530,
-    4267: 11531,
-    4268: 11532,
-    4269: 11533,
-    4270: 11534,
-    4271: 11535,
-    4272: 11536,
-    4273: 11537,
-    4274: 11538,
-    4275: 11539,
-    4276: 11540,
-    4277: 11541,
-    4278: 11542,
-    4279: 11543,
-    4280: 11544,
-    4281: 11545,
-    4282: 11546,
-    4283: 11547,
-    4284: 11548,
-    4285: 11549,
-    4286: 11550,
-    4287: 11551,
-    4288: 11552,
-    4289: 11553,
-    4290: 11554,
-    4291: 11555,
-    4292: 11556,
-    4293: 11557,
-    7680: 7681,
-    7682: 7683,
-    7684: 7685,
-    7686: 7687,
-    7688: 7689,
-    7690: 7691,
-    7692: 7693,
-    7694: 7695,
-    7696: 7697,
-    7698: 7699,
-    7700: 7701,
-    7702: 7703,
-    7704: 7705,
-    7706: 7707,
-    7708: 7709,
-    7710: 7711,
-    7712: 7713,
-    7714: 7715,
-    7716: 7717,
-    7718: 7719,
-    7720: 7721,
-    7722: 7723,
-    7724: 7725,
-    7726: 7727,
-    7728: 7729,
-    7730: 7731,
-    7732: 7733,
-    7734: 7735,
-    7736: 7737,
-    7738: 7739,
-    7740: 7741,
-    7742: 7743,
-    7744: 7745,
-    7746: 7747,
-    7748: 7749,
-    7750: 7751,
-    7752: 7753,
-    7754: 7755,
-    7756: 7757,
-    7758: 7759,
-    7760: 7761,
-    7762: 7763,
-    7764: 7765,
-    7766: 7767,
-    7768: 7769,
-    7770: 7771,
-    7772: 7773,
-    7774: 7775,
-    7776: 7777,
-    7778: 7779,
-    7780: 7781,
-    7782: 7783,
-    7784: 7785,
-    7786: 7787,
-    7788: 7789,
-    7790: 7791,
-    7792: 7793,
-    7794: 7795,
-    7796: 7797,
-    7798: 7799,
-    7800: 7801,
-    7802: 7803,
-    7804: 7805,
-    7806: 7807,
-    7808: 7809,
-    7810: 7811,
-    7812: 7813,
-    7814: 7815,
-    7816: 7817,
-    7818: 7819,
-    7820: 7821,
-    7822: 7823,
-    7824: 7825,
-    7826: 7827,
-    7828: 7829,
-    7840: 7841,
-    7842: 7843,
-    7844: 7845,
-    7846: 7847,
-    7848: 7849,
-    7850: 7851,
-    7852: 7853,
-    7854: 7855,
-    7856: 7857,
-    7858: 7859,
-    7860: 7861,
-    7862: 7863,
-    7864: 7865,
-    7866: 7867,
-    7868: 7869,
-    7870: 7871,
-    7872: 7873,
-    7874: 7875,
-    7876: 7877,
-    7878: 7879,
-    7880: 7881,
-    7882: 7883,
-    7884: 7885,
-    7886: 7887,
-    7888: 7889,
-    7890: 7891,
-    7892: 7893,
-    7894: 7895,
-    7896: 7897,
-    7898: 7899,
-    7900: 7901,
-    7902: 7903,
-    7904: 7905,
-    7906: 7907,
-    7908: 7909,
-    7910: 7911,
-    7912: 7913,
-    7914: 7915,
-    7916: 7917,
-    7918: 7919,
-    7920: 7921,
-    7922: 7923,
-    7924: 7925,
-    7926: 7927,
-    7928: 7929,
-    7944: 7936,
-    7945: 7937,
-    7946: 7938,
-    7947: 7939,
-    7948: 7940,
-    7949: 7941,
-    7950: 7942,
-    7951: 7943,
-    7960: 7952,
-    7961: 7953,
-    7962: 7954,
-    7963: 7955,
-    7964: 7956,
-    7965: 7957,
-    7976: 7968,
-    7977: 7969,
-    7978: 7970,
-    7979: 7971,
-    7980: 7972,
-    7981: 7973,
-    7982: 7974,
-    7983: 7975,
-    7992: 7984,
-    7993: 7985,
-    7994: 7986,
-    7995: 7987,
-    7996: 7988,
-    7997: 7989,
-    7998: 7990,
-    7999: 7991,
-    8008: 8000,
-    8009: 8001,
-    8010: 8002,
-    8011: 8003,
-    8012: 8004,
-    8013: 8005,
-    8025: 8017,
-    8027: 8019,
-    8029: 8021,
-    8031: 8023,
-    8040: 8032,
-    8041: 8033,
-    8042: 8034,
-    8043: 8035,
-    8044: 8036,
-    8045: 8037,
-    8046: 8038,
-    8047: 8039,
-    8072: 8064,
-    8073: 8065,
-    8074: 8066,
-    8075: 8067,
-    8076: 8068,
-    8077: 8069,
-    8078: 8070,
-    8079: 8071,
-    8088: 8080,
-    8089: 8081,
-    8090: 8082,
-    8091: 8083,
-    8092: 8084,
-    8093: 8085,
-    8094: 8086,
-    8095: 8087,
-    8104: 8096,
-    8105: 8097,
-    8106: 8098,
-    8107: 8099,
-    8108: 8100,
-    8109: 8101,
-    8110: 8102,
-    8111: 8103,
-    8120: 8112,
-    8121: 8113,
-    8122: 8048,
-    8123: 8049,
-    8124: 8115,
-    8136: 8050,
-    8137: 8051,
-    8138: 8052,
-    8139: 8053,
-    8140: 8131,
-    8152: 8144,
-    8153: 8145,
-    8154: 8054,
-    8155: 8055,
-    8168: 8160,
-    8169: 8161,
-    8170: 8058,
-    8171: 8059,
-    8172: 8165,
-    8184: 8056,
-    8185: 8057,
-    8186: 8060,
-    8187: 8061,
-    8188: 8179,
-    8486: 969,
-    8490: 107,
-    8491: 229,
-    8498: 8526,
-    8544: 8560,
-    8545: 8561,
-    8546: 8562,
-    8547: 8563,
-    8548: 8564,
-    8549: 8565,
-    8550: 8566,
-    8551: 8567,
-    8552: 8568,
-    8553: 8569,
-    8554: 8570,
-    8555: 8571,
-    8556: 8572,
-    8557: 8573,
-    8558: 8574,
-    8559: 8575,
-    8579: 8580,
-    9398: 9424,
-    9399: 9425,
-    9400: 9426,
-    9401: 9427,
-    9402: 9428,
-    9403: 9429,
-    9404: 9430,
-    9405: 9431,
-    9406: 9432,
-    9407: 9433,
-    9408: 9434,
-    9409: 9435,
-    9410: 9436,
-    9411: 9437,
-    9412: 9438,
-    9413: 9439,
-    9414: 9440,
-    9415: 9441,
-    9416: 9442,
-    9417: 9443,
-    9418: 9444,
-    9419: 9445,
-    9420: 9446,
-    9421: 9447,
-    9422: 9448,
-    9423: 9449,
-    11264: 11312,
-    11265: 11313,
-    11266: 11314,
-    11267: 11315,
-    11268: 11316,
-    11269: 11317,
-    11270: 11318,
-    11271: 11319,
-    11272: 11320,
-    11273: 11321,
-    11274: 11322,
-    11275: 11323,
-    11276: 11324,
-    11277: 11325,
-    11278: 11326,
-    11279: 11327,
-    11280: 11328,
-    11281: 11329,
-    11282: 11330,
-    11283: 11331,
-    11284: 11332,
-    11285: 11333,
-    11286: 11334,
-    11287: 11335,
-    11288: 11336,
-    11289: 11337,
-    11290: 11338,
-    11291: 11339,
-    11292: 11340,
-    11293: 11341,
-    11294: 11342,
-    11295: 11343,
-    11296: 11344,
-    11297: 11345,
-    11298: 11346,
-    11299: 11347,
-    11300: 11348,
-    11301: 11349,
-    11302: 11350,
-    11303: 11351,
-    11304: 11352,
-    11305: 11353,
-    11306: 11354,
-    11307: 11355,
-    11308: 11356,
-    11309: 11357,
-    11310: 11358,
-    11360: 11361,
-    11362: 619,
-    11363: 7549,
-    11364: 637,
-    11367: 11368,
-    11369: 11370,
-    11371: 11372,
-    11381: 11382,
-    11392: 11393,
-    11394: 11395,
-    11396: 11397,
-    11398: 11399,
-    11400: 11401,
-    11402: 11403,
-    11404: 11405,
-    11406: 11407,
-    11408: 11409,
-    11410: 11411,
-    11412: 11413,
-    11414: 11415,
-    11416: 11417,
-    11418: 11419,
-    11420: 11421,
-    11422: 11423,
-    11424: 11425,
-    11426: 11427,
-    11428: 11429,
-    11430: 11431,
-    11432: 11433,
-    11434: 11435,
-    11436: 11437,
-    11438: 11439,
-    11440: 11441,
-    11442: 11443,
-    11444: 11445,
-    11446: 11447,
-    11448: 11449,
-    11450: 11451,
-    11452: 11453,
-    11454: 11455,
-    11456: 11457,
-    11458: 11459,
-    11460: 11461,
-    11462: 11463,
-    11464: 11465,
-    11466: 11467,
-    11468: 11469,
-    11470: 11471,
-    11472: 11473,
-    11474: 11475,
-    11476: 11477,
-    11478: 11479,
-    11480: 11481,
-    11482: 11483,
-    11484: 11485,
-    11486: 11487,
-    11488: 11489,
-    11490: 11491,
-    65313: 65345,
-    65314: 65346,
-    65315: 65347,
-    65316: 65348,
-    65317: 65349,
-    65318: 65350,
-    65319: 65351,
-    65320: 65352,
-    65321: 65353,
-    65322: 65354,
-    65323: 65355,
-    65324: 65356,
-    65325: 65357,
-    65326: 65358,
-    65327: 65359,
-    65328: 65360,
-    65329: 65361,
-    65330: 65362,
-    65331: 65363,
-    65332: 65364,
-    65333: 65365,
-    65334: 65366,
-    65335: 65367,
-    65336: 65368,
-    65337: 65369,
-    65338: 65370,
-    66560: 66600,
-    66561: 66601,
-    66562: 66602,
-    66563: 66603,
-    66564: 66604,
-    66565: 66605,
-    66566: 66606,
-    66567: 66607,
-    66568: 66608,
-    66569: 66609,
-    66570: 66610,
-    66571: 66611,
-    66572: 66612,
-    66573: 66613,
-    66574: 66614,
-    66575: 66615,
-    66576: 66616,
-    66577: 66617,
-    66578: 66618,
-    66579: 66619,
-    66580: 66620,
-    66581: 66621,
-    66582: 66622,
-    66583: 66623,
-    66584: 66624,
-    66585: 66625,
-    66586: 66626,
-    66587: 66627,
-    66588: 66628,
-    66589: 66629,
-    66590: 66630,
-    66591: 66631,
-    66592: 66632,
-    66593: 66633,
-    66594: 66634,
-    66595: 66635,
-    66596: 66636,
-    66597: 66637,
-    66598: 66638,
-    66599: 66639}
+# (start, end, step, delta) runs
 
-specialCasing = {   None: {   223: {'upper': (83, 83), 'lower': 223, 'context': None},
-              304: {'upper': 304, 'lower': (105, 775), 'context': None},
-              329: {'upper': (700, 78), 'lower': 329, 'context': None},
-              496: {'upper': (74, 780), 'lower': 496, 'context': None},
-              912: {'upper': (921, 776, 769), 'lower': 912, 'context': None},
-              931: {'upper': 931, 'lower': 962, 'context': 'Final_Sigma'},
-              944: {'upper': (933, 776, 769), 'lower': 944, 'context': None},
-              1415: {'upper': (1333, 1362), 'lower': 1415, 'context': None},
-              7830: {'upper': (72, 817), 'lower': 7830, 'context': None},
-              7831: {'upper': (84, 776), 'lower': 7831, 'context': None},
-              7832: {'upper': (87, 778), 'lower': 7832, 'context': None},
-              7833: {'upper': (89, 778), 'lower': 7833, 'context': None},
-              7834: {'upper': (65, 702), 'lower': 7834, 'context': None},
-              8016: {'upper': (933, 787), 'lower': 8016, 'context': None},
-              8018: {   'context': None,
-                        'lower': 8018,
-                        'upper': (933, 787, 768)},
-              8020: {   'context': None,
-                        'lower': 8020,
-                        'upper': (933, 787, 769)},
-              8022: {   'context': None,
-                        'lower': 8022,
-                        'upper': (933, 787, 834)},
-              8064: {'upper': (7944, 921), 'lower': 8064, 'context': None},
-              8065: {'upper': (7945, 921), 'lower': 8065, 'context': None},
-              8066: {'upper': (7946, 921), 'lower': 8066, 'context': None},
-              8067: {'upper': (7947, 921), 'lower': 8067, 'context': None},
-              8068: {'upper': (7948, 921), 'lower': 8068, 'context': None},
-              8069: {'upper': (7949, 921), 'lower': 8069, 'context': None},
-              8070: {'upper': (7950, 921), 'lower': 8070, 'context': None},
-              8071: {'upper': (7951, 921), 'lower': 8071, 'context': None},
-              8072: {'upper': (7944, 921), 'lower': 8064, 'context': None},
-              8073: {'upper': (7945, 921), 'lower': 8065, 'context': None},
-              8074: {'upper': (7946, 921), 'lower': 8066, 'context': None},
-              8075: {'upper': (7947, 921), 'lower': 8067, 'context': None},
-              8076: {'upper': (7948, 921), 'lower': 8068, 'context': None},
-              8077: {'upper': (7949, 921), 'lower': 8069, 'context': None},
-              8078: {'upper': (7950, 921), 'lower': 8070, 'context': None},
-              8079: {'upper': (7951, 921), 'lower': 8071, 'context': None},
-              8080: {'upper': (7976, 921), 'lower': 8080, 'context': None},
-              8081: {'upper': (7977, 921), 'lower': 8081, 'context': None},
-              8082: {'upper': (7978, 921), 'lower': 8082, 'context': None},
-              8083: {'upper': (7979, 921), 'lower': 8083, 'context': None},
-              8084: {'upper': (7980, 921), 'lower': 8084, 'context': None},
-              8085: {'upper': (7981, 921), 'lower': 8085, 'context': None},
-              8086: {'upper': (7982, 921), 'lower': 8086, 'context': None},
-              8087: {'upper': (7983, 921), 'lower': 8087, 'context': None},
-              8088: {'upper': (7976, 921), 'lower': 8080, 'context': None},
-              8089: {'upper': (7977, 921), 'lower': 8081, 'context': None},
-              8090: {'upper': (7978, 921), 'lower': 8082, 'context': None},
-              8091: {'upper': (7979, 921), 'lower': 8083, 'context': None},
-              8092: {'upper': (7980, 921), 'lower': 8084, 'context': None},
-              8093: {'upper': (7981, 921), 'lower': 8085, 'context': None},
-              8094: {'upper': (7982, 921), 'lower': 8086, 'context': None},
-              8095: {'upper': (7983, 921), 'lower': 8087, 'context': None},
-              8096: {'upper': (8040, 921), 'lower': 8096, 'context': None},
-              8097: {'upper': (8041, 921), 'lower': 8097, 'context': None},
-              8098: {'upper': (8042, 921), 'lower': 8098, 'context': None},
-              8099: {'upper': (8043, 921), 'lower': 8099, 'context': None},
-              8100: {'upper': (8044, 921), 'lower': 8100, 'context': None},
-              8101: {'upper': (8045, 921), 'lower': 8101, 'context': None},
-              8102: {'upper': (8046, 921), 'lower': 8102, 'context': None},
-              8103: {'upper': (8047, 921), 'lower': 8103, 'context': None},
-              8104: {'upper': (8040, 921), 'lower': 8096, 'context': None},
-              8105: {'upper': (8041, 921), 'lower': 8097, 'context': None},
-              8106: {'upper': (8042, 921), 'lower': 8098, 'context': None},
-              8107: {'upper': (8043, 921), 'lower': 8099, 'context': None},
-              8108: {'upper': (8044, 921), 'lower': 8100, 'context': None},
-              8109: {'upper': (8045, 921), 'lower': 8101, 'context': None},
-              8110: {'upper': (8046, 921), 'lower': 8102, 'context': None},
-              8111: {'upper': (8047, 921), 'lower': 8103, 'context': None},
-              8114: {'upper': (8122, 921), 'lower': 8114, 'context': None},
-              8115: {'upper': (913, 921), 'lower': 8115, 'context': None},
-              8116: {'upper': (902, 921), 'lower': 8116, 'context': None},
-              8118: {'upper': (913, 834), 'lower': 8118, 'context': None},
-              8119: {   'context': None,
-                        'lower': 8119,
-                        'upper': (913, 834, 921)},
-              8124: {'upper': (913, 921), 'lower': 8115, 'context': None},
-              8130: {'upper': (8138, 921), 'lower': 8130, 'context': None},
-              8131: {'upper': (919, 921), 'lower': 8131, 'context': None},
-              8132: {'upper': (905, 921), 'lower': 8132, 'context': None},
-              8134: {'upper': (919, 834), 'lower': 8134, 'context': None},
-              8135: {   'context': None,
-                        'lower': 8135,
-                        'upper': (919, 834, 921)},
-              8140: {'upper': (919, 921), 'lower': 8131, 'context': None},
-              8146: {   'context': None,
-                        'lower': 8146,
-                        'upper': (921, 776, 768)},
-              8147: {   'context': None,
-                        'lower': 8147,
-                        'upper': (921, 776, 769)},
-              8150: {'upper': (921, 834), 'lower': 8150, 'context': None},
-              8151: {   'context': None,
-                        'lower': 8151,
-                        'upper': (921, 776, 834)},
-              8162: {   'context': None,
-                        'lower': 8162,
-                        'upper': (933, 776, 768)},
-              8163: {   'context': None,
-                        'lower': 8163,
-                        'upper': (933, 776, 769)},
-              8164: {'upper': (929, 787), 'lower': 8164, 'context': None},
-              8166: {'upper': (933, 834), 'lower': 8166, 'context': None},
-              8167: {   'context': None,
-                        'lower': 8167,
-                        'upper': (933, 776, 834)},
-              8178: {'upper': (8186, 921), 'lower': 8178, 'context': None},
-              8179: {'upper': (937, 921), 'lower': 8179, 'context': None},
-              8180: {'upper': (911, 921), 'lower': 8180, 'context': None},
-              8182: {'upper': (937, 834), 'lower': 8182, 'context': None},
-              8183: {   'context': None,
-                        'lower': 8183,
-                        'upper': (937, 834, 921)},
-              8188: {'upper': (937, 921), 'lower': 8179, 'context': None},
-              64256: {'upper': (70, 70), 'lower': 64256, 'context': None},
-              64257: {'upper': (70, 73), 'lower': 64257, 'context': None},
-              64258: {'upper': (70, 76), 'lower': 64258, 'context': None},
-              64259: {'upper': (70, 70, 73), 'lower': 64259, 'context': None},
-              64260: {'upper': (70, 70, 76), 'lower': 64260, 'context': None},
-              64261: {'upper': (83, 84), 'lower': 64261, 'context': None},
-              64262: {'upper': (83, 84), 'lower': 64262, 'context': None},
-              64275: {'upper': (1348, 1350), 'lower': 64275, 'context': None},
-              64276: {'upper': (1348, 1333), 'lower': 64276, 'context': None},
-              64277: {'upper': (1348, 1339), 'lower': 64277, 'context': None},
-              64278: {'upper': (1358, 1350), 'lower': 64278, 'context': None},
-              64279: {'upper': (1348, 1341), 'lower': 64279, 'context': None}},
-    'AZE': {   73: {'upper': 73, 'lower': 305, 'context': 'Not_Before_Dot'},
-               105: {'upper': 304, 'lower': 105, 'context': None},
-               304: {'upper': 304, 'lower': 105, 'context': None},
-               775: {'upper': 775, 'lower': None, 'context': 'After_I'}},
-    'LTH': {   73: {   'context': 'More_Above',
-                       'lower': (105, 775),
-                       'upper': 73},
-               74: {   'context': 'More_Above',
-                       'lower': (106, 775),
-                       'upper': 74},
-               204: {'upper': 204, 'lower': (105, 775, 768), 'context': None},
-               205: {'upper': 205, 'lower': (105, 775, 769), 'context': None},
-               296: {'upper': 296, 'lower': (105, 775, 771), 'context': None},
+lowerToSingleUpperRuns = array('l', [
+    97, 122, 1, -32, 181, 181, 1, 743, 224, 246, 1, -32, 248, 254, 1, -32, 255,
+    255, 1, 121, 257, 303, 2, -1, 305, 305, 1, -232, 307, 311, 2, -1, 314, 328,
+    2, -1, 331, 375, 2, -1, 378, 382, 2, -1, 383, 383, 1, -300, 384, 384, 1,
+    195, 387, 389, 2, -1, 392, 392, 1, -1, 396, 396, 1, -1, 402, 402, 1, -1,
+    405, 405, 1, 97, 409, 409, 1, -1, 410, 410, 1, 163, 414, 414, 1, 130, 417,
+    421, 2, -1, 424, 424, 1, -1, 429, 429, 1, -1, 432, 432, 1, -1, 436, 438, 2,
+    -1, 441, 441, 1, -1, 445, 445, 1, -1, 447, 447, 1, 56, 453, 453, 1, -1,
+    454, 454, 1, -2, 456, 456, 1, -1, 457, 457, 1, -2, 459, 459, 1, -1, 460,
+    460, 1, -2, 462, 476, 2, -1, 477, 477, 1, -79, 479, 495, 2, -1, 498, 498,
+    1, -1, 499, 499, 1, -2, 501, 501, 1, -1, 505, 543, 2, -1, 547, 563, 2, -1,
+    572, 572, 1, -1, 578, 578, 1, -1, 583, 591, 2, -1, 595, 595, 1, -210, 596,
+    596, 1, -206, 598, 599, 1, -205, 601, 601, 1, -202, 603, 603, 1, -203, 608,
+    608, 1, -205, 611, 611, 1, -207, 616, 616, 1, -209, 617, 617, 1, -211, 619,
+    619, 1, 10743, 623, 623, 1, -211, 626, 626, 1, -213, 629, 629, 1, -214,
+    637, 637, 1, 10727, 640, 640, 1, -218, 643, 643, 1, -218, 648, 648, 1,
+    -218, 649, 649, 1, -69, 650, 651, 1, -217, 652, 652, 1, -71, 658, 658, 1,
+    -219, 837, 837, 1, 84, 891, 893, 1, 130, 940, 940, 1, -38, 941, 943, 1,
+    -37, 945, 961, 1, -32, 962, 962, 1, -31, 963, 971, 1, -32, 972, 972, 1,
+    -64, 973, 974, 1, -63, 976, 976, 1, -62, 977, 977, 1, -57, 981, 981, 1,
+    -47, 982, 982, 1, -54, 985, 1007, 2, -1, 1008, 1008, 1, -86, 1009, 1009, 1,
+    -80, 1010, 1010, 1, 7, 1013, 1013, 1, -96, 1016, 1016, 1, -1, 1019, 1019,
+    1, -1, 1072, 1103, 1, -32, 1104, 1119, 1, -80, 1121, 1153, 2, -1, 1163,
+    1215, 2, -1, 1218, 1230, 2, -1, 1231, 1231, 1, -15, 1233, 1299, 2, -1,
+    1377, 1414, 1, -48, 7549, 7549, 1, 3814, 7681, 7829, 2, -1, 7835, 7835, 1,
+    -59, 7841, 7929, 2, -1, 7936, 7943, 1, 8, 7952, 7957, 1, 8, 7968, 7975, 1,
+    8, 7984, 7991, 1, 8, 8000, 8005, 1, 8, 8017, 8023, 2, 8, 8032, 8039, 1, 8,
+    8048, 8049, 1, 74, 8050, 8053, 1, 86, 8054, 8055, 1, 100, 8056, 8057, 1,
+    128, 8058, 8059, 1, 112, 8060, 8061, 1, 126, 8064, 8071, 1, 8, 8080, 8087,
+    1, 8, 8096, 8103, 1, 8, 8112, 8113, 1, 8, 8115, 8115, 1, 9, 8126, 8126, 1,
+    -7205, 8131, 8131, 1, 9, 8144, 8145, 1, 8, 8160, 8161, 1, 8, 8165, 8165, 1,
+    7, 8179, 8179, 1, 9, 8526, 8526, 1, -28, 8560, 8575, 1, -16, 8580, 8580, 1,
+    -1, 9424, 9449, 1, -26, 11312, 11358, 1, -48, 11361, 11361, 1, -1, 11365,
+    11365, 1, -10795, 11366, 11366, 1, -10792, 11368, 11372, 2, -1, 11382,
+    11382, 1, -1, 11393, 11491, 2, -1, 11520, 11557, 1, -7264, 65345, 65370, 1,
+    -32, 66600, 66639, 1, -40,
+])
+
+
+
+# (start, end, step, delta) runs
+
+upperToSingleLowerRuns = array('l', [
+    65, 90, 1, 32, 192, 214, 1, 32, 216, 222, 1, 32, 256, 302, 2, 1, 304, 304,
+    1, -199, 306, 310, 2, 1, 313, 327, 2, 1, 330, 374, 2, 1, 376, 376, 1, -121,
+    377, 381, 2, 1, 385, 385, 1, 210, 386, 388, 2, 1, 390, 390, 1, 206, 391,
+    391, 1, 1, 393, 394, 1, 205, 395, 395, 1, 1, 398, 398, 1, 79, 399, 399, 1,
+    202, 400, 400, 1, 203, 401, 401, 1, 1, 403, 403, 1, 205, 404, 404, 1, 207,
+    406, 406, 1, 211, 407, 407, 1, 209, 408, 408, 1, 1, 412, 412, 1, 211, 413,
+    413, 1, 213, 415, 415, 1, 214, 416, 420, 2, 1, 422, 422, 1, 218, 423, 423,
+    1, 1, 425, 425, 1, 218, 428, 428, 1, 1, 430, 430, 1, 218, 431, 431, 1, 1,
+    433, 434, 1, 217, 435, 437, 2, 1, 439, 439, 1, 219, 440, 440, 1, 1, 444,
+    444, 1, 1, 452, 452, 1, 2, 453, 453, 1, 1, 455, 455, 1, 2, 456, 456, 1, 1,
+    458, 458, 1, 2, 459, 475, 2, 1, 478, 494, 2, 1, 497, 497, 1, 2, 498, 500,
+    2, 1, 502, 502, 1, -97, 503, 503, 1, -56, 504, 542, 2, 1, 544, 544, 1,
+    -130, 546, 562, 2, 1, 570, 570, 1, 10795, 571, 571, 1, 1, 573, 573, 1,
+    -163, 574, 574, 1, 10792, 577, 577, 1, 1, 579, 579, 1, -195, 580, 580, 1,
+    69, 581, 581, 1, 71, 582, 590, 2, 1, 902, 902, 1, 38, 904, 906, 1, 37, 908,
+    908, 1, 64, 910, 911, 1, 63, 913, 929, 1, 32, 931, 939, 1, 32, 984, 1006,
+    2, 1, 1012, 1012, 1, -60, 1015, 1015, 1, 1, 1017, 1017, 1, -7, 1018, 1018,
+    1, 1, 1021, 1023, 1, -130, 1024, 1039, 1, 80, 1040, 1071, 1, 32, 1120,
+    1152, 2, 1, 1162, 1214, 2, 1, 1216, 1216, 1, 15, 1217, 1229, 2, 1, 1232,
+    1298, 2, 1, 1329, 1366, 1, 48, 4256, 4293, 1, 7264, 7680, 7828, 2, 1, 7840,
+    7928, 2, 1, 7944, 7951, 1, -8, 7960, 7965, 1, -8, 7976, 7983, 1, -8, 7992,
+    7999, 1, -8, 8008, 8013, 1, -8, 8025, 8031, 2, -8, 8040, 8047, 1, -8, 8072,
+    8079, 1, -8, 8088, 8095, 1, -8, 8104, 8111, 1, -8, 8120, 8121, 1, -8, 8122,
+    8123, 1, -74, 8124, 8124, 1, -9, 8136, 8139, 1, -86, 8140, 8140, 1, -9,
+    8152, 8153, 1, -8, 8154, 8155, 1, -100, 8168, 8169, 1, -8, 8170, 8171, 1,
+    -112, 8172, 8172, 1, -7, 8184, 8185, 1, -128, 8186, 8187, 1, -126, 8188,
+    8188, 1, -9, 8486, 8486, 1, -7517, 8490, 8490, 1, -8383, 8491, 8491, 1,
+    -8262, 8498, 8498, 1, 28, 8544, 8559, 1, 16, 8579, 8579, 1, 1, 9398, 9423,
+    1, 26, 11264, 11310, 1, 48, 11360, 11360, 1, 1, 11362, 11362, 1, -10743,
+    11363, 11363, 1, -3814, 11364, 11364, 1, -10727, 11367, 11371, 2, 1, 11381,
+    11381, 1, 1, 11392, 11490, 2, 1, 65313, 65338, 1, 32, 66560, 66599, 1, 40,
+])
+
+
+
+specialCasing = {   None: {   223: {'context': None, 'lower': 223, 'upper': (83, 83)},
+              304: {'context': None, 'lower': (105, 775), 'upper': 304},
+              329: {'context': None, 'lower': 329, 'upper': (700, 78)},
+              496: {'context': None, 'lower': 496, 'upper': (74, 780)},
+              912: {'context': None, 'lower': 912, 'upper': (921, 776, 769)},
+              931: {'context': 'Final_Sigma', 'lower': 962, 'upper': 931},
+              944: {'context': None, 'lower': 944, 'upper': (933, 776, 769)},
+              1415: {'context': None, 'lower': 1415, 'upper': (1333, 1362)},
+              7830: {'context': None, 'lower': 7830, 'upper': (72, 817)},
+              7831: {'context': None, 'lower': 7831, 'upper': (84, 776)},
+              7832: {'context': None, 'lower': 7832, 'upper': (87, 778)},
+              7833: {'context': None, 'lower': 7833, 'upper': (89, 778)},
+              7834: {'context': None, 'lower': 7834, 'upper': (65, 702)},
+              8016: {'context': None, 'lower': 8016, 'upper': (933, 787)},
+              8018: {'context': None, 'lower': 8018, 'upper': (933, 787, 768)},
+              8020: {'context': None, 'lower': 8020, 'upper': (933, 787, 769)},
+              8022: {'context': None, 'lower': 8022, 'upper': (933, 787, 834)},
+              8064: {'context': None, 'lower': 8064, 'upper': (7944, 921)},
+              8065: {'context': None, 'lower': 8065, 'upper': (7945, 921)},
+              8066: {'context': None, 'lower': 8066, 'upper': (7946, 921)},
+              8067: {'context': None, 'lower': 8067, 'upper': (7947, 921)},
+              8068: {'context': None, 'lower': 8068, 'upper': (7948, 921)},
+              8069: {'context': None, 'lower': 8069, 'upper': (7949, 921)},
+              8070: {'context': None, 'lower': 8070, 'upper': (7950, 921)},
+              8071: {'context': None, 'lower': 8071, 'upper': (7951, 921)},
+              8072: {'context': None, 'lower': 8064, 'upper': (7944, 921)},
+              8073: {'context': None, 'lower': 8065, 'upper': (7945, 921)},
+              8074: {'context': None, 'lower': 8066, 'upper': (7946, 921)},
+              8075: {'context': None, 'lower': 8067, 'upper': (7947, 921)},
+              8076: {'context': None, 'lower': 8068, 'upper': (7948, 921)},
+              8077: {'context': None, 'lower': 8069, 'upper': (7949, 921)},
+              8078: {'context': None, 'lower': 8070, 'upper': (7950, 921)},
+              8079: {'context': None, 'lower': 8071, 'upper': (7951, 921)},
+              8080: {'context': None, 'lower': 8080, 'upper': (7976, 921)},
+              8081: {'context': None, 'lower': 8081, 'upper': (7977, 921)},
+              8082: {'context': None, 'lower': 8082, 'upper': (7978, 921)},
+              8083: {'context': None, 'lower': 8083, 'upper': (7979, 921)},
+              8084: {'context': None, 'lower': 8084, 'upper': (7980, 921)},
+              8085: {'context': None, 'lower': 8085, 'upper': (7981, 921)},
+              8086: {'context': None, 'lower': 8086, 'upper': (7982, 921)},
+              8087: {'context': None, 'lower': 8087, 'upper': (7983, 921)},
+              8088: {'context': None, 'lower': 8080, 'upper': (7976, 921)},
+              8089: {'context': None, 'lower': 8081, 'upper': (7977, 921)},
+              8090: {'context': None, 'lower': 8082, 'upper': (7978, 921)},
+              8091: {'context': None, 'lower': 8083, 'upper': (7979, 921)},
+              8092: {'context': None, 'lower': 8084, 'upper': (7980, 921)},
+              8093: {'context': None, 'lower': 8085, 'upper': (7981, 921)},
+              8094: {'context': None, 'lower': 8086, 'upper': (7982, 921)},
+              8095: {'context': None, 'lower': 8087, 'upper': (7983, 921)},
+              8096: {'context': None, 'lower': 8096, 'upper': (8040, 921)},
+              8097: {'context': None, 'lower': 8097, 'upper': (8041, 921)},
+              8098: {'context': None, 'lower': 8098, 'upper': (8042, 921)},
+              8099: {'context': None, 'lower': 8099, 'upper': (8043, 921)},
+              8100: {'context': None, 'lower': 8100, 'upper': (8044, 921)},
+              8101: {'context': None, 'lower': 8101, 'upper': (8045, 921)},
+              8102: {'context': None, 'lower': 8102, 'upper': (8046, 921)},
+              8103: {'context': None, 'lower': 8103, 'upper': (8047, 921)},
+              8104: {'context': None, 'lower': 8096, 'upper': (8040, 921)},
+              8105: {'context': None, 'lower': 8097, 'upper': (8041, 921)},
+              8106: {'context': None, 'lower': 8098, 'upper': (8042, 921)},
+              8107: {'context': None, 'lower': 8099, 'upper': (8043, 921)},
+              8108: {'context': None, 'lower': 8100, 'upper': (8044, 921)},
+              8109: {'context': None, 'lower': 8101, 'upper': (8045, 921)},
+              8110: {'context': None, 'lower': 8102, 'upper': (8046, 921)},
+              8111: {'context': None, 'lower': 8103, 'upper': (8047, 921)},
+              8114: {'context': None, 'lower': 8114, 'upper': (8122, 921)},
+              8115: {'context': None, 'lower': 8115, 'upper': (913, 921)},
+              8116: {'context': None, 'lower': 8116, 'upper': (902, 921)},
+              8118: {'context': None, 'lower': 8118, 'upper': (913, 834)},
+              8119: {'context': None, 'lower': 8119, 'upper': (913, 834, 921)},
+              8124: {'context': None, 'lower': 8115, 'upper': (913, 921)},
+              8130: {'context': None, 'lower': 8130, 'upper': (8138, 921)},
+              8131: {'context': None, 'lower': 8131, 'upper': (919, 921)},
+              8132: {'context': None, 'lower': 8132, 'upper': (905, 921)},
+              8134: {'context': None, 'lower': 8134, 'upper': (919, 834)},
+              8135: {'context': None, 'lower': 8135, 'upper': (919, 834, 921)},
+              8140: {'context': None, 'lower': 8131, 'upper': (919, 921)},
+              8146: {'context': None, 'lower': 8146, 'upper': (921, 776, 768)},
+              8147: {'context': None, 'lower': 8147, 'upper': (921, 776, 769)},
+              8150: {'context': None, 'lower': 8150, 'upper': (921, 834)},
+              8151: {'context': None, 'lower': 8151, 'upper': (921, 776, 834)},
+              8162: {'context': None, 'lower': 8162, 'upper': (933, 776, 768)},
+              8163: {'context': None, 'lower': 8163, 'upper': (933, 776, 769)},
+              8164: {'context': None, 'lower': 8164, 'upper': (929, 787)},
+              8166: {'context': None, 'lower': 8166, 'upper': (933, 834)},
+              8167: {'context': None, 'lower': 8167, 'upper': (933, 776, 834)},
+              8178: {'context': None, 'lower': 8178, 'upper': (8186, 921)},
+              8179: {'context': None, 'lower': 8179, 'upper': (937, 921)},
+              8180: {'context': None, 'lower': 8180, 'upper': (911, 921)},
+              8182: {'context': None, 'lower': 8182, 'upper': (937, 834)},
+              8183: {'context': None, 'lower': 8183, 'upper': (937, 834, 921)},
+              8188: {'context': None, 'lower': 8179, 'upper': (937, 921)},
+              64256: {'context': None, 'lower': 64256, 'upper': (70, 70)},
+              64257: {'context': None, 'lower': 64257, 'upper': (70, 73)},
+              64258: {'context': None, 'lower': 64258, 'upper': (70, 76)},
+              64259: {'context': None, 'lower': 64259, 'upper': (70, 70, 73)},
+              64260: {'context': None, 'lower': 64260, 'upper': (70, 70, 76)},
+              64261: {'context': None, 'lower': 64261, 'upper': (83, 84)},
+              64262: {'context': None, 'lower': 64262, 'upper': (83, 84)},
+              64275: {'context': None, 'lower': 64275, 'upper': (1348, 1350)},
+              64276: {'context': None, 'lower': 64276, 'upper': (1348, 1333)},
+              64277: {'context': None, 'lower': 64277, 'upper': (1348, 1339)},
+              64278: {'context': None, 'lower': 64278, 'upper': (1358, 1350)},
+              64279: {'context': None, 'lower': 64279, 'upper': (1348, 1341)}},
+    'AZE': {   73: {'context': 'Not_Before_Dot', 'lower': 305, 'upper': 73},
+               105: {'context': None, 'lower': 105, 'upper': 304},
+               304: {'context': None, 'lower': 105, 'upper': 304},
+               775: {'context': 'After_I', 'lower': None, 'upper': 775}},
+    'LTH': {   73: {'context': 'More_Above', 'lower': (105, 775), 'upper': 73},
+               74: {'context': 'More_Above', 'lower': (106, 775), 'upper': 74},
+               204: {'context': None, 'lower': (105, 775, 768), 'upper': 204},
+               205: {'context': None, 'lower': (105, 775, 769), 'upper': 205},
+               296: {'context': None, 'lower': (105, 775, 771), 'upper': 296},
                302: {   'context': 'More_Above',
                         'lower': (303, 775),
                         'upper': 302},
                775: {   'context': 'After_Soft_Dotted',
                         'lower': 775,
                         'upper': None}},
-    'TRK': {   73: {'upper': 73, 'lower': 305, 'context': 'Not_Before_Dot'},
-               105: {'upper': 304, 'lower': 105, 'context': None},
-               304: {'upper': 304, 'lower': 105, 'context': None},
-               775: {'upper': 775, 'lower': None, 'context': 'After_I'}}}
+    'TRK': {   73: {'context': 'Not_Before_Dot', 'lower': 305, 'upper': 73},
+               105: {'context': None, 'lower': 105, 'upper': 304},
+               304: {'context': None, 'lower': 105, 'upper': 304},
+               775: {'context': 'After_I', 'lower': None, 'upper': 775}}}
+
+
+
+softDottedRangeStarts = array('L', [
+    105, 303, 585, 616, 669, 690, 1011, 1110, 1112, 7522, 7574, 7588, 7592,
+    7725, 7883, 8305, 8520, 119842, 119894, 119946, 119998, 120050, 120102,
+    120154, 120206, 120258, 120310, 120362, 120414, 120466,
+])
 
-softDotted = {   105: None,
-    106: None,
-    303: None,
-    585: None,
-    616: None,
-    669: None,
-    690: None,
-    1011: None,
-    1110: None,
-    1112: None,
-    7522: None,
-    7574: None,
-    7588: None,
-    7592: None,
-    7725: None,
-    7883: None,
-    8305: None,
-    8520: None,
-    8521: None,
-    119842: None,
-    119843: None,
-    119894: None,
-    119895: None,
-    119946: None,
-    119947: None,
-    119998: None,
-    119999: None,
-    120050: None,
-    120051: None,
-    120102: None,
-    120103: None,
-    120154: None,
-    120155: None,
-    120206: None,
-    120207: None,
-    120258: None,
-    120259: None,
-    120310: None,
-    120311: None,
-    120362: None,
-    120363: None,
-    120414: None,
-    120415: None,
-    120466: None,
-    120467: None}
+softDottedRangeEnds = array('L', [
+    106, 303, 585, 616, 669, 690, 1011, 1110, 1112, 7522, 7574, 7588, 7592,
+    7725, 7883, 8305, 8521, 119843, 119895, 119947, 119999, 120051, 120103,
+    120155, 120207, 120259, 120311, 120363, 120415, 120467,
+])
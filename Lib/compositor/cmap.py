@@ -3,18 +3,336 @@ Utilities for handling the cmap table
 and character mapping in general.
 """
 
+from array import array
+from collections.abc import Mapping
+from itertools import accumulate
+
+# subtables that cover the full Unicode repertoire
+# are preferred over those limited to the BMP. the
+# format 13 subtable (0, 6) maps ranges of characters
+# to a last resort glyph, so it is used only if there
+# is nothing else.
+cmapPreferences = [(3, 10), (0, 4), (0, 3), (3, 1), (0, 6)]
+
 def extractCMAP(ttFont):
-    for platformID, encodingID in [(3, 10), (0, 3), (3, 1)]:
+    """
+    Get the cmap of the preferred subtable in the font.
+
+        >>> from fontTools.ttLib import newTable
+        >>> from fontTools.ttLib.tables._c_m_a_p import CmapSubtable
+        >>> def makeSubtable(format, platformID, platEncID, cmap):
+        ...     subtable = CmapSubtable.newSubtable(format)
+        ...     subtable.platformID = platformID
+        ...     subtable.platEncID = platEncID
+        ...     subtable.language = 0
+        ...     subtable.cmap = cmap
+        ...     return subtable
+        >>> cmapTable = newTable("cmap")
+        >>> cmapTable.tableVersion = 0
+        >>> cmapTable.tables = [
+        ...     makeSubtable(13, 0, 6, {0x41 : "lastResort", 0x1F600 : "lastResort"}),
+        ...     makeSubtable(4, 3, 1, {0x41 : "A"})
+        ... ]
+        >>> font = {"cmap" : cmapTable}
+        >>> extractCMAP(font)
+        {65: 'A'}
+        >>> cmapTable.tables.append(makeSubtable(12, 3, 10, {0x41 : "A", 0x1F600 : "grinning"}))
+        >>> sorted(extractCMAP(font).items())
+        [(65, 'A'), (128512, 'grinning')]
+        >>> cmapTable.tables = cmapTable.tables[:1]
+        >>> extractCMAP(font)[0x41]
+        'lastResort'
+        >>> cmapTable.tables = []
+        >>> extractCMAP(font)
+        Traceback (most recent call last):
+            ...
+        compositor.error.CompositorError: Found none of CMAP (3, 10), (0, 4), (0, 3), (3, 1) or (0, 6) in font.
+    """
+    for platformID, encodingID in cmapPreferences:
         cmapSubtable = ttFont["cmap"].getcmap(platformID, encodingID)
         if cmapSubtable is not None:
             return cmapSubtable.cmap
     from compositor.error import CompositorError
-    raise CompositorError("Found neither CMAP (3, 10), (0, 3), nor (3, 1) in font.")
+    raise CompositorError("Found none of CMAP (3, 10), (0, 4), (0, 3), (3, 1) or (0, 6) in font.")
+
+def extractVariationSequences(ttFont):
+    """
+    Get the Unicode variation sequences defined in the
+    format 14 cmap subtable as a dict of
+    (code point, variation selector) : glyph name.
+    The glyph name is None for sequences that use
+    the default glyph for the code point.
+    """
+    variationSequences = {}
+    for cmapSubtable in ttFont["cmap"].tables:
+        if cmapSubtable.format != 14:
+            continue
+        for variationSelector, mapping in cmapSubtable.uvsDict.items():
+            for value, glyphName in mapping:
+                variationSequences[value, variationSelector] = glyphName
+    return variationSequences
 
 def reverseCMAP(cmap):
-    reversed = {}
-    for value, name in cmap.items():
-        if name not in reversed:
-            reversed[name] = []
-        reversed[name].append(value)
-    return reversed
+    """
+    Get a map of glyph name to the sorted list of
+    code points that are mapped to the glyph.
+
+        >>> reversed = reverseCMAP({0x41 : "A", 0x391 : "A", 0x42 : "B"})
+        >>> reversed["A"]
+        [65, 913]
+        >>> reversed.get("C", [None])
+        [None]
+    """
+    if not isinstance(cmap, CharacterMap):
+        cmap = CharacterMap(cmap)
+    return cmap.reverse()
+
+# ----------------------
+# compact character maps
+# ----------------------
+
+def _getGlyphIDTypeCode(glyphCount):
+    if glyphCount <= 0x10000:
+        return "H"
+    return "I"
+
+
+class CharacterMap(Mapping):
+
+    """
+    A read only map of code point to glyph name. Single code
+    points are looked up in the dict that the map is made
+    from, so that dict should not be changed afterwards. The
+    code points are also kept in a sorted array with the
+    glyph ID of each in a parallel array, from which the
+    reversed map and the bulk mapping tables are built. The
+    arrays are compiled when they are first needed.
+    glyphOrder is the list of glyph names that the glyph IDs
+    refer to. If it is not given, the glyph names in the cmap
+    are numbered in code point order. glyphIDMap is an
+    optional dict of glyph name to glyph ID for glyphOrder,
+    which is shared with the reversed map.
+
+        >>> cmap = CharacterMap({0x42 : "B", 0x41 : "A", 0x391 : "A"}, ["A", "B"])
+        >>> list(cmap.codePoints)
+        [65, 66, 913]
+        >>> list(cmap.glyphIDs)
+        [0, 1, 0]
+        >>> cmap[0x391]
+        'A'
+        >>> cmap.get(0x43, ".notdef")
+        '.notdef'
+        >>> 0x42 in cmap, 0x43 in cmap, None in cmap
+        (True, False, False)
+        >>> len(cmap), list(cmap)
+        (3, [65, 66, 913])
+        >>> cmap == {0x41 : "A", 0x42 : "B", 0x391 : "A"}
+        True
+        >>> glyphOrder = ["A"]
+        >>> cmap = CharacterMap({0x41 : "A", 0x42 : "B"}, glyphOrder)
+        >>> cmap.glyphOrder, glyphOrder
+        (['A', 'B'], ['A'])
+        >>> CharacterMap({0x42 : "B", 0x41 : "A", 0x61 : "B"}).glyphOrder
+        ['A', 'B']
+    """
+
+    __slots__ = ["_mapping", "_glyphOrder", "_glyphIDMap", "_codePoints", "_glyphIDs"]
+
+    def __init__(self, cmap, glyphOrder=None, glyphIDMap=None):
+        if not isinstance(cmap, dict):
+            cmap = dict(cmap)
+        self._mapping = cmap
+        self._glyphOrder = glyphOrder
+        self._glyphIDMap = glyphIDMap
+        self._codePoints = None
+        self._glyphIDs = None
+
+    def compile(self):
+        """
+        Compile the arrays if that hasn't been done yet.
+        """
+        if self._codePoints is not None:
+            return
+        cmap = self._mapping
+        glyphOrder = self._glyphOrder
+        glyphIDMap = self._glyphIDMap
+        codePoints = sorted(cmap)
+        glyphNames = list(map(cmap.__getitem__, codePoints))
+        if glyphOrder is None:
+            # a glyph gets the next ID when it is first seen.
+            glyphIDMap = {}
+            glyphIDs = [glyphIDMap.setdefault(glyphName, len(glyphIDMap)) for glyphName in glyphNames]
+            glyphOrder = list(glyphIDMap)
+        else:
+            if glyphIDMap is None:
+                glyphIDMap = {glyphName : glyphID for glyphID, glyphName in enumerate(glyphOrder)}
+            glyphIDs = list(map(glyphIDMap.get, glyphNames))
+        if None in glyphIDs:
+            # the glyph order and the glyph ID map are only
+            # copied when there are names missing from them.
+            glyphOrder = list(glyphOrder)
+            glyphIDMap = dict(glyphIDMap)
+            for index, glyphName in enumerate(glyphNames):
+                if glyphIDs[index] is None:
+                    glyphID = glyphIDMap.get(glyphName)
+                    if glyphID is None:
+                        glyphID = glyphIDMap[glyphName] = len(glyphOrder)
+                        glyphOrder.append(glyphName)
+                    glyphIDs[index] = glyphID
+        self._glyphIDs = array(_getGlyphIDTypeCode(len(glyphOrder)), glyphIDs)
+        self._glyphOrder = glyphOrder
+        self._glyphIDMap = glyphIDMap
+        self._codePoints = array("I", codePoints)
+
+    def _get_codePoints(self):
+        self.compile()
+        return self._codePoints
+
+    codePoints = property(_get_codePoints)
+
+    def _get_glyphIDs(self):
+        self.compile()
+        return self._glyphIDs
+
+    glyphIDs = property(_get_glyphIDs)
+
+    def _get_glyphOrder(self):
+        self.compile()
+        return self._glyphOrder
+
+    glyphOrder = property(_get_glyphOrder)
+
+    def _get_glyphIDMap(self):
+        self.compile()
+        return self._glyphIDMap
+
+    glyphIDMap = property(_get_glyphIDMap)
+
+    def __getitem__(self, value):
+        return self._mapping[value]
+
+    def get(self, value, default=None):
+        return self._mapping.get(value, default)
+
+    def __contains__(self, value):
+        return value in self._mapping
+
+    def __len__(self):
+        return len(self._mapping)
+
+    def __iter__(self):
+        return iter(self.codePoints)
+
+    def reverse(self):
+        """
+        Get the reversed map as a ReversedCharacterMap.
+        """
+        return ReversedCharacterMap(self)
+
+
+class ReversedCharacterMap(Mapping):
+
+    """
+    A read only map of glyph name to the sorted list of code
+    points mapped to the glyph. The code points are stored
+    in one array, sorted by glyph ID, and the code points of
+    glyph ID i are codePoints[offsets[i]:offsets[i + 1]].
+    The arrays are compiled when they are first needed.
+
+        >>> cmap = CharacterMap({0x42 : "B", 0x41 : "A", 0x391 : "A"}, ["A", "B", "C"])
+        >>> reversed = ReversedCharacterMap(cmap)
+        >>> list(reversed.offsets)
+        [0, 2, 3, 3]
+        >>> list(reversed.codePoints)
+        [65, 913, 66]
+        >>> reversed["A"], reversed["B"]
+        ([65, 913], [66])
+        >>> "C" in reversed, "D" in reversed
+        (False, False)
+        >>> reversed.get("C", [None])
+        [None]
+        >>> sorted(reversed), len(reversed)
+        (['A', 'B'], 2)
+    """
+
+    __slots__ = ["_cmap", "_codePoints", "_offsets", "_glyphIDMap", "_length"]
+
+    def __init__(self, cmap):
+        self._cmap = cmap
+        self._codePoints = None
+        self._offsets = None
+        self._glyphIDMap = None
+        self._length = None
+
+    def compile(self):
+        """
+        Compile the arrays if that hasn't been done yet.
+        """
+        if self._codePoints is not None:
+            return
+        cmap = self._cmap
+        glyphIDs = cmap.glyphIDs
+        counts = [0] * (len(cmap.glyphOrder) + 1)
+        for glyphID in glyphIDs:
+            counts[glyphID + 1] += 1
+        self._length = len(counts) - counts.count(0)
+        # the code points are already sorted, so a stable sort
+        # by glyph ID keeps them sorted within each glyph.
+        order = sorted(range(len(glyphIDs)), key=glyphIDs.__getitem__)
+        self._offsets = array("I", accumulate(counts))
+        self._glyphIDMap = cmap.glyphIDMap
+        self._codePoints = array("I", map(cmap.codePoints.__getitem__, order))
+
+    def _get_codePoints(self):
+        self.compile()
+        return self._codePoints
+
+    codePoints = property(_get_codePoints)
+
+    def _get_offsets(self):
+        self.compile()
+        return self._offsets
+
+    offsets = property(_get_offsets)
+
+    def _get_glyphOrder(self):
+        return self._cmap.glyphOrder
+
+    glyphOrder = property(_get_glyphOrder)
+
+    def get(self, glyphName, default=None):
+        if self._codePoints is None:
+            self.compile()
+        glyphID = self._glyphIDMap.get(glyphName)
+        if glyphID is None:
+            return default
+        offsets = self._offsets
+        start = offsets[glyphID]
+        end = offsets[glyphID + 1]
+        if start == end:
+            return default
+        return self._codePoints[start:end].tolist()
+
+    def __getitem__(self, glyphName):
+        codePoints = self.get(glyphName)
+        if codePoints is None:
+            raise KeyError(glyphName)
+        return codePoints
+
+    def __contains__(self, glyphName):
+        if self._codePoints is None:
+            self.compile()
+        glyphID = self._glyphIDMap.get(glyphName)
+        if glyphID is None:
+            return False
+        return self._offsets[glyphID] != self._offsets[glyphID + 1]
+
+    def __len__(self):
+        self.compile()
+        return self._length
+
+    def __iter__(self):
+        offsets = self.offsets
+        for glyphID, glyphName in enumerate(self.glyphOrder):
+            if offsets[glyphID] != offsets[glyphID + 1]:
+                yield glyphName
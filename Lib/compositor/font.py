@@ -1,25 +1,37 @@
 from __future__ import unicode_literals
 import weakref
+import struct
+from array import array
 from fontTools.ttLib import TTFont
 from fontTools.pens.basePen import AbstractPen
-from fontTools.misc.textTools import tostr
-from compositor.layoutEngine import LayoutEngine
+from fontTools.pens.recordingPen import DecomposingRecordingPen, replayRecording
+from compositor.layoutEngine import LayoutEngine, _requireNumPy
 from compositor.glyphRecord import GlyphRecord
-from compositor.cmap import extractCMAP
+from compositor.cmap import CharacterMap, extractCMAP, extractVariationSequences
+from compositor.cache import LRUCache
 from compositor.error import CompositorError
+from compositor.memory import getObjectSize
 
 
 class Font(LayoutEngine):
 
-    def __init__(self, path, glyphClass=None):
+    def __init__(self, path, glyphClass=None, pathCacheSize=200000, glyphCacheSize=None, weakGlyphCache=False):
+        # there is nothing to close until the source is open.
+        self._closed = True
         super(Font, self).__init__()
         self.path = path
-        self._glyphs = {}
+        self.setGlyphCachePolicy(glyphCacheSize, weakGlyphCache)
+        self._glyphBounds = {}
+        # the path cache is limited by the total
+        # number of points in the cached glyphs.
+        self._pathCache = LRUCache(maxWeight=pathCacheSize)
         if isinstance(path, TTFont):
             self.source = path
         else:
             self.source = TTFont(path)
+        self._closed = False
         self.loadGlyphSet()
+        self.loadMetrics()
         self.loadCMAP()
         self.loadFeatures()
         self.loadInfo()
@@ -28,17 +40,28 @@ class Font(LayoutEngine):
         self.glyphClass = glyphClass
 
     def __del__(self):
-        del self._glyphs
+        self.close()
+
+    def close(self):
+        """
+        Discard the caches and close the source font file.
+        The font should not be used after this. Closing a
+        font that is already closed does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.clearCaches()
         self.source.close()
-        del self.source
 
     # --------------
     # initialization
     # --------------
 
     def loadCMAP(self):
-        cmap = extractCMAP(self.source)
-        self.setCMAP(cmap)
+        cmap = CharacterMap(extractCMAP(self.source), self.source.getGlyphOrder(), self._glyphOrder)
+        variationSequences = extractVariationSequences(self.source)
+        self.setCMAP(cmap, variationSequences)
 
     def loadGlyphSet(self):
         self.glyphSet = self.source.getGlyphSet()
@@ -50,6 +73,14 @@ class Font(LayoutEngine):
         for index, glyphName in enumerate(order):
             self._glyphOrder[glyphName] = index
 
+    def loadMetrics(self):
+        # the advance widths are read straight from
+        # the hmtx table into an array indexed by
+        # glyph ID so that they can be retrieved
+        # without creating glyph objects.
+        metrics = self.source["hmtx"].metrics
+        self._advanceWidths = array("H", [metrics[glyphName][0] for glyphName in self.source.getGlyphOrder()])
+
     def loadInfo(self):
         self.info = info = Info()
         head = self.source["head"]
@@ -129,36 +160,267 @@ class Font(LayoutEngine):
         return name in self.glyphSet
 
     def __getitem__(self, name):
-        if name not in self._glyphs:
+        glyph = self._glyphs.get(name)
+        if glyph is None:
             if name not in self.glyphSet:
                 name = self.fallbackGlyph
-            glyph = self.glyphSet[name]
-            index = self._glyphOrder[name]
-            glyph = self.glyphClass(name, index, glyph, self)
-            self._glyphs[name] = glyph
-        return self._glyphs[name]
+            glyph = self._glyphs.get(name)
+            if glyph is None:
+                source = self.glyphSet[name]
+                index = self._glyphOrder[name]
+                glyph = self.glyphClass(name, index, source, self)
+                if not self._frozen:
+                    self._glyphs[name] = glyph
+        return glyph
+
+    # -------
+    # caching
+    # -------
+
+    def setGlyphCachePolicy(self, maxSize=None, weak=False):
+        """
+        Set how glyph objects are kept after they are created.
+        - maxSize
+          The maximum number of glyph objects to keep. When this
+          is exceeded, the least recently used glyph is discarded.
+          If this is None, all glyph objects are kept.
+        - weak
+          If True, glyph objects are kept only as long as they
+          are referenced elsewhere. This can't be combined
+          with maxSize.
+
+        Any glyph objects that have already been created are
+        discarded.
+        """
+        if weak and maxSize is not None:
+            raise CompositorError("A weak glyph cache can't have a maximum size.")
+        if weak:
+            self._glyphs = weakref.WeakValueDictionary()
+        elif maxSize is not None:
+            self._glyphs = LRUCache(maxWeight=maxSize)
+            self._glyphs.frozen = self._frozen
+        else:
+            self._glyphs = {}
+        self._glyphCachePolicy = dict(maxSize=maxSize, weak=weak)
+
+    def getCacheInfo(self):
+        """
+        Get a dict describing the contents of the caches:
+        - glyphs
+          The number of cached glyph objects.
+        - glyphCachePolicy
+          A dict with the maxSize and weak settings.
+        - paths
+          The number of cached glyph recordings and paths.
+        - pathPoints
+          The total number of points in the path cache.
+        - pathCacheSize
+          The maximum number of points in the path cache.
+        - bounds
+          The number of cached glyph bounds.
+        """
+        return dict(
+            glyphs=len(self._glyphs),
+            glyphCachePolicy=dict(self._glyphCachePolicy),
+            paths=len(self._pathCache),
+            pathPoints=self._pathCache.weight,
+            pathCacheSize=self._pathCache.maxWeight,
+            bounds=len(self._glyphBounds)
+        )
+
+    def warmUp(self, glyphs=False):
+        """
+        Fill the caches before the font is shared, for example
+        before forking worker processes. If glyphs is True,
+        glyph objects and bounds are created for every glyph
+        in the font. Glyph objects beyond the glyph cache
+        size are discarded.
+        """
+        super(Font, self).warmUp()
+        if glyphs:
+            for glyphName in self.getGlyphOrder():
+                self[glyphName]
+                self.getGlyphBounds(glyphName)
+
+    def freeze(self):
+        super(Font, self).freeze()
+        if isinstance(self._glyphs, LRUCache):
+            self._glyphs.frozen = True
+        self._pathCache.frozen = True
+
+    def clearCaches(self):
+        """
+        Discard all cached glyph objects, paths and bounds.
+        """
+        self._glyphs.clear()
+        self._pathCache.clear()
+        self._glyphBounds.clear()
+
+    # ------
+    # memory
+    # ------
+
+    def memoryReport(self):
+        """
+        Get a dict with the approximate number of bytes used by
+        the font. In addition to the parts listed by
+        LayoutEngine.memoryReport this has:
+        - metrics
+          The advance widths and the glyph order.
+        - source
+          A dict of table tag to size for the tables of the
+          source TTFont that have been loaded. Tables that
+          have not been loaded are not listed.
+        - caches
+          This also has the sizes of the glyph objects,
+          the path cache and the glyph bounds.
+
+        The glyph objects don't include the outline data held
+        by the source tables.
+        """
+        return super(Font, self).memoryReport()
+
+    def _getMemoryReport(self, seen):
+        seen.add(id(self.source))
+        seen.add(id(self.glyphSet))
+        seen.add(id(self.info))
+        report = super(Font, self)._getMemoryReport(seen)
+        report["metrics"] = dict(
+            advanceWidths=getObjectSize(self._advanceWidths, seen),
+            glyphOrder=getObjectSize(self._glyphOrder, seen)
+        )
+        source = {}
+        for tag in self.source.keys():
+            if self.source.isLoaded(tag):
+                source[tag] = getObjectSize(self.source[tag], seen)
+        report["source"] = source
+        caches = report["caches"]
+        caches["glyphs"] = getObjectSize(self._glyphs, seen)
+        caches["paths"] = getObjectSize(self._pathCache, seen)
+        caches["bounds"] = getObjectSize(self._glyphBounds, seen)
+        return report
 
     # -----------------
     # string processing
     # -----------------
 
-    def stringToGlyphNames(self, string):
-        glyphNames = []
-        for c in string:
-            c = tostr(c)
-            v = ord(c)
-            if v in self.cmap:
-                glyphNames.append(self.cmap[v])
-            elif self.fallbackGlyph is not None:
-                glyphNames.append(self.fallbackGlyph)
-        return glyphNames
-
     def stringToGlyphRecords(self, string):
-        return [GlyphRecord(glyphName) for glyphName in self.stringToGlyphNames(string)]
+        glyphNames, clusters = self.stringToGlyphNamesAndClusters(string)
+        return [GlyphRecord(glyphName, cluster) for glyphName, cluster in zip(glyphNames, clusters)]
 
     def didProcessingGSUB(self, glyphRecords):
+        advanceWidths = self._advanceWidths
+        glyphOrder = self._glyphOrder
+        fallbackIndex = glyphOrder.get(self.fallbackGlyph)
         for glyphRecord in glyphRecords:
-            glyphRecord.advanceWidth += self[glyphRecord.glyphName].width
+            index = glyphOrder.get(glyphRecord.glyphName, fallbackIndex)
+            glyphRecord.advanceWidth += advanceWidths[index]
+
+    def _getGlyphIDMap(self):
+        return self._glyphOrder
+
+    # -------
+    # metrics
+    # -------
+
+    def getAdvanceWidth(self, glyphName):
+        """
+        Get the advance width of a glyph without loading
+        the glyph. If the glyph is not in the font, the
+        advance width of the fallback glyph is returned.
+        """
+        if glyphName not in self._glyphOrder:
+            glyphName = self.fallbackGlyph
+        return self._advanceWidths[self._glyphOrder[glyphName]]
+
+    # ------
+    # bounds
+    # ------
+
+    def getGlyphBounds(self, glyphName):
+        """
+        Get the bounding box of a glyph formatted as
+        (xMin, yMin, xMax, yMax). If the glyph contains
+        no outlines, None is returned. For TrueType fonts
+        the bounding box stored in the glyf table is used.
+        The result is cached.
+        """
+        if glyphName not in self._glyphOrder:
+            glyphName = self.fallbackGlyph
+        if glyphName not in self._glyphBounds:
+            if "glyf" in self.source:
+                bounds = _readGlyfBounds(self.source["glyf"], glyphName)
+            else:
+                bounds = self[glyphName].bounds
+            if self._frozen:
+                return bounds
+            self._glyphBounds[glyphName] = bounds
+        return self._glyphBounds[glyphName]
+
+    def getBounds(self, glyphNames):
+        """
+        Get the bounding boxes for a list of glyph names as a
+        NumPy array with one (xMin, yMin, xMax, yMax) row per
+        glyph. The row for a glyph without outlines is NaN.
+        This requires NumPy.
+        """
+        numpy = _requireNumPy("get the bounds as an array")
+        bounds = numpy.full((len(glyphNames), 4), numpy.nan)
+        for index, glyphName in enumerate(glyphNames):
+            glyphBounds = self.getGlyphBounds(glyphName)
+            if glyphBounds is not None:
+                bounds[index] = glyphBounds
+        return bounds
+
+    # -----
+    # paths
+    # -----
+
+    def _getGlyphRecording(self, glyphName):
+        """
+        Get the pen instructions for a glyph, with components
+        decomposed. These are stored in the path cache, weighted
+        by the number of points, along with the paths made from them.
+        """
+        key = (glyphName, None)
+        recording = self._pathCache.get(key)
+        if recording is None:
+            pen = DecomposingRecordingPen(self.glyphSet)
+            self.glyphSet[glyphName].draw(pen)
+            recording = pen.value
+            self._pathCache.set(key, recording, weight=_countRecordingPoints(recording))
+        return recording
+
+    def drawGlyph(self, glyphName, pen):
+        """
+        Draw a glyph with a pen. The glyph is only decoded
+        the first time it is drawn. After that, the cached
+        pen instructions are replayed. Components are
+        decomposed. If the glyph is not in the font, the
+        fallback glyph is drawn.
+        """
+        if glyphName not in self.glyphSet:
+            glyphName = self.fallbackGlyph
+        replayRecording(self._getGlyphRecording(glyphName), pen)
+
+    def getGlyphPath(self, glyphName, penFactory):
+        """
+        Get a pen that has drawn the glyph. penFactory is called
+        with the font as its only argument, following the
+        convention of the fontTools pens that take a glyph set,
+        for example CocoaPen. The pen is cached by glyph name and
+        penFactory, so the same factory should be passed each time.
+        """
+        if glyphName not in self.glyphSet:
+            glyphName = self.fallbackGlyph
+        key = (glyphName, penFactory)
+        pen = self._pathCache.get(key)
+        if pen is None:
+            recording = self._getGlyphRecording(glyphName)
+            pen = penFactory(self)
+            replayRecording(recording, pen)
+            self._pathCache.set(key, pen, weight=_countRecordingPoints(recording))
+        return pen
 
     # -------------
     # Miscellaneous
@@ -168,6 +430,23 @@ class Font(LayoutEngine):
         return self.source.getGlyphOrder()
 
 
+def _countRecordingPoints(recording):
+    return sum([len(args) for operator, args in recording])
+
+def _readGlyfBounds(glyfTable, glyphName):
+    glyph = glyfTable.glyphs[glyphName]
+    # read the header of compiled glyphs directly
+    # so that the glyph doesn't have to be expanded.
+    if hasattr(glyph, "data"):
+        if not glyph.data:
+            return None
+        numberOfContours, xMin, yMin, xMax, yMax = struct.unpack(">hhhhh", glyph.data[:10])
+        return xMin, yMin, xMax, yMax
+    if not glyph.numberOfContours:
+        return None
+    return glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax
+
+
 class Info(object): pass
 
 
@@ -182,15 +461,20 @@ class Glyph(object):
         self.width = source.width
         self.font = weakref.ref(font)
         self.index = index
+        self._bounds = None
+        self._boundsLoaded = False
 
     def draw(self, pen):
         self.source.draw(pen)
 
     def _get_bounds(self):
-        from fontTools.pens.boundsPen import BoundsPen
-        pen = BoundsPen(self.font())
-        self.draw(pen)
-        return pen.bounds
+        if not self._boundsLoaded:
+            from fontTools.pens.boundsPen import BoundsPen
+            pen = BoundsPen(self.font())
+            self.draw(pen)
+            self._bounds = pen.bounds
+            self._boundsLoaded = True
+        return self._bounds
 
     bounds = property(_get_bounds)
 
@@ -0,0 +1,236 @@
+"""
+A registry that shares Font objects.
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from compositor.font import Font
+from compositor.error import CompositorError
+
+
+class FontRegistry(object):
+
+    """
+    FontRegistry object.
+
+    This object hands out shared Font objects. Fonts are
+    identified by their absolute path, the modification
+    time of the file and the keyword arguments given for
+    the Font. Requesting a font that is already loaded
+    returns the loaded object, so the file is only opened
+    and its GSUB, GPOS and GDEF data is only compiled once.
+    If the file is modified, the next request loads it again.
+
+    Every font returned by acquireFont must be given back
+    with releaseFont. When a font is no longer used, it is
+    closed. If idleTimeout is given, the font is kept for
+    that many seconds and closed by the next call to
+    acquireFont, releaseFont or collect after that.
+
+        registry = FontRegistry(idleTimeout=60)
+        with registry.font("/path/to/a/font.otf") as font:
+            glyphRecords = font.process("Hello World!")
+
+    The feature states of a font are shared by everyone
+    using it. Fonts for the same file that are requested
+    with different keyword arguments are separate objects,
+    so they don't share their compiled tables or their
+    feature states.
+    """
+
+    def __init__(self, idleTimeout=None, fontClass=None):
+        if fontClass is None:
+            fontClass = Font
+        self.fontClass = fontClass
+        self.idleTimeout = idleTimeout
+        self._lock = threading.RLock()
+        # key : [font, reference count, idle since]
+        self._entries = {}
+        # id(font) : key
+        self._keys = {}
+
+    def _makeKey(self, path, kwargs):
+        path = os.path.abspath(path)
+        modificationTime = os.stat(path).st_mtime
+        return (path, modificationTime, tuple(sorted(kwargs.items())))
+
+    def acquireFont(self, path, **kwargs):
+        """
+        Get a Font for path. The keyword arguments are
+        passed to the font class when a new font is loaded.
+        """
+        key = self._makeKey(path, kwargs)
+        with self._lock:
+            self.collect()
+            entry = self._entries.get(key)
+            if entry is None:
+                font = self.fontClass(key[0], **kwargs)
+                entry = [font, 0, None]
+                self._entries[key] = entry
+                self._keys[id(font)] = key
+            entry[1] += 1
+            entry[2] = None
+            return entry[0]
+
+    def releaseFont(self, font):
+        """
+        Give back a Font obtained from acquireFont.
+        """
+        with self._lock:
+            key = self._keys.get(id(font))
+            if key is None:
+                raise CompositorError("The font is not in the registry.")
+            entry = self._entries[key]
+            if entry[1] == 0:
+                raise CompositorError("The font has been released more often than it was acquired.")
+            entry[1] -= 1
+            if entry[1] == 0:
+                if self.idleTimeout is None:
+                    self._closeEntry(key)
+                else:
+                    entry[2] = time.monotonic()
+            self.collect()
+
+    @contextmanager
+    def font(self, path, **kwargs):
+        """
+        Acquire a Font for the duration of a with statement.
+        """
+        font = self.acquireFont(path, **kwargs)
+        try:
+            yield font
+        finally:
+            self.releaseFont(font)
+
+    def collect(self, force=False):
+        """
+        Close the fonts that have been idle for longer than
+        idleTimeout. If force is True, all unused fonts are
+        closed regardless of how long they have been idle.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for key, (font, referenceCount, idleSince) in list(self._entries.items()):
+                if referenceCount or idleSince is None:
+                    continue
+                if force or now - idleSince >= self.idleTimeout:
+                    self._closeEntry(key)
+
+    def _closeEntry(self, key):
+        font = self._entries.pop(key)[0]
+        del self._keys[id(font)]
+        font.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def getFontInfo(self):
+        """
+        Get a list of (path, reference count) for the
+        loaded fonts.
+        """
+        with self._lock:
+            return [(key[0], entry[1]) for key, entry in self._entries.items()]
+
+# -----
+# Tests
+# -----
+
+def testReferenceCounting():
+    """
+    >>> import tempfile
+    >>> class TestFont(object):
+    ...     def __init__(self, path, **kwargs):
+    ...         self.closeCount = 0
+    ...     def close(self):
+    ...         self.closeCount += 1
+    >>> handle, path = tempfile.mkstemp()
+    >>> os.close(handle)
+
+    A font is closed when it is released as often as it was acquired.
+
+    >>> registry = FontRegistry(fontClass=TestFont)
+    >>> font = registry.acquireFont(path)
+    >>> registry.acquireFont(path) is font
+    True
+    >>> registry.getFontInfo() == [(os.path.abspath(path), 2)]
+    True
+    >>> registry.releaseFont(font)
+    >>> font.closeCount, len(registry)
+    (0, 1)
+    >>> registry.releaseFont(font)
+    >>> font.closeCount, len(registry)
+    (1, 0)
+    >>> registry.releaseFont(font)
+    Traceback (most recent call last):
+        ...
+    compositor.error.CompositorError: The font is not in the registry.
+
+    Different keyword arguments give different fonts.
+
+    >>> font = registry.acquireFont(path)
+    >>> other = registry.acquireFont(path, glyphCacheSize=10)
+    >>> other is font, len(registry)
+    (False, 2)
+    >>> registry.releaseFont(font)
+    >>> registry.releaseFont(other)
+
+    A modified file is loaded again.
+
+    >>> font = registry.acquireFont(path)
+    >>> os.utime(path, (0, 0))
+    >>> other = registry.acquireFont(path)
+    >>> other is font, len(registry)
+    (False, 2)
+    >>> registry.releaseFont(font)
+    >>> registry.releaseFont(other)
+
+    With an idle timeout, unused fonts are kept until they are collected.
+
+    >>> registry = FontRegistry(idleTimeout=60, fontClass=TestFont)
+    >>> with registry.font(path) as font:
+    ...     pass
+    >>> font.closeCount, len(registry)
+    (0, 1)
+    >>> with registry.font(path) as other:
+    ...     other is font
+    True
+    >>> registry.collect()
+    >>> font.closeCount, len(registry)
+    (0, 1)
+    >>> registry.collect(force=True)
+    >>> font.closeCount, len(registry)
+    (1, 0)
+    >>> os.remove(path)
+    """
+
+def testFontClose():
+    """
+    A registry font that was closed by its user and then
+    released, or collected, is only closed once.
+
+    >>> import gc
+    >>> import tempfile
+    >>> from compositor.tables import _makeTestFont
+    >>> handle, path = tempfile.mkstemp(suffix=".ttf")
+    >>> os.close(handle)
+    >>> _makeTestFont().source.save(path)
+    >>> registry = FontRegistry()
+    >>> font = registry.acquireFont(path)
+    >>> closeCount = []
+    >>> close = font.source.close
+    >>> font.source.close = lambda: closeCount.append(close())
+    >>> font.close()
+    >>> registry.releaseFont(font)
+    >>> del font
+    >>> _ = gc.collect()
+    >>> len(closeCount), len(registry)
+    (1, 0)
+    >>> os.remove(path)
+    """
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
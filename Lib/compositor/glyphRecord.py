@@ -40,6 +40,13 @@ class GlyphRecord(object):
     - ligatureComponents
       This is a list of glyph names that are the
       components of a ligature.
+    - cluster
+      The index of the character in the processed string,
+      or of the glyph name in the processed glyph list,
+      that the glyph came from. Glyphs made by a multiple
+      substitution keep the cluster of the substituted
+      glyph and a ligature gets the lowest cluster of
+      its components.
 
     This object contains three methods for making educated
     guesses about Unicode values. This is necessary when
@@ -63,9 +70,9 @@ class GlyphRecord(object):
                 "xAdvance", "yAdvance", "advanceWidth", "advanceHeight",
                 "alternates", "_alternatesReference",
                 "_ligatureComponents", "_ligatureComponentsReference",
-                "_substitutionHistory"]
+                "_substitutionHistory", "cluster"]
 
-    def __init__(self, glyphName):
+    def __init__(self, glyphName, cluster=0):
         self.glyph = None
         self.glyphName = glyphName
         self.xPlacement = 0
@@ -78,6 +85,7 @@ class GlyphRecord(object):
         self._alternatesReference = None
         self._ligatureComponents = []
         self._substitutionHistory = []
+        self.cluster = cluster
 
     def __repr__(self):
         name = str(self.glyphName)
@@ -129,13 +137,13 @@ class GlyphRecord(object):
         return None
 
 
-def glyphNamesToGlyphRecords(glyphList):
+def glyphNamesToGlyphRecords(glyphList, cluster=0):
     """
     >>> glyphList = ["a", "b"]
     >>> glyphNamesToGlyphRecords(glyphList)
     [<GlyphRecord: Name: a XPlacement: 0 YPlacement: 0 XAdvance: 0 YAdvance: 0>, <GlyphRecord: Name: b XPlacement: 0 YPlacement: 0 XAdvance: 0 YAdvance: 0>]
     """
-    return [GlyphRecord(glyphName) for glyphName in glyphList]
+    return [GlyphRecord(glyphName, cluster) for glyphName in glyphList]
 
 def glyphRecordsToTuples(glyphRecords):
     """
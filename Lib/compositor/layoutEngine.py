@@ -1,34 +1,99 @@
 from compositor.tables import GSUB, GPOS, GDEF
 from compositor.glyphRecord import GlyphRecord
-from compositor.cmap import reverseCMAP
+from compositor.cmap import CharacterMap, ReversedCharacterMap
 from compositor.textUtilities import convertCase
 from compositor.error import CompositorError
+from compositor.memory import getObjectSize
 from fontTools.misc.textTools import tostr
 
+# strings at least this long are mapped
+# with NumPy when it is available.
+bulkMappingThreshold = 64
+
+_numpy = None
+
+def _importNumPy():
+    """
+    Import NumPy on first use. This returns
+    False if NumPy is not available.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
+
+def _requireNumPy(purpose="process text to arrays"):
+    """
+    Import NumPy or raise a CompositorError
+    saying what it is required for.
+    """
+    numpy = _importNumPy()
+    if not numpy:
+        raise CompositorError("NumPy is required to %s" % purpose)
+    return numpy
+
+# the fields of the arrays returned by processToArray
+glyphArrayFields = [
+    ("glyphID", "i4"),
+    ("cluster", "i4"),
+    ("xPlacement", "i4"),
+    ("yPlacement", "i4"),
+    ("xAdvance", "i4"),
+    ("yAdvance", "i4"),
+    ("advanceWidth", "i4")
+]
+
 
 class LayoutEngine(object):
 
     def __init__(self):
-        self.cmap = {}
-        self.reversedCMAP = {}
+        self.cmap = CharacterMap({})
+        self.reversedCMAP = self.cmap.reverse()
+        self.variationSequences = {}
+        self._variationSelectors = set()
         self.gdef = None
         self.gsub = None
         self.gpos = None
         self.fallbackGlyph = ".notdef"
+        self._alternatesCache = {}
+        self._codePointTable = None
+        self._frozen = False
 
     # ------------
     # data setting
     # ------------
 
-    def setCMAP(self, cmap):
+    def setCMAP(self, cmap, variationSequences=None):
+        """
+        Set the character map. cmap is a dict or a CharacterMap
+        of code point to glyph name. It is stored as a CharacterMap,
+        so engine.cmap is read only, and a dict that is given is
+        kept by it and should not be changed afterwards. Call this
+        again to change the character map. variationSequences is
+        an optional dict of (code point, variation selector) to
+        glyph name, or to None when the sequence uses the default
+        glyph.
+        """
+        if variationSequences is None:
+            variationSequences = {}
+        if not isinstance(cmap, CharacterMap):
+            cmap = CharacterMap(cmap)
         self.cmap = cmap
-        self.reversedCMAP = reverseCMAP(cmap)
+        self.reversedCMAP = cmap.reverse()
+        self.variationSequences = variationSequences
+        self._variationSelectors = set([variationSelector for value, variationSelector in variationSequences])
+        self._codePointTable = None
         if self.gsub is not None:
             self.gsub.setCMAP(self.reversedCMAP)
         if self.gpos is not None:
             self.gpos.setCMAP(self.reversedCMAP)
 
     def setFeatureTables(self, gdef=None, gsub=None, gpos=None):
+        self._alternatesCache = {}
         self.gdef = None
         if gdef is not None:
             self.gdef = GDEF().loadFromFontTools(gdef)
@@ -44,35 +109,158 @@ class LayoutEngine(object):
     # -----------------
 
     def stringToGlyphNames(self, string):
+        return self._mapString(string)[0]
+
+    def stringToGlyphNamesAndClusters(self, string):
+        """
+        Map a string to glyph names. This returns the glyph
+        names and a list with the index of the character
+        that each glyph name was mapped from. If a subclass
+        overrides stringToGlyphNames, that is used instead
+        and the clusters are the indexes of the glyph names.
+
+            >>> engine = LayoutEngine()
+            >>> engine.setCMAP({0x61 : "a", 0x62 : "b"})
+            >>> engine.stringToGlyphNamesAndClusters("a\\u0300b")
+            (['a', '.notdef', 'b'], [0, 1, 2])
+            >>> engine.fallbackGlyph = None
+            >>> engine.stringToGlyphNamesAndClusters("a\\u0300b")
+            (['a', 'b'], [0, 2])
+            >>> class SmallCapsEngine(LayoutEngine):
+            ...     def stringToGlyphNames(self, string):
+            ...         return [glyphName + ".sc" for glyphName in super().stringToGlyphNames(string)]
+            >>> engine = SmallCapsEngine()
+            >>> engine.setCMAP({0x61 : "a", 0x62 : "b"})
+            >>> [(r.glyphName, r.cluster) for r in engine.process("ab")]
+            [('a.sc', 0), ('b.sc', 1)]
+        """
+        if type(self).stringToGlyphNames is not LayoutEngine.stringToGlyphNames:
+            glyphNames = self.stringToGlyphNames(string)
+            return glyphNames, list(range(len(glyphNames)))
+        return self._mapString(string, trackClusters=True)
+
+    def _mapString(self, string, trackClusters=False):
+        if len(string) >= bulkMappingThreshold and isinstance(string, str) and self.cmap:
+            numpy = _importNumPy()
+            if numpy and not self._containsVariationSelector(string):
+                return self._mapStringBulk(string, numpy, trackClusters)
+        # the dict behind the character map is used
+        # directly, since this is done for every character.
+        cmap = self.cmap
+        if isinstance(cmap, CharacterMap):
+            cmap = cmap._mapping
+        fallbackGlyph = self.fallbackGlyph
+        variationSequences = self.variationSequences
+        variationSelectors = self._variationSelectors
         glyphNames = []
-        for c in string:
+        clusters = None
+        if trackClusters:
+            clusters = []
+        previous = None
+        for index, c in enumerate(string):
             c = tostr(c)
             v = ord(c)
-            if v in self.cmap:
-                glyphNames.append(self.cmap[v])
-            elif self.fallbackGlyph is not None:
-                glyphNames.append(self.fallbackGlyph)
-        return glyphNames
+            # a variation selector known to the font selects
+            # the glyph for the preceding character and does
+            # not get a glyph of its own.
+            if previous is not None and v in variationSelectors:
+                glyphName = variationSequences.get((previous, v))
+                if glyphName is not None:
+                    glyphNames[-1] = glyphName
+                previous = None
+                continue
+            previous = None
+            glyphName = cmap.get(v)
+            if glyphName is not None:
+                glyphNames.append(glyphName)
+            elif fallbackGlyph is not None:
+                glyphNames.append(fallbackGlyph)
+            else:
+                continue
+            if trackClusters:
+                clusters.append(index)
+            previous = v
+        return glyphNames, clusters
+
+    def _containsVariationSelector(self, string):
+        for variationSelector in self._variationSelectors:
+            if chr(variationSelector) in string:
+                return True
+        return False
+
+    def _getCodePointTable(self, numpy):
+        """
+        Get the cmap as a sorted array of code points and
+        an array of the corresponding glyph names.
+        """
+        table = self._codePointTable
+        if table is None:
+            cmap = self.cmap
+            if not isinstance(cmap, CharacterMap):
+                cmap = CharacterMap(cmap)
+            glyphOrder = numpy.empty(len(cmap.glyphOrder), dtype=object)
+            glyphOrder[:] = cmap.glyphOrder
+            glyphNames = glyphOrder[numpy.array(cmap.glyphIDs, dtype=numpy.intp)]
+            table = (numpy.array(cmap.codePoints, dtype=numpy.uint32), glyphNames)
+            if not self._frozen:
+                self._codePointTable = table
+        return table
+
+    def _mapStringBulk(self, string, numpy, trackClusters):
+        """
+        Map a string to glyph names by encoding it to UTF-32 and
+        searching the code points in the sorted cmap array. This
+        avoids the per character work of _mapString for long
+        strings. Variation sequences are not handled here.
+        """
+        codePoints, glyphNames = self._getCodePointTable(numpy)
+        values = numpy.frombuffer(string.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+        indexes = numpy.searchsorted(codePoints, values)
+        indexes[indexes == len(codePoints)] = len(codePoints) - 1
+        found = codePoints[indexes] == values
+        clusters = None
+        if self.fallbackGlyph is None:
+            if trackClusters:
+                clusters = numpy.flatnonzero(found).tolist()
+            return glyphNames[indexes[found]].tolist(), clusters
+        result = glyphNames[indexes]
+        result[~found] = self.fallbackGlyph
+        if trackClusters:
+            clusters = list(range(len(values)))
+        return result.tolist(), clusters
 
     def stringToGlyphRecords(self, string):
-        return [GlyphRecord(glyphName) for glyphName in self.stringToGlyphNames(string)]
+        glyphNames, clusters = self.stringToGlyphNamesAndClusters(string)
+        return self.glyphListToGlyphRecords(glyphNames, clusters)
 
-    def glyphListToGlyphRecords(self, glyphList):
+    def glyphListToGlyphRecords(self, glyphList, clusters=None):
+        if clusters is None:
+            clusters = range(len(glyphList))
         glyphRecords = []
-        for glyphName in glyphList:
-            record = GlyphRecord(glyphName)
+        for glyphName, cluster in zip(glyphList, clusters):
+            record = GlyphRecord(glyphName, cluster)
             glyphRecords.append(record)
         return glyphRecords
 
-    def process(self, stringOrGlyphList, script="latn", langSys=None, rightToLeft=False, case="unchanged", logger=None):
+    def process(self, stringOrGlyphList, script="latn", langSys=None, rightToLeft=False, case="unchanged", logger=None, profiler=None):
+        """
+        Process a string or a list of glyph names with the
+        GSUB and GPOS tables and return a list of glyph records.
+        The cluster of each record is the index of the character
+        in the string, or of the glyph name in the list, that
+        the glyph came from.
+        """
+        clusters = None
         if isinstance(stringOrGlyphList, str):
-            stringOrGlyphList = self.stringToGlyphNames(stringOrGlyphList)
+            stringOrGlyphList, clusters = self.stringToGlyphNamesAndClusters(stringOrGlyphList)
         if case != "unchanged":
             l = langSys
             if l is not None:
                 l = l.strip()
-            stringOrGlyphList = convertCase(case, stringOrGlyphList, self.cmap, self.reversedCMAP, l, self.fallbackGlyph)
-        glyphRecords = self.glyphListToGlyphRecords(stringOrGlyphList)
+            if clusters is None:
+                clusters = list(range(len(stringOrGlyphList)))
+            stringOrGlyphList, clusters = convertCase(case, stringOrGlyphList, self.cmap, self.reversedCMAP, l, self.fallbackGlyph, clusters=clusters)
+        glyphRecords = self.glyphListToGlyphRecords(stringOrGlyphList, clusters)
         if rightToLeft:
             glyphRecords.reverse()
         if logger:
@@ -84,7 +272,7 @@ class LayoutEngine(object):
 
             if logger:
                 logger.logTableStart(self.gsub)
-            glyphRecords = self.gsub.process(glyphRecords, script=script, langSys=langSys, logger=logger)
+            glyphRecords = self.gsub.process(glyphRecords, script=script, langSys=langSys, logger=logger, profiler=profiler)
             if logger:
                 logger.logResults(glyphRecords)
                 logger.logTableEnd()
@@ -95,7 +283,7 @@ class LayoutEngine(object):
 
             if logger:
                 logger.logTableStart(self.gpos)
-            glyphRecords = self.gpos.process(glyphRecords, script=script, langSys=langSys, logger=logger)
+            glyphRecords = self.gpos.process(glyphRecords, script=script, langSys=langSys, logger=logger, profiler=profiler)
             if logger:
                 logger.logResults(glyphRecords)
                 logger.logTableEnd()
@@ -116,6 +304,63 @@ class LayoutEngine(object):
     def didProcessingGPOS(self, glyphRecords):
         pass
 
+    # ------
+    # arrays
+    # ------
+
+    def processToArray(self, stringOrGlyphList, script="latn", langSys=None, rightToLeft=False, case="unchanged"):
+        """
+        Process a string or glyph list and return the glyph
+        records as a NumPy structured array with one row per
+        glyph and the fields listed in glyphArrayFields.
+        glyphID is -1 for glyphs that have no glyph ID.
+        This requires NumPy.
+        """
+        numpy = _requireNumPy()
+        glyphRecords = self.process(stringOrGlyphList, script=script, langSys=langSys, rightToLeft=rightToLeft, case=case)
+        return numpy.array(self._glyphRecordsToRows(glyphRecords), dtype=glyphArrayFields)
+
+    def processBatchToArray(self, stringsOrGlyphLists, script="latn", langSys=None, rightToLeft=False, case="unchanged"):
+        """
+        Process several strings or glyph lists and return
+        one concatenated array, as returned by processToArray,
+        and an array of offsets. The rows for item i are
+        array[offsets[i]:offsets[i + 1]].
+        This requires NumPy.
+        """
+        numpy = _requireNumPy()
+        rows = []
+        offsets = [0]
+        for stringOrGlyphList in stringsOrGlyphLists:
+            glyphRecords = self.process(stringOrGlyphList, script=script, langSys=langSys, rightToLeft=rightToLeft, case=case)
+            rows.extend(self._glyphRecordsToRows(glyphRecords))
+            offsets.append(len(rows))
+        return numpy.array(rows, dtype=glyphArrayFields), numpy.array(offsets, dtype=numpy.intp)
+
+    def _glyphRecordsToRows(self, glyphRecords):
+        glyphIDs = self._getGlyphIDMap()
+        fallbackID = glyphIDs.get(self.fallbackGlyph, -1)
+        return [
+            (
+                glyphIDs.get(record.glyphName, fallbackID),
+                record.cluster,
+                record.xPlacement,
+                record.yPlacement,
+                record.xAdvance,
+                record.yAdvance,
+                record.advanceWidth
+            )
+            for record in glyphRecords
+        ]
+
+    def _getGlyphIDMap(self):
+        """
+        Get a dict of glyph name to glyph ID. The engine
+        doesn't know the glyph order, so this is empty.
+        Subclasses that load a font should override this.
+        """
+        return {}
+
     # ------------------
     # feature management
     # ------------------
@@ -172,3 +417,202 @@ class LayoutEngine(object):
         if self.gpos is not None:
             if featureTag in self.gpos:
                 self.gpos.setFeatureState(featureTag, state)
+
+    # ----------
+    # alternates
+    # ----------
+
+    def getAlternatesMap(self, features=("aalt",)):
+        """
+        Get a dict of glyph name to a list of alternate glyph
+        names for every glyph in the font that has alternates
+        in the given features. The map is built from the GSUB
+        lookup tables without shaping any text and it is cached
+        for each set of features. The returned dict is shared,
+        so it should not be modified by the caller. features
+        is a feature tag or a list of feature tags.
+
+            >>> from compositor.tables import _makeTestFont
+            >>> font = _makeTestFont("feature salt { sub a from [b i]; } salt;")
+            >>> font.getAlternatesMap(["salt"])
+            {'a': ['b', 'i']}
+            >>> font.getAlternatesMap("salt") is font.getAlternatesMap(["salt"])
+            True
+            >>> list(font._alternatesCache)
+            [('salt',)]
+        """
+        if isinstance(features, str):
+            features = (features,)
+        features = tuple(features)
+        if features not in self._alternatesCache:
+            alternates = {}
+            if self.gsub is not None:
+                alternates = self.gsub.getAlternates(features)
+            if self._frozen:
+                return alternates
+            self._alternatesCache[features] = alternates
+        return self._alternatesCache[features]
+
+    # -------
+    # caching
+    # -------
+
+    def warmUp(self):
+        """
+        Fill the lazily built caches so that processing
+        doesn't have to store anything in them later. This
+        covers every script and langSys in the tables with
+        the current feature states, the aalt alternates and
+        the arrays of the character maps.
+        """
+        for table in (self.gsub, self.gpos):
+            if table is not None:
+                table.warmUp()
+        self.getAlternatesMap()
+        for characterMap in (self.cmap, self.reversedCMAP):
+            if isinstance(characterMap, (CharacterMap, ReversedCharacterMap)):
+                characterMap.compile()
+        numpy = _importNumPy()
+        if numpy and self.cmap:
+            self._getCodePointTable(numpy)
+
+    def freeze(self):
+        """
+        Stop storing anything in the caches. This is meant for
+        servers that load fonts in a parent process and then
+        fork workers: after warmUp and freeze the compiled
+        objects are only read, so the memory pages holding
+        them are not copied by the workers. Calling gc.freeze()
+        just before forking keeps the garbage collector from
+        touching them too. Anything missing from the caches
+        is computed on demand and discarded.
+        """
+        self._frozen = True
+        for table in (self.gsub, self.gpos):
+            if table is not None:
+                table.freeze()
+
+    # ------
+    # memory
+    # ------
+
+    def memoryReport(self):
+        """
+        Get a dict with the approximate number of bytes used
+        by the parts of the engine. The sizes are measured by
+        walking the objects, so this can be slow for large
+        fonts. Objects that are shared by several parts are
+        counted once, in the first part that refers to them,
+        in this order:
+        - characterMap
+          A dict with the sizes of cmap, reversedCMAP
+          and variationSequences.
+        - tables
+          A dict of GDEF, GSUB and GPOS. The GSUB and GPOS
+          entries list the bytes of each lookup and subtable
+          and the totals per lookup type.
+        - caches
+          A dict with the sizes of the caches.
+        - total
+          The sum of all of the above.
+        """
+        report = self._getMemoryReport(set([id(self)]))
+        report["total"] = _sumMemoryReport(report)
+        return report
+
+    def _getMemoryReport(self, seen):
+        """
+        Subclasses may override this to add their own
+        parts to the report. seen is passed to
+        getObjectSize for every measurement.
+        """
+        # the tables refer to the reversed cmap and the
+        # lookups refer to GDEF, so these are measured first
+        characterMap = dict(
+            cmap=getObjectSize(self.cmap, seen),
+            reversedCMAP=getObjectSize(self.reversedCMAP, seen),
+            variationSequences=getObjectSize(self.variationSequences, seen)
+        )
+        tables = {}
+        if self.gdef is not None:
+            tables["GDEF"] = dict(total=getObjectSize(self.gdef, seen))
+        for tag, table in (("GSUB", self.gsub), ("GPOS", self.gpos)):
+            if table is not None:
+                tables[tag] = _getTableMemoryReport(table, seen)
+        caches = dict(
+            alternates=getObjectSize(self._alternatesCache, seen),
+            codePointTable=getObjectSize(self._codePointTable, seen)
+        )
+        return dict(tables=tables, characterMap=characterMap, caches=caches)
+
+
+def _getTableMemoryReport(table, seen):
+    lookups = []
+    lookupTypes = {}
+    for index, lookup in enumerate(table.LookupList.Lookup):
+        subtables = []
+        for subtableIndex, subtable in enumerate(lookup.SubTable):
+            subtables.append(dict(
+                index=subtableIndex,
+                type=subtable.__class__.__name__,
+                total=getObjectSize(subtable, seen)
+            ))
+        total = sum([subtable["total"] for subtable in subtables]) + getObjectSize(lookup, seen)
+        lookups.append(dict(index=index, lookupType=lookup.LookupType, total=total, subtables=subtables))
+        lookupTypes[lookup.LookupType] = lookupTypes.get(lookup.LookupType, 0) + total
+    # the script and feature lists and the caches
+    other = getObjectSize(table, seen)
+    total = sum(lookupTypes.values()) + other
+    return dict(total=total, lookupTypes=lookupTypes, lookups=lookups, other=other)
+
+def _sumMemoryReport(report):
+    total = 0
+    for value in report.values():
+        if isinstance(value, dict):
+            if "total" in value:
+                total += value["total"]
+            else:
+                total += _sumMemoryReport(value)
+        else:
+            total += value
+    return total
+
+# -----
+# Tests
+# -----
+
+def testProcessToArray():
+    """
+    The rows hold the glyph IDs, the clusters and
+    the positions of the processed glyph records.
+
+    >>> from compositor.tables import _makeTestFont
+    >>> font = _makeTestFont()
+    >>> glyphs = font.processToArray("a\\u0301 bb")
+    >>> glyphs.dtype.names
+    ('glyphID', 'cluster', 'xPlacement', 'yPlacement', 'xAdvance', 'yAdvance', 'advanceWidth')
+    >>> glyphs.tolist()
+    [(2, 0, 0, 0, 0, 0, 500), (7, 1, -400, 50, 0, 0, 0), (1, 2, 0, 0, 0, 0, 500), (3, 3, 0, 0, 0, 0, 500), (3, 4, 0, 100, 0, 0, 500)]
+    >>> glyphOrder = font.getGlyphOrder()
+    >>> [glyphOrder[glyphID] for glyphID in glyphs["glyphID"]] == [r.glyphName for r in font.process("a\\u0301 bb")]
+    True
+
+    The batch rows are the rows of each item in turn.
+
+    >>> glyphs, offsets = font.processBatchToArray(["a\\u0301", "", "bb"])
+    >>> offsets.tolist()
+    [0, 2, 2, 4]
+    >>> glyphs[offsets[2]:offsets[3]].tolist() == font.processToArray("bb").tolist()
+    True
+
+    Glyphs without a glyph ID get -1.
+
+    >>> engine = LayoutEngine()
+    >>> engine.setCMAP({0x61 : "a"})
+    >>> engine.processToArray("ab")["glyphID"].tolist()
+    [-1, -1]
+    """
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
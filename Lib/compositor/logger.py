@@ -14,7 +14,18 @@ Usage:
     report = logger.getText()
 
 The returned log is in XML format.
+
+The Tracer is a lighter alternative. It records
+compact event tuples in a ring buffer that holds
+the most recent events and only formats them
+when they are asked for:
+
+    tracer = Tracer(capacity=10000)
+    font.process("Hello World!", logger=tracer)
+    events = tracer.getEvents()
+    report = tracer.getText()
 """
+from collections import deque
 from io import StringIO
 from fontTools.misc.xmlWriter import XMLWriter
 
@@ -164,3 +175,137 @@ class Logger(object):
 
     def getText(self):
         return self._file.getvalue()
+
+
+class Tracer(object):
+
+    """
+    Record the processing as event tuples. Each event
+    starts with its name:
+
+    - ("start",) and ("end",)
+    - ("settings", glyphNames, script, langSys)
+    - ("table", tableTag) and ("tableEnd",)
+    - ("applicableLookups", tableTag, ((featureTag, lookupIndex), ...))
+    - ("lookup", tableTag, featureTag, lookupIndex) and ("lookupEnd",)
+    - ("subTable", subTableIndex, subTableType, position, glyphName)
+    - ("output", glyphName, xPlacement, yPlacement, xAdvance, yAdvance)
+    - ("results", glyphNames)
+
+    Once capacity events have been recorded,
+    the oldest events are dropped.
+    """
+
+    def __init__(self, capacity=10000):
+        self._events = deque(maxlen=capacity)
+        self._lookupIndexes = {}
+        self._subTableIndexes = {}
+        self._subTable = None
+
+    def clear(self):
+        self._events.clear()
+
+    def getEvents(self):
+        return list(self._events)
+
+    # -------------
+    # logger events
+    # -------------
+
+    def logStart(self):
+        self._events.append(("start",))
+
+    def logEnd(self):
+        self._events.append(("end",))
+
+    def logMainSettings(self, glyphNames, script, langSys):
+        self._events.append(("settings", tuple(glyphNames), script, langSys))
+
+    def logTableStart(self, table):
+        self._events.append(("table", table.__class__.__name__))
+
+    def logTableEnd(self):
+        self._events.append(("tableEnd",))
+
+    def _getLookupIndex(self, table, lookup):
+        indexes = self._lookupIndexes.get(id(table))
+        if indexes is None:
+            indexes = self._lookupIndexes[id(table)] = dict([(id(l), i) for i, l in enumerate(table.LookupList.Lookup)])
+        return indexes[id(lookup)]
+
+    def logApplicableLookups(self, table, lookups):
+        lookups = tuple([(tag, self._getLookupIndex(table, lookup)) for tag, lookup in lookups])
+        self._events.append(("applicableLookups", table.__class__.__name__, lookups))
+
+    def logProcessingStart(self):
+        pass
+
+    def logProcessingEnd(self):
+        pass
+
+    def logLookupStart(self, table, tag, lookup):
+        self._subTableIndexes = dict([(id(subtable), i) for i, subtable in enumerate(lookup.SubTable)])
+        self._events.append(("lookup", table.__class__.__name__, tag, self._getLookupIndex(table, lookup)))
+
+    def logLookupEnd(self):
+        self._events.append(("lookupEnd",))
+
+    def logSubTableStart(self, lookup, subtable):
+        self._subTable = subtable
+
+    def logSubTableEnd(self):
+        self._subTable = None
+
+    def logInput(self, processed, unprocessed):
+        subtable = self._subTable
+        self._events.append(("subTable", self._subTableIndexes.get(id(subtable)), subtable.__class__.__name__, len(processed), unprocessed[0].glyphName))
+
+    def logOutput(self, processed, unprocessed):
+        if processed:
+            r = processed[-1]
+        elif unprocessed:
+            r = unprocessed[0]
+        else:
+            return
+        self._events.append(("output", r.glyphName, r.xPlacement, r.yPlacement, r.xAdvance, r.yAdvance))
+
+    def logResults(self, processed):
+        self._events.append(("results", tuple([r.glyphName for r in processed])))
+
+    # ----------
+    # formatting
+    # ----------
+
+    def getText(self):
+        """
+        Format the recorded events as indented lines of text.
+        """
+        lines = []
+        depth = 0
+        for event in self._events:
+            name = event[0]
+            if name in ("end", "tableEnd", "lookupEnd"):
+                depth = max(depth - 1, 0)
+                continue
+            if name == "start":
+                line = "start"
+            elif name == "settings":
+                line = "settings: %s script=%s langSys=%s" % (" ".join(event[1]), event[2], event[3])
+            elif name == "table":
+                line = "table %s" % event[1]
+            elif name == "applicableLookups":
+                line = "lookups: %s" % " ".join(["%s:%d" % lookup for lookup in event[2]])
+            elif name == "lookup":
+                line = "lookup %d (%s)" % (event[3], event[2])
+            elif name == "subTable":
+                line = "subtable %s %s at %d: %s" % (event[1], event[2], event[3], event[4])
+            elif name == "output":
+                line = "    -> %s (%s, %s, %s, %s)" % event[1:]
+            elif name == "results":
+                line = "results: %s" % " ".join(event[1])
+            else:
+                line = repr(event)
+            lines.append("    " * depth + line)
+            if name in ("start", "table", "lookup"):
+                depth += 1
+        return "\n".join(lines)
@@ -4,6 +4,7 @@ GSUB and GPOS LookupList objects (and friends).
 
 
 import weakref
+from fontTools.otlLib.maxContextCalc import maxCtxSubtable
 from compositor.subTablesGSUB import *
 from compositor.subTablesGPOS import *
 
@@ -31,7 +32,12 @@ class BaseLookupList(object):
 class BaseLookup(object):
 
     __slots__ = ["LookupType", "LookupFlag", "SubTableCount", "SubTable",
-                "_lookupList", "_gdefReference", "__weakref__"]
+                "maxContext", "_lookupList", "_gdefReference", "__weakref__"]
+    _tableTag = None
+    _extensionLookupType = None
+    # lookup types that may read any number
+    # of glyphs from the current position on
+    _unboundedLookupTypes = ()
 
     def __init__(self):
         self._lookupList = None
@@ -40,6 +46,7 @@ class BaseLookup(object):
         self.LookupFlag = None
         self.SubTableCount = 0
         self.SubTable = []
+        self.maxContext = None
 
     def loadFromFontTools(self, lookup, lookupList, gdef):
         self._lookupList = weakref.ref(lookupList)
@@ -57,8 +64,27 @@ class BaseLookup(object):
             cls = self._lookupSubTableClass(format)
             obj = cls().loadFromFontTools(subtable, self)
             self.SubTable.append(obj)
+        self.maxContext = self._getMaxContext(lookup)
         return self
 
+    def _getMaxContext(self, lookup):
+        """
+        Get the largest number of glyphs, not counting the
+        glyphs skipped by the lookup flag, that a subtable
+        reads from the current position on. The backtrack is
+        read from the processed glyphs and is not counted.
+        None means that there is no limit.
+        """
+        maxContext = 1
+        for subtable in lookup.SubTable:
+            lookupType = lookup.LookupType
+            if lookupType == self._extensionLookupType:
+                lookupType = subtable.ExtensionLookupType
+            if lookupType in self._unboundedLookupTypes:
+                return None
+            maxContext = maxCtxSubtable(maxContext, self._tableTag, lookup.LookupType, subtable)
+        return maxContext
+
     def _get_gdef(self):
         if self._gdefReference is not None:
             return self._gdefReference()
@@ -69,15 +95,26 @@ class BaseLookup(object):
 
 class LookupFlag(object):
 
-    __slots__ = ["_gdef", "_flag"]
+    """
+    The glyphs that are skipped with the flag are compiled
+    from the GDEF glyph classes into the ignoredGlyphs
+    frozenset when the flag is loaded. Checking if a glyph
+    is skipped is a membership test in that set.
+    """
+
+    __slots__ = ["_gdef", "_flag", "ignoredGlyphs"]
 
     def __init__(self):
         self._gdef = None
         self._flag = None
+        self.ignoredGlyphs = frozenset()
 
     def loadFromFontTools(self, lookupFlag, gdef):
         self._gdef = gdef
         self._flag = lookupFlag
+        self.ignoredGlyphs = frozenset()
+        if gdef is not None:
+            self.ignoredGlyphs = gdef().getIgnoredGlyphs(lookupFlag)
         return self
 
     def _get_haveIgnore(self):
@@ -111,27 +148,7 @@ class LookupFlag(object):
     MarkAttachmentType = property(_get_MarkAttachmentType)
 
     def coversGlyph(self, glyphName):
-        gdef = self._gdef
-        if gdef is None:
-            return False
-        gdef = gdef()
-        cls = gdef.GlyphClassDef[glyphName]
-        if cls == 0:
-            return False
-        if self._haveIgnore:
-            if cls == 1 and self.IgnoreBaseGlyphs: #IgnoreBaseGlyphs
-                return True
-            if cls == 2 and self.IgnoreLigatures: #IgnoreLigatures
-                return True
-            if cls == 3 and self.IgnoreMarks: #IgnoreMarks
-                return True
-        if self.MarkAttachmentType and cls == 3:
-            if gdef.MarkAttachClassDef is None:
-                return False
-            markClass = gdef.MarkAttachClassDef[glyphName]
-            if (self._flag & 0xff00) >> 8 != markClass:
-                return True
-        return False
+        return glyphName in self.ignoredGlyphs
 
 # ----
 # GSUB
@@ -141,6 +158,8 @@ class LookupFlag(object):
 class GSUBLookup(BaseLookup):
 
     __slots__ = []
+    _tableTag = "GSUB"
+    _extensionLookupType = 7
 
     def _lookupSubTableClass(self, subtableFormat):
         lookupType = self.LookupType
@@ -177,6 +196,10 @@ class GSUBLookupList(BaseLookupList):
 class GPOSLookup(BaseLookup):
 
     __slots__ = []
+    _tableTag = "GPOS"
+    _extensionLookupType = 9
+    # a cursive attachment chain can be of any length
+    _unboundedLookupTypes = (3,)
 
     def _lookupSubTableClass(self, subtableFormat):
         lookupType = self.LookupType
@@ -0,0 +1,86 @@
+"""
+Approximate memory measurement.
+"""
+
+import sys
+import types
+import weakref
+
+# objects of these types are shared by everything
+# that uses them, so they are not counted.
+_sharedTypes = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    weakref.ref,
+    type(None),
+    bool
+)
+
+# these are counted, but they don't refer to anything else.
+_atomicTypes = (str, bytes, bytearray, int, float, complex, memoryview)
+
+
+def getObjectSize(obj, seen=None):
+    """
+    Get the approximate number of bytes used by an object
+    and everything that it refers to. Objects with an id
+    in seen are skipped and the ids of all counted objects
+    are added to it, so a shared seen set counts each object
+    only once, where it is first found. Classes, modules,
+    functions and weak references are not followed.
+
+        >>> getObjectSize([]) == sys.getsizeof([])
+        True
+        >>> item = "x" * 100
+        >>> getObjectSize([item, item]) == sys.getsizeof([item, item]) + sys.getsizeof(item)
+        True
+        >>> seen = set()
+        >>> getObjectSize(item, seen) > 0
+        True
+        >>> getObjectSize([item], seen) == sys.getsizeof([item])
+        True
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        objID = id(obj)
+        if objID in seen:
+            continue
+        seen.add(objID)
+        if isinstance(obj, _sharedTypes):
+            continue
+        size += sys.getsizeof(obj)
+        if isinstance(obj, _atomicTypes):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+            continue
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+            continue
+        # fontTools tables load their data on attribute
+        # access, so the attributes are read directly.
+        try:
+            stack.append(object.__getattribute__(obj, "__dict__"))
+        except AttributeError:
+            pass
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = [slots]
+            for name in slots:
+                if name in ("__dict__", "__weakref__"):
+                    continue
+                try:
+                    stack.append(object.__getattribute__(obj, name))
+                except AttributeError:
+                    pass
+    return size
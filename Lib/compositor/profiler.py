@@ -0,0 +1,125 @@
+"""
+A lightweight profiling object. It records, with
+the help of the tables, how much time is spent in
+each lookup and subtable and how often they match.
+
+Usage:
+
+    profiler = Profiler()
+    font = Font("/path/to/a/font.otf")
+    font.process("Hello World!", profiler=profiler)
+    data = profiler.getData()
+    text = profiler.getJSON()
+
+The profiler can be passed to any number of process
+calls. The numbers accumulate until reset is called.
+Consecutive single substitution lookups are not
+composed while profiling, so they can be measured
+one by one.
+"""
+import json
+
+
+class Profiler(object):
+
+    def __init__(self):
+        self._lookups = {}
+        self._lookupIndexes = {}
+
+    def reset(self):
+        self._lookups = {}
+        self._lookupIndexes = {}
+
+    # -------------
+    # table support
+    # -------------
+
+    def _getLookupIndex(self, table, lookup):
+        indexes = self._lookupIndexes.get(id(table))
+        if indexes is None:
+            indexes = self._lookupIndexes[id(table)] = dict([(id(l), i) for i, l in enumerate(table.LookupList.Lookup)])
+        return indexes[id(lookup)]
+
+    def getLookupRecord(self, table, featureTag, lookup):
+        """
+        Get the dict that the numbers for a lookup are added to.
+        """
+        tableTag = table.__class__.__name__
+        key = (tableTag, self._getLookupIndex(table, lookup))
+        record = self._lookups.get(key)
+        if record is None:
+            subtables = []
+            for index, subtable in enumerate(lookup.SubTable):
+                subtables.append(dict(
+                    index=index,
+                    type=subtable.__class__.__name__,
+                    calls=0,
+                    coverageHits=0,
+                    applications=0,
+                    time=0.0
+                ))
+            record = self._lookups[key] = dict(
+                table=tableTag,
+                index=key[1],
+                lookupType=lookup.LookupType,
+                features=set(),
+                calls=0,
+                positions=0,
+                applications=0,
+                time=0.0,
+                subtables=subtables
+            )
+        record["features"].add(featureTag)
+        return record
+
+    def logSubTable(self, lookupRecord, index, subtable, glyphName, performedAction, time):
+        record = lookupRecord["subtables"][index]
+        record["calls"] += 1
+        record["time"] += time
+        if performedAction:
+            record["applications"] += 1
+            record["coverageHits"] += 1
+        elif _coversGlyph(subtable, glyphName):
+            record["coverageHits"] += 1
+
+    # ------
+    # output
+    # ------
+
+    def getData(self):
+        """
+        Get the recorded numbers as a dict. The lookups are
+        listed by table and index and each lists its subtables.
+        Times are in seconds.
+        """
+        lookups = []
+        for key in sorted(self._lookups):
+            record = dict(self._lookups[key])
+            record["features"] = sorted(record["features"])
+            record["subtables"] = [dict(subtable) for subtable in record["subtables"]]
+            lookups.append(record)
+        totalTime = sum([record["time"] for record in lookups])
+        return dict(time=totalTime, lookups=lookups)
+
+    def getJSON(self, indent=None):
+        return json.dumps(self.getData(), indent=indent)
+
+
+def _coversGlyph(subtable, glyphName):
+    """
+    Returns a boolean indicating if the glyph is in
+    the first coverage that the subtable tests.
+    """
+    extension = getattr(subtable, "ExtSubTable", None)
+    if extension is not None:
+        subtable = extension
+    for attr in ("Coverage", "InputCoverage", "MarkCoverage", "Mark1Coverage"):
+        coverage = getattr(subtable, attr, None)
+        if coverage is None:
+            continue
+        if isinstance(coverage, list):
+            if not coverage:
+                continue
+            coverage = coverage[0]
+        return glyphName in coverage
+    return False
@@ -40,7 +40,7 @@ class BaseSubTable(object):
         return processed, glyphRecords, False
 
     def _lookupFlagCoversGlyph(self, glyphName):
-        return self._lookup().LookupFlag.coversGlyph(glyphName)
+        return glyphName in self._lookup().LookupFlag.ignoredGlyphs
 
     def _nextRecord(self, glyphRecords):
         nextRecord = None
@@ -61,33 +61,28 @@ class BaseContextSubTable(BaseSubTable):
     __slots__ = []
 
     def _processMatch(self, rule, processed, glyphRecords, inputGlyphCount, matchedIndexes, featureTag):
-            performedAction = False
-            if not rule._ActionCount:
-                performedAction = True
-                processed.extend(glyphRecords[:inputGlyphCount])
-                glyphRecords = glyphRecords[inputGlyphCount:]
-            else:
-                eligibleRecords = glyphRecords[:inputGlyphCount]
-                ineligibleRecords = glyphRecords[inputGlyphCount:]
-                for record in rule._ActionLookupRecord:
-                    sequenceIndex = record.SequenceIndex
-                    matchIndex = matchedIndexes[sequenceIndex]
-
-                    backRecords = eligibleRecords[:matchIndex]
-                    inputRecords = eligibleRecords[matchIndex:]
-
-                    lookupListIndex = record.LookupListIndex
-                    lookup = self._lookup()._lookupList().Lookup[lookupListIndex]
-
-                    for subtable in lookup.SubTable:
-                        backRecords, inputRecords, performedAction = subtable.process(backRecords, inputRecords, featureTag)
-                        if performedAction:
-                            break
+            # the matched input is moved into processed and the
+            # nested lookups are applied at their positions within
+            # it. only the records from the lookup position to the
+            # end of the match are detached for each nested lookup,
+            # so the work is bounded by the length of the match.
+            matchStart = len(processed)
+            processed.extend(glyphRecords[:inputGlyphCount])
+            glyphRecords = glyphRecords[inputGlyphCount:]
+            lookupList = self._lookup()._lookupList()
+            for record in rule._ActionLookupRecord:
+                position = matchStart + matchedIndexes[record.SequenceIndex]
+                if position >= len(processed):
+                    continue
+                inputRecords = processed[position:]
+                del processed[position:]
+                lookup = lookupList.Lookup[record.LookupListIndex]
+                for subtable in lookup.SubTable:
+                    processed, inputRecords, performedAction = subtable.process(processed, inputRecords, featureTag)
                     if performedAction:
-                        eligibleRecords = backRecords + inputRecords
-                processed.extend(eligibleRecords)
-                glyphRecords = ineligibleRecords
-            return processed, glyphRecords, performedAction
+                        break
+                processed.extend(inputRecords)
+            return processed, glyphRecords, True
 
 
 class BaseChainingContextSubTable(BaseContextSubTable):
@@ -198,6 +193,8 @@ class BaseContextFormat3SubTable(BaseContextSubTable):
         currentGlyphIndex = 0
         for coverage in self.Coverage:
             glyphRecord, relativeIndex = self._nextRecord(glyphRecords[currentGlyphIndex:])
+            if glyphRecord is None:
+                break
             currentGlyphIndex += relativeIndex
             currentGlyph = glyphRecord.glyphName
             if currentGlyph not in coverage:
@@ -425,6 +422,11 @@ class Coverage(object):
     To get the index for a particular glyph:
         >>> coverage.index("x")
         330
+
+    The get method returns the index or None if the
+    glyph is not covered. The glyphs are stored in a
+    dict of glyph name to index, so all of these take
+    constant time.
     """
 
     __slots__ = ["_glyphs"]
@@ -432,7 +434,7 @@ class Coverage(object):
 
     def __init__(self, coverage=None):
         if coverage is not None:
-            coverage = list(coverage)
+            coverage = _indexGlyphs(coverage)
         self._glyphs = coverage
 
     def loadFromFontTools(self, coverage):
@@ -440,16 +442,32 @@ class Coverage(object):
         # Coverage object or a list of glyph names
         if not isinstance(coverage, list):
             coverage = coverage.glyphs
-        self._glyphs = list(coverage)
+        self._glyphs = _indexGlyphs(coverage)
         return self
 
     def __contains__(self, glyphName):
         return glyphName in self._glyphs
 
     def index(self, glyphName):
-        return self._glyphs.index(glyphName)
+        index = self._glyphs.get(glyphName)
+        if index is None:
+            raise ValueError("%s is not in the coverage" % glyphName)
+        return index
+
+    def get(self, glyphName, default=None):
+        return self._glyphs.get(glyphName, default)
 
     def _get_Glyphs(self):
         return list(self._glyphs)
 
     Glyphs = property(_get_Glyphs, doc="This is for reference only. Not for use in processing.")
+
+
+def _indexGlyphs(glyphNames):
+    # the first index is kept for a glyph
+    # that is listed more than once
+    glyphs = {}
+    for index, glyphName in enumerate(glyphNames):
+        if glyphName not in glyphs:
+            glyphs[glyphName] = index
+    return glyphs
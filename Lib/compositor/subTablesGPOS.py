@@ -1,3 +1,4 @@
+from array import array
 from compositor.classDefinitionTables import ClassDef
 from compositor.subTablesBase import BaseSubTable, BaseLookupRecord, Coverage,\
     BaseContextFormat1SubTable, BaseContextFormat2SubTable, BaseContextFormat3SubTable,\
@@ -15,6 +16,14 @@ __all__ = [
 
 globalPositionSubTableSlots = ["PosFormat"]
 
+# the ValueFormat flags of the supported value record fields
+valueFormatFields = [
+    (0x0001, "XPlacement"),
+    (0x0002, "YPlacement"),
+    (0x0004, "XAdvance"),
+    (0x0008, "YAdvance")
+]
+
 
 class ValueRecord(object):
 
@@ -32,22 +41,178 @@ class ValueRecord(object):
         self.XAdvance = 0
         self.YAdvance = 0
 
-    def loadFromFontTools(self, valueRecord):
+    def loadFromFontTools(self, valueRecord, valueFormat=None):
         self.XPlacement = 0
         self.YPlacement = 0
         self.XAdvance = 0
         self.YAdvance = 0
-        if hasattr(valueRecord, "XPlacement"):
-            self.XPlacement += valueRecord.XPlacement
-        if hasattr(valueRecord, "YPlacement"):
-            self.YPlacement += valueRecord.YPlacement
-        if hasattr(valueRecord, "XAdvance"):
-            self.XAdvance += valueRecord.XAdvance
-        if hasattr(valueRecord, "YAdvance"):
-            self.YAdvance += valueRecord.YAdvance
+        for flag, attr in valueFormatFields:
+            if valueFormat is not None and not valueFormat & flag:
+                continue
+            if hasattr(valueRecord, attr):
+                setattr(self, attr, getattr(valueRecord, attr))
         return self
 
 
+# -------------
+# Packed Values
+# -------------
+
+
+class ValueArray(object):
+
+    """
+    Value records packed into one array with the
+    XPlacement, YPlacement, XAdvance and YAdvance
+    of each record. Identical records are stored
+    once. The record at index 0 is the zero record,
+    which is shared by all records without values.
+
+        >>> from fontTools.ttLib.tables.otBase import ValueRecord as FontToolsValueRecord
+        >>> record = FontToolsValueRecord(0x0004)
+        >>> record.XAdvance = -20
+        >>> values = ValueArray()
+        >>> values.append(record, 0x0004)
+        1
+        >>> values.append(record, 0x0004)
+        1
+        >>> values.append(record, 0x0001)
+        0
+        >>> values.compact()
+        >>> len(values)
+        2
+        >>> values[1].XAdvance
+        -20
+    """
+
+    __slots__ = ["_values", "_indexes"]
+
+    def __init__(self):
+        self._values = array("i", [0, 0, 0, 0])
+        self._indexes = {(0, 0, 0, 0) : 0}
+
+    def __len__(self):
+        return len(self._values) // 4
+
+    def __getitem__(self, index):
+        record = ValueRecord()
+        index *= 4
+        record.XPlacement, record.YPlacement, record.XAdvance, record.YAdvance = self._values[index:index + 4]
+        return record
+
+    def append(self, valueRecord, valueFormat):
+        """
+        Add a fontTools value record and get its index.
+        Only the fields flagged in valueFormat are read.
+        """
+        if valueRecord is None or not valueFormat & 0x000F:
+            return 0
+        values = tuple([getattr(valueRecord, attr, 0) if valueFormat & flag else 0 for flag, attr in valueFormatFields])
+        index = self._indexes.get(values)
+        if index is None:
+            index = self._indexes[values] = len(self)
+            self._values.extend(values)
+        return index
+
+    def compact(self):
+        """
+        Discard the data that is only needed while
+        records are appended and store the values in
+        the smallest array type that can hold them.
+        """
+        self._indexes = None
+        self._values = _compactArray(self._values, "h")
+
+    def addTo(self, glyphRecord, index):
+        if index:
+            values = self._values
+            index *= 4
+            glyphRecord.xPlacement += values[index]
+            glyphRecord.yPlacement += values[index + 1]
+            glyphRecord.xAdvance += values[index + 2]
+            glyphRecord.yAdvance += values[index + 3]
+
+
+class AnchorArray(object):
+
+    """
+    Anchors packed into one array with the X and Y
+    coordinates of each anchor. Identical anchors
+    are stored once. Index 0 stands for a missing
+    anchor.
+
+    Deviation from spec:
+    - AnchorPoint and the device tables are not
+      implemented. The coordinates are used for
+      all formats.
+    """
+
+    __slots__ = ["_coordinates", "_indexes"]
+
+    def __init__(self):
+        self._coordinates = array("i", [0, 0])
+        self._indexes = {}
+
+    def __len__(self):
+        return len(self._coordinates) // 2
+
+    def __getitem__(self, index):
+        """
+        Get the (x, y) coordinates of an
+        anchor or None if it is missing.
+        """
+        if not index:
+            return None
+        index *= 2
+        return self._coordinates[index], self._coordinates[index + 1]
+
+    def append(self, anchor):
+        """
+        Add a fontTools anchor and get its index.
+        """
+        if anchor is None:
+            return 0
+        coordinates = (anchor.XCoordinate, anchor.YCoordinate)
+        index = self._indexes.get(coordinates)
+        if index is None:
+            index = self._indexes[coordinates] = len(self)
+            self._coordinates.extend(coordinates)
+        return index
+
+    def compact(self):
+        self._indexes = None
+        self._coordinates = _compactArray(self._coordinates, "h")
+
+    def getOffset(self, index1, index2):
+        """
+        Get the (x, y) offset from the second anchor to
+        the first or None if either is missing.
+        """
+        if not index1 or not index2:
+            return None
+        coordinates = self._coordinates
+        index1 *= 2
+        index2 *= 2
+        return coordinates[index1] - coordinates[index2], coordinates[index1 + 1] - coordinates[index2 + 1]
+
+
+def _compactArray(values, typeCode):
+    """
+    Get the values in an array of typeCode if
+    they fit. Otherwise return them unchanged.
+    """
+    try:
+        return array(typeCode, values)
+    except OverflowError:
+        return values
+
+def _indexArray(indexes):
+    try:
+        return array("H", indexes)
+    except OverflowError:
+        return array("I", indexes)
+
+
 # -------------
 # Lookup Type 1
 # -------------
@@ -57,8 +222,6 @@ class GPOSLookupType1Format1(BaseSubTable):
 
     """
     Deviation from spec: None
-
-    XXX need to handle ValueFormat?
     """
 
     __slots__ = ["Coverage", "ValueFormat", "Value"] + globalPositionSubTableSlots
@@ -74,7 +237,7 @@ class GPOSLookupType1Format1(BaseSubTable):
         super(GPOSLookupType1Format1, self).loadFromFontTools(subtable, lookup)
         self.Coverage = Coverage().loadFromFontTools(subtable.Coverage)
         self.ValueFormat = subtable.ValueFormat
-        self.Value = ValueRecord().loadFromFontTools(subtable.Value)
+        self.Value = ValueRecord().loadFromFontTools(subtable.Value, subtable.ValueFormat)
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -95,24 +258,28 @@ class GPOSLookupType1Format2(BaseSubTable):
     """
     Deviation from spec:
     - ValueCount attribute is not implemented.
-
-    XXX need to handle ValueFormat?
+    - Value is a ValueArray of the distinct values.
+      The index of the value for each coverage
+      index is stored in ValueIndex.
     """
 
-    __slots__ = ["Coverage", "ValueFormat", "Value"] + globalPositionSubTableSlots
+    __slots__ = ["Coverage", "ValueFormat", "Value", "ValueIndex"] + globalPositionSubTableSlots
 
     def __init__(self):
         super(GPOSLookupType1Format2, self).__init__()
         self.PosFormat = 2
         self.Coverage = None
         self.ValueFormat = None
-        self.Value = []
+        self.Value = None
+        self.ValueIndex = None
 
     def loadFromFontTools(self, subtable, lookup):
         super(GPOSLookupType1Format2, self).loadFromFontTools(subtable, lookup)
         self.Coverage = Coverage().loadFromFontTools(subtable.Coverage)
         self.ValueFormat = subtable.ValueFormat
-        self.Value = [ValueRecord().loadFromFontTools(value) for value in subtable.Value]
+        self.Value = ValueArray()
+        self.ValueIndex = _indexArray([self.Value.append(value, subtable.ValueFormat) for value in subtable.Value])
+        self.Value.compact()
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -123,8 +290,7 @@ class GPOSLookupType1Format2(BaseSubTable):
             if not self._lookupFlagCoversGlyph(currentGlyph):
                 performedPos = True
                 valueIndex = self.Coverage.index(currentGlyph)
-                value = self.Value[valueIndex]
-                currentRecord += value
+                self.Value.addTo(currentRecord, self.ValueIndex[valueIndex])
                 processed.append(currentRecord)
                 glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedPos
@@ -140,9 +306,11 @@ class GPOSLookupType2Format1(BaseSubTable):
     """
     Deviation from spec:
     - PairSetCount attribute is not implemented.
+    - Value is a ValueArray of the distinct values
+      in all pair sets.
     """
 
-    __slots__ = ["Coverage", "ValueFormat1", "ValueFormat2", "PairSet"] + globalPositionSubTableSlots
+    __slots__ = ["Coverage", "ValueFormat1", "ValueFormat2", "PairSet", "Value"] + globalPositionSubTableSlots
 
     def __init__(self):
         super(GPOSLookupType2Format1, self).__init__()
@@ -151,13 +319,16 @@ class GPOSLookupType2Format1(BaseSubTable):
         self.ValueFormat1 = None
         self.ValueFormat2 = None
         self.PairSet = []
+        self.Value = None
 
     def loadFromFontTools(self, subtable, lookup):
         super(GPOSLookupType2Format1, self).loadFromFontTools(subtable, lookup)
         self.Coverage = Coverage().loadFromFontTools(subtable.Coverage)
         self.ValueFormat1 = subtable.ValueFormat1
         self.ValueFormat2 = subtable.ValueFormat2
-        self.PairSet = [PairSet().loadFromFontTools(pairSet) for pairSet in subtable.PairSet]
+        self.Value = ValueArray()
+        self.PairSet = [PairSet().loadFromFontTools(pairSet, self.ValueFormat1, self.ValueFormat2, self.Value) for pairSet in subtable.PairSet]
+        self.Value.compact()
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -169,23 +340,21 @@ class GPOSLookupType2Format1(BaseSubTable):
                 nextRecord, nextRecordIndex = self._nextRecord(glyphRecords[1:])
                 nextRecordIndex += 1
                 if nextRecord is not None:
-                    nextGlyph = nextRecord.glyphName
                     pairSetIndex = self.Coverage.index(currentGlyph)
                     pairSet = self.PairSet[pairSetIndex]
-                    for pairValueRecord in pairSet.PairValueRecord:
-                        if nextGlyph == pairValueRecord.SecondGlyph:
-                            performedPos = True
-                            if self.ValueFormat1:
-                                currentRecord += pairValueRecord.Value1
-                            if self.ValueFormat2:
-                                nextRecord += pairValueRecord.Value2
-                            if self.ValueFormat2:
-                                processed.extend(glyphRecords[:nextRecordIndex+1])
-                                glyphRecords = glyphRecords[nextRecordIndex+1:]
-                            else:
-                                processed.append(currentRecord)
-                                glyphRecords = glyphRecords[1:]
-                            break
+                    pairIndex = pairSet.SecondGlyph.get(nextRecord.glyphName)
+                    if pairIndex is not None:
+                        performedPos = True
+                        if pairSet.Value1 is not None:
+                            self.Value.addTo(currentRecord, pairSet.Value1[pairIndex])
+                        if pairSet.Value2 is not None:
+                            self.Value.addTo(nextRecord, pairSet.Value2[pairIndex])
+                        if self.ValueFormat2:
+                            processed.extend(glyphRecords[:nextRecordIndex+1])
+                            glyphRecords = glyphRecords[nextRecordIndex+1:]
+                        else:
+                            processed.append(currentRecord)
+                            glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedPos
 
 
@@ -194,35 +363,37 @@ class PairSet(object):
     """
     Deviation from spec:
     - PairValueCount attribute is not implemented.
-    """
-
-    __slots__ = ["PairValueRecord"]
-
-    def __init__(self):
-        self.PairValueRecord = []
-
-    def loadFromFontTools(self, pairSet):
-        self.PairValueRecord = [PairValueRecord().loadFromFontTools(record) for record in pairSet.PairValueRecord]
-        return self
-
-
-class PairValueRecord(object):
-
-    """
-    Deviation from spec: None
+    - PairValueRecord attribute is not implemented.
+      SecondGlyph is a dict of second glyph names
+      to pair indexes. Value1 and Value2 are arrays
+      with the index of the value of each pair in
+      the subtable's ValueArray. They are None if
+      the ValueFormat has no supported fields.
     """
 
     __slots__ = ["SecondGlyph", "Value1", "Value2"]
 
     def __init__(self):
-        self.SecondGlyph = None
+        self.SecondGlyph = {}
         self.Value1 = None
         self.Value2 = None
 
-    def loadFromFontTools(self, pairValueRecord):
-        self.SecondGlyph = pairValueRecord.SecondGlyph
-        self.Value1 = ValueRecord().loadFromFontTools(pairValueRecord.Value1)
-        self.Value2 = ValueRecord().loadFromFontTools(pairValueRecord.Value2)
+    def loadFromFontTools(self, pairSet, valueFormat1, valueFormat2, values):
+        self.SecondGlyph = {}
+        value1 = []
+        value2 = []
+        for pairIndex, pairValueRecord in enumerate(pairSet.PairValueRecord):
+            # the first record for a glyph is used
+            if pairValueRecord.SecondGlyph not in self.SecondGlyph:
+                self.SecondGlyph[pairValueRecord.SecondGlyph] = pairIndex
+            value1.append(values.append(getattr(pairValueRecord, "Value1", None), valueFormat1))
+            value2.append(values.append(getattr(pairValueRecord, "Value2", None), valueFormat2))
+        self.Value1 = None
+        if valueFormat1 & 0x000F:
+            self.Value1 = _indexArray(value1)
+        self.Value2 = None
+        if valueFormat2 & 0x000F:
+            self.Value2 = _indexArray(value2)
         return self
 
 
@@ -231,11 +402,17 @@ class GPOSLookupType2Format2(BaseSubTable):
     """
     Deviation from spec:
     - Class1Count attribute is not implemented.
-    - Class2Count attribute is not implemented.
+    - Class1Record attribute is not implemented.
+      Value is a ValueArray of the distinct values.
+      Value1 and Value2 are arrays with the index of
+      the value for each class 1 and class 2 pair, at
+      class1 * Class2Count + class2. They are None if
+      the ValueFormat has no supported fields.
     """
 
     __slots__ = ["Coverage", "ValueFormat1", "ValueFormat2",
-                "ClassDef1", "ClassDef2", "Class1Record"] + globalPositionSubTableSlots
+                "ClassDef1", "ClassDef2", "Class2Count",
+                "Value", "Value1", "Value2"] + globalPositionSubTableSlots
 
     def __init__(self):
         super(GPOSLookupType2Format2, self).__init__()
@@ -244,7 +421,10 @@ class GPOSLookupType2Format2(BaseSubTable):
         self.ValueFormat2 = None
         self.ClassDef1 = None
         self.ClassDef2 = None
-        self.Class1Record = []
+        self.Class2Count = 0
+        self.Value = None
+        self.Value1 = None
+        self.Value2 = None
 
     def loadFromFontTools(self, subtable, lookup):
         super(GPOSLookupType2Format2, self).loadFromFontTools(subtable, lookup)
@@ -253,7 +433,21 @@ class GPOSLookupType2Format2(BaseSubTable):
         self.ValueFormat2 = subtable.ValueFormat2
         self.ClassDef1 = ClassDef().loadFromFontTools(subtable.ClassDef1)
         self.ClassDef2 = ClassDef().loadFromFontTools(subtable.ClassDef2)
-        self.Class1Record = [Class1Record().loadFromFontTools(record) for record in subtable.Class1Record]
+        self.Class2Count = subtable.Class2Count
+        self.Value = ValueArray()
+        value1 = []
+        value2 = []
+        for class1Record in subtable.Class1Record:
+            for class2Record in class1Record.Class2Record:
+                value1.append(self.Value.append(getattr(class2Record, "Value1", None), self.ValueFormat1))
+                value2.append(self.Value.append(getattr(class2Record, "Value2", None), self.ValueFormat2))
+        self.Value.compact()
+        self.Value1 = None
+        if self.ValueFormat1 & 0x000F:
+            self.Value1 = _indexArray(value1)
+        self.Value2 = None
+        if self.ValueFormat2 & 0x000F:
+            self.Value2 = _indexArray(value2)
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -267,14 +461,11 @@ class GPOSLookupType2Format2(BaseSubTable):
                 if nextRecord is not None:
                     nextGlyph = nextRecord.glyphName
                     performedPos = True
-                    class1Index = self.ClassDef1[currentGlyph]
-                    class1Record = self.Class1Record[class1Index]
-                    class2Index = self.ClassDef2[nextGlyph]
-                    class2Record = class1Record.Class2Record[class2Index]
-                    if self.ValueFormat1:
-                        currentRecord += class2Record.Value1
-                    if self.ValueFormat2:
-                        nextRecord += class2Record.Value2
+                    valueIndex = self.ClassDef1[currentGlyph] * self.Class2Count + self.ClassDef2[nextGlyph]
+                    if self.Value1 is not None:
+                        self.Value.addTo(currentRecord, self.Value1[valueIndex])
+                    if self.Value2 is not None:
+                        self.Value.addTo(nextRecord, self.Value2[valueIndex])
                     if self.ValueFormat2:
                         processed.extend(glyphRecords[:nextRecordIndex+1])
                         glyphRecords = glyphRecords[nextRecordIndex+1:]
@@ -284,40 +475,6 @@ class GPOSLookupType2Format2(BaseSubTable):
         return processed, glyphRecords, performedPos
 
 
-class Class1Record(object):
-
-    """
-    Deviation from spec: None
-    """
-
-    __slots__ = ["Class2Record"]
-
-    def __init__(self):
-        self.Class2Record = []
-
-    def loadFromFontTools(self, class1Record):
-        self.Class2Record = [Class2Record().loadFromFontTools(record) for record in class1Record.Class2Record]
-        return self
-
-
-class Class2Record(object):
-
-    """
-    Deviation from spec: None
-    """
-
-    __slots__ = ["Value1", "Value2"]
-
-    def __init__(self):
-        self.Value1 = None
-        self.Value2 = None
-
-    def loadFromFontTools(self, class2Record):
-        self.Value1 = ValueRecord().loadFromFontTools(class2Record.Value1)
-        self.Value2 = ValueRecord().loadFromFontTools(class2Record.Value2)
-        return self
-
-
 # -------------
 # Lookup Type 3
 # -------------
@@ -328,20 +485,29 @@ class GPOSLookupType3(BaseSubTable):
     """
     Deviation from spec:
     - EntryExitRecordCount attribute is not implemented.
+    - EntryExitRecord attribute is not implemented.
+      Anchors is an AnchorArray. EntryAnchor and
+      ExitAnchor are arrays with the index of the
+      anchors for each coverage index.
     """
 
-    __slots__ = ["Coverage", "EntryExitRecord"] + globalPositionSubTableSlots
+    __slots__ = ["Coverage", "Anchors", "EntryAnchor", "ExitAnchor"] + globalPositionSubTableSlots
 
     def __init__(self):
         super(GPOSLookupType3, self).__init__()
         self.PosFormat = 1
         self.Coverage = None
-        self.EntryExitRecord = []
+        self.Anchors = None
+        self.EntryAnchor = None
+        self.ExitAnchor = None
 
     def loadFromFontTools(self, subtable, lookup):
         super(GPOSLookupType3, self).loadFromFontTools(subtable, lookup)
         self.Coverage = Coverage().loadFromFontTools(subtable.Coverage)
-        self.EntryExitRecord = [EntryExitRecord().loadFromFontTools(entryExitRecord) for entryExitRecord in subtable.EntryExitRecord]
+        self.Anchors = AnchorArray()
+        self.EntryAnchor = _indexArray([self.Anchors.append(record.EntryAnchor) for record in subtable.EntryExitRecord])
+        self.ExitAnchor = _indexArray([self.Anchors.append(record.ExitAnchor) for record in subtable.EntryExitRecord])
+        self.Anchors.compact()
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -350,39 +516,101 @@ class GPOSLookupType3(BaseSubTable):
         currentGlyph = currentRecord.glyphName
         if currentGlyph in self.Coverage:
             if not self._lookupFlagCoversGlyph(currentGlyph):
-                nextRecord, nextRecordIndex = self._nextRecord(glyphRecords[1:])
-                if nextRecord is not None:
-                    nextGlyph = nextRecord.glyphName
-                    if nextGlyph in self.Coverage:
-                        performedPos = True
-                        exitIndex = self.Coverage.index(currentGlyph)
-                        exitAnchor = self.EntryExitRecord[exitIndex].ExitAnchor
-                        entryIndex = self.Coverage.index(nextGlyph)
-                        entryAnchor = self.EntryExitRecord[entryIndex].EntryAnchor
-                        if exitAnchor is not None and entryAnchor is not None:
-                            currentRecord.xAdvance += exitAnchor.XCoordinate - currentRecord.advanceWidth - entryAnchor.XCoordinate
-                            currentRecord.yAdvance += exitAnchor.YCoordinate - currentRecord.advanceHeight - entryAnchor.YCoordinate
-                        processed.append(currentRecord)
-                        glyphRecords = glyphRecords[1:]
+                # the whole chain that starts with the current
+                # glyph is attached at once, with the subtables
+                # of the lookup tried for each connection.
+                lookup = self._lookup()
+                subtables = [getattr(subtable, "ExtSubTable", subtable) for subtable in lookup.SubTable]
+                chainEnd = attachCursiveChains(glyphRecords, subtables, lookup.LookupFlag, firstChainOnly=True)
+                if chainEnd:
+                    performedPos = True
+                    processed.extend(glyphRecords[:chainEnd])
+                    glyphRecords = glyphRecords[chainEnd:]
         return processed, glyphRecords, performedPos
 
-
-class EntryExitRecord(object):
-
-    """
-    Deviation from spec: None
-    """
-
-    __slots__ = ["EntryAnchor", "ExitAnchor"]
-
-    def __init__(self):
-        self.EntryAnchor = None
-        self.ExitAnchor = None
-
-    def loadFromFontTools(self, entryExitRecord):
-        self.EntryAnchor = _createAnchor(entryExitRecord.EntryAnchor)
-        self.ExitAnchor = _createAnchor(entryExitRecord.ExitAnchor)
-        return self
+    def getOffset(self, glyphName, nextGlyphName):
+        """
+        Get the (x, y) offset from the exit anchor of a glyph to
+        the entry anchor of the next glyph. None is returned if
+        the subtable doesn't cover both glyphs and False if it
+        covers them but one of the anchors is missing.
+        """
+        exitIndex = self.Coverage.get(glyphName)
+        if exitIndex is None:
+            return None
+        entryIndex = self.Coverage.get(nextGlyphName)
+        if entryIndex is None:
+            return None
+        offset = self.Anchors.getOffset(self.ExitAnchor[exitIndex], self.EntryAnchor[entryIndex])
+        if offset is None:
+            return False
+        return offset
+
+
+def attachCursiveChains(glyphRecords, subtables, lookupFlag, firstChainOnly=False):
+    """
+    Attach the glyph records that are connected by the exit
+    and entry anchors of the cursive attachment subtables
+    of a lookup. The connections are found in one pass and
+    each chain is positioned once it is complete:
+    - the advance of each connected glyph is changed so
+      that its exit anchor meets the entry anchor of the
+      next glyph.
+    - the vertical offsets accumulate along the chain,
+      starting with the first glyph. The glyphs skipped
+      by the lookup flag are moved with the preceding glyph.
+
+    Returns the index after the last chain. If firstChainOnly
+    is True, only a chain starting with the first record is
+    attached and 0 is returned if there isn't one.
+    """
+    chainEnd = 0
+    ignoredGlyphs = lookupFlag.ignoredGlyphs
+    # the indexes of the records in the current chain and
+    # the offsets from each of them to the next one
+    chain = []
+    offsets = []
+    for index, glyphRecord in enumerate(glyphRecords):
+        glyphName = glyphRecord.glyphName
+        if glyphName in ignoredGlyphs:
+            continue
+        offset = None
+        if chain:
+            previousGlyph = glyphRecords[chain[-1]].glyphName
+            for subtable in subtables:
+                offset = subtable.getOffset(previousGlyph, glyphName)
+                if offset is not None:
+                    break
+        if offset:
+            chain.append(index)
+            offsets.append(offset)
+            continue
+        if offsets:
+            _positionCursiveChain(glyphRecords, chain, offsets, index)
+            chainEnd = index
+        if firstChainOnly and chain:
+            return chainEnd
+        chain = [index]
+        offsets = []
+    if offsets:
+        _positionCursiveChain(glyphRecords, chain, offsets, len(glyphRecords))
+        chainEnd = len(glyphRecords)
+    return chainEnd
+
+def _positionCursiveChain(glyphRecords, chain, offsets, end):
+    yOffset = 0
+    for chainIndex, index in enumerate(chain):
+        if chainIndex < len(offsets):
+            nextIndex = chain[chainIndex + 1]
+            glyphRecord = glyphRecords[index]
+            glyphRecord.xAdvance += offsets[chainIndex][0] - glyphRecord.advanceWidth
+        else:
+            nextIndex = end
+        if yOffset:
+            for glyphRecord in glyphRecords[index:nextIndex]:
+                glyphRecord.yPlacement += yOffset
+        if chainIndex < len(offsets):
+            yOffset += offsets[chainIndex][1]
 
 
 # -------------
@@ -394,24 +622,30 @@ class GPOSLookupType4(BaseSubTable):
 
     """
     Deviation from spec:
-    - ClassCount attribute is not implemented.
+    - Anchors is an AnchorArray with the anchors
+      of the MarkArray and the BaseArray.
     """
 
-    __slots__ = ["MarkCoverage", "BaseCoverage", "MarkArray", "BaseArray"] + globalPositionSubTableSlots
+    __slots__ = ["MarkCoverage", "BaseCoverage", "ClassCount", "MarkArray", "BaseArray", "Anchors"] + globalPositionSubTableSlots
 
     def __init__(self):
         super(GPOSLookupType4, self).__init__()
         self.MarkCoverage = None
         self.BaseCoverage = None
+        self.ClassCount = 0
         self.MarkArray = None
         self.BaseArray = None
+        self.Anchors = None
 
     def loadFromFontTools(self, subtable, lookup):
         super(GPOSLookupType4, self).loadFromFontTools(subtable, lookup)
         self.MarkCoverage = Coverage().loadFromFontTools(subtable.MarkCoverage)
         self.BaseCoverage = Coverage().loadFromFontTools(subtable.BaseCoverage)
-        self.MarkArray = MarkArray().loadFromFontTools(subtable.MarkArray)
-        self.BaseArray = BaseArray().loadFromFontTools(subtable.BaseArray)
+        self.ClassCount = subtable.ClassCount
+        self.Anchors = AnchorArray()
+        self.MarkArray = MarkArray().loadFromFontTools(subtable.MarkArray, self.Anchors)
+        self.BaseArray = BaseArray().loadFromFontTools(subtable.BaseArray, self.ClassCount, self.Anchors)
+        self.Anchors.compact()
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -421,59 +655,54 @@ class GPOSLookupType4(BaseSubTable):
         if currentGlyph in self.MarkCoverage:
             if not self._lookupFlagCoversGlyph(currentGlyph):
                 previousRecord = None
-                previousRecordIndex = 0
                 gdef = self._lookup()._gdef
                 # look back to find the most recent glyph that:
                 # 1. is not covered by the lookup flag
                 # 2. is not a mark glyph (as defined in the GDEF)
-                while previousRecord is None:
-                    for _previousRecord in reversed(processed):
-                        previousRecordIndex -= 1
-                        _previousGlyph = _previousRecord.glyphName
-                        if not self._lookupFlagCoversGlyph(_previousGlyph):
-                            if gdef is not None and gdef.GlyphClassDef[_previousGlyph] != 3:
-                                previousRecord = _previousRecord
-                                break
-                    break
+                for _previousRecord in reversed(processed):
+                    _previousGlyph = _previousRecord.glyphName
+                    if not self._lookupFlagCoversGlyph(_previousGlyph):
+                        if gdef is not None and _previousGlyph not in gdef.markGlyphs:
+                            previousRecord = _previousRecord
+                            break
                 if previousRecord is not None:
-                    previousGlyph = previousRecord.glyphName
-                    if previousGlyph in self.BaseCoverage:
-                        performedPos = True
-                        markCoverageIndex = self.MarkCoverage.index(currentGlyph)
-                        markRecord = self.MarkArray.MarkRecord[markCoverageIndex]
-                        markAnchor = markRecord.MarkAnchor
-                        baseCoverageIndex = self.BaseCoverage.index(previousGlyph)
-                        baseRecord = self.BaseArray.BaseRecord[baseCoverageIndex]
-                        baseAnchor = baseRecord.BaseAnchor[markRecord.Class]
-                        xOffset, yOffset = _calculateAnchorDifference(baseAnchor, markAnchor)
-                        currentRecord.xPlacement += xOffset - previousRecord.advanceWidth
-                        currentRecord.yPlacement += yOffset - previousRecord.advanceHeight
+                    performedPos = self.attachMark(currentRecord, previousRecord)
+                    if performedPos:
                         processed.append(currentRecord)
                         glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedPos
 
+    def attachMark(self, markRecord, baseRecord, componentIndex=0):
+        """
+        Position a mark glyph record on a base glyph record.
+        Returns a boolean indicating if both are covered.
+        componentIndex is ignored.
+        """
+        markCoverageIndex = self.MarkCoverage.get(markRecord.glyphName)
+        if markCoverageIndex is None:
+            return False
+        baseCoverageIndex = self.BaseCoverage.get(baseRecord.glyphName)
+        if baseCoverageIndex is None:
+            return False
+        markClass = self.MarkArray.Class[markCoverageIndex]
+        baseAnchor = self.BaseArray.getAnchor(baseCoverageIndex, markClass)
+        offset = self.Anchors.getOffset(baseAnchor, self.MarkArray.MarkAnchor[markCoverageIndex])
+        if offset is not None:
+            xOffset, yOffset = offset
+            markRecord.xPlacement += xOffset - baseRecord.advanceWidth
+            markRecord.yPlacement += yOffset - baseRecord.advanceHeight
+        return True
+
 
 class MarkArray(object):
 
     """
     Deviation from spec:
     - MarkCount attribute is not implemented.
-    """
-
-    __slots__ = ["MarkRecord"]
-
-    def __init__(self):
-        self.MarkRecord = []
-
-    def loadFromFontTools(self, markArray):
-        self.MarkRecord = [MarkRecord().loadFromFontTools(markRecord) for markRecord in markArray.MarkRecord]
-        return self
-
-
-class MarkRecord(object):
-
-    """
-    Deviation from spec: None
+    - MarkRecord attribute is not implemented.
+      Class is an array with the class of each
+      mark and MarkAnchor is an array with the
+      index of its anchor in an AnchorArray.
     """
 
     __slots__ = ["Class", "MarkAnchor"]
@@ -482,9 +711,9 @@ class MarkRecord(object):
         self.Class = None
         self.MarkAnchor = None
 
-    def loadFromFontTools(self, markRecord):
-        self.Class = markRecord.Class
-        self.MarkAnchor = _createAnchor(markRecord.MarkAnchor)
+    def loadFromFontTools(self, markArray, anchors):
+        self.Class = _indexArray([markRecord.Class for markRecord in markArray.MarkRecord])
+        self.MarkAnchor = _indexArray([anchors.append(markRecord.MarkAnchor) for markRecord in markArray.MarkRecord])
         return self
 
 
@@ -493,89 +722,25 @@ class BaseArray(object):
     """
     Deviation from spec:
     - BaseCount attribute is not implemented.
+    - BaseRecord attribute is not implemented.
+      BaseAnchor is an array with the index of
+      the anchor in an AnchorArray for each
+      base and class, at base * ClassCount + class.
     """
 
-    __slots__ = ["BaseRecord"]
+    __slots__ = ["ClassCount", "BaseAnchor"]
 
     def __init__(self):
-        self.BaseRecord = []
+        self.ClassCount = 0
+        self.BaseAnchor = None
 
-    def loadFromFontTools(self, baseArray):
-        self.BaseRecord = [BaseRecord().loadFromFontTools(baseRecord) for baseRecord in baseArray.BaseRecord]
+    def loadFromFontTools(self, baseArray, classCount, anchors):
+        self.ClassCount = classCount
+        self.BaseAnchor = _indexArray([anchors.append(anchor) for baseRecord in baseArray.BaseRecord for anchor in baseRecord.BaseAnchor])
         return self
 
-
-class BaseRecord(object):
-
-    """
-    Deviation from spec: None
-    """
-
-    __slots__ = ["BaseAnchor"]
-
-    def __init__(self):
-        self.BaseAnchor = []
-
-    def loadFromFontTools(self, baseRecord):
-        self.BaseAnchor = [_createAnchor(anchor) for anchor in baseRecord.BaseAnchor]
-        return self
-
-
-def _createAnchor(anchor):
-    if anchor is None:
-        return None
-    if anchor.Format == 1:
-        return AnchorFormat1().loadFromFontTools(anchor)
-    elif anchor.Format == 2:
-        return AnchorFormat2().loadFromFontTools(anchor)
-
-def _calculateAnchorDifference(anchor1, anchor2):
-    xDiff = anchor1.XCoordinate - anchor2.XCoordinate
-    yDiff = anchor1.YCoordinate - anchor2.YCoordinate
-    return xDiff, yDiff
-
-
-class AnchorFormat1(object):
-
-    """
-    Deviation from spec: None
-    """
-
-    __slots__ = ["AnchorFormat", "XCoordinate", "YCoordinate"]
-
-    def __init__(self):
-        self.AnchorFormat = 1
-        self.XCoordinate = None
-        self.YCoordinate = None
-
-    def loadFromFontTools(self, anchor):
-        self.XCoordinate = anchor.XCoordinate
-        self.YCoordinate = anchor.YCoordinate
-        return self
-
-
-class AnchorFormat2(object):
-
-    """
-    Deviation from spec: None
-
-    XXX this references a glyph contour point (as an index).
-    not sure how that should be handled.
-    """
-
-    __slots__ = ["AnchorFormat", "XCoordinate", "YCoordinate", "AnchorPoint"]
-
-    def __init__(self):
-        self.AnchorFormat = 2
-        self.XCoordinate = None
-        self.YCoordinate = None
-        self.AnchorPoint = None
-
-    def loadFromFontTools(self, anchor):
-        self.XCoordinate = anchor.XCoordinate
-        self.YCoordinate = anchor.YCoordinate
-        self.AnchorPoint = anchor.AnchorPoint
-        return self
+    def getAnchor(self, baseIndex, markClass):
+        return self.BaseAnchor[baseIndex * self.ClassCount + markClass]
 
 
 # -------------
@@ -587,27 +752,33 @@ class GPOSLookupType5(BaseSubTable):
 
     """
     Deviation from spec:
-    - ClassCount attribute is not implemented.
+    - Anchors is an AnchorArray with the anchors of
+      the MarkArray and the LigatureArray.
 
     Note: This could process things in a buggy way.
     Not enough test cases are available to know for sure.
     """
 
-    __slots__ = ["MarkCoverage", "LigatureCoverage", "MarkArray", "LigatureArray"] + globalPositionSubTableSlots
+    __slots__ = ["MarkCoverage", "LigatureCoverage", "ClassCount", "MarkArray", "LigatureArray", "Anchors"] + globalPositionSubTableSlots
 
     def __init__(self):
         super(GPOSLookupType5, self).__init__()
         self.MarkCoverage = None
         self.LigatureCoverage = None
+        self.ClassCount = 0
         self.MarkArray = None
         self.LigatureArray = None
+        self.Anchors = None
 
     def loadFromFontTools(self, subtable, lookup):
         super(GPOSLookupType5, self).loadFromFontTools(subtable, lookup)
         self.MarkCoverage = Coverage().loadFromFontTools(subtable.MarkCoverage)
         self.LigatureCoverage = Coverage().loadFromFontTools(subtable.LigatureCoverage)
-        self.MarkArray = MarkArray().loadFromFontTools(subtable.MarkArray)
-        self.LigatureArray = LigatureArray().loadFromFontTools(subtable.LigatureArray)
+        self.ClassCount = subtable.ClassCount
+        self.Anchors = AnchorArray()
+        self.MarkArray = MarkArray().loadFromFontTools(subtable.MarkArray, self.Anchors)
+        self.LigatureArray = LigatureArray().loadFromFontTools(subtable.LigatureArray, self.ClassCount, self.Anchors)
+        self.Anchors.compact()
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -622,35 +793,43 @@ class GPOSLookupType5(BaseSubTable):
                 # look back to find the most recent glyph that:
                 # 1. is not covered by the lookup flag
                 # 2. is not a mark glyph (as defined in the GDEF)
-                while previousRecord is None:
-                    for _previousRecord in reversed(processed):
-                        previousRecordIndex -= 1
-                        _previousGlyph = _previousRecord.glyphName
-                        if not self._lookupFlagCoversGlyph(_previousGlyph):
-                            if gdef is not None and gdef.GlyphClassDef[_previousGlyph] != 3:
-                                previousRecord = _previousRecord
-                                break
-                    break
+                for _previousRecord in reversed(processed):
+                    previousRecordIndex -= 1
+                    _previousGlyph = _previousRecord.glyphName
+                    if not self._lookupFlagCoversGlyph(_previousGlyph):
+                        if gdef is not None and _previousGlyph not in gdef.markGlyphs:
+                            previousRecord = _previousRecord
+                            break
                 if previousRecord is not None:
-                    previousGlyph = previousRecord.glyphName
-                    if previousGlyph in self.LigatureCoverage:
-                        performedPos = True
-                        markCoverageIndex = self.MarkCoverage.index(currentGlyph)
-                        markRecord = self.MarkArray.MarkRecord[markCoverageIndex]
-                        markAnchor = markRecord.MarkAnchor
-                        ligatureCoverageIndex = self.LigatureCoverage.index(previousGlyph)
-                        ligatureAttach = self.LigatureArray.LigatureAttach[ligatureCoverageIndex]
-                        componentIndex = abs(previousRecordIndex) - 1
-                        componentRecord = ligatureAttach.ComponentRecord[componentIndex]
-                        ligatureAnchor = componentRecord.LigatureAnchor[markRecord.Class]
-                        if ligatureAnchor is not None:
-                            xOffset, yOffset = _calculateAnchorDifference(ligatureAnchor, markAnchor)
-                            currentRecord.xPlacement += xOffset - previousRecord.advanceWidth
-                            currentRecord.yPlacement += yOffset - previousRecord.advanceHeight
+                    componentIndex = abs(previousRecordIndex) - 1
+                    performedPos = self.attachMark(currentRecord, previousRecord, componentIndex)
+                    if performedPos:
                         processed.append(currentRecord)
                         glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedPos
 
+    def attachMark(self, markRecord, baseRecord, componentIndex=0):
+        """
+        Position a mark glyph record on a component of a
+        ligature glyph record. Returns a boolean indicating
+        if both are covered.
+        """
+        markCoverageIndex = self.MarkCoverage.get(markRecord.glyphName)
+        if markCoverageIndex is None:
+            return False
+        ligatureCoverageIndex = self.LigatureCoverage.get(baseRecord.glyphName)
+        if ligatureCoverageIndex is None:
+            return False
+        markClass = self.MarkArray.Class[markCoverageIndex]
+        ligatureAttach = self.LigatureArray.LigatureAttach[ligatureCoverageIndex]
+        ligatureAnchor = ligatureAttach.getAnchor(componentIndex, markClass)
+        offset = self.Anchors.getOffset(ligatureAnchor, self.MarkArray.MarkAnchor[markCoverageIndex])
+        if offset is not None:
+            xOffset, yOffset = offset
+            markRecord.xPlacement += xOffset - baseRecord.advanceWidth
+            markRecord.yPlacement += yOffset - baseRecord.advanceHeight
+        return True
+
 
 class LigatureArray(object):
 
@@ -664,8 +843,8 @@ class LigatureArray(object):
     def __init__(self):
         self.LigatureAttach = []
 
-    def loadFromFontTools(self, ligatureArray):
-        self.LigatureAttach = [LigatureAttach().loadFromFontTools(ligatureAttach) for ligatureAttach in ligatureArray.LigatureAttach]
+    def loadFromFontTools(self, ligatureArray, classCount, anchors):
+        self.LigatureAttach = [LigatureAttach().loadFromFontTools(ligatureAttach, classCount, anchors) for ligatureAttach in ligatureArray.LigatureAttach]
         return self
 
 
@@ -673,35 +852,32 @@ class LigatureAttach(object):
 
     """
     Deviation from spec:
-    - ComponentCount attribute is not implemented.
+    - ComponentRecord attribute is not implemented.
+      LigatureAnchor is an array with the index of
+      the anchor in an AnchorArray for each component
+      and class, at component * ClassCount + class.
     """
 
-    __slots__ = ["ComponentRecord"]
+    __slots__ = ["ComponentCount", "ClassCount", "LigatureAnchor"]
 
     def __init__(self):
-        self.ComponentRecord = []
-
-    def loadFromFontTools(self, ligatureAttach):
-        self.ComponentRecord = [ComponentRecord().loadFromFontTools(componentRecord) for componentRecord in ligatureAttach.ComponentRecord]
+        self.ComponentCount = 0
+        self.ClassCount = 0
+        self.LigatureAnchor = None
+
+    def loadFromFontTools(self, ligatureAttach, classCount, anchors):
+        self.ComponentCount = ligatureAttach.ComponentCount
+        self.ClassCount = classCount
+        self.LigatureAnchor = _indexArray([anchors.append(anchor) for componentRecord in ligatureAttach.ComponentRecord for anchor in componentRecord.LigatureAnchor])
         return self
 
-
-class ComponentRecord(object):
-
-    """
-    Deviation from spec: None
-
-    XXX an anchor could be None. see the spec for more info.
-    """
-
-    __slots__ = ["LigatureAnchor"]
-
-    def __init__(self):
-        self.LigatureAnchor = []
-
-    def loadFromFontTools(self, componentRecord):
-        self.LigatureAnchor = [_createAnchor(anchor) for anchor in componentRecord.LigatureAnchor]
-        return self
+    def getAnchor(self, componentIndex, markClass):
+        if not self.ComponentCount:
+            return 0
+        # marks beyond the last component
+        # attach to the last component
+        componentIndex = min(componentIndex, self.ComponentCount - 1)
+        return self.LigatureAnchor[componentIndex * self.ClassCount + markClass]
 
 
 # -------------
@@ -713,27 +889,33 @@ class GPOSLookupType6(BaseSubTable):
 
     """
     Deviation from spec:
-    - ClassCount attribute is not implemented.
+    - Anchors is an AnchorArray with the anchors of
+      the Mark1Array and the Mark2Array.
 
     Note: This could process things in a buggy way.
     Not enough test cases are available to know for sure.
     """
 
-    __slots__ = ["Mark1Coverage", "Mark1Array", "Mark2Coverage", "Mark2Array"] + globalPositionSubTableSlots
+    __slots__ = ["Mark1Coverage", "Mark1Array", "Mark2Coverage", "Mark2Array", "ClassCount", "Anchors"] + globalPositionSubTableSlots
 
     def __init__(self):
         super(GPOSLookupType6, self).__init__()
         self.Mark1Coverage = None
         self.Mark2Coverage = None
+        self.ClassCount = 0
         self.Mark1Array = None
         self.Mark2Array = None
+        self.Anchors = None
 
     def loadFromFontTools(self, subtable, lookup):
         super(GPOSLookupType6, self).loadFromFontTools(subtable, lookup)
         self.Mark1Coverage = Coverage().loadFromFontTools(subtable.Mark1Coverage)
         self.Mark2Coverage = Coverage().loadFromFontTools(subtable.Mark2Coverage)
-        self.Mark1Array = MarkArray().loadFromFontTools(subtable.Mark1Array)
-        self.Mark2Array = Mark2Array().loadFromFontTools(subtable.Mark2Array)
+        self.ClassCount = subtable.ClassCount
+        self.Anchors = AnchorArray()
+        self.Mark1Array = MarkArray().loadFromFontTools(subtable.Mark1Array, self.Anchors)
+        self.Mark2Array = Mark2Array().loadFromFontTools(subtable.Mark2Array, self.ClassCount, self.Anchors)
+        self.Anchors.compact()
         return self
 
     def process(self, processed, glyphRecords, featureTag):
@@ -743,67 +925,63 @@ class GPOSLookupType6(BaseSubTable):
         if currentGlyph in self.Mark1Coverage:
             if not self._lookupFlagCoversGlyph(currentGlyph):
                 previousRecord = None
-                previousRecordIndex = 0
-                gdef = self._lookup()._gdef
-                while previousRecord is None:
-                    for _previousRecord in reversed(processed):
-                        previousRecordIndex -= 1
-                        _previousGlyph = _previousRecord.glyphName
-                        if not self._lookupFlagCoversGlyph(_previousGlyph):
-                            previousRecord = _previousRecord
-                            break
-                    break
+                for _previousRecord in reversed(processed):
+                    if not self._lookupFlagCoversGlyph(_previousRecord.glyphName):
+                        previousRecord = _previousRecord
+                        break
                 if previousRecord is not None:
-                    previousGlyph = previousRecord.glyphName
-                    if previousGlyph in self.Mark2Coverage:
-                        performedPos = True
-
-                        mark1CoverageIndex = self.Mark1Coverage.index(currentGlyph)
-                        mark1Record = self.Mark1Array.MarkRecord[mark1CoverageIndex]
-                        mark1Anchor = mark1Record.MarkAnchor
-
-                        mark2CoverageIndex = self.Mark2Coverage.index(previousGlyph)
-                        mark2Record = self.Mark2Array.Mark2Record[mark2CoverageIndex]
-                        mark2Anchor = mark2Record.Mark2Anchor[mark1Record.Class]
-                        xOffset, yOffset = _calculateAnchorDifference(mark2Anchor, mark1Anchor)
-                        currentRecord.xPlacement += xOffset - previousRecord.advanceWidth
-                        currentRecord.yPlacement += yOffset - previousRecord.advanceHeight
+                    performedPos = self.attachMark(currentRecord, previousRecord)
+                    if performedPos:
                         processed.append(currentRecord)
                         glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedPos
 
+    def attachMark(self, markRecord, baseRecord, componentIndex=0):
+        """
+        Position a mark glyph record on the preceding
+        mark glyph record. Returns a boolean indicating
+        if both are covered. componentIndex is ignored.
+        """
+        mark1CoverageIndex = self.Mark1Coverage.get(markRecord.glyphName)
+        if mark1CoverageIndex is None:
+            return False
+        mark2CoverageIndex = self.Mark2Coverage.get(baseRecord.glyphName)
+        if mark2CoverageIndex is None:
+            return False
+        mark1Class = self.Mark1Array.Class[mark1CoverageIndex]
+        mark2Anchor = self.Mark2Array.getAnchor(mark2CoverageIndex, mark1Class)
+        offset = self.Anchors.getOffset(mark2Anchor, self.Mark1Array.MarkAnchor[mark1CoverageIndex])
+        if offset is not None:
+            xOffset, yOffset = offset
+            markRecord.xPlacement += xOffset - baseRecord.advanceWidth
+            markRecord.yPlacement += yOffset - baseRecord.advanceHeight
+        return True
+
 
 class Mark2Array(object):
 
     """
     Deviation from spec:
     - Mark2Count attribute is not implemented.
+    - Mark2Record attribute is not implemented.
+      Mark2Anchor is an array with the index of
+      the anchor in an AnchorArray for each mark
+      and class, at mark * ClassCount + class.
     """
 
-    __slots__ = ["Mark2Record"]
+    __slots__ = ["ClassCount", "Mark2Anchor"]
 
     def __init__(self):
-        self.Mark2Record = []
+        self.ClassCount = 0
+        self.Mark2Anchor = None
 
-    def loadFromFontTools(self, mark2Array):
-        self.Mark2Record = [Mark2Record().loadFromFontTools(mark2Record) for mark2Record in mark2Array.Mark2Record]
+    def loadFromFontTools(self, mark2Array, classCount, anchors):
+        self.ClassCount = classCount
+        self.Mark2Anchor = _indexArray([anchors.append(anchor) for mark2Record in mark2Array.Mark2Record for anchor in mark2Record.Mark2Anchor])
         return self
 
-
-class Mark2Record(object):
-
-    """
-    Deviation from spec: None
-    """
-
-    __slots__ = ["Mark2Anchor"]
-
-    def __init__(self):
-        self.Mark2Anchor = []
-
-    def loadFromFontTools(self, mark2Record):
-        self.Mark2Anchor = [_createAnchor(anchor) for anchor in mark2Record.Mark2Anchor]
-        return self
+    def getAnchor(self, mark2Index, markClass):
+        return self.Mark2Anchor[mark2Index * self.ClassCount + markClass]
 
 
 # -------------
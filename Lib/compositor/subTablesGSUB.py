@@ -75,6 +75,13 @@ class GSUBLookupType1Format2(BaseSubTable):
                 glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedSub
 
+    def getAlternates(self):
+        """
+        Get a list of (glyphName, alternates) for
+        every glyph covered by the subtable.
+        """
+        return [(glyphName, [substitute]) for glyphName, substitute in zip(self.Coverage.Glyphs, self.Substitute)]
+
 
 # -------------
 # Lookup Type 2
@@ -122,7 +129,7 @@ class GSUBLookupType2(BaseSubTable):
                 index = self.Coverage.index(currentGlyph)
                 sequence = self.Sequence[index]
                 substitute = sequence.Substitute
-                substitute = glyphNamesToGlyphRecords(substitute)
+                substitute = glyphNamesToGlyphRecords(substitute, currentRecord.cluster)
                 processed.extend(substitute)
                 glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedSub
@@ -203,6 +210,13 @@ class GSUBLookupType3(BaseSubTable):
                 glyphRecords = glyphRecords[1:]
         return processed, glyphRecords, performedSub
 
+    def getAlternates(self):
+        """
+        Get a list of (glyphName, alternates) for
+        every glyph covered by the subtable.
+        """
+        return [(glyphName, list(alternateSet.Alternate)) for glyphName, alternateSet in zip(self.Coverage.Glyphs, self.AlternateSet)]
+
 
 class AlternateSet(object):
 
@@ -258,9 +272,9 @@ class GSUBLookupType4(BaseSubTable):
         performedSub = False
         currentRecord = glyphRecords[0]
         currentGlyph = currentRecord.glyphName
-        lookupFlag = self._lookup().LookupFlag
+        ignoredGlyphs = self._lookup().LookupFlag.ignoredGlyphs
         if currentGlyph in self.Coverage:
-            if not lookupFlag.coversGlyph(currentGlyph):
+            if currentGlyph not in ignoredGlyphs:
                 while not performedSub:
                     coverageIndex = self.Coverage.index(currentGlyph)
                     ligatureSet = self.LigatureSet[coverageIndex]
@@ -272,7 +286,7 @@ class GSUBLookupType4(BaseSubTable):
                         lastWasMatch = False
                         for index, glyphRecord in enumerate(glyphRecords[1:]):
                             glyphName = glyphRecord.glyphName
-                            if not lookupFlag.coversGlyph(glyphName):
+                            if glyphName not in ignoredGlyphs:
                                 if not glyphName == component[currentComponentIndex]:
                                     lastWasMatch = False
                                     break
@@ -287,6 +301,10 @@ class GSUBLookupType4(BaseSubTable):
                             currentRecord.saveState([currentGlyph] + ligature.Component)
                             currentRecord.glyphName = ligature.LigGlyph
                             currentRecord.ligatureComponents = [currentGlyph] + ligature.Component
+                            for index in matchedRecordIndexes:
+                                cluster = glyphRecords[index + 1].cluster
+                                if cluster < currentRecord.cluster:
+                                    currentRecord.cluster = cluster
                             processed.append(currentRecord)
                             glyphRecords = [record for index, record in enumerate(glyphRecords[1:]) if index not in matchedRecordIndexes]
                             break
@@ -899,6 +917,11 @@ class GSUBLookupType7(BaseSubTable):
     def process(self, processed, glyphRecords, featureTag):
         return self.ExtSubTable.process(processed, glyphRecords, featureTag)
 
+    def getAlternates(self):
+        if hasattr(self.ExtSubTable, "getAlternates"):
+            return self.ExtSubTable.getAlternates()
+        return []
+
 
 # -------------
 # Lookup Type 8
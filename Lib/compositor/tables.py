@@ -3,13 +3,16 @@ GSUB, GPOS and GDEF table objects.
 """
 
 import unicodedata
+from functools import partial
+from time import perf_counter
 from compositor.cmap import reverseCMAP
 from compositor.scriptList import ScriptList
 from compositor.featureList import FeatureList
 from compositor.lookupList import GSUBLookupList, GPOSLookupList
 from compositor.subTablesBase import Coverage
+from compositor.subTablesGPOS import GPOSLookupType3, GPOSLookupType4, GPOSLookupType5, GPOSLookupType6, attachCursiveChains
 from compositor.classDefinitionTables import MarkAttachClassDef, GlyphClassDef
-from compositor.textUtilities import isWordBreakBefore, isWordBreakAfter
+from compositor.textUtilities import getWordBreaks
 
 
 defaultOnFeatures = [
@@ -46,6 +49,18 @@ defaultOnFeatures = [
     "vkrn"
 ]
 
+# features that only apply at certain positions within a word
+boundarySensitiveFeatures = set(["init", "medi", "fina", "isol"])
+
+# (word break before, word break after) for the positions
+# where the boundary sensitive features apply
+_boundarySensitivePositions = {
+    "init" : (True, False),
+    "medi" : (False, False),
+    "fina" : (False, True),
+    "isol" : (True, True),
+}
+
 
 class BaseTable(object):
 
@@ -59,6 +74,7 @@ class BaseTable(object):
         self._featureApplicationStates = {}
         self._applicableFeatureCache = {}
         self._featureTags = None
+        self._frozen = False
 
     def loadFromFontTools(self, table, reversedCMAP, gdef):
         self._cmap = reversedCMAP
@@ -72,7 +88,7 @@ class BaseTable(object):
     def setCMAP(self, reversedCMAP):
         self._cmap = reversedCMAP
 
-    def process(self, glyphRecords, script="latn", langSys=None, logger=None):
+    def process(self, glyphRecords, script="latn", langSys=None, logger=None, profiler=None):
         """
         Pass the list of GlyphRecord objects through the features
         applicable for the given script and langSys. This returns
@@ -82,11 +98,36 @@ class BaseTable(object):
         if logger:
             logger.logApplicableLookups(self, applicableLookups)
             logger.logProcessingStart()
-        result = self._processLookups(glyphRecords, applicableLookups, logger=logger)
+        result = self._processLookups(glyphRecords, applicableLookups, logger=logger, profiler=profiler)
         if logger:
             logger.logProcessingEnd()
         return result
 
+    # -------
+    # caching
+    # -------
+
+    def warmUp(self):
+        """
+        Fill the caches that are otherwise built while
+        processing, for every script and langSys defined
+        in the table and the current feature states.
+        """
+        for scriptRecord in self.ScriptList.ScriptRecord:
+            script = scriptRecord.Script
+            langSysTags = [None] + [langSysRecord.LangSysTag for langSysRecord in script.LangSysRecord]
+            for langSys in langSysTags:
+                applicableLookups = self._preprocess(scriptRecord.ScriptTag, langSys)
+                self._processLookups([], applicableLookups)
+
+    def freeze(self):
+        """
+        Stop storing anything in the caches. Everything
+        that is not already cached is computed on demand.
+        Feature states can still be changed.
+        """
+        self._frozen = True
+
     # ------------------
     # feature management
     # ------------------
@@ -157,6 +198,33 @@ class BaseTable(object):
         """
         self._featureApplicationStates[featureTag] = state
 
+    # ----------
+    # alternates
+    # ----------
+
+    def getAlternates(self, featureTags):
+        """
+        Get a dict of glyph name to a list of alternate glyph
+        names defined by the lookups in the given features.
+        This reads the lookup tables directly, so the feature
+        application states, script and langSys are ignored.
+        """
+        lookupIndexes = set()
+        for featureRecord in self.FeatureList.FeatureRecord:
+            if featureRecord.FeatureTag in featureTags:
+                lookupIndexes |= set(featureRecord.Feature.LookupListIndex)
+        alternates = {}
+        for lookup in self._getLookups(lookupIndexes):
+            for subtable in lookup.SubTable:
+                if not hasattr(subtable, "getAlternates"):
+                    continue
+                for glyphName, glyphAlternates in subtable.getAlternates():
+                    found = alternates.setdefault(glyphName, [])
+                    for alternate in glyphAlternates:
+                        if alternate != glyphName and alternate not in found:
+                            found.append(alternate)
+        return alternates
+
     # -------------
     # preprocessing
     # -------------
@@ -246,7 +314,8 @@ class BaseTable(object):
                 applicableFeatures.add(specificLangSys.ReqFeatureIndex)
         applicableFeatures = self._getFeatures(applicableFeatures)
         # store the found features for potential use by this method
-        self._applicableFeatureCache[script, langSys] = applicableFeatures
+        if not self._frozen:
+            self._applicableFeatureCache[script, langSys] = applicableFeatures
         return applicableFeatures
 
     def _getFeatures(self, indices):
@@ -271,78 +340,411 @@ class BaseTable(object):
     # processing
     # ----------
 
-    def _processLookups(self, glyphRecords, lookups, processingAalt=False, logger=None):
+    def _processLookups(self, glyphRecords, lookups, processingAalt=False, logger=None, profiler=None):
         aaltHolding = []
-        boundarySensitive = set(["init", "medi", "fina", "isol"])
+        boundarySensitive = boundarySensitiveFeatures
+        composable = []
         for featureTag, lookup in lookups:
             # store aalt for processing at the end
             if not processingAalt and featureTag == "aalt":
                 aaltHolding.append((featureTag, lookup))
                 continue
+            # collect consecutive lookups that can be composed
+            # into a single mapping and apply them together
+            if logger is None and profiler is None and self._isComposableLookup(featureTag, lookup):
+                composable.append(lookup)
+                continue
+            if composable:
+                glyphRecords = self._processComposedLookups(glyphRecords, composable)
+                composable = []
             if logger:
                 logger.logLookupStart(self, featureTag, lookup)
-            processed = []
-            # loop through the glyph records
-            while glyphRecords:
-                skip = False
-                if featureTag in boundarySensitive:
-                    side1GlyphNames = [r.getSide1GlyphNameWithUnicodeValue(self._cmap) for r in processed] + [r.getSide1GlyphNameWithUnicodeValue(self._cmap) for r in glyphRecords]
-                    side2GlyphNames = [r.getSide2GlyphNameWithUnicodeValue(self._cmap) for r in processed] + [r.getSide2GlyphNameWithUnicodeValue(self._cmap) for r in glyphRecords]
-                    index = len(processed)
-                    wordBreakBefore = isWordBreakBefore(side1GlyphNames, index, self._cmap)
-                    wordBreakAfter = isWordBreakAfter(side2GlyphNames, index, self._cmap)
-                if featureTag == "init":
-                    if not wordBreakBefore or wordBreakAfter:
-                        skip = True
-                elif featureTag == "medi":
-                    if wordBreakBefore or wordBreakAfter:
-                        skip = True
-                elif featureTag == "fina":
-                    if wordBreakBefore or not wordBreakAfter:
-                        skip = True
-                elif featureTag == "isol":
-                    if not wordBreakBefore or not wordBreakAfter:
-                        skip = True
-                # loop through the lookups subtables
-                performedAction = False
-                if not skip:
-                    processed, glyphRecords, performedAction = self._processLookup(processed, glyphRecords, lookup, featureTag, logger=logger)
-                if not performedAction:
-                    processed.append(glyphRecords[0])
-                    glyphRecords = glyphRecords[1:]
-            glyphRecords = processed
+            # choose how the lookup is applied at each position
+            # so that the loop doesn't check for the logger or
+            # the profiler at every glyph.
+            if profiler is not None:
+                lookupRecord = profiler.getLookupRecord(self, featureTag, lookup)
+                lookupRecord["calls"] += 1
+                lookupStart = perf_counter()
+                processLookup = partial(self._profileLookup, profiler=profiler, lookupRecord=lookupRecord)
+            elif logger:
+                processLookup = partial(self._logLookup, logger=logger)
+            else:
+                processLookup = self._processLookup
+            # some lookups can be applied to the whole run at once
+            processRun = None
+            if processLookup == self._processLookup:
+                processRun = self._getRunProcessor(lookup)
+            # the logger records the glyph records that each
+            # subtable is given, so it gets all of them.
+            maxContext = None
+            if not logger:
+                maxContext = lookup.maxContext
+            if featureTag in boundarySensitive:
+                glyphRecords = self._processBoundarySensitiveLookup(glyphRecords, lookup, featureTag, processLookup, maxContext)
+            elif processRun is not None:
+                glyphRecords = processRun(glyphRecords, lookup, featureTag)
+            else:
+                glyphRecords = self._processPositions(glyphRecords, lookup, featureTag, processLookup, maxContext)
+            if profiler is not None:
+                lookupRecord["time"] += perf_counter() - lookupStart
             if logger:
                 logger.logLookupEnd()
+        if composable:
+            glyphRecords = self._processComposedLookups(glyphRecords, composable)
         # process aalt for the final glyph records
         if not processingAalt and aaltHolding:
-            glyphRecords = self._processLookups(glyphRecords, aaltHolding, processingAalt=True, logger=logger)
+            glyphRecords = self._processLookups(glyphRecords, aaltHolding, processingAalt=True, logger=logger, profiler=profiler)
         return glyphRecords
 
-    def _processLookup(self, processed, glyphRecords, lookup, featureTag, logger=None):
+    def _processPositions(self, glyphRecords, lookup, featureTag, processLookup, maxContext, required=None):
+        """
+        Apply a lookup at each position of the run.
+
+        The subtables are given a window of the records that
+        follow the current position instead of all of them, so
+        moving to the next position doesn't copy the rest of
+        the run. The window holds at least maxContext records
+        that are not skipped by the lookup flag. If maxContext
+        is None, the window holds all of the remaining records.
+
+        required is a tuple of the word break before and the
+        word break after a position that the lookup applies
+        to. If it is None, the lookup applies everywhere.
+        """
+        processed = []
+        ignoredGlyphs = lookup.LookupFlag.ignoredGlyphs
+        count = len(glyphRecords)
+        index = 0
+        window = []
+        wordBreaks = None
+        if maxContext is None:
+            window = glyphRecords
+            index = count
+        while window or index < count:
+            if index < count:
+                needed = maxContext
+                for record in window:
+                    if record.glyphName not in ignoredGlyphs:
+                        needed -= 1
+                while needed > 0 and index < count:
+                    record = glyphRecords[index]
+                    window.append(record)
+                    index += 1
+                    if record.glyphName not in ignoredGlyphs:
+                        needed -= 1
+            performedAction = False
+            if required is None:
+                processed, window, performedAction = processLookup(processed, window, lookup, featureTag)
+            else:
+                # the breaks are found for the whole run once. when
+                # a lookup changes the number of records, the breaks
+                # of the records it replaced are replaced in place.
+                position = len(processed)
+                if wordBreaks is None:
+                    wordBreaks = self._getWordBreaks(processed + window + glyphRecords[index:])
+                if (wordBreaks[0][position], wordBreaks[1][position + 1]) == required:
+                    before = window
+                    processed, window, performedAction = processLookup(processed, window, lookup, featureTag)
+                    if len(processed) - position + len(window) != len(before):
+                        _replaceWordBreaks(wordBreaks, position, before, processed[position:], window)
+            if not performedAction:
+                processed.append(window[0])
+                window = window[1:]
+        return processed
+
+    def _processBoundarySensitiveLookup(self, glyphRecords, lookup, featureTag, processLookup, maxContext):
+        """
+        Apply a lookup only at the positions within a word
+        that the feature applies to.
+        """
+        # word break before, word break after
+        required = _boundarySensitivePositions[featureTag]
+        return self._processPositions(glyphRecords, lookup, featureTag, processLookup, maxContext, required)
+
+    def _getWordBreaks(self, glyphRecords):
+        """
+        Get the word breaks for the side 1 and the side 2
+        glyph names of the glyph records. Each is a list of
+        booleans declaring if there is a word break before
+        each record, followed by the break at the end.
+        """
+        cmap = self._cmap
+        side1 = [cmap.get(r.getSide1GlyphNameWithUnicodeValue(cmap), [None])[0] for r in glyphRecords]
+        side2 = [cmap.get(r.getSide2GlyphNameWithUnicodeValue(cmap), [None])[0] for r in glyphRecords]
+        side1Breaks = getWordBreaks(side1)
+        if side2 == side1:
+            return side1Breaks, side1Breaks
+        return side1Breaks, getWordBreaks(side2)
+
+    def _processLookup(self, processed, glyphRecords, lookup, featureTag):
+        performedAction = False
+        for subtable in lookup.SubTable:
+            processed, glyphRecords, performedAction = subtable.process(processed, glyphRecords, featureTag)
+            if performedAction:
+                break
+        return processed, glyphRecords, performedAction
+
+    def _logLookup(self, processed, glyphRecords, lookup, featureTag, logger):
+        """
+        Process a lookup at the current position
+        and log each subtable that is tried.
+        """
         performedAction = False
         for subtable in lookup.SubTable:
-            if logger:
-                logger.logSubTableStart(lookup, subtable)
-                logger.logInput(processed, glyphRecords)
+            logger.logSubTableStart(lookup, subtable)
+            logger.logInput(processed, glyphRecords)
             processed, glyphRecords, performedAction = subtable.process(processed, glyphRecords, featureTag)
-            if logger:
-                if performedAction:
-                    logger.logOutput(processed, glyphRecords)
-                logger.logSubTableEnd()
+            if performedAction:
+                logger.logOutput(processed, glyphRecords)
+            logger.logSubTableEnd()
             if performedAction:
                 break
         return processed, glyphRecords, performedAction
 
+    def _profileLookup(self, processed, glyphRecords, lookup, featureTag, profiler, lookupRecord):
+        """
+        Process a lookup at the current position and
+        record the time spent in each subtable.
+        """
+        lookupRecord["positions"] += 1
+        glyphName = glyphRecords[0].glyphName
+        performedAction = False
+        for index, subtable in enumerate(lookup.SubTable):
+            start = perf_counter()
+            processed, glyphRecords, performedAction = subtable.process(processed, glyphRecords, featureTag)
+            profiler.logSubTable(lookupRecord, index, subtable, glyphName, performedAction, perf_counter() - start)
+            if performedAction:
+                lookupRecord["applications"] += 1
+                break
+        return processed, glyphRecords, performedAction
+
+    def _isComposableLookup(self, featureTag, lookup):
+        """
+        Subclasses may override this to flag lookups that
+        can be composed with their neighbors and applied
+        with _processComposedLookups.
+        """
+        return False
+
+    def _getRunProcessor(self, lookup):
+        """
+        Subclasses may override this to return a function
+        that applies a lookup to all of the glyph records
+        in one pass. It is called with the glyph records,
+        the lookup and the feature tag and returns the
+        new glyph records. None means the lookup is
+        applied position by position.
+        """
+        return None
+
 
 class GSUB(BaseTable):
 
     _LookupListClass = GSUBLookupList
 
+    def __init__(self, reversedCMAP={}):
+        super(GSUB, self).__init__(reversedCMAP)
+        self._composedLookupCache = {}
+
+    # ----------------------------
+    # single substitution chaining
+    # ----------------------------
+
+    def _getSingleSubstitutionSubTables(self, lookup):
+        """
+        Get the single substitution subtables in the lookup.
+        If the lookup contains anything else, None is returned.
+        """
+        lookupType = lookup.LookupType
+        if lookupType == 1:
+            return lookup.SubTable
+        if lookupType == 7:
+            for subtable in lookup.SubTable:
+                if subtable.ExtensionLookupType != 1:
+                    return None
+            return [subtable.ExtSubTable for subtable in lookup.SubTable]
+        return None
+
+    def _isComposableLookup(self, featureTag, lookup):
+        # single substitutions don't depend on context, so
+        # they can be composed unless the feature gives them
+        # a special behavior or a position restriction.
+        if featureTag == "aalt" or featureTag in boundarySensitiveFeatures:
+            return False
+        return self._getSingleSubstitutionSubTables(lookup) is not None
+
+    def _getComposedLookupMap(self, lookups):
+        """
+        Compose a sequence of single substitution lookups into a
+        dict of glyph name to (final glyph name, substitution history).
+        Glyphs that are skipped by a lookup's flag are not
+        substituted by that lookup, just as in the standard
+        processing.
+        """
+        key = tuple(lookups)
+        if key in self._composedLookupCache:
+            return self._composedLookupCache[key]
+        mappings = []
+        for lookup in lookups:
+            lookupFlag = lookup.LookupFlag
+            mapping = {}
+            for subtable in self._getSingleSubstitutionSubTables(lookup):
+                for glyphName, substitute in zip(subtable.Coverage.Glyphs, subtable.Substitute):
+                    # the first subtable covering a glyph wins
+                    if glyphName in mapping:
+                        continue
+                    if lookupFlag.coversGlyph(glyphName):
+                        continue
+                    mapping[glyphName] = substitute
+            mappings.append(mapping)
+        composed = {}
+        for mapping in mappings:
+            for glyphName in mapping:
+                if glyphName in composed:
+                    continue
+                history = []
+                substitute = glyphName
+                for m in mappings:
+                    if substitute in m:
+                        history.append(substitute)
+                        substitute = m[substitute]
+                composed[glyphName] = (substitute, history)
+        if not self._frozen:
+            self._composedLookupCache[key] = composed
+        return composed
+
+    def _processComposedLookups(self, glyphRecords, lookups):
+        composed = self._getComposedLookupMap(lookups)
+        for glyphRecord in glyphRecords:
+            substitution = composed.get(glyphRecord.glyphName)
+            if substitution is None:
+                continue
+            substitute, history = substitution
+            for glyphName in history:
+                glyphRecord.saveState(glyphName)
+            glyphRecord.glyphName = substitute
+        return glyphRecords
+
+
+def _replaceWordBreaks(wordBreaks, position, before, produced, after):
+    """
+    Update the word breaks after a lookup at position replaced
+    the before records with the produced and after records.
+    The subtables don't change the records before position or
+    the lists they are given, so the replaced span is found by
+    comparing the records, which stops at the end of the span
+    instead of going through the rest of the run. The records
+    that replace the span get the breaks at its ends and no
+    breaks between them.
+    """
+    producedCount = len(produced)
+
+    def getRecord(index):
+        if index < producedCount:
+            return produced[index]
+        return after[index - producedCount]
+
+    difference = producedCount + len(after) - len(before)
+    common = min(len(before), len(before) + difference)
+    start = 0
+    while start < common and before[start] is getRecord(start):
+        start += 1
+    # the first record after start that is found at the same
+    # place from the end is the start of the unchanged records.
+    end = max(start, start - difference)
+    while end < len(before) and before[end] is not getRecord(end + difference):
+        end += 1
+    start += position
+    end += position
+    inserted = end + difference - start
+    side1Breaks, side2Breaks = wordBreaks
+    lists = [side1Breaks]
+    if side2Breaks is not side1Breaks:
+        lists.append(side2Breaks)
+    for breaks in lists:
+        if inserted:
+            breaks[start:end + 1] = [breaks[start]] + [False] * (inserted - 1) + [breaks[end]]
+        else:
+            breaks[start:end + 1] = [breaks[start] or breaks[end]]
+
 
 class GPOS(BaseTable):
 
     _LookupListClass = GPOSLookupList
 
+    # ----------
+    # attachment
+    # ----------
+
+    def _getRunProcessor(self, lookup):
+        subtables = _getSubTables(lookup, _markAttachmentSubTableClasses)
+        if subtables is not None:
+            # mark to base and mark to ligature attachment need
+            # the GDEF to skip the marks before the base. without
+            # it the lookup is applied at each position.
+            if lookup._gdef is None and not isinstance(subtables[0], GPOSLookupType6):
+                return None
+            return self._processMarkAttachmentLookup
+        if _getSubTables(lookup, (GPOSLookupType3,)) is not None:
+            return self._processCursiveAttachmentLookup
+        return None
+
+    def _processCursiveAttachmentLookup(self, glyphRecords, lookup, featureTag):
+        subtables = _getSubTables(lookup, (GPOSLookupType3,))
+        attachCursiveChains(glyphRecords, subtables, lookup.LookupFlag)
+        return glyphRecords
+
+    def _processMarkAttachmentLookup(self, glyphRecords, lookup, featureTag):
+        """
+        Apply a mark attachment lookup to all glyph records in
+        one pass. The index of the most recent base is kept
+        up to date while going forward, so the marks don't
+        have to look back for it.
+        """
+        subtables = _getSubTables(lookup, _markAttachmentSubTableClasses)
+        # mark to mark attachment uses the previous glyph.
+        # the others use the previous glyph that is not
+        # a mark, which can only be found with a GDEF.
+        ignoredGlyphs = lookup.LookupFlag.ignoredGlyphs
+        markGlyphs = frozenset()
+        if not isinstance(subtables[0], GPOSLookupType6):
+            markGlyphs = lookup._gdef.markGlyphs
+        baseIndex = None
+        for index, glyphRecord in enumerate(glyphRecords):
+            glyphName = glyphRecord.glyphName
+            if glyphName in ignoredGlyphs:
+                continue
+            if baseIndex is not None:
+                baseRecord = glyphRecords[baseIndex]
+                componentIndex = index - baseIndex - 1
+                for subtable in subtables:
+                    if subtable.attachMark(glyphRecord, baseRecord, componentIndex):
+                        break
+            if glyphName not in markGlyphs:
+                baseIndex = index
+        return glyphRecords
+
+
+_markAttachmentSubTableClasses = (GPOSLookupType4, GPOSLookupType5, GPOSLookupType6)
+
+def _getSubTables(lookup, classes):
+    """
+    Get the subtables of a lookup with the extension
+    subtables resolved if they are all instances of
+    one of the given classes. Otherwise None is returned.
+    """
+    subtables = [getattr(subtable, "ExtSubTable", subtable) for subtable in lookup.SubTable]
+    if not subtables:
+        return None
+    cls = subtables[0].__class__
+    if cls not in classes:
+        return None
+    for subtable in subtables:
+        if subtable.__class__ is not cls:
+            return None
+    return subtables
+
 
 class GDEF(object):
 
@@ -351,6 +753,8 @@ class GDEF(object):
         self.MarkAttachClassDef = None
         self.AttachList = None
         self.LigCaretList = None
+        self.markGlyphs = frozenset()
+        self._ignoredGlyphs = {}
 
     def loadFromFontTools(self, table):
         table = table.table
@@ -362,8 +766,42 @@ class GDEF(object):
             self.LigCaretList = LigCaretList().loadFromFontTools(table.LigCaretList)
         if table.MarkAttachClassDef is not None:
             self.MarkAttachClassDef = MarkAttachClassDef().loadFromFontTools(table.MarkAttachClassDef)
+        self.markGlyphs = frozenset(self._getGlyphClasses().get(3, ()))
+        self._ignoredGlyphs = {}
         return self
 
+    def _getGlyphClasses(self):
+        glyphClasses = {}
+        if self.GlyphClassDef is not None:
+            for glyphName, glyphClass in self.GlyphClassDef.Glyphs.items():
+                if glyphClass:
+                    glyphClasses.setdefault(glyphClass, []).append(glyphName)
+        return glyphClasses
+
+    def getIgnoredGlyphs(self, lookupFlag):
+        """
+        Get a frozenset of the glyphs that are skipped by
+        a lookup with the given LookupFlag value. The sets
+        are compiled from the glyph classes once for each
+        value, so lookups with the same value share them.
+        """
+        ignoredGlyphs = self._ignoredGlyphs.get(lookupFlag)
+        if ignoredGlyphs is None:
+            ignored = set()
+            glyphClasses = self._getGlyphClasses()
+            # IgnoreBaseGlyphs, IgnoreLigatures, IgnoreMarks
+            for flag, glyphClass in ((0x0002, 1), (0x0004, 2), (0x0008, 3)):
+                if lookupFlag & flag:
+                    ignored.update(glyphClasses.get(glyphClass, ()))
+            # marks that are not of the MarkAttachmentType
+            markAttachmentType = (lookupFlag & 0xFF00) >> 8
+            if markAttachmentType and self.MarkAttachClassDef is not None:
+                for glyphName in glyphClasses.get(3, ()):
+                    if self.MarkAttachClassDef[glyphName] != markAttachmentType:
+                        ignored.add(glyphName)
+            ignoredGlyphs = self._ignoredGlyphs[lookupFlag] = frozenset(ignored)
+        return ignoredGlyphs
+
 
 class AttachList(object):
 
@@ -487,3 +925,169 @@ class CaretValueFormat3(CaretValueFormat1):
     def __init__(self):
         super(CaretValueFormat3, self).__init__()
         self.DeviceTable = None
+
+# -----
+# Tests
+# -----
+
+_testFeatures = """
+languagesystem DFLT dflt;
+languagesystem latn dflt;
+markClass acute <anchor 150 700> @TOP;
+feature mark {
+    pos base a <anchor 250 750> mark @TOP;
+} mark;
+feature mkmk {
+    pos mark acute <anchor 150 900> mark @TOP;
+} mkmk;
+feature curs {
+    pos cursive b <anchor 0 0> <anchor 500 100>;
+} curs;
+"""
+
+_clusterTestFeatures = """
+languagesystem DFLT dflt;
+languagesystem latn dflt;
+feature ccmp {
+    sub b by a acute;
+} ccmp;
+feature liga {
+    sub f i by f_i;
+} liga;
+"""
+
+_boundaryTestFeatures = """
+languagesystem DFLT dflt;
+languagesystem latn dflt;
+feature init {
+    sub f i by f_i;
+} init;
+feature medi {
+    sub b by a acute;
+} medi;
+feature fina {
+    sub a by i;
+} fina;
+"""
+
+def _makeTestFont(features=_testFeatures, gdef=True):
+    from io import BytesIO
+    from fontTools.ttLib import TTFont
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+    from compositor.font import Font
+    glyphOrder = [".notdef", "space", "a", "b", "f", "i", "f_i", "acute"]
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyphOrder)
+    builder.setupCharacterMap({0x20 : "space", 0x61 : "a", 0x62 : "b", 0x66 : "f", 0x69 : "i", 0x301 : "acute"})
+    builder.setupGlyf({glyphName : TTGlyphPen(None).glyph() for glyphName in glyphOrder})
+    builder.setupHorizontalMetrics({glyphName : (0 if glyphName == "acute" else 500, 0) for glyphName in glyphOrder})
+    builder.setupHorizontalHeader()
+    builder.setupNameTable(dict(familyName="Test", styleName="Regular"))
+    builder.setupOS2()
+    builder.setupPost()
+    addOpenTypeFeaturesFromString(builder.font, features)
+    if not gdef:
+        del builder.font["GDEF"]
+    data = BytesIO()
+    builder.save(data)
+    data.seek(0)
+    font = Font(TTFont(data))
+    font.setFeatureState("curs", True)
+    return font
+
+def _getPositions(glyphRecords):
+    return [(r.glyphName, r.xPlacement, r.yPlacement, r.xAdvance, r.yAdvance) for r in glyphRecords]
+
+def _getClusters(glyphRecords):
+    return [(r.glyphName, r.cluster) for r in glyphRecords]
+
+def testBoundarySensitiveLookups():
+    """
+    The init, medi, fina and isol lookups are only applied at
+    their positions in a word. The word breaks are found once
+    for each lookup. The glyphs that a ligature or a multiple
+    substitution makes get the breaks at the ends of the glyphs
+    they replaced, so the rest of the word is not split.
+
+    >>> font = _makeTestFont(_boundaryTestFeatures)
+    >>> _getClusters(font.process("fia fia"))
+    [('f_i', 0), ('i', 2), ('space', 3), ('f_i', 4), ('i', 6)]
+    >>> _getClusters(font.process("fbbba ba"))
+    [('f', 0), ('a', 1), ('acute', 1), ('a', 2), ('acute', 2), ('a', 3), ('acute', 3), ('i', 4), ('space', 5), ('b', 6), ('i', 7)]
+    """
+
+def testMarkAttachment():
+    """
+    The mark attachment lookups are applied to the whole run
+    at once. The results match those of the per position path
+    that is used while profiling.
+
+    >>> from compositor.profiler import Profiler
+    >>> font = _makeTestFont()
+    >>> text = "a\\u0301\\u0301 ba\\u0301"
+    >>> _getPositions(font.process(text))
+    [('a', 0, 0, 0, 0), ('acute', -400, 50, 0, 0), ('acute', -400, 250, 0, 0), ('space', 0, 0, 0, 0), ('b', 0, 0, 0, 0), ('a', 0, 0, 0, 0), ('acute', -400, 50, 0, 0)]
+    >>> _getPositions(font.process(text)) == _getPositions(font.process(text, profiler=Profiler()))
+    True
+
+    Without a GDEF the base can't be told apart from the marks,
+    so only mark to mark attachment is done.
+
+    >>> font = _makeTestFont(gdef=False)
+    >>> _getPositions(font.process(text))
+    [('a', 0, 0, 0, 0), ('acute', 0, 0, 0, 0), ('acute', 0, 200, 0, 0), ('space', 0, 0, 0, 0), ('b', 0, 0, 0, 0), ('a', 0, 0, 0, 0), ('acute', 0, 0, 0, 0)]
+    >>> _getPositions(font.process(text)) == _getPositions(font.process(text, profiler=Profiler()))
+    True
+    """
+
+def testCursiveAttachment():
+    """
+    Cursive attachment is applied to the whole run at once too.
+
+    >>> from compositor.profiler import Profiler
+    >>> font = _makeTestFont()
+    >>> text = "bbb b"
+    >>> _getPositions(font.process(text))
+    [('b', 0, 0, 0, 0), ('b', 0, 100, 0, 0), ('b', 0, 200, 0, 0), ('space', 0, 0, 0, 0), ('b', 0, 0, 0, 0)]
+    >>> _getPositions(font.process(text)) == _getPositions(font.process(text, profiler=Profiler()))
+    True
+    >>> _getPositions(font.process(text, rightToLeft=True)) == _getPositions(font.process(text, rightToLeft=True, profiler=Profiler()))
+    True
+    """
+
+def testClusters():
+    """
+    A ligature gets the lowest cluster of its components and
+    the glyphs of a multiple substitution share the cluster
+    of the substituted glyph.
+
+    >>> font = _makeTestFont(_clusterTestFeatures)
+    >>> _getClusters(font.process("fib a"))
+    [('f_i', 0), ('a', 2), ('acute', 2), ('space', 3), ('a', 4)]
+    >>> _getClusters(font.process(["f", "i", "b"]))
+    [('f_i', 0), ('a', 2), ('acute', 2)]
+
+    The clusters stay with the glyphs when the run is reversed.
+
+    >>> _getClusters(font.process("ab", rightToLeft=True))
+    [('a', 1), ('acute', 1), ('a', 0)]
+
+    Characters that are not mapped are skipped
+    when there is no fallback glyph.
+
+    >>> font.fallbackGlyph = None
+    >>> _getClusters(font.process("fxi"))
+    [('f_i', 0)]
+
+    Long strings are mapped in bulk and get the same clusters.
+
+    >>> glyphRecords = font.process("fib " * 20)
+    >>> _getClusters(glyphRecords[:4]), _getClusters(glyphRecords[-4:])
+    ([('f_i', 0), ('a', 2), ('acute', 2), ('space', 3)], [('f_i', 76), ('a', 78), ('acute', 78), ('space', 79)])
+    """
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
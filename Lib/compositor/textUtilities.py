@@ -1,14 +1,69 @@
 
 import unicodedata
+from bisect import bisect_right
 from compositor.cmap import reverseCMAP
-from compositor.caseConversionMaps import lowerToSingleUpper, upperToSingleLower, specialCasing, softDotted
-from compositor.wordBreakProperties import wordBreakProperties
+from compositor.caseConversionMaps import lowerToSingleUpperRuns, upperToSingleLowerRuns, specialCasing, softDottedRangeStarts, softDottedRangeEnds
+from compositor.wordBreakProperties import wordBreakPropertyNames, wordBreakRangeStarts, wordBreakRangeEnds, wordBreakRangeValues
+
+# ------------------
+# Unicode Properties
+# ------------------
+# The property data is stored as sorted ranges of code points.
+
+def _findRange(uniValue, starts, ends):
+    """
+    Returns the index of the range containing uniValue or -1.
+    """
+    if uniValue is None:
+        return -1
+    index = bisect_right(starts, uniValue) - 1
+    if index >= 0 and uniValue <= ends[index]:
+        return index
+    return -1
+
+def _expandCaseRuns(runs):
+    """
+    Expand (start, end, step, delta) runs into
+    a dict of code point to code point.
+    """
+    mapping = {}
+    for index in range(0, len(runs), 4):
+        start, end, step, delta = runs[index:index+4]
+        for uniValue in range(start, end + 1, step):
+            mapping[uniValue] = uniValue + delta
+    return mapping
+
+def getWordBreakProperty(uniValue):
+    """
+    Returns the word break property of a code point or None.
+
+        >>> getWordBreakProperty(convertCodeToInt("0041"))
+        'ALetter'
+        >>> getWordBreakProperty(convertCodeToInt("0021")) is None
+        True
+    """
+    index = _findRange(uniValue, wordBreakRangeStarts, wordBreakRangeEnds)
+    if index == -1:
+        return None
+    return wordBreakPropertyNames[wordBreakRangeValues[index]]
+
+def isSoftDotted(uniValue):
+    """
+    Returns a boolean indicating if a code point is Soft_Dotted.
+
+        >>> isSoftDotted(convertCodeToInt("0069"))
+        True
+        >>> isSoftDotted(convertCodeToInt("0049"))
+        False
+    """
+    return _findRange(uniValue, softDottedRangeStarts, softDottedRangeEnds) != -1
+
 
 # ---------------
 # Case Conversion
 # ---------------
 
-def convertCase(case, glyphNames, cmap, reversedCMAP, language=None, fallbackGlyph=".notdef"):
+def convertCase(case, glyphNames, cmap, reversedCMAP, language=None, fallbackGlyph=".notdef", clusters=None):
     """
     Case Conversion Function
 
@@ -30,7 +85,14 @@ def convertCase(case, glyphNames, cmap, reversedCMAP, language=None, fallbackGly
     - fallbackGlyph
       The glyph name that should be used when the converted
       glyph does not exist in the font.
+    - clusters
+      A list with the cluster index of each glyph name. May be
+      None. If given, the converted glyph names are returned
+      along with a list of their cluster indexes. Characters
+      that are converted to several characters repeat the
+      cluster of the original.
     """
+    single, conditional, trackPrevious = _getCaseTable(case, language)
     # before anything else happens, the glyph names
     # have to be converted to unicode values. if no
     # unicode value is available, the glyph name is used.
@@ -42,31 +104,45 @@ def convertCase(case, glyphNames, cmap, reversedCMAP, language=None, fallbackGly
         else:
             glyphs.append(uniValue[0])
     converted = []
+    convertedClusters = []
+    # the word breaks are found when they are first needed.
+    wordBreaks = []
+    # the last preceding base character with no intervening
+    # combining character of class 230. this is only tracked
+    # when the language has rules that need it.
+    previous = None
     for index, uniValue in enumerate(glyphs):
         # glyph name indicating that there is no available unicode
         if isinstance(uniValue, str):
             converted.append(uniValue)
+            if clusters is not None:
+                convertedClusters.append(clusters[index])
+            previous = None
             continue
-        ## special casing
-        # specific language
-        if language is not None:
-            madeChange = _handleSpecialCasing(case, glyphs, index, uniValue, converted, cmap, reversedCMAP, language)
-            if madeChange:
-                continue
-        # no specific language required
-        madeChange = _handleSpecialCasing(case, glyphs, index, uniValue, converted, cmap, reversedCMAP, None)
-        if madeChange:
-            continue
-        ## single casing
-        if case == "upper":
-            d = lowerToSingleUpper
+        conversion = single.get(uniValue, uniValue)
+        rules = conditional.get(uniValue)
+        if rules is not None:
+            for context, ruleConversion in rules:
+                if context is None or _matchCaseContext(context, glyphs, index, previous, wordBreaks):
+                    conversion = ruleConversion
+                    break
+        # if the conversion is None, it means that the character should be removed.
+        if conversion is None:
+            pass
+        elif isinstance(conversion, tuple):
+            converted.extend(conversion)
+            if clusters is not None:
+                convertedClusters.extend([clusters[index]] * len(conversion))
         else:
-            d = upperToSingleLower
-        if uniValue in d:
-            converted.append(d[uniValue])
-            continue
-        ## fallback
-        converted.append(uniValue)
+            converted.append(conversion)
+            if clusters is not None:
+                convertedClusters.append(clusters[index])
+        if trackPrevious:
+            combining = unicodedata.combining(chr(uniValue))
+            if combining == 230:
+                previous = None
+            elif combining == 0:
+                previous = uniValue
     # convert back to glyph names
     glyphNames = []
     for uniValue in converted:
@@ -74,6 +150,8 @@ def convertCase(case, glyphNames, cmap, reversedCMAP, language=None, fallbackGly
             glyphNames.append(uniValue)
             continue
         glyphNames.append(cmap.get(uniValue, fallbackGlyph))
+    if clusters is not None:
+        return glyphNames, convertedClusters
     return glyphNames
 
 def convertCodeToInt(code):
@@ -83,259 +161,311 @@ def convertCodeToInt(code):
         return tuple([convertCodeToInt(i) for i in code.split(" ")])
     return int(code, 16)
 
-def _handleSpecialCasing(case, glyphs, index, uniValue, converted, cmap, reversedCMAP, language):
+_caseTables = {}
+
+def _getCaseTable(case, language):
     """
-    Handle a language specific lookup.
-    Returns a boolean indicating if a change was made.
+    Get the compiled conversion table for a case and language.
+
+    The table is a tuple of:
+    - a dict of code point to conversion for the characters
+      that don't depend on their context. A conversion is a
+      code point, a tuple of code points or None.
+    - a dict of code point to a list of (context, conversion)
+      rules for the characters that do. The rules are tried in
+      order and the first match wins. A context of None always
+      matches. If nothing matches, the first dict is used.
+    - a boolean indicating if any of the contexts needs the
+      preceding base character.
     """
-    if language not in specialCasing:
+    key = (case, language)
+    table = _caseTables.get(key)
+    if table is None:
+        if case == "upper":
+            single = _expandCaseRuns(lowerToSingleUpperRuns)
+        else:
+            single = _expandCaseRuns(upperToSingleLowerRuns)
+        # the language specific rules come before the general ones
+        specialRules = {}
+        for l in (language, None):
+            if l not in specialCasing:
+                continue
+            for uniValue, rule in specialCasing[l].items():
+                specialRules.setdefault(uniValue, []).append((rule["context"], rule[case]))
+        conditional = {}
+        trackPrevious = False
+        for uniValue, rules in specialRules.items():
+            if rules[0][0] is None:
+                single[uniValue] = rules[0][1]
+                continue
+            conditional[uniValue] = rules
+            for context, conversion in rules:
+                if context in ("After_I", "After_Soft_Dotted"):
+                    trackPrevious = True
+        table = _caseTables[key] = (single, conditional, trackPrevious)
+    return table
+
+def _matchCaseContext(context, glyphs, index, previous, wordBreaks):
+    """
+    Returns a boolean indicating if the context of a
+    special casing rule is met at index. previous is
+    the last preceding base character with no inter-
+    vening combining character of class 230. wordBreaks
+    is filled with the word breaks for glyphs if they
+    are needed and it is empty.
+    """
+    ## After_I
+    # The last preceding base character was
+    # an uppercase I, and there is no inter-
+    # vening combining character class 230.
+    if context == "After_I":
+        return previous == 0x0049
+    ## After_Soft_Dotted
+    # The last preceding character with a
+    # combining class of zero before C was
+    # Soft_Dotted, and there is no interven-
+    # ing combining character class 230
+    elif context == "After_Soft_Dotted":
+        return isSoftDotted(previous)
+    ## More_Above
+    # C is followed by one or more charac-
+    # ters of combining class 230 (ABOVE)
+    # in the combining character sequence.
+    elif context == "More_Above":
+        if index + 1 < len(glyphs):
+            next = glyphs[index + 1]
+            if not isinstance(next, str):
+                return unicodedata.combining(chr(next)) == 230
         return False
-    languageMap = specialCasing[language]
-    if uniValue in languageMap:
-        contextMatch = True
-        context = languageMap[uniValue]["context"]
-        if context:
-            contextMatch = False
-            ## After_I
-            # The last preceding base character was
-            # an uppercase I, and there is no inter-
-            # vening combining character class 230.
-            if context == "After_I":
-                previous = None
-                for otherUniValue in reversed(glyphs[:index]):
-                    previous = otherUniValue
-                    if isinstance(otherUniValue, str):
-                        break
-                    combining = unicodedata.combining(chr(otherUniValue))
-                    if combining == 230:
-                        previous = None
-                        break
-                    if combining == 0:
-                        break
-                if previous == convertCodeToInt("0049"):
-                    contextMatch = True
-            elif context == "Not_After_I":
-                # not referenced in SpecialCasing
-                raise NotImplementedError
-            ## After_Soft_Dotted
-            # The last preceding character with a
-            # combining class of zero before C was
-            # Soft_Dotted, and there is no interven-
-            # ing combining character class 230
-            elif context == "After_Soft_Dotted":
-                previous = None
-                for otherUniValue in reversed(glyphs[:index]):
-                    previous = otherUniValue
-                    if isinstance(otherUniValue, str):
-                        break
-                    combining = unicodedata.combining(chr(otherUniValue))
-                    if combining == 230:
-                        previous = None
-                        break
-                    if combining == 0:
-                        break
-                if previous in softDotted:
-                    contextMatch = True
-            elif context == "Not_After_Soft_Dotted":
-                # not referenced in SpecialCasing
-                raise NotImplementedError
-            ## More_Above
-            # C is followed by one or more charac-
-            # ters of combining class 230 (ABOVE)
-            # in the combining character sequence.
-            elif context == "More_Above":
-                next = None
-                for otherUniValue in glyphs[index+1:]:
-                    next = otherUniValue
-                    if isinstance(otherUniValue, str):
-                        break
-                    combining = unicodedata.combining(chr(otherUniValue))
-                    if combining == 230:
-                        contextMatch = True
-                        break
-                    else:
-                        break
-            elif context == "Not_More_Above":
-                # not referenced in SpecialCasing
-                raise NotImplementedError
-            ## Before_Dot
-            # C is followed by U+0307 combining
-            # dot above. Any sequence of charac-
-            # ters with a combining class that is nei-
-            # ther 0 nor 230 may intervene between
-            # the current character and the com-
-            # bining dot above.
-            elif context == "Before_Dot":
-                # not referenced in SpecialCasing
-                raise NotImplementedError
-            elif context == "Not_Before_Dot":
-                next = None
-                contextMatch = True
-                for otherUniValue in glyphs[index+1:]:
-                    if isinstance(otherUniValue, str):
-                        break
-                    if otherUniValue == convertCodeToInt("0307"):
-                        contextMatch = False
-                        break
-                    else:
-                        combining = unicodedata.combining(chr(otherUniValue))
-                        if combining == 0 or combining == 230:
-                            break
-            ## Final_Sigma
-            # Within the closest word boundaries
-            # containing C, there is a cased letter
-            # before C, and there is no cased letter
-            # after C.
-            elif context == "Final_Sigma":
-                glyphNames = [cmap.get(i, i) for i in glyphs]
-                if isWordBreakAfter(glyphNames, index, reversedCMAP):
-                    contextMatch = True
-            ## Unknown
-            else:
-                raise NotImplementedError(context)
-        if contextMatch:
-            conversion = languageMap[uniValue][case]
-            # if the conversion is None, it means that the character should be removed.
-            if conversion is None:
-                return True
-            # apply the conversion to the list of converted characters.
-            if not isinstance(conversion, tuple):
-                conversion = [conversion]
-            for code in conversion:
-                converted.append(code)
-            return True
-    return False
+    ## Not_Before_Dot
+    # C is not followed by U+0307 combining
+    # dot above. Any sequence of charac-
+    # ters with a combining class that is nei-
+    # ther 0 nor 230 may intervene between
+    # the current character and the com-
+    # bining dot above.
+    elif context == "Not_Before_Dot":
+        for otherUniValue in glyphs[index+1:]:
+            if isinstance(otherUniValue, str):
+                break
+            if otherUniValue == 0x0307:
+                return False
+            combining = unicodedata.combining(chr(otherUniValue))
+            if combining == 0 or combining == 230:
+                break
+        return True
+    ## Final_Sigma
+    # Within the closest word boundaries
+    # containing C, there is a cased letter
+    # before C, and there is no cased letter
+    # after C.
+    elif context == "Final_Sigma":
+        if not wordBreaks:
+            wordBreaks.extend(getWordBreaks([None if isinstance(uniValue, str) else uniValue for uniValue in glyphs]))
+        return wordBreaks[index + 1]
+    ## Unknown
+    # Not_After_I, Not_After_Soft_Dotted, Not_More_Above
+    # and Before_Dot are not referenced in SpecialCasing
+    raise NotImplementedError(context)
 
 # -----------------------
 # Word Boundary Detection
 # -----------------------
 # This implements the default word boundary algorithm explained here:
-# http://www.unicode.org/reports/tr29/tr29-11.html#Default_Word_Boundaries
-
-_notBreakBefore = set([
-    # Do not break within CRLF
-    (convertCodeToInt("240D"), convertCodeToInt("240A")),
-    # Do not break between most letters.
-    ("ALetter", "ALetter"),
-    # Do not break across certain punctuation.
-    ("ALetter", "MidLetter", "ALetter"),
-    # Do not break within sequences of digits, or digits adjacent to letters.
-    ("Numeric", "Numeric"),
-    ("Numeric", "ALetter"),
-    ("ALetter", "Numeric"),
-    # Do not break within sequences, such as "3.2" or "3,456.789".
-    ("Numeric", "MidNum", "Numeric"),
-    # Do not break between Katakana.
-    ("Katakana", "Katakana"),
-    # Do not break from extenders.
-    ("ALetter", "ExtendNumLet"),
-    ("Numeric", "ExtendNumLet"),
-    ("Katakana", "ExtendNumLet"),
-    ("ExtendNumLet", "ExtendNumLet"),
-])
-
-def isWordBreakBefore(glyphNames, index, reversedCMAP):
+# http://www.unicode.org/reports/tr29/#Word_Boundaries
+#
+# The rules that only look at the characters on either side
+# of a position are compiled into a table indexed by the word
+# break classes of those characters. The rules that look
+# further ahead or behind are marked in the table and
+# resolved while walking through the text once.
+#
+# The property data comes from the Unicode 5.0 version of
+# WordBreakProperty.txt, so the classes added after that
+# (Hebrew_Letter, Single_Quote, Double_Quote, MidNumLet and
+# Extended_Pictographic) and the rules that use them are left
+# out until the data is updated.
+
+_wordBreakClassNames = [
+    "Other",
+    "CR",
+    "LF",
+    "Newline",
+    "Extend",
+    "ZWJ",
+    "Regional_Indicator",
+    "Format",
+    "Katakana",
+    "ALetter",
+    "MidLetter",
+    "MidNum",
+    "Numeric",
+    "ExtendNumLet",
+    "WSegSpace",
+]
+
+(_wbOther, _wbCR, _wbLF, _wbNewline, _wbExtend, _wbZWJ, _wbRegionalIndicator,
+ _wbFormat, _wbKatakana, _wbALetter, _wbMidLetter, _wbMidNum, _wbNumeric,
+ _wbExtendNumLet, _wbWSegSpace) = range(len(_wordBreakClassNames))
+
+_wordBreakClasses = dict([(name, index) for index, name in enumerate(_wordBreakClassNames)])
+_wordBreakPropertyClasses = [_wordBreakClasses.get(name, _wbOther) for name in wordBreakPropertyNames]
+
+_wbNewlines = set([_wbCR, _wbLF, _wbNewline])
+_wbIgnorable = set([_wbExtend, _wbFormat, _wbZWJ])
+
+# pair table actions
+_wbBreak = 0
+_wbKeep = 1
+_wbKeepIfALetterAhead = 2
+_wbKeepIfNumericAhead = 3
+_wbKeepIfALetterBehind = 4
+_wbKeepIfNumericBehind = 5
+_wbKeepIfOddRegionalIndicators = 6
+
+def _buildWordBreakPairTable():
+    count = len(_wordBreakClassNames)
+    table = [[_wbBreak] * count for i in range(count)]
+    def setAction(lefts, rights, action):
+        for left in lefts:
+            for right in rights:
+                table[left][right] = action
+    # WB5: ALetter x ALetter
+    setAction([_wbALetter], [_wbALetter], _wbKeep)
+    # WB6: ALetter x MidLetter ALetter
+    setAction([_wbALetter], [_wbMidLetter], _wbKeepIfALetterAhead)
+    # WB7: ALetter MidLetter x ALetter
+    setAction([_wbMidLetter], [_wbALetter], _wbKeepIfALetterBehind)
+    # WB8: Numeric x Numeric
+    # WB9: ALetter x Numeric
+    # WB10: Numeric x ALetter
+    setAction([_wbNumeric], [_wbNumeric], _wbKeep)
+    setAction([_wbALetter], [_wbNumeric], _wbKeep)
+    setAction([_wbNumeric], [_wbALetter], _wbKeep)
+    # WB11: Numeric MidNum x Numeric
+    setAction([_wbMidNum], [_wbNumeric], _wbKeepIfNumericBehind)
+    # WB12: Numeric x MidNum Numeric
+    setAction([_wbNumeric], [_wbMidNum], _wbKeepIfNumericAhead)
+    # WB13: Katakana x Katakana
+    setAction([_wbKatakana], [_wbKatakana], _wbKeep)
+    # WB13a: (ALetter | Numeric | Katakana | ExtendNumLet) x ExtendNumLet
+    setAction([_wbALetter, _wbNumeric, _wbKatakana, _wbExtendNumLet], [_wbExtendNumLet], _wbKeep)
+    # WB13b: ExtendNumLet x (ALetter | Numeric | Katakana)
+    setAction([_wbExtendNumLet], [_wbALetter, _wbNumeric, _wbKatakana], _wbKeep)
+    # WB15, WB16: do not break within pairs of regional indicators
+    setAction([_wbRegionalIndicator], [_wbRegionalIndicator], _wbKeepIfOddRegionalIndicators)
+    return table
+
+_wordBreakPairTable = _buildWordBreakPairTable()
+
+def _getWordBreakClass(uniValue):
+    index = _findRange(uniValue, wordBreakRangeStarts, wordBreakRangeEnds)
+    if index == -1:
+        return _wbOther
+    return _wordBreakPropertyClasses[wordBreakRangeValues[index]]
+
+def getWordBreaks(uniValues):
+    """
+    Returns a list of booleans declaring if there is a
+    word break before each of the given unicode values.
+    The list has one more item than uniValues: the last
+    item is the break at the end of the text. None can
+    be used for glyphs that don't have a unicode value.
+
+    This walks through the text once, so it should be
+    preferred over isWordBreakBefore and isWordBreakAfter
+    when the breaks for a whole run are needed.
+
+        >>> getWordBreaks([convertCodeToInt(i) for i in "0041 0020 0031 002E 0031".split(" ")])
+        [True, True, True, False, False, True]
+    """
+    count = len(uniValues)
+    classes = [_getWordBreakClass(uniValue) for uniValue in uniValues]
+    breaks = [True] * (count + 1)
+    pairTable = _wordBreakPairTable
+    newlines = _wbNewlines
+    ignorable = _wbIgnorable
+    # the classes of the last two characters that are
+    # not ignored by WB4 and the number of consecutive
+    # regional indicators ending with the last one.
+    last = None
+    lastButOne = None
+    regionalIndicators = 0
+    for index, right in enumerate(classes):
+        if index:
+            previous = classes[index - 1]
+            # WB3: CR x LF
+            if previous == _wbCR and right == _wbLF:
+                breaks[index] = False
+            # WB3a, WB3b: break before and after newlines
+            elif previous in newlines or right in newlines:
+                pass
+            # WB3d: WSegSpace x WSegSpace
+            elif previous == _wbWSegSpace and right == _wbWSegSpace:
+                breaks[index] = False
+            # WB4: X (Extend | Format | ZWJ)* -> X
+            elif right in ignorable:
+                breaks[index] = False
+            else:
+                action = pairTable[last][right]
+                if action == _wbKeep:
+                    breaks[index] = False
+                elif action != _wbBreak:
+                    if action <= _wbKeepIfNumericAhead:
+                        ahead = _wbOther
+                        aheadIndex = index + 1
+                        while aheadIndex < count and classes[aheadIndex] in ignorable:
+                            aheadIndex += 1
+                        if aheadIndex < count:
+                            ahead = classes[aheadIndex]
+                        if action == _wbKeepIfALetterAhead:
+                            breaks[index] = ahead != _wbALetter
+                        else:
+                            breaks[index] = ahead != _wbNumeric
+                    elif action == _wbKeepIfALetterBehind:
+                        breaks[index] = lastButOne != _wbALetter
+                    elif action == _wbKeepIfNumericBehind:
+                        breaks[index] = lastButOne != _wbNumeric
+                    else:
+                        breaks[index] = not regionalIndicators % 2
+        # ignored characters attach to the preceding character
+        # unless they follow the start of the text or a newline.
+        if right in ignorable:
+            if last is not None and last not in newlines:
+                continue
+            right = _wbOther
+        lastButOne = last
+        last = right
+        if right == _wbRegionalIndicator:
+            regionalIndicators += 1
+        else:
+            regionalIndicators = 0
+    return breaks
+
+def _glyphNamesToUnicodeValues(glyphNames, reversedCMAP):
+    return [reversedCMAP.get(glyphName, [None])[0] for glyphName in glyphNames]
+
+def isWordBreakBefore(glyphNames, index, reversedCMAP, wordBreaks=None):
     """
     Returns a boolean declaring if the position
     before index can be considered a word break.
+    wordBreaks may be the list returned by getWordBreaks
+    for the glyph names. Passing it avoids finding the
+    breaks of the whole run again for every position.
     """
-    # Start of line
-    if index == 0:
-        return True
-    # get the unicode values and word break properties
-    # for the previous two, current and next glyphs.
-    unicodeValue = reversedCMAP.get(glyphNames[index], [None])[0]
-    wordBreakProperty = wordBreakProperties.get(unicodeValue)
-    backOneUnicodeValue = reversedCMAP.get(glyphNames[index - 1], [None])[0]
-    backOneWordBreakProperty = wordBreakProperties.get(backOneUnicodeValue)
-    if index > 1:
-        backTwoUnicodeValue = reversedCMAP.get(glyphNames[index - 2], [None])[0]
-        backTwoWordBreakProperty = wordBreakProperties.get(backTwoUnicodeValue)
-    else:
-        backTwoUnicodeValue = False
-        backTwoWordBreakProperty = False
-    if index < len(glyphNames) - 1:
-        forwardOneUnicodeValue = reversedCMAP.get(glyphNames[index + 1], [None])[0]
-        forwardOneWordBreakProperty = wordBreakProperties.get(forwardOneUnicodeValue)
-    else:
-        forwardOneUnicodeValue = None
-        forwardOneWordBreakProperty = None
-    # test the previous and current unicode values
-    if (backOneUnicodeValue, unicodeValue) in _notBreakBefore:
-        return False
-    # test the previous and current word break properties
-    if (backOneWordBreakProperty, wordBreakProperty) in _notBreakBefore:
-        return False
-    # test the previous, current and next word break properties
-    if (backOneWordBreakProperty, wordBreakProperty, forwardOneWordBreakProperty) in _notBreakBefore:
-        return False
-    # test the previous, current and next word break properties
-    if (backTwoWordBreakProperty, backOneWordBreakProperty, wordBreakProperty) in _notBreakBefore:
-        return False
-    # Otherwise, break everywhere (including around ideographs).
-    return True
-
-_notBreakAfter = set([
-    # Do not break within CRLF
-    (convertCodeToInt("240D"), convertCodeToInt("240A")),
-    # Do not break between most letters.
-    ("ALetter", "ALetter"),
-    # Do not break across certain punctuation.
-    ("ALetter", "MidLetter", "ALetter"),
-    # Do not break within sequences of digits, or digits adjacent to letters.
-    ("Numeric", "Numeric"),
-    ("Numeric", "ALetter"),
-    ("ALetter", "Numeric"),
-    # Do not break within sequences, such as "3.2" or "3,456.789".
-    ("Numeric", "MidNum", "Numeric"),
-    # Do not break between Katakana.
-    ("Katakana", "Katakana"),
-    # Do not break from extenders.
-    ("ExtendNumLet", "ALetter"),
-    ("ExtendNumLet", "Numeric"),
-    ("ExtendNumLet", "Katakana"),
-])
-
-def isWordBreakAfter(glyphNames, index, reversedCMAP):
+    if wordBreaks is None:
+        wordBreaks = getWordBreaks(_glyphNamesToUnicodeValues(glyphNames, reversedCMAP))
+    return wordBreaks[index]
+
+def isWordBreakAfter(glyphNames, index, reversedCMAP, wordBreaks=None):
     """
     Returns a boolean declaring if the position
     after index can be considered a word break.
+    wordBreaks is used as in isWordBreakBefore.
     """
-    # End of line
-    if index == len(glyphNames) - 1:
-        return True
-    # get the unicode values and word break properties
-    # for the previous, current and next two glyphs.
-    unicodeValue = reversedCMAP.get(glyphNames[index], [None])[0]
-    wordBreakProperty = wordBreakProperties.get(unicodeValue)
-    forwardOneUnicodeValue = reversedCMAP.get(glyphNames[index + 1], [None])[0]
-    forwardOneWordBreakProperty = wordBreakProperties.get(forwardOneUnicodeValue)
-    if index > 0:
-        backOneUnicodeValue = reversedCMAP.get(glyphNames[index - 1], [None])[0]
-        backOneWordBreakProperty = wordBreakProperties.get(backOneUnicodeValue)
-    else:
-        backOneUnicodeValue = None
-        backOneWordBreakProperty = None
-    if index < len(glyphNames) - 2:
-        forwardTwoUnicodeValue = reversedCMAP.get(glyphNames[index + 2], [None])[0]
-        forwardTwoWordBreakProperty = wordBreakProperties.get(forwardTwoUnicodeValue)
-    else:
-        forwardTwoUnicodeValue = None
-        forwardTwoWordBreakProperty = None
-    # test the current and next unicode values
-    if (unicodeValue, forwardOneUnicodeValue) in _notBreakAfter:
-        return False
-    # test the current and next word break properties
-    if (wordBreakProperty, forwardOneWordBreakProperty) in _notBreakAfter:
-        return False
-    # test the previous, current and next word break properties
-    if (backOneWordBreakProperty, wordBreakProperty, forwardOneWordBreakProperty) in _notBreakAfter:
-        return False
-    # test the current and next two word break properties
-    if (wordBreakProperty, forwardOneWordBreakProperty, forwardTwoWordBreakProperty) in _notBreakAfter:
-        return False
-    # Otherwise, break everywhere (including around ideographs).
-    return True
+    if wordBreaks is None:
+        wordBreaks = getWordBreaks(_glyphNamesToUnicodeValues(glyphNames, reversedCMAP))
+    return wordBreaks[index + 1]
 
 # -----
 # Tests
@@ -396,6 +526,8 @@ def testCaseConversionLowerMoreAbove():
     ['i', 'i', 'dotabove', 'grave']
     >>> convertCase("lower", ["I", "I"], cmap, reverseCMAP(cmap), "LTH")
     ['i', 'i']
+    >>> convertCase("lower", ["I", "grave"], cmap, reverseCMAP(cmap), "LTH", clusters=[0, 1])
+    (['i', 'dotabove', 'grave'], [0, 0, 1])
     """
 
 def testCaseConversionLowerNotBeforeDot():
@@ -599,6 +731,79 @@ def testBreakAfter():
     False
     """
 
+def testWordBreaks():
+    """
+    >>> def breaks(codes):
+    ...     return getWordBreaks([convertCodeToInt(i) for i in codes.split(" ")])
+
+    # CR, LF
+    >>> breaks("0041 000D 000A 0041")
+    [True, True, False, True, True]
+
+    # Extend and Format attach to the preceding character
+    >>> breaks("0628 064E 0628")
+    [True, False, False, True]
+    >>> breaks("0041 00AD 003A 0301 0041")
+    [True, False, False, False, False, True]
+
+    # but not at the start of the text
+    >>> breaks("0301 0041")
+    [True, True, True]
+
+    # Regional indicators pair up
+    >>> breaks("1F1EB 1F1F7 1F1E9 1F1EA 1F1EE")
+    [True, False, True, False, True, True]
+
+    # Spaces
+    >>> breaks("0041 0020 0020 0041")
+    [True, True, False, True, True]
+
+    # Glyphs without unicode values
+    >>> getWordBreaks([None, convertCodeToInt("0041")])
+    [True, True, True]
+
+    # ALetter MidLetter ALetter looks ahead
+    # and behind, skipping Extend and Format
+    >>> breaks("0063 0061 006E 0027 0074")
+    [True, False, False, False, False, True]
+    >>> breaks("0061 003A 0301 0062")
+    [True, False, False, False, True]
+    >>> breaks("0061 003A")
+    [True, True, True]
+    >>> breaks("0061 003A 0020")
+    [True, True, True, True]
+    >>> breaks("0061 003A 003A 0062")
+    [True, True, True, True, True]
+
+    # Numeric MidNum Numeric
+    >>> breaks("0031 002E 0031")
+    [True, False, False, True]
+    >>> breaks("0031 002C 0041")
+    [True, True, True, True]
+    >>> breaks("0031 002E")
+    [True, True, True]
+
+    # Precomputed breaks
+    >>> cmap = reverseCMAP({convertCodeToInt("0061") : "a", convertCodeToInt("003A") : "colon"})
+    >>> glyphNames = ["a", "colon", "a"]
+    >>> wordBreaks = getWordBreaks(_glyphNamesToUnicodeValues(glyphNames, cmap))
+    >>> [isWordBreakBefore(glyphNames, i, cmap, wordBreaks) for i in range(3)]
+    [True, False, False]
+    >>> isWordBreakAfter(glyphNames, 2, cmap, wordBreaks)
+    True
+    """
+
+def testWordBreakData():
+    """
+    Every word break class that the rules use has
+    code points in the property data.
+
+    >>> [name for name in _wordBreakClassNames if name != "Other" and name not in wordBreakPropertyNames]
+    []
+    >>> [name for name in wordBreakPropertyNames if name not in _wordBreakClasses]
+    []
+    """
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
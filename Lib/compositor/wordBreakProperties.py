@@ -2,21775 +2,158 @@
 # DO NOT EDIT!
 # ------------
 # This was generated by tools/UnicodeReferenceGenerator.py
-# Generated on: Sat, 08 Sep 2007 10:03:42
+# Generated on: Mon, 19 Oct 2026 18:21:04
 
-wordBreakProperties = {   39: 'MidLetter',
-    44: 'MidNum',
-    46: 'MidNum',
-    48: 'Numeric',
-    49: 'Numeric',
-    50: 'Numeric',
-    51: 'Numeric',
-    52: 'Numeric',
-    53: 'Numeric',
-    54: 'Numeric',
-    55: 'Numeric',
-    56: 'Numeric',
-    57: 'Numeric',
-    58: 'MidLetter',
-    59: 'MidNum',
-    65: 'ALetter',
-    66: 'ALetter',
-    67: 'ALetter',
-    68: 'ALetter',
-    69: 'ALetter',
-    70: 'ALetter',
-    71: 'ALetter',
-    72: 'ALetter',
-    73: 'ALetter',
-    74: 'ALetter',
-    75: 'ALetter',
-    76: 'ALetter',
-    77: 'ALetter',
-    78: 'ALetter',
-    79: 'ALetter',
-    80: 'ALetter',
-    81: 'ALetter',
-    82: 'ALetter',
-    83: 'ALetter',
-    84: 'ALetter',
-    85: 'ALetter',
-    86: 'ALetter',
-    87: 'ALetter',
-    88: 'ALetter',
-    89: 'ALetter',
-    90: 'ALetter',
-    95: 'ExtendNumLet',
-    97: 'ALetter',
-    98: 'ALetter',
-    99: 'ALetter',
-    100: 'ALetter',
-    101: 'ALetter',
-    102: 'ALetter',
-    103: 'ALetter',
-    104: 'ALetter',
-    105: 'ALetter',
-    106: 'ALetter',
-    107: 'ALetter',
-    108: 'ALetter',
-    109: 'ALetter',
-    110: 'ALetter',
-    111: 'ALetter',
-    112: 'ALetter',
-    113: 'ALetter',
-    114: 'ALetter',
-    115: 'ALetter',
-    116: 'ALetter',
-    117: 'ALetter',
-    118: 'ALetter',
-    119: 'ALetter',
-    120: 'ALetter',
-    121: 'ALetter',
-    122: 'ALetter',
-    170: 'ALetter',
-    173: 'Format',
-    181: 'ALetter',
-    183: 'MidLetter',
-    186: 'ALetter',
-    192: 'ALetter',
-    193: 'ALetter',
-    194: 'ALetter',
-    195: 'ALetter',
-    196: 'ALetter',
-    197: 'ALetter',
-    198: 'ALetter',
-    199: 'ALetter',
-    200: 'ALetter',
-    201: 'ALetter',
-    202: 'ALetter',
-    203: 'ALetter',
-    204: 'ALetter',
-    205: 'ALetter',
-    206: 'ALetter',
-    207: 'ALetter',
-    208: 'ALetter',
-    209: 'ALetter',
-    210: 'ALetter',
-    211: 'ALetter',
-    212: 'ALetter',
-    213: 'ALetter',
-    214: 'ALetter',
-    216: 'ALetter',
-    217: 'ALetter',
-    218: 'ALetter',
-    219: 'ALetter',
-    220: 'ALetter',
-    221: 'ALetter',
-    222: 'ALetter',
-    223: 'ALetter',
-    224: 'ALetter',
-    225: 'ALetter',
-    226: 'ALetter',
-    227: 'ALetter',
-    228: 'ALetter',
-    229: 'ALetter',
-    230: 'ALetter',
-    231: 'ALetter',
-    232: 'ALetter',
-    233: 'ALetter',
-    234: 'ALetter',
-    235: 'ALetter',
-    236: 'ALetter',
-    237: 'ALetter',
-    238: 'ALetter',
-    239: 'ALetter',
-    240: 'ALetter',
-    241: 'ALetter',
-    242: 'ALetter',
-    243: 'ALetter',
-    244: 'ALetter',
-    245: 'ALetter',
-    246: 'ALetter',
-    248: 'ALetter',
-    249: 'ALetter',
-    250: 'ALetter',
-    251: 'ALetter',
-    252: 'ALetter',
-    253: 'ALetter',
-    254: 'ALetter',
-    255: 'ALetter',
-    256: 'ALetter',
-    257: 'ALetter',
-    258: 'ALetter',
-    259: 'ALetter',
-    260: 'ALetter',
-    261: 'ALetter',
-    262: 'ALetter',
-    263: 'ALetter',
-    264: 'ALetter',
-    265: 'ALetter',
-    266: 'ALetter',
-    267: 'ALetter',
-    268: 'ALetter',
-    269: 'ALetter',
-    270: 'ALetter',
-    271: 'ALetter',
-    272: 'ALetter',
-    273: 'ALetter',
-    274: 'ALetter',
-    275: 'ALetter',
-    276: 'ALetter',
-    277: 'ALetter',
-    278: 'ALetter',
-    279: 'ALetter',
-    280: 'ALetter',
-    281: 'ALetter',
-    282: 'ALetter',
-    283: 'ALetter',
-    284: 'ALetter',
-    285: 'ALetter',
-    286: 'ALetter',
-    287: 'ALetter',
-    288: 'ALetter',
-    289: 'ALetter',
-    290: 'ALetter',
-    291: 'ALetter',
-    292: 'ALetter',
-    293: 'ALetter',
-    294: 'ALetter',
-    295: 'ALetter',
-    296: 'ALetter',
-    297: 'ALetter',
-    298: 'ALetter',
-    299: 'ALetter',
-    300: 'ALetter',
-    301: 'ALetter',
-    302: 'ALetter',
-    303: 'ALetter',
-    304: 'ALetter',
-    305: 'ALetter',
-    306: 'ALetter',
-    307: 'ALetter',
-    308: 'ALetter',
-    309: 'ALetter',
-    310: 'ALetter',
-    311: 'ALetter',
-    312: 'ALetter',
-    313: 'ALetter',
-    314: 'ALetter',
-    315: 'ALetter',
-    316: 'ALetter',
-    317: 'ALetter',
-    318: 'ALetter',
-    319: 'ALetter',
-    320: 'ALetter',
-    321: 'ALetter',
-    322: 'ALetter',
-    323: 'ALetter',
-    324: 'ALetter',
-    325: 'ALetter',
-    326: 'ALetter',
-    327: 'ALetter',
-    328: 'ALetter',
-    329: 'ALetter',
-    330: 'ALetter',
-    331: 'ALetter',
-    332: 'ALetter',
-    333: 'ALetter',
-    334: 'ALetter',
-    335: 'ALetter',
-    336: 'ALetter',
-    337: 'ALetter',
-    338: 'ALetter',
-    339: 'ALetter',
-    340: 'ALetter',
-    341: 'ALetter',
-    342: 'ALetter',
-    343: 'ALetter',
-    344: 'ALetter',
-    345: 'ALetter',
-    346: 'ALetter',
-    347: 'ALetter',
-    348: 'ALetter',
-    349: 'ALetter',
-    350: 'ALetter',
-    351: 'ALetter',
-    352: 'ALetter',
-    353: 'ALetter',
-    354: 'ALetter',
-    355: 'ALetter',
-    356: 'ALetter',
-    357: 'ALetter',
-    358: 'ALetter',
-    359: 'ALetter',
-    360: 'ALetter',
-    361: 'ALetter',
-    362: 'ALetter',
-    363: 'ALetter',
-    364: 'ALetter',
-    365: 'ALetter',
-    366: 'ALetter',
-    367: 'ALetter',
-    368: 'ALetter',
-    369: 'ALetter',
-    370: 'ALetter',
-    371: 'ALetter',
-    372: 'ALetter',
-    373: 'ALetter',
-    374: 'ALetter',
-    375: 'ALetter',
-    376: 'ALetter',
-    377: 'ALetter',
-    378: 'ALetter',
-    379: 'ALetter',
-    380: 'ALetter',
-    381: 'ALetter',
-    382: 'ALetter',
-    383: 'ALetter',
-    384: 'ALetter',
-    385: 'ALetter',
-    386: 'ALetter',
-    387: 'ALetter',
-    388: 'ALetter',
-    389: 'ALetter',
-    390: 'ALetter',
-    391: 'ALetter',
-    392: 'ALetter',
-    393: 'ALetter',
-    394: 'ALetter',
-    395: 'ALetter',
-    396: 'ALetter',
-    397: 'ALetter',
-    398: 'ALetter',
-    399: 'ALetter',
-    400: 'ALetter',
-    401: 'ALetter',
-    402: 'ALetter',
-    403: 'ALetter',
-    404: 'ALetter',
-    405: 'ALetter',
-    406: 'ALetter',
-    407: 'ALetter',
-    408: 'ALetter',
-    409: 'ALetter',
-    410: 'ALetter',
-    411: 'ALetter',
-    412: 'ALetter',
-    413: 'ALetter',
-    414: 'ALetter',
-    415: 'ALetter',
-    416: 'ALetter',
-    417: 'ALetter',
-    418: 'ALetter',
-    419: 'ALetter',
-    420: 'ALetter',
-    421: 'ALetter',
-    422: 'ALetter',
-    423: 'ALetter',
-    424: 'ALetter',
-    425: 'ALetter',
-    426: 'ALetter',
-    427: 'ALetter',
-    428: 'ALetter',
-    429: 'ALetter',
-    430: 'ALetter',
-    431: 'ALetter',
-    432: 'ALetter',
-    433: 'ALetter',
-    434: 'ALetter',
-    435: 'ALetter',
-    436: 'ALetter',
-    437: 'ALetter',
-    438: 'ALetter',
-    439: 'ALetter',
-    440: 'ALetter',
-    441: 'ALetter',
-    442: 'ALetter',
-    443: 'ALetter',
-    444: 'ALetter',
-    445: 'ALetter',
-    446: 'ALetter',
-    447: 'ALetter',
-    448: 'ALetter',
-    449: 'ALetter',
-    450: 'ALetter',
-    451: 'ALetter',
-    452: 'ALetter',
-    453: 'ALetter',
-    454: 'ALetter',
-    455: 'ALetter',
-    456: 'ALetter',
-    457: 'ALetter',
-    458: 'ALetter',
-    459: 'ALetter',
-    460: 'ALetter',
-    461: 'ALetter',
-    462: 'ALetter',
-    463: 'ALetter',
-    464: 'ALetter',
-    465: 'ALetter',
-    466: 'ALetter',
-    467: 'ALetter',
-    468: 'ALetter',
-    469: 'ALetter',
-    470: 'ALetter',
-    471: 'ALetter',
-    472: 'ALetter',
-    473: 'ALetter',
-    474: 'ALetter',
-    475: 'ALetter',
-    476: 'ALetter',
-    477: 'ALetter',
-    478: 'ALetter',
-    479: 'ALetter',
-    480: 'ALetter',
-    481: 'ALetter',
-    482: 'ALetter',
-    483: 'ALetter',
-    484: 'ALetter',
-    485: 'ALetter',
-    486: 'ALetter',
-    487: 'ALetter',
-    488: 'ALetter',
-    489: 'ALetter',
-    490: 'ALetter',
-    491: 'ALetter',
-    492: 'ALetter',
-    493: 'ALetter',
-    494: 'ALetter',
-    495: 'ALetter',
-    496: 'ALetter',
-    497: 'ALetter',
-    498: 'ALetter',
-    499: 'ALetter',
-    500: 'ALetter',
-    501: 'ALetter',
-    502: 'ALetter',
-    503: 'ALetter',
-    504: 'ALetter',
-    505: 'ALetter',
-    506: 'ALetter',
-    507: 'ALetter',
-    508: 'ALetter',
-    509: 'ALetter',
-    510: 'ALetter',
-    511: 'ALetter',
-    512: 'ALetter',
-    513: 'ALetter',
-    514: 'ALetter',
-    515: 'ALetter',
-    516: 'ALetter',
-    517: 'ALetter',
-    518: 'ALetter',
-    519: 'ALetter',
-    520: 'ALetter',
-    521: 'ALetter',
-    522: 'ALetter',
-    523: 'ALetter',
-    524: 'ALetter',
-    525: 'ALetter',
-    526: 'ALetter',
-    527: 'ALetter',
-    528: 'ALetter',
-    529: 'ALetter',
-    530: 'ALetter',
-    531: 'ALetter',
-    532: 'ALetter',
-    533: 'ALetter',
-    534: 'ALetter',
-    535: 'ALetter',
-    536: 'ALetter',
-    537: 'ALetter',
-    538: 'ALetter',
-    539: 'ALetter',
-    540: 'ALetter',
-    541: 'ALetter',
-    542: 'ALetter',
-    543: 'ALetter',
-    544: 'ALetter',
-    545: 'ALetter',
-    546: 'ALetter',
-    547: 'ALetter',
-    548: 'ALetter',
-    549: 'ALetter',
-    550: 'ALetter',
-    551: 'ALetter',
-    552: 'ALetter',
-    553: 'ALetter',
-    554: 'ALetter',
-    555: 'ALetter',
-    556: 'ALetter',
-    557: 'ALetter',
-    558: 'ALetter',
-    559: 'ALetter',
-    560: 'ALetter',
-    561: 'ALetter',
-    562: 'ALetter',
-    563: 'ALetter',
-    564: 'ALetter',
-    565: 'ALetter',
-    566: 'ALetter',
-    567: 'ALetter',
-    568: 'ALetter',
-    569: 'ALetter',
-    570: 'ALetter',
-    571: 'ALetter',
-    572: 'ALetter',
-    573: 'ALetter',
-    574: 'ALetter',
-    575: 'ALetter',
-    576: 'ALetter',
-    577: 'ALetter',
-    578: 'ALetter',
-    579: 'ALetter',
-    580: 'ALetter',
-    581: 'ALetter',
-    582: 'ALetter',
-    583: 'ALetter',
-    584: 'ALetter',
-    585: 'ALetter',
-    586: 'ALetter',
-    587: 'ALetter',
-    588: 'ALetter',
-    589: 'ALetter',
-    590: 'ALetter',
-    591: 'ALetter',
-    592: 'ALetter',
-    593: 'ALetter',
-    594: 'ALetter',
-    595: 'ALetter',
-    596: 'ALetter',
-    597: 'ALetter',
-    598: 'ALetter',
-    599: 'ALetter',
-    600: 'ALetter',
-    601: 'ALetter',
-    602: 'ALetter',
-    603: 'ALetter',
-    604: 'ALetter',
-    605: 'ALetter',
-    606: 'ALetter',
-    607: 'ALetter',
-    608: 'ALetter',
-    609: 'ALetter',
-    610: 'ALetter',
-    611: 'ALetter',
-    612: 'ALetter',
-    613: 'ALetter',
-    614: 'ALetter',
-    615: 'ALetter',
-    616: 'ALetter',
-    617: 'ALetter',
-    618: 'ALetter',
-    619: 'ALetter',
-    620: 'ALetter',
-    621: 'ALetter',
-    622: 'ALetter',
-    623: 'ALetter',
-    624: 'ALetter',
-    625: 'ALetter',
-    626: 'ALetter',
-    627: 'ALetter',
-    628: 'ALetter',
-    629: 'ALetter',
-    630: 'ALetter',
-    631: 'ALetter',
-    632: 'ALetter',
-    633: 'ALetter',
-    634: 'ALetter',
-    635: 'ALetter',
-    636: 'ALetter',
-    637: 'ALetter',
-    638: 'ALetter',
-    639: 'ALetter',
-    640: 'ALetter',
-    641: 'ALetter',
-    642: 'ALetter',
-    643: 'ALetter',
-    644: 'ALetter',
-    645: 'ALetter',
-    646: 'ALetter',
-    647: 'ALetter',
-    648: 'ALetter',
-    649: 'ALetter',
-    650: 'ALetter',
-    651: 'ALetter',
-    652: 'ALetter',
-    653: 'ALetter',
-    654: 'ALetter',
-    655: 'ALetter',
-    656: 'ALetter',
-    657: 'ALetter',
-    658: 'ALetter',
-    659: 'ALetter',
-    660: 'ALetter',
-    661: 'ALetter',
-    662: 'ALetter',
-    663: 'ALetter',
-    664: 'ALetter',
-    665: 'ALetter',
-    666: 'ALetter',
-    667: 'ALetter',
-    668: 'ALetter',
-    669: 'ALetter',
-    670: 'ALetter',
-    671: 'ALetter',
-    672: 'ALetter',
-    673: 'ALetter',
-    674: 'ALetter',
-    675: 'ALetter',
-    676: 'ALetter',
-    677: 'ALetter',
-    678: 'ALetter',
-    679: 'ALetter',
-    680: 'ALetter',
-    681: 'ALetter',
-    682: 'ALetter',
-    683: 'ALetter',
-    684: 'ALetter',
-    685: 'ALetter',
-    686: 'ALetter',
-    687: 'ALetter',
-    688: 'ALetter',
-    689: 'ALetter',
-    690: 'ALetter',
-    691: 'ALetter',
-    692: 'ALetter',
-    693: 'ALetter',
-    694: 'ALetter',
-    695: 'ALetter',
-    696: 'ALetter',
-    697: 'ALetter',
-    698: 'ALetter',
-    699: 'ALetter',
-    700: 'ALetter',
-    701: 'ALetter',
-    702: 'ALetter',
-    703: 'ALetter',
-    704: 'ALetter',
-    705: 'ALetter',
-    710: 'ALetter',
-    711: 'ALetter',
-    712: 'ALetter',
-    713: 'ALetter',
-    714: 'ALetter',
-    715: 'ALetter',
-    716: 'ALetter',
-    717: 'ALetter',
-    718: 'ALetter',
-    719: 'ALetter',
-    720: 'ALetter',
-    721: 'ALetter',
-    736: 'ALetter',
-    737: 'ALetter',
-    738: 'ALetter',
-    739: 'ALetter',
-    740: 'ALetter',
-    750: 'ALetter',
-    890: 'ALetter',
-    891: 'ALetter',
-    892: 'ALetter',
-    893: 'ALetter',
-    894: 'MidNum',
-    902: 'ALetter',
-    904: 'ALetter',
-    905: 'ALetter',
-    906: 'ALetter',
-    908: 'ALetter',
-    910: 'ALetter',
-    911: 'ALetter',
-    912: 'ALetter',
-    913: 'ALetter',
-    914: 'ALetter',
-    915: 'ALetter',
-    916: 'ALetter',
-    917: 'ALetter',
-    918: 'ALetter',
-    919: 'ALetter',
-    920: 'ALetter',
-    921: 'ALetter',
-    922: 'ALetter',
-    923: 'ALetter',
-    924: 'ALetter',
-    925: 'ALetter',
-    926: 'ALetter',
-    927: 'ALetter',
-    928: 'ALetter',
-    929: 'ALetter',
-    931: 'ALetter',
-    932: 'ALetter',
-    933: 'ALetter',
-    934: 'ALetter',
-    935: 'ALetter',
-    936: 'ALetter',
-    937: 'ALetter',
-    938: 'ALetter',
-    939: 'ALetter',
-    940: 'ALetter',
-    941: 'ALetter',
-    942: 'ALetter',
-    943: 'ALetter',
-    944: 'ALetter',
-    945: 'ALetter',
-    946: 'ALetter',
-    947: 'ALetter',
-    948: 'ALetter',
-    949: 'ALetter',
-    950: 'ALetter',
-    951: 'ALetter',
-    952: 'ALetter',
-    953: 'ALetter',
-    954: 'ALetter',
-    955: 'ALetter',
-    956: 'ALetter',
-    957: 'ALetter',
-    958: 'ALetter',
-    959: 'ALetter',
-    960: 'ALetter',
-    961: 'ALetter',
-    962: 'ALetter',
-    963: 'ALetter',
-    964: 'ALetter',
-    965: 'ALetter',
-    966: 'ALetter',
-    967: 'ALetter',
-    968: 'ALetter',
-    969: 'ALetter',
-    970: 'ALetter',
-    971: 'ALetter',
-    972: 'ALetter',
-    973: 'ALetter',
-    974: 'ALetter',
-    976: 'ALetter',
-    977: 'ALetter',
-    978: 'ALetter',
-    979: 'ALetter',
-    980: 'ALetter',
-    981: 'ALetter',
-    982: 'ALetter',
-    983: 'ALetter',
-    984: 'ALetter',
-    985: 'ALetter',
-    986: 'ALetter',
-    987: 'ALetter',
-    988: 'ALetter',
-    989: 'ALetter',
-    990: 'ALetter',
-    991: 'ALetter',
-    992: 'ALetter',
-    993: 'ALetter',
-    994: 'ALetter',
-    995: 'ALetter',
-    996: 'ALetter',
-    997: 'ALetter',
-    998: 'ALetter',
-    999: 'ALetter',
-    1000: 'ALetter',
-    1001: 'ALetter',
-    1002: 'ALetter',
-    1003: 'ALetter',
-    1004: 'ALetter',
-    1005: 'ALetter',
-    1006: 'ALetter',
-    1007: 'ALetter',
-    1008: 'ALetter',
-    1009: 'ALetter',
-    1010: 'ALetter',
-    1011: 'ALetter',
-    1012: 'ALetter',
-    1013: 'ALetter',
-    1015: 'ALetter',
-    1016: 'ALetter',
-    1017: 'ALetter',
-    1018: 'ALetter',
-    1019: 'ALetter',
-    1020: 'ALetter',
-    1021: 'ALetter',
-    1022: 'ALetter',
-    1023: 'ALetter',
-    1024: 'ALetter',
-    1025: 'ALetter',
-    1026: 'ALetter',
-    1027: 'ALetter',
-    1028: 'ALetter',
-    1029: 'ALetter',
-    1030: 'ALetter',
-    1031: 'ALetter',
-    1032: 'ALetter',
-    1033: 'ALetter',
-    1034: 'ALetter',
-    1035: 'ALetter',
-    1036: 'ALetter',
-    1037: 'ALetter',
-    1038: 'ALetter',
-    1039: 'ALetter',
-    1040: 'ALetter',
-    1041: 'ALetter',
-    1042: 'ALetter',
-    1043: 'ALetter',
-    1044: 'ALetter',
-    1045: 'ALetter',
-    1046: 'ALetter',
-    1047: 'ALetter',
-    1048: 'ALetter',
-    1049: 'ALetter',
-    1050: 'ALetter',
-    1051: 'ALetter',
-    1052: 'ALetter',
-    1053: 'ALetter',
-    1054: 'ALetter',
-    1055: 'ALetter',
-    1056: 'ALetter',
-    1057: 'ALetter',
-    1058: 'ALetter',
-    1059: 'ALetter',
-    1060: 'ALetter',
-    1061: 'ALetter',
-    1062: 'ALetter',
-    1063: 'ALetter',
-    1064: 'ALetter',
-    1065: 'ALetter',
-    1066: 'ALetter',
-    1067: 'ALetter',
-    1068: 'ALetter',
-    1069: 'ALetter',
-    1070: 'ALetter',
-    1071: 'ALetter',
-    1072: 'ALetter',
-    1073: 'ALetter',
-    1074: 'ALetter',
-    1075: 'ALetter',
-    1076: 'ALetter',
-    1077: 'ALetter',
-    1078: 'ALetter',
-    1079: 'ALetter',
-    1080: 'ALetter',
-    1081: 'ALetter',
-    1082: 'ALetter',
-    1083: 'ALetter',
-    1084: 'ALetter',
-    1085: 'ALetter',
-    1086: 'ALetter',
-    1087: 'ALetter',
-    1088: 'ALetter',
-    1089: 'ALetter',
-    1090: 'ALetter',
-    1091: 'ALetter',
-    1092: 'ALetter',
-    1093: 'ALetter',
-    1094: 'ALetter',
-    1095: 'ALetter',
-    1096: 'ALetter',
-    1097: 'ALetter',
-    1098: 'ALetter',
-    1099: 'ALetter',
-    1100: 'ALetter',
-    1101: 'ALetter',
-    1102: 'ALetter',
-    1103: 'ALetter',
-    1104: 'ALetter',
-    1105: 'ALetter',
-    1106: 'ALetter',
-    1107: 'ALetter',
-    1108: 'ALetter',
-    1109: 'ALetter',
-    1110: 'ALetter',
-    1111: 'ALetter',
-    1112: 'ALetter',
-    1113: 'ALetter',
-    1114: 'ALetter',
-    1115: 'ALetter',
-    1116: 'ALetter',
-    1117: 'ALetter',
-    1118: 'ALetter',
-    1119: 'ALetter',
-    1120: 'ALetter',
-    1121: 'ALetter',
-    1122: 'ALetter',
-    1123: 'ALetter',
-    1124: 'ALetter',
-    1125: 'ALetter',
-    1126: 'ALetter',
-    1127: 'ALetter',
-    1128: 'ALetter',
-    1129: 'ALetter',
-    1130: 'ALetter',
-    1131: 'ALetter',
-    1132: 'ALetter',
-    1133: 'ALetter',
-    1134: 'ALetter',
-    1135: 'ALetter',
-    1136: 'ALetter',
-    1137: 'ALetter',
-    1138: 'ALetter',
-    1139: 'ALetter',
-    1140: 'ALetter',
-    1141: 'ALetter',
-    1142: 'ALetter',
-    1143: 'ALetter',
-    1144: 'ALetter',
-    1145: 'ALetter',
-    1146: 'ALetter',
-    1147: 'ALetter',
-    1148: 'ALetter',
-    1149: 'ALetter',
-    1150: 'ALetter',
-    1151: 'ALetter',
-    1152: 'ALetter',
-    1153: 'ALetter',
-    1162: 'ALetter',
-    1163: 'ALetter',
-    1164: 'ALetter',
-    1165: 'ALetter',
-    1166: 'ALetter',
-    1167: 'ALetter',
-    1168: 'ALetter',
-    1169: 'ALetter',
-    1170: 'ALetter',
-    1171: 'ALetter',
-    1172: 'ALetter',
-    1173: 'ALetter',
-    1174: 'ALetter',
-    1175: 'ALetter',
-    1176: 'ALetter',
-    1177: 'ALetter',
-    1178: 'ALetter',
-    1179: 'ALetter',
-    1180: 'ALetter',
-    1181: 'ALetter',
-    1182: 'ALetter',
-    1183: 'ALetter',
-    1184: 'ALetter',
-    1185: 'ALetter',
-    1186: 'ALetter',
-    1187: 'ALetter',
-    1188: 'ALetter',
-    1189: 'ALetter',
-    1190: 'ALetter',
-    1191: 'ALetter',
-    1192: 'ALetter',
-    1193: 'ALetter',
-    1194: 'ALetter',
-    1195: 'ALetter',
-    1196: 'ALetter',
-    1197: 'ALetter',
-    1198: 'ALetter',
-    1199: 'ALetter',
-    1200: 'ALetter',
-    1201: 'ALetter',
-    1202: 'ALetter',
-    1203: 'ALetter',
-    1204: 'ALetter',
-    1205: 'ALetter',
-    1206: 'ALetter',
-    1207: 'ALetter',
-    1208: 'ALetter',
-    1209: 'ALetter',
-    1210: 'ALetter',
-    1211: 'ALetter',
-    1212: 'ALetter',
-    1213: 'ALetter',
-    1214: 'ALetter',
-    1215: 'ALetter',
-    1216: 'ALetter',
-    1217: 'ALetter',
-    1218: 'ALetter',
-    1219: 'ALetter',
-    1220: 'ALetter',
-    1221: 'ALetter',
-    1222: 'ALetter',
-    1223: 'ALetter',
-    1224: 'ALetter',
-    1225: 'ALetter',
-    1226: 'ALetter',
-    1227: 'ALetter',
-    1228: 'ALetter',
-    1229: 'ALetter',
-    1230: 'ALetter',
-    1231: 'ALetter',
-    1232: 'ALetter',
-    1233: 'ALetter',
-    1234: 'ALetter',
-    1235: 'ALetter',
-    1236: 'ALetter',
-    1237: 'ALetter',
-    1238: 'ALetter',
-    1239: 'ALetter',
-    1240: 'ALetter',
-    1241: 'ALetter',
-    1242: 'ALetter',
-    1243: 'ALetter',
-    1244: 'ALetter',
-    1245: 'ALetter',
-    1246: 'ALetter',
-    1247: 'ALetter',
-    1248: 'ALetter',
-    1249: 'ALetter',
-    1250: 'ALetter',
-    1251: 'ALetter',
-    1252: 'ALetter',
-    1253: 'ALetter',
-    1254: 'ALetter',
-    1255: 'ALetter',
-    1256: 'ALetter',
-    1257: 'ALetter',
-    1258: 'ALetter',
-    1259: 'ALetter',
-    1260: 'ALetter',
-    1261: 'ALetter',
-    1262: 'ALetter',
-    1263: 'ALetter',
-    1264: 'ALetter',
-    1265: 'ALetter',
-    1266: 'ALetter',
-    1267: 'ALetter',
-    1268: 'ALetter',
-    1269: 'ALetter',
-    1270: 'ALetter',
-    1271: 'ALetter',
-    1272: 'ALetter',
-    1273: 'ALetter',
-    1274: 'ALetter',
-    1275: 'ALetter',
-    1276: 'ALetter',
-    1277: 'ALetter',
-    1278: 'ALetter',
-    1279: 'ALetter',
-    1280: 'ALetter',
-    1281: 'ALetter',
-    1282: 'ALetter',
-    1283: 'ALetter',
-    1284: 'ALetter',
-    1285: 'ALetter',
-    1286: 'ALetter',
-    1287: 'ALetter',
-    1288: 'ALetter',
-    1289: 'ALetter',
-    1290: 'ALetter',
-    1291: 'ALetter',
-    1292: 'ALetter',
-    1293: 'ALetter',
-    1294: 'ALetter',
-    1295: 'ALetter',
-    1296: 'ALetter',
-    1297: 'ALetter',
-    1298: 'ALetter',
-    1299: 'ALetter',
-    1329: 'ALetter',
-    1330: 'ALetter',
-    1331: 'ALetter',
-    1332: 'ALetter',
-    1333: 'ALetter',
-    1334: 'ALetter',
-    1335: 'ALetter',
-    1336: 'ALetter',
-    1337: 'ALetter',
-    1338: 'ALetter',
-    1339: 'ALetter',
-    1340: 'ALetter',
-    1341: 'ALetter',
-    1342: 'ALetter',
-    1343: 'ALetter',
-    1344: 'ALetter',
-    1345: 'ALetter',
-    1346: 'ALetter',
-    1347: 'ALetter',
-    1348: 'ALetter',
-    1349: 'ALetter',
-    1350: 'ALetter',
-    1351: 'ALetter',
-    1352: 'ALetter',
-    1353: 'ALetter',
-    1354: 'ALetter',
-    1355: 'ALetter',
-    1356: 'ALetter',
-    1357: 'ALetter',
-    1358: 'ALetter',
-    1359: 'ALetter',
-    1360: 'ALetter',
-    1361: 'ALetter',
-    1362: 'ALetter',
-    1363: 'ALetter',
-    1364: 'ALetter',
-    1365: 'ALetter',
-    1366: 'ALetter',
-    1369: 'ALetter',
-    1377: 'ALetter',
-    1378: 'ALetter',
-    1379: 'ALetter',
-    1380: 'ALetter',
-    1381: 'ALetter',
-    1382: 'ALetter',
-    1383: 'ALetter',
-    1384: 'ALetter',
-    1385: 'ALetter',
-    1386: 'ALetter',
-    1387: 'ALetter',
-    1388: 'ALetter',
-    1389: 'ALetter',
-    1390: 'ALetter',
-    1391: 'ALetter',
-    1392: 'ALetter',
-    1393: 'ALetter',
-    1394: 'ALetter',
-    1395: 'ALetter',
-    1396: 'ALetter',
-    1397: 'ALetter',
-    1398: 'ALetter',
-    1399: 'ALetter',
-    1400: 'ALetter',
-    1401: 'ALetter',
-    1402: 'ALetter',
-    1403: 'ALetter',
-    1404: 'ALetter',
-    1405: 'ALetter',
-    1406: 'ALetter',
-    1407: 'ALetter',
-    1408: 'ALetter',
-    1409: 'ALetter',
-    1410: 'ALetter',
-    1411: 'ALetter',
-    1412: 'ALetter',
-    1413: 'ALetter',
-    1414: 'ALetter',
-    1415: 'ALetter',
-    1417: 'MidNum',
-    1488: 'ALetter',
-    1489: 'ALetter',
-    1490: 'ALetter',
-    1491: 'ALetter',
-    1492: 'ALetter',
-    1493: 'ALetter',
-    1494: 'ALetter',
-    1495: 'ALetter',
-    1496: 'ALetter',
-    1497: 'ALetter',
-    1498: 'ALetter',
-    1499: 'ALetter',
-    1500: 'ALetter',
-    1501: 'ALetter',
-    1502: 'ALetter',
-    1503: 'ALetter',
-    1504: 'ALetter',
-    1505: 'ALetter',
-    1506: 'ALetter',
-    1507: 'ALetter',
-    1508: 'ALetter',
-    1509: 'ALetter',
-    1510: 'ALetter',
-    1511: 'ALetter',
-    1512: 'ALetter',
-    1513: 'ALetter',
-    1514: 'ALetter',
-    1520: 'ALetter',
-    1521: 'ALetter',
-    1522: 'ALetter',
-    1523: 'ALetter',
-    1524: 'MidLetter',
-    1536: 'Format',
-    1537: 'Format',
-    1538: 'Format',
-    1539: 'Format',
-    1549: 'MidNum',
-    1569: 'ALetter',
-    1570: 'ALetter',
-    1571: 'ALetter',
-    1572: 'ALetter',
-    1573: 'ALetter',
-    1574: 'ALetter',
-    1575: 'ALetter',
-    1576: 'ALetter',
-    1577: 'ALetter',
-    1578: 'ALetter',
-    1579: 'ALetter',
-    1580: 'ALetter',
-    1581: 'ALetter',
-    1582: 'ALetter',
-    1583: 'ALetter',
-    1584: 'ALetter',
-    1585: 'ALetter',
-    1586: 'ALetter',
-    1587: 'ALetter',
-    1588: 'ALetter',
-    1589: 'ALetter',
-    1590: 'ALetter',
-    1591: 'ALetter',
-    1592: 'ALetter',
-    1593: 'ALetter',
-    1594: 'ALetter',
-    1600: 'ALetter',
-    1601: 'ALetter',
-    1602: 'ALetter',
-    1603: 'ALetter',
-    1604: 'ALetter',
-    1605: 'ALetter',
-    1606: 'ALetter',
-    1607: 'ALetter',
-    1608: 'ALetter',
-    1609: 'ALetter',
-    1610: 'ALetter',
-    1632: 'Numeric',
-    1633: 'Numeric',
-    1634: 'Numeric',
-    1635: 'Numeric',
-    1636: 'Numeric',
-    1637: 'Numeric',
-    1638: 'Numeric',
-    1639: 'Numeric',
-    1640: 'Numeric',
-    1641: 'Numeric',
-    1643: 'Numeric',
-    1644: 'Numeric',
-    1646: 'ALetter',
-    1647: 'ALetter',
-    1649: 'ALetter',
-    1650: 'ALetter',
-    1651: 'ALetter',
-    1652: 'ALetter',
-    1653: 'ALetter',
-    1654: 'ALetter',
-    1655: 'ALetter',
-    1656: 'ALetter',
-    1657: 'ALetter',
-    1658: 'ALetter',
-    1659: 'ALetter',
-    1660: 'ALetter',
-    1661: 'ALetter',
-    1662: 'ALetter',
-    1663: 'ALetter',
-    1664: 'ALetter',
-    1665: 'ALetter',
-    1666: 'ALetter',
-    1667: 'ALetter',
-    1668: 'ALetter',
-    1669: 'ALetter',
-    1670: 'ALetter',
-    1671: 'ALetter',
-    1672: 'ALetter',
-    1673: 'ALetter',
-    1674: 'ALetter',
-    1675: 'ALetter',
-    1676: 'ALetter',
-    1677: 'ALetter',
-    1678: 'ALetter',
-    1679: 'ALetter',
-    1680: 'ALetter',
-    1681: 'ALetter',
-    1682: 'ALetter',
-    1683: 'ALetter',
-    1684: 'ALetter',
-    1685: 'ALetter',
-    1686: 'ALetter',
-    1687: 'ALetter',
-    1688: 'ALetter',
-    1689: 'ALetter',
-    1690: 'ALetter',
-    1691: 'ALetter',
-    1692: 'ALetter',
-    1693: 'ALetter',
-    1694: 'ALetter',
-    1695: 'ALetter',
-    1696: 'ALetter',
-    1697: 'ALetter',
-    1698: 'ALetter',
-    1699: 'ALetter',
-    1700: 'ALetter',
-    1701: 'ALetter',
-    1702: 'ALetter',
-    1703: 'ALetter',
-    1704: 'ALetter',
-    1705: 'ALetter',
-    1706: 'ALetter',
-    1707: 'ALetter',
-    1708: 'ALetter',
-    1709: 'ALetter',
-    1710: 'ALetter',
-    1711: 'ALetter',
-    1712: 'ALetter',
-    1713: 'ALetter',
-    1714: 'ALetter',
-    1715: 'ALetter',
-    1716: 'ALetter',
-    1717: 'ALetter',
-    1718: 'ALetter',
-    1719: 'ALetter',
-    1720: 'ALetter',
-    1721: 'ALetter',
-    1722: 'ALetter',
-    1723: 'ALetter',
-    1724: 'ALetter',
-    1725: 'ALetter',
-    1726: 'ALetter',
-    1727: 'ALetter',
-    1728: 'ALetter',
-    1729: 'ALetter',
-    1730: 'ALetter',
-    1731: 'ALetter',
-    1732: 'ALetter',
-    1733: 'ALetter',
-    1734: 'ALetter',
-    1735: 'ALetter',
-    1736: 'ALetter',
-    1737: 'ALetter',
-    1738: 'ALetter',
-    1739: 'ALetter',
-    1740: 'ALetter',
-    1741: 'ALetter',
-    1742: 'ALetter',
-    1743: 'ALetter',
-    1744: 'ALetter',
-    1745: 'ALetter',
-    1746: 'ALetter',
-    1747: 'ALetter',
-    1749: 'ALetter',
-    1757: 'Format',
-    1765: 'ALetter',
-    1766: 'ALetter',
-    1774: 'ALetter',
-    1775: 'ALetter',
-    1776: 'Numeric',
-    1777: 'Numeric',
-    1778: 'Numeric',
-    1779: 'Numeric',
-    1780: 'Numeric',
-    1781: 'Numeric',
-    1782: 'Numeric',
-    1783: 'Numeric',
-    1784: 'Numeric',
-    1785: 'Numeric',
-    1786: 'ALetter',
-    1787: 'ALetter',
-    1788: 'ALetter',
-    1791: 'ALetter',
-    1807: 'Format',
-    1808: 'ALetter',
-    1810: 'ALetter',
-    1811: 'ALetter',
-    1812: 'ALetter',
-    1813: 'ALetter',
-    1814: 'ALetter',
-    1815: 'ALetter',
-    1816: 'ALetter',
-    1817: 'ALetter',
-    1818: 'ALetter',
-    1819: 'ALetter',
-    1820: 'ALetter',
-    1821: 'ALetter',
-    1822: 'ALetter',
-    1823: 'ALetter',
-    1824: 'ALetter',
-    1825: 'ALetter',
-    1826: 'ALetter',
-    1827: 'ALetter',
-    1828: 'ALetter',
-    1829: 'ALetter',
-    1830: 'ALetter',
-    1831: 'ALetter',
-    1832: 'ALetter',
-    1833: 'ALetter',
-    1834: 'ALetter',
-    1835: 'ALetter',
-    1836: 'ALetter',
-    1837: 'ALetter',
-    1838: 'ALetter',
-    1839: 'ALetter',
-    1869: 'ALetter',
-    1870: 'ALetter',
-    1871: 'ALetter',
-    1872: 'ALetter',
-    1873: 'ALetter',
-    1874: 'ALetter',
-    1875: 'ALetter',
-    1876: 'ALetter',
-    1877: 'ALetter',
-    1878: 'ALetter',
-    1879: 'ALetter',
-    1880: 'ALetter',
-    1881: 'ALetter',
-    1882: 'ALetter',
-    1883: 'ALetter',
-    1884: 'ALetter',
-    1885: 'ALetter',
-    1886: 'ALetter',
-    1887: 'ALetter',
-    1888: 'ALetter',
-    1889: 'ALetter',
-    1890: 'ALetter',
-    1891: 'ALetter',
-    1892: 'ALetter',
-    1893: 'ALetter',
-    1894: 'ALetter',
-    1895: 'ALetter',
-    1896: 'ALetter',
-    1897: 'ALetter',
-    1898: 'ALetter',
-    1899: 'ALetter',
-    1900: 'ALetter',
-    1901: 'ALetter',
-    1920: 'ALetter',
-    1921: 'ALetter',
-    1922: 'ALetter',
-    1923: 'ALetter',
-    1924: 'ALetter',
-    1925: 'ALetter',
-    1926: 'ALetter',
-    1927: 'ALetter',
-    1928: 'ALetter',
-    1929: 'ALetter',
-    1930: 'ALetter',
-    1931: 'ALetter',
-    1932: 'ALetter',
-    1933: 'ALetter',
-    1934: 'ALetter',
-    1935: 'ALetter',
-    1936: 'ALetter',
-    1937: 'ALetter',
-    1938: 'ALetter',
-    1939: 'ALetter',
-    1940: 'ALetter',
-    1941: 'ALetter',
-    1942: 'ALetter',
-    1943: 'ALetter',
-    1944: 'ALetter',
-    1945: 'ALetter',
-    1946: 'ALetter',
-    1947: 'ALetter',
-    1948: 'ALetter',
-    1949: 'ALetter',
-    1950: 'ALetter',
-    1951: 'ALetter',
-    1952: 'ALetter',
-    1953: 'ALetter',
-    1954: 'ALetter',
-    1955: 'ALetter',
-    1956: 'ALetter',
-    1957: 'ALetter',
-    1969: 'ALetter',
-    1984: 'Numeric',
-    1985: 'Numeric',
-    1986: 'Numeric',
-    1987: 'Numeric',
-    1988: 'Numeric',
-    1989: 'Numeric',
-    1990: 'Numeric',
-    1991: 'Numeric',
-    1992: 'Numeric',
-    1993: 'Numeric',
-    1994: 'ALetter',
-    1995: 'ALetter',
-    1996: 'ALetter',
-    1997: 'ALetter',
-    1998: 'ALetter',
-    1999: 'ALetter',
-    2000: 'ALetter',
-    2001: 'ALetter',
-    2002: 'ALetter',
-    2003: 'ALetter',
-    2004: 'ALetter',
-    2005: 'ALetter',
-    2006: 'ALetter',
-    2007: 'ALetter',
-    2008: 'ALetter',
-    2009: 'ALetter',
-    2010: 'ALetter',
-    2011: 'ALetter',
-    2012: 'ALetter',
-    2013: 'ALetter',
-    2014: 'ALetter',
-    2015: 'ALetter',
-    2016: 'ALetter',
-    2017: 'ALetter',
-    2018: 'ALetter',
-    2019: 'ALetter',
-    2020: 'ALetter',
-    2021: 'ALetter',
-    2022: 'ALetter',
-    2023: 'ALetter',
-    2024: 'ALetter',
-    2025: 'ALetter',
-    2026: 'ALetter',
-    2036: 'ALetter',
-    2037: 'ALetter',
-    2040: 'MidNum',
-    2042: 'ALetter',
-    2307: 'ALetter',
-    2308: 'ALetter',
-    2309: 'ALetter',
-    2310: 'ALetter',
-    2311: 'ALetter',
-    2312: 'ALetter',
-    2313: 'ALetter',
-    2314: 'ALetter',
-    2315: 'ALetter',
-    2316: 'ALetter',
-    2317: 'ALetter',
-    2318: 'ALetter',
-    2319: 'ALetter',
-    2320: 'ALetter',
-    2321: 'ALetter',
-    2322: 'ALetter',
-    2323: 'ALetter',
-    2324: 'ALetter',
-    2325: 'ALetter',
-    2326: 'ALetter',
-    2327: 'ALetter',
-    2328: 'ALetter',
-    2329: 'ALetter',
-    2330: 'ALetter',
-    2331: 'ALetter',
-    2332: 'ALetter',
-    2333: 'ALetter',
-    2334: 'ALetter',
-    2335: 'ALetter',
-    2336: 'ALetter',
-    2337: 'ALetter',
-    2338: 'ALetter',
-    2339: 'ALetter',
-    2340: 'ALetter',
-    2341: 'ALetter',
-    2342: 'ALetter',
-    2343: 'ALetter',
-    2344: 'ALetter',
-    2345: 'ALetter',
-    2346: 'ALetter',
-    2347: 'ALetter',
-    2348: 'ALetter',
-    2349: 'ALetter',
-    2350: 'ALetter',
-    2351: 'ALetter',
-    2352: 'ALetter',
-    2353: 'ALetter',
-    2354: 'ALetter',
-    2355: 'ALetter',
-    2356: 'ALetter',
-    2357: 'ALetter',
-    2358: 'ALetter',
-    2359: 'ALetter',
-    2360: 'ALetter',
-    2361: 'ALetter',
-    2365: 'ALetter',
-    2366: 'ALetter',
-    2367: 'ALetter',
-    2368: 'ALetter',
-    2377: 'ALetter',
-    2378: 'ALetter',
-    2379: 'ALetter',
-    2380: 'ALetter',
-    2384: 'ALetter',
-    2392: 'ALetter',
-    2393: 'ALetter',
-    2394: 'ALetter',
-    2395: 'ALetter',
-    2396: 'ALetter',
-    2397: 'ALetter',
-    2398: 'ALetter',
-    2399: 'ALetter',
-    2400: 'ALetter',
-    2401: 'ALetter',
-    2406: 'Numeric',
-    2407: 'Numeric',
-    2408: 'Numeric',
-    2409: 'Numeric',
-    2410: 'Numeric',
-    2411: 'Numeric',
-    2412: 'Numeric',
-    2413: 'Numeric',
-    2414: 'Numeric',
-    2415: 'Numeric',
-    2427: 'ALetter',
-    2428: 'ALetter',
-    2429: 'ALetter',
-    2430: 'ALetter',
-    2431: 'ALetter',
-    2434: 'ALetter',
-    2435: 'ALetter',
-    2437: 'ALetter',
-    2438: 'ALetter',
-    2439: 'ALetter',
-    2440: 'ALetter',
-    2441: 'ALetter',
-    2442: 'ALetter',
-    2443: 'ALetter',
-    2444: 'ALetter',
-    2447: 'ALetter',
-    2448: 'ALetter',
-    2451: 'ALetter',
-    2452: 'ALetter',
-    2453: 'ALetter',
-    2454: 'ALetter',
-    2455: 'ALetter',
-    2456: 'ALetter',
-    2457: 'ALetter',
-    2458: 'ALetter',
-    2459: 'ALetter',
-    2460: 'ALetter',
-    2461: 'ALetter',
-    2462: 'ALetter',
-    2463: 'ALetter',
-    2464: 'ALetter',
-    2465: 'ALetter',
-    2466: 'ALetter',
-    2467: 'ALetter',
-    2468: 'ALetter',
-    2469: 'ALetter',
-    2470: 'ALetter',
-    2471: 'ALetter',
-    2472: 'ALetter',
-    2474: 'ALetter',
-    2475: 'ALetter',
-    2476: 'ALetter',
-    2477: 'ALetter',
-    2478: 'ALetter',
-    2479: 'ALetter',
-    2480: 'ALetter',
-    2482: 'ALetter',
-    2486: 'ALetter',
-    2487: 'ALetter',
-    2488: 'ALetter',
-    2489: 'ALetter',
-    2493: 'ALetter',
-    2495: 'ALetter',
-    2496: 'ALetter',
-    2503: 'ALetter',
-    2504: 'ALetter',
-    2507: 'ALetter',
-    2508: 'ALetter',
-    2510: 'ALetter',
-    2524: 'ALetter',
-    2525: 'ALetter',
-    2527: 'ALetter',
-    2528: 'ALetter',
-    2529: 'ALetter',
-    2534: 'Numeric',
-    2535: 'Numeric',
-    2536: 'Numeric',
-    2537: 'Numeric',
-    2538: 'Numeric',
-    2539: 'Numeric',
-    2540: 'Numeric',
-    2541: 'Numeric',
-    2542: 'Numeric',
-    2543: 'Numeric',
-    2544: 'ALetter',
-    2545: 'ALetter',
-    2563: 'ALetter',
-    2565: 'ALetter',
-    2566: 'ALetter',
-    2567: 'ALetter',
-    2568: 'ALetter',
-    2569: 'ALetter',
-    2570: 'ALetter',
-    2575: 'ALetter',
-    2576: 'ALetter',
-    2579: 'ALetter',
-    2580: 'ALetter',
-    2581: 'ALetter',
-    2582: 'ALetter',
-    2583: 'ALetter',
-    2584: 'ALetter',
-    2585: 'ALetter',
-    2586: 'ALetter',
-    2587: 'ALetter',
-    2588: 'ALetter',
-    2589: 'ALetter',
-    2590: 'ALetter',
-    2591: 'ALetter',
-    2592: 'ALetter',
-    2593: 'ALetter',
-    2594: 'ALetter',
-    2595: 'ALetter',
-    2596: 'ALetter',
-    2597: 'ALetter',
-    2598: 'ALetter',
-    2599: 'ALetter',
-    2600: 'ALetter',
-    2602: 'ALetter',
-    2603: 'ALetter',
-    2604: 'ALetter',
-    2605: 'ALetter',
-    2606: 'ALetter',
-    2607: 'ALetter',
-    2608: 'ALetter',
-    2610: 'ALetter',
-    2611: 'ALetter',
-    2613: 'ALetter',
-    2614: 'ALetter',
-    2616: 'ALetter',
-    2617: 'ALetter',
-    2622: 'ALetter',
-    2623: 'ALetter',
-    2624: 'ALetter',
-    2649: 'ALetter',
-    2650: 'ALetter',
-    2651: 'ALetter',
-    2652: 'ALetter',
-    2654: 'ALetter',
-    2662: 'Numeric',
-    2663: 'Numeric',
-    2664: 'Numeric',
-    2665: 'Numeric',
-    2666: 'Numeric',
-    2667: 'Numeric',
-    2668: 'Numeric',
-    2669: 'Numeric',
-    2670: 'Numeric',
-    2671: 'Numeric',
-    2674: 'ALetter',
-    2675: 'ALetter',
-    2676: 'ALetter',
-    2691: 'ALetter',
-    2693: 'ALetter',
-    2694: 'ALetter',
-    2695: 'ALetter',
-    2696: 'ALetter',
-    2697: 'ALetter',
-    2698: 'ALetter',
-    2699: 'ALetter',
-    2700: 'ALetter',
-    2701: 'ALetter',
-    2703: 'ALetter',
-    2704: 'ALetter',
-    2705: 'ALetter',
-    2707: 'ALetter',
-    2708: 'ALetter',
-    2709: 'ALetter',
-    2710: 'ALetter',
-    2711: 'ALetter',
-    2712: 'ALetter',
-    2713: 'ALetter',
-    2714: 'ALetter',
-    2715: 'ALetter',
-    2716: 'ALetter',
-    2717: 'ALetter',
-    2718: 'ALetter',
-    2719: 'ALetter',
-    2720: 'ALetter',
-    2721: 'ALetter',
-    2722: 'ALetter',
-    2723: 'ALetter',
-    2724: 'ALetter',
-    2725: 'ALetter',
-    2726: 'ALetter',
-    2727: 'ALetter',
-    2728: 'ALetter',
-    2730: 'ALetter',
-    2731: 'ALetter',
-    2732: 'ALetter',
-    2733: 'ALetter',
-    2734: 'ALetter',
-    2735: 'ALetter',
-    2736: 'ALetter',
-    2738: 'ALetter',
-    2739: 'ALetter',
-    2741: 'ALetter',
-    2742: 'ALetter',
-    2743: 'ALetter',
-    2744: 'ALetter',
-    2745: 'ALetter',
-    2749: 'ALetter',
-    2750: 'ALetter',
-    2751: 'ALetter',
-    2752: 'ALetter',
-    2761: 'ALetter',
-    2763: 'ALetter',
-    2764: 'ALetter',
-    2768: 'ALetter',
-    2784: 'ALetter',
-    2785: 'ALetter',
-    2790: 'Numeric',
-    2791: 'Numeric',
-    2792: 'Numeric',
-    2793: 'Numeric',
-    2794: 'Numeric',
-    2795: 'Numeric',
-    2796: 'Numeric',
-    2797: 'Numeric',
-    2798: 'Numeric',
-    2799: 'Numeric',
-    2818: 'ALetter',
-    2819: 'ALetter',
-    2821: 'ALetter',
-    2822: 'ALetter',
-    2823: 'ALetter',
-    2824: 'ALetter',
-    2825: 'ALetter',
-    2826: 'ALetter',
-    2827: 'ALetter',
-    2828: 'ALetter',
-    2831: 'ALetter',
-    2832: 'ALetter',
-    2835: 'ALetter',
-    2836: 'ALetter',
-    2837: 'ALetter',
-    2838: 'ALetter',
-    2839: 'ALetter',
-    2840: 'ALetter',
-    2841: 'ALetter',
-    2842: 'ALetter',
-    2843: 'ALetter',
-    2844: 'ALetter',
-    2845: 'ALetter',
-    2846: 'ALetter',
-    2847: 'ALetter',
-    2848: 'ALetter',
-    2849: 'ALetter',
-    2850: 'ALetter',
-    2851: 'ALetter',
-    2852: 'ALetter',
-    2853: 'ALetter',
-    2854: 'ALetter',
-    2855: 'ALetter',
-    2856: 'ALetter',
-    2858: 'ALetter',
-    2859: 'ALetter',
-    2860: 'ALetter',
-    2861: 'ALetter',
-    2862: 'ALetter',
-    2863: 'ALetter',
-    2864: 'ALetter',
-    2866: 'ALetter',
-    2867: 'ALetter',
-    2869: 'ALetter',
-    2870: 'ALetter',
-    2871: 'ALetter',
-    2872: 'ALetter',
-    2873: 'ALetter',
-    2877: 'ALetter',
-    2880: 'ALetter',
-    2887: 'ALetter',
-    2888: 'ALetter',
-    2891: 'ALetter',
-    2892: 'ALetter',
-    2908: 'ALetter',
-    2909: 'ALetter',
-    2911: 'ALetter',
-    2912: 'ALetter',
-    2913: 'ALetter',
-    2918: 'Numeric',
-    2919: 'Numeric',
-    2920: 'Numeric',
-    2921: 'Numeric',
-    2922: 'Numeric',
-    2923: 'Numeric',
-    2924: 'Numeric',
-    2925: 'Numeric',
-    2926: 'Numeric',
-    2927: 'Numeric',
-    2929: 'ALetter',
-    2947: 'ALetter',
-    2949: 'ALetter',
-    2950: 'ALetter',
-    2951: 'ALetter',
-    2952: 'ALetter',
-    2953: 'ALetter',
-    2954: 'ALetter',
-    2958: 'ALetter',
-    2959: 'ALetter',
-    2960: 'ALetter',
-    2962: 'ALetter',
-    2963: 'ALetter',
-    2964: 'ALetter',
-    2965: 'ALetter',
-    2969: 'ALetter',
-    2970: 'ALetter',
-    2972: 'ALetter',
-    2974: 'ALetter',
-    2975: 'ALetter',
-    2979: 'ALetter',
-    2980: 'ALetter',
-    2984: 'ALetter',
-    2985: 'ALetter',
-    2986: 'ALetter',
-    2990: 'ALetter',
-    2991: 'ALetter',
-    2992: 'ALetter',
-    2993: 'ALetter',
-    2994: 'ALetter',
-    2995: 'ALetter',
-    2996: 'ALetter',
-    2997: 'ALetter',
-    2998: 'ALetter',
-    2999: 'ALetter',
-    3000: 'ALetter',
-    3001: 'ALetter',
-    3007: 'ALetter',
-    3009: 'ALetter',
-    3010: 'ALetter',
-    3014: 'ALetter',
-    3015: 'ALetter',
-    3016: 'ALetter',
-    3018: 'ALetter',
-    3019: 'ALetter',
-    3020: 'ALetter',
-    3046: 'Numeric',
-    3047: 'Numeric',
-    3048: 'Numeric',
-    3049: 'Numeric',
-    3050: 'Numeric',
-    3051: 'Numeric',
-    3052: 'Numeric',
-    3053: 'Numeric',
-    3054: 'Numeric',
-    3055: 'Numeric',
-    3073: 'ALetter',
-    3074: 'ALetter',
-    3075: 'ALetter',
-    3077: 'ALetter',
-    3078: 'ALetter',
-    3079: 'ALetter',
-    3080: 'ALetter',
-    3081: 'ALetter',
-    3082: 'ALetter',
-    3083: 'ALetter',
-    3084: 'ALetter',
-    3086: 'ALetter',
-    3087: 'ALetter',
-    3088: 'ALetter',
-    3090: 'ALetter',
-    3091: 'ALetter',
-    3092: 'ALetter',
-    3093: 'ALetter',
-    3094: 'ALetter',
-    3095: 'ALetter',
-    3096: 'ALetter',
-    3097: 'ALetter',
-    3098: 'ALetter',
-    3099: 'ALetter',
-    3100: 'ALetter',
-    3101: 'ALetter',
-    3102: 'ALetter',
-    3103: 'ALetter',
-    3104: 'ALetter',
-    3105: 'ALetter',
-    3106: 'ALetter',
-    3107: 'ALetter',
-    3108: 'ALetter',
-    3109: 'ALetter',
-    3110: 'ALetter',
-    3111: 'ALetter',
-    3112: 'ALetter',
-    3114: 'ALetter',
-    3115: 'ALetter',
-    3116: 'ALetter',
-    3117: 'ALetter',
-    3118: 'ALetter',
-    3119: 'ALetter',
-    3120: 'ALetter',
-    3121: 'ALetter',
-    3122: 'ALetter',
-    3123: 'ALetter',
-    3125: 'ALetter',
-    3126: 'ALetter',
-    3127: 'ALetter',
-    3128: 'ALetter',
-    3129: 'ALetter',
-    3137: 'ALetter',
-    3138: 'ALetter',
-    3139: 'ALetter',
-    3140: 'ALetter',
-    3168: 'ALetter',
-    3169: 'ALetter',
-    3174: 'Numeric',
-    3175: 'Numeric',
-    3176: 'Numeric',
-    3177: 'Numeric',
-    3178: 'Numeric',
-    3179: 'Numeric',
-    3180: 'Numeric',
-    3181: 'Numeric',
-    3182: 'Numeric',
-    3183: 'Numeric',
-    3202: 'ALetter',
-    3203: 'ALetter',
-    3205: 'ALetter',
-    3206: 'ALetter',
-    3207: 'ALetter',
-    3208: 'ALetter',
-    3209: 'ALetter',
-    3210: 'ALetter',
-    3211: 'ALetter',
-    3212: 'ALetter',
-    3214: 'ALetter',
-    3215: 'ALetter',
-    3216: 'ALetter',
-    3218: 'ALetter',
-    3219: 'ALetter',
-    3220: 'ALetter',
-    3221: 'ALetter',
-    3222: 'ALetter',
-    3223: 'ALetter',
-    3224: 'ALetter',
-    3225: 'ALetter',
-    3226: 'ALetter',
-    3227: 'ALetter',
-    3228: 'ALetter',
-    3229: 'ALetter',
-    3230: 'ALetter',
-    3231: 'ALetter',
-    3232: 'ALetter',
-    3233: 'ALetter',
-    3234: 'ALetter',
-    3235: 'ALetter',
-    3236: 'ALetter',
-    3237: 'ALetter',
-    3238: 'ALetter',
-    3239: 'ALetter',
-    3240: 'ALetter',
-    3242: 'ALetter',
-    3243: 'ALetter',
-    3244: 'ALetter',
-    3245: 'ALetter',
-    3246: 'ALetter',
-    3247: 'ALetter',
-    3248: 'ALetter',
-    3249: 'ALetter',
-    3250: 'ALetter',
-    3251: 'ALetter',
-    3253: 'ALetter',
-    3254: 'ALetter',
-    3255: 'ALetter',
-    3256: 'ALetter',
-    3257: 'ALetter',
-    3261: 'ALetter',
-    3262: 'ALetter',
-    3264: 'ALetter',
-    3265: 'ALetter',
-    3267: 'ALetter',
-    3268: 'ALetter',
-    3271: 'ALetter',
-    3272: 'ALetter',
-    3274: 'ALetter',
-    3275: 'ALetter',
-    3294: 'ALetter',
-    3296: 'ALetter',
-    3297: 'ALetter',
-    3302: 'Numeric',
-    3303: 'Numeric',
-    3304: 'Numeric',
-    3305: 'Numeric',
-    3306: 'Numeric',
-    3307: 'Numeric',
-    3308: 'Numeric',
-    3309: 'Numeric',
-    3310: 'Numeric',
-    3311: 'Numeric',
-    3330: 'ALetter',
-    3331: 'ALetter',
-    3333: 'ALetter',
-    3334: 'ALetter',
-    3335: 'ALetter',
-    3336: 'ALetter',
-    3337: 'ALetter',
-    3338: 'ALetter',
-    3339: 'ALetter',
-    3340: 'ALetter',
-    3342: 'ALetter',
-    3343: 'ALetter',
-    3344: 'ALetter',
-    3346: 'ALetter',
-    3347: 'ALetter',
-    3348: 'ALetter',
-    3349: 'ALetter',
-    3350: 'ALetter',
-    3351: 'ALetter',
-    3352: 'ALetter',
-    3353: 'ALetter',
-    3354: 'ALetter',
-    3355: 'ALetter',
-    3356: 'ALetter',
-    3357: 'ALetter',
-    3358: 'ALetter',
-    3359: 'ALetter',
-    3360: 'ALetter',
-    3361: 'ALetter',
-    3362: 'ALetter',
-    3363: 'ALetter',
-    3364: 'ALetter',
-    3365: 'ALetter',
-    3366: 'ALetter',
-    3367: 'ALetter',
-    3368: 'ALetter',
-    3370: 'ALetter',
-    3371: 'ALetter',
-    3372: 'ALetter',
-    3373: 'ALetter',
-    3374: 'ALetter',
-    3375: 'ALetter',
-    3376: 'ALetter',
-    3377: 'ALetter',
-    3378: 'ALetter',
-    3379: 'ALetter',
-    3380: 'ALetter',
-    3381: 'ALetter',
-    3382: 'ALetter',
-    3383: 'ALetter',
-    3384: 'ALetter',
-    3385: 'ALetter',
-    3391: 'ALetter',
-    3392: 'ALetter',
-    3398: 'ALetter',
-    3399: 'ALetter',
-    3400: 'ALetter',
-    3402: 'ALetter',
-    3403: 'ALetter',
-    3404: 'ALetter',
-    3424: 'ALetter',
-    3425: 'ALetter',
-    3430: 'Numeric',
-    3431: 'Numeric',
-    3432: 'Numeric',
-    3433: 'Numeric',
-    3434: 'Numeric',
-    3435: 'Numeric',
-    3436: 'Numeric',
-    3437: 'Numeric',
-    3438: 'Numeric',
-    3439: 'Numeric',
-    3458: 'ALetter',
-    3459: 'ALetter',
-    3461: 'ALetter',
-    3462: 'ALetter',
-    3463: 'ALetter',
-    3464: 'ALetter',
-    3465: 'ALetter',
-    3466: 'ALetter',
-    3467: 'ALetter',
-    3468: 'ALetter',
-    3469: 'ALetter',
-    3470: 'ALetter',
-    3471: 'ALetter',
-    3472: 'ALetter',
-    3473: 'ALetter',
-    3474: 'ALetter',
-    3475: 'ALetter',
-    3476: 'ALetter',
-    3477: 'ALetter',
-    3478: 'ALetter',
-    3482: 'ALetter',
-    3483: 'ALetter',
-    3484: 'ALetter',
-    3485: 'ALetter',
-    3486: 'ALetter',
-    3487: 'ALetter',
-    3488: 'ALetter',
-    3489: 'ALetter',
-    3490: 'ALetter',
-    3491: 'ALetter',
-    3492: 'ALetter',
-    3493: 'ALetter',
-    3494: 'ALetter',
-    3495: 'ALetter',
-    3496: 'ALetter',
-    3497: 'ALetter',
-    3498: 'ALetter',
-    3499: 'ALetter',
-    3500: 'ALetter',
-    3501: 'ALetter',
-    3502: 'ALetter',
-    3503: 'ALetter',
-    3504: 'ALetter',
-    3505: 'ALetter',
-    3507: 'ALetter',
-    3508: 'ALetter',
-    3509: 'ALetter',
-    3510: 'ALetter',
-    3511: 'ALetter',
-    3512: 'ALetter',
-    3513: 'ALetter',
-    3514: 'ALetter',
-    3515: 'ALetter',
-    3517: 'ALetter',
-    3520: 'ALetter',
-    3521: 'ALetter',
-    3522: 'ALetter',
-    3523: 'ALetter',
-    3524: 'ALetter',
-    3525: 'ALetter',
-    3526: 'ALetter',
-    3536: 'ALetter',
-    3537: 'ALetter',
-    3544: 'ALetter',
-    3545: 'ALetter',
-    3546: 'ALetter',
-    3547: 'ALetter',
-    3548: 'ALetter',
-    3549: 'ALetter',
-    3550: 'ALetter',
-    3570: 'ALetter',
-    3571: 'ALetter',
-    3664: 'Numeric',
-    3665: 'Numeric',
-    3666: 'Numeric',
-    3667: 'Numeric',
-    3668: 'Numeric',
-    3669: 'Numeric',
-    3670: 'Numeric',
-    3671: 'Numeric',
-    3672: 'Numeric',
-    3673: 'Numeric',
-    3792: 'Numeric',
-    3793: 'Numeric',
-    3794: 'Numeric',
-    3795: 'Numeric',
-    3796: 'Numeric',
-    3797: 'Numeric',
-    3798: 'Numeric',
-    3799: 'Numeric',
-    3800: 'Numeric',
-    3801: 'Numeric',
-    3840: 'ALetter',
-    3872: 'Numeric',
-    3873: 'Numeric',
-    3874: 'Numeric',
-    3875: 'Numeric',
-    3876: 'Numeric',
-    3877: 'Numeric',
-    3878: 'Numeric',
-    3879: 'Numeric',
-    3880: 'Numeric',
-    3881: 'Numeric',
-    3904: 'ALetter',
-    3905: 'ALetter',
-    3906: 'ALetter',
-    3907: 'ALetter',
-    3908: 'ALetter',
-    3909: 'ALetter',
-    3910: 'ALetter',
-    3911: 'ALetter',
-    3913: 'ALetter',
-    3914: 'ALetter',
-    3915: 'ALetter',
-    3916: 'ALetter',
-    3917: 'ALetter',
-    3918: 'ALetter',
-    3919: 'ALetter',
-    3920: 'ALetter',
-    3921: 'ALetter',
-    3922: 'ALetter',
-    3923: 'ALetter',
-    3924: 'ALetter',
-    3925: 'ALetter',
-    3926: 'ALetter',
-    3927: 'ALetter',
-    3928: 'ALetter',
-    3929: 'ALetter',
-    3930: 'ALetter',
-    3931: 'ALetter',
-    3932: 'ALetter',
-    3933: 'ALetter',
-    3934: 'ALetter',
-    3935: 'ALetter',
-    3936: 'ALetter',
-    3937: 'ALetter',
-    3938: 'ALetter',
-    3939: 'ALetter',
-    3940: 'ALetter',
-    3941: 'ALetter',
-    3942: 'ALetter',
-    3943: 'ALetter',
-    3944: 'ALetter',
-    3945: 'ALetter',
-    3946: 'ALetter',
-    3967: 'ALetter',
-    3976: 'ALetter',
-    3977: 'ALetter',
-    3978: 'ALetter',
-    3979: 'ALetter',
-    4160: 'Numeric',
-    4161: 'Numeric',
-    4162: 'Numeric',
-    4163: 'Numeric',
-    4164: 'Numeric',
-    4165: 'Numeric',
-    4166: 'Numeric',
-    4167: 'Numeric',
-    4168: 'Numeric',
-    4169: 'Numeric',
-    4256: 'ALetter',
-    4257: 'ALetter',
-    4258: 'ALetter',
-    4259: 'ALetter',
-    4260: 'ALetter',
-    4261: 'ALetter',
-    4262: 'ALetter',
-    4263: 'ALetter',
-    4264: 'ALetter',
-    4265: 'ALetter',
-    4266: 'ALetter',
-    4267: 'ALetter',
-    4268: 'ALetter',
-    4269: 'ALetter',
-    4270: 'ALetter',
-    4271: 'ALetter',
-    4272: 'ALetter',
-    4273: 'ALetter',
-    4274: 'ALetter',
-    4275: 'ALetter',
-    4276: 'ALetter',
-    4277: 'ALetter',
-    4278: 'ALetter',
-    4279: 'ALetter',
-    4280: 'ALetter',
-    4281: 'ALetter',
-    4282: 'ALetter',
-    4283: 'ALetter',
-    4284: 'ALetter',
-    4285: 'ALetter',
-    4286: 'ALetter',
-    4287: 'ALetter',
-    4288: 'ALetter',
-    4289: 'ALetter',
-    4290: 'ALetter',
-    4291: 'ALetter',
-    4292: 'ALetter',
-    4293: 'ALetter',
-    4304: 'ALetter',
-    4305: 'ALetter',
-    4306: 'ALetter',
-    4307: 'ALetter',
-    4308: 'ALetter',
-    4309: 'ALetter',
-    4310: 'ALetter',
-    4311: 'ALetter',
-    4312: 'ALetter',
-    4313: 'ALetter',
-    4314: 'ALetter',
-    4315: 'ALetter',
-    4316: 'ALetter',
-    4317: 'ALetter',
-    4318: 'ALetter',
-    4319: 'ALetter',
-    4320: 'ALetter',
-    4321: 'ALetter',
-    4322: 'ALetter',
-    4323: 'ALetter',
-    4324: 'ALetter',
-    4325: 'ALetter',
-    4326: 'ALetter',
-    4327: 'ALetter',
-    4328: 'ALetter',
-    4329: 'ALetter',
-    4330: 'ALetter',
-    4331: 'ALetter',
-    4332: 'ALetter',
-    4333: 'ALetter',
-    4334: 'ALetter',
-    4335: 'ALetter',
-    4336: 'ALetter',
-    4337: 'ALetter',
-    4338: 'ALetter',
-    4339: 'ALetter',
-    4340: 'ALetter',
-    4341: 'ALetter',
-    4342: 'ALetter',
-    4343: 'ALetter',
-    4344: 'ALetter',
-    4345: 'ALetter',
-    4346: 'ALetter',
-    4348: 'ALetter',
-    4352: 'ALetter',
-    4353: 'ALetter',
-    4354: 'ALetter',
-    4355: 'ALetter',
-    4356: 'ALetter',
-    4357: 'ALetter',
-    4358: 'ALetter',
-    4359: 'ALetter',
-    4360: 'ALetter',
-    4361: 'ALetter',
-    4362: 'ALetter',
-    4363: 'ALetter',
-    4364: 'ALetter',
-    4365: 'ALetter',
-    4366: 'ALetter',
-    4367: 'ALetter',
-    4368: 'ALetter',
-    4369: 'ALetter',
-    4370: 'ALetter',
-    4371: 'ALetter',
-    4372: 'ALetter',
-    4373: 'ALetter',
-    4374: 'ALetter',
-    4375: 'ALetter',
-    4376: 'ALetter',
-    4377: 'ALetter',
-    4378: 'ALetter',
-    4379: 'ALetter',
-    4380: 'ALetter',
-    4381: 'ALetter',
-    4382: 'ALetter',
-    4383: 'ALetter',
-    4384: 'ALetter',
-    4385: 'ALetter',
-    4386: 'ALetter',
-    4387: 'ALetter',
-    4388: 'ALetter',
-    4389: 'ALetter',
-    4390: 'ALetter',
-    4391: 'ALetter',
-    4392: 'ALetter',
-    4393: 'ALetter',
-    4394: 'ALetter',
-    4395: 'ALetter',
-    4396: 'ALetter',
-    4397: 'ALetter',
-    4398: 'ALetter',
-    4399: 'ALetter',
-    4400: 'ALetter',
-    4401: 'ALetter',
-    4402: 'ALetter',
-    4403: 'ALetter',
-    4404: 'ALetter',
-    4405: 'ALetter',
-    4406: 'ALetter',
-    4407: 'ALetter',
-    4408: 'ALetter',
-    4409: 'ALetter',
-    4410: 'ALetter',
-    4411: 'ALetter',
-    4412: 'ALetter',
-    4413: 'ALetter',
-    4414: 'ALetter',
-    4415: 'ALetter',
-    4416: 'ALetter',
-    4417: 'ALetter',
-    4418: 'ALetter',
-    4419: 'ALetter',
-    4420: 'ALetter',
-    4421: 'ALetter',
-    4422: 'ALetter',
-    4423: 'ALetter',
-    4424: 'ALetter',
-    4425: 'ALetter',
-    4426: 'ALetter',
-    4427: 'ALetter',
-    4428: 'ALetter',
-    4429: 'ALetter',
-    4430: 'ALetter',
-    4431: 'ALetter',
-    4432: 'ALetter',
-    4433: 'ALetter',
-    4434: 'ALetter',
-    4435: 'ALetter',
-    4436: 'ALetter',
-    4437: 'ALetter',
-    4438: 'ALetter',
-    4439: 'ALetter',
-    4440: 'ALetter',
-    4441: 'ALetter',
-    4447: 'ALetter',
-    4448: 'ALetter',
-    4449: 'ALetter',
-    4450: 'ALetter',
-    4451: 'ALetter',
-    4452: 'ALetter',
-    4453: 'ALetter',
-    4454: 'ALetter',
-    4455: 'ALetter',
-    4456: 'ALetter',
-    4457: 'ALetter',
-    4458: 'ALetter',
-    4459: 'ALetter',
-    4460: 'ALetter',
-    4461: 'ALetter',
-    4462: 'ALetter',
-    4463: 'ALetter',
-    4464: 'ALetter',
-    4465: 'ALetter',
-    4466: 'ALetter',
-    4467: 'ALetter',
-    4468: 'ALetter',
-    4469: 'ALetter',
-    4470: 'ALetter',
-    4471: 'ALetter',
-    4472: 'ALetter',
-    4473: 'ALetter',
-    4474: 'ALetter',
-    4475: 'ALetter',
-    4476: 'ALetter',
-    4477: 'ALetter',
-    4478: 'ALetter',
-    4479: 'ALetter',
-    4480: 'ALetter',
-    4481: 'ALetter',
-    4482: 'ALetter',
-    4483: 'ALetter',
-    4484: 'ALetter',
-    4485: 'ALetter',
-    4486: 'ALetter',
-    4487: 'ALetter',
-    4488: 'ALetter',
-    4489: 'ALetter',
-    4490: 'ALetter',
-    4491: 'ALetter',
-    4492: 'ALetter',
-    4493: 'ALetter',
-    4494: 'ALetter',
-    4495: 'ALetter',
-    4496: 'ALetter',
-    4497: 'ALetter',
-    4498: 'ALetter',
-    4499: 'ALetter',
-    4500: 'ALetter',
-    4501: 'ALetter',
-    4502: 'ALetter',
-    4503: 'ALetter',
-    4504: 'ALetter',
-    4505: 'ALetter',
-    4506: 'ALetter',
-    4507: 'ALetter',
-    4508: 'ALetter',
-    4509: 'ALetter',
-    4510: 'ALetter',
-    4511: 'ALetter',
-    4512: 'ALetter',
-    4513: 'ALetter',
-    4514: 'ALetter',
-    4520: 'ALetter',
-    4521: 'ALetter',
-    4522: 'ALetter',
-    4523: 'ALetter',
-    4524: 'ALetter',
-    4525: 'ALetter',
-    4526: 'ALetter',
-    4527: 'ALetter',
-    4528: 'ALetter',
-    4529: 'ALetter',
-    4530: 'ALetter',
-    4531: 'ALetter',
-    4532: 'ALetter',
-    4533: 'ALetter',
-    4534: 'ALetter',
-    4535: 'ALetter',
-    4536: 'ALetter',
-    4537: 'ALetter',
-    4538: 'ALetter',
-    4539: 'ALetter',
-    4540: 'ALetter',
-    4541: 'ALetter',
-    4542: 'ALetter',
-    4543: 'ALetter',
-    4544: 'ALetter',
-    4545: 'ALetter',
-    4546: 'ALetter',
-    4547: 'ALetter',
-    4548: 'ALetter',
-    4549: 'ALetter',
-    4550: 'ALetter',
-    4551: 'ALetter',
-    4552: 'ALetter',
-    4553: 'ALetter',
-    4554: 'ALetter',
-    4555: 'ALetter',
-    4556: 'ALetter',
-    4557: 'ALetter',
-    4558: 'ALetter',
-    4559: 'ALetter',
-    4560: 'ALetter',
-    4561: 'ALetter',
-    4562: 'ALetter',
-    4563: 'ALetter',
-    4564: 'ALetter',
-    4565: 'ALetter',
-    4566: 'ALetter',
-    4567: 'ALetter',
-    4568: 'ALetter',
-    4569: 'ALetter',
-    4570: 'ALetter',
-    4571: 'ALetter',
-    4572: 'ALetter',
-    4573: 'ALetter',
-    4574: 'ALetter',
-    4575: 'ALetter',
-    4576: 'ALetter',
-    4577: 'ALetter',
-    4578: 'ALetter',
-    4579: 'ALetter',
-    4580: 'ALetter',
-    4581: 'ALetter',
-    4582: 'ALetter',
-    4583: 'ALetter',
-    4584: 'ALetter',
-    4585: 'ALetter',
-    4586: 'ALetter',
-    4587: 'ALetter',
-    4588: 'ALetter',
-    4589: 'ALetter',
-    4590: 'ALetter',
-    4591: 'ALetter',
-    4592: 'ALetter',
-    4593: 'ALetter',
-    4594: 'ALetter',
-    4595: 'ALetter',
-    4596: 'ALetter',
-    4597: 'ALetter',
-    4598: 'ALetter',
-    4599: 'ALetter',
-    4600: 'ALetter',
-    4601: 'ALetter',
-    4608: 'ALetter',
-    4609: 'ALetter',
-    4610: 'ALetter',
-    4611: 'ALetter',
-    4612: 'ALetter',
-    4613: 'ALetter',
-    4614: 'ALetter',
-    4615: 'ALetter',
-    4616: 'ALetter',
-    4617: 'ALetter',
-    4618: 'ALetter',
-    4619: 'ALetter',
-    4620: 'ALetter',
-    4621: 'ALetter',
-    4622: 'ALetter',
-    4623: 'ALetter',
-    4624: 'ALetter',
-    4625: 'ALetter',
-    4626: 'ALetter',
-    4627: 'ALetter',
-    4628: 'ALetter',
-    4629: 'ALetter',
-    4630: 'ALetter',
-    4631: 'ALetter',
-    4632: 'ALetter',
-    4633: 'ALetter',
-    4634: 'ALetter',
-    4635: 'ALetter',
-    4636: 'ALetter',
-    4637: 'ALetter',
-    4638: 'ALetter',
-    4639: 'ALetter',
-    4640: 'ALetter',
-    4641: 'ALetter',
-    4642: 'ALetter',
-    4643: 'ALetter',
-    4644: 'ALetter',
-    4645: 'ALetter',
-    4646: 'ALetter',
-    4647: 'ALetter',
-    4648: 'ALetter',
-    4649: 'ALetter',
-    4650: 'ALetter',
-    4651: 'ALetter',
-    4652: 'ALetter',
-    4653: 'ALetter',
-    4654: 'ALetter',
-    4655: 'ALetter',
-    4656: 'ALetter',
-    4657: 'ALetter',
-    4658: 'ALetter',
-    4659: 'ALetter',
-    4660: 'ALetter',
-    4661: 'ALetter',
-    4662: 'ALetter',
-    4663: 'ALetter',
-    4664: 'ALetter',
-    4665: 'ALetter',
-    4666: 'ALetter',
-    4667: 'ALetter',
-    4668: 'ALetter',
-    4669: 'ALetter',
-    4670: 'ALetter',
-    4671: 'ALetter',
-    4672: 'ALetter',
-    4673: 'ALetter',
-    4674: 'ALetter',
-    4675: 'ALetter',
-    4676: 'ALetter',
-    4677: 'ALetter',
-    4678: 'ALetter',
-    4679: 'ALetter',
-    4680: 'ALetter',
-    4682: 'ALetter',
-    4683: 'ALetter',
-    4684: 'ALetter',
-    4685: 'ALetter',
-    4688: 'ALetter',
-    4689: 'ALetter',
-    4690: 'ALetter',
-    4691: 'ALetter',
-    4692: 'ALetter',
-    4693: 'ALetter',
-    4694: 'ALetter',
-    4696: 'ALetter',
-    4698: 'ALetter',
-    4699: 'ALetter',
-    4700: 'ALetter',
-    4701: 'ALetter',
-    4704: 'ALetter',
-    4705: 'ALetter',
-    4706: 'ALetter',
-    4707: 'ALetter',
-    4708: 'ALetter',
-    4709: 'ALetter',
-    4710: 'ALetter',
-    4711: 'ALetter',
-    4712: 'ALetter',
-    4713: 'ALetter',
-    4714: 'ALetter',
-    4715: 'ALetter',
-    4716: 'ALetter',
-    4717: 'ALetter',
-    4718: 'ALetter',
-    4719: 'ALetter',
-    4720: 'ALetter',
-    4721: 'ALetter',
-    4722: 'ALetter',
-    4723: 'ALetter',
-    4724: 'ALetter',
-    4725: 'ALetter',
-    4726: 'ALetter',
-    4727: 'ALetter',
-    4728: 'ALetter',
-    4729: 'ALetter',
-    4730: 'ALetter',
-    4731: 'ALetter',
-    4732: 'ALetter',
-    4733: 'ALetter',
-    4734: 'ALetter',
-    4735: 'ALetter',
-    4736: 'ALetter',
-    4737: 'ALetter',
-    4738: 'ALetter',
-    4739: 'ALetter',
-    4740: 'ALetter',
-    4741: 'ALetter',
-    4742: 'ALetter',
-    4743: 'ALetter',
-    4744: 'ALetter',
-    4746: 'ALetter',
-    4747: 'ALetter',
-    4748: 'ALetter',
-    4749: 'ALetter',
-    4752: 'ALetter',
-    4753: 'ALetter',
-    4754: 'ALetter',
-    4755: 'ALetter',
-    4756: 'ALetter',
-    4757: 'ALetter',
-    4758: 'ALetter',
-    4759: 'ALetter',
-    4760: 'ALetter',
-    4761: 'ALetter',
-    4762: 'ALetter',
-    4763: 'ALetter',
-    4764: 'ALetter',
-    4765: 'ALetter',
-    4766: 'ALetter',
-    4767: 'ALetter',
-    4768: 'ALetter',
-    4769: 'ALetter',
-    4770: 'ALetter',
-    4771: 'ALetter',
-    4772: 'ALetter',
-    4773: 'ALetter',
-    4774: 'ALetter',
-    4775: 'ALetter',
-    4776: 'ALetter',
-    4777: 'ALetter',
-    4778: 'ALetter',
-    4779: 'ALetter',
-    4780: 'ALetter',
-    4781: 'ALetter',
-    4782: 'ALetter',
-    4783: 'ALetter',
-    4784: 'ALetter',
-    4786: 'ALetter',
-    4787: 'ALetter',
-    4788: 'ALetter',
-    4789: 'ALetter',
-    4792: 'ALetter',
-    4793: 'ALetter',
-    4794: 'ALetter',
-    4795: 'ALetter',
-    4796: 'ALetter',
-    4797: 'ALetter',
-    4798: 'ALetter',
-    4800: 'ALetter',
-    4802: 'ALetter',
-    4803: 'ALetter',
-    4804: 'ALetter',
-    4805: 'ALetter',
-    4808: 'ALetter',
-    4809: 'ALetter',
-    4810: 'ALetter',
-    4811: 'ALetter',
-    4812: 'ALetter',
-    4813: 'ALetter',
-    4814: 'ALetter',
-    4815: 'ALetter',
-    4816: 'ALetter',
-    4817: 'ALetter',
-    4818: 'ALetter',
-    4819: 'ALetter',
-    4820: 'ALetter',
-    4821: 'ALetter',
-    4822: 'ALetter',
-    4824: 'ALetter',
-    4825: 'ALetter',
-    4826: 'ALetter',
-    4827: 'ALetter',
-    4828: 'ALetter',
-    4829: 'ALetter',
-    4830: 'ALetter',
-    4831: 'ALetter',
-    4832: 'ALetter',
-    4833: 'ALetter',
-    4834: 'ALetter',
-    4835: 'ALetter',
-    4836: 'ALetter',
-    4837: 'ALetter',
-    4838: 'ALetter',
-    4839: 'ALetter',
-    4840: 'ALetter',
-    4841: 'ALetter',
-    4842: 'ALetter',
-    4843: 'ALetter',
-    4844: 'ALetter',
-    4845: 'ALetter',
-    4846: 'ALetter',
-    4847: 'ALetter',
-    4848: 'ALetter',
-    4849: 'ALetter',
-    4850: 'ALetter',
-    4851: 'ALetter',
-    4852: 'ALetter',
-    4853: 'ALetter',
-    4854: 'ALetter',
-    4855: 'ALetter',
-    4856: 'ALetter',
-    4857: 'ALetter',
-    4858: 'ALetter',
-    4859: 'ALetter',
-    4860: 'ALetter',
-    4861: 'ALetter',
-    4862: 'ALetter',
-    4863: 'ALetter',
-    4864: 'ALetter',
-    4865: 'ALetter',
-    4866: 'ALetter',
-    4867: 'ALetter',
-    4868: 'ALetter',
-    4869: 'ALetter',
-    4870: 'ALetter',
-    4871: 'ALetter',
-    4872: 'ALetter',
-    4873: 'ALetter',
-    4874: 'ALetter',
-    4875: 'ALetter',
-    4876: 'ALetter',
-    4877: 'ALetter',
-    4878: 'ALetter',
-    4879: 'ALetter',
-    4880: 'ALetter',
-    4882: 'ALetter',
-    4883: 'ALetter',
-    4884: 'ALetter',
-    4885: 'ALetter',
-    4888: 'ALetter',
-    4889: 'ALetter',
-    4890: 'ALetter',
-    4891: 'ALetter',
-    4892: 'ALetter',
-    4893: 'ALetter',
-    4894: 'ALetter',
-    4895: 'ALetter',
-    4896: 'ALetter',
-    4897: 'ALetter',
-    4898: 'ALetter',
-    4899: 'ALetter',
-    4900: 'ALetter',
-    4901: 'ALetter',
-    4902: 'ALetter',
-    4903: 'ALetter',
-    4904: 'ALetter',
-    4905: 'ALetter',
-    4906: 'ALetter',
-    4907: 'ALetter',
-    4908: 'ALetter',
-    4909: 'ALetter',
-    4910: 'ALetter',
-    4911: 'ALetter',
-    4912: 'ALetter',
-    4913: 'ALetter',
-    4914: 'ALetter',
-    4915: 'ALetter',
-    4916: 'ALetter',
-    4917: 'ALetter',
-    4918: 'ALetter',
-    4919: 'ALetter',
-    4920: 'ALetter',
-    4921: 'ALetter',
-    4922: 'ALetter',
-    4923: 'ALetter',
-    4924: 'ALetter',
-    4925: 'ALetter',
-    4926: 'ALetter',
-    4927: 'ALetter',
-    4928: 'ALetter',
-    4929: 'ALetter',
-    4930: 'ALetter',
-    4931: 'ALetter',
-    4932: 'ALetter',
-    4933: 'ALetter',
-    4934: 'ALetter',
-    4935: 'ALetter',
-    4936: 'ALetter',
-    4937: 'ALetter',
-    4938: 'ALetter',
-    4939: 'ALetter',
-    4940: 'ALetter',
-    4941: 'ALetter',
-    4942: 'ALetter',
-    4943: 'ALetter',
-    4944: 'ALetter',
-    4945: 'ALetter',
-    4946: 'ALetter',
-    4947: 'ALetter',
-    4948: 'ALetter',
-    4949: 'ALetter',
-    4950: 'ALetter',
-    4951: 'ALetter',
-    4952: 'ALetter',
-    4953: 'ALetter',
-    4954: 'ALetter',
-    4992: 'ALetter',
-    4993: 'ALetter',
-    4994: 'ALetter',
-    4995: 'ALetter',
-    4996: 'ALetter',
-    4997: 'ALetter',
-    4998: 'ALetter',
-    4999: 'ALetter',
-    5000: 'ALetter',
-    5001: 'ALetter',
-    5002: 'ALetter',
-    5003: 'ALetter',
-    5004: 'ALetter',
-    5005: 'ALetter',
-    5006: 'ALetter',
-    5007: 'ALetter',
-    5024: 'ALetter',
-    5025: 'ALetter',
-    5026: 'ALetter',
-    5027: 'ALetter',
-    5028: 'ALetter',
-    5029: 'ALetter',
-    5030: 'ALetter',
-    5031: 'ALetter',
-    5032: 'ALetter',
-    5033: 'ALetter',
-    5034: 'ALetter',
-    5035: 'ALetter',
-    5036: 'ALetter',
-    5037: 'ALetter',
-    5038: 'ALetter',
-    5039: 'ALetter',
-    5040: 'ALetter',
-    5041: 'ALetter',
-    5042: 'ALetter',
-    5043: 'ALetter',
-    5044: 'ALetter',
-    5045: 'ALetter',
-    5046: 'ALetter',
-    5047: 'ALetter',
-    5048: 'ALetter',
-    5049: 'ALetter',
-    5050: 'ALetter',
-    5051: 'ALetter',
-    5052: 'ALetter',
-    5053: 'ALetter',
-    5054: 'ALetter',
-    5055: 'ALetter',
-    5056: 'ALetter',
-    5057: 'ALetter',
-    5058: 'ALetter',
-    5059: 'ALetter',
-    5060: 'ALetter',
-    5061: 'ALetter',
-    5062: 'ALetter',
-    5063: 'ALetter',
-    5064: 'ALetter',
-    5065: 'ALetter',
-    5066: 'ALetter',
-    5067: 'ALetter',
-    5068: 'ALetter',
-    5069: 'ALetter',
-    5070: 'ALetter',
-    5071: 'ALetter',
-    5072: 'ALetter',
-    5073: 'ALetter',
-    5074: 'ALetter',
-    5075: 'ALetter',
-    5076: 'ALetter',
-    5077: 'ALetter',
-    5078: 'ALetter',
-    5079: 'ALetter',
-    5080: 'ALetter',
-    5081: 'ALetter',
-    5082: 'ALetter',
-    5083: 'ALetter',
-    5084: 'ALetter',
-    5085: 'ALetter',
-    5086: 'ALetter',
-    5087: 'ALetter',
-    5088: 'ALetter',
-    5089: 'ALetter',
-    5090: 'ALetter',
-    5091: 'ALetter',
-    5092: 'ALetter',
-    5093: 'ALetter',
-    5094: 'ALetter',
-    5095: 'ALetter',
-    5096: 'ALetter',
-    5097: 'ALetter',
-    5098: 'ALetter',
-    5099: 'ALetter',
-    5100: 'ALetter',
-    5101: 'ALetter',
-    5102: 'ALetter',
-    5103: 'ALetter',
-    5104: 'ALetter',
-    5105: 'ALetter',
-    5106: 'ALetter',
-    5107: 'ALetter',
-    5108: 'ALetter',
-    5121: 'ALetter',
-    5122: 'ALetter',
-    5123: 'ALetter',
-    5124: 'ALetter',
-    5125: 'ALetter',
-    5126: 'ALetter',
-    5127: 'ALetter',
-    5128: 'ALetter',
-    5129: 'ALetter',
-    5130: 'ALetter',
-    5131: 'ALetter',
-    5132: 'ALetter',
-    5133: 'ALetter',
-    5134: 'ALetter',
-    5135: 'ALetter',
-    5136: 'ALetter',
-    5137: 'ALetter',
-    5138: 'ALetter',
-    5139: 'ALetter',
-    5140: 'ALetter',
-    5141: 'ALetter',
-    5142: 'ALetter',
-    5143: 'ALetter',
-    5144: 'ALetter',
-    5145: 'ALetter',
-    5146: 'ALetter',
-    5147: 'ALetter',
-    5148: 'ALetter',
-    5149: 'ALetter',
-    5150: 'ALetter',
-    5151: 'ALetter',
-    5152: 'ALetter',
-    5153: 'ALetter',
-    5154: 'ALetter',
-    5155: 'ALetter',
-    5156: 'ALetter',
-    5157: 'ALetter',
-    5158: 'ALetter',
-    5159: 'ALetter',
-    5160: 'ALetter',
-    5161: 'ALetter',
-    5162: 'ALetter',
-    5163: 'ALetter',
-    5164: 'ALetter',
-    5165: 'ALetter',
-    5166: 'ALetter',
-    5167: 'ALetter',
-    5168: 'ALetter',
-    5169: 'ALetter',
-    5170: 'ALetter',
-    5171: 'ALetter',
-    5172: 'ALetter',
-    5173: 'ALetter',
-    5174: 'ALetter',
-    5175: 'ALetter',
-    5176: 'ALetter',
-    5177: 'ALetter',
-    5178: 'ALetter',
-    5179: 'ALetter',
-    5180: 'ALetter',
-    5181: 'ALetter',
-    5182: 'ALetter',
-    5183: 'ALetter',
-    5184: 'ALetter',
-    5185: 'ALetter',
-    5186: 'ALetter',
-    5187: 'ALetter',
-    5188: 'ALetter',
-    5189: 'ALetter',
-    5190: 'ALetter',
-    5191: 'ALetter',
-    5192: 'ALetter',
-    5193: 'ALetter',
-    5194: 'ALetter',
-    5195: 'ALetter',
-    5196: 'ALetter',
-    5197: 'ALetter',
-    5198: 'ALetter',
-    5199: 'ALetter',
-    5200: 'ALetter',
-    5201: 'ALetter',
-    5202: 'ALetter',
-    5203: 'ALetter',
-    5204: 'ALetter',
-    5205: 'ALetter',
-    5206: 'ALetter',
-    5207: 'ALetter',
-    5208: 'ALetter',
-    5209: 'ALetter',
-    5210: 'ALetter',
-    5211: 'ALetter',
-    5212: 'ALetter',
-    5213: 'ALetter',
-    5214: 'ALetter',
-    5215: 'ALetter',
-    5216: 'ALetter',
-    5217: 'ALetter',
-    5218: 'ALetter',
-    5219: 'ALetter',
-    5220: 'ALetter',
-    5221: 'ALetter',
-    5222: 'ALetter',
-    5223: 'ALetter',
-    5224: 'ALetter',
-    5225: 'ALetter',
-    5226: 'ALetter',
-    5227: 'ALetter',
-    5228: 'ALetter',
-    5229: 'ALetter',
-    5230: 'ALetter',
-    5231: 'ALetter',
-    5232: 'ALetter',
-    5233: 'ALetter',
-    5234: 'ALetter',
-    5235: 'ALetter',
-    5236: 'ALetter',
-    5237: 'ALetter',
-    5238: 'ALetter',
-    5239: 'ALetter',
-    5240: 'ALetter',
-    5241: 'ALetter',
-    5242: 'ALetter',
-    5243: 'ALetter',
-    5244: 'ALetter',
-    5245: 'ALetter',
-    5246: 'ALetter',
-    5247: 'ALetter',
-    5248: 'ALetter',
-    5249: 'ALetter',
-    5250: 'ALetter',
-    5251: 'ALetter',
-    5252: 'ALetter',
-    5253: 'ALetter',
-    5254: 'ALetter',
-    5255: 'ALetter',
-    5256: 'ALetter',
-    5257: 'ALetter',
-    5258: 'ALetter',
-    5259: 'ALetter',
-    5260: 'ALetter',
-    5261: 'ALetter',
-    5262: 'ALetter',
-    5263: 'ALetter',
-    5264: 'ALetter',
-    5265: 'ALetter',
-    5266: 'ALetter',
-    5267: 'ALetter',
-    5268: 'ALetter',
-    5269: 'ALetter',
-    5270: 'ALetter',
-    5271: 'ALetter',
-    5272: 'ALetter',
-    5273: 'ALetter',
-    5274: 'ALetter',
-    5275: 'ALetter',
-    5276: 'ALetter',
-    5277: 'ALetter',
-    5278: 'ALetter',
-    5279: 'ALetter',
-    5280: 'ALetter',
-    5281: 'ALetter',
-    5282: 'ALetter',
-    5283: 'ALetter',
-    5284: 'ALetter',
-    5285: 'ALetter',
-    5286: 'ALetter',
-    5287: 'ALetter',
-    5288: 'ALetter',
-    5289: 'ALetter',
-    5290: 'ALetter',
-    5291: 'ALetter',
-    5292: 'ALetter',
-    5293: 'ALetter',
-    5294: 'ALetter',
-    5295: 'ALetter',
-    5296: 'ALetter',
-    5297: 'ALetter',
-    5298: 'ALetter',
-    5299: 'ALetter',
-    5300: 'ALetter',
-    5301: 'ALetter',
-    5302: 'ALetter',
-    5303: 'ALetter',
-    5304: 'ALetter',
-    5305: 'ALetter',
-    5306: 'ALetter',
-    5307: 'ALetter',
-    5308: 'ALetter',
-    5309: 'ALetter',
-    5310: 'ALetter',
-    5311: 'ALetter',
-    5312: 'ALetter',
-    5313: 'ALetter',
-    5314: 'ALetter',
-    5315: 'ALetter',
-    5316: 'ALetter',
-    5317: 'ALetter',
-    5318: 'ALetter',
-    5319: 'ALetter',
-    5320: 'ALetter',
-    5321: 'ALetter',
-    5322: 'ALetter',
-    5323: 'ALetter',
-    5324: 'ALetter',
-    5325: 'ALetter',
-    5326: 'ALetter',
-    5327: 'ALetter',
-    5328: 'ALetter',
-    5329: 'ALetter',
-    5330: 'ALetter',
-    5331: 'ALetter',
-    5332: 'ALetter',
-    5333: 'ALetter',
-    5334: 'ALetter',
-    5335: 'ALetter',
-    5336: 'ALetter',
-    5337: 'ALetter',
-    5338: 'ALetter',
-    5339: 'ALetter',
-    5340: 'ALetter',
-    5341: 'ALetter',
-    5342: 'ALetter',
-    5343: 'ALetter',
-    5344: 'ALetter',
-    5345: 'ALetter',
-    5346: 'ALetter',
-    5347: 'ALetter',
-    5348: 'ALetter',
-    5349: 'ALetter',
-    5350: 'ALetter',
-    5351: 'ALetter',
-    5352: 'ALetter',
-    5353: 'ALetter',
-    5354: 'ALetter',
-    5355: 'ALetter',
-    5356: 'ALetter',
-    5357: 'ALetter',
-    5358: 'ALetter',
-    5359: 'ALetter',
-    5360: 'ALetter',
-    5361: 'ALetter',
-    5362: 'ALetter',
-    5363: 'ALetter',
-    5364: 'ALetter',
-    5365: 'ALetter',
-    5366: 'ALetter',
-    5367: 'ALetter',
-    5368: 'ALetter',
-    5369: 'ALetter',
-    5370: 'ALetter',
-    5371: 'ALetter',
-    5372: 'ALetter',
-    5373: 'ALetter',
-    5374: 'ALetter',
-    5375: 'ALetter',
-    5376: 'ALetter',
-    5377: 'ALetter',
-    5378: 'ALetter',
-    5379: 'ALetter',
-    5380: 'ALetter',
-    5381: 'ALetter',
-    5382: 'ALetter',
-    5383: 'ALetter',
-    5384: 'ALetter',
-    5385: 'ALetter',
-    5386: 'ALetter',
-    5387: 'ALetter',
-    5388: 'ALetter',
-    5389: 'ALetter',
-    5390: 'ALetter',
-    5391: 'ALetter',
-    5392: 'ALetter',
-    5393: 'ALetter',
-    5394: 'ALetter',
-    5395: 'ALetter',
-    5396: 'ALetter',
-    5397: 'ALetter',
-    5398: 'ALetter',
-    5399: 'ALetter',
-    5400: 'ALetter',
-    5401: 'ALetter',
-    5402: 'ALetter',
-    5403: 'ALetter',
-    5404: 'ALetter',
-    5405: 'ALetter',
-    5406: 'ALetter',
-    5407: 'ALetter',
-    5408: 'ALetter',
-    5409: 'ALetter',
-    5410: 'ALetter',
-    5411: 'ALetter',
-    5412: 'ALetter',
-    5413: 'ALetter',
-    5414: 'ALetter',
-    5415: 'ALetter',
-    5416: 'ALetter',
-    5417: 'ALetter',
-    5418: 'ALetter',
-    5419: 'ALetter',
-    5420: 'ALetter',
-    5421: 'ALetter',
-    5422: 'ALetter',
-    5423: 'ALetter',
-    5424: 'ALetter',
-    5425: 'ALetter',
-    5426: 'ALetter',
-    5427: 'ALetter',
-    5428: 'ALetter',
-    5429: 'ALetter',
-    5430: 'ALetter',
-    5431: 'ALetter',
-    5432: 'ALetter',
-    5433: 'ALetter',
-    5434: 'ALetter',
-    5435: 'ALetter',
-    5436: 'ALetter',
-    5437: 'ALetter',
-    5438: 'ALetter',
-    5439: 'ALetter',
-    5440: 'ALetter',
-    5441: 'ALetter',
-    5442: 'ALetter',
-    5443: 'ALetter',
-    5444: 'ALetter',
-    5445: 'ALetter',
-    5446: 'ALetter',
-    5447: 'ALetter',
-    5448: 'ALetter',
-    5449: 'ALetter',
-    5450: 'ALetter',
-    5451: 'ALetter',
-    5452: 'ALetter',
-    5453: 'ALetter',
-    5454: 'ALetter',
-    5455: 'ALetter',
-    5456: 'ALetter',
-    5457: 'ALetter',
-    5458: 'ALetter',
-    5459: 'ALetter',
-    5460: 'ALetter',
-    5461: 'ALetter',
-    5462: 'ALetter',
-    5463: 'ALetter',
-    5464: 'ALetter',
-    5465: 'ALetter',
-    5466: 'ALetter',
-    5467: 'ALetter',
-    5468: 'ALetter',
-    5469: 'ALetter',
-    5470: 'ALetter',
-    5471: 'ALetter',
-    5472: 'ALetter',
-    5473: 'ALetter',
-    5474: 'ALetter',
-    5475: 'ALetter',
-    5476: 'ALetter',
-    5477: 'ALetter',
-    5478: 'ALetter',
-    5479: 'ALetter',
-    5480: 'ALetter',
-    5481: 'ALetter',
-    5482: 'ALetter',
-    5483: 'ALetter',
-    5484: 'ALetter',
-    5485: 'ALetter',
-    5486: 'ALetter',
-    5487: 'ALetter',
-    5488: 'ALetter',
-    5489: 'ALetter',
-    5490: 'ALetter',
-    5491: 'ALetter',
-    5492: 'ALetter',
-    5493: 'ALetter',
-    5494: 'ALetter',
-    5495: 'ALetter',
-    5496: 'ALetter',
-    5497: 'ALetter',
-    5498: 'ALetter',
-    5499: 'ALetter',
-    5500: 'ALetter',
-    5501: 'ALetter',
-    5502: 'ALetter',
-    5503: 'ALetter',
-    5504: 'ALetter',
-    5505: 'ALetter',
-    5506: 'ALetter',
-    5507: 'ALetter',
-    5508: 'ALetter',
-    5509: 'ALetter',
-    5510: 'ALetter',
-    5511: 'ALetter',
-    5512: 'ALetter',
-    5513: 'ALetter',
-    5514: 'ALetter',
-    5515: 'ALetter',
-    5516: 'ALetter',
-    5517: 'ALetter',
-    5518: 'ALetter',
-    5519: 'ALetter',
-    5520: 'ALetter',
-    5521: 'ALetter',
-    5522: 'ALetter',
-    5523: 'ALetter',
-    5524: 'ALetter',
-    5525: 'ALetter',
-    5526: 'ALetter',
-    5527: 'ALetter',
-    5528: 'ALetter',
-    5529: 'ALetter',
-    5530: 'ALetter',
-    5531: 'ALetter',
-    5532: 'ALetter',
-    5533: 'ALetter',
-    5534: 'ALetter',
-    5535: 'ALetter',
-    5536: 'ALetter',
-    5537: 'ALetter',
-    5538: 'ALetter',
-    5539: 'ALetter',
-    5540: 'ALetter',
-    5541: 'ALetter',
-    5542: 'ALetter',
-    5543: 'ALetter',
-    5544: 'ALetter',
-    5545: 'ALetter',
-    5546: 'ALetter',
-    5547: 'ALetter',
-    5548: 'ALetter',
-    5549: 'ALetter',
-    5550: 'ALetter',
-    5551: 'ALetter',
-    5552: 'ALetter',
-    5553: 'ALetter',
-    5554: 'ALetter',
-    5555: 'ALetter',
-    5556: 'ALetter',
-    5557: 'ALetter',
-    5558: 'ALetter',
-    5559: 'ALetter',
-    5560: 'ALetter',
-    5561: 'ALetter',
-    5562: 'ALetter',
-    5563: 'ALetter',
-    5564: 'ALetter',
-    5565: 'ALetter',
-    5566: 'ALetter',
-    5567: 'ALetter',
-    5568: 'ALetter',
-    5569: 'ALetter',
-    5570: 'ALetter',
-    5571: 'ALetter',
-    5572: 'ALetter',
-    5573: 'ALetter',
-    5574: 'ALetter',
-    5575: 'ALetter',
-    5576: 'ALetter',
-    5577: 'ALetter',
-    5578: 'ALetter',
-    5579: 'ALetter',
-    5580: 'ALetter',
-    5581: 'ALetter',
-    5582: 'ALetter',
-    5583: 'ALetter',
-    5584: 'ALetter',
-    5585: 'ALetter',
-    5586: 'ALetter',
-    5587: 'ALetter',
-    5588: 'ALetter',
-    5589: 'ALetter',
-    5590: 'ALetter',
-    5591: 'ALetter',
-    5592: 'ALetter',
-    5593: 'ALetter',
-    5594: 'ALetter',
-    5595: 'ALetter',
-    5596: 'ALetter',
-    5597: 'ALetter',
-    5598: 'ALetter',
-    5599: 'ALetter',
-    5600: 'ALetter',
-    5601: 'ALetter',
-    5602: 'ALetter',
-    5603: 'ALetter',
-    5604: 'ALetter',
-    5605: 'ALetter',
-    5606: 'ALetter',
-    5607: 'ALetter',
-    5608: 'ALetter',
-    5609: 'ALetter',
-    5610: 'ALetter',
-    5611: 'ALetter',
-    5612: 'ALetter',
-    5613: 'ALetter',
-    5614: 'ALetter',
-    5615: 'ALetter',
-    5616: 'ALetter',
-    5617: 'ALetter',
-    5618: 'ALetter',
-    5619: 'ALetter',
-    5620: 'ALetter',
-    5621: 'ALetter',
-    5622: 'ALetter',
-    5623: 'ALetter',
-    5624: 'ALetter',
-    5625: 'ALetter',
-    5626: 'ALetter',
-    5627: 'ALetter',
-    5628: 'ALetter',
-    5629: 'ALetter',
-    5630: 'ALetter',
-    5631: 'ALetter',
-    5632: 'ALetter',
-    5633: 'ALetter',
-    5634: 'ALetter',
-    5635: 'ALetter',
-    5636: 'ALetter',
-    5637: 'ALetter',
-    5638: 'ALetter',
-    5639: 'ALetter',
-    5640: 'ALetter',
-    5641: 'ALetter',
-    5642: 'ALetter',
-    5643: 'ALetter',
-    5644: 'ALetter',
-    5645: 'ALetter',
-    5646: 'ALetter',
-    5647: 'ALetter',
-    5648: 'ALetter',
-    5649: 'ALetter',
-    5650: 'ALetter',
-    5651: 'ALetter',
-    5652: 'ALetter',
-    5653: 'ALetter',
-    5654: 'ALetter',
-    5655: 'ALetter',
-    5656: 'ALetter',
-    5657: 'ALetter',
-    5658: 'ALetter',
-    5659: 'ALetter',
-    5660: 'ALetter',
-    5661: 'ALetter',
-    5662: 'ALetter',
-    5663: 'ALetter',
-    5664: 'ALetter',
-    5665: 'ALetter',
-    5666: 'ALetter',
-    5667: 'ALetter',
-    5668: 'ALetter',
-    5669: 'ALetter',
-    5670: 'ALetter',
-    5671: 'ALetter',
-    5672: 'ALetter',
-    5673: 'ALetter',
-    5674: 'ALetter',
-    5675: 'ALetter',
-    5676: 'ALetter',
-    5677: 'ALetter',
-    5678: 'ALetter',
-    5679: 'ALetter',
-    5680: 'ALetter',
-    5681: 'ALetter',
-    5682: 'ALetter',
-    5683: 'ALetter',
-    5684: 'ALetter',
-    5685: 'ALetter',
-    5686: 'ALetter',
-    5687: 'ALetter',
-    5688: 'ALetter',
-    5689: 'ALetter',
-    5690: 'ALetter',
-    5691: 'ALetter',
-    5692: 'ALetter',
-    5693: 'ALetter',
-    5694: 'ALetter',
-    5695: 'ALetter',
-    5696: 'ALetter',
-    5697: 'ALetter',
-    5698: 'ALetter',
-    5699: 'ALetter',
-    5700: 'ALetter',
-    5701: 'ALetter',
-    5702: 'ALetter',
-    5703: 'ALetter',
-    5704: 'ALetter',
-    5705: 'ALetter',
-    5706: 'ALetter',
-    5707: 'ALetter',
-    5708: 'ALetter',
-    5709: 'ALetter',
-    5710: 'ALetter',
-    5711: 'ALetter',
-    5712: 'ALetter',
-    5713: 'ALetter',
-    5714: 'ALetter',
-    5715: 'ALetter',
-    5716: 'ALetter',
-    5717: 'ALetter',
-    5718: 'ALetter',
-    5719: 'ALetter',
-    5720: 'ALetter',
-    5721: 'ALetter',
-    5722: 'ALetter',
-    5723: 'ALetter',
-    5724: 'ALetter',
-    5725: 'ALetter',
-    5726: 'ALetter',
-    5727: 'ALetter',
-    5728: 'ALetter',
-    5729: 'ALetter',
-    5730: 'ALetter',
-    5731: 'ALetter',
-    5732: 'ALetter',
-    5733: 'ALetter',
-    5734: 'ALetter',
-    5735: 'ALetter',
-    5736: 'ALetter',
-    5737: 'ALetter',
-    5738: 'ALetter',
-    5739: 'ALetter',
-    5740: 'ALetter',
-    5743: 'ALetter',
-    5744: 'ALetter',
-    5745: 'ALetter',
-    5746: 'ALetter',
-    5747: 'ALetter',
-    5748: 'ALetter',
-    5749: 'ALetter',
-    5750: 'ALetter',
-    5761: 'ALetter',
-    5762: 'ALetter',
-    5763: 'ALetter',
-    5764: 'ALetter',
-    5765: 'ALetter',
-    5766: 'ALetter',
-    5767: 'ALetter',
-    5768: 'ALetter',
-    5769: 'ALetter',
-    5770: 'ALetter',
-    5771: 'ALetter',
-    5772: 'ALetter',
-    5773: 'ALetter',
-    5774: 'ALetter',
-    5775: 'ALetter',
-    5776: 'ALetter',
-    5777: 'ALetter',
-    5778: 'ALetter',
-    5779: 'ALetter',
-    5780: 'ALetter',
-    5781: 'ALetter',
-    5782: 'ALetter',
-    5783: 'ALetter',
-    5784: 'ALetter',
-    5785: 'ALetter',
-    5786: 'ALetter',
-    5792: 'ALetter',
-    5793: 'ALetter',
-    5794: 'ALetter',
-    5795: 'ALetter',
-    5796: 'ALetter',
-    5797: 'ALetter',
-    5798: 'ALetter',
-    5799: 'ALetter',
-    5800: 'ALetter',
-    5801: 'ALetter',
-    5802: 'ALetter',
-    5803: 'ALetter',
-    5804: 'ALetter',
-    5805: 'ALetter',
-    5806: 'ALetter',
-    5807: 'ALetter',
-    5808: 'ALetter',
-    5809: 'ALetter',
-    5810: 'ALetter',
-    5811: 'ALetter',
-    5812: 'ALetter',
-    5813: 'ALetter',
-    5814: 'ALetter',
-    5815: 'ALetter',
-    5816: 'ALetter',
-    5817: 'ALetter',
-    5818: 'ALetter',
-    5819: 'ALetter',
-    5820: 'ALetter',
-    5821: 'ALetter',
-    5822: 'ALetter',
-    5823: 'ALetter',
-    5824: 'ALetter',
-    5825: 'ALetter',
-    5826: 'ALetter',
-    5827: 'ALetter',
-    5828: 'ALetter',
-    5829: 'ALetter',
-    5830: 'ALetter',
-    5831: 'ALetter',
-    5832: 'ALetter',
-    5833: 'ALetter',
-    5834: 'ALetter',
-    5835: 'ALetter',
-    5836: 'ALetter',
-    5837: 'ALetter',
-    5838: 'ALetter',
-    5839: 'ALetter',
-    5840: 'ALetter',
-    5841: 'ALetter',
-    5842: 'ALetter',
-    5843: 'ALetter',
-    5844: 'ALetter',
-    5845: 'ALetter',
-    5846: 'ALetter',
-    5847: 'ALetter',
-    5848: 'ALetter',
-    5849: 'ALetter',
-    5850: 'ALetter',
-    5851: 'ALetter',
-    5852: 'ALetter',
-    5853: 'ALetter',
-    5854: 'ALetter',
-    5855: 'ALetter',
-    5856: 'ALetter',
-    5857: 'ALetter',
-    5858: 'ALetter',
-    5859: 'ALetter',
-    5860: 'ALetter',
-    5861: 'ALetter',
-    5862: 'ALetter',
-    5863: 'ALetter',
-    5864: 'ALetter',
-    5865: 'ALetter',
-    5866: 'ALetter',
-    5870: 'ALetter',
-    5871: 'ALetter',
-    5872: 'ALetter',
-    5888: 'ALetter',
-    5889: 'ALetter',
-    5890: 'ALetter',
-    5891: 'ALetter',
-    5892: 'ALetter',
-    5893: 'ALetter',
-    5894: 'ALetter',
-    5895: 'ALetter',
-    5896: 'ALetter',
-    5897: 'ALetter',
-    5898: 'ALetter',
-    5899: 'ALetter',
-    5900: 'ALetter',
-    5902: 'ALetter',
-    5903: 'ALetter',
-    5904: 'ALetter',
-    5905: 'ALetter',
-    5920: 'ALetter',
-    5921: 'ALetter',
-    5922: 'ALetter',
-    5923: 'ALetter',
-    5924: 'ALetter',
-    5925: 'ALetter',
-    5926: 'ALetter',
-    5927: 'ALetter',
-    5928: 'ALetter',
-    5929: 'ALetter',
-    5930: 'ALetter',
-    5931: 'ALetter',
-    5932: 'ALetter',
-    5933: 'ALetter',
-    5934: 'ALetter',
-    5935: 'ALetter',
-    5936: 'ALetter',
-    5937: 'ALetter',
-    5952: 'ALetter',
-    5953: 'ALetter',
-    5954: 'ALetter',
-    5955: 'ALetter',
-    5956: 'ALetter',
-    5957: 'ALetter',
-    5958: 'ALetter',
-    5959: 'ALetter',
-    5960: 'ALetter',
-    5961: 'ALetter',
-    5962: 'ALetter',
-    5963: 'ALetter',
-    5964: 'ALetter',
-    5965: 'ALetter',
-    5966: 'ALetter',
-    5967: 'ALetter',
-    5968: 'ALetter',
-    5969: 'ALetter',
-    5984: 'ALetter',
-    5985: 'ALetter',
-    5986: 'ALetter',
-    5987: 'ALetter',
-    5988: 'ALetter',
-    5989: 'ALetter',
-    5990: 'ALetter',
-    5991: 'ALetter',
-    5992: 'ALetter',
-    5993: 'ALetter',
-    5994: 'ALetter',
-    5995: 'ALetter',
-    5996: 'ALetter',
-    5998: 'ALetter',
-    5999: 'ALetter',
-    6000: 'ALetter',
-    6068: 'Format',
-    6069: 'Format',
-    6112: 'Numeric',
-    6113: 'Numeric',
-    6114: 'Numeric',
-    6115: 'Numeric',
-    6116: 'Numeric',
-    6117: 'Numeric',
-    6118: 'Numeric',
-    6119: 'Numeric',
-    6120: 'Numeric',
-    6121: 'Numeric',
-    6160: 'Numeric',
-    6161: 'Numeric',
-    6162: 'Numeric',
-    6163: 'Numeric',
-    6164: 'Numeric',
-    6165: 'Numeric',
-    6166: 'Numeric',
-    6167: 'Numeric',
-    6168: 'Numeric',
-    6169: 'Numeric',
-    6176: 'ALetter',
-    6177: 'ALetter',
-    6178: 'ALetter',
-    6179: 'ALetter',
-    6180: 'ALetter',
-    6181: 'ALetter',
-    6182: 'ALetter',
-    6183: 'ALetter',
-    6184: 'ALetter',
-    6185: 'ALetter',
-    6186: 'ALetter',
-    6187: 'ALetter',
-    6188: 'ALetter',
-    6189: 'ALetter',
-    6190: 'ALetter',
-    6191: 'ALetter',
-    6192: 'ALetter',
-    6193: 'ALetter',
-    6194: 'ALetter',
-    6195: 'ALetter',
-    6196: 'ALetter',
-    6197: 'ALetter',
-    6198: 'ALetter',
-    6199: 'ALetter',
-    6200: 'ALetter',
-    6201: 'ALetter',
-    6202: 'ALetter',
-    6203: 'ALetter',
-    6204: 'ALetter',
-    6205: 'ALetter',
-    6206: 'ALetter',
-    6207: 'ALetter',
-    6208: 'ALetter',
-    6209: 'ALetter',
-    6210: 'ALetter',
-    6211: 'ALetter',
-    6212: 'ALetter',
-    6213: 'ALetter',
-    6214: 'ALetter',
-    6215: 'ALetter',
-    6216: 'ALetter',
-    6217: 'ALetter',
-    6218: 'ALetter',
-    6219: 'ALetter',
-    6220: 'ALetter',
-    6221: 'ALetter',
-    6222: 'ALetter',
-    6223: 'ALetter',
-    6224: 'ALetter',
-    6225: 'ALetter',
-    6226: 'ALetter',
-    6227: 'ALetter',
-    6228: 'ALetter',
-    6229: 'ALetter',
-    6230: 'ALetter',
-    6231: 'ALetter',
-    6232: 'ALetter',
-    6233: 'ALetter',
-    6234: 'ALetter',
-    6235: 'ALetter',
-    6236: 'ALetter',
-    6237: 'ALetter',
-    6238: 'ALetter',
-    6239: 'ALetter',
-    6240: 'ALetter',
-    6241: 'ALetter',
-    6242: 'ALetter',
-    6243: 'ALetter',
-    6244: 'ALetter',
-    6245: 'ALetter',
-    6246: 'ALetter',
-    6247: 'ALetter',
-    6248: 'ALetter',
-    6249: 'ALetter',
-    6250: 'ALetter',
-    6251: 'ALetter',
-    6252: 'ALetter',
-    6253: 'ALetter',
-    6254: 'ALetter',
-    6255: 'ALetter',
-    6256: 'ALetter',
-    6257: 'ALetter',
-    6258: 'ALetter',
-    6259: 'ALetter',
-    6260: 'ALetter',
-    6261: 'ALetter',
-    6262: 'ALetter',
-    6263: 'ALetter',
-    6272: 'ALetter',
-    6273: 'ALetter',
-    6274: 'ALetter',
-    6275: 'ALetter',
-    6276: 'ALetter',
-    6277: 'ALetter',
-    6278: 'ALetter',
-    6279: 'ALetter',
-    6280: 'ALetter',
-    6281: 'ALetter',
-    6282: 'ALetter',
-    6283: 'ALetter',
-    6284: 'ALetter',
-    6285: 'ALetter',
-    6286: 'ALetter',
-    6287: 'ALetter',
-    6288: 'ALetter',
-    6289: 'ALetter',
-    6290: 'ALetter',
-    6291: 'ALetter',
-    6292: 'ALetter',
-    6293: 'ALetter',
-    6294: 'ALetter',
-    6295: 'ALetter',
-    6296: 'ALetter',
-    6297: 'ALetter',
-    6298: 'ALetter',
-    6299: 'ALetter',
-    6300: 'ALetter',
-    6301: 'ALetter',
-    6302: 'ALetter',
-    6303: 'ALetter',
-    6304: 'ALetter',
-    6305: 'ALetter',
-    6306: 'ALetter',
-    6307: 'ALetter',
-    6308: 'ALetter',
-    6309: 'ALetter',
-    6310: 'ALetter',
-    6311: 'ALetter',
-    6312: 'ALetter',
-    6400: 'ALetter',
-    6401: 'ALetter',
-    6402: 'ALetter',
-    6403: 'ALetter',
-    6404: 'ALetter',
-    6405: 'ALetter',
-    6406: 'ALetter',
-    6407: 'ALetter',
-    6408: 'ALetter',
-    6409: 'ALetter',
-    6410: 'ALetter',
-    6411: 'ALetter',
-    6412: 'ALetter',
-    6413: 'ALetter',
-    6414: 'ALetter',
-    6415: 'ALetter',
-    6416: 'ALetter',
-    6417: 'ALetter',
-    6418: 'ALetter',
-    6419: 'ALetter',
-    6420: 'ALetter',
-    6421: 'ALetter',
-    6422: 'ALetter',
-    6423: 'ALetter',
-    6424: 'ALetter',
-    6425: 'ALetter',
-    6426: 'ALetter',
-    6427: 'ALetter',
-    6428: 'ALetter',
-    6435: 'ALetter',
-    6436: 'ALetter',
-    6437: 'ALetter',
-    6438: 'ALetter',
-    6441: 'ALetter',
-    6442: 'ALetter',
-    6443: 'ALetter',
-    6448: 'ALetter',
-    6449: 'ALetter',
-    6451: 'ALetter',
-    6452: 'ALetter',
-    6453: 'ALetter',
-    6454: 'ALetter',
-    6455: 'ALetter',
-    6456: 'ALetter',
-    6470: 'Numeric',
-    6471: 'Numeric',
-    6472: 'Numeric',
-    6473: 'Numeric',
-    6474: 'Numeric',
-    6475: 'Numeric',
-    6476: 'Numeric',
-    6477: 'Numeric',
-    6478: 'Numeric',
-    6479: 'Numeric',
-    6608: 'Numeric',
-    6609: 'Numeric',
-    6610: 'Numeric',
-    6611: 'Numeric',
-    6612: 'Numeric',
-    6613: 'Numeric',
-    6614: 'Numeric',
-    6615: 'Numeric',
-    6616: 'Numeric',
-    6617: 'Numeric',
-    6656: 'ALetter',
-    6657: 'ALetter',
-    6658: 'ALetter',
-    6659: 'ALetter',
-    6660: 'ALetter',
-    6661: 'ALetter',
-    6662: 'ALetter',
-    6663: 'ALetter',
-    6664: 'ALetter',
-    6665: 'ALetter',
-    6666: 'ALetter',
-    6667: 'ALetter',
-    6668: 'ALetter',
-    6669: 'ALetter',
-    6670: 'ALetter',
-    6671: 'ALetter',
-    6672: 'ALetter',
-    6673: 'ALetter',
-    6674: 'ALetter',
-    6675: 'ALetter',
-    6676: 'ALetter',
-    6677: 'ALetter',
-    6678: 'ALetter',
-    6681: 'ALetter',
-    6682: 'ALetter',
-    6683: 'ALetter',
-    6916: 'ALetter',
-    6917: 'ALetter',
-    6918: 'ALetter',
-    6919: 'ALetter',
-    6920: 'ALetter',
-    6921: 'ALetter',
-    6922: 'ALetter',
-    6923: 'ALetter',
-    6924: 'ALetter',
-    6925: 'ALetter',
-    6926: 'ALetter',
-    6927: 'ALetter',
-    6928: 'ALetter',
-    6929: 'ALetter',
-    6930: 'ALetter',
-    6931: 'ALetter',
-    6932: 'ALetter',
-    6933: 'ALetter',
-    6934: 'ALetter',
-    6935: 'ALetter',
-    6936: 'ALetter',
-    6937: 'ALetter',
-    6938: 'ALetter',
-    6939: 'ALetter',
-    6940: 'ALetter',
-    6941: 'ALetter',
-    6942: 'ALetter',
-    6943: 'ALetter',
-    6944: 'ALetter',
-    6945: 'ALetter',
-    6946: 'ALetter',
-    6947: 'ALetter',
-    6948: 'ALetter',
-    6949: 'ALetter',
-    6950: 'ALetter',
-    6951: 'ALetter',
-    6952: 'ALetter',
-    6953: 'ALetter',
-    6954: 'ALetter',
-    6955: 'ALetter',
-    6956: 'ALetter',
-    6957: 'ALetter',
-    6958: 'ALetter',
-    6959: 'ALetter',
-    6960: 'ALetter',
-    6961: 'ALetter',
-    6962: 'ALetter',
-    6963: 'ALetter',
-    6965: 'ALetter',
-    6971: 'ALetter',
-    6973: 'ALetter',
-    6974: 'ALetter',
-    6975: 'ALetter',
-    6976: 'ALetter',
-    6977: 'ALetter',
-    6979: 'ALetter',
-    6981: 'ALetter',
-    6982: 'ALetter',
-    6983: 'ALetter',
-    6984: 'ALetter',
-    6985: 'ALetter',
-    6986: 'ALetter',
-    6987: 'ALetter',
-    6992: 'Numeric',
-    6993: 'Numeric',
-    6994: 'Numeric',
-    6995: 'Numeric',
-    6996: 'Numeric',
-    6997: 'Numeric',
-    6998: 'Numeric',
-    6999: 'Numeric',
-    7000: 'Numeric',
-    7001: 'Numeric',
-    7424: 'ALetter',
-    7425: 'ALetter',
-    7426: 'ALetter',
-    7427: 'ALetter',
-    7428: 'ALetter',
-    7429: 'ALetter',
-    7430: 'ALetter',
-    7431: 'ALetter',
-    7432: 'ALetter',
-    7433: 'ALetter',
-    7434: 'ALetter',
-    7435: 'ALetter',
-    7436: 'ALetter',
-    7437: 'ALetter',
-    7438: 'ALetter',
-    7439: 'ALetter',
-    7440: 'ALetter',
-    7441: 'ALetter',
-    7442: 'ALetter',
-    7443: 'ALetter',
-    7444: 'ALetter',
-    7445: 'ALetter',
-    7446: 'ALetter',
-    7447: 'ALetter',
-    7448: 'ALetter',
-    7449: 'ALetter',
-    7450: 'ALetter',
-    7451: 'ALetter',
-    7452: 'ALetter',
-    7453: 'ALetter',
-    7454: 'ALetter',
-    7455: 'ALetter',
-    7456: 'ALetter',
-    7457: 'ALetter',
-    7458: 'ALetter',
-    7459: 'ALetter',
-    7460: 'ALetter',
-    7461: 'ALetter',
-    7462: 'ALetter',
-    7463: 'ALetter',
-    7464: 'ALetter',
-    7465: 'ALetter',
-    7466: 'ALetter',
-    7467: 'ALetter',
-    7468: 'ALetter',
-    7469: 'ALetter',
-    7470: 'ALetter',
-    7471: 'ALetter',
-    7472: 'ALetter',
-    7473: 'ALetter',
-    7474: 'ALetter',
-    7475: 'ALetter',
-    7476: 'ALetter',
-    7477: 'ALetter',
-    7478: 'ALetter',
-    7479: 'ALetter',
-    7480: 'ALetter',
-    7481: 'ALetter',
-    7482: 'ALetter',
-    7483: 'ALetter',
-    7484: 'ALetter',
-    7485: 'ALetter',
-    7486: 'ALetter',
-    7487: 'ALetter',
-    7488: 'ALetter',
-    7489: 'ALetter',
-    7490: 'ALetter',
-    7491: 'ALetter',
-    7492: 'ALetter',
-    7493: 'ALetter',
-    7494: 'ALetter',
-    7495: 'ALetter',
-    7496: 'ALetter',
-    7497: 'ALetter',
-    7498: 'ALetter',
-    7499: 'ALetter',
-    7500: 'ALetter',
-    7501: 'ALetter',
-    7502: 'ALetter',
-    7503: 'ALetter',
-    7504: 'ALetter',
-    7505: 'ALetter',
-    7506: 'ALetter',
-    7507: 'ALetter',
-    7508: 'ALetter',
-    7509: 'ALetter',
-    7510: 'ALetter',
-    7511: 'ALetter',
-    7512: 'ALetter',
-    7513: 'ALetter',
-    7514: 'ALetter',
-    7515: 'ALetter',
-    7516: 'ALetter',
-    7517: 'ALetter',
-    7518: 'ALetter',
-    7519: 'ALetter',
-    7520: 'ALetter',
-    7521: 'ALetter',
-    7522: 'ALetter',
-    7523: 'ALetter',
-    7524: 'ALetter',
-    7525: 'ALetter',
-    7526: 'ALetter',
-    7527: 'ALetter',
-    7528: 'ALetter',
-    7529: 'ALetter',
-    7530: 'ALetter',
-    7531: 'ALetter',
-    7532: 'ALetter',
-    7533: 'ALetter',
-    7534: 'ALetter',
-    7535: 'ALetter',
-    7536: 'ALetter',
-    7537: 'ALetter',
-    7538: 'ALetter',
-    7539: 'ALetter',
-    7540: 'ALetter',
-    7541: 'ALetter',
-    7542: 'ALetter',
-    7543: 'ALetter',
-    7544: 'ALetter',
-    7545: 'ALetter',
-    7546: 'ALetter',
-    7547: 'ALetter',
-    7548: 'ALetter',
-    7549: 'ALetter',
-    7550: 'ALetter',
-    7551: 'ALetter',
-    7552: 'ALetter',
-    7553: 'ALetter',
-    7554: 'ALetter',
-    7555: 'ALetter',
-    7556: 'ALetter',
-    7557: 'ALetter',
-    7558: 'ALetter',
-    7559: 'ALetter',
-    7560: 'ALetter',
-    7561: 'ALetter',
-    7562: 'ALetter',
-    7563: 'ALetter',
-    7564: 'ALetter',
-    7565: 'ALetter',
-    7566: 'ALetter',
-    7567: 'ALetter',
-    7568: 'ALetter',
-    7569: 'ALetter',
-    7570: 'ALetter',
-    7571: 'ALetter',
-    7572: 'ALetter',
-    7573: 'ALetter',
-    7574: 'ALetter',
-    7575: 'ALetter',
-    7576: 'ALetter',
-    7577: 'ALetter',
-    7578: 'ALetter',
-    7579: 'ALetter',
-    7580: 'ALetter',
-    7581: 'ALetter',
-    7582: 'ALetter',
-    7583: 'ALetter',
-    7584: 'ALetter',
-    7585: 'ALetter',
-    7586: 'ALetter',
-    7587: 'ALetter',
-    7588: 'ALetter',
-    7589: 'ALetter',
-    7590: 'ALetter',
-    7591: 'ALetter',
-    7592: 'ALetter',
-    7593: 'ALetter',
-    7594: 'ALetter',
-    7595: 'ALetter',
-    7596: 'ALetter',
-    7597: 'ALetter',
-    7598: 'ALetter',
-    7599: 'ALetter',
-    7600: 'ALetter',
-    7601: 'ALetter',
-    7602: 'ALetter',
-    7603: 'ALetter',
-    7604: 'ALetter',
-    7605: 'ALetter',
-    7606: 'ALetter',
-    7607: 'ALetter',
-    7608: 'ALetter',
-    7609: 'ALetter',
-    7610: 'ALetter',
-    7611: 'ALetter',
-    7612: 'ALetter',
-    7613: 'ALetter',
-    7614: 'ALetter',
-    7615: 'ALetter',
-    7680: 'ALetter',
-    7681: 'ALetter',
-    7682: 'ALetter',
-    7683: 'ALetter',
-    7684: 'ALetter',
-    7685: 'ALetter',
-    7686: 'ALetter',
-    7687: 'ALetter',
-    7688: 'ALetter',
-    7689: 'ALetter',
-    7690: 'ALetter',
-    7691: 'ALetter',
-    7692: 'ALetter',
-    7693: 'ALetter',
-    7694: 'ALetter',
-    7695: 'ALetter',
-    7696: 'ALetter',
-    7697: 'ALetter',
-    7698: 'ALetter',
-    7699: 'ALetter',
-    7700: 'ALetter',
-    7701: 'ALetter',
-    7702: 'ALetter',
-    7703: 'ALetter',
-    7704: 'ALetter',
-    7705: 'ALetter',
-    7706: 'ALetter',
-    7707: 'ALetter',
-    7708: 'ALetter',
-    7709: 'ALetter',
-    7710: 'ALetter',
-    7711: 'ALetter',
-    7712: 'ALetter',
-    7713: 'ALetter',
-    7714: 'ALetter',
-    7715: 'ALetter',
-    7716: 'ALetter',
-    7717: 'ALetter',
-    7718: 'ALetter',
-    7719: 'ALetter',
-    7720: 'ALetter',
-    7721: 'ALetter',
-    7722: 'ALetter',
-    7723: 'ALetter',
-    7724: 'ALetter',
-    7725: 'ALetter',
-    7726: 'ALetter',
-    7727: 'ALetter',
-    7728: 'ALetter',
-    7729: 'ALetter',
-    7730: 'ALetter',
-    7731: 'ALetter',
-    7732: 'ALetter',
-    7733: 'ALetter',
-    7734: 'ALetter',
-    7735: 'ALetter',
-    7736: 'ALetter',
-    7737: 'ALetter',
-    7738: 'ALetter',
-    7739: 'ALetter',
-    7740: 'ALetter',
-    7741: 'ALetter',
-    7742: 'ALetter',
-    7743: 'ALetter',
-    7744: 'ALetter',
-    7745: 'ALetter',
-    7746: 'ALetter',
-    7747: 'ALetter',
-    7748: 'ALetter',
-    7749: 'ALetter',
-    7750: 'ALetter',
-    7751: 'ALetter',
-    7752: 'ALetter',
-    7753: 'ALetter',
-    7754: 'ALetter',
-    7755: 'ALetter',
-    7756: 'ALetter',
-    7757: 'ALetter',
-    7758: 'ALetter',
-    7759: 'ALetter',
-    7760: 'ALetter',
-    7761: 'ALetter',
-    7762: 'ALetter',
-    7763: 'ALetter',
-    7764: 'ALetter',
-    7765: 'ALetter',
-    7766: 'ALetter',
-    7767: 'ALetter',
-    7768: 'ALetter',
-    7769: 'ALetter',
-    7770: 'ALetter',
-    7771: 'ALetter',
-    7772: 'ALetter',
-    7773: 'ALetter',
-    7774: 'ALetter',
-    7775: 'ALetter',
-    7776: 'ALetter',
-    7777: 'ALetter',
-    7778: 'ALetter',
-    7779: 'ALetter',
-    7780: 'ALetter',
-    7781: 'ALetter',
-    7782: 'ALetter',
-    7783: 'ALetter',
-    7784: 'ALetter',
-    7785: 'ALetter',
-    7786: 'ALetter',
-    7787: 'ALetter',
-    7788: 'ALetter',
-    7789: 'ALetter',
-    7790: 'ALetter',
-    7791: 'ALetter',
-    7792: 'ALetter',
-    7793: 'ALetter',
-    7794: 'ALetter',
-    7795: 'ALetter',
-    7796: 'ALetter',
-    7797: 'ALetter',
-    7798: 'ALetter',
-    7799: 'ALetter',
-    7800: 'ALetter',
-    7801: 'ALetter',
-    7802: 'ALetter',
-    7803: 'ALetter',
-    7804: 'ALetter',
-    7805: 'ALetter',
-    7806: 'ALetter',
-    7807: 'ALetter',
-    7808: 'ALetter',
-    7809: 'ALetter',
-    7810: 'ALetter',
-    7811: 'ALetter',
-    7812: 'ALetter',
-    7813: 'ALetter',
-    7814: 'ALetter',
-    7815: 'ALetter',
-    7816: 'ALetter',
-    7817: 'ALetter',
-    7818: 'ALetter',
-    7819: 'ALetter',
-    7820: 'ALetter',
-    7821: 'ALetter',
-    7822: 'ALetter',
-    7823: 'ALetter',
-    7824: 'ALetter',
-    7825: 'ALetter',
-    7826: 'ALetter',
-    7827: 'ALetter',
-    7828: 'ALetter',
-    7829: 'ALetter',
-    7830: 'ALetter',
-    7831: 'ALetter',
-    7832: 'ALetter',
-    7833: 'ALetter',
-    7834: 'ALetter',
-    7835: 'ALetter',
-    7840: 'ALetter',
-    7841: 'ALetter',
-    7842: 'ALetter',
-    7843: 'ALetter',
-    7844: 'ALetter',
-    7845: 'ALetter',
-    7846: 'ALetter',
-    7847: 'ALetter',
-    7848: 'ALetter',
-    7849: 'ALetter',
-    7850: 'ALetter',
-    7851: 'ALetter',
-    7852: 'ALetter',
-    7853: 'ALetter',
-    7854: 'ALetter',
-    7855: 'ALetter',
-    7856: 'ALetter',
-    7857: 'ALetter',
-    7858: 'ALetter',
-    7859: 'ALetter',
-    7860: 'ALetter',
-    7861: 'ALetter',
-    7862: 'ALetter',
-    7863: 'ALetter',
-    7864: 'ALetter',
-    7865: 'ALetter',
-    7866: 'ALetter',
-    7867: 'ALetter',
-    7868: 'ALetter',
-    7869: 'ALetter',
-    7870: 'ALetter',
-    7871: 'ALetter',
-    7872: 'ALetter',
-    7873: 'ALetter',
-    7874: 'ALetter',
-    7875: 'ALetter',
-    7876: 'ALetter',
-    7877: 'ALetter',
-    7878: 'ALetter',
-    7879: 'ALetter',
-    7880: 'ALetter',
-    7881: 'ALetter',
-    7882: 'ALetter',
-    7883: 'ALetter',
-    7884: 'ALetter',
-    7885: 'ALetter',
-    7886: 'ALetter',
-    7887: 'ALetter',
-    7888: 'ALetter',
-    7889: 'ALetter',
-    7890: 'ALetter',
-    7891: 'ALetter',
-    7892: 'ALetter',
-    7893: 'ALetter',
-    7894: 'ALetter',
-    7895: 'ALetter',
-    7896: 'ALetter',
-    7897: 'ALetter',
-    7898: 'ALetter',
-    7899: 'ALetter',
-    7900: 'ALetter',
-    7901: 'ALetter',
-    7902: 'ALetter',
-    7903: 'ALetter',
-    7904: 'ALetter',
-    7905: 'ALetter',
-    7906: 'ALetter',
-    7907: 'ALetter',
-    7908: 'ALetter',
-    7909: 'ALetter',
-    7910: 'ALetter',
-    7911: 'ALetter',
-    7912: 'ALetter',
-    7913: 'ALetter',
-    7914: 'ALetter',
-    7915: 'ALetter',
-    7916: 'ALetter',
-    7917: 'ALetter',
-    7918: 'ALetter',
-    7919: 'ALetter',
-    7920: 'ALetter',
-    7921: 'ALetter',
-    7922: 'ALetter',
-    7923: 'ALetter',
-    7924: 'ALetter',
-    7925: 'ALetter',
-    7926: 'ALetter',
-    7927: 'ALetter',
-    7928: 'ALetter',
-    7929: 'ALetter',
-    7936: 'ALetter',
-    7937: 'ALetter',
-    7938: 'ALetter',
-    7939: 'ALetter',
-    7940: 'ALetter',
-    7941: 'ALetter',
-    7942: 'ALetter',
-    7943: 'ALetter',
-    7944: 'ALetter',
-    7945: 'ALetter',
-    7946: 'ALetter',
-    7947: 'ALetter',
-    7948: 'ALetter',
-    7949: 'ALetter',
-    7950: 'ALetter',
-    7951: 'ALetter',
-    7952: 'ALetter',
-    7953: 'ALetter',
-    7954: 'ALetter',
-    7955: 'ALetter',
-    7956: 'ALetter',
-    7957: 'ALetter',
-    7960: 'ALetter',
-    7961: 'ALetter',
-    7962: 'ALetter',
-    7963: 'ALetter',
-    7964: 'ALetter',
-    7965: 'ALetter',
-    7968: 'ALetter',
-    7969: 'ALetter',
-    7970: 'ALetter',
-    7971: 'ALetter',
-    7972: 'ALetter',
-    7973: 'ALetter',
-    7974: 'ALetter',
-    7975: 'ALetter',
-    7976: 'ALetter',
-    7977: 'ALetter',
-    7978: 'ALetter',
-    7979: 'ALetter',
-    7980: 'ALetter',
-    7981: 'ALetter',
-    7982: 'ALetter',
-    7983: 'ALetter',
-    7984: 'ALetter',
-    7985: 'ALetter',
-    7986: 'ALetter',
-    7987: 'ALetter',
-    7988: 'ALetter',
-    7989: 'ALetter',
-    7990: 'ALetter',
-    7991: 'ALetter',
-    7992: 'ALetter',
-    7993: 'ALetter',
-    7994: 'ALetter',
-    7995: 'ALetter',
-    7996: 'ALetter',
-    7997: 'ALetter',
-    7998: 'ALetter',
-    7999: 'ALetter',
-    8000: 'ALetter',
-    8001: 'ALetter',
-    8002: 'ALetter',
-    8003: 'ALetter',
-    8004: 'ALetter',
-    8005: 'ALetter',
-    8008: 'ALetter',
-    8009: 'ALetter',
-    8010: 'ALetter',
-    8011: 'ALetter',
-    8012: 'ALetter',
-    8013: 'ALetter',
-    8016: 'ALetter',
-    8017: 'ALetter',
-    8018: 'ALetter',
-    8019: 'ALetter',
-    8020: 'ALetter',
-    8021: 'ALetter',
-    8022: 'ALetter',
-    8023: 'ALetter',
-    8025: 'ALetter',
-    8027: 'ALetter',
-    8029: 'ALetter',
-    8031: 'ALetter',
-    8032: 'ALetter',
-    8033: 'ALetter',
-    8034: 'ALetter',
-    8035: 'ALetter',
-    8036: 'ALetter',
-    8037: 'ALetter',
-    8038: 'ALetter',
-    8039: 'ALetter',
-    8040: 'ALetter',
-    8041: 'ALetter',
-    8042: 'ALetter',
-    8043: 'ALetter',
-    8044: 'ALetter',
-    8045: 'ALetter',
-    8046: 'ALetter',
-    8047: 'ALetter',
-    8048: 'ALetter',
-    8049: 'ALetter',
-    8050: 'ALetter',
-    8051: 'ALetter',
-    8052: 'ALetter',
-    8053: 'ALetter',
-    8054: 'ALetter',
-    8055: 'ALetter',
-    8056: 'ALetter',
-    8057: 'ALetter',
-    8058: 'ALetter',
-    8059: 'ALetter',
-    8060: 'ALetter',
-    8061: 'ALetter',
-    8064: 'ALetter',
-    8065: 'ALetter',
-    8066: 'ALetter',
-    8067: 'ALetter',
-    8068: 'ALetter',
-    8069: 'ALetter',
-    8070: 'ALetter',
-    8071: 'ALetter',
-    8072: 'ALetter',
-    8073: 'ALetter',
-    8074: 'ALetter',
-    8075: 'ALetter',
-    8076: 'ALetter',
-    8077: 'ALetter',
-    8078: 'ALetter',
-    8079: 'ALetter',
-    8080: 'ALetter',
-    8081: 'ALetter',
-    8082: 'ALetter',
-    8083: 'ALetter',
-    8084: 'ALetter',
-    8085: 'ALetter',
-    8086: 'ALetter',
-    8087: 'ALetter',
-    8088: 'ALetter',
-    8089: 'ALetter',
-    8090: 'ALetter',
-    8091: 'ALetter',
-    8092: 'ALetter',
-    8093: 'ALetter',
-    8094: 'ALetter',
-    8095: 'ALetter',
-    8096: 'ALetter',
-    8097: 'ALetter',
-    8098: 'ALetter',
-    8099: 'ALetter',
-    8100: 'ALetter',
-    8101: 'ALetter',
-    8102: 'ALetter',
-    8103: 'ALetter',
-    8104: 'ALetter',
-    8105: 'ALetter',
-    8106: 'ALetter',
-    8107: 'ALetter',
-    8108: 'ALetter',
-    8109: 'ALetter',
-    8110: 'ALetter',
-    8111: 'ALetter',
-    8112: 'ALetter',
-    8113: 'ALetter',
-    8114: 'ALetter',
-    8115: 'ALetter',
-    8116: 'ALetter',
-    8118: 'ALetter',
-    8119: 'ALetter',
-    8120: 'ALetter',
-    8121: 'ALetter',
-    8122: 'ALetter',
-    8123: 'ALetter',
-    8124: 'ALetter',
-    8126: 'ALetter',
-    8130: 'ALetter',
-    8131: 'ALetter',
-    8132: 'ALetter',
-    8134: 'ALetter',
-    8135: 'ALetter',
-    8136: 'ALetter',
-    8137: 'ALetter',
-    8138: 'ALetter',
-    8139: 'ALetter',
-    8140: 'ALetter',
-    8144: 'ALetter',
-    8145: 'ALetter',
-    8146: 'ALetter',
-    8147: 'ALetter',
-    8150: 'ALetter',
-    8151: 'ALetter',
-    8152: 'ALetter',
-    8153: 'ALetter',
-    8154: 'ALetter',
-    8155: 'ALetter',
-    8160: 'ALetter',
-    8161: 'ALetter',
-    8162: 'ALetter',
-    8163: 'ALetter',
-    8164: 'ALetter',
-    8165: 'ALetter',
-    8166: 'ALetter',
-    8167: 'ALetter',
-    8168: 'ALetter',
-    8169: 'ALetter',
-    8170: 'ALetter',
-    8171: 'ALetter',
-    8172: 'ALetter',
-    8178: 'ALetter',
-    8179: 'ALetter',
-    8180: 'ALetter',
-    8182: 'ALetter',
-    8183: 'ALetter',
-    8184: 'ALetter',
-    8185: 'ALetter',
-    8186: 'ALetter',
-    8187: 'ALetter',
-    8188: 'ALetter',
-    8203: 'Format',
-    8206: 'Format',
-    8207: 'Format',
-    8217: 'MidLetter',
-    8231: 'MidLetter',
-    8234: 'Format',
-    8235: 'Format',
-    8236: 'Format',
-    8237: 'Format',
-    8238: 'Format',
-    8255: 'ExtendNumLet',
-    8256: 'ExtendNumLet',
-    8260: 'MidNum',
-    8276: 'ExtendNumLet',
-    8288: 'Format',
-    8289: 'Format',
-    8290: 'Format',
-    8291: 'Format',
-    8298: 'Format',
-    8299: 'Format',
-    8300: 'Format',
-    8301: 'Format',
-    8302: 'Format',
-    8303: 'Format',
-    8305: 'ALetter',
-    8319: 'ALetter',
-    8336: 'ALetter',
-    8337: 'ALetter',
-    8338: 'ALetter',
-    8339: 'ALetter',
-    8340: 'ALetter',
-    8450: 'ALetter',
-    8455: 'ALetter',
-    8458: 'ALetter',
-    8459: 'ALetter',
-    8460: 'ALetter',
-    8461: 'ALetter',
-    8462: 'ALetter',
-    8463: 'ALetter',
-    8464: 'ALetter',
-    8465: 'ALetter',
-    8466: 'ALetter',
-    8467: 'ALetter',
-    8469: 'ALetter',
-    8473: 'ALetter',
-    8474: 'ALetter',
-    8475: 'ALetter',
-    8476: 'ALetter',
-    8477: 'ALetter',
-    8484: 'ALetter',
-    8486: 'ALetter',
-    8488: 'ALetter',
-    8490: 'ALetter',
-    8491: 'ALetter',
-    8492: 'ALetter',
-    8493: 'ALetter',
-    8495: 'ALetter',
-    8496: 'ALetter',
-    8497: 'ALetter',
-    8498: 'ALetter',
-    8499: 'ALetter',
-    8500: 'ALetter',
-    8501: 'ALetter',
-    8502: 'ALetter',
-    8503: 'ALetter',
-    8504: 'ALetter',
-    8505: 'ALetter',
-    8508: 'ALetter',
-    8509: 'ALetter',
-    8510: 'ALetter',
-    8511: 'ALetter',
-    8517: 'ALetter',
-    8518: 'ALetter',
-    8519: 'ALetter',
-    8520: 'ALetter',
-    8521: 'ALetter',
-    8526: 'ALetter',
-    8544: 'ALetter',
-    8545: 'ALetter',
-    8546: 'ALetter',
-    8547: 'ALetter',
-    8548: 'ALetter',
-    8549: 'ALetter',
-    8550: 'ALetter',
-    8551: 'ALetter',
-    8552: 'ALetter',
-    8553: 'ALetter',
-    8554: 'ALetter',
-    8555: 'ALetter',
-    8556: 'ALetter',
-    8557: 'ALetter',
-    8558: 'ALetter',
-    8559: 'ALetter',
-    8560: 'ALetter',
-    8561: 'ALetter',
-    8562: 'ALetter',
-    8563: 'ALetter',
-    8564: 'ALetter',
-    8565: 'ALetter',
-    8566: 'ALetter',
-    8567: 'ALetter',
-    8568: 'ALetter',
-    8569: 'ALetter',
-    8570: 'ALetter',
-    8571: 'ALetter',
-    8572: 'ALetter',
-    8573: 'ALetter',
-    8574: 'ALetter',
-    8575: 'ALetter',
-    8576: 'ALetter',
-    8577: 'ALetter',
-    8578: 'ALetter',
-    8579: 'ALetter',
-    8580: 'ALetter',
-    9398: 'ALetter',
-    9399: 'ALetter',
-    9400: 'ALetter',
-    9401: 'ALetter',
-    9402: 'ALetter',
-    9403: 'ALetter',
-    9404: 'ALetter',
-    9405: 'ALetter',
-    9406: 'ALetter',
-    9407: 'ALetter',
-    9408: 'ALetter',
-    9409: 'ALetter',
-    9410: 'ALetter',
-    9411: 'ALetter',
-    9412: 'ALetter',
-    9413: 'ALetter',
-    9414: 'ALetter',
-    9415: 'ALetter',
-    9416: 'ALetter',
-    9417: 'ALetter',
-    9418: 'ALetter',
-    9419: 'ALetter',
-    9420: 'ALetter',
-    9421: 'ALetter',
-    9422: 'ALetter',
-    9423: 'ALetter',
-    9424: 'ALetter',
-    9425: 'ALetter',
-    9426: 'ALetter',
-    9427: 'ALetter',
-    9428: 'ALetter',
-    9429: 'ALetter',
-    9430: 'ALetter',
-    9431: 'ALetter',
-    9432: 'ALetter',
-    9433: 'ALetter',
-    9434: 'ALetter',
-    9435: 'ALetter',
-    9436: 'ALetter',
-    9437: 'ALetter',
-    9438: 'ALetter',
-    9439: 'ALetter',
-    9440: 'ALetter',
-    9441: 'ALetter',
-    9442: 'ALetter',
-    9443: 'ALetter',
-    9444: 'ALetter',
-    9445: 'ALetter',
-    9446: 'ALetter',
-    9447: 'ALetter',
-    9448: 'ALetter',
-    9449: 'ALetter',
-    11264: 'ALetter',
-    11265: 'ALetter',
-    11266: 'ALetter',
-    11267: 'ALetter',
-    11268: 'ALetter',
-    11269: 'ALetter',
-    11270: 'ALetter',
-    11271: 'ALetter',
-    11272: 'ALetter',
-    11273: 'ALetter',
-    11274: 'ALetter',
-    11275: 'ALetter',
-    11276: 'ALetter',
-    11277: 'ALetter',
-    11278: 'ALetter',
-    11279: 'ALetter',
-    11280: 'ALetter',
-    11281: 'ALetter',
-    11282: 'ALetter',
-    11283: 'ALetter',
-    11284: 'ALetter',
-    11285: 'ALetter',
-    11286: 'ALetter',
-    11287: 'ALetter',
-    11288: 'ALetter',
-    11289: 'ALetter',
-    11290: 'ALetter',
-    11291: 'ALetter',
-    11292: 'ALetter',
-    11293: 'ALetter',
-    11294: 'ALetter',
-    11295: 'ALetter',
-    11296: 'ALetter',
-    11297: 'ALetter',
-    11298: 'ALetter',
-    11299: 'ALetter',
-    11300: 'ALetter',
-    11301: 'ALetter',
-    11302: 'ALetter',
-    11303: 'ALetter',
-    11304: 'ALetter',
-    11305: 'ALetter',
-    11306: 'ALetter',
-    11307: 'ALetter',
-    11308: 'ALetter',
-    11309: 'ALetter',
-    11310: 'ALetter',
-    11312: 'ALetter',
-    11313: 'ALetter',
-    11314: 'ALetter',
-    11315: 'ALetter',
-    11316: 'ALetter',
-    11317: 'ALetter',
-    11318: 'ALetter',
-    11319: 'ALetter',
-    11320: 'ALetter',
-    11321: 'ALetter',
-    11322: 'ALetter',
-    11323: 'ALetter',
-    11324: 'ALetter',
-    11325: 'ALetter',
-    11326: 'ALetter',
-    11327: 'ALetter',
-    11328: 'ALetter',
-    11329: 'ALetter',
-    11330: 'ALetter',
-    11331: 'ALetter',
-    11332: 'ALetter',
-    11333: 'ALetter',
-    11334: 'ALetter',
-    11335: 'ALetter',
-    11336: 'ALetter',
-    11337: 'ALetter',
-    11338: 'ALetter',
-    11339: 'ALetter',
-    11340: 'ALetter',
-    11341: 'ALetter',
-    11342: 'ALetter',
-    11343: 'ALetter',
-    11344: 'ALetter',
-    11345: 'ALetter',
-    11346: 'ALetter',
-    11347: 'ALetter',
-    11348: 'ALetter',
-    11349: 'ALetter',
-    11350: 'ALetter',
-    11351: 'ALetter',
-    11352: 'ALetter',
-    11353: 'ALetter',
-    11354: 'ALetter',
-    11355: 'ALetter',
-    11356: 'ALetter',
-    11357: 'ALetter',
-    11358: 'ALetter',
-    11360: 'ALetter',
-    11361: 'ALetter',
-    11362: 'ALetter',
-    11363: 'ALetter',
-    11364: 'ALetter',
-    11365: 'ALetter',
-    11366: 'ALetter',
-    11367: 'ALetter',
-    11368: 'ALetter',
-    11369: 'ALetter',
-    11370: 'ALetter',
-    11371: 'ALetter',
-    11372: 'ALetter',
-    11380: 'ALetter',
-    11381: 'ALetter',
-    11382: 'ALetter',
-    11383: 'ALetter',
-    11392: 'ALetter',
-    11393: 'ALetter',
-    11394: 'ALetter',
-    11395: 'ALetter',
-    11396: 'ALetter',
-    11397: 'ALetter',
-    11398: 'ALetter',
-    11399: 'ALetter',
-    11400: 'ALetter',
-    11401: 'ALetter',
-    11402: 'ALetter',
-    11403: 'ALetter',
-    11404: 'ALetter',
-    11405: 'ALetter',
-    11406: 'ALetter',
-    11407: 'ALetter',
-    11408: 'ALetter',
-    11409: 'ALetter',
-    11410: 'ALetter',
-    11411: 'ALetter',
-    11412: 'ALetter',
-    11413: 'ALetter',
-    11414: 'ALetter',
-    11415: 'ALetter',
-    11416: 'ALetter',
-    11417: 'ALetter',
-    11418: 'ALetter',
-    11419: 'ALetter',
-    11420: 'ALetter',
-    11421: 'ALetter',
-    11422: 'ALetter',
-    11423: 'ALetter',
-    11424: 'ALetter',
-    11425: 'ALetter',
-    11426: 'ALetter',
-    11427: 'ALetter',
-    11428: 'ALetter',
-    11429: 'ALetter',
-    11430: 'ALetter',
-    11431: 'ALetter',
-    11432: 'ALetter',
-    11433: 'ALetter',
-    11434: 'ALetter',
-    11435: 'ALetter',
-    11436: 'ALetter',
-    11437: 'ALetter',
-    11438: 'ALetter',
-    11439: 'ALetter',
-    11440: 'ALetter',
-    11441: 'ALetter',
-    11442: 'ALetter',
-    11443: 'ALetter',
-    11444: 'ALetter',
-    11445: 'ALetter',
-    11446: 'ALetter',
-    11447: 'ALetter',
-    11448: 'ALetter',
-    11449: 'ALetter',
-    11450: 'ALetter',
-    11451: 'ALetter',
-    11452: 'ALetter',
-    11453: 'ALetter',
-    11454: 'ALetter',
-    11455: 'ALetter',
-    11456: 'ALetter',
-    11457: 'ALetter',
-    11458: 'ALetter',
-    11459: 'ALetter',
-    11460: 'ALetter',
-    11461: 'ALetter',
-    11462: 'ALetter',
-    11463: 'ALetter',
-    11464: 'ALetter',
-    11465: 'ALetter',
-    11466: 'ALetter',
-    11467: 'ALetter',
-    11468: 'ALetter',
-    11469: 'ALetter',
-    11470: 'ALetter',
-    11471: 'ALetter',
-    11472: 'ALetter',
-    11473: 'ALetter',
-    11474: 'ALetter',
-    11475: 'ALetter',
-    11476: 'ALetter',
-    11477: 'ALetter',
-    11478: 'ALetter',
-    11479: 'ALetter',
-    11480: 'ALetter',
-    11481: 'ALetter',
-    11482: 'ALetter',
-    11483: 'ALetter',
-    11484: 'ALetter',
-    11485: 'ALetter',
-    11486: 'ALetter',
-    11487: 'ALetter',
-    11488: 'ALetter',
-    11489: 'ALetter',
-    11490: 'ALetter',
-    11491: 'ALetter',
-    11492: 'ALetter',
-    11520: 'ALetter',
-    11521: 'ALetter',
-    11522: 'ALetter',
-    11523: 'ALetter',
-    11524: 'ALetter',
-    11525: 'ALetter',
-    11526: 'ALetter',
-    11527: 'ALetter',
-    11528: 'ALetter',
-    11529: 'ALetter',
-    11530: 'ALetter',
-    11531: 'ALetter',
-    11532: 'ALetter',
-    11533: 'ALetter',
-    11534: 'ALetter',
-    11535: 'ALetter',
-    11536: 'ALetter',
-    11537: 'ALetter',
-    11538: 'ALetter',
-    11539: 'ALetter',
-    11540: 'ALetter',
-    11541: 'ALetter',
-    11542: 'ALetter',
-    11543: 'ALetter',
-    11544: 'ALetter',
-    11545: 'ALetter',
-    11546: 'ALetter',
-    11547: 'ALetter',
-    11548: 'ALetter',
-    11549: 'ALetter',
-    11550: 'ALetter',
-    11551: 'ALetter',
-    11552: 'ALetter',
-    11553: 'ALetter',
-    11554: 'ALetter',
-    11555: 'ALetter',
-    11556: 'ALetter',
-    11557: 'ALetter',
-    11568: 'ALetter',
-    11569: 'ALetter',
-    11570: 'ALetter',
-    11571: 'ALetter',
-    11572: 'ALetter',
-    11573: 'ALetter',
-    11574: 'ALetter',
-    11575: 'ALetter',
-    11576: 'ALetter',
-    11577: 'ALetter',
-    11578: 'ALetter',
-    11579: 'ALetter',
-    11580: 'ALetter',
-    11581: 'ALetter',
-    11582: 'ALetter',
-    11583: 'ALetter',
-    11584: 'ALetter',
-    11585: 'ALetter',
-    11586: 'ALetter',
-    11587: 'ALetter',
-    11588: 'ALetter',
-    11589: 'ALetter',
-    11590: 'ALetter',
-    11591: 'ALetter',
-    11592: 'ALetter',
-    11593: 'ALetter',
-    11594: 'ALetter',
-    11595: 'ALetter',
-    11596: 'ALetter',
-    11597: 'ALetter',
-    11598: 'ALetter',
-    11599: 'ALetter',
-    11600: 'ALetter',
-    11601: 'ALetter',
-    11602: 'ALetter',
-    11603: 'ALetter',
-    11604: 'ALetter',
-    11605: 'ALetter',
-    11606: 'ALetter',
-    11607: 'ALetter',
-    11608: 'ALetter',
-    11609: 'ALetter',
-    11610: 'ALetter',
-    11611: 'ALetter',
-    11612: 'ALetter',
-    11613: 'ALetter',
-    11614: 'ALetter',
-    11615: 'ALetter',
-    11616: 'ALetter',
-    11617: 'ALetter',
-    11618: 'ALetter',
-    11619: 'ALetter',
-    11620: 'ALetter',
-    11621: 'ALetter',
-    11631: 'ALetter',
-    11648: 'ALetter',
-    11649: 'ALetter',
-    11650: 'ALetter',
-    11651: 'ALetter',
-    11652: 'ALetter',
-    11653: 'ALetter',
-    11654: 'ALetter',
-    11655: 'ALetter',
-    11656: 'ALetter',
-    11657: 'ALetter',
-    11658: 'ALetter',
-    11659: 'ALetter',
-    11660: 'ALetter',
-    11661: 'ALetter',
-    11662: 'ALetter',
-    11663: 'ALetter',
-    11664: 'ALetter',
-    11665: 'ALetter',
-    11666: 'ALetter',
-    11667: 'ALetter',
-    11668: 'ALetter',
-    11669: 'ALetter',
-    11670: 'ALetter',
-    11680: 'ALetter',
-    11681: 'ALetter',
-    11682: 'ALetter',
-    11683: 'ALetter',
-    11684: 'ALetter',
-    11685: 'ALetter',
-    11686: 'ALetter',
-    11688: 'ALetter',
-    11689: 'ALetter',
-    11690: 'ALetter',
-    11691: 'ALetter',
-    11692: 'ALetter',
-    11693: 'ALetter',
-    11694: 'ALetter',
-    11696: 'ALetter',
-    11697: 'ALetter',
-    11698: 'ALetter',
-    11699: 'ALetter',
-    11700: 'ALetter',
-    11701: 'ALetter',
-    11702: 'ALetter',
-    11704: 'ALetter',
-    11705: 'ALetter',
-    11706: 'ALetter',
-    11707: 'ALetter',
-    11708: 'ALetter',
-    11709: 'ALetter',
-    11710: 'ALetter',
-    11712: 'ALetter',
-    11713: 'ALetter',
-    11714: 'ALetter',
-    11715: 'ALetter',
-    11716: 'ALetter',
-    11717: 'ALetter',
-    11718: 'ALetter',
-    11720: 'ALetter',
-    11721: 'ALetter',
-    11722: 'ALetter',
-    11723: 'ALetter',
-    11724: 'ALetter',
-    11725: 'ALetter',
-    11726: 'ALetter',
-    11728: 'ALetter',
-    11729: 'ALetter',
-    11730: 'ALetter',
-    11731: 'ALetter',
-    11732: 'ALetter',
-    11733: 'ALetter',
-    11734: 'ALetter',
-    11736: 'ALetter',
-    11737: 'ALetter',
-    11738: 'ALetter',
-    11739: 'ALetter',
-    11740: 'ALetter',
-    11741: 'ALetter',
-    11742: 'ALetter',
-    12293: 'ALetter',
-    12337: 'Katakana',
-    12338: 'Katakana',
-    12339: 'Katakana',
-    12340: 'Katakana',
-    12341: 'Katakana',
-    12347: 'ALetter',
-    12348: 'ALetter',
-    12443: 'Katakana',
-    12444: 'Katakana',
-    12448: 'Katakana',
-    12449: 'Katakana',
-    12450: 'Katakana',
-    12451: 'Katakana',
-    12452: 'Katakana',
-    12453: 'Katakana',
-    12454: 'Katakana',
-    12455: 'Katakana',
-    12456: 'Katakana',
-    12457: 'Katakana',
-    12458: 'Katakana',
-    12459: 'Katakana',
-    12460: 'Katakana',
-    12461: 'Katakana',
-    12462: 'Katakana',
-    12463: 'Katakana',
-    12464: 'Katakana',
-    12465: 'Katakana',
-    12466: 'Katakana',
-    12467: 'Katakana',
-    12468: 'Katakana',
-    12469: 'Katakana',
-    12470: 'Katakana',
-    12471: 'Katakana',
-    12472: 'Katakana',
-    12473: 'Katakana',
-    12474: 'Katakana',
-    12475: 'Katakana',
-    12476: 'Katakana',
-    12477: 'Katakana',
-    12478: 'Katakana',
-    12479: 'Katakana',
-    12480: 'Katakana',
-    12481: 'Katakana',
-    12482: 'Katakana',
-    12483: 'Katakana',
-    12484: 'Katakana',
-    12485: 'Katakana',
-    12486: 'Katakana',
-    12487: 'Katakana',
-    12488: 'Katakana',
-    12489: 'Katakana',
-    12490: 'Katakana',
-    12491: 'Katakana',
-    12492: 'Katakana',
-    12493: 'Katakana',
-    12494: 'Katakana',
-    12495: 'Katakana',
-    12496: 'Katakana',
-    12497: 'Katakana',
-    12498: 'Katakana',
-    12499: 'Katakana',
-    12500: 'Katakana',
-    12501: 'Katakana',
-    12502: 'Katakana',
-    12503: 'Katakana',
-    12504: 'Katakana',
-    12505: 'Katakana',
-    12506: 'Katakana',
-    12507: 'Katakana',
-    12508: 'Katakana',
-    12509: 'Katakana',
-    12510: 'Katakana',
-    12511: 'Katakana',
-    12512: 'Katakana',
-    12513: 'Katakana',
-    12514: 'Katakana',
-    12515: 'Katakana',
-    12516: 'Katakana',
-    12517: 'Katakana',
-    12518: 'Katakana',
-    12519: 'Katakana',
-    12520: 'Katakana',
-    12521: 'Katakana',
-    12522: 'Katakana',
-    12523: 'Katakana',
-    12524: 'Katakana',
-    12525: 'Katakana',
-    12526: 'Katakana',
-    12527: 'Katakana',
-    12528: 'Katakana',
-    12529: 'Katakana',
-    12530: 'Katakana',
-    12531: 'Katakana',
-    12532: 'Katakana',
-    12533: 'Katakana',
-    12534: 'Katakana',
-    12535: 'Katakana',
-    12536: 'Katakana',
-    12537: 'Katakana',
-    12538: 'Katakana',
-    12540: 'Katakana',
-    12541: 'Katakana',
-    12542: 'Katakana',
-    12543: 'Katakana',
-    12549: 'ALetter',
-    12550: 'ALetter',
-    12551: 'ALetter',
-    12552: 'ALetter',
-    12553: 'ALetter',
-    12554: 'ALetter',
-    12555: 'ALetter',
-    12556: 'ALetter',
-    12557: 'ALetter',
-    12558: 'ALetter',
-    12559: 'ALetter',
-    12560: 'ALetter',
-    12561: 'ALetter',
-    12562: 'ALetter',
-    12563: 'ALetter',
-    12564: 'ALetter',
-    12565: 'ALetter',
-    12566: 'ALetter',
-    12567: 'ALetter',
-    12568: 'ALetter',
-    12569: 'ALetter',
-    12570: 'ALetter',
-    12571: 'ALetter',
-    12572: 'ALetter',
-    12573: 'ALetter',
-    12574: 'ALetter',
-    12575: 'ALetter',
-    12576: 'ALetter',
-    12577: 'ALetter',
-    12578: 'ALetter',
-    12579: 'ALetter',
-    12580: 'ALetter',
-    12581: 'ALetter',
-    12582: 'ALetter',
-    12583: 'ALetter',
-    12584: 'ALetter',
-    12585: 'ALetter',
-    12586: 'ALetter',
-    12587: 'ALetter',
-    12588: 'ALetter',
-    12593: 'ALetter',
-    12594: 'ALetter',
-    12595: 'ALetter',
-    12596: 'ALetter',
-    12597: 'ALetter',
-    12598: 'ALetter',
-    12599: 'ALetter',
-    12600: 'ALetter',
-    12601: 'ALetter',
-    12602: 'ALetter',
-    12603: 'ALetter',
-    12604: 'ALetter',
-    12605: 'ALetter',
-    12606: 'ALetter',
-    12607: 'ALetter',
-    12608: 'ALetter',
-    12609: 'ALetter',
-    12610: 'ALetter',
-    12611: 'ALetter',
-    12612: 'ALetter',
-    12613: 'ALetter',
-    12614: 'ALetter',
-    12615: 'ALetter',
-    12616: 'ALetter',
-    12617: 'ALetter',
-    12618: 'ALetter',
-    12619: 'ALetter',
-    12620: 'ALetter',
-    12621: 'ALetter',
-    12622: 'ALetter',
-    12623: 'ALetter',
-    12624: 'ALetter',
-    12625: 'ALetter',
-    12626: 'ALetter',
-    12627: 'ALetter',
-    12628: 'ALetter',
-    12629: 'ALetter',
-    12630: 'ALetter',
-    12631: 'ALetter',
-    12632: 'ALetter',
-    12633: 'ALetter',
-    12634: 'ALetter',
-    12635: 'ALetter',
-    12636: 'ALetter',
-    12637: 'ALetter',
-    12638: 'ALetter',
-    12639: 'ALetter',
-    12640: 'ALetter',
-    12641: 'ALetter',
-    12642: 'ALetter',
-    12643: 'ALetter',
-    12644: 'ALetter',
-    12645: 'ALetter',
-    12646: 'ALetter',
-    12647: 'ALetter',
-    12648: 'ALetter',
-    12649: 'ALetter',
-    12650: 'ALetter',
-    12651: 'ALetter',
-    12652: 'ALetter',
-    12653: 'ALetter',
-    12654: 'ALetter',
-    12655: 'ALetter',
-    12656: 'ALetter',
-    12657: 'ALetter',
-    12658: 'ALetter',
-    12659: 'ALetter',
-    12660: 'ALetter',
-    12661: 'ALetter',
-    12662: 'ALetter',
-    12663: 'ALetter',
-    12664: 'ALetter',
-    12665: 'ALetter',
-    12666: 'ALetter',
-    12667: 'ALetter',
-    12668: 'ALetter',
-    12669: 'ALetter',
-    12670: 'ALetter',
-    12671: 'ALetter',
-    12672: 'ALetter',
-    12673: 'ALetter',
-    12674: 'ALetter',
-    12675: 'ALetter',
-    12676: 'ALetter',
-    12677: 'ALetter',
-    12678: 'ALetter',
-    12679: 'ALetter',
-    12680: 'ALetter',
-    12681: 'ALetter',
-    12682: 'ALetter',
-    12683: 'ALetter',
-    12684: 'ALetter',
-    12685: 'ALetter',
-    12686: 'ALetter',
-    12704: 'ALetter',
-    12705: 'ALetter',
-    12706: 'ALetter',
-    12707: 'ALetter',
-    12708: 'ALetter',
-    12709: 'ALetter',
-    12710: 'ALetter',
-    12711: 'ALetter',
-    12712: 'ALetter',
-    12713: 'ALetter',
-    12714: 'ALetter',
-    12715: 'ALetter',
-    12716: 'ALetter',
-    12717: 'ALetter',
-    12718: 'ALetter',
-    12719: 'ALetter',
-    12720: 'ALetter',
-    12721: 'ALetter',
-    12722: 'ALetter',
-    12723: 'ALetter',
-    12724: 'ALetter',
-    12725: 'ALetter',
-    12726: 'ALetter',
-    12727: 'ALetter',
-    12784: 'Katakana',
-    12785: 'Katakana',
-    12786: 'Katakana',
-    12787: 'Katakana',
-    12788: 'Katakana',
-    12789: 'Katakana',
-    12790: 'Katakana',
-    12791: 'Katakana',
-    12792: 'Katakana',
-    12793: 'Katakana',
-    12794: 'Katakana',
-    12795: 'Katakana',
-    12796: 'Katakana',
-    12797: 'Katakana',
-    12798: 'Katakana',
-    12799: 'Katakana',
-    40960: 'ALetter',
-    40961: 'ALetter',
-    40962: 'ALetter',
-    40963: 'ALetter',
-    40964: 'ALetter',
-    40965: 'ALetter',
-    40966: 'ALetter',
-    40967: 'ALetter',
-    40968: 'ALetter',
-    40969: 'ALetter',
-    40970: 'ALetter',
-    40971: 'ALetter',
-    40972: 'ALetter',
-    40973: 'ALetter',
-    40974: 'ALetter',
-    40975: 'ALetter',
-    40976: 'ALetter',
-    40977: 'ALetter',
-    40978: 'ALetter',
-    40979: 'ALetter',
-    40980: 'ALetter',
-    40981: 'ALetter',
-    40982: 'ALetter',
-    40983: 'ALetter',
-    40984: 'ALetter',
-    40985: 'ALetter',
-    40986: 'ALetter',
-    40987: 'ALetter',
-    40988: 'ALetter',
-    40989: 'ALetter',
-    40990: 'ALetter',
-    40991: 'ALetter',
-    40992: 'ALetter',
-    40993: 'ALetter',
-    40994: 'ALetter',
-    40995: 'ALetter',
-    40996: 'ALetter',
-    40997: 'ALetter',
-    40998: 'ALetter',
-    40999: 'ALetter',
-    41000: 'ALetter',
-    41001: 'ALetter',
-    41002: 'ALetter',
-    41003: 'ALetter',
-    41004: 'ALetter',
-    41005: 'ALetter',
-    41006: 'ALetter',
-    41007: 'ALetter',
-    41008: 'ALetter',
-    41009: 'ALetter',
-    41010: 'ALetter',
-    41011: 'ALetter',
-    41012: 'ALetter',
-    41013: 'ALetter',
-    41014: 'ALetter',
-    41015: 'ALetter',
-    41016: 'ALetter',
-    41017: 'ALetter',
-    41018: 'ALetter',
-    41019: 'ALetter',
-    41020: 'ALetter',
-    41021: 'ALetter',
-    41022: 'ALetter',
-    41023: 'ALetter',
-    41024: 'ALetter',
-    41025: 'ALetter',
-    41026: 'ALetter',
-    41027: 'ALetter',
-    41028: 'ALetter',
-    41029: 'ALetter',
-    41030: 'ALetter',
-    41031: 'ALetter',
-    41032: 'ALetter',
-    41033: 'ALetter',
-    41034: 'ALetter',
-    41035: 'ALetter',
-    41036: 'ALetter',
-    41037: 'ALetter',
-    41038: 'ALetter',
-    41039: 'ALetter',
-    41040: 'ALetter',
-    41041: 'ALetter',
-    41042: 'ALetter',
-    41043: 'ALetter',
-    41044: 'ALetter',
-    41045: 'ALetter',
-    41046: 'ALetter',
-    41047: 'ALetter',
-    41048: 'ALetter',
-    41049: 'ALetter',
-    41050: 'ALetter',
-    41051: 'ALetter',
-    41052: 'ALetter',
-    41053: 'ALetter',
-    41054: 'ALetter',
-    41055: 'ALetter',
-    41056: 'ALetter',
-    41057: 'ALetter',
-    41058: 'ALetter',
-    41059: 'ALetter',
-    41060: 'ALetter',
-    41061: 'ALetter',
-    41062: 'ALetter',
-    41063: 'ALetter',
-    41064: 'ALetter',
-    41065: 'ALetter',
-    41066: 'ALetter',
-    41067: 'ALetter',
-    41068: 'ALetter',
-    41069: 'ALetter',
-    41070: 'ALetter',
-    41071: 'ALetter',
-    41072: 'ALetter',
-    41073: 'ALetter',
-    41074: 'ALetter',
-    41075: 'ALetter',
-    41076: 'ALetter',
-    41077: 'ALetter',
-    41078: 'ALetter',
-    41079: 'ALetter',
-    41080: 'ALetter',
-    41081: 'ALetter',
-    41082: 'ALetter',
-    41083: 'ALetter',
-    41084: 'ALetter',
-    41085: 'ALetter',
-    41086: 'ALetter',
-    41087: 'ALetter',
-    41088: 'ALetter',
-    41089: 'ALetter',
-    41090: 'ALetter',
-    41091: 'ALetter',
-    41092: 'ALetter',
-    41093: 'ALetter',
-    41094: 'ALetter',
-    41095: 'ALetter',
-    41096: 'ALetter',
-    41097: 'ALetter',
-    41098: 'ALetter',
-    41099: 'ALetter',
-    41100: 'ALetter',
-    41101: 'ALetter',
-    41102: 'ALetter',
-    41103: 'ALetter',
-    41104: 'ALetter',
-    41105: 'ALetter',
-    41106: 'ALetter',
-    41107: 'ALetter',
-    41108: 'ALetter',
-    41109: 'ALetter',
-    41110: 'ALetter',
-    41111: 'ALetter',
-    41112: 'ALetter',
-    41113: 'ALetter',
-    41114: 'ALetter',
-    41115: 'ALetter',
-    41116: 'ALetter',
-    41117: 'ALetter',
-    41118: 'ALetter',
-    41119: 'ALetter',
-    41120: 'ALetter',
-    41121: 'ALetter',
-    41122: 'ALetter',
-    41123: 'ALetter',
-    41124: 'ALetter',
-    41125: 'ALetter',
-    41126: 'ALetter',
-    41127: 'ALetter',
-    41128: 'ALetter',
-    41129: 'ALetter',
-    41130: 'ALetter',
-    41131: 'ALetter',
-    41132: 'ALetter',
-    41133: 'ALetter',
-    41134: 'ALetter',
-    41135: 'ALetter',
-    41136: 'ALetter',
-    41137: 'ALetter',
-    41138: 'ALetter',
-    41139: 'ALetter',
-    41140: 'ALetter',
-    41141: 'ALetter',
-    41142: 'ALetter',
-    41143: 'ALetter',
-    41144: 'ALetter',
-    41145: 'ALetter',
-    41146: 'ALetter',
-    41147: 'ALetter',
-    41148: 'ALetter',
-    41149: 'ALetter',
-    41150: 'ALetter',
-    41151: 'ALetter',
-    41152: 'ALetter',
-    41153: 'ALetter',
-    41154: 'ALetter',
-    41155: 'ALetter',
-    41156: 'ALetter',
-    41157: 'ALetter',
-    41158: 'ALetter',
-    41159: 'ALetter',
-    41160: 'ALetter',
-    41161: 'ALetter',
-    41162: 'ALetter',
-    41163: 'ALetter',
-    41164: 'ALetter',
-    41165: 'ALetter',
-    41166: 'ALetter',
-    41167: 'ALetter',
-    41168: 'ALetter',
-    41169: 'ALetter',
-    41170: 'ALetter',
-    41171: 'ALetter',
-    41172: 'ALetter',
-    41173: 'ALetter',
-    41174: 'ALetter',
-    41175: 'ALetter',
-    41176: 'ALetter',
-    41177: 'ALetter',
-    41178: 'ALetter',
-    41179: 'ALetter',
-    41180: 'ALetter',
-    41181: 'ALetter',
-    41182: 'ALetter',
-    41183: 'ALetter',
-    41184: 'ALetter',
-    41185: 'ALetter',
-    41186: 'ALetter',
-    41187: 'ALetter',
-    41188: 'ALetter',
-    41189: 'ALetter',
-    41190: 'ALetter',
-    41191: 'ALetter',
-    41192: 'ALetter',
-    41193: 'ALetter',
-    41194: 'ALetter',
-    41195: 'ALetter',
-    41196: 'ALetter',
-    41197: 'ALetter',
-    41198: 'ALetter',
-    41199: 'ALetter',
-    41200: 'ALetter',
-    41201: 'ALetter',
-    41202: 'ALetter',
-    41203: 'ALetter',
-    41204: 'ALetter',
-    41205: 'ALetter',
-    41206: 'ALetter',
-    41207: 'ALetter',
-    41208: 'ALetter',
-    41209: 'ALetter',
-    41210: 'ALetter',
-    41211: 'ALetter',
-    41212: 'ALetter',
-    41213: 'ALetter',
-    41214: 'ALetter',
-    41215: 'ALetter',
-    41216: 'ALetter',
-    41217: 'ALetter',
-    41218: 'ALetter',
-    41219: 'ALetter',
-    41220: 'ALetter',
-    41221: 'ALetter',
-    41222: 'ALetter',
-    41223: 'ALetter',
-    41224: 'ALetter',
-    41225: 'ALetter',
-    41226: 'ALetter',
-    41227: 'ALetter',
-    41228: 'ALetter',
-    41229: 'ALetter',
-    41230: 'ALetter',
-    41231: 'ALetter',
-    41232: 'ALetter',
-    41233: 'ALetter',
-    41234: 'ALetter',
-    41235: 'ALetter',
-    41236: 'ALetter',
-    41237: 'ALetter',
-    41238: 'ALetter',
-    41239: 'ALetter',
-    41240: 'ALetter',
-    41241: 'ALetter',
-    41242: 'ALetter',
-    41243: 'ALetter',
-    41244: 'ALetter',
-    41245: 'ALetter',
-    41246: 'ALetter',
-    41247: 'ALetter',
-    41248: 'ALetter',
-    41249: 'ALetter',
-    41250: 'ALetter',
-    41251: 'ALetter',
-    41252: 'ALetter',
-    41253: 'ALetter',
-    41254: 'ALetter',
-    41255: 'ALetter',
-    41256: 'ALetter',
-    41257: 'ALetter',
-    41258: 'ALetter',
-    41259: 'ALetter',
-    41260: 'ALetter',
-    41261: 'ALetter',
-    41262: 'ALetter',
-    41263: 'ALetter',
-    41264: 'ALetter',
-    41265: 'ALetter',
-    41266: 'ALetter',
-    41267: 'ALetter',
-    41268: 'ALetter',
-    41269: 'ALetter',
-    41270: 'ALetter',
-    41271: 'ALetter',
-    41272: 'ALetter',
-    41273: 'ALetter',
-    41274: 'ALetter',
-    41275: 'ALetter',
-    41276: 'ALetter',
-    41277: 'ALetter',
-    41278: 'ALetter',
-    41279: 'ALetter',
-    41280: 'ALetter',
-    41281: 'ALetter',
-    41282: 'ALetter',
-    41283: 'ALetter',
-    41284: 'ALetter',
-    41285: 'ALetter',
-    41286: 'ALetter',
-    41287: 'ALetter',
-    41288: 'ALetter',
-    41289: 'ALetter',
-    41290: 'ALetter',
-    41291: 'ALetter',
-    41292: 'ALetter',
-    41293: 'ALetter',
-    41294: 'ALetter',
-    41295: 'ALetter',
-    41296: 'ALetter',
-    41297: 'ALetter',
-    41298: 'ALetter',
-    41299: 'ALetter',
-    41300: 'ALetter',
-    41301: 'ALetter',
-    41302: 'ALetter',
-    41303: 'ALetter',
-    41304: 'ALetter',
-    41305: 'ALetter',
-    41306: 'ALetter',
-    41307: 'ALetter',
-    41308: 'ALetter',
-    41309: 'ALetter',
-    41310: 'ALetter',
-    41311: 'ALetter',
-    41312: 'ALetter',
-    41313: 'ALetter',
-    41314: 'ALetter',
-    41315: 'ALetter',
-    41316: 'ALetter',
-    41317: 'ALetter',
-    41318: 'ALetter',
-    41319: 'ALetter',
-    41320: 'ALetter',
-    41321: 'ALetter',
-    41322: 'ALetter',
-    41323: 'ALetter',
-    41324: 'ALetter',
-    41325: 'ALetter',
-    41326: 'ALetter',
-    41327: 'ALetter',
-    41328: 'ALetter',
-    41329: 'ALetter',
-    41330: 'ALetter',
-    41331: 'ALetter',
-    41332: 'ALetter',
-    41333: 'ALetter',
-    41334: 'ALetter',
-    41335: 'ALetter',
-    41336: 'ALetter',
-    41337: 'ALetter',
-    41338: 'ALetter',
-    41339: 'ALetter',
-    41340: 'ALetter',
-    41341: 'ALetter',
-    41342: 'ALetter',
-    41343: 'ALetter',
-    41344: 'ALetter',
-    41345: 'ALetter',
-    41346: 'ALetter',
-    41347: 'ALetter',
-    41348: 'ALetter',
-    41349: 'ALetter',
-    41350: 'ALetter',
-    41351: 'ALetter',
-    41352: 'ALetter',
-    41353: 'ALetter',
-    41354: 'ALetter',
-    41355: 'ALetter',
-    41356: 'ALetter',
-    41357: 'ALetter',
-    41358: 'ALetter',
-    41359: 'ALetter',
-    41360: 'ALetter',
-    41361: 'ALetter',
-    41362: 'ALetter',
-    41363: 'ALetter',
-    41364: 'ALetter',
-    41365: 'ALetter',
-    41366: 'ALetter',
-    41367: 'ALetter',
-    41368: 'ALetter',
-    41369: 'ALetter',
-    41370: 'ALetter',
-    41371: 'ALetter',
-    41372: 'ALetter',
-    41373: 'ALetter',
-    41374: 'ALetter',
-    41375: 'ALetter',
-    41376: 'ALetter',
-    41377: 'ALetter',
-    41378: 'ALetter',
-    41379: 'ALetter',
-    41380: 'ALetter',
-    41381: 'ALetter',
-    41382: 'ALetter',
-    41383: 'ALetter',
-    41384: 'ALetter',
-    41385: 'ALetter',
-    41386: 'ALetter',
-    41387: 'ALetter',
-    41388: 'ALetter',
-    41389: 'ALetter',
-    41390: 'ALetter',
-    41391: 'ALetter',
-    41392: 'ALetter',
-    41393: 'ALetter',
-    41394: 'ALetter',
-    41395: 'ALetter',
-    41396: 'ALetter',
-    41397: 'ALetter',
-    41398: 'ALetter',
-    41399: 'ALetter',
-    41400: 'ALetter',
-    41401: 'ALetter',
-    41402: 'ALetter',
-    41403: 'ALetter',
-    41404: 'ALetter',
-    41405: 'ALetter',
-    41406: 'ALetter',
-    41407: 'ALetter',
-    41408: 'ALetter',
-    41409: 'ALetter',
-    41410: 'ALetter',
-    41411: 'ALetter',
-    41412: 'ALetter',
-    41413: 'ALetter',
-    41414: 'ALetter',
-    41415: 'ALetter',
-    41416: 'ALetter',
-    41417: 'ALetter',
-    41418: 'ALetter',
-    41419: 'ALetter',
-    41420: 'ALetter',
-    41421: 'ALetter',
-    41422: 'ALetter',
-    41423: 'ALetter',
-    41424: 'ALetter',
-    41425: 'ALetter',
-    41426: 'ALetter',
-    41427: 'ALetter',
-    41428: 'ALetter',
-    41429: 'ALetter',
-    41430: 'ALetter',
-    41431: 'ALetter',
-    41432: 'ALetter',
-    41433: 'ALetter',
-    41434: 'ALetter',
-    41435: 'ALetter',
-    41436: 'ALetter',
-    41437: 'ALetter',
-    41438: 'ALetter',
-    41439: 'ALetter',
-    41440: 'ALetter',
-    41441: 'ALetter',
-    41442: 'ALetter',
-    41443: 'ALetter',
-    41444: 'ALetter',
-    41445: 'ALetter',
-    41446: 'ALetter',
-    41447: 'ALetter',
-    41448: 'ALetter',
-    41449: 'ALetter',
-    41450: 'ALetter',
-    41451: 'ALetter',
-    41452: 'ALetter',
-    41453: 'ALetter',
-    41454: 'ALetter',
-    41455: 'ALetter',
-    41456: 'ALetter',
-    41457: 'ALetter',
-    41458: 'ALetter',
-    41459: 'ALetter',
-    41460: 'ALetter',
-    41461: 'ALetter',
-    41462: 'ALetter',
-    41463: 'ALetter',
-    41464: 'ALetter',
-    41465: 'ALetter',
-    41466: 'ALetter',
-    41467: 'ALetter',
-    41468: 'ALetter',
-    41469: 'ALetter',
-    41470: 'ALetter',
-    41471: 'ALetter',
-    41472: 'ALetter',
-    41473: 'ALetter',
-    41474: 'ALetter',
-    41475: 'ALetter',
-    41476: 'ALetter',
-    41477: 'ALetter',
-    41478: 'ALetter',
-    41479: 'ALetter',
-    41480: 'ALetter',
-    41481: 'ALetter',
-    41482: 'ALetter',
-    41483: 'ALetter',
-    41484: 'ALetter',
-    41485: 'ALetter',
-    41486: 'ALetter',
-    41487: 'ALetter',
-    41488: 'ALetter',
-    41489: 'ALetter',
-    41490: 'ALetter',
-    41491: 'ALetter',
-    41492: 'ALetter',
-    41493: 'ALetter',
-    41494: 'ALetter',
-    41495: 'ALetter',
-    41496: 'ALetter',
-    41497: 'ALetter',
-    41498: 'ALetter',
-    41499: 'ALetter',
-    41500: 'ALetter',
-    41501: 'ALetter',
-    41502: 'ALetter',
-    41503: 'ALetter',
-    41504: 'ALetter',
-    41505: 'ALetter',
-    41506: 'ALetter',
-    41507: 'ALetter',
-    41508: 'ALetter',
-    41509: 'ALetter',
-    41510: 'ALetter',
-    41511: 'ALetter',
-    41512: 'ALetter',
-    41513: 'ALetter',
-    41514: 'ALetter',
-    41515: 'ALetter',
-    41516: 'ALetter',
-    41517: 'ALetter',
-    41518: 'ALetter',
-    41519: 'ALetter',
-    41520: 'ALetter',
-    41521: 'ALetter',
-    41522: 'ALetter',
-    41523: 'ALetter',
-    41524: 'ALetter',
-    41525: 'ALetter',
-    41526: 'ALetter',
-    41527: 'ALetter',
-    41528: 'ALetter',
-    41529: 'ALetter',
-    41530: 'ALetter',
-    41531: 'ALetter',
-    41532: 'ALetter',
-    41533: 'ALetter',
-    41534: 'ALetter',
-    41535: 'ALetter',
-    41536: 'ALetter',
-    41537: 'ALetter',
-    41538: 'ALetter',
-    41539: 'ALetter',
-    41540: 'ALetter',
-    41541: 'ALetter',
-    41542: 'ALetter',
-    41543: 'ALetter',
-    41544: 'ALetter',
-    41545: 'ALetter',
-    41546: 'ALetter',
-    41547: 'ALetter',
-    41548: 'ALetter',
-    41549: 'ALetter',
-    41550: 'ALetter',
-    41551: 'ALetter',
-    41552: 'ALetter',
-    41553: 'ALetter',
-    41554: 'ALetter',
-    41555: 'ALetter',
-    41556: 'ALetter',
-    41557: 'ALetter',
-    41558: 'ALetter',
-    41559: 'ALetter',
-    41560: 'ALetter',
-    41561: 'ALetter',
-    41562: 'ALetter',
-    41563: 'ALetter',
-    41564: 'ALetter',
-    41565: 'ALetter',
-    41566: 'ALetter',
-    41567: 'ALetter',
-    41568: 'ALetter',
-    41569: 'ALetter',
-    41570: 'ALetter',
-    41571: 'ALetter',
-    41572: 'ALetter',
-    41573: 'ALetter',
-    41574: 'ALetter',
-    41575: 'ALetter',
-    41576: 'ALetter',
-    41577: 'ALetter',
-    41578: 'ALetter',
-    41579: 'ALetter',
-    41580: 'ALetter',
-    41581: 'ALetter',
-    41582: 'ALetter',
-    41583: 'ALetter',
-    41584: 'ALetter',
-    41585: 'ALetter',
-    41586: 'ALetter',
-    41587: 'ALetter',
-    41588: 'ALetter',
-    41589: 'ALetter',
-    41590: 'ALetter',
-    41591: 'ALetter',
-    41592: 'ALetter',
-    41593: 'ALetter',
-    41594: 'ALetter',
-    41595: 'ALetter',
-    41596: 'ALetter',
-    41597: 'ALetter',
-    41598: 'ALetter',
-    41599: 'ALetter',
-    41600: 'ALetter',
-    41601: 'ALetter',
-    41602: 'ALetter',
-    41603: 'ALetter',
-    41604: 'ALetter',
-    41605: 'ALetter',
-    41606: 'ALetter',
-    41607: 'ALetter',
-    41608: 'ALetter',
-    41609: 'ALetter',
-    41610: 'ALetter',
-    41611: 'ALetter',
-    41612: 'ALetter',
-    41613: 'ALetter',
-    41614: 'ALetter',
-    41615: 'ALetter',
-    41616: 'ALetter',
-    41617: 'ALetter',
-    41618: 'ALetter',
-    41619: 'ALetter',
-    41620: 'ALetter',
-    41621: 'ALetter',
-    41622: 'ALetter',
-    41623: 'ALetter',
-    41624: 'ALetter',
-    41625: 'ALetter',
-    41626: 'ALetter',
-    41627: 'ALetter',
-    41628: 'ALetter',
-    41629: 'ALetter',
-    41630: 'ALetter',
-    41631: 'ALetter',
-    41632: 'ALetter',
-    41633: 'ALetter',
-    41634: 'ALetter',
-    41635: 'ALetter',
-    41636: 'ALetter',
-    41637: 'ALetter',
-    41638: 'ALetter',
-    41639: 'ALetter',
-    41640: 'ALetter',
-    41641: 'ALetter',
-    41642: 'ALetter',
-    41643: 'ALetter',
-    41644: 'ALetter',
-    41645: 'ALetter',
-    41646: 'ALetter',
-    41647: 'ALetter',
-    41648: 'ALetter',
-    41649: 'ALetter',
-    41650: 'ALetter',
-    41651: 'ALetter',
-    41652: 'ALetter',
-    41653: 'ALetter',
-    41654: 'ALetter',
-    41655: 'ALetter',
-    41656: 'ALetter',
-    41657: 'ALetter',
-    41658: 'ALetter',
-    41659: 'ALetter',
-    41660: 'ALetter',
-    41661: 'ALetter',
-    41662: 'ALetter',
-    41663: 'ALetter',
-    41664: 'ALetter',
-    41665: 'ALetter',
-    41666: 'ALetter',
-    41667: 'ALetter',
-    41668: 'ALetter',
-    41669: 'ALetter',
-    41670: 'ALetter',
-    41671: 'ALetter',
-    41672: 'ALetter',
-    41673: 'ALetter',
-    41674: 'ALetter',
-    41675: 'ALetter',
-    41676: 'ALetter',
-    41677: 'ALetter',
-    41678: 'ALetter',
-    41679: 'ALetter',
-    41680: 'ALetter',
-    41681: 'ALetter',
-    41682: 'ALetter',
-    41683: 'ALetter',
-    41684: 'ALetter',
-    41685: 'ALetter',
-    41686: 'ALetter',
-    41687: 'ALetter',
-    41688: 'ALetter',
-    41689: 'ALetter',
-    41690: 'ALetter',
-    41691: 'ALetter',
-    41692: 'ALetter',
-    41693: 'ALetter',
-    41694: 'ALetter',
-    41695: 'ALetter',
-    41696: 'ALetter',
-    41697: 'ALetter',
-    41698: 'ALetter',
-    41699: 'ALetter',
-    41700: 'ALetter',
-    41701: 'ALetter',
-    41702: 'ALetter',
-    41703: 'ALetter',
-    41704: 'ALetter',
-    41705: 'ALetter',
-    41706: 'ALetter',
-    41707: 'ALetter',
-    41708: 'ALetter',
-    41709: 'ALetter',
-    41710: 'ALetter',
-    41711: 'ALetter',
-    41712: 'ALetter',
-    41713: 'ALetter',
-    41714: 'ALetter',
-    41715: 'ALetter',
-    41716: 'ALetter',
-    41717: 'ALetter',
-    41718: 'ALetter',
-    41719: 'ALetter',
-    41720: 'ALetter',
-    41721: 'ALetter',
-    41722: 'ALetter',
-    41723: 'ALetter',
-    41724: 'ALetter',
-    41725: 'ALetter',
-    41726: 'ALetter',
-    41727: 'ALetter',
-    41728: 'ALetter',
-    41729: 'ALetter',
-    41730: 'ALetter',
-    41731: 'ALetter',
-    41732: 'ALetter',
-    41733: 'ALetter',
-    41734: 'ALetter',
-    41735: 'ALetter',
-    41736: 'ALetter',
-    41737: 'ALetter',
-    41738: 'ALetter',
-    41739: 'ALetter',
-    41740: 'ALetter',
-    41741: 'ALetter',
-    41742: 'ALetter',
-    41743: 'ALetter',
-    41744: 'ALetter',
-    41745: 'ALetter',
-    41746: 'ALetter',
-    41747: 'ALetter',
-    41748: 'ALetter',
-    41749: 'ALetter',
-    41750: 'ALetter',
-    41751: 'ALetter',
-    41752: 'ALetter',
-    41753: 'ALetter',
-    41754: 'ALetter',
-    41755: 'ALetter',
-    41756: 'ALetter',
-    41757: 'ALetter',
-    41758: 'ALetter',
-    41759: 'ALetter',
-    41760: 'ALetter',
-    41761: 'ALetter',
-    41762: 'ALetter',
-    41763: 'ALetter',
-    41764: 'ALetter',
-    41765: 'ALetter',
-    41766: 'ALetter',
-    41767: 'ALetter',
-    41768: 'ALetter',
-    41769: 'ALetter',
-    41770: 'ALetter',
-    41771: 'ALetter',
-    41772: 'ALetter',
-    41773: 'ALetter',
-    41774: 'ALetter',
-    41775: 'ALetter',
-    41776: 'ALetter',
-    41777: 'ALetter',
-    41778: 'ALetter',
-    41779: 'ALetter',
-    41780: 'ALetter',
-    41781: 'ALetter',
-    41782: 'ALetter',
-    41783: 'ALetter',
-    41784: 'ALetter',
-    41785: 'ALetter',
-    41786: 'ALetter',
-    41787: 'ALetter',
-    41788: 'ALetter',
-    41789: 'ALetter',
-    41790: 'ALetter',
-    41791: 'ALetter',
-    41792: 'ALetter',
-    41793: 'ALetter',
-    41794: 'ALetter',
-    41795: 'ALetter',
-    41796: 'ALetter',
-    41797: 'ALetter',
-    41798: 'ALetter',
-    41799: 'ALetter',
-    41800: 'ALetter',
-    41801: 'ALetter',
-    41802: 'ALetter',
-    41803: 'ALetter',
-    41804: 'ALetter',
-    41805: 'ALetter',
-    41806: 'ALetter',
-    41807: 'ALetter',
-    41808: 'ALetter',
-    41809: 'ALetter',
-    41810: 'ALetter',
-    41811: 'ALetter',
-    41812: 'ALetter',
-    41813: 'ALetter',
-    41814: 'ALetter',
-    41815: 'ALetter',
-    41816: 'ALetter',
-    41817: 'ALetter',
-    41818: 'ALetter',
-    41819: 'ALetter',
-    41820: 'ALetter',
-    41821: 'ALetter',
-    41822: 'ALetter',
-    41823: 'ALetter',
-    41824: 'ALetter',
-    41825: 'ALetter',
-    41826: 'ALetter',
-    41827: 'ALetter',
-    41828: 'ALetter',
-    41829: 'ALetter',
-    41830: 'ALetter',
-    41831: 'ALetter',
-    41832: 'ALetter',
-    41833: 'ALetter',
-    41834: 'ALetter',
-    41835: 'ALetter',
-    41836: 'ALetter',
-    41837: 'ALetter',
-    41838: 'ALetter',
-    41839: 'ALetter',
-    41840: 'ALetter',
-    41841: 'ALetter',
-    41842: 'ALetter',
-    41843: 'ALetter',
-    41844: 'ALetter',
-    41845: 'ALetter',
-    41846: 'ALetter',
-    41847: 'ALetter',
-    41848: 'ALetter',
-    41849: 'ALetter',
-    41850: 'ALetter',
-    41851: 'ALetter',
-    41852: 'ALetter',
-    41853: 'ALetter',
-    41854: 'ALetter',
-    41855: 'ALetter',
-    41856: 'ALetter',
-    41857: 'ALetter',
-    41858: 'ALetter',
-    41859: 'ALetter',
-    41860: 'ALetter',
-    41861: 'ALetter',
-    41862: 'ALetter',
-    41863: 'ALetter',
-    41864: 'ALetter',
-    41865: 'ALetter',
-    41866: 'ALetter',
-    41867: 'ALetter',
-    41868: 'ALetter',
-    41869: 'ALetter',
-    41870: 'ALetter',
-    41871: 'ALetter',
-    41872: 'ALetter',
-    41873: 'ALetter',
-    41874: 'ALetter',
-    41875: 'ALetter',
-    41876: 'ALetter',
-    41877: 'ALetter',
-    41878: 'ALetter',
-    41879: 'ALetter',
-    41880: 'ALetter',
-    41881: 'ALetter',
-    41882: 'ALetter',
-    41883: 'ALetter',
-    41884: 'ALetter',
-    41885: 'ALetter',
-    41886: 'ALetter',
-    41887: 'ALetter',
-    41888: 'ALetter',
-    41889: 'ALetter',
-    41890: 'ALetter',
-    41891: 'ALetter',
-    41892: 'ALetter',
-    41893: 'ALetter',
-    41894: 'ALetter',
-    41895: 'ALetter',
-    41896: 'ALetter',
-    41897: 'ALetter',
-    41898: 'ALetter',
-    41899: 'ALetter',
-    41900: 'ALetter',
-    41901: 'ALetter',
-    41902: 'ALetter',
-    41903: 'ALetter',
-    41904: 'ALetter',
-    41905: 'ALetter',
-    41906: 'ALetter',
-    41907: 'ALetter',
-    41908: 'ALetter',
-    41909: 'ALetter',
-    41910: 'ALetter',
-    41911: 'ALetter',
-    41912: 'ALetter',
-    41913: 'ALetter',
-    41914: 'ALetter',
-    41915: 'ALetter',
-    41916: 'ALetter',
-    41917: 'ALetter',
-    41918: 'ALetter',
-    41919: 'ALetter',
-    41920: 'ALetter',
-    41921: 'ALetter',
-    41922: 'ALetter',
-    41923: 'ALetter',
-    41924: 'ALetter',
-    41925: 'ALetter',
-    41926: 'ALetter',
-    41927: 'ALetter',
-    41928: 'ALetter',
-    41929: 'ALetter',
-    41930: 'ALetter',
-    41931: 'ALetter',
-    41932: 'ALetter',
-    41933: 'ALetter',
-    41934: 'ALetter',
-    41935: 'ALetter',
-    41936: 'ALetter',
-    41937: 'ALetter',
-    41938: 'ALetter',
-    41939: 'ALetter',
-    41940: 'ALetter',
-    41941: 'ALetter',
-    41942: 'ALetter',
-    41943: 'ALetter',
-    41944: 'ALetter',
-    41945: 'ALetter',
-    41946: 'ALetter',
-    41947: 'ALetter',
-    41948: 'ALetter',
-    41949: 'ALetter',
-    41950: 'ALetter',
-    41951: 'ALetter',
-    41952: 'ALetter',
-    41953: 'ALetter',
-    41954: 'ALetter',
-    41955: 'ALetter',
-    41956: 'ALetter',
-    41957: 'ALetter',
-    41958: 'ALetter',
-    41959: 'ALetter',
-    41960: 'ALetter',
-    41961: 'ALetter',
-    41962: 'ALetter',
-    41963: 'ALetter',
-    41964: 'ALetter',
-    41965: 'ALetter',
-    41966: 'ALetter',
-    41967: 'ALetter',
-    41968: 'ALetter',
-    41969: 'ALetter',
-    41970: 'ALetter',
-    41971: 'ALetter',
-    41972: 'ALetter',
-    41973: 'ALetter',
-    41974: 'ALetter',
-    41975: 'ALetter',
-    41976: 'ALetter',
-    41977: 'ALetter',
-    41978: 'ALetter',
-    41979: 'ALetter',
-    41980: 'ALetter',
-    41981: 'ALetter',
-    41982: 'ALetter',
-    41983: 'ALetter',
-    41984: 'ALetter',
-    41985: 'ALetter',
-    41986: 'ALetter',
-    41987: 'ALetter',
-    41988: 'ALetter',
-    41989: 'ALetter',
-    41990: 'ALetter',
-    41991: 'ALetter',
-    41992: 'ALetter',
-    41993: 'ALetter',
-    41994: 'ALetter',
-    41995: 'ALetter',
-    41996: 'ALetter',
-    41997: 'ALetter',
-    41998: 'ALetter',
-    41999: 'ALetter',
-    42000: 'ALetter',
-    42001: 'ALetter',
-    42002: 'ALetter',
-    42003: 'ALetter',
-    42004: 'ALetter',
-    42005: 'ALetter',
-    42006: 'ALetter',
-    42007: 'ALetter',
-    42008: 'ALetter',
-    42009: 'ALetter',
-    42010: 'ALetter',
-    42011: 'ALetter',
-    42012: 'ALetter',
-    42013: 'ALetter',
-    42014: 'ALetter',
-    42015: 'ALetter',
-    42016: 'ALetter',
-    42017: 'ALetter',
-    42018: 'ALetter',
-    42019: 'ALetter',
-    42020: 'ALetter',
-    42021: 'ALetter',
-    42022: 'ALetter',
-    42023: 'ALetter',
-    42024: 'ALetter',
-    42025: 'ALetter',
-    42026: 'ALetter',
-    42027: 'ALetter',
-    42028: 'ALetter',
-    42029: 'ALetter',
-    42030: 'ALetter',
-    42031: 'ALetter',
-    42032: 'ALetter',
-    42033: 'ALetter',
-    42034: 'ALetter',
-    42035: 'ALetter',
-    42036: 'ALetter',
-    42037: 'ALetter',
-    42038: 'ALetter',
-    42039: 'ALetter',
-    42040: 'ALetter',
-    42041: 'ALetter',
-    42042: 'ALetter',
-    42043: 'ALetter',
-    42044: 'ALetter',
-    42045: 'ALetter',
-    42046: 'ALetter',
-    42047: 'ALetter',
-    42048: 'ALetter',
-    42049: 'ALetter',
-    42050: 'ALetter',
-    42051: 'ALetter',
-    42052: 'ALetter',
-    42053: 'ALetter',
-    42054: 'ALetter',
-    42055: 'ALetter',
-    42056: 'ALetter',
-    42057: 'ALetter',
-    42058: 'ALetter',
-    42059: 'ALetter',
-    42060: 'ALetter',
-    42061: 'ALetter',
-    42062: 'ALetter',
-    42063: 'ALetter',
-    42064: 'ALetter',
-    42065: 'ALetter',
-    42066: 'ALetter',
-    42067: 'ALetter',
-    42068: 'ALetter',
-    42069: 'ALetter',
-    42070: 'ALetter',
-    42071: 'ALetter',
-    42072: 'ALetter',
-    42073: 'ALetter',
-    42074: 'ALetter',
-    42075: 'ALetter',
-    42076: 'ALetter',
-    42077: 'ALetter',
-    42078: 'ALetter',
-    42079: 'ALetter',
-    42080: 'ALetter',
-    42081: 'ALetter',
-    42082: 'ALetter',
-    42083: 'ALetter',
-    42084: 'ALetter',
-    42085: 'ALetter',
-    42086: 'ALetter',
-    42087: 'ALetter',
-    42088: 'ALetter',
-    42089: 'ALetter',
-    42090: 'ALetter',
-    42091: 'ALetter',
-    42092: 'ALetter',
-    42093: 'ALetter',
-    42094: 'ALetter',
-    42095: 'ALetter',
-    42096: 'ALetter',
-    42097: 'ALetter',
-    42098: 'ALetter',
-    42099: 'ALetter',
-    42100: 'ALetter',
-    42101: 'ALetter',
-    42102: 'ALetter',
-    42103: 'ALetter',
-    42104: 'ALetter',
-    42105: 'ALetter',
-    42106: 'ALetter',
-    42107: 'ALetter',
-    42108: 'ALetter',
-    42109: 'ALetter',
-    42110: 'ALetter',
-    42111: 'ALetter',
-    42112: 'ALetter',
-    42113: 'ALetter',
-    42114: 'ALetter',
-    42115: 'ALetter',
-    42116: 'ALetter',
-    42117: 'ALetter',
-    42118: 'ALetter',
-    42119: 'ALetter',
-    42120: 'ALetter',
-    42121: 'ALetter',
-    42122: 'ALetter',
-    42123: 'ALetter',
-    42124: 'ALetter',
-    42775: 'ALetter',
-    42776: 'ALetter',
-    42777: 'ALetter',
-    42778: 'ALetter',
-    43008: 'ALetter',
-    43009: 'ALetter',
-    43011: 'ALetter',
-    43012: 'ALetter',
-    43013: 'ALetter',
-    43015: 'ALetter',
-    43016: 'ALetter',
-    43017: 'ALetter',
-    43018: 'ALetter',
-    43020: 'ALetter',
-    43021: 'ALetter',
-    43022: 'ALetter',
-    43023: 'ALetter',
-    43024: 'ALetter',
-    43025: 'ALetter',
-    43026: 'ALetter',
-    43027: 'ALetter',
-    43028: 'ALetter',
-    43029: 'ALetter',
-    43030: 'ALetter',
-    43031: 'ALetter',
-    43032: 'ALetter',
-    43033: 'ALetter',
-    43034: 'ALetter',
-    43035: 'ALetter',
-    43036: 'ALetter',
-    43037: 'ALetter',
-    43038: 'ALetter',
-    43039: 'ALetter',
-    43040: 'ALetter',
-    43041: 'ALetter',
-    43042: 'ALetter',
-    43043: 'ALetter',
-    43044: 'ALetter',
-    43047: 'ALetter',
-    43072: 'ALetter',
-    43073: 'ALetter',
-    43074: 'ALetter',
-    43075: 'ALetter',
-    43076: 'ALetter',
-    43077: 'ALetter',
-    43078: 'ALetter',
-    43079: 'ALetter',
-    43080: 'ALetter',
-    43081: 'ALetter',
-    43082: 'ALetter',
-    43083: 'ALetter',
-    43084: 'ALetter',
-    43085: 'ALetter',
-    43086: 'ALetter',
-    43087: 'ALetter',
-    43088: 'ALetter',
-    43089: 'ALetter',
-    43090: 'ALetter',
-    43091: 'ALetter',
-    43092: 'ALetter',
-    43093: 'ALetter',
-    43094: 'ALetter',
-    43095: 'ALetter',
-    43096: 'ALetter',
-    43097: 'ALetter',
-    43098: 'ALetter',
-    43099: 'ALetter',
-    43100: 'ALetter',
-    43101: 'ALetter',
-    43102: 'ALetter',
-    43103: 'ALetter',
-    43104: 'ALetter',
-    43105: 'ALetter',
-    43106: 'ALetter',
-    43107: 'ALetter',
-    43108: 'ALetter',
-    43109: 'ALetter',
-    43110: 'ALetter',
-    43111: 'ALetter',
-    43112: 'ALetter',
-    43113: 'ALetter',
-    43114: 'ALetter',
-    43115: 'ALetter',
-    43116: 'ALetter',
-    43117: 'ALetter',
-    43118: 'ALetter',
-    43119: 'ALetter',
-    43120: 'ALetter',
-    43121: 'ALetter',
-    43122: 'ALetter',
-    43123: 'ALetter',
-    44032: 'ALetter',
-    44033: 'ALetter',
-    44034: 'ALetter',
-    44035: 'ALetter',
-    44036: 'ALetter',
-    44037: 'ALetter',
-    44038: 'ALetter',
-    44039: 'ALetter',
-    44040: 'ALetter',
-    44041: 'ALetter',
-    44042: 'ALetter',
-    44043: 'ALetter',
-    44044: 'ALetter',
-    44045: 'ALetter',
-    44046: 'ALetter',
-    44047: 'ALetter',
-    44048: 'ALetter',
-    44049: 'ALetter',
-    44050: 'ALetter',
-    44051: 'ALetter',
-    44052: 'ALetter',
-    44053: 'ALetter',
-    44054: 'ALetter',
-    44055: 'ALetter',
-    44056: 'ALetter',
-    44057: 'ALetter',
-    44058: 'ALetter',
-    44059: 'ALetter',
-    44060: 'ALetter',
-    44061: 'ALetter',
-    44062: 'ALetter',
-    44063: 'ALetter',
-    44064: 'ALetter',
-    44065: 'ALetter',
-    44066: 'ALetter',
-    44067: 'ALetter',
-    44068: 'ALetter',
-    44069: 'ALetter',
-    44070: 'ALetter',
-    44071: 'ALetter',
-    44072: 'ALetter',
-    44073: 'ALetter',
-    44074: 'ALetter',
-    44075: 'ALetter',
-    44076: 'ALetter',
-    44077: 'ALetter',
-    44078: 'ALetter',
-    44079: 'ALetter',
-    44080: 'ALetter',
-    44081: 'ALetter',
-    44082: 'ALetter',
-    44083: 'ALetter',
-    44084: 'ALetter',
-    44085: 'ALetter',
-    44086: 'ALetter',
-    44087: 'ALetter',
-    44088: 'ALetter',
-    44089: 'ALetter',
-    44090: 'ALetter',
-    44091: 'ALetter',
-    44092: 'ALetter',
-    44093: 'ALetter',
-    44094: 'ALetter',
-    44095: 'ALetter',
-    44096: 'ALetter',
-    44097: 'ALetter',
-    44098: 'ALetter',
-    44099: 'ALetter',
-    44100: 'ALetter',
-    44101: 'ALetter',
-    44102: 'ALetter',
-    44103: 'ALetter',
-    44104: 'ALetter',
-    44105: 'ALetter',
-    44106: 'ALetter',
-    44107: 'ALetter',
-    44108: 'ALetter',
-    44109: 'ALetter',
-    44110: 'ALetter',
-    44111: 'ALetter',
-    44112: 'ALetter',
-    44113: 'ALetter',
-    44114: 'ALetter',
-    44115: 'ALetter',
-    44116: 'ALetter',
-    44117: 'ALetter',
-    44118: 'ALetter',
-    44119: 'ALetter',
-    44120: 'ALetter',
-    44121: 'ALetter',
-    44122: 'ALetter',
-    44123: 'ALetter',
-    44124: 'ALetter',
-    44125: 'ALetter',
-    44126: 'ALetter',
-    44127: 'ALetter',
-    44128: 'ALetter',
-    44129: 'ALetter',
-    44130: 'ALetter',
-    44131: 'ALetter',
-    44132: 'ALetter',
-    44133: 'ALetter',
-    44134: 'ALetter',
-    44135: 'ALetter',
-    44136: 'ALetter',
-    44137: 'ALetter',
-    44138: 'ALetter',
-    44139: 'ALetter',
-    44140: 'ALetter',
-    44141: 'ALetter',
-    44142: 'ALetter',
-    44143: 'ALetter',
-    44144: 'ALetter',
-    44145: 'ALetter',
-    44146: 'ALetter',
-    44147: 'ALetter',
-    44148: 'ALetter',
-    44149: 'ALetter',
-    44150: 'ALetter',
-    44151: 'ALetter',
-    44152: 'ALetter',
-    44153: 'ALetter',
-    44154: 'ALetter',
-    44155: 'ALetter',
-    44156: 'ALetter',
-    44157: 'ALetter',
-    44158: 'ALetter',
-    44159: 'ALetter',
-    44160: 'ALetter',
-    44161: 'ALetter',
-    44162: 'ALetter',
-    44163: 'ALetter',
-    44164: 'ALetter',
-    44165: 'ALetter',
-    44166: 'ALetter',
-    44167: 'ALetter',
-    44168: 'ALetter',
-    44169: 'ALetter',
-    44170: 'ALetter',
-    44171: 'ALetter',
-    44172: 'ALetter',
-    44173: 'ALetter',
-    44174: 'ALetter',
-    44175: 'ALetter',
-    44176: 'ALetter',
-    44177: 'ALetter',
-    44178: 'ALetter',
-    44179: 'ALetter',
-    44180: 'ALetter',
-    44181: 'ALetter',
-    44182: 'ALetter',
-    44183: 'ALetter',
-    44184: 'ALetter',
-    44185: 'ALetter',
-    44186: 'ALetter',
-    44187: 'ALetter',
-    44188: 'ALetter',
-    44189: 'ALetter',
-    44190: 'ALetter',
-    44191: 'ALetter',
-    44192: 'ALetter',
-    44193: 'ALetter',
-    44194: 'ALetter',
-    44195: 'ALetter',
-    44196: 'ALetter',
-    44197: 'ALetter',
-    44198: 'ALetter',
-    44199: 'ALetter',
-    44200: 'ALetter',
-    44201: 'ALetter',
-    44202: 'ALetter',
-    44203: 'ALetter',
-    44204: 'ALetter',
-    44205: 'ALetter',
-    44206: 'ALetter',
-    44207: 'ALetter',
-    44208: 'ALetter',
-    44209: 'ALetter',
-    44210: 'ALetter',
-    44211: 'ALetter',
-    44212: 'ALetter',
-    44213: 'ALetter',
-    44214: 'ALetter',
-    44215: 'ALetter',
-    44216: 'ALetter',
-    44217: 'ALetter',
-    44218: 'ALetter',
-    44219: 'ALetter',
-    44220: 'ALetter',
-    44221: 'ALetter',
-    44222: 'ALetter',
-    44223: 'ALetter',
-    44224: 'ALetter',
-    44225: 'ALetter',
-    44226: 'ALetter',
-    44227: 'ALetter',
-    44228: 'ALetter',
-    44229: 'ALetter',
-    44230: 'ALetter',
-    44231: 'ALetter',
-    44232: 'ALetter',
-    44233: 'ALetter',
-    44234: 'ALetter',
-    44235: 'ALetter',
-    44236: 'ALetter',
-    44237: 'ALetter',
-    44238: 'ALetter',
-    44239: 'ALetter',
-    44240: 'ALetter',
-    44241: 'ALetter',
-    44242: 'ALetter',
-    44243: 'ALetter',
-    44244: 'ALetter',
-    44245: 'ALetter',
-    44246: 'ALetter',
-    44247: 'ALetter',
-    44248: 'ALetter',
-    44249: 'ALetter',
-    44250: 'ALetter',
-    44251: 'ALetter',
-    44252: 'ALetter',
-    44253: 'ALetter',
-    44254: 'ALetter',
-    44255: 'ALetter',
-    44256: 'ALetter',
-    44257: 'ALetter',
-    44258: 'ALetter',
-    44259: 'ALetter',
-    44260: 'ALetter',
-    44261: 'ALetter',
-    44262: 'ALetter',
-    44263: 'ALetter',
-    44264: 'ALetter',
-    44265: 'ALetter',
-    44266: 'ALetter',
-    44267: 'ALetter',
-    44268: 'ALetter',
-    44269: 'ALetter',
-    44270: 'ALetter',
-    44271: 'ALetter',
-    44272: 'ALetter',
-    44273: 'ALetter',
-    44274: 'ALetter',
-    44275: 'ALetter',
-    44276: 'ALetter',
-    44277: 'ALetter',
-    44278: 'ALetter',
-    44279: 'ALetter',
-    44280: 'ALetter',
-    44281: 'ALetter',
-    44282: 'ALetter',
-    44283: 'ALetter',
-    44284: 'ALetter',
-    44285: 'ALetter',
-    44286: 'ALetter',
-    44287: 'ALetter',
-    44288: 'ALetter',
-    44289: 'ALetter',
-    44290: 'ALetter',
-    44291: 'ALetter',
-    44292: 'ALetter',
-    44293: 'ALetter',
-    44294: 'ALetter',
-    44295: 'ALetter',
-    44296: 'ALetter',
-    44297: 'ALetter',
-    44298: 'ALetter',
-    44299: 'ALetter',
-    44300: 'ALetter',
-    44301: 'ALetter',
-    44302: 'ALetter',
-    44303: 'ALetter',
-    44304: 'ALetter',
-    44305: 'ALetter',
-    44306: 'ALetter',
-    44307: 'ALetter',
-    44308: 'ALetter',
-    44309: 'ALetter',
-    44310: 'ALetter',
-    44311: 'ALetter',
-    44312: 'ALetter',
-    44313: 'ALetter',
-    44314: 'ALetter',
-    44315: 'ALetter',
-    44316: 'ALetter',
-    44317: 'ALetter',
-    44318: 'ALetter',
-    44319: 'ALetter',
-    44320: 'ALetter',
-    44321: 'ALetter',
-    44322: 'ALetter',
-    44323: 'ALetter',
-    44324: 'ALetter',
-    44325: 'ALetter',
-    44326: 'ALetter',
-    44327: 'ALetter',
-    44328: 'ALetter',
-    44329: 'ALetter',
-    44330: 'ALetter',
-    44331: 'ALetter',
-    44332: 'ALetter',
-    44333: 'ALetter',
-    44334: 'ALetter',
-    44335: 'ALetter',
-    44336: 'ALetter',
-    44337: 'ALetter',
-    44338: 'ALetter',
-    44339: 'ALetter',
-    44340: 'ALetter',
-    44341: 'ALetter',
-    44342: 'ALetter',
-    44343: 'ALetter',
-    44344: 'ALetter',
-    44345: 'ALetter',
-    44346: 'ALetter',
-    44347: 'ALetter',
-    44348: 'ALetter',
-    44349: 'ALetter',
-    44350: 'ALetter',
-    44351: 'ALetter',
-    44352: 'ALetter',
-    44353: 'ALetter',
-    44354: 'ALetter',
-    44355: 'ALetter',
-    44356: 'ALetter',
-    44357: 'ALetter',
-    44358: 'ALetter',
-    44359: 'ALetter',
-    44360: 'ALetter',
-    44361: 'ALetter',
-    44362: 'ALetter',
-    44363: 'ALetter',
-    44364: 'ALetter',
-    44365: 'ALetter',
-    44366: 'ALetter',
-    44367: 'ALetter',
-    44368: 'ALetter',
-    44369: 'ALetter',
-    44370: 'ALetter',
-    44371: 'ALetter',
-    44372: 'ALetter',
-    44373: 'ALetter',
-    44374: 'ALetter',
-    44375: 'ALetter',
-    44376: 'ALetter',
-    44377: 'ALetter',
-    44378: 'ALetter',
-    44379: 'ALetter',
-    44380: 'ALetter',
-    44381: 'ALetter',
-    44382: 'ALetter',
-    44383: 'ALetter',
-    44384: 'ALetter',
-    44385: 'ALetter',
-    44386: 'ALetter',
-    44387: 'ALetter',
-    44388: 'ALetter',
-    44389: 'ALetter',
-    44390: 'ALetter',
-    44391: 'ALetter',
-    44392: 'ALetter',
-    44393: 'ALetter',
-    44394: 'ALetter',
-    44395: 'ALetter',
-    44396: 'ALetter',
-    44397: 'ALetter',
-    44398: 'ALetter',
-    44399: 'ALetter',
-    44400: 'ALetter',
-    44401: 'ALetter',
-    44402: 'ALetter',
-    44403: 'ALetter',
-    44404: 'ALetter',
-    44405: 'ALetter',
-    44406: 'ALetter',
-    44407: 'ALetter',
-    44408: 'ALetter',
-    44409: 'ALetter',
-    44410: 'ALetter',
-    44411: 'ALetter',
-    44412: 'ALetter',
-    44413: 'ALetter',
-    44414: 'ALetter',
-    44415: 'ALetter',
-    44416: 'ALetter',
-    44417: 'ALetter',
-    44418: 'ALetter',
-    44419: 'ALetter',
-    44420: 'ALetter',
-    44421: 'ALetter',
-    44422: 'ALetter',
-    44423: 'ALetter',
-    44424: 'ALetter',
-    44425: 'ALetter',
-    44426: 'ALetter',
-    44427: 'ALetter',
-    44428: 'ALetter',
-    44429: 'ALetter',
-    44430: 'ALetter',
-    44431: 'ALetter',
-    44432: 'ALetter',
-    44433: 'ALetter',
-    44434: 'ALetter',
-    44435: 'ALetter',
-    44436: 'ALetter',
-    44437: 'ALetter',
-    44438: 'ALetter',
-    44439: 'ALetter',
-    44440: 'ALetter',
-    44441: 'ALetter',
-    44442: 'ALetter',
-    44443: 'ALetter',
-    44444: 'ALetter',
-    44445: 'ALetter',
-    44446: 'ALetter',
-    44447: 'ALetter',
-    44448: 'ALetter',
-    44449: 'ALetter',
-    44450: 'ALetter',
-    44451: 'ALetter',
-    44452: 'ALetter',
-    44453: 'ALetter',
-    44454: 'ALetter',
-    44455: 'ALetter',
-    44456: 'ALetter',
-    44457: 'ALetter',
-    44458: 'ALetter',
-    44459: 'ALetter',
-    44460: 'ALetter',
-    44461: 'ALetter',
-    44462: 'ALetter',
-    44463: 'ALetter',
-    44464: 'ALetter',
-    44465: 'ALetter',
-    44466: 'ALetter',
-    44467: 'ALetter',
-    44468: 'ALetter',
-    44469: 'ALetter',
-    44470: 'ALetter',
-    44471: 'ALetter',
-    44472: 'ALetter',
-    44473: 'ALetter',
-    44474: 'ALetter',
-    44475: 'ALetter',
-    44476: 'ALetter',
-    44477: 'ALetter',
-    44478: 'ALetter',
-    44479: 'ALetter',
-    44480: 'ALetter',
-    44481: 'ALetter',
-    44482: 'ALetter',
-    44483: 'ALetter',
-    44484: 'ALetter',
-    44485: 'ALetter',
-    44486: 'ALetter',
-    44487: 'ALetter',
-    44488: 'ALetter',
-    44489: 'ALetter',
-    44490: 'ALetter',
-    44491: 'ALetter',
-    44492: 'ALetter',
-    44493: 'ALetter',
-    44494: 'ALetter',
-    44495: 'ALetter',
-    44496: 'ALetter',
-    44497: 'ALetter',
-    44498: 'ALetter',
-    44499: 'ALetter',
-    44500: 'ALetter',
-    44501: 'ALetter',
-    44502: 'ALetter',
-    44503: 'ALetter',
-    44504: 'ALetter',
-    44505: 'ALetter',
-    44506: 'ALetter',
-    44507: 'ALetter',
-    44508: 'ALetter',
-    44509: 'ALetter',
-    44510: 'ALetter',
-    44511: 'ALetter',
-    44512: 'ALetter',
-    44513: 'ALetter',
-    44514: 'ALetter',
-    44515: 'ALetter',
-    44516: 'ALetter',
-    44517: 'ALetter',
-    44518: 'ALetter',
-    44519: 'ALetter',
-    44520: 'ALetter',
-    44521: 'ALetter',
-    44522: 'ALetter',
-    44523: 'ALetter',
-    44524: 'ALetter',
-    44525: 'ALetter',
-    44526: 'ALetter',
-    44527: 'ALetter',
-    44528: 'ALetter',
-    44529: 'ALetter',
-    44530: 'ALetter',
-    44531: 'ALetter',
-    44532: 'ALetter',
-    44533: 'ALetter',
-    44534: 'ALetter',
-    44535: 'ALetter',
-    44536: 'ALetter',
-    44537: 'ALetter',
-    44538: 'ALetter',
-    44539: 'ALetter',
-    44540: 'ALetter',
-    44541: 'ALetter',
-    44542: 'ALetter',
-    44543: 'ALetter',
-    44544: 'ALetter',
-    44545: 'ALetter',
-    44546: 'ALetter',
-    44547: 'ALetter',
-    44548: 'ALetter',
-    44549: 'ALetter',
-    44550: 'ALetter',
-    44551: 'ALetter',
-    44552: 'ALetter',
-    44553: 'ALetter',
-    44554: 'ALetter',
-    44555: 'ALetter',
-    44556: 'ALetter',
-    44557: 'ALetter',
-    44558: 'ALetter',
-    44559: 'ALetter',
-    44560: 'ALetter',
-    44561: 'ALetter',
-    44562: 'ALetter',
-    44563: 'ALetter',
-    44564: 'ALetter',
-    44565: 'ALetter',
-    44566: 'ALetter',
-    44567: 'ALetter',
-    44568: 'ALetter',
-    44569: 'ALetter',
-    44570: 'ALetter',
-    44571: 'ALetter',
-    44572: 'ALetter',
-    44573: 'ALetter',
-    44574: 'ALetter',
-    44575: 'ALetter',
-    44576: 'ALetter',
-    44577: 'ALetter',
-    44578: 'ALetter',
-    44579: 'ALetter',
-    44580: 'ALetter',
-    44581: 'ALetter',
-    44582: 'ALetter',
-    44583: 'ALetter',
-    44584: 'ALetter',
-    44585: 'ALetter',
-    44586: 'ALetter',
-    44587: 'ALetter',
-    44588: 'ALetter',
-    44589: 'ALetter',
-    44590: 'ALetter',
-    44591: 'ALetter',
-    44592: 'ALetter',
-    44593: 'ALetter',
-    44594: 'ALetter',
-    44595: 'ALetter',
-    44596: 'ALetter',
-    44597: 'ALetter',
-    44598: 'ALetter',
-    44599: 'ALetter',
-    44600: 'ALetter',
-    44601: 'ALetter',
-    44602: 'ALetter',
-    44603: 'ALetter',
-    44604: 'ALetter',
-    44605: 'ALetter',
-    44606: 'ALetter',
-    44607: 'ALetter',
-    44608: 'ALetter',
-    44609: 'ALetter',
-    44610: 'ALetter',
-    44611: 'ALetter',
-    44612: 'ALetter',
-    44613: 'ALetter',
-    44614: 'ALetter',
-    44615: 'ALetter',
-    44616: 'ALetter',
-    44617: 'ALetter',
-    44618: 'ALetter',
-    44619: 'ALetter',
-    44620: 'ALetter',
-    44621: 'ALetter',
-    44622: 'ALetter',
-    44623: 'ALetter',
-    44624: 'ALetter',
-    44625: 'ALetter',
-    44626: 'ALetter',
-    44627: 'ALetter',
-    44628: 'ALetter',
-    44629: 'ALetter',
-    44630: 'ALetter',
-    44631: 'ALetter',
-    44632: 'ALetter',
-    44633: 'ALetter',
-    44634: 'ALetter',
-    44635: 'ALetter',
-    44636: 'ALetter',
-    44637: 'ALetter',
-    44638: 'ALetter',
-    44639: 'ALetter',
-    44640: 'ALetter',
-    44641: 'ALetter',
-    44642: 'ALetter',
-    44643: 'ALetter',
-    44644: 'ALetter',
-    44645: 'ALetter',
-    44646: 'ALetter',
-    44647: 'ALetter',
-    44648: 'ALetter',
-    44649: 'ALetter',
-    44650: 'ALetter',
-    44651: 'ALetter',
-    44652: 'ALetter',
-    44653: 'ALetter',
-    44654: 'ALetter',
-    44655: 'ALetter',
-    44656: 'ALetter',
-    44657: 'ALetter',
-    44658: 'ALetter',
-    44659: 'ALetter',
-    44660: 'ALetter',
-    44661: 'ALetter',
-    44662: 'ALetter',
-    44663: 'ALetter',
-    44664: 'ALetter',
-    44665: 'ALetter',
-    44666: 'ALetter',
-    44667: 'ALetter',
-    44668: 'ALetter',
-    44669: 'ALetter',
-    44670: 'ALetter',
-    44671: 'ALetter',
-    44672: 'ALetter',
-    44673: 'ALetter',
-    44674: 'ALetter',
-    44675: 'ALetter',
-    44676: 'ALetter',
-    44677: 'ALetter',
-    44678: 'ALetter',
-    44679: 'ALetter',
-    44680: 'ALetter',
-    44681: 'ALetter',
-    44682: 'ALetter',
-    44683: 'ALetter',
-    44684: 'ALetter',
-    44685: 'ALetter',
-    44686: 'ALetter',
-    44687: 'ALetter',
-    44688: 'ALetter',
-    44689: 'ALetter',
-    44690: 'ALetter',
-    44691: 'ALetter',
-    44692: 'ALetter',
-    44693: 'ALetter',
-    44694: 'ALetter',
-    44695: 'ALetter',
-    44696: 'ALetter',
-    44697: 'ALetter',
-    44698: 'ALetter',
-    44699: 'ALetter',
-    44700: 'ALetter',
-    44701: 'ALetter',
-    44702: 'ALetter',
-    44703: 'ALetter',
-    44704: 'ALetter',
-    44705: 'ALetter',
-    44706: 'ALetter',
-    44707: 'ALetter',
-    44708: 'ALetter',
-    44709: 'ALetter',
-    44710: 'ALetter',
-    44711: 'ALetter',
-    44712: 'ALetter',
-    44713: 'ALetter',
-    44714: 'ALetter',
-    44715: 'ALetter',
-    44716: 'ALetter',
-    44717: 'ALetter',
-    44718: 'ALetter',
-    44719: 'ALetter',
-    44720: 'ALetter',
-    44721: 'ALetter',
-    44722: 'ALetter',
-    44723: 'ALetter',
-    44724: 'ALetter',
-    44725: 'ALetter',
-    44726: 'ALetter',
-    44727: 'ALetter',
-    44728: 'ALetter',
-    44729: 'ALetter',
-    44730: 'ALetter',
-    44731: 'ALetter',
-    44732: 'ALetter',
-    44733: 'ALetter',
-    44734: 'ALetter',
-    44735: 'ALetter',
-    44736: 'ALetter',
-    44737: 'ALetter',
-    44738: 'ALetter',
-    44739: 'ALetter',
-    44740: 'ALetter',
-    44741: 'ALetter',
-    44742: 'ALetter',
-    44743: 'ALetter',
-    44744: 'ALetter',
-    44745: 'ALetter',
-    44746: 'ALetter',
-    44747: 'ALetter',
-    44748: 'ALetter',
-    44749: 'ALetter',
-    44750: 'ALetter',
-    44751: 'ALetter',
-    44752: 'ALetter',
-    44753: 'ALetter',
-    44754: 'ALetter',
-    44755: 'ALetter',
-    44756: 'ALetter',
-    44757: 'ALetter',
-    44758: 'ALetter',
-    44759: 'ALetter',
-    44760: 'ALetter',
-    44761: 'ALetter',
-    44762: 'ALetter',
-    44763: 'ALetter',
-    44764: 'ALetter',
-    44765: 'ALetter',
-    44766: 'ALetter',
-    44767: 'ALetter',
-    44768: 'ALetter',
-    44769: 'ALetter',
-    44770: 'ALetter',
-    44771: 'ALetter',
-    44772: 'ALetter',
-    44773: 'ALetter',
-    44774: 'ALetter',
-    44775: 'ALetter',
-    44776: 'ALetter',
-    44777: 'ALetter',
-    44778: 'ALetter',
-    44779: 'ALetter',
-    44780: 'ALetter',
-    44781: 'ALetter',
-    44782: 'ALetter',
-    44783: 'ALetter',
-    44784: 'ALetter',
-    44785: 'ALetter',
-    44786: 'ALetter',
-    44787: 'ALetter',
-    44788: 'ALetter',
-    44789: 'ALetter',
-    44790: 'ALetter',
-    44791: 'ALetter',
-    44792: 'ALetter',
-    44793: 'ALetter',
-    44794: 'ALetter',
-    44795: 'ALetter',
-    44796: 'ALetter',
-    44797: 'ALetter',
-    44798: 'ALetter',
-    44799: 'ALetter',
-    44800: 'ALetter',
-    44801: 'ALetter',
-    44802: 'ALetter',
-    44803: 'ALetter',
-    44804: 'ALetter',
-    44805: 'ALetter',
-    44806: 'ALetter',
-    44807: 'ALetter',
-    44808: 'ALetter',
-    44809: 'ALetter',
-    44810: 'ALetter',
-    44811: 'ALetter',
-    44812: 'ALetter',
-    44813: 'ALetter',
-    44814: 'ALetter',
-    44815: 'ALetter',
-    44816: 'ALetter',
-    44817: 'ALetter',
-    44818: 'ALetter',
-    44819: 'ALetter',
-    44820: 'ALetter',
-    44821: 'ALetter',
-    44822: 'ALetter',
-    44823: 'ALetter',
-    44824: 'ALetter',
-    44825: 'ALetter',
-    44826: 'ALetter',
-    44827: 'ALetter',
-    44828: 'ALetter',
-    44829: 'ALetter',
-    44830: 'ALetter',
-    44831: 'ALetter',
-    44832: 'ALetter',
-    44833: 'ALetter',
-    44834: 'ALetter',
-    44835: 'ALetter',
-    44836: 'ALetter',
-    44837: 'ALetter',
-    44838: 'ALetter',
-    44839: 'ALetter',
-    44840: 'ALetter',
-    44841: 'ALetter',
-    44842: 'ALetter',
-    44843: 'ALetter',
-    44844: 'ALetter',
-    44845: 'ALetter',
-    44846: 'ALetter',
-    44847: 'ALetter',
-    44848: 'ALetter',
-    44849: 'ALetter',
-    44850: 'ALetter',
-    44851: 'ALetter',
-    44852: 'ALetter',
-    44853: 'ALetter',
-    44854: 'ALetter',
-    44855: 'ALetter',
-    44856: 'ALetter',
-    44857: 'ALetter',
-    44858: 'ALetter',
-    44859: 'ALetter',
-    44860: 'ALetter',
-    44861: 'ALetter',
-    44862: 'ALetter',
-    44863: 'ALetter',
-    44864: 'ALetter',
-    44865: 'ALetter',
-    44866: 'ALetter',
-    44867: 'ALetter',
-    44868: 'ALetter',
-    44869: 'ALetter',
-    44870: 'ALetter',
-    44871: 'ALetter',
-    44872: 'ALetter',
-    44873: 'ALetter',
-    44874: 'ALetter',
-    44875: 'ALetter',
-    44876: 'ALetter',
-    44877: 'ALetter',
-    44878: 'ALetter',
-    44879: 'ALetter',
-    44880: 'ALetter',
-    44881: 'ALetter',
-    44882: 'ALetter',
-    44883: 'ALetter',
-    44884: 'ALetter',
-    44885: 'ALetter',
-    44886: 'ALetter',
-    44887: 'ALetter',
-    44888: 'ALetter',
-    44889: 'ALetter',
-    44890: 'ALetter',
-    44891: 'ALetter',
-    44892: 'ALetter',
-    44893: 'ALetter',
-    44894: 'ALetter',
-    44895: 'ALetter',
-    44896: 'ALetter',
-    44897: 'ALetter',
-    44898: 'ALetter',
-    44899: 'ALetter',
-    44900: 'ALetter',
-    44901: 'ALetter',
-    44902: 'ALetter',
-    44903: 'ALetter',
-    44904: 'ALetter',
-    44905: 'ALetter',
-    44906: 'ALetter',
-    44907: 'ALetter',
-    44908: 'ALetter',
-    44909: 'ALetter',
-    44910: 'ALetter',
-    44911: 'ALetter',
-    44912: 'ALetter',
-    44913: 'ALetter',
-    44914: 'ALetter',
-    44915: 'ALetter',
-    44916: 'ALetter',
-    44917: 'ALetter',
-    44918: 'ALetter',
-    44919: 'ALetter',
-    44920: 'ALetter',
-    44921: 'ALetter',
-    44922: 'ALetter',
-    44923: 'ALetter',
-    44924: 'ALetter',
-    44925: 'ALetter',
-    44926: 'ALetter',
-    44927: 'ALetter',
-    44928: 'ALetter',
-    44929: 'ALetter',
-    44930: 'ALetter',
-    44931: 'ALetter',
-    44932: 'ALetter',
-    44933: 'ALetter',
-    44934: 'ALetter',
-    44935: 'ALetter',
-    44936: 'ALetter',
-    44937: 'ALetter',
-    44938: 'ALetter',
-    44939: 'ALetter',
-    44940: 'ALetter',
-    44941: 'ALetter',
-    44942: 'ALetter',
-    44943: 'ALetter',
-    44944: 'ALetter',
-    44945: 'ALetter',
-    44946: 'ALetter',
-    44947: 'ALetter',
-    44948: 'ALetter',
-    44949: 'ALetter',
-    44950: 'ALetter',
-    44951: 'ALetter',
-    44952: 'ALetter',
-    44953: 'ALetter',
-    44954: 'ALetter',
-    44955: 'ALetter',
-    44956: 'ALetter',
-    44957: 'ALetter',
-    44958: 'ALetter',
-    44959: 'ALetter',
-    44960: 'ALetter',
-    44961: 'ALetter',
-    44962: 'ALetter',
-    44963: 'ALetter',
-    44964: 'ALetter',
-    44965: 'ALetter',
-    44966: 'ALetter',
-    44967: 'ALetter',
-    44968: 'ALetter',
-    44969: 'ALetter',
-    44970: 'ALetter',
-    44971: 'ALetter',
-    44972: 'ALetter',
-    44973: 'ALetter',
-    44974: 'ALetter',
-    44975: 'ALetter',
-    44976: 'ALetter',
-    44977: 'ALetter',
-    44978: 'ALetter',
-    44979: 'ALetter',
-    44980: 'ALetter',
-    44981: 'ALetter',
-    44982: 'ALetter',
-    44983: 'ALetter',
-    44984: 'ALetter',
-    44985: 'ALetter',
-    44986: 'ALetter',
-    44987: 'ALetter',
-    44988: 'ALetter',
-    44989: 'ALetter',
-    44990: 'ALetter',
-    44991: 'ALetter',
-    44992: 'ALetter',
-    44993: 'ALetter',
-    44994: 'ALetter',
-    44995: 'ALetter',
-    44996: 'ALetter',
-    44997: 'ALetter',
-    44998: 'ALetter',
-    44999: 'ALetter',
-    45000: 'ALetter',
-    45001: 'ALetter',
-    45002: 'ALetter',
-    45003: 'ALetter',
-    45004: 'ALetter',
-    45005: 'ALetter',
-    45006: 'ALetter',
-    45007: 'ALetter',
-    45008: 'ALetter',
-    45009: 'ALetter',
-    45010: 'ALetter',
-    45011: 'ALetter',
-    45012: 'ALetter',
-    45013: 'ALetter',
-    45014: 'ALetter',
-    45015: 'ALetter',
-    45016: 'ALetter',
-    45017: 'ALetter',
-    45018: 'ALetter',
-    45019: 'ALetter',
-    45020: 'ALetter',
-    45021: 'ALetter',
-    45022: 'ALetter',
-    45023: 'ALetter',
-    45024: 'ALetter',
-    45025: 'ALetter',
-    45026: 'ALetter',
-    45027: 'ALetter',
-    45028: 'ALetter',
-    45029: 'ALetter',
-    45030: 'ALetter',
-    45031: 'ALetter',
-    45032: 'ALetter',
-    45033: 'ALetter',
-    45034: 'ALetter',
-    45035: 'ALetter',
-    45036: 'ALetter',
-    45037: 'ALetter',
-    45038: 'ALetter',
-    45039: 'ALetter',
-    45040: 'ALetter',
-    45041: 'ALetter',
-    45042: 'ALetter',
-    45043: 'ALetter',
-    45044: 'ALetter',
-    45045: 'ALetter',
-    45046: 'ALetter',
-    45047: 'ALetter',
-    45048: 'ALetter',
-    45049: 'ALetter',
-    45050: 'ALetter',
-    45051: 'ALetter',
-    45052: 'ALetter',
-    45053: 'ALetter',
-    45054: 'ALetter',
-    45055: 'ALetter',
-    45056: 'ALetter',
-    45057: 'ALetter',
-    45058: 'ALetter',
-    45059: 'ALetter',
-    45060: 'ALetter',
-    45061: 'ALetter',
-    45062: 'ALetter',
-    45063: 'ALetter',
-    45064: 'ALetter',
-    45065: 'ALetter',
-    45066: 'ALetter',
-    45067: 'ALetter',
-    45068: 'ALetter',
-    45069: 'ALetter',
-    45070: 'ALetter',
-    45071: 'ALetter',
-    45072: 'ALetter',
-    45073: 'ALetter',
-    45074: 'ALetter',
-    45075: 'ALetter',
-    45076: 'ALetter',
-    45077: 'ALetter',
-    45078: 'ALetter',
-    45079: 'ALetter',
-    45080: 'ALetter',
-    45081: 'ALetter',
-    45082: 'ALetter',
-    45083: 'ALetter',
-    45084: 'ALetter',
-    45085: 'ALetter',
-    45086: 'ALetter',
-    45087: 'ALetter',
-    45088: 'ALetter',
-    45089: 'ALetter',
-    45090: 'ALetter',
-    45091: 'ALetter',
-    45092: 'ALetter',
-    45093: 'ALetter',
-    45094: 'ALetter',
-    45095: 'ALetter',
-    45096: 'ALetter',
-    45097: 'ALetter',
-    45098: 'ALetter',
-    45099: 'ALetter',
-    45100: 'ALetter',
-    45101: 'ALetter',
-    45102: 'ALetter',
-    45103: 'ALetter',
-    45104: 'ALetter',
-    45105: 'ALetter',
-    45106: 'ALetter',
-    45107: 'ALetter',
-    45108: 'ALetter',
-    45109: 'ALetter',
-    45110: 'ALetter',
-    45111: 'ALetter',
-    45112: 'ALetter',
-    45113: 'ALetter',
-    45114: 'ALetter',
-    45115: 'ALetter',
-    45116: 'ALetter',
-    45117: 'ALetter',
-    45118: 'ALetter',
-    45119: 'ALetter',
-    45120: 'ALetter',
-    45121: 'ALetter',
-    45122: 'ALetter',
-    45123: 'ALetter',
-    45124: 'ALetter',
-    45125: 'ALetter',
-    45126: 'ALetter',
-    45127: 'ALetter',
-    45128: 'ALetter',
-    45129: 'ALetter',
-    45130: 'ALetter',
-    45131: 'ALetter',
-    45132: 'ALetter',
-    45133: 'ALetter',
-    45134: 'ALetter',
-    45135: 'ALetter',
-    45136: 'ALetter',
-    45137: 'ALetter',
-    45138: 'ALetter',
-    45139: 'ALetter',
-    45140: 'ALetter',
-    45141: 'ALetter',
-    45142: 'ALetter',
-    45143: 'ALetter',
-    45144: 'ALetter',
-    45145: 'ALetter',
-    45146: 'ALetter',
-    45147: 'ALetter',
-    45148: 'ALetter',
-    45149: 'ALetter',
-    45150: 'ALetter',
-    45151: 'ALetter',
-    45152: 'ALetter',
-    45153: 'ALetter',
-    45154: 'ALetter',
-    45155: 'ALetter',
-    45156: 'ALetter',
-    45157: 'ALetter',
-    45158: 'ALetter',
-    45159: 'ALetter',
-    45160: 'ALetter',
-    45161: 'ALetter',
-    45162: 'ALetter',
-    45163: 'ALetter',
-    45164: 'ALetter',
-    45165: 'ALetter',
-    45166: 'ALetter',
-    45167: 'ALetter',
-    45168: 'ALetter',
-    45169: 'ALetter',
-    45170: 'ALetter',
-    45171: 'ALetter',
-    45172: 'ALetter',
-    45173: 'ALetter',
-    45174: 'ALetter',
-    45175: 'ALetter',
-    45176: 'ALetter',
-    45177: 'ALetter',
-    45178: 'ALetter',
-    45179: 'ALetter',
-    45180: 'ALetter',
-    45181: 'ALetter',
-    45182: 'ALetter',
-    45183: 'ALetter',
-    45184: 'ALetter',
-    45185: 'ALetter',
-    45186: 'ALetter',
-    45187: 'ALetter',
-    45188: 'ALetter',
-    45189: 'ALetter',
-    45190: 'ALetter',
-    45191: 'ALetter',
-    45192: 'ALetter',
-    45193: 'ALetter',
-    45194: 'ALetter',
-    45195: 'ALetter',
-    45196: 'ALetter',
-    45197: 'ALetter',
-    45198: 'ALetter',
-    45199: 'ALetter',
-    45200: 'ALetter',
-    45201: 'ALetter',
-    45202: 'ALetter',
-    45203: 'ALetter',
-    45204: 'ALetter',
-    45205: 'ALetter',
-    45206: 'ALetter',
-    45207: 'ALetter',
-    45208: 'ALetter',
-    45209: 'ALetter',
-    45210: 'ALetter',
-    45211: 'ALetter',
-    45212: 'ALetter',
-    45213: 'ALetter',
-    45214: 'ALetter',
-    45215: 'ALetter',
-    45216: 'ALetter',
-    45217: 'ALetter',
-    45218: 'ALetter',
-    45219: 'ALetter',
-    45220: 'ALetter',
-    45221: 'ALetter',
-    45222: 'ALetter',
-    45223: 'ALetter',
-    45224: 'ALetter',
-    45225: 'ALetter',
-    45226: 'ALetter',
-    45227: 'ALetter',
-    45228: 'ALetter',
-    45229: 'ALetter',
-    45230: 'ALetter',
-    45231: 'ALetter',
-    45232: 'ALetter',
-    45233: 'ALetter',
-    45234: 'ALetter',
-    45235: 'ALetter',
-    45236: 'ALetter',
-    45237: 'ALetter',
-    45238: 'ALetter',
-    45239: 'ALetter',
-    45240: 'ALetter',
-    45241: 'ALetter',
-    45242: 'ALetter',
-    45243: 'ALetter',
-    45244: 'ALetter',
-    45245: 'ALetter',
-    45246: 'ALetter',
-    45247: 'ALetter',
-    45248: 'ALetter',
-    45249: 'ALetter',
-    45250: 'ALetter',
-    45251: 'ALetter',
-    45252: 'ALetter',
-    45253: 'ALetter',
-    45254: 'ALetter',
-    45255: 'ALetter',
-    45256: 'ALetter',
-    45257: 'ALetter',
-    45258: 'ALetter',
-    45259: 'ALetter',
-    45260: 'ALetter',
-    45261: 'ALetter',
-    45262: 'ALetter',
-    45263: 'ALetter',
-    45264: 'ALetter',
-    45265: 'ALetter',
-    45266: 'ALetter',
-    45267: 'ALetter',
-    45268: 'ALetter',
-    45269: 'ALetter',
-    45270: 'ALetter',
-    45271: 'ALetter',
-    45272: 'ALetter',
-    45273: 'ALetter',
-    45274: 'ALetter',
-    45275: 'ALetter',
-    45276: 'ALetter',
-    45277: 'ALetter',
-    45278: 'ALetter',
-    45279: 'ALetter',
-    45280: 'ALetter',
-    45281: 'ALetter',
-    45282: 'ALetter',
-    45283: 'ALetter',
-    45284: 'ALetter',
-    45285: 'ALetter',
-    45286: 'ALetter',
-    45287: 'ALetter',
-    45288: 'ALetter',
-    45289: 'ALetter',
-    45290: 'ALetter',
-    45291: 'ALetter',
-    45292: 'ALetter',
-    45293: 'ALetter',
-    45294: 'ALetter',
-    45295: 'ALetter',
-    45296: 'ALetter',
-    45297: 'ALetter',
-    45298: 'ALetter',
-    45299: 'ALetter',
-    45300: 'ALetter',
-    45301: 'ALetter',
-    45302: 'ALetter',
-    45303: 'ALetter',
-    45304: 'ALetter',
-    45305: 'ALetter',
-    45306: 'ALetter',
-    45307: 'ALetter',
-    45308: 'ALetter',
-    45309: 'ALetter',
-    45310: 'ALetter',
-    45311: 'ALetter',
-    45312: 'ALetter',
-    45313: 'ALetter',
-    45314: 'ALetter',
-    45315: 'ALetter',
-    45316: 'ALetter',
-    45317: 'ALetter',
-    45318: 'ALetter',
-    45319: 'ALetter',
-    45320: 'ALetter',
-    45321: 'ALetter',
-    45322: 'ALetter',
-    45323: 'ALetter',
-    45324: 'ALetter',
-    45325: 'ALetter',
-    45326: 'ALetter',
-    45327: 'ALetter',
-    45328: 'ALetter',
-    45329: 'ALetter',
-    45330: 'ALetter',
-    45331: 'ALetter',
-    45332: 'ALetter',
-    45333: 'ALetter',
-    45334: 'ALetter',
-    45335: 'ALetter',
-    45336: 'ALetter',
-    45337: 'ALetter',
-    45338: 'ALetter',
-    45339: 'ALetter',
-    45340: 'ALetter',
-    45341: 'ALetter',
-    45342: 'ALetter',
-    45343: 'ALetter',
-    45344: 'ALetter',
-    45345: 'ALetter',
-    45346: 'ALetter',
-    45347: 'ALetter',
-    45348: 'ALetter',
-    45349: 'ALetter',
-    45350: 'ALetter',
-    45351: 'ALetter',
-    45352: 'ALetter',
-    45353: 'ALetter',
-    45354: 'ALetter',
-    45355: 'ALetter',
-    45356: 'ALetter',
-    45357: 'ALetter',
-    45358: 'ALetter',
-    45359: 'ALetter',
-    45360: 'ALetter',
-    45361: 'ALetter',
-    45362: 'ALetter',
-    45363: 'ALetter',
-    45364: 'ALetter',
-    45365: 'ALetter',
-    45366: 'ALetter',
-    45367: 'ALetter',
-    45368: 'ALetter',
-    45369: 'ALetter',
-    45370: 'ALetter',
-    45371: 'ALetter',
-    45372: 'ALetter',
-    45373: 'ALetter',
-    45374: 'ALetter',
-    45375: 'ALetter',
-    45376: 'ALetter',
-    45377: 'ALetter',
-    45378: 'ALetter',
-    45379: 'ALetter',
-    45380: 'ALetter',
-    45381: 'ALetter',
-    45382: 'ALetter',
-    45383: 'ALetter',
-    45384: 'ALetter',
-    45385: 'ALetter',
-    45386: 'ALetter',
-    45387: 'ALetter',
-    45388: 'ALetter',
-    45389: 'ALetter',
-    45390: 'ALetter',
-    45391: 'ALetter',
-    45392: 'ALetter',
-    45393: 'ALetter',
-    45394: 'ALetter',
-    45395: 'ALetter',
-    45396: 'ALetter',
-    45397: 'ALetter',
-    45398: 'ALetter',
-    45399: 'ALetter',
-    45400: 'ALetter',
-    45401: 'ALetter',
-    45402: 'ALetter',
-    45403: 'ALetter',
-    45404: 'ALetter',
-    45405: 'ALetter',
-    45406: 'ALetter',
-    45407: 'ALetter',
-    45408: 'ALetter',
-    45409: 'ALetter',
-    45410: 'ALetter',
-    45411: 'ALetter',
-    45412: 'ALetter',
-    45413: 'ALetter',
-    45414: 'ALetter',
-    45415: 'ALetter',
-    45416: 'ALetter',
-    45417: 'ALetter',
-    45418: 'ALetter',
-    45419: 'ALetter',
-    45420: 'ALetter',
-    45421: 'ALetter',
-    45422: 'ALetter',
-    45423: 'ALetter',
-    45424: 'ALetter',
-    45425: 'ALetter',
-    45426: 'ALetter',
-    45427: 'ALetter',
-    45428: 'ALetter',
-    45429: 'ALetter',
-    45430: 'ALetter',
-    45431: 'ALetter',
-    45432: 'ALetter',
-    45433: 'ALetter',
-    45434: 'ALetter',
-    45435: 'ALetter',
-    45436: 'ALetter',
-    45437: 'ALetter',
-    45438: 'ALetter',
-    45439: 'ALetter',
-    45440: 'ALetter',
-    45441: 'ALetter',
-    45442: 'ALetter',
-    45443: 'ALetter',
-    45444: 'ALetter',
-    45445: 'ALetter',
-    45446: 'ALetter',
-    45447: 'ALetter',
-    45448: 'ALetter',
-    45449: 'ALetter',
-    45450: 'ALetter',
-    45451: 'ALetter',
-    45452: 'ALetter',
-    45453: 'ALetter',
-    45454: 'ALetter',
-    45455: 'ALetter',
-    45456: 'ALetter',
-    45457: 'ALetter',
-    45458: 'ALetter',
-    45459: 'ALetter',
-    45460: 'ALetter',
-    45461: 'ALetter',
-    45462: 'ALetter',
-    45463: 'ALetter',
-    45464: 'ALetter',
-    45465: 'ALetter',
-    45466: 'ALetter',
-    45467: 'ALetter',
-    45468: 'ALetter',
-    45469: 'ALetter',
-    45470: 'ALetter',
-    45471: 'ALetter',
-    45472: 'ALetter',
-    45473: 'ALetter',
-    45474: 'ALetter',
-    45475: 'ALetter',
-    45476: 'ALetter',
-    45477: 'ALetter',
-    45478: 'ALetter',
-    45479: 'ALetter',
-    45480: 'ALetter',
-    45481: 'ALetter',
-    45482: 'ALetter',
-    45483: 'ALetter',
-    45484: 'ALetter',
-    45485: 'ALetter',
-    45486: 'ALetter',
-    45487: 'ALetter',
-    45488: 'ALetter',
-    45489: 'ALetter',
-    45490: 'ALetter',
-    45491: 'ALetter',
-    45492: 'ALetter',
-    45493: 'ALetter',
-    45494: 'ALetter',
-    45495: 'ALetter',
-    45496: 'ALetter',
-    45497: 'ALetter',
-    45498: 'ALetter',
-    45499: 'ALetter',
-    45500: 'ALetter',
-    45501: 'ALetter',
-    45502: 'ALetter',
-    45503: 'ALetter',
-    45504: 'ALetter',
-    45505: 'ALetter',
-    45506: 'ALetter',
-    45507: 'ALetter',
-    45508: 'ALetter',
-    45509: 'ALetter',
-    45510: 'ALetter',
-    45511: 'ALetter',
-    45512: 'ALetter',
-    45513: 'ALetter',
-    45514: 'ALetter',
-    45515: 'ALetter',
-    45516: 'ALetter',
-    45517: 'ALetter',
-    45518: 'ALetter',
-    45519: 'ALetter',
-    45520: 'ALetter',
-    45521: 'ALetter',
-    45522: 'ALetter',
-    45523: 'ALetter',
-    45524: 'ALetter',
-    45525: 'ALetter',
-    45526: 'ALetter',
-    45527: 'ALetter',
-    45528: 'ALetter',
-    45529: 'ALetter',
-    45530: 'ALetter',
-    45531: 'ALetter',
-    45532: 'ALetter',
-    45533: 'ALetter',
-    45534: 'ALetter',
-    45535: 'ALetter',
-    45536: 'ALetter',
-    45537: 'ALetter',
-    45538: 'ALetter',
-    45539: 'ALetter',
-    45540: 'ALetter',
-    45541: 'ALetter',
-    45542: 'ALetter',
-    45543: 'ALetter',
-    45544: 'ALetter',
-    45545: 'ALetter',
-    45546: 'ALetter',
-    45547: 'ALetter',
-    45548: 'ALetter',
-    45549: 'ALetter',
-    45550: 'ALetter',
-    45551: 'ALetter',
-    45552: 'ALetter',
-    45553: 'ALetter',
-    45554: 'ALetter',
-    45555: 'ALetter',
-    45556: 'ALetter',
-    45557: 'ALetter',
-    45558: 'ALetter',
-    45559: 'ALetter',
-    45560: 'ALetter',
-    45561: 'ALetter',
-    45562: 'ALetter',
-    45563: 'ALetter',
-    45564: 'ALetter',
-    45565: 'ALetter',
-    45566: 'ALetter',
-    45567: 'ALetter',
-    45568: 'ALetter',
-    45569: 'ALetter',
-    45570: 'ALetter',
-    45571: 'ALetter',
-    45572: 'ALetter',
-    45573: 'ALetter',
-    45574: 'ALetter',
-    45575: 'ALetter',
-    45576: 'ALetter',
-    45577: 'ALetter',
-    45578: 'ALetter',
-    45579: 'ALetter',
-    45580: 'ALetter',
-    45581: 'ALetter',
-    45582: 'ALetter',
-    45583: 'ALetter',
-    45584: 'ALetter',
-    45585: 'ALetter',
-    45586: 'ALetter',
-    45587: 'ALetter',
-    45588: 'ALetter',
-    45589: 'ALetter',
-    45590: 'ALetter',
-    45591: 'ALetter',
-    45592: 'ALetter',
-    45593: 'ALetter',
-    45594: 'ALetter',
-    45595: 'ALetter',
-    45596: 'ALetter',
-    45597: 'ALetter',
-    45598: 'ALetter',
-    45599: 'ALetter',
-    45600: 'ALetter',
-    45601: 'ALetter',
-    45602: 'ALetter',
-    45603: 'ALetter',
-    45604: 'ALetter',
-    45605: 'ALetter',
-    45606: 'ALetter',
-    45607: 'ALetter',
-    45608: 'ALetter',
-    45609: 'ALetter',
-    45610: 'ALetter',
-    45611: 'ALetter',
-    45612: 'ALetter',
-    45613: 'ALetter',
-    45614: 'ALetter',
-    45615: 'ALetter',
-    45616: 'ALetter',
-    45617: 'ALetter',
-    45618: 'ALetter',
-    45619: 'ALetter',
-    45620: 'ALetter',
-    45621: 'ALetter',
-    45622: 'ALetter',
-    45623: 'ALetter',
-    45624: 'ALetter',
-    45625: 'ALetter',
-    45626: 'ALetter',
-    45627: 'ALetter',
-    45628: 'ALetter',
-    45629: 'ALetter',
-    45630: 'ALetter',
-    45631: 'ALetter',
-    45632: 'ALetter',
-    45633: 'ALetter',
-    45634: 'ALetter',
-    45635: 'ALetter',
-    45636: 'ALetter',
-    45637: 'ALetter',
-    45638: 'ALetter',
-    45639: 'ALetter',
-    45640: 'ALetter',
-    45641: 'ALetter',
-    45642: 'ALetter',
-    45643: 'ALetter',
-    45644: 'ALetter',
-    45645: 'ALetter',
-    45646: 'ALetter',
-    45647: 'ALetter',
-    45648: 'ALetter',
-    45649: 'ALetter',
-    45650: 'ALetter',
-    45651: 'ALetter',
-    45652: 'ALetter',
-    45653: 'ALetter',
-    45654: 'ALetter',
-    45655: 'ALetter',
-    45656: 'ALetter',
-    45657: 'ALetter',
-    45658: 'ALetter',
-    45659: 'ALetter',
-    45660: 'ALetter',
-    45661: 'ALetter',
-    45662: 'ALetter',
-    45663: 'ALetter',
-    45664: 'ALetter',
-    45665: 'ALetter',
-    45666: 'ALetter',
-    45667: 'ALetter',
-    45668: 'ALetter',
-    45669: 'ALetter',
-    45670: 'ALetter',
-    45671: 'ALetter',
-    45672: 'ALetter',
-    45673: 'ALetter',
-    45674: 'ALetter',
-    45675: 'ALetter',
-    45676: 'ALetter',
-    45677: 'ALetter',
-    45678: 'ALetter',
-    45679: 'ALetter',
-    45680: 'ALetter',
-    45681: 'ALetter',
-    45682: 'ALetter',
-    45683: 'ALetter',
-    45684: 'ALetter',
-    45685: 'ALetter',
-    45686: 'ALetter',
-    45687: 'ALetter',
-    45688: 'ALetter',
-    45689: 'ALetter',
-    45690: 'ALetter',
-    45691: 'ALetter',
-    45692: 'ALetter',
-    45693: 'ALetter',
-    45694: 'ALetter',
-    45695: 'ALetter',
-    45696: 'ALetter',
-    45697: 'ALetter',
-    45698: 'ALetter',
-    45699: 'ALetter',
-    45700: 'ALetter',
-    45701: 'ALetter',
-    45702: 'ALetter',
-    45703: 'ALetter',
-    45704: 'ALetter',
-    45705: 'ALetter',
-    45706: 'ALetter',
-    45707: 'ALetter',
-    45708: 'ALetter',
-    45709: 'ALetter',
-    45710: 'ALetter',
-    45711: 'ALetter',
-    45712: 'ALetter',
-    45713: 'ALetter',
-    45714: 'ALetter',
-    45715: 'ALetter',
-    45716: 'ALetter',
-    45717: 'ALetter',
-    45718: 'ALetter',
-    45719: 'ALetter',
-    45720: 'ALetter',
-    45721: 'ALetter',
-    45722: 'ALetter',
-    45723: 'ALetter',
-    45724: 'ALetter',
-    45725: 'ALetter',
-    45726: 'ALetter',
-    45727: 'ALetter',
-    45728: 'ALetter',
-    45729: 'ALetter',
-    45730: 'ALetter',
-    45731: 'ALetter',
-    45732: 'ALetter',
-    45733: 'ALetter',
-    45734: 'ALetter',
-    45735: 'ALetter',
-    45736: 'ALetter',
-    45737: 'ALetter',
-    45738: 'ALetter',
-    45739: 'ALetter',
-    45740: 'ALetter',
-    45741: 'ALetter',
-    45742: 'ALetter',
-    45743: 'ALetter',
-    45744: 'ALetter',
-    45745: 'ALetter',
-    45746: 'ALetter',
-    45747: 'ALetter',
-    45748: 'ALetter',
-    45749: 'ALetter',
-    45750: 'ALetter',
-    45751: 'ALetter',
-    45752: 'ALetter',
-    45753: 'ALetter',
-    45754: 'ALetter',
-    45755: 'ALetter',
-    45756: 'ALetter',
-    45757: 'ALetter',
-    45758: 'ALetter',
-    45759: 'ALetter',
-    45760: 'ALetter',
-    45761: 'ALetter',
-    45762: 'ALetter',
-    45763: 'ALetter',
-    45764: 'ALetter',
-    45765: 'ALetter',
-    45766: 'ALetter',
-    45767: 'ALetter',
-    45768: 'ALetter',
-    45769: 'ALetter',
-    45770: 'ALetter',
-    45771: 'ALetter',
-    45772: 'ALetter',
-    45773: 'ALetter',
-    45774: 'ALetter',
-    45775: 'ALetter',
-    45776: 'ALetter',
-    45777: 'ALetter',
-    45778: 'ALetter',
-    45779: 'ALetter',
-    45780: 'ALetter',
-    45781: 'ALetter',
-    45782: 'ALetter',
-    45783: 'ALetter',
-    45784: 'ALetter',
-    45785: 'ALetter',
-    45786: 'ALetter',
-    45787: 'ALetter',
-    45788: 'ALetter',
-    45789: 'ALetter',
-    45790: 'ALetter',
-    45791: 'ALetter',
-    45792: 'ALetter',
-    45793: 'ALetter',
-    45794: 'ALetter',
-    45795: 'ALetter',
-    45796: 'ALetter',
-    45797: 'ALetter',
-    45798: 'ALetter',
-    45799: 'ALetter',
-    45800: 'ALetter',
-    45801: 'ALetter',
-    45802: 'ALetter',
-    45803: 'ALetter',
-    45804: 'ALetter',
-    45805: 'ALetter',
-    45806: 'ALetter',
-    45807: 'ALetter',
-    45808: 'ALetter',
-    45809: 'ALetter',
-    45810: 'ALetter',
-    45811: 'ALetter',
-    45812: 'ALetter',
-    45813: 'ALetter',
-    45814: 'ALetter',
-    45815: 'ALetter',
-    45816: 'ALetter',
-    45817: 'ALetter',
-    45818: 'ALetter',
-    45819: 'ALetter',
-    45820: 'ALetter',
-    45821: 'ALetter',
-    45822: 'ALetter',
-    45823: 'ALetter',
-    45824: 'ALetter',
-    45825: 'ALetter',
-    45826: 'ALetter',
-    45827: 'ALetter',
-    45828: 'ALetter',
-    45829: 'ALetter',
-    45830: 'ALetter',
-    45831: 'ALetter',
-    45832: 'ALetter',
-    45833: 'ALetter',
-    45834: 'ALetter',
-    45835: 'ALetter',
-    45836: 'ALetter',
-    45837: 'ALetter',
-    45838: 'ALetter',
-    45839: 'ALetter',
-    45840: 'ALetter',
-    45841: 'ALetter',
-    45842: 'ALetter',
-    45843: 'ALetter',
-    45844: 'ALetter',
-    45845: 'ALetter',
-    45846: 'ALetter',
-    45847: 'ALetter',
-    45848: 'ALetter',
-    45849: 'ALetter',
-    45850: 'ALetter',
-    45851: 'ALetter',
-    45852: 'ALetter',
-    45853: 'ALetter',
-    45854: 'ALetter',
-    45855: 'ALetter',
-    45856: 'ALetter',
-    45857: 'ALetter',
-    45858: 'ALetter',
-    45859: 'ALetter',
-    45860: 'ALetter',
-    45861: 'ALetter',
-    45862: 'ALetter',
-    45863: 'ALetter',
-    45864: 'ALetter',
-    45865: 'ALetter',
-    45866: 'ALetter',
-    45867: 'ALetter',
-    45868: 'ALetter',
-    45869: 'ALetter',
-    45870: 'ALetter',
-    45871: 'ALetter',
-    45872: 'ALetter',
-    45873: 'ALetter',
-    45874: 'ALetter',
-    45875: 'ALetter',
-    45876: 'ALetter',
-    45877: 'ALetter',
-    45878: 'ALetter',
-    45879: 'ALetter',
-    45880: 'ALetter',
-    45881: 'ALetter',
-    45882: 'ALetter',
-    45883: 'ALetter',
-    45884: 'ALetter',
-    45885: 'ALetter',
-    45886: 'ALetter',
-    45887: 'ALetter',
-    45888: 'ALetter',
-    45889: 'ALetter',
-    45890: 'ALetter',
-    45891: 'ALetter',
-    45892: 'ALetter',
-    45893: 'ALetter',
-    45894: 'ALetter',
-    45895: 'ALetter',
-    45896: 'ALetter',
-    45897: 'ALetter',
-    45898: 'ALetter',
-    45899: 'ALetter',
-    45900: 'ALetter',
-    45901: 'ALetter',
-    45902: 'ALetter',
-    45903: 'ALetter',
-    45904: 'ALetter',
-    45905: 'ALetter',
-    45906: 'ALetter',
-    45907: 'ALetter',
-    45908: 'ALetter',
-    45909: 'ALetter',
-    45910: 'ALetter',
-    45911: 'ALetter',
-    45912: 'ALetter',
-    45913: 'ALetter',
-    45914: 'ALetter',
-    45915: 'ALetter',
-    45916: 'ALetter',
-    45917: 'ALetter',
-    45918: 'ALetter',
-    45919: 'ALetter',
-    45920: 'ALetter',
-    45921: 'ALetter',
-    45922: 'ALetter',
-    45923: 'ALetter',
-    45924: 'ALetter',
-    45925: 'ALetter',
-    45926: 'ALetter',
-    45927: 'ALetter',
-    45928: 'ALetter',
-    45929: 'ALetter',
-    45930: 'ALetter',
-    45931: 'ALetter',
-    45932: 'ALetter',
-    45933: 'ALetter',
-    45934: 'ALetter',
-    45935: 'ALetter',
-    45936: 'ALetter',
-    45937: 'ALetter',
-    45938: 'ALetter',
-    45939: 'ALetter',
-    45940: 'ALetter',
-    45941: 'ALetter',
-    45942: 'ALetter',
-    45943: 'ALetter',
-    45944: 'ALetter',
-    45945: 'ALetter',
-    45946: 'ALetter',
-    45947: 'ALetter',
-    45948: 'ALetter',
-    45949: 'ALetter',
-    45950: 'ALetter',
-    45951: 'ALetter',
-    45952: 'ALetter',
-    45953: 'ALetter',
-    45954: 'ALetter',
-    45955: 'ALetter',
-    45956: 'ALetter',
-    45957: 'ALetter',
-    45958: 'ALetter',
-    45959: 'ALetter',
-    45960: 'ALetter',
-    45961: 'ALetter',
-    45962: 'ALetter',
-    45963: 'ALetter',
-    45964: 'ALetter',
-    45965: 'ALetter',
-    45966: 'ALetter',
-    45967: 'ALetter',
-    45968: 'ALetter',
-    45969: 'ALetter',
-    45970: 'ALetter',
-    45971: 'ALetter',
-    45972: 'ALetter',
-    45973: 'ALetter',
-    45974: 'ALetter',
-    45975: 'ALetter',
-    45976: 'ALetter',
-    45977: 'ALetter',
-    45978: 'ALetter',
-    45979: 'ALetter',
-    45980: 'ALetter',
-    45981: 'ALetter',
-    45982: 'ALetter',
-    45983: 'ALetter',
-    45984: 'ALetter',
-    45985: 'ALetter',
-    45986: 'ALetter',
-    45987: 'ALetter',
-    45988: 'ALetter',
-    45989: 'ALetter',
-    45990: 'ALetter',
-    45991: 'ALetter',
-    45992: 'ALetter',
-    45993: 'ALetter',
-    45994: 'ALetter',
-    45995: 'ALetter',
-    45996: 'ALetter',
-    45997: 'ALetter',
-    45998: 'ALetter',
-    45999: 'ALetter',
-    46000: 'ALetter',
-    46001: 'ALetter',
-    46002: 'ALetter',
-    46003: 'ALetter',
-    46004: 'ALetter',
-    46005: 'ALetter',
-    46006: 'ALetter',
-    46007: 'ALetter',
-    46008: 'ALetter',
-    46009: 'ALetter',
-    46010: 'ALetter',
-    46011: 'ALetter',
-    46012: 'ALetter',
-    46013: 'ALetter',
-    46014: 'ALetter',
-    46015: 'ALetter',
-    46016: 'ALetter',
-    46017: 'ALetter',
-    46018: 'ALetter',
-    46019: 'ALetter',
-    46020: 'ALetter',
-    46021: 'ALetter',
-    46022: 'ALetter',
-    46023: 'ALetter',
-    46024: 'ALetter',
-    46025: 'ALetter',
-    46026: 'ALetter',
-    46027: 'ALetter',
-    46028: 'ALetter',
-    46029: 'ALetter',
-    46030: 'ALetter',
-    46031: 'ALetter',
-    46032: 'ALetter',
-    46033: 'ALetter',
-    46034: 'ALetter',
-    46035: 'ALetter',
-    46036: 'ALetter',
-    46037: 'ALetter',
-    46038: 'ALetter',
-    46039: 'ALetter',
-    46040: 'ALetter',
-    46041: 'ALetter',
-    46042: 'ALetter',
-    46043: 'ALetter',
-    46044: 'ALetter',
-    46045: 'ALetter',
-    46046: 'ALetter',
-    46047: 'ALetter',
-    46048: 'ALetter',
-    46049: 'ALetter',
-    46050: 'ALetter',
-    46051: 'ALetter',
-    46052: 'ALetter',
-    46053: 'ALetter',
-    46054: 'ALetter',
-    46055: 'ALetter',
-    46056: 'ALetter',
-    46057: 'ALetter',
-    46058: 'ALetter',
-    46059: 'ALetter',
-    46060: 'ALetter',
-    46061: 'ALetter',
-    46062: 'ALetter',
-    46063: 'ALetter',
-    46064: 'ALetter',
-    46065: 'ALetter',
-    46066: 'ALetter',
-    46067: 'ALetter',
-    46068: 'ALetter',
-    46069: 'ALetter',
-    46070: 'ALetter',
-    46071: 'ALetter',
-    46072: 'ALetter',
-    46073: 'ALetter',
-    46074: 'ALetter',
-    46075: 'ALetter',
-    46076: 'ALetter',
-    46077: 'ALetter',
-    46078: 'ALetter',
-    46079: 'ALetter',
-    46080: 'ALetter',
-    46081: 'ALetter',
-    46082: 'ALetter',
-    46083: 'ALetter',
-    46084: 'ALetter',
-    46085: 'ALetter',
-    46086: 'ALetter',
-    46087: 'ALetter',
-    46088: 'ALetter',
-    46089: 'ALetter',
-    46090: 'ALetter',
-    46091: 'ALetter',
-    46092: 'ALetter',
-    46093: 'ALetter',
-    46094: 'ALetter',
-    46095: 'ALetter',
-    46096: 'ALetter',
-    46097: 'ALetter',
-    46098: 'ALetter',
-    46099: 'ALetter',
-    46100: 'ALetter',
-    46101: 'ALetter',
-    46102: 'ALetter',
-    46103: 'ALetter',
-    46104: 'ALetter',
-    46105: 'ALetter',
-    46106: 'ALetter',
-    46107: 'ALetter',
-    46108: 'ALetter',
-    46109: 'ALetter',
-    46110: 'ALetter',
-    46111: 'ALetter',
-    46112: 'ALetter',
-    46113: 'ALetter',
-    46114: 'ALetter',
-    46115: 'ALetter',
-    46116: 'ALetter',
-    46117: 'ALetter',
-    46118: 'ALetter',
-    46119: 'ALetter',
-    46120: 'ALetter',
-    46121: 'ALetter',
-    46122: 'ALetter',
-    46123: 'ALetter',
-    46124: 'ALetter',
-    46125: 'ALetter',
-    46126: 'ALetter',
-    46127: 'ALetter',
-    46128: 'ALetter',
-    46129: 'ALetter',
-    46130: 'ALetter',
-    46131: 'ALetter',
-    46132: 'ALetter',
-    46133: 'ALetter',
-    46134: 'ALetter',
-    46135: 'ALetter',
-    46136: 'ALetter',
-    46137: 'ALetter',
-    46138: 'ALetter',
-    46139: 'ALetter',
-    46140: 'ALetter',
-    46141: 'ALetter',
-    46142: 'ALetter',
-    46143: 'ALetter',
-    46144: 'ALetter',
-    46145: 'ALetter',
-    46146: 'ALetter',
-    46147: 'ALetter',
-    46148: 'ALetter',
-    46149: 'ALetter',
-    46150: 'ALetter',
-    46151: 'ALetter',
-    46152: 'ALetter',
-    46153: 'ALetter',
-    46154: 'ALetter',
-    46155: 'ALetter',
-    46156: 'ALetter',
-    46157: 'ALetter',
-    46158: 'ALetter',
-    46159: 'ALetter',
-    46160: 'ALetter',
-    46161: 'ALetter',
-    46162: 'ALetter',
-    46163: 'ALetter',
-    46164: 'ALetter',
-    46165: 'ALetter',
-    46166: 'ALetter',
-    46167: 'ALetter',
-    46168: 'ALetter',
-    46169: 'ALetter',
-    46170: 'ALetter',
-    46171: 'ALetter',
-    46172: 'ALetter',
-    46173: 'ALetter',
-    46174: 'ALetter',
-    46175: 'ALetter',
-    46176: 'ALetter',
-    46177: 'ALetter',
-    46178: 'ALetter',
-    46179: 'ALetter',
-    46180: 'ALetter',
-    46181: 'ALetter',
-    46182: 'ALetter',
-    46183: 'ALetter',
-    46184: 'ALetter',
-    46185: 'ALetter',
-    46186: 'ALetter',
-    46187: 'ALetter',
-    46188: 'ALetter',
-    46189: 'ALetter',
-    46190: 'ALetter',
-    46191: 'ALetter',
-    46192: 'ALetter',
-    46193: 'ALetter',
-    46194: 'ALetter',
-    46195: 'ALetter',
-    46196: 'ALetter',
-    46197: 'ALetter',
-    46198: 'ALetter',
-    46199: 'ALetter',
-    46200: 'ALetter',
-    46201: 'ALetter',
-    46202: 'ALetter',
-    46203: 'ALetter',
-    46204: 'ALetter',
-    46205: 'ALetter',
-    46206: 'ALetter',
-    46207: 'ALetter',
-    46208: 'ALetter',
-    46209: 'ALetter',
-    46210: 'ALetter',
-    46211: 'ALetter',
-    46212: 'ALetter',
-    46213: 'ALetter',
-    46214: 'ALetter',
-    46215: 'ALetter',
-    46216: 'ALetter',
-    46217: 'ALetter',
-    46218: 'ALetter',
-    46219: 'ALetter',
-    46220: 'ALetter',
-    46221: 'ALetter',
-    46222: 'ALetter',
-    46223: 'ALetter',
-    46224: 'ALetter',
-    46225: 'ALetter',
-    46226: 'ALetter',
-    46227: 'ALetter',
-    46228: 'ALetter',
-    46229: 'ALetter',
-    46230: 'ALetter',
-    46231: 'ALetter',
-    46232: 'ALetter',
-    46233: 'ALetter',
-    46234: 'ALetter',
-    46235: 'ALetter',
-    46236: 'ALetter',
-    46237: 'ALetter',
-    46238: 'ALetter',
-    46239: 'ALetter',
-    46240: 'ALetter',
-    46241: 'ALetter',
-    46242: 'ALetter',
-    46243: 'ALetter',
-    46244: 'ALetter',
-    46245: 'ALetter',
-    46246: 'ALetter',
-    46247: 'ALetter',
-    46248: 'ALetter',
-    46249: 'ALetter',
-    46250: 'ALetter',
-    46251: 'ALetter',
-    46252: 'ALetter',
-    46253: 'ALetter',
-    46254: 'ALetter',
-    46255: 'ALetter',
-    46256: 'ALetter',
-    46257: 'ALetter',
-    46258: 'ALetter',
-    46259: 'ALetter',
-    46260: 'ALetter',
-    46261: 'ALetter',
-    46262: 'ALetter',
-    46263: 'ALetter',
-    46264: 'ALetter',
-    46265: 'ALetter',
-    46266: 'ALetter',
-    46267: 'ALetter',
-    46268: 'ALetter',
-    46269: 'ALetter',
-    46270: 'ALetter',
-    46271: 'ALetter',
-    46272: 'ALetter',
-    46273: 'ALetter',
-    46274: 'ALetter',
-    46275: 'ALetter',
-    46276: 'ALetter',
-    46277: 'ALetter',
-    46278: 'ALetter',
-    46279: 'ALetter',
-    46280: 'ALetter',
-    46281: 'ALetter',
-    46282: 'ALetter',
-    46283: 'ALetter',
-    46284: 'ALetter',
-    46285: 'ALetter',
-    46286: 'ALetter',
-    46287: 'ALetter',
-    46288: 'ALetter',
-    46289: 'ALetter',
-    46290: 'ALetter',
-    46291: 'ALetter',
-    46292: 'ALetter',
-    46293: 'ALetter',
-    46294: 'ALetter',
-    46295: 'ALetter',
-    46296: 'ALetter',
-    46297: 'ALetter',
-    46298: 'ALetter',
-    46299: 'ALetter',
-    46300: 'ALetter',
-    46301: 'ALetter',
-    46302: 'ALetter',
-    46303: 'ALetter',
-    46304: 'ALetter',
-    46305: 'ALetter',
-    46306: 'ALetter',
-    46307: 'ALetter',
-    46308: 'ALetter',
-    46309: 'ALetter',
-    46310: 'ALetter',
-    46311: 'ALetter',
-    46312: 'ALetter',
-    46313: 'ALetter',
-    46314: 'ALetter',
-    46315: 'ALetter',
-    46316: 'ALetter',
-    46317: 'ALetter',
-    46318: 'ALetter',
-    46319: 'ALetter',
-    46320: 'ALetter',
-    46321: 'ALetter',
-    46322: 'ALetter',
-    46323: 'ALetter',
-    46324: 'ALetter',
-    46325: 'ALetter',
-    46326: 'ALetter',
-    46327: 'ALetter',
-    46328: 'ALetter',
-    46329: 'ALetter',
-    46330: 'ALetter',
-    46331: 'ALetter',
-    46332: 'ALetter',
-    46333: 'ALetter',
-    46334: 'ALetter',
-    46335: 'ALetter',
-    46336: 'ALetter',
-    46337: 'ALetter',
-    46338: 'ALetter',
-    46339: 'ALetter',
-    46340: 'ALetter',
-    46341: 'ALetter',
-    46342: 'ALetter',
-    46343: 'ALetter',
-    46344: 'ALetter',
-    46345: 'ALetter',
-    46346: 'ALetter',
-    46347: 'ALetter',
-    46348: 'ALetter',
-    46349: 'ALetter',
-    46350: 'ALetter',
-    46351: 'ALetter',
-    46352: 'ALetter',
-    46353: 'ALetter',
-    46354: 'ALetter',
-    46355: 'ALetter',
-    46356: 'ALetter',
-    46357: 'ALetter',
-    46358: 'ALetter',
-    46359: 'ALetter',
-    46360: 'ALetter',
-    46361: 'ALetter',
-    46362: 'ALetter',
-    46363: 'ALetter',
-    46364: 'ALetter',
-    46365: 'ALetter',
-    46366: 'ALetter',
-    46367: 'ALetter',
-    46368: 'ALetter',
-    46369: 'ALetter',
-    46370: 'ALetter',
-    46371: 'ALetter',
-    46372: 'ALetter',
-    46373: 'ALetter',
-    46374: 'ALetter',
-    46375: 'ALetter',
-    46376: 'ALetter',
-    46377: 'ALetter',
-    46378: 'ALetter',
-    46379: 'ALetter',
-    46380: 'ALetter',
-    46381: 'ALetter',
-    46382: 'ALetter',
-    46383: 'ALetter',
-    46384: 'ALetter',
-    46385: 'ALetter',
-    46386: 'ALetter',
-    46387: 'ALetter',
-    46388: 'ALetter',
-    46389: 'ALetter',
-    46390: 'ALetter',
-    46391: 'ALetter',
-    46392: 'ALetter',
-    46393: 'ALetter',
-    46394: 'ALetter',
-    46395: 'ALetter',
-    46396: 'ALetter',
-    46397: 'ALetter',
-    46398: 'ALetter',
-    46399: 'ALetter',
-    46400: 'ALetter',
-    46401: 'ALetter',
-    46402: 'ALetter',
-    46403: 'ALetter',
-    46404: 'ALetter',
-    46405: 'ALetter',
-    46406: 'ALetter',
-    46407: 'ALetter',
-    46408: 'ALetter',
-    46409: 'ALetter',
-    46410: 'ALetter',
-    46411: 'ALetter',
-    46412: 'ALetter',
-    46413: 'ALetter',
-    46414: 'ALetter',
-    46415: 'ALetter',
-    46416: 'ALetter',
-    46417: 'ALetter',
-    46418: 'ALetter',
-    46419: 'ALetter',
-    46420: 'ALetter',
-    46421: 'ALetter',
-    46422: 'ALetter',
-    46423: 'ALetter',
-    46424: 'ALetter',
-    46425: 'ALetter',
-    46426: 'ALetter',
-    46427: 'ALetter',
-    46428: 'ALetter',
-    46429: 'ALetter',
-    46430: 'ALetter',
-    46431: 'ALetter',
-    46432: 'ALetter',
-    46433: 'ALetter',
-    46434: 'ALetter',
-    46435: 'ALetter',
-    46436: 'ALetter',
-    46437: 'ALetter',
-    46438: 'ALetter',
-    46439: 'ALetter',
-    46440: 'ALetter',
-    46441: 'ALetter',
-    46442: 'ALetter',
-    46443: 'ALetter',
-    46444: 'ALetter',
-    46445: 'ALetter',
-    46446: 'ALetter',
-    46447: 'ALetter',
-    46448: 'ALetter',
-    46449: 'ALetter',
-    46450: 'ALetter',
-    46451: 'ALetter',
-    46452: 'ALetter',
-    46453: 'ALetter',
-    46454: 'ALetter',
-    46455: 'ALetter',
-    46456: 'ALetter',
-    46457: 'ALetter',
-    46458: 'ALetter',
-    46459: 'ALetter',
-    46460: 'ALetter',
-    46461: 'ALetter',
-    46462: 'ALetter',
-    46463: 'ALetter',
-    46464: 'ALetter',
-    46465: 'ALetter',
-    46466: 'ALetter',
-    46467: 'ALetter',
-    46468: 'ALetter',
-    46469: 'ALetter',
-    46470: 'ALetter',
-    46471: 'ALetter',
-    46472: 'ALetter',
-    46473: 'ALetter',
-    46474: 'ALetter',
-    46475: 'ALetter',
-    46476: 'ALetter',
-    46477: 'ALetter',
-    46478: 'ALetter',
-    46479: 'ALetter',
-    46480: 'ALetter',
-    46481: 'ALetter',
-    46482: 'ALetter',
-    46483: 'ALetter',
-    46484: 'ALetter',
-    46485: 'ALetter',
-    46486: 'ALetter',
-    46487: 'ALetter',
-    46488: 'ALetter',
-    46489: 'ALetter',
-    46490: 'ALetter',
-    46491: 'ALetter',
-    46492: 'ALetter',
-    46493: 'ALetter',
-    46494: 'ALetter',
-    46495: 'ALetter',
-    46496: 'ALetter',
-    46497: 'ALetter',
-    46498: 'ALetter',
-    46499: 'ALetter',
-    46500: 'ALetter',
-    46501: 'ALetter',
-    46502: 'ALetter',
-    46503: 'ALetter',
-    46504: 'ALetter',
-    46505: 'ALetter',
-    46506: 'ALetter',
-    46507: 'ALetter',
-    46508: 'ALetter',
-    46509: 'ALetter',
-    46510: 'ALetter',
-    46511: 'ALetter',
-    46512: 'ALetter',
-    46513: 'ALetter',
-    46514: 'ALetter',
-    46515: 'ALetter',
-    46516: 'ALetter',
-    46517: 'ALetter',
-    46518: 'ALetter',
-    46519: 'ALetter',
-    46520: 'ALetter',
-    46521: 'ALetter',
-    46522: 'ALetter',
-    46523: 'ALetter',
-    46524: 'ALetter',
-    46525: 'ALetter',
-    46526: 'ALetter',
-    46527: 'ALetter',
-    46528: 'ALetter',
-    46529: 'ALetter',
-    46530: 'ALetter',
-    46531: 'ALetter',
-    46532: 'ALetter',
-    46533: 'ALetter',
-    46534: 'ALetter',
-    46535: 'ALetter',
-    46536: 'ALetter',
-    46537: 'ALetter',
-    46538: 'ALetter',
-    46539: 'ALetter',
-    46540: 'ALetter',
-    46541: 'ALetter',
-    46542: 'ALetter',
-    46543: 'ALetter',
-    46544: 'ALetter',
-    46545: 'ALetter',
-    46546: 'ALetter',
-    46547: 'ALetter',
-    46548: 'ALetter',
-    46549: 'ALetter',
-    46550: 'ALetter',
-    46551: 'ALetter',
-    46552: 'ALetter',
-    46553: 'ALetter',
-    46554: 'ALetter',
-    46555: 'ALetter',
-    46556: 'ALetter',
-    46557: 'ALetter',
-    46558: 'ALetter',
-    46559: 'ALetter',
-    46560: 'ALetter',
-    46561: 'ALetter',
-    46562: 'ALetter',
-    46563: 'ALetter',
-    46564: 'ALetter',
-    46565: 'ALetter',
-    46566: 'ALetter',
-    46567: 'ALetter',
-    46568: 'ALetter',
-    46569: 'ALetter',
-    46570: 'ALetter',
-    46571: 'ALetter',
-    46572: 'ALetter',
-    46573: 'ALetter',
-    46574: 'ALetter',
-    46575: 'ALetter',
-    46576: 'ALetter',
-    46577: 'ALetter',
-    46578: 'ALetter',
-    46579: 'ALetter',
-    46580: 'ALetter',
-    46581: 'ALetter',
-    46582: 'ALetter',
-    46583: 'ALetter',
-    46584: 'ALetter',
-    46585: 'ALetter',
-    46586: 'ALetter',
-    46587: 'ALetter',
-    46588: 'ALetter',
-    46589: 'ALetter',
-    46590: 'ALetter',
-    46591: 'ALetter',
-    46592: 'ALetter',
-    46593: 'ALetter',
-    46594: 'ALetter',
-    46595: 'ALetter',
-    46596: 'ALetter',
-    46597: 'ALetter',
-    46598: 'ALetter',
-    46599: 'ALetter',
-    46600: 'ALetter',
-    46601: 'ALetter',
-    46602: 'ALetter',
-    46603: 'ALetter',
-    46604: 'ALetter',
-    46605: 'ALetter',
-    46606: 'ALetter',
-    46607: 'ALetter',
-    46608: 'ALetter',
-    46609: 'ALetter',
-    46610: 'ALetter',
-    46611: 'ALetter',
-    46612: 'ALetter',
-    46613: 'ALetter',
-    46614: 'ALetter',
-    46615: 'ALetter',
-    46616: 'ALetter',
-    46617: 'ALetter',
-    46618: 'ALetter',
-    46619: 'ALetter',
-    46620: 'ALetter',
-    46621: 'ALetter',
-    46622: 'ALetter',
-    46623: 'ALetter',
-    46624: 'ALetter',
-    46625: 'ALetter',
-    46626: 'ALetter',
-    46627: 'ALetter',
-    46628: 'ALetter',
-    46629: 'ALetter',
-    46630: 'ALetter',
-    46631: 'ALetter',
-    46632: 'ALetter',
-    46633: 'ALetter',
-    46634: 'ALetter',
-    46635: 'ALetter',
-    46636: 'ALetter',
-    46637: 'ALetter',
-    46638: 'ALetter',
-    46639: 'ALetter',
-    46640: 'ALetter',
-    46641: 'ALetter',
-    46642: 'ALetter',
-    46643: 'ALetter',
-    46644: 'ALetter',
-    46645: 'ALetter',
-    46646: 'ALetter',
-    46647: 'ALetter',
-    46648: 'ALetter',
-    46649: 'ALetter',
-    46650: 'ALetter',
-    46651: 'ALetter',
-    46652: 'ALetter',
-    46653: 'ALetter',
-    46654: 'ALetter',
-    46655: 'ALetter',
-    46656: 'ALetter',
-    46657: 'ALetter',
-    46658: 'ALetter',
-    46659: 'ALetter',
-    46660: 'ALetter',
-    46661: 'ALetter',
-    46662: 'ALetter',
-    46663: 'ALetter',
-    46664: 'ALetter',
-    46665: 'ALetter',
-    46666: 'ALetter',
-    46667: 'ALetter',
-    46668: 'ALetter',
-    46669: 'ALetter',
-    46670: 'ALetter',
-    46671: 'ALetter',
-    46672: 'ALetter',
-    46673: 'ALetter',
-    46674: 'ALetter',
-    46675: 'ALetter',
-    46676: 'ALetter',
-    46677: 'ALetter',
-    46678: 'ALetter',
-    46679: 'ALetter',
-    46680: 'ALetter',
-    46681: 'ALetter',
-    46682: 'ALetter',
-    46683: 'ALetter',
-    46684: 'ALetter',
-    46685: 'ALetter',
-    46686: 'ALetter',
-    46687: 'ALetter',
-    46688: 'ALetter',
-    46689: 'ALetter',
-    46690: 'ALetter',
-    46691: 'ALetter',
-    46692: 'ALetter',
-    46693: 'ALetter',
-    46694: 'ALetter',
-    46695: 'ALetter',
-    46696: 'ALetter',
-    46697: 'ALetter',
-    46698: 'ALetter',
-    46699: 'ALetter',
-    46700: 'ALetter',
-    46701: 'ALetter',
-    46702: 'ALetter',
-    46703: 'ALetter',
-    46704: 'ALetter',
-    46705: 'ALetter',
-    46706: 'ALetter',
-    46707: 'ALetter',
-    46708: 'ALetter',
-    46709: 'ALetter',
-    46710: 'ALetter',
-    46711: 'ALetter',
-    46712: 'ALetter',
-    46713: 'ALetter',
-    46714: 'ALetter',
-    46715: 'ALetter',
-    46716: 'ALetter',
-    46717: 'ALetter',
-    46718: 'ALetter',
-    46719: 'ALetter',
-    46720: 'ALetter',
-    46721: 'ALetter',
-    46722: 'ALetter',
-    46723: 'ALetter',
-    46724: 'ALetter',
-    46725: 'ALetter',
-    46726: 'ALetter',
-    46727: 'ALetter',
-    46728: 'ALetter',
-    46729: 'ALetter',
-    46730: 'ALetter',
-    46731: 'ALetter',
-    46732: 'ALetter',
-    46733: 'ALetter',
-    46734: 'ALetter',
-    46735: 'ALetter',
-    46736: 'ALetter',
-    46737: 'ALetter',
-    46738: 'ALetter',
-    46739: 'ALetter',
-    46740: 'ALetter',
-    46741: 'ALetter',
-    46742: 'ALetter',
-    46743: 'ALetter',
-    46744: 'ALetter',
-    46745: 'ALetter',
-    46746: 'ALetter',
-    46747: 'ALetter',
-    46748: 'ALetter',
-    46749: 'ALetter',
-    46750: 'ALetter',
-    46751: 'ALetter',
-    46752: 'ALetter',
-    46753: 'ALetter',
-    46754: 'ALetter',
-    46755: 'ALetter',
-    46756: 'ALetter',
-    46757: 'ALetter',
-    46758: 'ALetter',
-    46759: 'ALetter',
-    46760: 'ALetter',
-    46761: 'ALetter',
-    46762: 'ALetter',
-    46763: 'ALetter',
-    46764: 'ALetter',
-    46765: 'ALetter',
-    46766: 'ALetter',
-    46767: 'ALetter',
-    46768: 'ALetter',
-    46769: 'ALetter',
-    46770: 'ALetter',
-    46771: 'ALetter',
-    46772: 'ALetter',
-    46773: 'ALetter',
-    46774: 'ALetter',
-    46775: 'ALetter',
-    46776: 'ALetter',
-    46777: 'ALetter',
-    46778: 'ALetter',
-    46779: 'ALetter',
-    46780: 'ALetter',
-    46781: 'ALetter',
-    46782: 'ALetter',
-    46783: 'ALetter',
-    46784: 'ALetter',
-    46785: 'ALetter',
-    46786: 'ALetter',
-    46787: 'ALetter',
-    46788: 'ALetter',
-    46789: 'ALetter',
-    46790: 'ALetter',
-    46791: 'ALetter',
-    46792: 'ALetter',
-    46793: 'ALetter',
-    46794: 'ALetter',
-    46795: 'ALetter',
-    46796: 'ALetter',
-    46797: 'ALetter',
-    46798: 'ALetter',
-    46799: 'ALetter',
-    46800: 'ALetter',
-    46801: 'ALetter',
-    46802: 'ALetter',
-    46803: 'ALetter',
-    46804: 'ALetter',
-    46805: 'ALetter',
-    46806: 'ALetter',
-    46807: 'ALetter',
-    46808: 'ALetter',
-    46809: 'ALetter',
-    46810: 'ALetter',
-    46811: 'ALetter',
-    46812: 'ALetter',
-    46813: 'ALetter',
-    46814: 'ALetter',
-    46815: 'ALetter',
-    46816: 'ALetter',
-    46817: 'ALetter',
-    46818: 'ALetter',
-    46819: 'ALetter',
-    46820: 'ALetter',
-    46821: 'ALetter',
-    46822: 'ALetter',
-    46823: 'ALetter',
-    46824: 'ALetter',
-    46825: 'ALetter',
-    46826: 'ALetter',
-    46827: 'ALetter',
-    46828: 'ALetter',
-    46829: 'ALetter',
-    46830: 'ALetter',
-    46831: 'ALetter',
-    46832: 'ALetter',
-    46833: 'ALetter',
-    46834: 'ALetter',
-    46835: 'ALetter',
-    46836: 'ALetter',
-    46837: 'ALetter',
-    46838: 'ALetter',
-    46839: 'ALetter',
-    46840: 'ALetter',
-    46841: 'ALetter',
-    46842: 'ALetter',
-    46843: 'ALetter',
-    46844: 'ALetter',
-    46845: 'ALetter',
-    46846: 'ALetter',
-    46847: 'ALetter',
-    46848: 'ALetter',
-    46849: 'ALetter',
-    46850: 'ALetter',
-    46851: 'ALetter',
-    46852: 'ALetter',
-    46853: 'ALetter',
-    46854: 'ALetter',
-    46855: 'ALetter',
-    46856: 'ALetter',
-    46857: 'ALetter',
-    46858: 'ALetter',
-    46859: 'ALetter',
-    46860: 'ALetter',
-    46861: 'ALetter',
-    46862: 'ALetter',
-    46863: 'ALetter',
-    46864: 'ALetter',
-    46865: 'ALetter',
-    46866: 'ALetter',
-    46867: 'ALetter',
-    46868: 'ALetter',
-    46869: 'ALetter',
-    46870: 'ALetter',
-    46871: 'ALetter',
-    46872: 'ALetter',
-    46873: 'ALetter',
-    46874: 'ALetter',
-    46875: 'ALetter',
-    46876: 'ALetter',
-    46877: 'ALetter',
-    46878: 'ALetter',
-    46879: 'ALetter',
-    46880: 'ALetter',
-    46881: 'ALetter',
-    46882: 'ALetter',
-    46883: 'ALetter',
-    46884: 'ALetter',
-    46885: 'ALetter',
-    46886: 'ALetter',
-    46887: 'ALetter',
-    46888: 'ALetter',
-    46889: 'ALetter',
-    46890: 'ALetter',
-    46891: 'ALetter',
-    46892: 'ALetter',
-    46893: 'ALetter',
-    46894: 'ALetter',
-    46895: 'ALetter',
-    46896: 'ALetter',
-    46897: 'ALetter',
-    46898: 'ALetter',
-    46899: 'ALetter',
-    46900: 'ALetter',
-    46901: 'ALetter',
-    46902: 'ALetter',
-    46903: 'ALetter',
-    46904: 'ALetter',
-    46905: 'ALetter',
-    46906: 'ALetter',
-    46907: 'ALetter',
-    46908: 'ALetter',
-    46909: 'ALetter',
-    46910: 'ALetter',
-    46911: 'ALetter',
-    46912: 'ALetter',
-    46913: 'ALetter',
-    46914: 'ALetter',
-    46915: 'ALetter',
-    46916: 'ALetter',
-    46917: 'ALetter',
-    46918: 'ALetter',
-    46919: 'ALetter',
-    46920: 'ALetter',
-    46921: 'ALetter',
-    46922: 'ALetter',
-    46923: 'ALetter',
-    46924: 'ALetter',
-    46925: 'ALetter',
-    46926: 'ALetter',
-    46927: 'ALetter',
-    46928: 'ALetter',
-    46929: 'ALetter',
-    46930: 'ALetter',
-    46931: 'ALetter',
-    46932: 'ALetter',
-    46933: 'ALetter',
-    46934: 'ALetter',
-    46935: 'ALetter',
-    46936: 'ALetter',
-    46937: 'ALetter',
-    46938: 'ALetter',
-    46939: 'ALetter',
-    46940: 'ALetter',
-    46941: 'ALetter',
-    46942: 'ALetter',
-    46943: 'ALetter',
-    46944: 'ALetter',
-    46945: 'ALetter',
-    46946: 'ALetter',
-    46947: 'ALetter',
-    46948: 'ALetter',
-    46949: 'ALetter',
-    46950: 'ALetter',
-    46951: 'ALetter',
-    46952: 'ALetter',
-    46953: 'ALetter',
-    46954: 'ALetter',
-    46955: 'ALetter',
-    46956: 'ALetter',
-    46957: 'ALetter',
-    46958: 'ALetter',
-    46959: 'ALetter',
-    46960: 'ALetter',
-    46961: 'ALetter',
-    46962: 'ALetter',
-    46963: 'ALetter',
-    46964: 'ALetter',
-    46965: 'ALetter',
-    46966: 'ALetter',
-    46967: 'ALetter',
-    46968: 'ALetter',
-    46969: 'ALetter',
-    46970: 'ALetter',
-    46971: 'ALetter',
-    46972: 'ALetter',
-    46973: 'ALetter',
-    46974: 'ALetter',
-    46975: 'ALetter',
-    46976: 'ALetter',
-    46977: 'ALetter',
-    46978: 'ALetter',
-    46979: 'ALetter',
-    46980: 'ALetter',
-    46981: 'ALetter',
-    46982: 'ALetter',
-    46983: 'ALetter',
-    46984: 'ALetter',
-    46985: 'ALetter',
-    46986: 'ALetter',
-    46987: 'ALetter',
-    46988: 'ALetter',
-    46989: 'ALetter',
-    46990: 'ALetter',
-    46991: 'ALetter',
-    46992: 'ALetter',
-    46993: 'ALetter',
-    46994: 'ALetter',
-    46995: 'ALetter',
-    46996: 'ALetter',
-    46997: 'ALetter',
-    46998: 'ALetter',
-    46999: 'ALetter',
-    47000: 'ALetter',
-    47001: 'ALetter',
-    47002: 'ALetter',
-    47003: 'ALetter',
-    47004: 'ALetter',
-    47005: 'ALetter',
-    47006: 'ALetter',
-    47007: 'ALetter',
-    47008: 'ALetter',
-    47009: 'ALetter',
-    47010: 'ALetter',
-    47011: 'ALetter',
-    47012: 'ALetter',
-    47013: 'ALetter',
-    47014: 'ALetter',
-    47015: 'ALetter',
-    47016: 'ALetter',
-    47017: 'ALetter',
-    47018: 'ALetter',
-    47019: 'ALetter',
-    47020: 'ALetter',
-    47021: 'ALetter',
-    47022: 'ALetter',
-    47023: 'ALetter',
-    47024: 'ALetter',
-    47025: 'ALetter',
-    47026: 'ALetter',
-    47027: 'ALetter',
-    47028: 'ALetter',
-    47029: 'ALetter',
-    47030: 'ALetter',
-    47031: 'ALetter',
-    47032: 'ALetter',
-    47033: 'ALetter',
-    47034: 'ALetter',
-    47035: 'ALetter',
-    47036: 'ALetter',
-    47037: 'ALetter',
-    47038: 'ALetter',
-    47039: 'ALetter',
-    47040: 'ALetter',
-    47041: 'ALetter',
-    47042: 'ALetter',
-    47043: 'ALetter',
-    47044: 'ALetter',
-    47045: 'ALetter',
-    47046: 'ALetter',
-    47047: 'ALetter',
-    47048: 'ALetter',
-    47049: 'ALetter',
-    47050: 'ALetter',
-    47051: 'ALetter',
-    47052: 'ALetter',
-    47053: 'ALetter',
-    47054: 'ALetter',
-    47055: 'ALetter',
-    47056: 'ALetter',
-    47057: 'ALetter',
-    47058: 'ALetter',
-    47059: 'ALetter',
-    47060: 'ALetter',
-    47061: 'ALetter',
-    47062: 'ALetter',
-    47063: 'ALetter',
-    47064: 'ALetter',
-    47065: 'ALetter',
-    47066: 'ALetter',
-    47067: 'ALetter',
-    47068: 'ALetter',
-    47069: 'ALetter',
-    47070: 'ALetter',
-    47071: 'ALetter',
-    47072: 'ALetter',
-    47073: 'ALetter',
-    47074: 'ALetter',
-    47075: 'ALetter',
-    47076: 'ALetter',
-    47077: 'ALetter',
-    47078: 'ALetter',
-    47079: 'ALetter',
-    47080: 'ALetter',
-    47081: 'ALetter',
-    47082: 'ALetter',
-    47083: 'ALetter',
-    47084: 'ALetter',
-    47085: 'ALetter',
-    47086: 'ALetter',
-    47087: 'ALetter',
-    47088: 'ALetter',
-    47089: 'ALetter',
-    47090: 'ALetter',
-    47091: 'ALetter',
-    47092: 'ALetter',
-    47093: 'ALetter',
-    47094: 'ALetter',
-    47095: 'ALetter',
-    47096: 'ALetter',
-    47097: 'ALetter',
-    47098: 'ALetter',
-    47099: 'ALetter',
-    47100: 'ALetter',
-    47101: 'ALetter',
-    47102: 'ALetter',
-    47103: 'ALetter',
-    47104: 'ALetter',
-    47105: 'ALetter',
-    47106: 'ALetter',
-    47107: 'ALetter',
-    47108: 'ALetter',
-    47109: 'ALetter',
-    47110: 'ALetter',
-    47111: 'ALetter',
-    47112: 'ALetter',
-    47113: 'ALetter',
-    47114: 'ALetter',
-    47115: 'ALetter',
-    47116: 'ALetter',
-    47117: 'ALetter',
-    47118: 'ALetter',
-    47119: 'ALetter',
-    47120: 'ALetter',
-    47121: 'ALetter',
-    47122: 'ALetter',
-    47123: 'ALetter',
-    47124: 'ALetter',
-    47125: 'ALetter',
-    47126: 'ALetter',
-    47127: 'ALetter',
-    47128: 'ALetter',
-    47129: 'ALetter',
-    47130: 'ALetter',
-    47131: 'ALetter',
-    47132: 'ALetter',
-    47133: 'ALetter',
-    47134: 'ALetter',
-    47135: 'ALetter',
-    47136: 'ALetter',
-    47137: 'ALetter',
-    47138: 'ALetter',
-    47139: 'ALetter',
-    47140: 'ALetter',
-    47141: 'ALetter',
-    47142: 'ALetter',
-    47143: 'ALetter',
-    47144: 'ALetter',
-    47145: 'ALetter',
-    47146: 'ALetter',
-    47147: 'ALetter',
-    47148: 'ALetter',
-    47149: 'ALetter',
-    47150: 'ALetter',
-    47151: 'ALetter',
-    47152: 'ALetter',
-    47153: 'ALetter',
-    47154: 'ALetter',
-    47155: 'ALetter',
-    47156: 'ALetter',
-    47157: 'ALetter',
-    47158: 'ALetter',
-    47159: 'ALetter',
-    47160: 'ALetter',
-    47161: 'ALetter',
-    47162: 'ALetter',
-    47163: 'ALetter',
-    47164: 'ALetter',
-    47165: 'ALetter',
-    47166: 'ALetter',
-    47167: 'ALetter',
-    47168: 'ALetter',
-    47169: 'ALetter',
-    47170: 'ALetter',
-    47171: 'ALetter',
-    47172: 'ALetter',
-    47173: 'ALetter',
-    47174: 'ALetter',
-    47175: 'ALetter',
-    47176: 'ALetter',
-    47177: 'ALetter',
-    47178: 'ALetter',
-    47179: 'ALetter',
-    47180: 'ALetter',
-    47181: 'ALetter',
-    47182: 'ALetter',
-    47183: 'ALetter',
-    47184: 'ALetter',
-    47185: 'ALetter',
-    47186: 'ALetter',
-    47187: 'ALetter',
-    47188: 'ALetter',
-    47189: 'ALetter',
-    47190: 'ALetter',
-    47191: 'ALetter',
-    47192: 'ALetter',
-    47193: 'ALetter',
-    47194: 'ALetter',
-    47195: 'ALetter',
-    47196: 'ALetter',
-    47197: 'ALetter',
-    47198: 'ALetter',
-    47199: 'ALetter',
-    47200: 'ALetter',
-    47201: 'ALetter',
-    47202: 'ALetter',
-    47203: 'ALetter',
-    47204: 'ALetter',
-    47205: 'ALetter',
-    47206: 'ALetter',
-    47207: 'ALetter',
-    47208: 'ALetter',
-    47209: 'ALetter',
-    47210: 'ALetter',
-    47211: 'ALetter',
-    47212: 'ALetter',
-    47213: 'ALetter',
-    47214: 'ALetter',
-    47215: 'ALetter',
-    47216: 'ALetter',
-    47217: 'ALetter',
-    47218: 'ALetter',
-    47219: 'ALetter',
-    47220: 'ALetter',
-    47221: 'ALetter',
-    47222: 'ALetter',
-    47223: 'ALetter',
-    47224: 'ALetter',
-    47225: 'ALetter',
-    47226: 'ALetter',
-    47227: 'ALetter',
-    47228: 'ALetter',
-    47229: 'ALetter',
-    47230: 'ALetter',
-    47231: 'ALetter',
-    47232: 'ALetter',
-    47233: 'ALetter',
-    47234: 'ALetter',
-    47235: 'ALetter',
-    47236: 'ALetter',
-    47237: 'ALetter',
-    47238: 'ALetter',
-    47239: 'ALetter',
-    47240: 'ALetter',
-    47241: 'ALetter',
-    47242: 'ALetter',
-    47243: 'ALetter',
-    47244: 'ALetter',
-    47245: 'ALetter',
-    47246: 'ALetter',
-    47247: 'ALetter',
-    47248: 'ALetter',
-    47249: 'ALetter',
-    47250: 'ALetter',
-    47251: 'ALetter',
-    47252: 'ALetter',
-    47253: 'ALetter',
-    47254: 'ALetter',
-    47255: 'ALetter',
-    47256: 'ALetter',
-    47257: 'ALetter',
-    47258: 'ALetter',
-    47259: 'ALetter',
-    47260: 'ALetter',
-    47261: 'ALetter',
-    47262: 'ALetter',
-    47263: 'ALetter',
-    47264: 'ALetter',
-    47265: 'ALetter',
-    47266: 'ALetter',
-    47267: 'ALetter',
-    47268: 'ALetter',
-    47269: 'ALetter',
-    47270: 'ALetter',
-    47271: 'ALetter',
-    47272: 'ALetter',
-    47273: 'ALetter',
-    47274: 'ALetter',
-    47275: 'ALetter',
-    47276: 'ALetter',
-    47277: 'ALetter',
-    47278: 'ALetter',
-    47279: 'ALetter',
-    47280: 'ALetter',
-    47281: 'ALetter',
-    47282: 'ALetter',
-    47283: 'ALetter',
-    47284: 'ALetter',
-    47285: 'ALetter',
-    47286: 'ALetter',
-    47287: 'ALetter',
-    47288: 'ALetter',
-    47289: 'ALetter',
-    47290: 'ALetter',
-    47291: 'ALetter',
-    47292: 'ALetter',
-    47293: 'ALetter',
-    47294: 'ALetter',
-    47295: 'ALetter',
-    47296: 'ALetter',
-    47297: 'ALetter',
-    47298: 'ALetter',
-    47299: 'ALetter',
-    47300: 'ALetter',
-    47301: 'ALetter',
-    47302: 'ALetter',
-    47303: 'ALetter',
-    47304: 'ALetter',
-    47305: 'ALetter',
-    47306: 'ALetter',
-    47307: 'ALetter',
-    47308: 'ALetter',
-    47309: 'ALetter',
-    47310: 'ALetter',
-    47311: 'ALetter',
-    47312: 'ALetter',
-    47313: 'ALetter',
-    47314: 'ALetter',
-    47315: 'ALetter',
-    47316: 'ALetter',
-    47317: 'ALetter',
-    47318: 'ALetter',
-    47319: 'ALetter',
-    47320: 'ALetter',
-    47321: 'ALetter',
-    47322: 'ALetter',
-    47323: 'ALetter',
-    47324: 'ALetter',
-    47325: 'ALetter',
-    47326: 'ALetter',
-    47327: 'ALetter',
-    47328: 'ALetter',
-    47329: 'ALetter',
-    47330: 'ALetter',
-    47331: 'ALetter',
-    47332: 'ALetter',
-    47333: 'ALetter',
-    47334: 'ALetter',
-    47335: 'ALetter',
-    47336: 'ALetter',
-    47337: 'ALetter',
-    47338: 'ALetter',
-    47339: 'ALetter',
-    47340: 'ALetter',
-    47341: 'ALetter',
-    47342: 'ALetter',
-    47343: 'ALetter',
-    47344: 'ALetter',
-    47345: 'ALetter',
-    47346: 'ALetter',
-    47347: 'ALetter',
-    47348: 'ALetter',
-    47349: 'ALetter',
-    47350: 'ALetter',
-    47351: 'ALetter',
-    47352: 'ALetter',
-    47353: 'ALetter',
-    47354: 'ALetter',
-    47355: 'ALetter',
-    47356: 'ALetter',
-    47357: 'ALetter',
-    47358: 'ALetter',
-    47359: 'ALetter',
-    47360: 'ALetter',
-    47361: 'ALetter',
-    47362: 'ALetter',
-    47363: 'ALetter',
-    47364: 'ALetter',
-    47365: 'ALetter',
-    47366: 'ALetter',
-    47367: 'ALetter',
-    47368: 'ALetter',
-    47369: 'ALetter',
-    47370: 'ALetter',
-    47371: 'ALetter',
-    47372: 'ALetter',
-    47373: 'ALetter',
-    47374: 'ALetter',
-    47375: 'ALetter',
-    47376: 'ALetter',
-    47377: 'ALetter',
-    47378: 'ALetter',
-    47379: 'ALetter',
-    47380: 'ALetter',
-    47381: 'ALetter',
-    47382: 'ALetter',
-    47383: 'ALetter',
-    47384: 'ALetter',
-    47385: 'ALetter',
-    47386: 'ALetter',
-    47387: 'ALetter',
-    47388: 'ALetter',
-    47389: 'ALetter',
-    47390: 'ALetter',
-    47391: 'ALetter',
-    47392: 'ALetter',
-    47393: 'ALetter',
-    47394: 'ALetter',
-    47395: 'ALetter',
-    47396: 'ALetter',
-    47397: 'ALetter',
-    47398: 'ALetter',
-    47399: 'ALetter',
-    47400: 'ALetter',
-    47401: 'ALetter',
-    47402: 'ALetter',
-    47403: 'ALetter',
-    47404: 'ALetter',
-    47405: 'ALetter',
-    47406: 'ALetter',
-    47407: 'ALetter',
-    47408: 'ALetter',
-    47409: 'ALetter',
-    47410: 'ALetter',
-    47411: 'ALetter',
-    47412: 'ALetter',
-    47413: 'ALetter',
-    47414: 'ALetter',
-    47415: 'ALetter',
-    47416: 'ALetter',
-    47417: 'ALetter',
-    47418: 'ALetter',
-    47419: 'ALetter',
-    47420: 'ALetter',
-    47421: 'ALetter',
-    47422: 'ALetter',
-    47423: 'ALetter',
-    47424: 'ALetter',
-    47425: 'ALetter',
-    47426: 'ALetter',
-    47427: 'ALetter',
-    47428: 'ALetter',
-    47429: 'ALetter',
-    47430: 'ALetter',
-    47431: 'ALetter',
-    47432: 'ALetter',
-    47433: 'ALetter',
-    47434: 'ALetter',
-    47435: 'ALetter',
-    47436: 'ALetter',
-    47437: 'ALetter',
-    47438: 'ALetter',
-    47439: 'ALetter',
-    47440: 'ALetter',
-    47441: 'ALetter',
-    47442: 'ALetter',
-    47443: 'ALetter',
-    47444: 'ALetter',
-    47445: 'ALetter',
-    47446: 'ALetter',
-    47447: 'ALetter',
-    47448: 'ALetter',
-    47449: 'ALetter',
-    47450: 'ALetter',
-    47451: 'ALetter',
-    47452: 'ALetter',
-    47453: 'ALetter',
-    47454: 'ALetter',
-    47455: 'ALetter',
-    47456: 'ALetter',
-    47457: 'ALetter',
-    47458: 'ALetter',
-    47459: 'ALetter',
-    47460: 'ALetter',
-    47461: 'ALetter',
-    47462: 'ALetter',
-    47463: 'ALetter',
-    47464: 'ALetter',
-    47465: 'ALetter',
-    47466: 'ALetter',
-    47467: 'ALetter',
-    47468: 'ALetter',
-    47469: 'ALetter',
-    47470: 'ALetter',
-    47471: 'ALetter',
-    47472: 'ALetter',
-    47473: 'ALetter',
-    47474: 'ALetter',
-    47475: 'ALetter',
-    47476: 'ALetter',
-    47477: 'ALetter',
-    47478: 'ALetter',
-    47479: 'ALetter',
-    47480: 'ALetter',
-    47481: 'ALetter',
-    47482: 'ALetter',
-    47483: 'ALetter',
-    47484: 'ALetter',
-    47485: 'ALetter',
-    47486: 'ALetter',
-    47487: 'ALetter',
-    47488: 'ALetter',
-    47489: 'ALetter',
-    47490: 'ALetter',
-    47491: 'ALetter',
-    47492: 'ALetter',
-    47493: 'ALetter',
-    47494: 'ALetter',
-    47495: 'ALetter',
-    47496: 'ALetter',
-    47497: 'ALetter',
-    47498: 'ALetter',
-    47499: 'ALetter',
-    47500: 'ALetter',
-    47501: 'ALetter',
-    47502: 'ALetter',
-    47503: 'ALetter',
-    47504: 'ALetter',
-    47505: 'ALetter',
-    47506: 'ALetter',
-    47507: 'ALetter',
-    47508: 'ALetter',
-    47509: 'ALetter',
-    47510: 'ALetter',
-    47511: 'ALetter',
-    47512: 'ALetter',
-    47513: 'ALetter',
-    47514: 'ALetter',
-    47515: 'ALetter',
-    47516: 'ALetter',
-    47517: 'ALetter',
-    47518: 'ALetter',
-    47519: 'ALetter',
-    47520: 'ALetter',
-    47521: 'ALetter',
-    47522: 'ALetter',
-    47523: 'ALetter',
-    47524: 'ALetter',
-    47525: 'ALetter',
-    47526: 'ALetter',
-    47527: 'ALetter',
-    47528: 'ALetter',
-    47529: 'ALetter',
-    47530: 'ALetter',
-    47531: 'ALetter',
-    47532: 'ALetter',
-    47533: 'ALetter',
-    47534: 'ALetter',
-    47535: 'ALetter',
-    47536: 'ALetter',
-    47537: 'ALetter',
-    47538: 'ALetter',
-    47539: 'ALetter',
-    47540: 'ALetter',
-    47541: 'ALetter',
-    47542: 'ALetter',
-    47543: 'ALetter',
-    47544: 'ALetter',
-    47545: 'ALetter',
-    47546: 'ALetter',
-    47547: 'ALetter',
-    47548: 'ALetter',
-    47549: 'ALetter',
-    47550: 'ALetter',
-    47551: 'ALetter',
-    47552: 'ALetter',
-    47553: 'ALetter',
-    47554: 'ALetter',
-    47555: 'ALetter',
-    47556: 'ALetter',
-    47557: 'ALetter',
-    47558: 'ALetter',
-    47559: 'ALetter',
-    47560: 'ALetter',
-    47561: 'ALetter',
-    47562: 'ALetter',
-    47563: 'ALetter',
-    47564: 'ALetter',
-    47565: 'ALetter',
-    47566: 'ALetter',
-    47567: 'ALetter',
-    47568: 'ALetter',
-    47569: 'ALetter',
-    47570: 'ALetter',
-    47571: 'ALetter',
-    47572: 'ALetter',
-    47573: 'ALetter',
-    47574: 'ALetter',
-    47575: 'ALetter',
-    47576: 'ALetter',
-    47577: 'ALetter',
-    47578: 'ALetter',
-    47579: 'ALetter',
-    47580: 'ALetter',
-    47581: 'ALetter',
-    47582: 'ALetter',
-    47583: 'ALetter',
-    47584: 'ALetter',
-    47585: 'ALetter',
-    47586: 'ALetter',
-    47587: 'ALetter',
-    47588: 'ALetter',
-    47589: 'ALetter',
-    47590: 'ALetter',
-    47591: 'ALetter',
-    47592: 'ALetter',
-    47593: 'ALetter',
-    47594: 'ALetter',
-    47595: 'ALetter',
-    47596: 'ALetter',
-    47597: 'ALetter',
-    47598: 'ALetter',
-    47599: 'ALetter',
-    47600: 'ALetter',
-    47601: 'ALetter',
-    47602: 'ALetter',
-    47603: 'ALetter',
-    47604: 'ALetter',
-    47605: 'ALetter',
-    47606: 'ALetter',
-    47607: 'ALetter',
-    47608: 'ALetter',
-    47609: 'ALetter',
-    47610: 'ALetter',
-    47611: 'ALetter',
-    47612: 'ALetter',
-    47613: 'ALetter',
-    47614: 'ALetter',
-    47615: 'ALetter',
-    47616: 'ALetter',
-    47617: 'ALetter',
-    47618: 'ALetter',
-    47619: 'ALetter',
-    47620: 'ALetter',
-    47621: 'ALetter',
-    47622: 'ALetter',
-    47623: 'ALetter',
-    47624: 'ALetter',
-    47625: 'ALetter',
-    47626: 'ALetter',
-    47627: 'ALetter',
-    47628: 'ALetter',
-    47629: 'ALetter',
-    47630: 'ALetter',
-    47631: 'ALetter',
-    47632: 'ALetter',
-    47633: 'ALetter',
-    47634: 'ALetter',
-    47635: 'ALetter',
-    47636: 'ALetter',
-    47637: 'ALetter',
-    47638: 'ALetter',
-    47639: 'ALetter',
-    47640: 'ALetter',
-    47641: 'ALetter',
-    47642: 'ALetter',
-    47643: 'ALetter',
-    47644: 'ALetter',
-    47645: 'ALetter',
-    47646: 'ALetter',
-    47647: 'ALetter',
-    47648: 'ALetter',
-    47649: 'ALetter',
-    47650: 'ALetter',
-    47651: 'ALetter',
-    47652: 'ALetter',
-    47653: 'ALetter',
-    47654: 'ALetter',
-    47655: 'ALetter',
-    47656: 'ALetter',
-    47657: 'ALetter',
-    47658: 'ALetter',
-    47659: 'ALetter',
-    47660: 'ALetter',
-    47661: 'ALetter',
-    47662: 'ALetter',
-    47663: 'ALetter',
-    47664: 'ALetter',
-    47665: 'ALetter',
-    47666: 'ALetter',
-    47667: 'ALetter',
-    47668: 'ALetter',
-    47669: 'ALetter',
-    47670: 'ALetter',
-    47671: 'ALetter',
-    47672: 'ALetter',
-    47673: 'ALetter',
-    47674: 'ALetter',
-    47675: 'ALetter',
-    47676: 'ALetter',
-    47677: 'ALetter',
-    47678: 'ALetter',
-    47679: 'ALetter',
-    47680: 'ALetter',
-    47681: 'ALetter',
-    47682: 'ALetter',
-    47683: 'ALetter',
-    47684: 'ALetter',
-    47685: 'ALetter',
-    47686: 'ALetter',
-    47687: 'ALetter',
-    47688: 'ALetter',
-    47689: 'ALetter',
-    47690: 'ALetter',
-    47691: 'ALetter',
-    47692: 'ALetter',
-    47693: 'ALetter',
-    47694: 'ALetter',
-    47695: 'ALetter',
-    47696: 'ALetter',
-    47697: 'ALetter',
-    47698: 'ALetter',
-    47699: 'ALetter',
-    47700: 'ALetter',
-    47701: 'ALetter',
-    47702: 'ALetter',
-    47703: 'ALetter',
-    47704: 'ALetter',
-    47705: 'ALetter',
-    47706: 'ALetter',
-    47707: 'ALetter',
-    47708: 'ALetter',
-    47709: 'ALetter',
-    47710: 'ALetter',
-    47711: 'ALetter',
-    47712: 'ALetter',
-    47713: 'ALetter',
-    47714: 'ALetter',
-    47715: 'ALetter',
-    47716: 'ALetter',
-    47717: 'ALetter',
-    47718: 'ALetter',
-    47719: 'ALetter',
-    47720: 'ALetter',
-    47721: 'ALetter',
-    47722: 'ALetter',
-    47723: 'ALetter',
-    47724: 'ALetter',
-    47725: 'ALetter',
-    47726: 'ALetter',
-    47727: 'ALetter',
-    47728: 'ALetter',
-    47729: 'ALetter',
-    47730: 'ALetter',
-    47731: 'ALetter',
-    47732: 'ALetter',
-    47733: 'ALetter',
-    47734: 'ALetter',
-    47735: 'ALetter',
-    47736: 'ALetter',
-    47737: 'ALetter',
-    47738: 'ALetter',
-    47739: 'ALetter',
-    47740: 'ALetter',
-    47741: 'ALetter',
-    47742: 'ALetter',
-    47743: 'ALetter',
-    47744: 'ALetter',
-    47745: 'ALetter',
-    47746: 'ALetter',
-    47747: 'ALetter',
-    47748: 'ALetter',
-    47749: 'ALetter',
-    47750: 'ALetter',
-    47751: 'ALetter',
-    47752: 'ALetter',
-    47753: 'ALetter',
-    47754: 'ALetter',
-    47755: 'ALetter',
-    47756: 'ALetter',
-    47757: 'ALetter',
-    47758: 'ALetter',
-    47759: 'ALetter',
-    47760: 'ALetter',
-    47761: 'ALetter',
-    47762: 'ALetter',
-    47763: 'ALetter',
-    47764: 'ALetter',
-    47765: 'ALetter',
-    47766: 'ALetter',
-    47767: 'ALetter',
-    47768: 'ALetter',
-    47769: 'ALetter',
-    47770: 'ALetter',
-    47771: 'ALetter',
-    47772: 'ALetter',
-    47773: 'ALetter',
-    47774: 'ALetter',
-    47775: 'ALetter',
-    47776: 'ALetter',
-    47777: 'ALetter',
-    47778: 'ALetter',
-    47779: 'ALetter',
-    47780: 'ALetter',
-    47781: 'ALetter',
-    47782: 'ALetter',
-    47783: 'ALetter',
-    47784: 'ALetter',
-    47785: 'ALetter',
-    47786: 'ALetter',
-    47787: 'ALetter',
-    47788: 'ALetter',
-    47789: 'ALetter',
-    47790: 'ALetter',
-    47791: 'ALetter',
-    47792: 'ALetter',
-    47793: 'ALetter',
-    47794: 'ALetter',
-    47795: 'ALetter',
-    47796: 'ALetter',
-    47797: 'ALetter',
-    47798: 'ALetter',
-    47799: 'ALetter',
-    47800: 'ALetter',
-    47801: 'ALetter',
-    47802: 'ALetter',
-    47803: 'ALetter',
-    47804: 'ALetter',
-    47805: 'ALetter',
-    47806: 'ALetter',
-    47807: 'ALetter',
-    47808: 'ALetter',
-    47809: 'ALetter',
-    47810: 'ALetter',
-    47811: 'ALetter',
-    47812: 'ALetter',
-    47813: 'ALetter',
-    47814: 'ALetter',
-    47815: 'ALetter',
-    47816: 'ALetter',
-    47817: 'ALetter',
-    47818: 'ALetter',
-    47819: 'ALetter',
-    47820: 'ALetter',
-    47821: 'ALetter',
-    47822: 'ALetter',
-    47823: 'ALetter',
-    47824: 'ALetter',
-    47825: 'ALetter',
-    47826: 'ALetter',
-    47827: 'ALetter',
-    47828: 'ALetter',
-    47829: 'ALetter',
-    47830: 'ALetter',
-    47831: 'ALetter',
-    47832: 'ALetter',
-    47833: 'ALetter',
-    47834: 'ALetter',
-    47835: 'ALetter',
-    47836: 'ALetter',
-    47837: 'ALetter',
-    47838: 'ALetter',
-    47839: 'ALetter',
-    47840: 'ALetter',
-    47841: 'ALetter',
-    47842: 'ALetter',
-    47843: 'ALetter',
-    47844: 'ALetter',
-    47845: 'ALetter',
-    47846: 'ALetter',
-    47847: 'ALetter',
-    47848: 'ALetter',
-    47849: 'ALetter',
-    47850: 'ALetter',
-    47851: 'ALetter',
-    47852: 'ALetter',
-    47853: 'ALetter',
-    47854: 'ALetter',
-    47855: 'ALetter',
-    47856: 'ALetter',
-    47857: 'ALetter',
-    47858: 'ALetter',
-    47859: 'ALetter',
-    47860: 'ALetter',
-    47861: 'ALetter',
-    47862: 'ALetter',
-    47863: 'ALetter',
-    47864: 'ALetter',
-    47865: 'ALetter',
-    47866: 'ALetter',
-    47867: 'ALetter',
-    47868: 'ALetter',
-    47869: 'ALetter',
-    47870: 'ALetter',
-    47871: 'ALetter',
-    47872: 'ALetter',
-    47873: 'ALetter',
-    47874: 'ALetter',
-    47875: 'ALetter',
-    47876: 'ALetter',
-    47877: 'ALetter',
-    47878: 'ALetter',
-    47879: 'ALetter',
-    47880: 'ALetter',
-    47881: 'ALetter',
-    47882: 'ALetter',
-    47883: 'ALetter',
-    47884: 'ALetter',
-    47885: 'ALetter',
-    47886: 'ALetter',
-    47887: 'ALetter',
-    47888: 'ALetter',
-    47889: 'ALetter',
-    47890: 'ALetter',
-    47891: 'ALetter',
-    47892: 'ALetter',
-    47893: 'ALetter',
-    47894: 'ALetter',
-    47895: 'ALetter',
-    47896: 'ALetter',
-    47897: 'ALetter',
-    47898: 'ALetter',
-    47899: 'ALetter',
-    47900: 'ALetter',
-    47901: 'ALetter',
-    47902: 'ALetter',
-    47903: 'ALetter',
-    47904: 'ALetter',
-    47905: 'ALetter',
-    47906: 'ALetter',
-    47907: 'ALetter',
-    47908: 'ALetter',
-    47909: 'ALetter',
-    47910: 'ALetter',
-    47911: 'ALetter',
-    47912: 'ALetter',
-    47913: 'ALetter',
-    47914: 'ALetter',
-    47915: 'ALetter',
-    47916: 'ALetter',
-    47917: 'ALetter',
-    47918: 'ALetter',
-    47919: 'ALetter',
-    47920: 'ALetter',
-    47921: 'ALetter',
-    47922: 'ALetter',
-    47923: 'ALetter',
-    47924: 'ALetter',
-    47925: 'ALetter',
-    47926: 'ALetter',
-    47927: 'ALetter',
-    47928: 'ALetter',
-    47929: 'ALetter',
-    47930: 'ALetter',
-    47931: 'ALetter',
-    47932: 'ALetter',
-    47933: 'ALetter',
-    47934: 'ALetter',
-    47935: 'ALetter',
-    47936: 'ALetter',
-    47937: 'ALetter',
-    47938: 'ALetter',
-    47939: 'ALetter',
-    47940: 'ALetter',
-    47941: 'ALetter',
-    47942: 'ALetter',
-    47943: 'ALetter',
-    47944: 'ALetter',
-    47945: 'ALetter',
-    47946: 'ALetter',
-    47947: 'ALetter',
-    47948: 'ALetter',
-    47949: 'ALetter',
-    47950: 'ALetter',
-    47951: 'ALetter',
-    47952: 'ALetter',
-    47953: 'ALetter',
-    47954: 'ALetter',
-    47955: 'ALetter',
-    47956: 'ALetter',
-    47957: 'ALetter',
-    47958: 'ALetter',
-    47959: 'ALetter',
-    47960: 'ALetter',
-    47961: 'ALetter',
-    47962: 'ALetter',
-    47963: 'ALetter',
-    47964: 'ALetter',
-    47965: 'ALetter',
-    47966: 'ALetter',
-    47967: 'ALetter',
-    47968: 'ALetter',
-    47969: 'ALetter',
-    47970: 'ALetter',
-    47971: 'ALetter',
-    47972: 'ALetter',
-    47973: 'ALetter',
-    47974: 'ALetter',
-    47975: 'ALetter',
-    47976: 'ALetter',
-    47977: 'ALetter',
-    47978: 'ALetter',
-    47979: 'ALetter',
-    47980: 'ALetter',
-    47981: 'ALetter',
-    47982: 'ALetter',
-    47983: 'ALetter',
-    47984: 'ALetter',
-    47985: 'ALetter',
-    47986: 'ALetter',
-    47987: 'ALetter',
-    47988: 'ALetter',
-    47989: 'ALetter',
-    47990: 'ALetter',
-    47991: 'ALetter',
-    47992: 'ALetter',
-    47993: 'ALetter',
-    47994: 'ALetter',
-    47995: 'ALetter',
-    47996: 'ALetter',
-    47997: 'ALetter',
-    47998: 'ALetter',
-    47999: 'ALetter',
-    48000: 'ALetter',
-    48001: 'ALetter',
-    48002: 'ALetter',
-    48003: 'ALetter',
-    48004: 'ALetter',
-    48005: 'ALetter',
-    48006: 'ALetter',
-    48007: 'ALetter',
-    48008: 'ALetter',
-    48009: 'ALetter',
-    48010: 'ALetter',
-    48011: 'ALetter',
-    48012: 'ALetter',
-    48013: 'ALetter',
-    48014: 'ALetter',
-    48015: 'ALetter',
-    48016: 'ALetter',
-    48017: 'ALetter',
-    48018: 'ALetter',
-    48019: 'ALetter',
-    48020: 'ALetter',
-    48021: 'ALetter',
-    48022: 'ALetter',
-    48023: 'ALetter',
-    48024: 'ALetter',
-    48025: 'ALetter',
-    48026: 'ALetter',
-    48027: 'ALetter',
-    48028: 'ALetter',
-    48029: 'ALetter',
-    48030: 'ALetter',
-    48031: 'ALetter',
-    48032: 'ALetter',
-    48033: 'ALetter',
-    48034: 'ALetter',
-    48035: 'ALetter',
-    48036: 'ALetter',
-    48037: 'ALetter',
-    48038: 'ALetter',
-    48039: 'ALetter',
-    48040: 'ALetter',
-    48041: 'ALetter',
-    48042: 'ALetter',
-    48043: 'ALetter',
-    48044: 'ALetter',
-    48045: 'ALetter',
-    48046: 'ALetter',
-    48047: 'ALetter',
-    48048: 'ALetter',
-    48049: 'ALetter',
-    48050: 'ALetter',
-    48051: 'ALetter',
-    48052: 'ALetter',
-    48053: 'ALetter',
-    48054: 'ALetter',
-    48055: 'ALetter',
-    48056: 'ALetter',
-    48057: 'ALetter',
-    48058: 'ALetter',
-    48059: 'ALetter',
-    48060: 'ALetter',
-    48061: 'ALetter',
-    48062: 'ALetter',
-    48063: 'ALetter',
-    48064: 'ALetter',
-    48065: 'ALetter',
-    48066: 'ALetter',
-    48067: 'ALetter',
-    48068: 'ALetter',
-    48069: 'ALetter',
-    48070: 'ALetter',
-    48071: 'ALetter',
-    48072: 'ALetter',
-    48073: 'ALetter',
-    48074: 'ALetter',
-    48075: 'ALetter',
-    48076: 'ALetter',
-    48077: 'ALetter',
-    48078: 'ALetter',
-    48079: 'ALetter',
-    48080: 'ALetter',
-    48081: 'ALetter',
-    48082: 'ALetter',
-    48083: 'ALetter',
-    48084: 'ALetter',
-    48085: 'ALetter',
-    48086: 'ALetter',
-    48087: 'ALetter',
-    48088: 'ALetter',
-    48089: 'ALetter',
-    48090: 'ALetter',
-    48091: 'ALetter',
-    48092: 'ALetter',
-    48093: 'ALetter',
-    48094: 'ALetter',
-    48095: 'ALetter',
-    48096: 'ALetter',
-    48097: 'ALetter',
-    48098: 'ALetter',
-    48099: 'ALetter',
-    48100: 'ALetter',
-    48101: 'ALetter',
-    48102: 'ALetter',
-    48103: 'ALetter',
-    48104: 'ALetter',
-    48105: 'ALetter',
-    48106: 'ALetter',
-    48107: 'ALetter',
-    48108: 'ALetter',
-    48109: 'ALetter',
-    48110: 'ALetter',
-    48111: 'ALetter',
-    48112: 'ALetter',
-    48113: 'ALetter',
-    48114: 'ALetter',
-    48115: 'ALetter',
-    48116: 'ALetter',
-    48117: 'ALetter',
-    48118: 'ALetter',
-    48119: 'ALetter',
-    48120: 'ALetter',
-    48121: 'ALetter',
-    48122: 'ALetter',
-    48123: 'ALetter',
-    48124: 'ALetter',
-    48125: 'ALetter',
-    48126: 'ALetter',
-    48127: 'ALetter',
-    48128: 'ALetter',
-    48129: 'ALetter',
-    48130: 'ALetter',
-    48131: 'ALetter',
-    48132: 'ALetter',
-    48133: 'ALetter',
-    48134: 'ALetter',
-    48135: 'ALetter',
-    48136: 'ALetter',
-    48137: 'ALetter',
-    48138: 'ALetter',
-    48139: 'ALetter',
-    48140: 'ALetter',
-    48141: 'ALetter',
-    48142: 'ALetter',
-    48143: 'ALetter',
-    48144: 'ALetter',
-    48145: 'ALetter',
-    48146: 'ALetter',
-    48147: 'ALetter',
-    48148: 'ALetter',
-    48149: 'ALetter',
-    48150: 'ALetter',
-    48151: 'ALetter',
-    48152: 'ALetter',
-    48153: 'ALetter',
-    48154: 'ALetter',
-    48155: 'ALetter',
-    48156: 'ALetter',
-    48157: 'ALetter',
-    48158: 'ALetter',
-    48159: 'ALetter',
-    48160: 'ALetter',
-    48161: 'ALetter',
-    48162: 'ALetter',
-    48163: 'ALetter',
-    48164: 'ALetter',
-    48165: 'ALetter',
-    48166: 'ALetter',
-    48167: 'ALetter',
-    48168: 'ALetter',
-    48169: 'ALetter',
-    48170: 'ALetter',
-    48171: 'ALetter',
-    48172: 'ALetter',
-    48173: 'ALetter',
-    48174: 'ALetter',
-    48175: 'ALetter',
-    48176: 'ALetter',
-    48177: 'ALetter',
-    48178: 'ALetter',
-    48179: 'ALetter',
-    48180: 'ALetter',
-    48181: 'ALetter',
-    48182: 'ALetter',
-    48183: 'ALetter',
-    48184: 'ALetter',
-    48185: 'ALetter',
-    48186: 'ALetter',
-    48187: 'ALetter',
-    48188: 'ALetter',
-    48189: 'ALetter',
-    48190: 'ALetter',
-    48191: 'ALetter',
-    48192: 'ALetter',
-    48193: 'ALetter',
-    48194: 'ALetter',
-    48195: 'ALetter',
-    48196: 'ALetter',
-    48197: 'ALetter',
-    48198: 'ALetter',
-    48199: 'ALetter',
-    48200: 'ALetter',
-    48201: 'ALetter',
-    48202: 'ALetter',
-    48203: 'ALetter',
-    48204: 'ALetter',
-    48205: 'ALetter',
-    48206: 'ALetter',
-    48207: 'ALetter',
-    48208: 'ALetter',
-    48209: 'ALetter',
-    48210: 'ALetter',
-    48211: 'ALetter',
-    48212: 'ALetter',
-    48213: 'ALetter',
-    48214: 'ALetter',
-    48215: 'ALetter',
-    48216: 'ALetter',
-    48217: 'ALetter',
-    48218: 'ALetter',
-    48219: 'ALetter',
-    48220: 'ALetter',
-    48221: 'ALetter',
-    48222: 'ALetter',
-    48223: 'ALetter',
-    48224: 'ALetter',
-    48225: 'ALetter',
-    48226: 'ALetter',
-    48227: 'ALetter',
-    48228: 'ALetter',
-    48229: 'ALetter',
-    48230: 'ALetter',
-    48231: 'ALetter',
-    48232: 'ALetter',
-    48233: 'ALetter',
-    48234: 'ALetter',
-    48235: 'ALetter',
-    48236: 'ALetter',
-    48237: 'ALetter',
-    48238: 'ALetter',
-    48239: 'ALetter',
-    48240: 'ALetter',
-    48241: 'ALetter',
-    48242: 'ALetter',
-    48243: 'ALetter',
-    48244: 'ALetter',
-    48245: 'ALetter',
-    48246: 'ALetter',
-    48247: 'ALetter',
-    48248: 'ALetter',
-    48249: 'ALetter',
-    48250: 'ALetter',
-    48251: 'ALetter',
-    48252: 'ALetter',
-    48253: 'ALetter',
-    48254: 'ALetter',
-    48255: 'ALetter',
-    48256: 'ALetter',
-    48257: 'ALetter',
-    48258: 'ALetter',
-    48259: 'ALetter',
-    48260: 'ALetter',
-    48261: 'ALetter',
-    48262: 'ALetter',
-    48263: 'ALetter',
-    48264: 'ALetter',
-    48265: 'ALetter',
-    48266: 'ALetter',
-    48267: 'ALetter',
-    48268: 'ALetter',
-    48269: 'ALetter',
-    48270: 'ALetter',
-    48271: 'ALetter',
-    48272: 'ALetter',
-    48273: 'ALetter',
-    48274: 'ALetter',
-    48275: 'ALetter',
-    48276: 'ALetter',
-    48277: 'ALetter',
-    48278: 'ALetter',
-    48279: 'ALetter',
-    48280: 'ALetter',
-    48281: 'ALetter',
-    48282: 'ALetter',
-    48283: 'ALetter',
-    48284: 'ALetter',
-    48285: 'ALetter',
-    48286: 'ALetter',
-    48287: 'ALetter',
-    48288: 'ALetter',
-    48289: 'ALetter',
-    48290: 'ALetter',
-    48291: 'ALetter',
-    48292: 'ALetter',
-    48293: 'ALetter',
-    48294: 'ALetter',
-    48295: 'ALetter',
-    48296: 'ALetter',
-    48297: 'ALetter',
-    48298: 'ALetter',
-    48299: 'ALetter',
-    48300: 'ALetter',
-    48301: 'ALetter',
-    48302: 'ALetter',
-    48303: 'ALetter',
-    48304: 'ALetter',
-    48305: 'ALetter',
-    48306: 'ALetter',
-    48307: 'ALetter',
-    48308: 'ALetter',
-    48309: 'ALetter',
-    48310: 'ALetter',
-    48311: 'ALetter',
-    48312: 'ALetter',
-    48313: 'ALetter',
-    48314: 'ALetter',
-    48315: 'ALetter',
-    48316: 'ALetter',
-    48317: 'ALetter',
-    48318: 'ALetter',
-    48319: 'ALetter',
-    48320: 'ALetter',
-    48321: 'ALetter',
-    48322: 'ALetter',
-    48323: 'ALetter',
-    48324: 'ALetter',
-    48325: 'ALetter',
-    48326: 'ALetter',
-    48327: 'ALetter',
-    48328: 'ALetter',
-    48329: 'ALetter',
-    48330: 'ALetter',
-    48331: 'ALetter',
-    48332: 'ALetter',
-    48333: 'ALetter',
-    48334: 'ALetter',
-    48335: 'ALetter',
-    48336: 'ALetter',
-    48337: 'ALetter',
-    48338: 'ALetter',
-    48339: 'ALetter',
-    48340: 'ALetter',
-    48341: 'ALetter',
-    48342: 'ALetter',
-    48343: 'ALetter',
-    48344: 'ALetter',
-    48345: 'ALetter',
-    48346: 'ALetter',
-    48347: 'ALetter',
-    48348: 'ALetter',
-    48349: 'ALetter',
-    48350: 'ALetter',
-    48351: 'ALetter',
-    48352: 'ALetter',
-    48353: 'ALetter',
-    48354: 'ALetter',
-    48355: 'ALetter',
-    48356: 'ALetter',
-    48357: 'ALetter',
-    48358: 'ALetter',
-    48359: 'ALetter',
-    48360: 'ALetter',
-    48361: 'ALetter',
-    48362: 'ALetter',
-    48363: 'ALetter',
-    48364: 'ALetter',
-    48365: 'ALetter',
-    48366: 'ALetter',
-    48367: 'ALetter',
-    48368: 'ALetter',
-    48369: 'ALetter',
-    48370: 'ALetter',
-    48371: 'ALetter',
-    48372: 'ALetter',
-    48373: 'ALetter',
-    48374: 'ALetter',
-    48375: 'ALetter',
-    48376: 'ALetter',
-    48377: 'ALetter',
-    48378: 'ALetter',
-    48379: 'ALetter',
-    48380: 'ALetter',
-    48381: 'ALetter',
-    48382: 'ALetter',
-    48383: 'ALetter',
-    48384: 'ALetter',
-    48385: 'ALetter',
-    48386: 'ALetter',
-    48387: 'ALetter',
-    48388: 'ALetter',
-    48389: 'ALetter',
-    48390: 'ALetter',
-    48391: 'ALetter',
-    48392: 'ALetter',
-    48393: 'ALetter',
-    48394: 'ALetter',
-    48395: 'ALetter',
-    48396: 'ALetter',
-    48397: 'ALetter',
-    48398: 'ALetter',
-    48399: 'ALetter',
-    48400: 'ALetter',
-    48401: 'ALetter',
-    48402: 'ALetter',
-    48403: 'ALetter',
-    48404: 'ALetter',
-    48405: 'ALetter',
-    48406: 'ALetter',
-    48407: 'ALetter',
-    48408: 'ALetter',
-    48409: 'ALetter',
-    48410: 'ALetter',
-    48411: 'ALetter',
-    48412: 'ALetter',
-    48413: 'ALetter',
-    48414: 'ALetter',
-    48415: 'ALetter',
-    48416: 'ALetter',
-    48417: 'ALetter',
-    48418: 'ALetter',
-    48419: 'ALetter',
-    48420: 'ALetter',
-    48421: 'ALetter',
-    48422: 'ALetter',
-    48423: 'ALetter',
-    48424: 'ALetter',
-    48425: 'ALetter',
-    48426: 'ALetter',
-    48427: 'ALetter',
-    48428: 'ALetter',
-    48429: 'ALetter',
-    48430: 'ALetter',
-    48431: 'ALetter',
-    48432: 'ALetter',
-    48433: 'ALetter',
-    48434: 'ALetter',
-    48435: 'ALetter',
-    48436: 'ALetter',
-    48437: 'ALetter',
-    48438: 'ALetter',
-    48439: 'ALetter',
-    48440: 'ALetter',
-    48441: 'ALetter',
-    48442: 'ALetter',
-    48443: 'ALetter',
-    48444: 'ALetter',
-    48445: 'ALetter',
-    48446: 'ALetter',
-    48447: 'ALetter',
-    48448: 'ALetter',
-    48449: 'ALetter',
-    48450: 'ALetter',
-    48451: 'ALetter',
-    48452: 'ALetter',
-    48453: 'ALetter',
-    48454: 'ALetter',
-    48455: 'ALetter',
-    48456: 'ALetter',
-    48457: 'ALetter',
-    48458: 'ALetter',
-    48459: 'ALetter',
-    48460: 'ALetter',
-    48461: 'ALetter',
-    48462: 'ALetter',
-    48463: 'ALetter',
-    48464: 'ALetter',
-    48465: 'ALetter',
-    48466: 'ALetter',
-    48467: 'ALetter',
-    48468: 'ALetter',
-    48469: 'ALetter',
-    48470: 'ALetter',
-    48471: 'ALetter',
-    48472: 'ALetter',
-    48473: 'ALetter',
-    48474: 'ALetter',
-    48475: 'ALetter',
-    48476: 'ALetter',
-    48477: 'ALetter',
-    48478: 'ALetter',
-    48479: 'ALetter',
-    48480: 'ALetter',
-    48481: 'ALetter',
-    48482: 'ALetter',
-    48483: 'ALetter',
-    48484: 'ALetter',
-    48485: 'ALetter',
-    48486: 'ALetter',
-    48487: 'ALetter',
-    48488: 'ALetter',
-    48489: 'ALetter',
-    48490: 'ALetter',
-    48491: 'ALetter',
-    48492: 'ALetter',
-    48493: 'ALetter',
-    48494: 'ALetter',
-    48495: 'ALetter',
-    48496: 'ALetter',
-    48497: 'ALetter',
-    48498: 'ALetter',
-    48499: 'ALetter',
-    48500: 'ALetter',
-    48501: 'ALetter',
-    48502: 'ALetter',
-    48503: 'ALetter',
-    48504: 'ALetter',
-    48505: 'ALetter',
-    48506: 'ALetter',
-    48507: 'ALetter',
-    48508: 'ALetter',
-    48509: 'ALetter',
-    48510: 'ALetter',
-    48511: 'ALetter',
-    48512: 'ALetter',
-    48513: 'ALetter',
-    48514: 'ALetter',
-    48515: 'ALetter',
-    48516: 'ALetter',
-    48517: 'ALetter',
-    48518: 'ALetter',
-    48519: 'ALetter',
-    48520: 'ALetter',
-    48521: 'ALetter',
-    48522: 'ALetter',
-    48523: 'ALetter',
-    48524: 'ALetter',
-    48525: 'ALetter',
-    48526: 'ALetter',
-    48527: 'ALetter',
-    48528: 'ALetter',
-    48529: 'ALetter',
-    48530: 'ALetter',
-    48531: 'ALetter',
-    48532: 'ALetter',
-    48533: 'ALetter',
-    48534: 'ALetter',
-    48535: 'ALetter',
-    48536: 'ALetter',
-    48537: 'ALetter',
-    48538: 'ALetter',
-    48539: 'ALetter',
-    48540: 'ALetter',
-    48541: 'ALetter',
-    48542: 'ALetter',
-    48543: 'ALetter',
-    48544: 'ALetter',
-    48545: 'ALetter',
-    48546: 'ALetter',
-    48547: 'ALetter',
-    48548: 'ALetter',
-    48549: 'ALetter',
-    48550: 'ALetter',
-    48551: 'ALetter',
-    48552: 'ALetter',
-    48553: 'ALetter',
-    48554: 'ALetter',
-    48555: 'ALetter',
-    48556: 'ALetter',
-    48557: 'ALetter',
-    48558: 'ALetter',
-    48559: 'ALetter',
-    48560: 'ALetter',
-    48561: 'ALetter',
-    48562: 'ALetter',
-    48563: 'ALetter',
-    48564: 'ALetter',
-    48565: 'ALetter',
-    48566: 'ALetter',
-    48567: 'ALetter',
-    48568: 'ALetter',
-    48569: 'ALetter',
-    48570: 'ALetter',
-    48571: 'ALetter',
-    48572: 'ALetter',
-    48573: 'ALetter',
-    48574: 'ALetter',
-    48575: 'ALetter',
-    48576: 'ALetter',
-    48577: 'ALetter',
-    48578: 'ALetter',
-    48579: 'ALetter',
-    48580: 'ALetter',
-    48581: 'ALetter',
-    48582: 'ALetter',
-    48583: 'ALetter',
-    48584: 'ALetter',
-    48585: 'ALetter',
-    48586: 'ALetter',
-    48587: 'ALetter',
-    48588: 'ALetter',
-    48589: 'ALetter',
-    48590: 'ALetter',
-    48591: 'ALetter',
-    48592: 'ALetter',
-    48593: 'ALetter',
-    48594: 'ALetter',
-    48595: 'ALetter',
-    48596: 'ALetter',
-    48597: 'ALetter',
-    48598: 'ALetter',
-    48599: 'ALetter',
-    48600: 'ALetter',
-    48601: 'ALetter',
-    48602: 'ALetter',
-    48603: 'ALetter',
-    48604: 'ALetter',
-    48605: 'ALetter',
-    48606: 'ALetter',
-    48607: 'ALetter',
-    48608: 'ALetter',
-    48609: 'ALetter',
-    48610: 'ALetter',
-    48611: 'ALetter',
-    48612: 'ALetter',
-    48613: 'ALetter',
-    48614: 'ALetter',
-    48615: 'ALetter',
-    48616: 'ALetter',
-    48617: 'ALetter',
-    48618: 'ALetter',
-    48619: 'ALetter',
-    48620: 'ALetter',
-    48621: 'ALetter',
-    48622: 'ALetter',
-    48623: 'ALetter',
-    48624: 'ALetter',
-    48625: 'ALetter',
-    48626: 'ALetter',
-    48627: 'ALetter',
-    48628: 'ALetter',
-    48629: 'ALetter',
-    48630: 'ALetter',
-    48631: 'ALetter',
-    48632: 'ALetter',
-    48633: 'ALetter',
-    48634: 'ALetter',
-    48635: 'ALetter',
-    48636: 'ALetter',
-    48637: 'ALetter',
-    48638: 'ALetter',
-    48639: 'ALetter',
-    48640: 'ALetter',
-    48641: 'ALetter',
-    48642: 'ALetter',
-    48643: 'ALetter',
-    48644: 'ALetter',
-    48645: 'ALetter',
-    48646: 'ALetter',
-    48647: 'ALetter',
-    48648: 'ALetter',
-    48649: 'ALetter',
-    48650: 'ALetter',
-    48651: 'ALetter',
-    48652: 'ALetter',
-    48653: 'ALetter',
-    48654: 'ALetter',
-    48655: 'ALetter',
-    48656: 'ALetter',
-    48657: 'ALetter',
-    48658: 'ALetter',
-    48659: 'ALetter',
-    48660: 'ALetter',
-    48661: 'ALetter',
-    48662: 'ALetter',
-    48663: 'ALetter',
-    48664: 'ALetter',
-    48665: 'ALetter',
-    48666: 'ALetter',
-    48667: 'ALetter',
-    48668: 'ALetter',
-    48669: 'ALetter',
-    48670: 'ALetter',
-    48671: 'ALetter',
-    48672: 'ALetter',
-    48673: 'ALetter',
-    48674: 'ALetter',
-    48675: 'ALetter',
-    48676: 'ALetter',
-    48677: 'ALetter',
-    48678: 'ALetter',
-    48679: 'ALetter',
-    48680: 'ALetter',
-    48681: 'ALetter',
-    48682: 'ALetter',
-    48683: 'ALetter',
-    48684: 'ALetter',
-    48685: 'ALetter',
-    48686: 'ALetter',
-    48687: 'ALetter',
-    48688: 'ALetter',
-    48689: 'ALetter',
-    48690: 'ALetter',
-    48691: 'ALetter',
-    48692: 'ALetter',
-    48693: 'ALetter',
-    48694: 'ALetter',
-    48695: 'ALetter',
-    48696: 'ALetter',
-    48697: 'ALetter',
-    48698: 'ALetter',
-    48699: 'ALetter',
-    48700: 'ALetter',
-    48701: 'ALetter',
-    48702: 'ALetter',
-    48703: 'ALetter',
-    48704: 'ALetter',
-    48705: 'ALetter',
-    48706: 'ALetter',
-    48707: 'ALetter',
-    48708: 'ALetter',
-    48709: 'ALetter',
-    48710: 'ALetter',
-    48711: 'ALetter',
-    48712: 'ALetter',
-    48713: 'ALetter',
-    48714: 'ALetter',
-    48715: 'ALetter',
-    48716: 'ALetter',
-    48717: 'ALetter',
-    48718: 'ALetter',
-    48719: 'ALetter',
-    48720: 'ALetter',
-    48721: 'ALetter',
-    48722: 'ALetter',
-    48723: 'ALetter',
-    48724: 'ALetter',
-    48725: 'ALetter',
-    48726: 'ALetter',
-    48727: 'ALetter',
-    48728: 'ALetter',
-    48729: 'ALetter',
-    48730: 'ALetter',
-    48731: 'ALetter',
-    48732: 'ALetter',
-    48733: 'ALetter',
-    48734: 'ALetter',
-    48735: 'ALetter',
-    48736: 'ALetter',
-    48737: 'ALetter',
-    48738: 'ALetter',
-    48739: 'ALetter',
-    48740: 'ALetter',
-    48741: 'ALetter',
-    48742: 'ALetter',
-    48743: 'ALetter',
-    48744: 'ALetter',
-    48745: 'ALetter',
-    48746: 'ALetter',
-    48747: 'ALetter',
-    48748: 'ALetter',
-    48749: 'ALetter',
-    48750: 'ALetter',
-    48751: 'ALetter',
-    48752: 'ALetter',
-    48753: 'ALetter',
-    48754: 'ALetter',
-    48755: 'ALetter',
-    48756: 'ALetter',
-    48757: 'ALetter',
-    48758: 'ALetter',
-    48759: 'ALetter',
-    48760: 'ALetter',
-    48761: 'ALetter',
-    48762: 'ALetter',
-    48763: 'ALetter',
-    48764: 'ALetter',
-    48765: 'ALetter',
-    48766: 'ALetter',
-    48767: 'ALetter',
-    48768: 'ALetter',
-    48769: 'ALetter',
-    48770: 'ALetter',
-    48771: 'ALetter',
-    48772: 'ALetter',
-    48773: 'ALetter',
-    48774: 'ALetter',
-    48775: 'ALetter',
-    48776: 'ALetter',
-    48777: 'ALetter',
-    48778: 'ALetter',
-    48779: 'ALetter',
-    48780: 'ALetter',
-    48781: 'ALetter',
-    48782: 'ALetter',
-    48783: 'ALetter',
-    48784: 'ALetter',
-    48785: 'ALetter',
-    48786: 'ALetter',
-    48787: 'ALetter',
-    48788: 'ALetter',
-    48789: 'ALetter',
-    48790: 'ALetter',
-    48791: 'ALetter',
-    48792: 'ALetter',
-    48793: 'ALetter',
-    48794: 'ALetter',
-    48795: 'ALetter',
-    48796: 'ALetter',
-    48797: 'ALetter',
-    48798: 'ALetter',
-    48799: 'ALetter',
-    48800: 'ALetter',
-    48801: 'ALetter',
-    48802: 'ALetter',
-    48803: 'ALetter',
-    48804: 'ALetter',
-    48805: 'ALetter',
-    48806: 'ALetter',
-    48807: 'ALetter',
-    48808: 'ALetter',
-    48809: 'ALetter',
-    48810: 'ALetter',
-    48811: 'ALetter',
-    48812: 'ALetter',
-    48813: 'ALetter',
-    48814: 'ALetter',
-    48815: 'ALetter',
-    48816: 'ALetter',
-    48817: 'ALetter',
-    48818: 'ALetter',
-    48819: 'ALetter',
-    48820: 'ALetter',
-    48821: 'ALetter',
-    48822: 'ALetter',
-    48823: 'ALetter',
-    48824: 'ALetter',
-    48825: 'ALetter',
-    48826: 'ALetter',
-    48827: 'ALetter',
-    48828: 'ALetter',
-    48829: 'ALetter',
-    48830: 'ALetter',
-    48831: 'ALetter',
-    48832: 'ALetter',
-    48833: 'ALetter',
-    48834: 'ALetter',
-    48835: 'ALetter',
-    48836: 'ALetter',
-    48837: 'ALetter',
-    48838: 'ALetter',
-    48839: 'ALetter',
-    48840: 'ALetter',
-    48841: 'ALetter',
-    48842: 'ALetter',
-    48843: 'ALetter',
-    48844: 'ALetter',
-    48845: 'ALetter',
-    48846: 'ALetter',
-    48847: 'ALetter',
-    48848: 'ALetter',
-    48849: 'ALetter',
-    48850: 'ALetter',
-    48851: 'ALetter',
-    48852: 'ALetter',
-    48853: 'ALetter',
-    48854: 'ALetter',
-    48855: 'ALetter',
-    48856: 'ALetter',
-    48857: 'ALetter',
-    48858: 'ALetter',
-    48859: 'ALetter',
-    48860: 'ALetter',
-    48861: 'ALetter',
-    48862: 'ALetter',
-    48863: 'ALetter',
-    48864: 'ALetter',
-    48865: 'ALetter',
-    48866: 'ALetter',
-    48867: 'ALetter',
-    48868: 'ALetter',
-    48869: 'ALetter',
-    48870: 'ALetter',
-    48871: 'ALetter',
-    48872: 'ALetter',
-    48873: 'ALetter',
-    48874: 'ALetter',
-    48875: 'ALetter',
-    48876: 'ALetter',
-    48877: 'ALetter',
-    48878: 'ALetter',
-    48879: 'ALetter',
-    48880: 'ALetter',
-    48881: 'ALetter',
-    48882: 'ALetter',
-    48883: 'ALetter',
-    48884: 'ALetter',
-    48885: 'ALetter',
-    48886: 'ALetter',
-    48887: 'ALetter',
-    48888: 'ALetter',
-    48889: 'ALetter',
-    48890: 'ALetter',
-    48891: 'ALetter',
-    48892: 'ALetter',
-    48893: 'ALetter',
-    48894: 'ALetter',
-    48895: 'ALetter',
-    48896: 'ALetter',
-    48897: 'ALetter',
-    48898: 'ALetter',
-    48899: 'ALetter',
-    48900: 'ALetter',
-    48901: 'ALetter',
-    48902: 'ALetter',
-    48903: 'ALetter',
-    48904: 'ALetter',
-    48905: 'ALetter',
-    48906: 'ALetter',
-    48907: 'ALetter',
-    48908: 'ALetter',
-    48909: 'ALetter',
-    48910: 'ALetter',
-    48911: 'ALetter',
-    48912: 'ALetter',
-    48913: 'ALetter',
-    48914: 'ALetter',
-    48915: 'ALetter',
-    48916: 'ALetter',
-    48917: 'ALetter',
-    48918: 'ALetter',
-    48919: 'ALetter',
-    48920: 'ALetter',
-    48921: 'ALetter',
-    48922: 'ALetter',
-    48923: 'ALetter',
-    48924: 'ALetter',
-    48925: 'ALetter',
-    48926: 'ALetter',
-    48927: 'ALetter',
-    48928: 'ALetter',
-    48929: 'ALetter',
-    48930: 'ALetter',
-    48931: 'ALetter',
-    48932: 'ALetter',
-    48933: 'ALetter',
-    48934: 'ALetter',
-    48935: 'ALetter',
-    48936: 'ALetter',
-    48937: 'ALetter',
-    48938: 'ALetter',
-    48939: 'ALetter',
-    48940: 'ALetter',
-    48941: 'ALetter',
-    48942: 'ALetter',
-    48943: 'ALetter',
-    48944: 'ALetter',
-    48945: 'ALetter',
-    48946: 'ALetter',
-    48947: 'ALetter',
-    48948: 'ALetter',
-    48949: 'ALetter',
-    48950: 'ALetter',
-    48951: 'ALetter',
-    48952: 'ALetter',
-    48953: 'ALetter',
-    48954: 'ALetter',
-    48955: 'ALetter',
-    48956: 'ALetter',
-    48957: 'ALetter',
-    48958: 'ALetter',
-    48959: 'ALetter',
-    48960: 'ALetter',
-    48961: 'ALetter',
-    48962: 'ALetter',
-    48963: 'ALetter',
-    48964: 'ALetter',
-    48965: 'ALetter',
-    48966: 'ALetter',
-    48967: 'ALetter',
-    48968: 'ALetter',
-    48969: 'ALetter',
-    48970: 'ALetter',
-    48971: 'ALetter',
-    48972: 'ALetter',
-    48973: 'ALetter',
-    48974: 'ALetter',
-    48975: 'ALetter',
-    48976: 'ALetter',
-    48977: 'ALetter',
-    48978: 'ALetter',
-    48979: 'ALetter',
-    48980: 'ALetter',
-    48981: 'ALetter',
-    48982: 'ALetter',
-    48983: 'ALetter',
-    48984: 'ALetter',
-    48985: 'ALetter',
-    48986: 'ALetter',
-    48987: 'ALetter',
-    48988: 'ALetter',
-    48989: 'ALetter',
-    48990: 'ALetter',
-    48991: 'ALetter',
-    48992: 'ALetter',
-    48993: 'ALetter',
-    48994: 'ALetter',
-    48995: 'ALetter',
-    48996: 'ALetter',
-    48997: 'ALetter',
-    48998: 'ALetter',
-    48999: 'ALetter',
-    49000: 'ALetter',
-    49001: 'ALetter',
-    49002: 'ALetter',
-    49003: 'ALetter',
-    49004: 'ALetter',
-    49005: 'ALetter',
-    49006: 'ALetter',
-    49007: 'ALetter',
-    49008: 'ALetter',
-    49009: 'ALetter',
-    49010: 'ALetter',
-    49011: 'ALetter',
-    49012: 'ALetter',
-    49013: 'ALetter',
-    49014: 'ALetter',
-    49015: 'ALetter',
-    49016: 'ALetter',
-    49017: 'ALetter',
-    49018: 'ALetter',
-    49019: 'ALetter',
-    49020: 'ALetter',
-    49021: 'ALetter',
-    49022: 'ALetter',
-    49023: 'ALetter',
-    49024: 'ALetter',
-    49025: 'ALetter',
-    49026: 'ALetter',
-    49027: 'ALetter',
-    49028: 'ALetter',
-    49029: 'ALetter',
-    49030: 'ALetter',
-    49031: 'ALetter',
-    49032: 'ALetter',
-    49033: 'ALetter',
-    49034: 'ALetter',
-    49035: 'ALetter',
-    49036: 'ALetter',
-    49037: 'ALetter',
-    49038: 'ALetter',
-    49039: 'ALetter',
-    49040: 'ALetter',
-    49041: 'ALetter',
-    49042: 'ALetter',
-    49043: 'ALetter',
-    49044: 'ALetter',
-    49045: 'ALetter',
-    49046: 'ALetter',
-    49047: 'ALetter',
-    49048: 'ALetter',
-    49049: 'ALetter',
-    49050: 'ALetter',
-    49051: 'ALetter',
-    49052: 'ALetter',
-    49053: 'ALetter',
-    49054: 'ALetter',
-    49055: 'ALetter',
-    49056: 'ALetter',
-    49057: 'ALetter',
-    49058: 'ALetter',
-    49059: 'ALetter',
-    49060: 'ALetter',
-    49061: 'ALetter',
-    49062: 'ALetter',
-    49063: 'ALetter',
-    49064: 'ALetter',
-    49065: 'ALetter',
-    49066: 'ALetter',
-    49067: 'ALetter',
-    49068: 'ALetter',
-    49069: 'ALetter',
-    49070: 'ALetter',
-    49071: 'ALetter',
-    49072: 'ALetter',
-    49073: 'ALetter',
-    49074: 'ALetter',
-    49075: 'ALetter',
-    49076: 'ALetter',
-    49077: 'ALetter',
-    49078: 'ALetter',
-    49079: 'ALetter',
-    49080: 'ALetter',
-    49081: 'ALetter',
-    49082: 'ALetter',
-    49083: 'ALetter',
-    49084: 'ALetter',
-    49085: 'ALetter',
-    49086: 'ALetter',
-    49087: 'ALetter',
-    49088: 'ALetter',
-    49089: 'ALetter',
-    49090: 'ALetter',
-    49091: 'ALetter',
-    49092: 'ALetter',
-    49093: 'ALetter',
-    49094: 'ALetter',
-    49095: 'ALetter',
-    49096: 'ALetter',
-    49097: 'ALetter',
-    49098: 'ALetter',
-    49099: 'ALetter',
-    49100: 'ALetter',
-    49101: 'ALetter',
-    49102: 'ALetter',
-    49103: 'ALetter',
-    49104: 'ALetter',
-    49105: 'ALetter',
-    49106: 'ALetter',
-    49107: 'ALetter',
-    49108: 'ALetter',
-    49109: 'ALetter',
-    49110: 'ALetter',
-    49111: 'ALetter',
-    49112: 'ALetter',
-    49113: 'ALetter',
-    49114: 'ALetter',
-    49115: 'ALetter',
-    49116: 'ALetter',
-    49117: 'ALetter',
-    49118: 'ALetter',
-    49119: 'ALetter',
-    49120: 'ALetter',
-    49121: 'ALetter',
-    49122: 'ALetter',
-    49123: 'ALetter',
-    49124: 'ALetter',
-    49125: 'ALetter',
-    49126: 'ALetter',
-    49127: 'ALetter',
-    49128: 'ALetter',
-    49129: 'ALetter',
-    49130: 'ALetter',
-    49131: 'ALetter',
-    49132: 'ALetter',
-    49133: 'ALetter',
-    49134: 'ALetter',
-    49135: 'ALetter',
-    49136: 'ALetter',
-    49137: 'ALetter',
-    49138: 'ALetter',
-    49139: 'ALetter',
-    49140: 'ALetter',
-    49141: 'ALetter',
-    49142: 'ALetter',
-    49143: 'ALetter',
-    49144: 'ALetter',
-    49145: 'ALetter',
-    49146: 'ALetter',
-    49147: 'ALetter',
-    49148: 'ALetter',
-    49149: 'ALetter',
-    49150: 'ALetter',
-    49151: 'ALetter',
-    49152: 'ALetter',
-    49153: 'ALetter',
-    49154: 'ALetter',
-    49155: 'ALetter',
-    49156: 'ALetter',
-    49157: 'ALetter',
-    49158: 'ALetter',
-    49159: 'ALetter',
-    49160: 'ALetter',
-    49161: 'ALetter',
-    49162: 'ALetter',
-    49163: 'ALetter',
-    49164: 'ALetter',
-    49165: 'ALetter',
-    49166: 'ALetter',
-    49167: 'ALetter',
-    49168: 'ALetter',
-    49169: 'ALetter',
-    49170: 'ALetter',
-    49171: 'ALetter',
-    49172: 'ALetter',
-    49173: 'ALetter',
-    49174: 'ALetter',
-    49175: 'ALetter',
-    49176: 'ALetter',
-    49177: 'ALetter',
-    49178: 'ALetter',
-    49179: 'ALetter',
-    49180: 'ALetter',
-    49181: 'ALetter',
-    49182: 'ALetter',
-    49183: 'ALetter',
-    49184: 'ALetter',
-    49185: 'ALetter',
-    49186: 'ALetter',
-    49187: 'ALetter',
-    49188: 'ALetter',
-    49189: 'ALetter',
-    49190: 'ALetter',
-    49191: 'ALetter',
-    49192: 'ALetter',
-    49193: 'ALetter',
-    49194: 'ALetter',
-    49195: 'ALetter',
-    49196: 'ALetter',
-    49197: 'ALetter',
-    49198: 'ALetter',
-    49199: 'ALetter',
-    49200: 'ALetter',
-    49201: 'ALetter',
-    49202: 'ALetter',
-    49203: 'ALetter',
-    49204: 'ALetter',
-    49205: 'ALetter',
-    49206: 'ALetter',
-    49207: 'ALetter',
-    49208: 'ALetter',
-    49209: 'ALetter',
-    49210: 'ALetter',
-    49211: 'ALetter',
-    49212: 'ALetter',
-    49213: 'ALetter',
-    49214: 'ALetter',
-    49215: 'ALetter',
-    49216: 'ALetter',
-    49217: 'ALetter',
-    49218: 'ALetter',
-    49219: 'ALetter',
-    49220: 'ALetter',
-    49221: 'ALetter',
-    49222: 'ALetter',
-    49223: 'ALetter',
-    49224: 'ALetter',
-    49225: 'ALetter',
-    49226: 'ALetter',
-    49227: 'ALetter',
-    49228: 'ALetter',
-    49229: 'ALetter',
-    49230: 'ALetter',
-    49231: 'ALetter',
-    49232: 'ALetter',
-    49233: 'ALetter',
-    49234: 'ALetter',
-    49235: 'ALetter',
-    49236: 'ALetter',
-    49237: 'ALetter',
-    49238: 'ALetter',
-    49239: 'ALetter',
-    49240: 'ALetter',
-    49241: 'ALetter',
-    49242: 'ALetter',
-    49243: 'ALetter',
-    49244: 'ALetter',
-    49245: 'ALetter',
-    49246: 'ALetter',
-    49247: 'ALetter',
-    49248: 'ALetter',
-    49249: 'ALetter',
-    49250: 'ALetter',
-    49251: 'ALetter',
-    49252: 'ALetter',
-    49253: 'ALetter',
-    49254: 'ALetter',
-    49255: 'ALetter',
-    49256: 'ALetter',
-    49257: 'ALetter',
-    49258: 'ALetter',
-    49259: 'ALetter',
-    49260: 'ALetter',
-    49261: 'ALetter',
-    49262: 'ALetter',
-    49263: 'ALetter',
-    49264: 'ALetter',
-    49265: 'ALetter',
-    49266: 'ALetter',
-    49267: 'ALetter',
-    49268: 'ALetter',
-    49269: 'ALetter',
-    49270: 'ALetter',
-    49271: 'ALetter',
-    49272: 'ALetter',
-    49273: 'ALetter',
-    49274: 'ALetter',
-    49275: 'ALetter',
-    49276: 'ALetter',
-    49277: 'ALetter',
-    49278: 'ALetter',
-    49279: 'ALetter',
-    49280: 'ALetter',
-    49281: 'ALetter',
-    49282: 'ALetter',
-    49283: 'ALetter',
-    49284: 'ALetter',
-    49285: 'ALetter',
-    49286: 'ALetter',
-    49287: 'ALetter',
-    49288: 'ALetter',
-    49289: 'ALetter',
-    49290: 'ALetter',
-    49291: 'ALetter',
-    49292: 'ALetter',
-    49293: 'ALetter',
-    49294: 'ALetter',
-    49295: 'ALetter',
-    49296: 'ALetter',
-    49297: 'ALetter',
-    49298: 'ALetter',
-    49299: 'ALetter',
-    49300: 'ALetter',
-    49301: 'ALetter',
-    49302: 'ALetter',
-    49303: 'ALetter',
-    49304: 'ALetter',
-    49305: 'ALetter',
-    49306: 'ALetter',
-    49307: 'ALetter',
-    49308: 'ALetter',
-    49309: 'ALetter',
-    49310: 'ALetter',
-    49311: 'ALetter',
-    49312: 'ALetter',
-    49313: 'ALetter',
-    49314: 'ALetter',
-    49315: 'ALetter',
-    49316: 'ALetter',
-    49317: 'ALetter',
-    49318: 'ALetter',
-    49319: 'ALetter',
-    49320: 'ALetter',
-    49321: 'ALetter',
-    49322: 'ALetter',
-    49323: 'ALetter',
-    49324: 'ALetter',
-    49325: 'ALetter',
-    49326: 'ALetter',
-    49327: 'ALetter',
-    49328: 'ALetter',
-    49329: 'ALetter',
-    49330: 'ALetter',
-    49331: 'ALetter',
-    49332: 'ALetter',
-    49333: 'ALetter',
-    49334: 'ALetter',
-    49335: 'ALetter',
-    49336: 'ALetter',
-    49337: 'ALetter',
-    49338: 'ALetter',
-    49339: 'ALetter',
-    49340: 'ALetter',
-    49341: 'ALetter',
-    49342: 'ALetter',
-    49343: 'ALetter',
-    49344: 'ALetter',
-    49345: 'ALetter',
-    49346: 'ALetter',
-    49347: 'ALetter',
-    49348: 'ALetter',
-    49349: 'ALetter',
-    49350: 'ALetter',
-    49351: 'ALetter',
-    49352: 'ALetter',
-    49353: 'ALetter',
-    49354: 'ALetter',
-    49355: 'ALetter',
-    49356: 'ALetter',
-    49357: 'ALetter',
-    49358: 'ALetter',
-    49359: 'ALetter',
-    49360: 'ALetter',
-    49361: 'ALetter',
-    49362: 'ALetter',
-    49363: 'ALetter',
-    49364: 'ALetter',
-    49365: 'ALetter',
-    49366: 'ALetter',
-    49367: 'ALetter',
-    49368: 'ALetter',
-    49369: 'ALetter',
-    49370: 'ALetter',
-    49371: 'ALetter',
-    49372: 'ALetter',
-    49373: 'ALetter',
-    49374: 'ALetter',
-    49375: 'ALetter',
-    49376: 'ALetter',
-    49377: 'ALetter',
-    49378: 'ALetter',
-    49379: 'ALetter',
-    49380: 'ALetter',
-    49381: 'ALetter',
-    49382: 'ALetter',
-    49383: 'ALetter',
-    49384: 'ALetter',
-    49385: 'ALetter',
-    49386: 'ALetter',
-    49387: 'ALetter',
-    49388: 'ALetter',
-    49389: 'ALetter',
-    49390: 'ALetter',
-    49391: 'ALetter',
-    49392: 'ALetter',
-    49393: 'ALetter',
-    49394: 'ALetter',
-    49395: 'ALetter',
-    49396: 'ALetter',
-    49397: 'ALetter',
-    49398: 'ALetter',
-    49399: 'ALetter',
-    49400: 'ALetter',
-    49401: 'ALetter',
-    49402: 'ALetter',
-    49403: 'ALetter',
-    49404: 'ALetter',
-    49405: 'ALetter',
-    49406: 'ALetter',
-    49407: 'ALetter',
-    49408: 'ALetter',
-    49409: 'ALetter',
-    49410: 'ALetter',
-    49411: 'ALetter',
-    49412: 'ALetter',
-    49413: 'ALetter',
-    49414: 'ALetter',
-    49415: 'ALetter',
-    49416: 'ALetter',
-    49417: 'ALetter',
-    49418: 'ALetter',
-    49419: 'ALetter',
-    49420: 'ALetter',
-    49421: 'ALetter',
-    49422: 'ALetter',
-    49423: 'ALetter',
-    49424: 'ALetter',
-    49425: 'ALetter',
-    49426: 'ALetter',
-    49427: 'ALetter',
-    49428: 'ALetter',
-    49429: 'ALetter',
-    49430: 'ALetter',
-    49431: 'ALetter',
-    49432: 'ALetter',
-    49433: 'ALetter',
-    49434: 'ALetter',
-    49435: 'ALetter',
-    49436: 'ALetter',
-    49437: 'ALetter',
-    49438: 'ALetter',
-    49439: 'ALetter',
-    49440: 'ALetter',
-    49441: 'ALetter',
-    49442: 'ALetter',
-    49443: 'ALetter',
-    49444: 'ALetter',
-    49445: 'ALetter',
-    49446: 'ALetter',
-    49447: 'ALetter',
-    49448: 'ALetter',
-    49449: 'ALetter',
-    49450: 'ALetter',
-    49451: 'ALetter',
-    49452: 'ALetter',
-    49453: 'ALetter',
-    49454: 'ALetter',
-    49455: 'ALetter',
-    49456: 'ALetter',
-    49457: 'ALetter',
-    49458: 'ALetter',
-    49459: 'ALetter',
-    49460: 'ALetter',
-    49461: 'ALetter',
-    49462: 'ALetter',
-    49463: 'ALetter',
-    49464: 'ALetter',
-    49465: 'ALetter',
-    49466: 'ALetter',
-    49467: 'ALetter',
-    49468: 'ALetter',
-    49469: 'ALetter',
-    49470: 'ALetter',
-    49471: 'ALetter',
-    49472: 'ALetter',
-    49473: 'ALetter',
-    49474: 'ALetter',
-    49475: 'ALetter',
-    49476: 'ALetter',
-    49477: 'ALetter',
-    49478: 'ALetter',
-    49479: 'ALetter',
-    49480: 'ALetter',
-    49481: 'ALetter',
-    49482: 'ALetter',
-    49483: 'ALetter',
-    49484: 'ALetter',
-    49485: 'ALetter',
-    49486: 'ALetter',
-    49487: 'ALetter',
-    49488: 'ALetter',
-    49489: 'ALetter',
-    49490: 'ALetter',
-    49491: 'ALetter',
-    49492: 'ALetter',
-    49493: 'ALetter',
-    49494: 'ALetter',
-    49495: 'ALetter',
-    49496: 'ALetter',
-    49497: 'ALetter',
-    49498: 'ALetter',
-    49499: 'ALetter',
-    49500: 'ALetter',
-    49501: 'ALetter',
-    49502: 'ALetter',
-    49503: 'ALetter',
-    49504: 'ALetter',
-    49505: 'ALetter',
-    49506: 'ALetter',
-    49507: 'ALetter',
-    49508: 'ALetter',
-    49509: 'ALetter',
-    49510: 'ALetter',
-    49511: 'ALetter',
-    49512: 'ALetter',
-    49513: 'ALetter',
-    49514: 'ALetter',
-    49515: 'ALetter',
-    49516: 'ALetter',
-    49517: 'ALetter',
-    49518: 'ALetter',
-    49519: 'ALetter',
-    49520: 'ALetter',
-    49521: 'ALetter',
-    49522: 'ALetter',
-    49523: 'ALetter',
-    49524: 'ALetter',
-    49525: 'ALetter',
-    49526: 'ALetter',
-    49527: 'ALetter',
-    49528: 'ALetter',
-    49529: 'ALetter',
-    49530: 'ALetter',
-    49531: 'ALetter',
-    49532: 'ALetter',
-    49533: 'ALetter',
-    49534: 'ALetter',
-    49535: 'ALetter',
-    49536: 'ALetter',
-    49537: 'ALetter',
-    49538: 'ALetter',
-    49539: 'ALetter',
-    49540: 'ALetter',
-    49541: 'ALetter',
-    49542: 'ALetter',
-    49543: 'ALetter',
-    49544: 'ALetter',
-    49545: 'ALetter',
-    49546: 'ALetter',
-    49547: 'ALetter',
-    49548: 'ALetter',
-    49549: 'ALetter',
-    49550: 'ALetter',
-    49551: 'ALetter',
-    49552: 'ALetter',
-    49553: 'ALetter',
-    49554: 'ALetter',
-    49555: 'ALetter',
-    49556: 'ALetter',
-    49557: 'ALetter',
-    49558: 'ALetter',
-    49559: 'ALetter',
-    49560: 'ALetter',
-    49561: 'ALetter',
-    49562: 'ALetter',
-    49563: 'ALetter',
-    49564: 'ALetter',
-    49565: 'ALetter',
-    49566: 'ALetter',
-    49567: 'ALetter',
-    49568: 'ALetter',
-    49569: 'ALetter',
-    49570: 'ALetter',
-    49571: 'ALetter',
-    49572: 'ALetter',
-    49573: 'ALetter',
-    49574: 'ALetter',
-    49575: 'ALetter',
-    49576: 'ALetter',
-    49577: 'ALetter',
-    49578: 'ALetter',
-    49579: 'ALetter',
-    49580: 'ALetter',
-    49581: 'ALetter',
-    49582: 'ALetter',
-    49583: 'ALetter',
-    49584: 'ALetter',
-    49585: 'ALetter',
-    49586: 'ALetter',
-    49587: 'ALetter',
-    49588: 'ALetter',
-    49589: 'ALetter',
-    49590: 'ALetter',
-    49591: 'ALetter',
-    49592: 'ALetter',
-    49593: 'ALetter',
-    49594: 'ALetter',
-    49595: 'ALetter',
-    49596: 'ALetter',
-    49597: 'ALetter',
-    49598: 'ALetter',
-    49599: 'ALetter',
-    49600: 'ALetter',
-    49601: 'ALetter',
-    49602: 'ALetter',
-    49603: 'ALetter',
-    49604: 'ALetter',
-    49605: 'ALetter',
-    49606: 'ALetter',
-    49607: 'ALetter',
-    49608: 'ALetter',
-    49609: 'ALetter',
-    49610: 'ALetter',
-    49611: 'ALetter',
-    49612: 'ALetter',
-    49613: 'ALetter',
-    49614: 'ALetter',
-    49615: 'ALetter',
-    49616: 'ALetter',
-    49617: 'ALetter',
-    49618: 'ALetter',
-    49619: 'ALetter',
-    49620: 'ALetter',
-    49621: 'ALetter',
-    49622: 'ALetter',
-    49623: 'ALetter',
-    49624: 'ALetter',
-    49625: 'ALetter',
-    49626: 'ALetter',
-    49627: 'ALetter',
-    49628: 'ALetter',
-    49629: 'ALetter',
-    49630: 'ALetter',
-    49631: 'ALetter',
-    49632: 'ALetter',
-    49633: 'ALetter',
-    49634: 'ALetter',
-    49635: 'ALetter',
-    49636: 'ALetter',
-    49637: 'ALetter',
-    49638: 'ALetter',
-    49639: 'ALetter',
-    49640: 'ALetter',
-    49641: 'ALetter',
-    49642: 'ALetter',
-    49643: 'ALetter',
-    49644: 'ALetter',
-    49645: 'ALetter',
-    49646: 'ALetter',
-    49647: 'ALetter',
-    49648: 'ALetter',
-    49649: 'ALetter',
-    49650: 'ALetter',
-    49651: 'ALetter',
-    49652: 'ALetter',
-    49653: 'ALetter',
-    49654: 'ALetter',
-    49655: 'ALetter',
-    49656: 'ALetter',
-    49657: 'ALetter',
-    49658: 'ALetter',
-    49659: 'ALetter',
-    49660: 'ALetter',
-    49661: 'ALetter',
-    49662: 'ALetter',
-    49663: 'ALetter',
-    49664: 'ALetter',
-    49665: 'ALetter',
-    49666: 'ALetter',
-    49667: 'ALetter',
-    49668: 'ALetter',
-    49669: 'ALetter',
-    49670: 'ALetter',
-    49671: 'ALetter',
-    49672: 'ALetter',
-    49673: 'ALetter',
-    49674: 'ALetter',
-    49675: 'ALetter',
-    49676: 'ALetter',
-    49677: 'ALetter',
-    49678: 'ALetter',
-    49679: 'ALetter',
-    49680: 'ALetter',
-    49681: 'ALetter',
-    49682: 'ALetter',
-    49683: 'ALetter',
-    49684: 'ALetter',
-    49685: 'ALetter',
-    49686: 'ALetter',
-    49687: 'ALetter',
-    49688: 'ALetter',
-    49689: 'ALetter',
-    49690: 'ALetter',
-    49691: 'ALetter',
-    49692: 'ALetter',
-    49693: 'ALetter',
-    49694: 'ALetter',
-    49695: 'ALetter',
-    49696: 'ALetter',
-    49697: 'ALetter',
-    49698: 'ALetter',
-    49699: 'ALetter',
-    49700: 'ALetter',
-    49701: 'ALetter',
-    49702: 'ALetter',
-    49703: 'ALetter',
-    49704: 'ALetter',
-    49705: 'ALetter',
-    49706: 'ALetter',
-    49707: 'ALetter',
-    49708: 'ALetter',
-    49709: 'ALetter',
-    49710: 'ALetter',
-    49711: 'ALetter',
-    49712: 'ALetter',
-    49713: 'ALetter',
-    49714: 'ALetter',
-    49715: 'ALetter',
-    49716: 'ALetter',
-    49717: 'ALetter',
-    49718: 'ALetter',
-    49719: 'ALetter',
-    49720: 'ALetter',
-    49721: 'ALetter',
-    49722: 'ALetter',
-    49723: 'ALetter',
-    49724: 'ALetter',
-    49725: 'ALetter',
-    49726: 'ALetter',
-    49727: 'ALetter',
-    49728: 'ALetter',
-    49729: 'ALetter',
-    49730: 'ALetter',
-    49731: 'ALetter',
-    49732: 'ALetter',
-    49733: 'ALetter',
-    49734: 'ALetter',
-    49735: 'ALetter',
-    49736: 'ALetter',
-    49737: 'ALetter',
-    49738: 'ALetter',
-    49739: 'ALetter',
-    49740: 'ALetter',
-    49741: 'ALetter',
-    49742: 'ALetter',
-    49743: 'ALetter',
-    49744: 'ALetter',
-    49745: 'ALetter',
-    49746: 'ALetter',
-    49747: 'ALetter',
-    49748: 'ALetter',
-    49749: 'ALetter',
-    49750: 'ALetter',
-    49751: 'ALetter',
-    49752: 'ALetter',
-    49753: 'ALetter',
-    49754: 'ALetter',
-    49755: 'ALetter',
-    49756: 'ALetter',
-    49757: 'ALetter',
-    49758: 'ALetter',
-    49759: 'ALetter',
-    49760: 'ALetter',
-    49761: 'ALetter',
-    49762: 'ALetter',
-    49763: 'ALetter',
-    49764: 'ALetter',
-    49765: 'ALetter',
-    49766: 'ALetter',
-    49767: 'ALetter',
-    49768: 'ALetter',
-    49769: 'ALetter',
-    49770: 'ALetter',
-    49771: 'ALetter',
-    49772: 'ALetter',
-    49773: 'ALetter',
-    49774: 'ALetter',
-    49775: 'ALetter',
-    49776: 'ALetter',
-    49777: 'ALetter',
-    49778: 'ALetter',
-    49779: 'ALetter',
-    49780: 'ALetter',
-    49781: 'ALetter',
-    49782: 'ALetter',
-    49783: 'ALetter',
-    49784: 'ALetter',
-    49785: 'ALetter',
-    49786: 'ALetter',
-    49787: 'ALetter',
-    49788: 'ALetter',
-    49789: 'ALetter',
-    49790: 'ALetter',
-    49791: 'ALetter',
-    49792: 'ALetter',
-    49793: 'ALetter',
-    49794: 'ALetter',
-    49795: 'ALetter',
-    49796: 'ALetter',
-    49797: 'ALetter',
-    49798: 'ALetter',
-    49799: 'ALetter',
-    49800: 'ALetter',
-    49801: 'ALetter',
-    49802: 'ALetter',
-    49803: 'ALetter',
-    49804: 'ALetter',
-    49805: 'ALetter',
-    49806: 'ALetter',
-    49807: 'ALetter',
-    49808: 'ALetter',
-    49809: 'ALetter',
-    49810: 'ALetter',
-    49811: 'ALetter',
-    49812: 'ALetter',
-    49813: 'ALetter',
-    49814: 'ALetter',
-    49815: 'ALetter',
-    49816: 'ALetter',
-    49817: 'ALetter',
-    49818: 'ALetter',
-    49819: 'ALetter',
-    49820: 'ALetter',
-    49821: 'ALetter',
-    49822: 'ALetter',
-    49823: 'ALetter',
-    49824: 'ALetter',
-    49825: 'ALetter',
-    49826: 'ALetter',
-    49827: 'ALetter',
-    49828: 'ALetter',
-    49829: 'ALetter',
-    49830: 'ALetter',
-    49831: 'ALetter',
-    49832: 'ALetter',
-    49833: 'ALetter',
-    49834: 'ALetter',
-    49835: 'ALetter',
-    49836: 'ALetter',
-    49837: 'ALetter',
-    49838: 'ALetter',
-    49839: 'ALetter',
-    49840: 'ALetter',
-    49841: 'ALetter',
-    49842: 'ALetter',
-    49843: 'ALetter',
-    49844: 'ALetter',
-    49845: 'ALetter',
-    49846: 'ALetter',
-    49847: 'ALetter',
-    49848: 'ALetter',
-    49849: 'ALetter',
-    49850: 'ALetter',
-    49851: 'ALetter',
-    49852: 'ALetter',
-    49853: 'ALetter',
-    49854: 'ALetter',
-    49855: 'ALetter',
-    49856: 'ALetter',
-    49857: 'ALetter',
-    49858: 'ALetter',
-    49859: 'ALetter',
-    49860: 'ALetter',
-    49861: 'ALetter',
-    49862: 'ALetter',
-    49863: 'ALetter',
-    49864: 'ALetter',
-    49865: 'ALetter',
-    49866: 'ALetter',
-    49867: 'ALetter',
-    49868: 'ALetter',
-    49869: 'ALetter',
-    49870: 'ALetter',
-    49871: 'ALetter',
-    49872: 'ALetter',
-    49873: 'ALetter',
-    49874: 'ALetter',
-    49875: 'ALetter',
-    49876: 'ALetter',
-    49877: 'ALetter',
-    49878: 'ALetter',
-    49879: 'ALetter',
-    49880: 'ALetter',
-    49881: 'ALetter',
-    49882: 'ALetter',
-    49883: 'ALetter',
-    49884: 'ALetter',
-    49885: 'ALetter',
-    49886: 'ALetter',
-    49887: 'ALetter',
-    49888: 'ALetter',
-    49889: 'ALetter',
-    49890: 'ALetter',
-    49891: 'ALetter',
-    49892: 'ALetter',
-    49893: 'ALetter',
-    49894: 'ALetter',
-    49895: 'ALetter',
-    49896: 'ALetter',
-    49897: 'ALetter',
-    49898: 'ALetter',
-    49899: 'ALetter',
-    49900: 'ALetter',
-    49901: 'ALetter',
-    49902: 'ALetter',
-    49903: 'ALetter',
-    49904: 'ALetter',
-    49905: 'ALetter',
-    49906: 'ALetter',
-    49907: 'ALetter',
-    49908: 'ALetter',
-    49909: 'ALetter',
-    49910: 'ALetter',
-    49911: 'ALetter',
-    49912: 'ALetter',
-    49913: 'ALetter',
-    49914: 'ALetter',
-    49915: 'ALetter',
-    49916: 'ALetter',
-    49917: 'ALetter',
-    49918: 'ALetter',
-    49919: 'ALetter',
-    49920: 'ALetter',
-    49921: 'ALetter',
-    49922: 'ALetter',
-    49923: 'ALetter',
-    49924: 'ALetter',
-    49925: 'ALetter',
-    49926: 'ALetter',
-    49927: 'ALetter',
-    49928: 'ALetter',
-    49929: 'ALetter',
-    49930: 'ALetter',
-    49931: 'ALetter',
-    49932: 'ALetter',
-    49933: 'ALetter',
-    49934: 'ALetter',
-    49935: 'ALetter',
-    49936: 'ALetter',
-    49937: 'ALetter',
-    49938: 'ALetter',
-    49939: 'ALetter',
-    49940: 'ALetter',
-    49941: 'ALetter',
-    49942: 'ALetter',
-    49943: 'ALetter',
-    49944: 'ALetter',
-    49945: 'ALetter',
-    49946: 'ALetter',
-    49947: 'ALetter',
-    49948: 'ALetter',
-    49949: 'ALetter',
-    49950: 'ALetter',
-    49951: 'ALetter',
-    49952: 'ALetter',
-    49953: 'ALetter',
-    49954: 'ALetter',
-    49955: 'ALetter',
-    49956: 'ALetter',
-    49957: 'ALetter',
-    49958: 'ALetter',
-    49959: 'ALetter',
-    49960: 'ALetter',
-    49961: 'ALetter',
-    49962: 'ALetter',
-    49963: 'ALetter',
-    49964: 'ALetter',
-    49965: 'ALetter',
-    49966: 'ALetter',
-    49967: 'ALetter',
-    49968: 'ALetter',
-    49969: 'ALetter',
-    49970: 'ALetter',
-    49971: 'ALetter',
-    49972: 'ALetter',
-    49973: 'ALetter',
-    49974: 'ALetter',
-    49975: 'ALetter',
-    49976: 'ALetter',
-    49977: 'ALetter',
-    49978: 'ALetter',
-    49979: 'ALetter',
-    49980: 'ALetter',
-    49981: 'ALetter',
-    49982: 'ALetter',
-    49983: 'ALetter',
-    49984: 'ALetter',
-    49985: 'ALetter',
-    49986: 'ALetter',
-    49987: 'ALetter',
-    49988: 'ALetter',
-    49989: 'ALetter',
-    49990: 'ALetter',
-    49991: 'ALetter',
-    49992: 'ALetter',
-    49993: 'ALetter',
-    49994: 'ALetter',
-    49995: 'ALetter',
-    49996: 'ALetter',
-    49997: 'ALetter',
-    49998: 'ALetter',
-    49999: 'ALetter',
-    50000: 'ALetter',
-    50001: 'ALetter',
-    50002: 'ALetter',
-    50003: 'ALetter',
-    50004: 'ALetter',
-    50005: 'ALetter',
-    50006: 'ALetter',
-    50007: 'ALetter',
-    50008: 'ALetter',
-    50009: 'ALetter',
-    50010: 'ALetter',
-    50011: 'ALetter',
-    50012: 'ALetter',
-    50013: 'ALetter',
-    50014: 'ALetter',
-    50015: 'ALetter',
-    50016: 'ALetter',
-    50017: 'ALetter',
-    50018: 'ALetter',
-    50019: 'ALetter',
-    50020: 'ALetter',
-    50021: 'ALetter',
-    50022: 'ALetter',
-    50023: 'ALetter',
-    50024: 'ALetter',
-    50025: 'ALetter',
-    50026: 'ALetter',
-    50027: 'ALetter',
-    50028: 'ALetter',
-    50029: 'ALetter',
-    50030: 'ALetter',
-    50031: 'ALetter',
-    50032: 'ALetter',
-    50033: 'ALetter',
-    50034: 'ALetter',
-    50035: 'ALetter',
-    50036: 'ALetter',
-    50037: 'ALetter',
-    50038: 'ALetter',
-    50039: 'ALetter',
-    50040: 'ALetter',
-    50041: 'ALetter',
-    50042: 'ALetter',
-    50043: 'ALetter',
-    50044: 'ALetter',
-    50045: 'ALetter',
-    50046: 'ALetter',
-    50047: 'ALetter',
-    50048: 'ALetter',
-    50049: 'ALetter',
-    50050: 'ALetter',
-    50051: 'ALetter',
-    50052: 'ALetter',
-    50053: 'ALetter',
-    50054: 'ALetter',
-    50055: 'ALetter',
-    50056: 'ALetter',
-    50057: 'ALetter',
-    50058: 'ALetter',
-    50059: 'ALetter',
-    50060: 'ALetter',
-    50061: 'ALetter',
-    50062: 'ALetter',
-    50063: 'ALetter',
-    50064: 'ALetter',
-    50065: 'ALetter',
-    50066: 'ALetter',
-    50067: 'ALetter',
-    50068: 'ALetter',
-    50069: 'ALetter',
-    50070: 'ALetter',
-    50071: 'ALetter',
-    50072: 'ALetter',
-    50073: 'ALetter',
-    50074: 'ALetter',
-    50075: 'ALetter',
-    50076: 'ALetter',
-    50077: 'ALetter',
-    50078: 'ALetter',
-    50079: 'ALetter',
-    50080: 'ALetter',
-    50081: 'ALetter',
-    50082: 'ALetter',
-    50083: 'ALetter',
-    50084: 'ALetter',
-    50085: 'ALetter',
-    50086: 'ALetter',
-    50087: 'ALetter',
-    50088: 'ALetter',
-    50089: 'ALetter',
-    50090: 'ALetter',
-    50091: 'ALetter',
-    50092: 'ALetter',
-    50093: 'ALetter',
-    50094: 'ALetter',
-    50095: 'ALetter',
-    50096: 'ALetter',
-    50097: 'ALetter',
-    50098: 'ALetter',
-    50099: 'ALetter',
-    50100: 'ALetter',
-    50101: 'ALetter',
-    50102: 'ALetter',
-    50103: 'ALetter',
-    50104: 'ALetter',
-    50105: 'ALetter',
-    50106: 'ALetter',
-    50107: 'ALetter',
-    50108: 'ALetter',
-    50109: 'ALetter',
-    50110: 'ALetter',
-    50111: 'ALetter',
-    50112: 'ALetter',
-    50113: 'ALetter',
-    50114: 'ALetter',
-    50115: 'ALetter',
-    50116: 'ALetter',
-    50117: 'ALetter',
-    50118: 'ALetter',
-    50119: 'ALetter',
-    50120: 'ALetter',
-    50121: 'ALetter',
-    50122: 'ALetter',
-    50123: 'ALetter',
-    50124: 'ALetter',
-    50125: 'ALetter',
-    50126: 'ALetter',
-    50127: 'ALetter',
-    50128: 'ALetter',
-    50129: 'ALetter',
-    50130: 'ALetter',
-    50131: 'ALetter',
-    50132: 'ALetter',
-    50133: 'ALetter',
-    50134: 'ALetter',
-    50135: 'ALetter',
-    50136: 'ALetter',
-    50137: 'ALetter',
-    50138: 'ALetter',
-    50139: 'ALetter',
-    50140: 'ALetter',
-    50141: 'ALetter',
-    50142: 'ALetter',
-    50143: 'ALetter',
-    50144: 'ALetter',
-    50145: 'ALetter',
-    50146: 'ALetter',
-    50147: 'ALetter',
-    50148: 'ALetter',
-    50149: 'ALetter',
-    50150: 'ALetter',
-    50151: 'ALetter',
-    50152: 'ALetter',
-    50153: 'ALetter',
-    50154: 'ALetter',
-    50155: 'ALetter',
-    50156: 'ALetter',
-    50157: 'ALetter',
-    50158: 'ALetter',
-    50159: 'ALetter',
-    50160: 'ALetter',
-    50161: 'ALetter',
-    50162: 'ALetter',
-    50163: 'ALetter',
-    50164: 'ALetter',
-    50165: 'ALetter',
-    50166: 'ALetter',
-    50167: 'ALetter',
-    50168: 'ALetter',
-    50169: 'ALetter',
-    50170: 'ALetter',
-    50171: 'ALetter',
-    50172: 'ALetter',
-    50173: 'ALetter',
-    50174: 'ALetter',
-    50175: 'ALetter',
-    50176: 'ALetter',
-    50177: 'ALetter',
-    50178: 'ALetter',
-    50179: 'ALetter',
-    50180: 'ALetter',
-    50181: 'ALetter',
-    50182: 'ALetter',
-    50183: 'ALetter',
-    50184: 'ALetter',
-    50185: 'ALetter',
-    50186: 'ALetter',
-    50187: 'ALetter',
-    50188: 'ALetter',
-    50189: 'ALetter',
-    50190: 'ALetter',
-    50191: 'ALetter',
-    50192: 'ALetter',
-    50193: 'ALetter',
-    50194: 'ALetter',
-    50195: 'ALetter',
-    50196: 'ALetter',
-    50197: 'ALetter',
-    50198: 'ALetter',
-    50199: 'ALetter',
-    50200: 'ALetter',
-    50201: 'ALetter',
-    50202: 'ALetter',
-    50203: 'ALetter',
-    50204: 'ALetter',
-    50205: 'ALetter',
-    50206: 'ALetter',
-    50207: 'ALetter',
-    50208: 'ALetter',
-    50209: 'ALetter',
-    50210: 'ALetter',
-    50211: 'ALetter',
-    50212: 'ALetter',
-    50213: 'ALetter',
-    50214: 'ALetter',
-    50215: 'ALetter',
-    50216: 'ALetter',
-    50217: 'ALetter',
-    50218: 'ALetter',
-    50219: 'ALetter',
-    50220: 'ALetter',
-    50221: 'ALetter',
-    50222: 'ALetter',
-    50223: 'ALetter',
-    50224: 'ALetter',
-    50225: 'ALetter',
-    50226: 'ALetter',
-    50227: 'ALetter',
-    50228: 'ALetter',
-    50229: 'ALetter',
-    50230: 'ALetter',
-    50231: 'ALetter',
-    50232: 'ALetter',
-    50233: 'ALetter',
-    50234: 'ALetter',
-    50235: 'ALetter',
-    50236: 'ALetter',
-    50237: 'ALetter',
-    50238: 'ALetter',
-    50239: 'ALetter',
-    50240: 'ALetter',
-    50241: 'ALetter',
-    50242: 'ALetter',
-    50243: 'ALetter',
-    50244: 'ALetter',
-    50245: 'ALetter',
-    50246: 'ALetter',
-    50247: 'ALetter',
-    50248: 'ALetter',
-    50249: 'ALetter',
-    50250: 'ALetter',
-    50251: 'ALetter',
-    50252: 'ALetter',
-    50253: 'ALetter',
-    50254: 'ALetter',
-    50255: 'ALetter',
-    50256: 'ALetter',
-    50257: 'ALetter',
-    50258: 'ALetter',
-    50259: 'ALetter',
-    50260: 'ALetter',
-    50261: 'ALetter',
-    50262: 'ALetter',
-    50263: 'ALetter',
-    50264: 'ALetter',
-    50265: 'ALetter',
-    50266: 'ALetter',
-    50267: 'ALetter',
-    50268: 'ALetter',
-    50269: 'ALetter',
-    50270: 'ALetter',
-    50271: 'ALetter',
-    50272: 'ALetter',
-    50273: 'ALetter',
-    50274: 'ALetter',
-    50275: 'ALetter',
-    50276: 'ALetter',
-    50277: 'ALetter',
-    50278: 'ALetter',
-    50279: 'ALetter',
-    50280: 'ALetter',
-    50281: 'ALetter',
-    50282: 'ALetter',
-    50283: 'ALetter',
-    50284: 'ALetter',
-    50285: 'ALetter',
-    50286: 'ALetter',
-    50287: 'ALetter',
-    50288: 'ALetter',
-    50289: 'ALetter',
-    50290: 'ALetter',
-    50291: 'ALetter',
-    50292: 'ALetter',
-    50293: 'ALetter',
-    50294: 'ALetter',
-    50295: 'ALetter',
-    50296: 'ALetter',
-    50297: 'ALetter',
-    50298: 'ALetter',
-    50299: 'ALetter',
-    50300: 'ALetter',
-    50301: 'ALetter',
-    50302: 'ALetter',
-    50303: 'ALetter',
-    50304: 'ALetter',
-    50305: 'ALetter',
-    50306: 'ALetter',
-    50307: 'ALetter',
-    50308: 'ALetter',
-    50309: 'ALetter',
-    50310: 'ALetter',
-    50311: 'ALetter',
-    50312: 'ALetter',
-    50313: 'ALetter',
-    50314: 'ALetter',
-    50315: 'ALetter',
-    50316: 'ALetter',
-    50317: 'ALetter',
-    50318: 'ALetter',
-    50319: 'ALetter',
-    50320: 'ALetter',
-    50321: 'ALetter',
-    50322: 'ALetter',
-    50323: 'ALetter',
-    50324: 'ALetter',
-    50325: 'ALetter',
-    50326: 'ALetter',
-    50327: 'ALetter',
-    50328: 'ALetter',
-    50329: 'ALetter',
-    50330: 'ALetter',
-    50331: 'ALetter',
-    50332: 'ALetter',
-    50333: 'ALetter',
-    50334: 'ALetter',
-    50335: 'ALetter',
-    50336: 'ALetter',
-    50337: 'ALetter',
-    50338: 'ALetter',
-    50339: 'ALetter',
-    50340: 'ALetter',
-    50341: 'ALetter',
-    50342: 'ALetter',
-    50343: 'ALetter',
-    50344: 'ALetter',
-    50345: 'ALetter',
-    50346: 'ALetter',
-    50347: 'ALetter',
-    50348: 'ALetter',
-    50349: 'ALetter',
-    50350: 'ALetter',
-    50351: 'ALetter',
-    50352: 'ALetter',
-    50353: 'ALetter',
-    50354: 'ALetter',
-    50355: 'ALetter',
-    50356: 'ALetter',
-    50357: 'ALetter',
-    50358: 'ALetter',
-    50359: 'ALetter',
-    50360: 'ALetter',
-    50361: 'ALetter',
-    50362: 'ALetter',
-    50363: 'ALetter',
-    50364: 'ALetter',
-    50365: 'ALetter',
-    50366: 'ALetter',
-    50367: 'ALetter',
-    50368: 'ALetter',
-    50369: 'ALetter',
-    50370: 'ALetter',
-    50371: 'ALetter',
-    50372: 'ALetter',
-    50373: 'ALetter',
-    50374: 'ALetter',
-    50375: 'ALetter',
-    50376: 'ALetter',
-    50377: 'ALetter',
-    50378: 'ALetter',
-    50379: 'ALetter',
-    50380: 'ALetter',
-    50381: 'ALetter',
-    50382: 'ALetter',
-    50383: 'ALetter',
-    50384: 'ALetter',
-    50385: 'ALetter',
-    50386: 'ALetter',
-    50387: 'ALetter',
-    50388: 'ALetter',
-    50389: 'ALetter',
-    50390: 'ALetter',
-    50391: 'ALetter',
-    50392: 'ALetter',
-    50393: 'ALetter',
-    50394: 'ALetter',
-    50395: 'ALetter',
-    50396: 'ALetter',
-    50397: 'ALetter',
-    50398: 'ALetter',
-    50399: 'ALetter',
-    50400: 'ALetter',
-    50401: 'ALetter',
-    50402: 'ALetter',
-    50403: 'ALetter',
-    50404: 'ALetter',
-    50405: 'ALetter',
-    50406: 'ALetter',
-    50407: 'ALetter',
-    50408: 'ALetter',
-    50409: 'ALetter',
-    50410: 'ALetter',
-    50411: 'ALetter',
-    50412: 'ALetter',
-    50413: 'ALetter',
-    50414: 'ALetter',
-    50415: 'ALetter',
-    50416: 'ALetter',
-    50417: 'ALetter',
-    50418: 'ALetter',
-    50419: 'ALetter',
-    50420: 'ALetter',
-    50421: 'ALetter',
-    50422: 'ALetter',
-    50423: 'ALetter',
-    50424: 'ALetter',
-    50425: 'ALetter',
-    50426: 'ALetter',
-    50427: 'ALetter',
-    50428: 'ALetter',
-    50429: 'ALetter',
-    50430: 'ALetter',
-    50431: 'ALetter',
-    50432: 'ALetter',
-    50433: 'ALetter',
-    50434: 'ALetter',
-    50435: 'ALetter',
-    50436: 'ALetter',
-    50437: 'ALetter',
-    50438: 'ALetter',
-    50439: 'ALetter',
-    50440: 'ALetter',
-    50441: 'ALetter',
-    50442: 'ALetter',
-    50443: 'ALetter',
-    50444: 'ALetter',
-    50445: 'ALetter',
-    50446: 'ALetter',
-    50447: 'ALetter',
-    50448: 'ALetter',
-    50449: 'ALetter',
-    50450: 'ALetter',
-    50451: 'ALetter',
-    50452: 'ALetter',
-    50453: 'ALetter',
-    50454: 'ALetter',
-    50455: 'ALetter',
-    50456: 'ALetter',
-    50457: 'ALetter',
-    50458: 'ALetter',
-    50459: 'ALetter',
-    50460: 'ALetter',
-    50461: 'ALetter',
-    50462: 'ALetter',
-    50463: 'ALetter',
-    50464: 'ALetter',
-    50465: 'ALetter',
-    50466: 'ALetter',
-    50467: 'ALetter',
-    50468: 'ALetter',
-    50469: 'ALetter',
-    50470: 'ALetter',
-    50471: 'ALetter',
-    50472: 'ALetter',
-    50473: 'ALetter',
-    50474: 'ALetter',
-    50475: 'ALetter',
-    50476: 'ALetter',
-    50477: 'ALetter',
-    50478: 'ALetter',
-    50479: 'ALetter',
-    50480: 'ALetter',
-    50481: 'ALetter',
-    50482: 'ALetter',
-    50483: 'ALetter',
-    50484: 'ALetter',
-    50485: 'ALetter',
-    50486: 'ALetter',
-    50487: 'ALetter',
-    50488: 'ALetter',
-    50489: 'ALetter',
-    50490: 'ALetter',
-    50491: 'ALetter',
-    50492: 'ALetter',
-    50493: 'ALetter',
-    50494: 'ALetter',
-    50495: 'ALetter',
-    50496: 'ALetter',
-    50497: 'ALetter',
-    50498: 'ALetter',
-    50499: 'ALetter',
-    50500: 'ALetter',
-    50501: 'ALetter',
-    50502: 'ALetter',
-    50503: 'ALetter',
-    50504: 'ALetter',
-    50505: 'ALetter',
-    50506: 'ALetter',
-    50507: 'ALetter',
-    50508: 'ALetter',
-    50509: 'ALetter',
-    50510: 'ALetter',
-    50511: 'ALetter',
-    50512: 'ALetter',
-    50513: 'ALetter',
-    50514: 'ALetter',
-    50515: 'ALetter',
-    50516: 'ALetter',
-    50517: 'ALetter',
-    50518: 'ALetter',
-    50519: 'ALetter',
-    50520: 'ALetter',
-    50521: 'ALetter',
-    50522: 'ALetter',
-    50523: 'ALetter',
-    50524: 'ALetter',
-    50525: 'ALetter',
-    50526: 'ALetter',
-    50527: 'ALetter',
-    50528: 'ALetter',
-    50529: 'ALetter',
-    50530: 'ALetter',
-    50531: 'ALetter',
-    50532: 'ALetter',
-    50533: 'ALetter',
-    50534: 'ALetter',
-    50535: 'ALetter',
-    50536: 'ALetter',
-    50537: 'ALetter',
-    50538: 'ALetter',
-    50539: 'ALetter',
-    50540: 'ALetter',
-    50541: 'ALetter',
-    50542: 'ALetter',
-    50543: 'ALetter',
-    50544: 'ALetter',
-    50545: 'ALetter',
-    50546: 'ALetter',
-    50547: 'ALetter',
-    50548: 'ALetter',
-    50549: 'ALetter',
-    50550: 'ALetter',
-    50551: 'ALetter',
-    50552: 'ALetter',
-    50553: 'ALetter',
-    50554: 'ALetter',
-    50555: 'ALetter',
-    50556: 'ALetter',
-    50557: 'ALetter',
-    50558: 'ALetter',
-    50559: 'ALetter',
-    50560: 'ALetter',
-    50561: 'ALetter',
-    50562: 'ALetter',
-    50563: 'ALetter',
-    50564: 'ALetter',
-    50565: 'ALetter',
-    50566: 'ALetter',
-    50567: 'ALetter',
-    50568: 'ALetter',
-    50569: 'ALetter',
-    50570: 'ALetter',
-    50571: 'ALetter',
-    50572: 'ALetter',
-    50573: 'ALetter',
-    50574: 'ALetter',
-    50575: 'ALetter',
-    50576: 'ALetter',
-    50577: 'ALetter',
-    50578: 'ALetter',
-    50579: 'ALetter',
-    50580: 'ALetter',
-    50581: 'ALetter',
-    50582: 'ALetter',
-    50583: 'ALetter',
-    50584: 'ALetter',
-    50585: 'ALetter',
-    50586: 'ALetter',
-    50587: 'ALetter',
-    50588: 'ALetter',
-    50589: 'ALetter',
-    50590: 'ALetter',
-    50591: 'ALetter',
-    50592: 'ALetter',
-    50593: 'ALetter',
-    50594: 'ALetter',
-    50595: 'ALetter',
-    50596: 'ALetter',
-    50597: 'ALetter',
-    50598: 'ALetter',
-    50599: 'ALetter',
-    50600: 'ALetter',
-    50601: 'ALetter',
-    50602: 'ALetter',
-    50603: 'ALetter',
-    50604: 'ALetter',
-    50605: 'ALetter',
-    50606: 'ALetter',
-    50607: 'ALetter',
-    50608: 'ALetter',
-    50609: 'ALetter',
-    50610: 'ALetter',
-    50611: 'ALetter',
-    50612: 'ALetter',
-    50613: 'ALetter',
-    50614: 'ALetter',
-    50615: 'ALetter',
-    50616: 'ALetter',
-    50617: 'ALetter',
-    50618: 'ALetter',
-    50619: 'ALetter',
-    50620: 'ALetter',
-    50621: 'ALetter',
-    50622: 'ALetter',
-    50623: 'ALetter',
-    50624: 'ALetter',
-    50625: 'ALetter',
-    50626: 'ALetter',
-    50627: 'ALetter',
-    50628: 'ALetter',
-    50629: 'ALetter',
-    50630: 'ALetter',
-    50631: 'ALetter',
-    50632: 'ALetter',
-    50633: 'ALetter',
-    50634: 'ALetter',
-    50635: 'ALetter',
-    50636: 'ALetter',
-    50637: 'ALetter',
-    50638: 'ALetter',
-    50639: 'ALetter',
-    50640: 'ALetter',
-    50641: 'ALetter',
-    50642: 'ALetter',
-    50643: 'ALetter',
-    50644: 'ALetter',
-    50645: 'ALetter',
-    50646: 'ALetter',
-    50647: 'ALetter',
-    50648: 'ALetter',
-    50649: 'ALetter',
-    50650: 'ALetter',
-    50651: 'ALetter',
-    50652: 'ALetter',
-    50653: 'ALetter',
-    50654: 'ALetter',
-    50655: 'ALetter',
-    50656: 'ALetter',
-    50657: 'ALetter',
-    50658: 'ALetter',
-    50659: 'ALetter',
-    50660: 'ALetter',
-    50661: 'ALetter',
-    50662: 'ALetter',
-    50663: 'ALetter',
-    50664: 'ALetter',
-    50665: 'ALetter',
-    50666: 'ALetter',
-    50667: 'ALetter',
-    50668: 'ALetter',
-    50669: 'ALetter',
-    50670: 'ALetter',
-    50671: 'ALetter',
-    50672: 'ALetter',
-    50673: 'ALetter',
-    50674: 'ALetter',
-    50675: 'ALetter',
-    50676: 'ALetter',
-    50677: 'ALetter',
-    50678: 'ALetter',
-    50679: 'ALetter',
-    50680: 'ALetter',
-    50681: 'ALetter',
-    50682: 'ALetter',
-    50683: 'ALetter',
-    50684: 'ALetter',
-    50685: 'ALetter',
-    50686: 'ALetter',
-    50687: 'ALetter',
-    50688: 'ALetter',
-    50689: 'ALetter',
-    50690: 'ALetter',
-    50691: 'ALetter',
-    50692: 'ALetter',
-    50693: 'ALetter',
-    50694: 'ALetter',
-    50695: 'ALetter',
-    50696: 'ALetter',
-    50697: 'ALetter',
-    50698: 'ALetter',
-    50699: 'ALetter',
-    50700: 'ALetter',
-    50701: 'ALetter',
-    50702: 'ALetter',
-    50703: 'ALetter',
-    50704: 'ALetter',
-    50705: 'ALetter',
-    50706: 'ALetter',
-    50707: 'ALetter',
-    50708: 'ALetter',
-    50709: 'ALetter',
-    50710: 'ALetter',
-    50711: 'ALetter',
-    50712: 'ALetter',
-    50713: 'ALetter',
-    50714: 'ALetter',
-    50715: 'ALetter',
-    50716: 'ALetter',
-    50717: 'ALetter',
-    50718: 'ALetter',
-    50719: 'ALetter',
-    50720: 'ALetter',
-    50721: 'ALetter',
-    50722: 'ALetter',
-    50723: 'ALetter',
-    50724: 'ALetter',
-    50725: 'ALetter',
-    50726: 'ALetter',
-    50727: 'ALetter',
-    50728: 'ALetter',
-    50729: 'ALetter',
-    50730: 'ALetter',
-    50731: 'ALetter',
-    50732: 'ALetter',
-    50733: 'ALetter',
-    50734: 'ALetter',
-    50735: 'ALetter',
-    50736: 'ALetter',
-    50737: 'ALetter',
-    50738: 'ALetter',
-    50739: 'ALetter',
-    50740: 'ALetter',
-    50741: 'ALetter',
-    50742: 'ALetter',
-    50743: 'ALetter',
-    50744: 'ALetter',
-    50745: 'ALetter',
-    50746: 'ALetter',
-    50747: 'ALetter',
-    50748: 'ALetter',
-    50749: 'ALetter',
-    50750: 'ALetter',
-    50751: 'ALetter',
-    50752: 'ALetter',
-    50753: 'ALetter',
-    50754: 'ALetter',
-    50755: 'ALetter',
-    50756: 'ALetter',
-    50757: 'ALetter',
-    50758: 'ALetter',
-    50759: 'ALetter',
-    50760: 'ALetter',
-    50761: 'ALetter',
-    50762: 'ALetter',
-    50763: 'ALetter',
-    50764: 'ALetter',
-    50765: 'ALetter',
-    50766: 'ALetter',
-    50767: 'ALetter',
-    50768: 'ALetter',
-    50769: 'ALetter',
-    50770: 'ALetter',
-    50771: 'ALetter',
-    50772: 'ALetter',
-    50773: 'ALetter',
-    50774: 'ALetter',
-    50775: 'ALetter',
-    50776: 'ALetter',
-    50777: 'ALetter',
-    50778: 'ALetter',
-    50779: 'ALetter',
-    50780: 'ALetter',
-    50781: 'ALetter',
-    50782: 'ALetter',
-    50783: 'ALetter',
-    50784: 'ALetter',
-    50785: 'ALetter',
-    50786: 'ALetter',
-    50787: 'ALetter',
-    50788: 'ALetter',
-    50789: 'ALetter',
-    50790: 'ALetter',
-    50791: 'ALetter',
-    50792: 'ALetter',
-    50793: 'ALetter',
-    50794: 'ALetter',
-    50795: 'ALetter',
-    50796: 'ALetter',
-    50797: 'ALetter',
-    50798: 'ALetter',
-    50799: 'ALetter',
-    50800: 'ALetter',
-    50801: 'ALetter',
-    50802: 'ALetter',
-    50803: 'ALetter',
-    50804: 'ALetter',
-    50805: 'ALetter',
-    50806: 'ALetter',
-    50807: 'ALetter',
-    50808: 'ALetter',
-    50809: 'ALetter',
-    50810: 'ALetter',
-    50811: 'ALetter',
-    50812: 'ALetter',
-    50813: 'ALetter',
-    50814: 'ALetter',
-    50815: 'ALetter',
-    50816: 'ALetter',
-    50817: 'ALetter',
-    50818: 'ALetter',
-    50819: 'ALetter',
-    50820: 'ALetter',
-    50821: 'ALetter',
-    50822: 'ALetter',
-    50823: 'ALetter',
-    50824: 'ALetter',
-    50825: 'ALetter',
-    50826: 'ALetter',
-    50827: 'ALetter',
-    50828: 'ALetter',
-    50829: 'ALetter',
-    50830: 'ALetter',
-    50831: 'ALetter',
-    50832: 'ALetter',
-    50833: 'ALetter',
-    50834: 'ALetter',
-    50835: 'ALetter',
-    50836: 'ALetter',
-    50837: 'ALetter',
-    50838: 'ALetter',
-    50839: 'ALetter',
-    50840: 'ALetter',
-    50841: 'ALetter',
-    50842: 'ALetter',
-    50843: 'ALetter',
-    50844: 'ALetter',
-    50845: 'ALetter',
-    50846: 'ALetter',
-    50847: 'ALetter',
-    50848: 'ALetter',
-    50849: 'ALetter',
-    50850: 'ALetter',
-    50851: 'ALetter',
-    50852: 'ALetter',
-    50853: 'ALetter',
-    50854: 'ALetter',
-    50855: 'ALetter',
-    50856: 'ALetter',
-    50857: 'ALetter',
-    50858: 'ALetter',
-    50859: 'ALetter',
-    50860: 'ALetter',
-    50861: 'ALetter',
-    50862: 'ALetter',
-    50863: 'ALetter',
-    50864: 'ALetter',
-    50865: 'ALetter',
-    50866: 'ALetter',
-    50867: 'ALetter',
-    50868: 'ALetter',
-    50869: 'ALetter',
-    50870: 'ALetter',
-    50871: 'ALetter',
-    50872: 'ALetter',
-    50873: 'ALetter',
-    50874: 'ALetter',
-    50875: 'ALetter',
-    50876: 'ALetter',
-    50877: 'ALetter',
-    50878: 'ALetter',
-    50879: 'ALetter',
-    50880: 'ALetter',
-    50881: 'ALetter',
-    50882: 'ALetter',
-    50883: 'ALetter',
-    50884: 'ALetter',
-    50885: 'ALetter',
-    50886: 'ALetter',
-    50887: 'ALetter',
-    50888: 'ALetter',
-    50889: 'ALetter',
-    50890: 'ALetter',
-    50891: 'ALetter',
-    50892: 'ALetter',
-    50893: 'ALetter',
-    50894: 'ALetter',
-    50895: 'ALetter',
-    50896: 'ALetter',
-    50897: 'ALetter',
-    50898: 'ALetter',
-    50899: 'ALetter',
-    50900: 'ALetter',
-    50901: 'ALetter',
-    50902: 'ALetter',
-    50903: 'ALetter',
-    50904: 'ALetter',
-    50905: 'ALetter',
-    50906: 'ALetter',
-    50907: 'ALetter',
-    50908: 'ALetter',
-    50909: 'ALetter',
-    50910: 'ALetter',
-    50911: 'ALetter',
-    50912: 'ALetter',
-    50913: 'ALetter',
-    50914: 'ALetter',
-    50915: 'ALetter',
-    50916: 'ALetter',
-    50917: 'ALetter',
-    50918: 'ALetter',
-    50919: 'ALetter',
-    50920: 'ALetter',
-    50921: 'ALetter',
-    50922: 'ALetter',
-    50923: 'ALetter',
-    50924: 'ALetter',
-    50925: 'ALetter',
-    50926: 'ALetter',
-    50927: 'ALetter',
-    50928: 'ALetter',
-    50929: 'ALetter',
-    50930: 'ALetter',
-    50931: 'ALetter',
-    50932: 'ALetter',
-    50933: 'ALetter',
-    50934: 'ALetter',
-    50935: 'ALetter',
-    50936: 'ALetter',
-    50937: 'ALetter',
-    50938: 'ALetter',
-    50939: 'ALetter',
-    50940: 'ALetter',
-    50941: 'ALetter',
-    50942: 'ALetter',
-    50943: 'ALetter',
-    50944: 'ALetter',
-    50945: 'ALetter',
-    50946: 'ALetter',
-    50947: 'ALetter',
-    50948: 'ALetter',
-    50949: 'ALetter',
-    50950: 'ALetter',
-    50951: 'ALetter',
-    50952: 'ALetter',
-    50953: 'ALetter',
-    50954: 'ALetter',
-    50955: 'ALetter',
-    50956: 'ALetter',
-    50957: 'ALetter',
-    50958: 'ALetter',
-    50959: 'ALetter',
-    50960: 'ALetter',
-    50961: 'ALetter',
-    50962: 'ALetter',
-    50963: 'ALetter',
-    50964: 'ALetter',
-    50965: 'ALetter',
-    50966: 'ALetter',
-    50967: 'ALetter',
-    50968: 'ALetter',
-    50969: 'ALetter',
-    50970: 'ALetter',
-    50971: 'ALetter',
-    50972: 'ALetter',
-    50973: 'ALetter',
-    50974: 'ALetter',
-    50975: 'ALetter',
-    50976: 'ALetter',
-    50977: 'ALetter',
-    50978: 'ALetter',
-    50979: 'ALetter',
-    50980: 'ALetter',
-    50981: 'ALetter',
-    50982: 'ALetter',
-    50983: 'ALetter',
-    50984: 'ALetter',
-    50985: 'ALetter',
-    50986: 'ALetter',
-    50987: 'ALetter',
-    50988: 'ALetter',
-    50989: 'ALetter',
-    50990: 'ALetter',
-    50991: 'ALetter',
-    50992: 'ALetter',
-    50993: 'ALetter',
-    50994: 'ALetter',
-    50995: 'ALetter',
-    50996: 'ALetter',
-    50997: 'ALetter',
-    50998: 'ALetter',
-    50999: 'ALetter',
-    51000: 'ALetter',
-    51001: 'ALetter',
-    51002: 'ALetter',
-    51003: 'ALetter',
-    51004: 'ALetter',
-    51005: 'ALetter',
-    51006: 'ALetter',
-    51007: 'ALetter',
-    51008: 'ALetter',
-    51009: 'ALetter',
-    51010: 'ALetter',
-    51011: 'ALetter',
-    51012: 'ALetter',
-    51013: 'ALetter',
-    51014: 'ALetter',
-    51015: 'ALetter',
-    51016: 'ALetter',
-    51017: 'ALetter',
-    51018: 'ALetter',
-    51019: 'ALetter',
-    51020: 'ALetter',
-    51021: 'ALetter',
-    51022: 'ALetter',
-    51023: 'ALetter',
-    51024: 'ALetter',
-    51025: 'ALetter',
-    51026: 'ALetter',
-    51027: 'ALetter',
-    51028: 'ALetter',
-    51029: 'ALetter',
-    51030: 'ALetter',
-    51031: 'ALetter',
-    51032: 'ALetter',
-    51033: 'ALetter',
-    51034: 'ALetter',
-    51035: 'ALetter',
-    51036: 'ALetter',
-    51037: 'ALetter',
-    51038: 'ALetter',
-    51039: 'ALetter',
-    51040: 'ALetter',
-    51041: 'ALetter',
-    51042: 'ALetter',
-    51043: 'ALetter',
-    51044: 'ALetter',
-    51045: 'ALetter',
-    51046: 'ALetter',
-    51047: 'ALetter',
-    51048: 'ALetter',
-    51049: 'ALetter',
-    51050: 'ALetter',
-    51051: 'ALetter',
-    51052: 'ALetter',
-    51053: 'ALetter',
-    51054: 'ALetter',
-    51055: 'ALetter',
-    51056: 'ALetter',
-    51057: 'ALetter',
-    51058: 'ALetter',
-    51059: 'ALetter',
-    51060: 'ALetter',
-    51061: 'ALetter',
-    51062: 'ALetter',
-    51063: 'ALetter',
-    51064: 'ALetter',
-    51065: 'ALetter',
-    51066: 'ALetter',
-    51067: 'ALetter',
-    51068: 'ALetter',
-    51069: 'ALetter',
-    51070: 'ALetter',
-    51071: 'ALetter',
-    51072: 'ALetter',
-    51073: 'ALetter',
-    51074: 'ALetter',
-    51075: 'ALetter',
-    51076: 'ALetter',
-    51077: 'ALetter',
-    51078: 'ALetter',
-    51079: 'ALetter',
-    51080: 'ALetter',
-    51081: 'ALetter',
-    51082: 'ALetter',
-    51083: 'ALetter',
-    51084: 'ALetter',
-    51085: 'ALetter',
-    51086: 'ALetter',
-    51087: 'ALetter',
-    51088: 'ALetter',
-    51089: 'ALetter',
-    51090: 'ALetter',
-    51091: 'ALetter',
-    51092: 'ALetter',
-    51093: 'ALetter',
-    51094: 'ALetter',
-    51095: 'ALetter',
-    51096: 'ALetter',
-    51097: 'ALetter',
-    51098: 'ALetter',
-    51099: 'ALetter',
-    51100: 'ALetter',
-    51101: 'ALetter',
-    51102: 'ALetter',
-    51103: 'ALetter',
-    51104: 'ALetter',
-    51105: 'ALetter',
-    51106: 'ALetter',
-    51107: 'ALetter',
-    51108: 'ALetter',
-    51109: 'ALetter',
-    51110: 'ALetter',
-    51111: 'ALetter',
-    51112: 'ALetter',
-    51113: 'ALetter',
-    51114: 'ALetter',
-    51115: 'ALetter',
-    51116: 'ALetter',
-    51117: 'ALetter',
-    51118: 'ALetter',
-    51119: 'ALetter',
-    51120: 'ALetter',
-    51121: 'ALetter',
-    51122: 'ALetter',
-    51123: 'ALetter',
-    51124: 'ALetter',
-    51125: 'ALetter',
-    51126: 'ALetter',
-    51127: 'ALetter',
-    51128: 'ALetter',
-    51129: 'ALetter',
-    51130: 'ALetter',
-    51131: 'ALetter',
-    51132: 'ALetter',
-    51133: 'ALetter',
-    51134: 'ALetter',
-    51135: 'ALetter',
-    51136: 'ALetter',
-    51137: 'ALetter',
-    51138: 'ALetter',
-    51139: 'ALetter',
-    51140: 'ALetter',
-    51141: 'ALetter',
-    51142: 'ALetter',
-    51143: 'ALetter',
-    51144: 'ALetter',
-    51145: 'ALetter',
-    51146: 'ALetter',
-    51147: 'ALetter',
-    51148: 'ALetter',
-    51149: 'ALetter',
-    51150: 'ALetter',
-    51151: 'ALetter',
-    51152: 'ALetter',
-    51153: 'ALetter',
-    51154: 'ALetter',
-    51155: 'ALetter',
-    51156: 'ALetter',
-    51157: 'ALetter',
-    51158: 'ALetter',
-    51159: 'ALetter',
-    51160: 'ALetter',
-    51161: 'ALetter',
-    51162: 'ALetter',
-    51163: 'ALetter',
-    51164: 'ALetter',
-    51165: 'ALetter',
-    51166: 'ALetter',
-    51167: 'ALetter',
-    51168: 'ALetter',
-    51169: 'ALetter',
-    51170: 'ALetter',
-    51171: 'ALetter',
-    51172: 'ALetter',
-    51173: 'ALetter',
-    51174: 'ALetter',
-    51175: 'ALetter',
-    51176: 'ALetter',
-    51177: 'ALetter',
-    51178: 'ALetter',
-    51179: 'ALetter',
-    51180: 'ALetter',
-    51181: 'ALetter',
-    51182: 'ALetter',
-    51183: 'ALetter',
-    51184: 'ALetter',
-    51185: 'ALetter',
-    51186: 'ALetter',
-    51187: 'ALetter',
-    51188: 'ALetter',
-    51189: 'ALetter',
-    51190: 'ALetter',
-    51191: 'ALetter',
-    51192: 'ALetter',
-    51193: 'ALetter',
-    51194: 'ALetter',
-    51195: 'ALetter',
-    51196: 'ALetter',
-    51197: 'ALetter',
-    51198: 'ALetter',
-    51199: 'ALetter',
-    51200: 'ALetter',
-    51201: 'ALetter',
-    51202: 'ALetter',
-    51203: 'ALetter',
-    51204: 'ALetter',
-    51205: 'ALetter',
-    51206: 'ALetter',
-    51207: 'ALetter',
-    51208: 'ALetter',
-    51209: 'ALetter',
-    51210: 'ALetter',
-    51211: 'ALetter',
-    51212: 'ALetter',
-    51213: 'ALetter',
-    51214: 'ALetter',
-    51215: 'ALetter',
-    51216: 'ALetter',
-    51217: 'ALetter',
-    51218: 'ALetter',
-    51219: 'ALetter',
-    51220: 'ALetter',
-    51221: 'ALetter',
-    51222: 'ALetter',
-    51223: 'ALetter',
-    51224: 'ALetter',
-    51225: 'ALetter',
-    51226: 'ALetter',
-    51227: 'ALetter',
-    51228: 'ALetter',
-    51229: 'ALetter',
-    51230: 'ALetter',
-    51231: 'ALetter',
-    51232: 'ALetter',
-    51233: 'ALetter',
-    51234: 'ALetter',
-    51235: 'ALetter',
-    51236: 'ALetter',
-    51237: 'ALetter',
-    51238: 'ALetter',
-    51239: 'ALetter',
-    51240: 'ALetter',
-    51241: 'ALetter',
-    51242: 'ALetter',
-    51243: 'ALetter',
-    51244: 'ALetter',
-    51245: 'ALetter',
-    51246: 'ALetter',
-    51247: 'ALetter',
-    51248: 'ALetter',
-    51249: 'ALetter',
-    51250: 'ALetter',
-    51251: 'ALetter',
-    51252: 'ALetter',
-    51253: 'ALetter',
-    51254: 'ALetter',
-    51255: 'ALetter',
-    51256: 'ALetter',
-    51257: 'ALetter',
-    51258: 'ALetter',
-    51259: 'ALetter',
-    51260: 'ALetter',
-    51261: 'ALetter',
-    51262: 'ALetter',
-    51263: 'ALetter',
-    51264: 'ALetter',
-    51265: 'ALetter',
-    51266: 'ALetter',
-    51267: 'ALetter',
-    51268: 'ALetter',
-    51269: 'ALetter',
-    51270: 'ALetter',
-    51271: 'ALetter',
-    51272: 'ALetter',
-    51273: 'ALetter',
-    51274: 'ALetter',
-    51275: 'ALetter',
-    51276: 'ALetter',
-    51277: 'ALetter',
-    51278: 'ALetter',
-    51279: 'ALetter',
-    51280: 'ALetter',
-    51281: 'ALetter',
-    51282: 'ALetter',
-    51283: 'ALetter',
-    51284: 'ALetter',
-    51285: 'ALetter',
-    51286: 'ALetter',
-    51287: 'ALetter',
-    51288: 'ALetter',
-    51289: 'ALetter',
-    51290: 'ALetter',
-    51291: 'ALetter',
-    51292: 'ALetter',
-    51293: 'ALetter',
-    51294: 'ALetter',
-    51295: 'ALetter',
-    51296: 'ALetter',
-    51297: 'ALetter',
-    51298: 'ALetter',
-    51299: 'ALetter',
-    51300: 'ALetter',
-    51301: 'ALetter',
-    51302: 'ALetter',
-    51303: 'ALetter',
-    51304: 'ALetter',
-    51305: 'ALetter',
-    51306: 'ALetter',
-    51307: 'ALetter',
-    51308: 'ALetter',
-    51309: 'ALetter',
-    51310: 'ALetter',
-    51311: 'ALetter',
-    51312: 'ALetter',
-    51313: 'ALetter',
-    51314: 'ALetter',
-    51315: 'ALetter',
-    51316: 'ALetter',
-    51317: 'ALetter',
-    51318: 'ALetter',
-    51319: 'ALetter',
-    51320: 'ALetter',
-    51321: 'ALetter',
-    51322: 'ALetter',
-    51323: 'ALetter',
-    51324: 'ALetter',
-    51325: 'ALetter',
-    51326: 'ALetter',
-    51327: 'ALetter',
-    51328: 'ALetter',
-    51329: 'ALetter',
-    51330: 'ALetter',
-    51331: 'ALetter',
-    51332: 'ALetter',
-    51333: 'ALetter',
-    51334: 'ALetter',
-    51335: 'ALetter',
-    51336: 'ALetter',
-    51337: 'ALetter',
-    51338: 'ALetter',
-    51339: 'ALetter',
-    51340: 'ALetter',
-    51341: 'ALetter',
-    51342: 'ALetter',
-    51343: 'ALetter',
-    51344: 'ALetter',
-    51345: 'ALetter',
-    51346: 'ALetter',
-    51347: 'ALetter',
-    51348: 'ALetter',
-    51349: 'ALetter',
-    51350: 'ALetter',
-    51351: 'ALetter',
-    51352: 'ALetter',
-    51353: 'ALetter',
-    51354: 'ALetter',
-    51355: 'ALetter',
-    51356: 'ALetter',
-    51357: 'ALetter',
-    51358: 'ALetter',
-    51359: 'ALetter',
-    51360: 'ALetter',
-    51361: 'ALetter',
-    51362: 'ALetter',
-    51363: 'ALetter',
-    51364: 'ALetter',
-    51365: 'ALetter',
-    51366: 'ALetter',
-    51367: 'ALetter',
-    51368: 'ALetter',
-    51369: 'ALetter',
-    51370: 'ALetter',
-    51371: 'ALetter',
-    51372: 'ALetter',
-    51373: 'ALetter',
-    51374: 'ALetter',
-    51375: 'ALetter',
-    51376: 'ALetter',
-    51377: 'ALetter',
-    51378: 'ALetter',
-    51379: 'ALetter',
-    51380: 'ALetter',
-    51381: 'ALetter',
-    51382: 'ALetter',
-    51383: 'ALetter',
-    51384: 'ALetter',
-    51385: 'ALetter',
-    51386: 'ALetter',
-    51387: 'ALetter',
-    51388: 'ALetter',
-    51389: 'ALetter',
-    51390: 'ALetter',
-    51391: 'ALetter',
-    51392: 'ALetter',
-    51393: 'ALetter',
-    51394: 'ALetter',
-    51395: 'ALetter',
-    51396: 'ALetter',
-    51397: 'ALetter',
-    51398: 'ALetter',
-    51399: 'ALetter',
-    51400: 'ALetter',
-    51401: 'ALetter',
-    51402: 'ALetter',
-    51403: 'ALetter',
-    51404: 'ALetter',
-    51405: 'ALetter',
-    51406: 'ALetter',
-    51407: 'ALetter',
-    51408: 'ALetter',
-    51409: 'ALetter',
-    51410: 'ALetter',
-    51411: 'ALetter',
-    51412: 'ALetter',
-    51413: 'ALetter',
-    51414: 'ALetter',
-    51415: 'ALetter',
-    51416: 'ALetter',
-    51417: 'ALetter',
-    51418: 'ALetter',
-    51419: 'ALetter',
-    51420: 'ALetter',
-    51421: 'ALetter',
-    51422: 'ALetter',
-    51423: 'ALetter',
-    51424: 'ALetter',
-    51425: 'ALetter',
-    51426: 'ALetter',
-    51427: 'ALetter',
-    51428: 'ALetter',
-    51429: 'ALetter',
-    51430: 'ALetter',
-    51431: 'ALetter',
-    51432: 'ALetter',
-    51433: 'ALetter',
-    51434: 'ALetter',
-    51435: 'ALetter',
-    51436: 'ALetter',
-    51437: 'ALetter',
-    51438: 'ALetter',
-    51439: 'ALetter',
-    51440: 'ALetter',
-    51441: 'ALetter',
-    51442: 'ALetter',
-    51443: 'ALetter',
-    51444: 'ALetter',
-    51445: 'ALetter',
-    51446: 'ALetter',
-    51447: 'ALetter',
-    51448: 'ALetter',
-    51449: 'ALetter',
-    51450: 'ALetter',
-    51451: 'ALetter',
-    51452: 'ALetter',
-    51453: 'ALetter',
-    51454: 'ALetter',
-    51455: 'ALetter',
-    51456: 'ALetter',
-    51457: 'ALetter',
-    51458: 'ALetter',
-    51459: 'ALetter',
-    51460: 'ALetter',
-    51461: 'ALetter',
-    51462: 'ALetter',
-    51463: 'ALetter',
-    51464: 'ALetter',
-    51465: 'ALetter',
-    51466: 'ALetter',
-    51467: 'ALetter',
-    51468: 'ALetter',
-    51469: 'ALetter',
-    51470: 'ALetter',
-    51471: 'ALetter',
-    51472: 'ALetter',
-    51473: 'ALetter',
-    51474: 'ALetter',
-    51475: 'ALetter',
-    51476: 'ALetter',
-    51477: 'ALetter',
-    51478: 'ALetter',
-    51479: 'ALetter',
-    51480: 'ALetter',
-    51481: 'ALetter',
-    51482: 'ALetter',
-    51483: 'ALetter',
-    51484: 'ALetter',
-    51485: 'ALetter',
-    51486: 'ALetter',
-    51487: 'ALetter',
-    51488: 'ALetter',
-    51489: 'ALetter',
-    51490: 'ALetter',
-    51491: 'ALetter',
-    51492: 'ALetter',
-    51493: 'ALetter',
-    51494: 'ALetter',
-    51495: 'ALetter',
-    51496: 'ALetter',
-    51497: 'ALetter',
-    51498: 'ALetter',
-    51499: 'ALetter',
-    51500: 'ALetter',
-    51501: 'ALetter',
-    51502: 'ALetter',
-    51503: 'ALetter',
-    51504: 'ALetter',
-    51505: 'ALetter',
-    51506: 'ALetter',
-    51507: 'ALetter',
-    51508: 'ALetter',
-    51509: 'ALetter',
-    51510: 'ALetter',
-    51511: 'ALetter',
-    51512: 'ALetter',
-    51513: 'ALetter',
-    51514: 'ALetter',
-    51515: 'ALetter',
-    51516: 'ALetter',
-    51517: 'ALetter',
-    51518: 'ALetter',
-    51519: 'ALetter',
-    51520: 'ALetter',
-    51521: 'ALetter',
-    51522: 'ALetter',
-    51523: 'ALetter',
-    51524: 'ALetter',
-    51525: 'ALetter',
-    51526: 'ALetter',
-    51527: 'ALetter',
-    51528: 'ALetter',
-    51529: 'ALetter',
-    51530: 'ALetter',
-    51531: 'ALetter',
-    51532: 'ALetter',
-    51533: 'ALetter',
-    51534: 'ALetter',
-    51535: 'ALetter',
-    51536: 'ALetter',
-    51537: 'ALetter',
-    51538: 'ALetter',
-    51539: 'ALetter',
-    51540: 'ALetter',
-    51541: 'ALetter',
-    51542: 'ALetter',
-    51543: 'ALetter',
-    51544: 'ALetter',
-    51545: 'ALetter',
-    51546: 'ALetter',
-    51547: 'ALetter',
-    51548: 'ALetter',
-    51549: 'ALetter',
-    51550: 'ALetter',
-    51551: 'ALetter',
-    51552: 'ALetter',
-    51553: 'ALetter',
-    51554: 'ALetter',
-    51555: 'ALetter',
-    51556: 'ALetter',
-    51557: 'ALetter',
-    51558: 'ALetter',
-    51559: 'ALetter',
-    51560: 'ALetter',
-    51561: 'ALetter',
-    51562: 'ALetter',
-    51563: 'ALetter',
-    51564: 'ALetter',
-    51565: 'ALetter',
-    51566: 'ALetter',
-    51567: 'ALetter',
-    51568: 'ALetter',
-    51569: 'ALetter',
-    51570: 'ALetter',
-    51571: 'ALetter',
-    51572: 'ALetter',
-    51573: 'ALetter',
-    51574: 'ALetter',
-    51575: 'ALetter',
-    51576: 'ALetter',
-    51577: 'ALetter',
-    51578: 'ALetter',
-    51579: 'ALetter',
-    51580: 'ALetter',
-    51581: 'ALetter',
-    51582: 'ALetter',
-    51583: 'ALetter',
-    51584: 'ALetter',
-    51585: 'ALetter',
-    51586: 'ALetter',
-    51587: 'ALetter',
-    51588: 'ALetter',
-    51589: 'ALetter',
-    51590: 'ALetter',
-    51591: 'ALetter',
-    51592: 'ALetter',
-    51593: 'ALetter',
-    51594: 'ALetter',
-    51595: 'ALetter',
-    51596: 'ALetter',
-    51597: 'ALetter',
-    51598: 'ALetter',
-    51599: 'ALetter',
-    51600: 'ALetter',
-    51601: 'ALetter',
-    51602: 'ALetter',
-    51603: 'ALetter',
-    51604: 'ALetter',
-    51605: 'ALetter',
-    51606: 'ALetter',
-    51607: 'ALetter',
-    51608: 'ALetter',
-    51609: 'ALetter',
-    51610: 'ALetter',
-    51611: 'ALetter',
-    51612: 'ALetter',
-    51613: 'ALetter',
-    51614: 'ALetter',
-    51615: 'ALetter',
-    51616: 'ALetter',
-    51617: 'ALetter',
-    51618: 'ALetter',
-    51619: 'ALetter',
-    51620: 'ALetter',
-    51621: 'ALetter',
-    51622: 'ALetter',
-    51623: 'ALetter',
-    51624: 'ALetter',
-    51625: 'ALetter',
-    51626: 'ALetter',
-    51627: 'ALetter',
-    51628: 'ALetter',
-    51629: 'ALetter',
-    51630: 'ALetter',
-    51631: 'ALetter',
-    51632: 'ALetter',
-    51633: 'ALetter',
-    51634: 'ALetter',
-    51635: 'ALetter',
-    51636: 'ALetter',
-    51637: 'ALetter',
-    51638: 'ALetter',
-    51639: 'ALetter',
-    51640: 'ALetter',
-    51641: 'ALetter',
-    51642: 'ALetter',
-    51643: 'ALetter',
-    51644: 'ALetter',
-    51645: 'ALetter',
-    51646: 'ALetter',
-    51647: 'ALetter',
-    51648: 'ALetter',
-    51649: 'ALetter',
-    51650: 'ALetter',
-    51651: 'ALetter',
-    51652: 'ALetter',
-    51653: 'ALetter',
-    51654: 'ALetter',
-    51655: 'ALetter',
-    51656: 'ALetter',
-    51657: 'ALetter',
-    51658: 'ALetter',
-    51659: 'ALetter',
-    51660: 'ALetter',
-    51661: 'ALetter',
-    51662: 'ALetter',
-    51663: 'ALetter',
-    51664: 'ALetter',
-    51665: 'ALetter',
-    51666: 'ALetter',
-    51667: 'ALetter',
-    51668: 'ALetter',
-    51669: 'ALetter',
-    51670: 'ALetter',
-    51671: 'ALetter',
-    51672: 'ALetter',
-    51673: 'ALetter',
-    51674: 'ALetter',
-    51675: 'ALetter',
-    51676: 'ALetter',
-    51677: 'ALetter',
-    51678: 'ALetter',
-    51679: 'ALetter',
-    51680: 'ALetter',
-    51681: 'ALetter',
-    51682: 'ALetter',
-    51683: 'ALetter',
-    51684: 'ALetter',
-    51685: 'ALetter',
-    51686: 'ALetter',
-    51687: 'ALetter',
-    51688: 'ALetter',
-    51689: 'ALetter',
-    51690: 'ALetter',
-    51691: 'ALetter',
-    51692: 'ALetter',
-    51693: 'ALetter',
-    51694: 'ALetter',
-    51695: 'ALetter',
-    51696: 'ALetter',
-    51697: 'ALetter',
-    51698: 'ALetter',
-    51699: 'ALetter',
-    51700: 'ALetter',
-    51701: 'ALetter',
-    51702: 'ALetter',
-    51703: 'ALetter',
-    51704: 'ALetter',
-    51705: 'ALetter',
-    51706: 'ALetter',
-    51707: 'ALetter',
-    51708: 'ALetter',
-    51709: 'ALetter',
-    51710: 'ALetter',
-    51711: 'ALetter',
-    51712: 'ALetter',
-    51713: 'ALetter',
-    51714: 'ALetter',
-    51715: 'ALetter',
-    51716: 'ALetter',
-    51717: 'ALetter',
-    51718: 'ALetter',
-    51719: 'ALetter',
-    51720: 'ALetter',
-    51721: 'ALetter',
-    51722: 'ALetter',
-    51723: 'ALetter',
-    51724: 'ALetter',
-    51725: 'ALetter',
-    51726: 'ALetter',
-    51727: 'ALetter',
-    51728: 'ALetter',
-    51729: 'ALetter',
-    51730: 'ALetter',
-    51731: 'ALetter',
-    51732: 'ALetter',
-    51733: 'ALetter',
-    51734: 'ALetter',
-    51735: 'ALetter',
-    51736: 'ALetter',
-    51737: 'ALetter',
-    51738: 'ALetter',
-    51739: 'ALetter',
-    51740: 'ALetter',
-    51741: 'ALetter',
-    51742: 'ALetter',
-    51743: 'ALetter',
-    51744: 'ALetter',
-    51745: 'ALetter',
-    51746: 'ALetter',
-    51747: 'ALetter',
-    51748: 'ALetter',
-    51749: 'ALetter',
-    51750: 'ALetter',
-    51751: 'ALetter',
-    51752: 'ALetter',
-    51753: 'ALetter',
-    51754: 'ALetter',
-    51755: 'ALetter',
-    51756: 'ALetter',
-    51757: 'ALetter',
-    51758: 'ALetter',
-    51759: 'ALetter',
-    51760: 'ALetter',
-    51761: 'ALetter',
-    51762: 'ALetter',
-    51763: 'ALetter',
-    51764: 'ALetter',
-    51765: 'ALetter',
-    51766: 'ALetter',
-    51767: 'ALetter',
-    51768: 'ALetter',
-    51769: 'ALetter',
-    51770: 'ALetter',
-    51771: 'ALetter',
-    51772: 'ALetter',
-    51773: 'ALetter',
-    51774: 'ALetter',
-    51775: 'ALetter',
-    51776: 'ALetter',
-    51777: 'ALetter',
-    51778: 'ALetter',
-    51779: 'ALetter',
-    51780: 'ALetter',
-    51781: 'ALetter',
-    51782: 'ALetter',
-    51783: 'ALetter',
-    51784: 'ALetter',
-    51785: 'ALetter',
-    51786: 'ALetter',
-    51787: 'ALetter',
-    51788: 'ALetter',
-    51789: 'ALetter',
-    51790: 'ALetter',
-    51791: 'ALetter',
-    51792: 'ALetter',
-    51793: 'ALetter',
-    51794: 'ALetter',
-    51795: 'ALetter',
-    51796: 'ALetter',
-    51797: 'ALetter',
-    51798: 'ALetter',
-    51799: 'ALetter',
-    51800: 'ALetter',
-    51801: 'ALetter',
-    51802: 'ALetter',
-    51803: 'ALetter',
-    51804: 'ALetter',
-    51805: 'ALetter',
-    51806: 'ALetter',
-    51807: 'ALetter',
-    51808: 'ALetter',
-    51809: 'ALetter',
-    51810: 'ALetter',
-    51811: 'ALetter',
-    51812: 'ALetter',
-    51813: 'ALetter',
-    51814: 'ALetter',
-    51815: 'ALetter',
-    51816: 'ALetter',
-    51817: 'ALetter',
-    51818: 'ALetter',
-    51819: 'ALetter',
-    51820: 'ALetter',
-    51821: 'ALetter',
-    51822: 'ALetter',
-    51823: 'ALetter',
-    51824: 'ALetter',
-    51825: 'ALetter',
-    51826: 'ALetter',
-    51827: 'ALetter',
-    51828: 'ALetter',
-    51829: 'ALetter',
-    51830: 'ALetter',
-    51831: 'ALetter',
-    51832: 'ALetter',
-    51833: 'ALetter',
-    51834: 'ALetter',
-    51835: 'ALetter',
-    51836: 'ALetter',
-    51837: 'ALetter',
-    51838: 'ALetter',
-    51839: 'ALetter',
-    51840: 'ALetter',
-    51841: 'ALetter',
-    51842: 'ALetter',
-    51843: 'ALetter',
-    51844: 'ALetter',
-    51845: 'ALetter',
-    51846: 'ALetter',
-    51847: 'ALetter',
-    51848: 'ALetter',
-    51849: 'ALetter',
-    51850: 'ALetter',
-    51851: 'ALetter',
-    51852: 'ALetter',
-    51853: 'ALetter',
-    51854: 'ALetter',
-    51855: 'ALetter',
-    51856: 'ALetter',
-    51857: 'ALetter',
-    51858: 'ALetter',
-    51859: 'ALetter',
-    51860: 'ALetter',
-    51861: 'ALetter',
-    51862: 'ALetter',
-    51863: 'ALetter',
-    51864: 'ALetter',
-    51865: 'ALetter',
-    51866: 'ALetter',
-    51867: 'ALetter',
-    51868: 'ALetter',
-    51869: 'ALetter',
-    51870: 'ALetter',
-    51871: 'ALetter',
-    51872: 'ALetter',
-    51873: 'ALetter',
-    51874: 'ALetter',
-    51875: 'ALetter',
-    51876: 'ALetter',
-    51877: 'ALetter',
-    51878: 'ALetter',
-    51879: 'ALetter',
-    51880: 'ALetter',
-    51881: 'ALetter',
-    51882: 'ALetter',
-    51883: 'ALetter',
-    51884: 'ALetter',
-    51885: 'ALetter',
-    51886: 'ALetter',
-    51887: 'ALetter',
-    51888: 'ALetter',
-    51889: 'ALetter',
-    51890: 'ALetter',
-    51891: 'ALetter',
-    51892: 'ALetter',
-    51893: 'ALetter',
-    51894: 'ALetter',
-    51895: 'ALetter',
-    51896: 'ALetter',
-    51897: 'ALetter',
-    51898: 'ALetter',
-    51899: 'ALetter',
-    51900: 'ALetter',
-    51901: 'ALetter',
-    51902: 'ALetter',
-    51903: 'ALetter',
-    51904: 'ALetter',
-    51905: 'ALetter',
-    51906: 'ALetter',
-    51907: 'ALetter',
-    51908: 'ALetter',
-    51909: 'ALetter',
-    51910: 'ALetter',
-    51911: 'ALetter',
-    51912: 'ALetter',
-    51913: 'ALetter',
-    51914: 'ALetter',
-    51915: 'ALetter',
-    51916: 'ALetter',
-    51917: 'ALetter',
-    51918: 'ALetter',
-    51919: 'ALetter',
-    51920: 'ALetter',
-    51921: 'ALetter',
-    51922: 'ALetter',
-    51923: 'ALetter',
-    51924: 'ALetter',
-    51925: 'ALetter',
-    51926: 'ALetter',
-    51927: 'ALetter',
-    51928: 'ALetter',
-    51929: 'ALetter',
-    51930: 'ALetter',
-    51931: 'ALetter',
-    51932: 'ALetter',
-    51933: 'ALetter',
-    51934: 'ALetter',
-    51935: 'ALetter',
-    51936: 'ALetter',
-    51937: 'ALetter',
-    51938: 'ALetter',
-    51939: 'ALetter',
-    51940: 'ALetter',
-    51941: 'ALetter',
-    51942: 'ALetter',
-    51943: 'ALetter',
-    51944: 'ALetter',
-    51945: 'ALetter',
-    51946: 'ALetter',
-    51947: 'ALetter',
-    51948: 'ALetter',
-    51949: 'ALetter',
-    51950: 'ALetter',
-    51951: 'ALetter',
-    51952: 'ALetter',
-    51953: 'ALetter',
-    51954: 'ALetter',
-    51955: 'ALetter',
-    51956: 'ALetter',
-    51957: 'ALetter',
-    51958: 'ALetter',
-    51959: 'ALetter',
-    51960: 'ALetter',
-    51961: 'ALetter',
-    51962: 'ALetter',
-    51963: 'ALetter',
-    51964: 'ALetter',
-    51965: 'ALetter',
-    51966: 'ALetter',
-    51967: 'ALetter',
-    51968: 'ALetter',
-    51969: 'ALetter',
-    51970: 'ALetter',
-    51971: 'ALetter',
-    51972: 'ALetter',
-    51973: 'ALetter',
-    51974: 'ALetter',
-    51975: 'ALetter',
-    51976: 'ALetter',
-    51977: 'ALetter',
-    51978: 'ALetter',
-    51979: 'ALetter',
-    51980: 'ALetter',
-    51981: 'ALetter',
-    51982: 'ALetter',
-    51983: 'ALetter',
-    51984: 'ALetter',
-    51985: 'ALetter',
-    51986: 'ALetter',
-    51987: 'ALetter',
-    51988: 'ALetter',
-    51989: 'ALetter',
-    51990: 'ALetter',
-    51991: 'ALetter',
-    51992: 'ALetter',
-    51993: 'ALetter',
-    51994: 'ALetter',
-    51995: 'ALetter',
-    51996: 'ALetter',
-    51997: 'ALetter',
-    51998: 'ALetter',
-    51999: 'ALetter',
-    52000: 'ALetter',
-    52001: 'ALetter',
-    52002: 'ALetter',
-    52003: 'ALetter',
-    52004: 'ALetter',
-    52005: 'ALetter',
-    52006: 'ALetter',
-    52007: 'ALetter',
-    52008: 'ALetter',
-    52009: 'ALetter',
-    52010: 'ALetter',
-    52011: 'ALetter',
-    52012: 'ALetter',
-    52013: 'ALetter',
-    52014: 'ALetter',
-    52015: 'ALetter',
-    52016: 'ALetter',
-    52017: 'ALetter',
-    52018: 'ALetter',
-    52019: 'ALetter',
-    52020: 'ALetter',
-    52021: 'ALetter',
-    52022: 'ALetter',
-    52023: 'ALetter',
-    52024: 'ALetter',
-    52025: 'ALetter',
-    52026: 'ALetter',
-    52027: 'ALetter',
-    52028: 'ALetter',
-    52029: 'ALetter',
-    52030: 'ALetter',
-    52031: 'ALetter',
-    52032: 'ALetter',
-    52033: 'ALetter',
-    52034: 'ALetter',
-    52035: 'ALetter',
-    52036: 'ALetter',
-    52037: 'ALetter',
-    52038: 'ALetter',
-    52039: 'ALetter',
-    52040: 'ALetter',
-    52041: 'ALetter',
-    52042: 'ALetter',
-    52043: 'ALetter',
-    52044: 'ALetter',
-    52045: 'ALetter',
-    52046: 'ALetter',
-    52047: 'ALetter',
-    52048: 'ALetter',
-    52049: 'ALetter',
-    52050: 'ALetter',
-    52051: 'ALetter',
-    52052: 'ALetter',
-    52053: 'ALetter',
-    52054: 'ALetter',
-    52055: 'ALetter',
-    52056: 'ALetter',
-    52057: 'ALetter',
-    52058: 'ALetter',
-    52059: 'ALetter',
-    52060: 'ALetter',
-    52061: 'ALetter',
-    52062: 'ALetter',
-    52063: 'ALetter',
-    52064: 'ALetter',
-    52065: 'ALetter',
-    52066: 'ALetter',
-    52067: 'ALetter',
-    52068: 'ALetter',
-    52069: 'ALetter',
-    52070: 'ALetter',
-    52071: 'ALetter',
-    52072: 'ALetter',
-    52073: 'ALetter',
-    52074: 'ALetter',
-    52075: 'ALetter',
-    52076: 'ALetter',
-    52077: 'ALetter',
-    52078: 'ALetter',
-    52079: 'ALetter',
-    52080: 'ALetter',
-    52081: 'ALetter',
-    52082: 'ALetter',
-    52083: 'ALetter',
-    52084: 'ALetter',
-    52085: 'ALetter',
-    52086: 'ALetter',
-    52087: 'ALetter',
-    52088: 'ALetter',
-    52089: 'ALetter',
-    52090: 'ALetter',
-    52091: 'ALetter',
-    52092: 'ALetter',
-    52093: 'ALetter',
-    52094: 'ALetter',
-    52095: 'ALetter',
-    52096: 'ALetter',
-    52097: 'ALetter',
-    52098: 'ALetter',
-    52099: 'ALetter',
-    52100: 'ALetter',
-    52101: 'ALetter',
-    52102: 'ALetter',
-    52103: 'ALetter',
-    52104: 'ALetter',
-    52105: 'ALetter',
-    52106: 'ALetter',
-    52107: 'ALetter',
-    52108: 'ALetter',
-    52109: 'ALetter',
-    52110: 'ALetter',
-    52111: 'ALetter',
-    52112: 'ALetter',
-    52113: 'ALetter',
-    52114: 'ALetter',
-    52115: 'ALetter',
-    52116: 'ALetter',
-    52117: 'ALetter',
-    52118: 'ALetter',
-    52119: 'ALetter',
-    52120: 'ALetter',
-    52121: 'ALetter',
-    52122: 'ALetter',
-    52123: 'ALetter',
-    52124: 'ALetter',
-    52125: 'ALetter',
-    52126: 'ALetter',
-    52127: 'ALetter',
-    52128: 'ALetter',
-    52129: 'ALetter',
-    52130: 'ALetter',
-    52131: 'ALetter',
-    52132: 'ALetter',
-    52133: 'ALetter',
-    52134: 'ALetter',
-    52135: 'ALetter',
-    52136: 'ALetter',
-    52137: 'ALetter',
-    52138: 'ALetter',
-    52139: 'ALetter',
-    52140: 'ALetter',
-    52141: 'ALetter',
-    52142: 'ALetter',
-    52143: 'ALetter',
-    52144: 'ALetter',
-    52145: 'ALetter',
-    52146: 'ALetter',
-    52147: 'ALetter',
-    52148: 'ALetter',
-    52149: 'ALetter',
-    52150: 'ALetter',
-    52151: 'ALetter',
-    52152: 'ALetter',
-    52153: 'ALetter',
-    52154: 'ALetter',
-    52155: 'ALetter',
-    52156: 'ALetter',
-    52157: 'ALetter',
-    52158: 'ALetter',
-    52159: 'ALetter',
-    52160: 'ALetter',
-    52161: 'ALetter',
-    52162: 'ALetter',
-    52163: 'ALetter',
-    52164: 'ALetter',
-    52165: 'ALetter',
-    52166: 'ALetter',
-    52167: 'ALetter',
-    52168: 'ALetter',
-    52169: 'ALetter',
-    52170: 'ALetter',
-    52171: 'ALetter',
-    52172: 'ALetter',
-    52173: 'ALetter',
-    52174: 'ALetter',
-    52175: 'ALetter',
-    52176: 'ALetter',
-    52177: 'ALetter',
-    52178: 'ALetter',
-    52179: 'ALetter',
-    52180: 'ALetter',
-    52181: 'ALetter',
-    52182: 'ALetter',
-    52183: 'ALetter',
-    52184: 'ALetter',
-    52185: 'ALetter',
-    52186: 'ALetter',
-    52187: 'ALetter',
-    52188: 'ALetter',
-    52189: 'ALetter',
-    52190: 'ALetter',
-    52191: 'ALetter',
-    52192: 'ALetter',
-    52193: 'ALetter',
-    52194: 'ALetter',
-    52195: 'ALetter',
-    52196: 'ALetter',
-    52197: 'ALetter',
-    52198: 'ALetter',
-    52199: 'ALetter',
-    52200: 'ALetter',
-    52201: 'ALetter',
-    52202: 'ALetter',
-    52203: 'ALetter',
-    52204: 'ALetter',
-    52205: 'ALetter',
-    52206: 'ALetter',
-    52207: 'ALetter',
-    52208: 'ALetter',
-    52209: 'ALetter',
-    52210: 'ALetter',
-    52211: 'ALetter',
-    52212: 'ALetter',
-    52213: 'ALetter',
-    52214: 'ALetter',
-    52215: 'ALetter',
-    52216: 'ALetter',
-    52217: 'ALetter',
-    52218: 'ALetter',
-    52219: 'ALetter',
-    52220: 'ALetter',
-    52221: 'ALetter',
-    52222: 'ALetter',
-    52223: 'ALetter',
-    52224: 'ALetter',
-    52225: 'ALetter',
-    52226: 'ALetter',
-    52227: 'ALetter',
-    52228: 'ALetter',
-    52229: 'ALetter',
-    52230: 'ALetter',
-    52231: 'ALetter',
-    52232: 'ALetter',
-    52233: 'ALetter',
-    52234: 'ALetter',
-    52235: 'ALetter',
-    52236: 'ALetter',
-    52237: 'ALetter',
-    52238: 'ALetter',
-    52239: 'ALetter',
-    52240: 'ALetter',
-    52241: 'ALetter',
-    52242: 'ALetter',
-    52243: 'ALetter',
-    52244: 'ALetter',
-    52245: 'ALetter',
-    52246: 'ALetter',
-    52247: 'ALetter',
-    52248: 'ALetter',
-    52249: 'ALetter',
-    52250: 'ALetter',
-    52251: 'ALetter',
-    52252: 'ALetter',
-    52253: 'ALetter',
-    52254: 'ALetter',
-    52255: 'ALetter',
-    52256: 'ALetter',
-    52257: 'ALetter',
-    52258: 'ALetter',
-    52259: 'ALetter',
-    52260: 'ALetter',
-    52261: 'ALetter',
-    52262: 'ALetter',
-    52263: 'ALetter',
-    52264: 'ALetter',
-    52265: 'ALetter',
-    52266: 'ALetter',
-    52267: 'ALetter',
-    52268: 'ALetter',
-    52269: 'ALetter',
-    52270: 'ALetter',
-    52271: 'ALetter',
-    52272: 'ALetter',
-    52273: 'ALetter',
-    52274: 'ALetter',
-    52275: 'ALetter',
-    52276: 'ALetter',
-    52277: 'ALetter',
-    52278: 'ALetter',
-    52279: 'ALetter',
-    52280: 'ALetter',
-    52281: 'ALetter',
-    52282: 'ALetter',
-    52283: 'ALetter',
-    52284: 'ALetter',
-    52285: 'ALetter',
-    52286: 'ALetter',
-    52287: 'ALetter',
-    52288: 'ALetter',
-    52289: 'ALetter',
-    52290: 'ALetter',
-    52291: 'ALetter',
-    52292: 'ALetter',
-    52293: 'ALetter',
-    52294: 'ALetter',
-    52295: 'ALetter',
-    52296: 'ALetter',
-    52297: 'ALetter',
-    52298: 'ALetter',
-    52299: 'ALetter',
-    52300: 'ALetter',
-    52301: 'ALetter',
-    52302: 'ALetter',
-    52303: 'ALetter',
-    52304: 'ALetter',
-    52305: 'ALetter',
-    52306: 'ALetter',
-    52307: 'ALetter',
-    52308: 'ALetter',
-    52309: 'ALetter',
-    52310: 'ALetter',
-    52311: 'ALetter',
-    52312: 'ALetter',
-    52313: 'ALetter',
-    52314: 'ALetter',
-    52315: 'ALetter',
-    52316: 'ALetter',
-    52317: 'ALetter',
-    52318: 'ALetter',
-    52319: 'ALetter',
-    52320: 'ALetter',
-    52321: 'ALetter',
-    52322: 'ALetter',
-    52323: 'ALetter',
-    52324: 'ALetter',
-    52325: 'ALetter',
-    52326: 'ALetter',
-    52327: 'ALetter',
-    52328: 'ALetter',
-    52329: 'ALetter',
-    52330: 'ALetter',
-    52331: 'ALetter',
-    52332: 'ALetter',
-    52333: 'ALetter',
-    52334: 'ALetter',
-    52335: 'ALetter',
-    52336: 'ALetter',
-    52337: 'ALetter',
-    52338: 'ALetter',
-    52339: 'ALetter',
-    52340: 'ALetter',
-    52341: 'ALetter',
-    52342: 'ALetter',
-    52343: 'ALetter',
-    52344: 'ALetter',
-    52345: 'ALetter',
-    52346: 'ALetter',
-    52347: 'ALetter',
-    52348: 'ALetter',
-    52349: 'ALetter',
-    52350: 'ALetter',
-    52351: 'ALetter',
-    52352: 'ALetter',
-    52353: 'ALetter',
-    52354: 'ALetter',
-    52355: 'ALetter',
-    52356: 'ALetter',
-    52357: 'ALetter',
-    52358: 'ALetter',
-    52359: 'ALetter',
-    52360: 'ALetter',
-    52361: 'ALetter',
-    52362: 'ALetter',
-    52363: 'ALetter',
-    52364: 'ALetter',
-    52365: 'ALetter',
-    52366: 'ALetter',
-    52367: 'ALetter',
-    52368: 'ALetter',
-    52369: 'ALetter',
-    52370: 'ALetter',
-    52371: 'ALetter',
-    52372: 'ALetter',
-    52373: 'ALetter',
-    52374: 'ALetter',
-    52375: 'ALetter',
-    52376: 'ALetter',
-    52377: 'ALetter',
-    52378: 'ALetter',
-    52379: 'ALetter',
-    52380: 'ALetter',
-    52381: 'ALetter',
-    52382: 'ALetter',
-    52383: 'ALetter',
-    52384: 'ALetter',
-    52385: 'ALetter',
-    52386: 'ALetter',
-    52387: 'ALetter',
-    52388: 'ALetter',
-    52389: 'ALetter',
-    52390: 'ALetter',
-    52391: 'ALetter',
-    52392: 'ALetter',
-    52393: 'ALetter',
-    52394: 'ALetter',
-    52395: 'ALetter',
-    52396: 'ALetter',
-    52397: 'ALetter',
-    52398: 'ALetter',
-    52399: 'ALetter',
-    52400: 'ALetter',
-    52401: 'ALetter',
-    52402: 'ALetter',
-    52403: 'ALetter',
-    52404: 'ALetter',
-    52405: 'ALetter',
-    52406: 'ALetter',
-    52407: 'ALetter',
-    52408: 'ALetter',
-    52409: 'ALetter',
-    52410: 'ALetter',
-    52411: 'ALetter',
-    52412: 'ALetter',
-    52413: 'ALetter',
-    52414: 'ALetter',
-    52415: 'ALetter',
-    52416: 'ALetter',
-    52417: 'ALetter',
-    52418: 'ALetter',
-    52419: 'ALetter',
-    52420: 'ALetter',
-    52421: 'ALetter',
-    52422: 'ALetter',
-    52423: 'ALetter',
-    52424: 'ALetter',
-    52425: 'ALetter',
-    52426: 'ALetter',
-    52427: 'ALetter',
-    52428: 'ALetter',
-    52429: 'ALetter',
-    52430: 'ALetter',
-    52431: 'ALetter',
-    52432: 'ALetter',
-    52433: 'ALetter',
-    52434: 'ALetter',
-    52435: 'ALetter',
-    52436: 'ALetter',
-    52437: 'ALetter',
-    52438: 'ALetter',
-    52439: 'ALetter',
-    52440: 'ALetter',
-    52441: 'ALetter',
-    52442: 'ALetter',
-    52443: 'ALetter',
-    52444: 'ALetter',
-    52445: 'ALetter',
-    52446: 'ALetter',
-    52447: 'ALetter',
-    52448: 'ALetter',
-    52449: 'ALetter',
-    52450: 'ALetter',
-    52451: 'ALetter',
-    52452: 'ALetter',
-    52453: 'ALetter',
-    52454: 'ALetter',
-    52455: 'ALetter',
-    52456: 'ALetter',
-    52457: 'ALetter',
-    52458: 'ALetter',
-    52459: 'ALetter',
-    52460: 'ALetter',
-    52461: 'ALetter',
-    52462: 'ALetter',
-    52463: 'ALetter',
-    52464: 'ALetter',
-    52465: 'ALetter',
-    52466: 'ALetter',
-    52467: 'ALetter',
-    52468: 'ALetter',
-    52469: 'ALetter',
-    52470: 'ALetter',
-    52471: 'ALetter',
-    52472: 'ALetter',
-    52473: 'ALetter',
-    52474: 'ALetter',
-    52475: 'ALetter',
-    52476: 'ALetter',
-    52477: 'ALetter',
-    52478: 'ALetter',
-    52479: 'ALetter',
-    52480: 'ALetter',
-    52481: 'ALetter',
-    52482: 'ALetter',
-    52483: 'ALetter',
-    52484: 'ALetter',
-    52485: 'ALetter',
-    52486: 'ALetter',
-    52487: 'ALetter',
-    52488: 'ALetter',
-    52489: 'ALetter',
-    52490: 'ALetter',
-    52491: 'ALetter',
-    52492: 'ALetter',
-    52493: 'ALetter',
-    52494: 'ALetter',
-    52495: 'ALetter',
-    52496: 'ALetter',
-    52497: 'ALetter',
-    52498: 'ALetter',
-    52499: 'ALetter',
-    52500: 'ALetter',
-    52501: 'ALetter',
-    52502: 'ALetter',
-    52503: 'ALetter',
-    52504: 'ALetter',
-    52505: 'ALetter',
-    52506: 'ALetter',
-    52507: 'ALetter',
-    52508: 'ALetter',
-    52509: 'ALetter',
-    52510: 'ALetter',
-    52511: 'ALetter',
-    52512: 'ALetter',
-    52513: 'ALetter',
-    52514: 'ALetter',
-    52515: 'ALetter',
-    52516: 'ALetter',
-    52517: 'ALetter',
-    52518: 'ALetter',
-    52519: 'ALetter',
-    52520: 'ALetter',
-    52521: 'ALetter',
-    52522: 'ALetter',
-    52523: 'ALetter',
-    52524: 'ALetter',
-    52525: 'ALetter',
-    52526: 'ALetter',
-    52527: 'ALetter',
-    52528: 'ALetter',
-    52529: 'ALetter',
-    52530: 'ALetter',
-    52531: 'ALetter',
-    52532: 'ALetter',
-    52533: 'ALetter',
-    52534: 'ALetter',
-    52535: 'ALetter',
-    52536: 'ALetter',
-    52537: 'ALetter',
-    52538: 'ALetter',
-    52539: 'ALetter',
-    52540: 'ALetter',
-    52541: 'ALetter',
-    52542: 'ALetter',
-    52543: 'ALetter',
-    52544: 'ALetter',
-    52545: 'ALetter',
-    52546: 'ALetter',
-    52547: 'ALetter',
-    52548: 'ALetter',
-    52549: 'ALetter',
-    52550: 'ALetter',
-    52551: 'ALetter',
-    52552: 'ALetter',
-    52553: 'ALetter',
-    52554: 'ALetter',
-    52555: 'ALetter',
-    52556: 'ALetter',
-    52557: 'ALetter',
-    52558: 'ALetter',
-    52559: 'ALetter',
-    52560: 'ALetter',
-    52561: 'ALetter',
-    52562: 'ALetter',
-    52563: 'ALetter',
-    52564: 'ALetter',
-    52565: 'ALetter',
-    52566: 'ALetter',
-    52567: 'ALetter',
-    52568: 'ALetter',
-    52569: 'ALetter',
-    52570: 'ALetter',
-    52571: 'ALetter',
-    52572: 'ALetter',
-    52573: 'ALetter',
-    52574: 'ALetter',
-    52575: 'ALetter',
-    52576: 'ALetter',
-    52577: 'ALetter',
-    52578: 'ALetter',
-    52579: 'ALetter',
-    52580: 'ALetter',
-    52581: 'ALetter',
-    52582: 'ALetter',
-    52583: 'ALetter',
-    52584: 'ALetter',
-    52585: 'ALetter',
-    52586: 'ALetter',
-    52587: 'ALetter',
-    52588: 'ALetter',
-    52589: 'ALetter',
-    52590: 'ALetter',
-    52591: 'ALetter',
-    52592: 'ALetter',
-    52593: 'ALetter',
-    52594: 'ALetter',
-    52595: 'ALetter',
-    52596: 'ALetter',
-    52597: 'ALetter',
-    52598: 'ALetter',
-    52599: 'ALetter',
-    52600: 'ALetter',
-    52601: 'ALetter',
-    52602: 'ALetter',
-    52603: 'ALetter',
-    52604: 'ALetter',
-    52605: 'ALetter',
-    52606: 'ALetter',
-    52607: 'ALetter',
-    52608: 'ALetter',
-    52609: 'ALetter',
-    52610: 'ALetter',
-    52611: 'ALetter',
-    52612: 'ALetter',
-    52613: 'ALetter',
-    52614: 'ALetter',
-    52615: 'ALetter',
-    52616: 'ALetter',
-    52617: 'ALetter',
-    52618: 'ALetter',
-    52619: 'ALetter',
-    52620: 'ALetter',
-    52621: 'ALetter',
-    52622: 'ALetter',
-    52623: 'ALetter',
-    52624: 'ALetter',
-    52625: 'ALetter',
-    52626: 'ALetter',
-    52627: 'ALetter',
-    52628: 'ALetter',
-    52629: 'ALetter',
-    52630: 'ALetter',
-    52631: 'ALetter',
-    52632: 'ALetter',
-    52633: 'ALetter',
-    52634: 'ALetter',
-    52635: 'ALetter',
-    52636: 'ALetter',
-    52637: 'ALetter',
-    52638: 'ALetter',
-    52639: 'ALetter',
-    52640: 'ALetter',
-    52641: 'ALetter',
-    52642: 'ALetter',
-    52643: 'ALetter',
-    52644: 'ALetter',
-    52645: 'ALetter',
-    52646: 'ALetter',
-    52647: 'ALetter',
-    52648: 'ALetter',
-    52649: 'ALetter',
-    52650: 'ALetter',
-    52651: 'ALetter',
-    52652: 'ALetter',
-    52653: 'ALetter',
-    52654: 'ALetter',
-    52655: 'ALetter',
-    52656: 'ALetter',
-    52657: 'ALetter',
-    52658: 'ALetter',
-    52659: 'ALetter',
-    52660: 'ALetter',
-    52661: 'ALetter',
-    52662: 'ALetter',
-    52663: 'ALetter',
-    52664: 'ALetter',
-    52665: 'ALetter',
-    52666: 'ALetter',
-    52667: 'ALetter',
-    52668: 'ALetter',
-    52669: 'ALetter',
-    52670: 'ALetter',
-    52671: 'ALetter',
-    52672: 'ALetter',
-    52673: 'ALetter',
-    52674: 'ALetter',
-    52675: 'ALetter',
-    52676: 'ALetter',
-    52677: 'ALetter',
-    52678: 'ALetter',
-    52679: 'ALetter',
-    52680: 'ALetter',
-    52681: 'ALetter',
-    52682: 'ALetter',
-    52683: 'ALetter',
-    52684: 'ALetter',
-    52685: 'ALetter',
-    52686: 'ALetter',
-    52687: 'ALetter',
-    52688: 'ALetter',
-    52689: 'ALetter',
-    52690: 'ALetter',
-    52691: 'ALetter',
-    52692: 'ALetter',
-    52693: 'ALetter',
-    52694: 'ALetter',
-    52695: 'ALetter',
-    52696: 'ALetter',
-    52697: 'ALetter',
-    52698: 'ALetter',
-    52699: 'ALetter',
-    52700: 'ALetter',
-    52701: 'ALetter',
-    52702: 'ALetter',
-    52703: 'ALetter',
-    52704: 'ALetter',
-    52705: 'ALetter',
-    52706: 'ALetter',
-    52707: 'ALetter',
-    52708: 'ALetter',
-    52709: 'ALetter',
-    52710: 'ALetter',
-    52711: 'ALetter',
-    52712: 'ALetter',
-    52713: 'ALetter',
-    52714: 'ALetter',
-    52715: 'ALetter',
-    52716: 'ALetter',
-    52717: 'ALetter',
-    52718: 'ALetter',
-    52719: 'ALetter',
-    52720: 'ALetter',
-    52721: 'ALetter',
-    52722: 'ALetter',
-    52723: 'ALetter',
-    52724: 'ALetter',
-    52725: 'ALetter',
-    52726: 'ALetter',
-    52727: 'ALetter',
-    52728: 'ALetter',
-    52729: 'ALetter',
-    52730: 'ALetter',
-    52731: 'ALetter',
-    52732: 'ALetter',
-    52733: 'ALetter',
-    52734: 'ALetter',
-    52735: 'ALetter',
-    52736: 'ALetter',
-    52737: 'ALetter',
-    52738: 'ALetter',
-    52739: 'ALetter',
-    52740: 'ALetter',
-    52741: 'ALetter',
-    52742: 'ALetter',
-    52743: 'ALetter',
-    52744: 'ALetter',
-    52745: 'ALetter',
-    52746: 'ALetter',
-    52747: 'ALetter',
-    52748: 'ALetter',
-    52749: 'ALetter',
-    52750: 'ALetter',
-    52751: 'ALetter',
-    52752: 'ALetter',
-    52753: 'ALetter',
-    52754: 'ALetter',
-    52755: 'ALetter',
-    52756: 'ALetter',
-    52757: 'ALetter',
-    52758: 'ALetter',
-    52759: 'ALetter',
-    52760: 'ALetter',
-    52761: 'ALetter',
-    52762: 'ALetter',
-    52763: 'ALetter',
-    52764: 'ALetter',
-    52765: 'ALetter',
-    52766: 'ALetter',
-    52767: 'ALetter',
-    52768: 'ALetter',
-    52769: 'ALetter',
-    52770: 'ALetter',
-    52771: 'ALetter',
-    52772: 'ALetter',
-    52773: 'ALetter',
-    52774: 'ALetter',
-    52775: 'ALetter',
-    52776: 'ALetter',
-    52777: 'ALetter',
-    52778: 'ALetter',
-    52779: 'ALetter',
-    52780: 'ALetter',
-    52781: 'ALetter',
-    52782: 'ALetter',
-    52783: 'ALetter',
-    52784: 'ALetter',
-    52785: 'ALetter',
-    52786: 'ALetter',
-    52787: 'ALetter',
-    52788: 'ALetter',
-    52789: 'ALetter',
-    52790: 'ALetter',
-    52791: 'ALetter',
-    52792: 'ALetter',
-    52793: 'ALetter',
-    52794: 'ALetter',
-    52795: 'ALetter',
-    52796: 'ALetter',
-    52797: 'ALetter',
-    52798: 'ALetter',
-    52799: 'ALetter',
-    52800: 'ALetter',
-    52801: 'ALetter',
-    52802: 'ALetter',
-    52803: 'ALetter',
-    52804: 'ALetter',
-    52805: 'ALetter',
-    52806: 'ALetter',
-    52807: 'ALetter',
-    52808: 'ALetter',
-    52809: 'ALetter',
-    52810: 'ALetter',
-    52811: 'ALetter',
-    52812: 'ALetter',
-    52813: 'ALetter',
-    52814: 'ALetter',
-    52815: 'ALetter',
-    52816: 'ALetter',
-    52817: 'ALetter',
-    52818: 'ALetter',
-    52819: 'ALetter',
-    52820: 'ALetter',
-    52821: 'ALetter',
-    52822: 'ALetter',
-    52823: 'ALetter',
-    52824: 'ALetter',
-    52825: 'ALetter',
-    52826: 'ALetter',
-    52827: 'ALetter',
-    52828: 'ALetter',
-    52829: 'ALetter',
-    52830: 'ALetter',
-    52831: 'ALetter',
-    52832: 'ALetter',
-    52833: 'ALetter',
-    52834: 'ALetter',
-    52835: 'ALetter',
-    52836: 'ALetter',
-    52837: 'ALetter',
-    52838: 'ALetter',
-    52839: 'ALetter',
-    52840: 'ALetter',
-    52841: 'ALetter',
-    52842: 'ALetter',
-    52843: 'ALetter',
-    52844: 'ALetter',
-    52845: 'ALetter',
-    52846: 'ALetter',
-    52847: 'ALetter',
-    52848: 'ALetter',
-    52849: 'ALetter',
-    52850: 'ALetter',
-    52851: 'ALetter',
-    52852: 'ALetter',
-    52853: 'ALetter',
-    52854: 'ALetter',
-    52855: 'ALetter',
-    52856: 'ALetter',
-    52857: 'ALetter',
-    52858: 'ALetter',
-    52859: 'ALetter',
-    52860: 'ALetter',
-    52861: 'ALetter',
-    52862: 'ALetter',
-    52863: 'ALetter',
-    52864: 'ALetter',
-    52865: 'ALetter',
-    52866: 'ALetter',
-    52867: 'ALetter',
-    52868: 'ALetter',
-    52869: 'ALetter',
-    52870: 'ALetter',
-    52871: 'ALetter',
-    52872: 'ALetter',
-    52873: 'ALetter',
-    52874: 'ALetter',
-    52875: 'ALetter',
-    52876: 'ALetter',
-    52877: 'ALetter',
-    52878: 'ALetter',
-    52879: 'ALetter',
-    52880: 'ALetter',
-    52881: 'ALetter',
-    52882: 'ALetter',
-    52883: 'ALetter',
-    52884: 'ALetter',
-    52885: 'ALetter',
-    52886: 'ALetter',
-    52887: 'ALetter',
-    52888: 'ALetter',
-    52889: 'ALetter',
-    52890: 'ALetter',
-    52891: 'ALetter',
-    52892: 'ALetter',
-    52893: 'ALetter',
-    52894: 'ALetter',
-    52895: 'ALetter',
-    52896: 'ALetter',
-    52897: 'ALetter',
-    52898: 'ALetter',
-    52899: 'ALetter',
-    52900: 'ALetter',
-    52901: 'ALetter',
-    52902: 'ALetter',
-    52903: 'ALetter',
-    52904: 'ALetter',
-    52905: 'ALetter',
-    52906: 'ALetter',
-    52907: 'ALetter',
-    52908: 'ALetter',
-    52909: 'ALetter',
-    52910: 'ALetter',
-    52911: 'ALetter',
-    52912: 'ALetter',
-    52913: 'ALetter',
-    52914: 'ALetter',
-    52915: 'ALetter',
-    52916: 'ALetter',
-    52917: 'ALetter',
-    52918: 'ALetter',
-    52919: 'ALetter',
-    52920: 'ALetter',
-    52921: 'ALetter',
-    52922: 'ALetter',
-    52923: 'ALetter',
-    52924: 'ALetter',
-    52925: 'ALetter',
-    52926: 'ALetter',
-    52927: 'ALetter',
-    52928: 'ALetter',
-    52929: 'ALetter',
-    52930: 'ALetter',
-    52931: 'ALetter',
-    52932: 'ALetter',
-    52933: 'ALetter',
-    52934: 'ALetter',
-    52935: 'ALetter',
-    52936: 'ALetter',
-    52937: 'ALetter',
-    52938: 'ALetter',
-    52939: 'ALetter',
-    52940: 'ALetter',
-    52941: 'ALetter',
-    52942: 'ALetter',
-    52943: 'ALetter',
-    52944: 'ALetter',
-    52945: 'ALetter',
-    52946: 'ALetter',
-    52947: 'ALetter',
-    52948: 'ALetter',
-    52949: 'ALetter',
-    52950: 'ALetter',
-    52951: 'ALetter',
-    52952: 'ALetter',
-    52953: 'ALetter',
-    52954: 'ALetter',
-    52955: 'ALetter',
-    52956: 'ALetter',
-    52957: 'ALetter',
-    52958: 'ALetter',
-    52959: 'ALetter',
-    52960: 'ALetter',
-    52961: 'ALetter',
-    52962: 'ALetter',
-    52963: 'ALetter',
-    52964: 'ALetter',
-    52965: 'ALetter',
-    52966: 'ALetter',
-    52967: 'ALetter',
-    52968: 'ALetter',
-    52969: 'ALetter',
-    52970: 'ALetter',
-    52971: 'ALetter',
-    52972: 'ALetter',
-    52973: 'ALetter',
-    52974: 'ALetter',
-    52975: 'ALetter',
-    52976: 'ALetter',
-    52977: 'ALetter',
-    52978: 'ALetter',
-    52979: 'ALetter',
-    52980: 'ALetter',
-    52981: 'ALetter',
-    52982: 'ALetter',
-    52983: 'ALetter',
-    52984: 'ALetter',
-    52985: 'ALetter',
-    52986: 'ALetter',
-    52987: 'ALetter',
-    52988: 'ALetter',
-    52989: 'ALetter',
-    52990: 'ALetter',
-    52991: 'ALetter',
-    52992: 'ALetter',
-    52993: 'ALetter',
-    52994: 'ALetter',
-    52995: 'ALetter',
-    52996: 'ALetter',
-    52997: 'ALetter',
-    52998: 'ALetter',
-    52999: 'ALetter',
-    53000: 'ALetter',
-    53001: 'ALetter',
-    53002: 'ALetter',
-    53003: 'ALetter',
-    53004: 'ALetter',
-    53005: 'ALetter',
-    53006: 'ALetter',
-    53007: 'ALetter',
-    53008: 'ALetter',
-    53009: 'ALetter',
-    53010: 'ALetter',
-    53011: 'ALetter',
-    53012: 'ALetter',
-    53013: 'ALetter',
-    53014: 'ALetter',
-    53015: 'ALetter',
-    53016: 'ALetter',
-    53017: 'ALetter',
-    53018: 'ALetter',
-    53019: 'ALetter',
-    53020: 'ALetter',
-    53021: 'ALetter',
-    53022: 'ALetter',
-    53023: 'ALetter',
-    53024: 'ALetter',
-    53025: 'ALetter',
-    53026: 'ALetter',
-    53027: 'ALetter',
-    53028: 'ALetter',
-    53029: 'ALetter',
-    53030: 'ALetter',
-    53031: 'ALetter',
-    53032: 'ALetter',
-    53033: 'ALetter',
-    53034: 'ALetter',
-    53035: 'ALetter',
-    53036: 'ALetter',
-    53037: 'ALetter',
-    53038: 'ALetter',
-    53039: 'ALetter',
-    53040: 'ALetter',
-    53041: 'ALetter',
-    53042: 'ALetter',
-    53043: 'ALetter',
-    53044: 'ALetter',
-    53045: 'ALetter',
-    53046: 'ALetter',
-    53047: 'ALetter',
-    53048: 'ALetter',
-    53049: 'ALetter',
-    53050: 'ALetter',
-    53051: 'ALetter',
-    53052: 'ALetter',
-    53053: 'ALetter',
-    53054: 'ALetter',
-    53055: 'ALetter',
-    53056: 'ALetter',
-    53057: 'ALetter',
-    53058: 'ALetter',
-    53059: 'ALetter',
-    53060: 'ALetter',
-    53061: 'ALetter',
-    53062: 'ALetter',
-    53063: 'ALetter',
-    53064: 'ALetter',
-    53065: 'ALetter',
-    53066: 'ALetter',
-    53067: 'ALetter',
-    53068: 'ALetter',
-    53069: 'ALetter',
-    53070: 'ALetter',
-    53071: 'ALetter',
-    53072: 'ALetter',
-    53073: 'ALetter',
-    53074: 'ALetter',
-    53075: 'ALetter',
-    53076: 'ALetter',
-    53077: 'ALetter',
-    53078: 'ALetter',
-    53079: 'ALetter',
-    53080: 'ALetter',
-    53081: 'ALetter',
-    53082: 'ALetter',
-    53083: 'ALetter',
-    53084: 'ALetter',
-    53085: 'ALetter',
-    53086: 'ALetter',
-    53087: 'ALetter',
-    53088: 'ALetter',
-    53089: 'ALetter',
-    53090: 'ALetter',
-    53091: 'ALetter',
-    53092: 'ALetter',
-    53093: 'ALetter',
-    53094: 'ALetter',
-    53095: 'ALetter',
-    53096: 'ALetter',
-    53097: 'ALetter',
-    53098: 'ALetter',
-    53099: 'ALetter',
-    53100: 'ALetter',
-    53101: 'ALetter',
-    53102: 'ALetter',
-    53103: 'ALetter',
-    53104: 'ALetter',
-    53105: 'ALetter',
-    53106: 'ALetter',
-    53107: 'ALetter',
-    53108: 'ALetter',
-    53109: 'ALetter',
-    53110: 'ALetter',
-    53111: 'ALetter',
-    53112: 'ALetter',
-    53113: 'ALetter',
-    53114: 'ALetter',
-    53115: 'ALetter',
-    53116: 'ALetter',
-    53117: 'ALetter',
-    53118: 'ALetter',
-    53119: 'ALetter',
-    53120: 'ALetter',
-    53121: 'ALetter',
-    53122: 'ALetter',
-    53123: 'ALetter',
-    53124: 'ALetter',
-    53125: 'ALetter',
-    53126: 'ALetter',
-    53127: 'ALetter',
-    53128: 'ALetter',
-    53129: 'ALetter',
-    53130: 'ALetter',
-    53131: 'ALetter',
-    53132: 'ALetter',
-    53133: 'ALetter',
-    53134: 'ALetter',
-    53135: 'ALetter',
-    53136: 'ALetter',
-    53137: 'ALetter',
-    53138: 'ALetter',
-    53139: 'ALetter',
-    53140: 'ALetter',
-    53141: 'ALetter',
-    53142: 'ALetter',
-    53143: 'ALetter',
-    53144: 'ALetter',
-    53145: 'ALetter',
-    53146: 'ALetter',
-    53147: 'ALetter',
-    53148: 'ALetter',
-    53149: 'ALetter',
-    53150: 'ALetter',
-    53151: 'ALetter',
-    53152: 'ALetter',
-    53153: 'ALetter',
-    53154: 'ALetter',
-    53155: 'ALetter',
-    53156: 'ALetter',
-    53157: 'ALetter',
-    53158: 'ALetter',
-    53159: 'ALetter',
-    53160: 'ALetter',
-    53161: 'ALetter',
-    53162: 'ALetter',
-    53163: 'ALetter',
-    53164: 'ALetter',
-    53165: 'ALetter',
-    53166: 'ALetter',
-    53167: 'ALetter',
-    53168: 'ALetter',
-    53169: 'ALetter',
-    53170: 'ALetter',
-    53171: 'ALetter',
-    53172: 'ALetter',
-    53173: 'ALetter',
-    53174: 'ALetter',
-    53175: 'ALetter',
-    53176: 'ALetter',
-    53177: 'ALetter',
-    53178: 'ALetter',
-    53179: 'ALetter',
-    53180: 'ALetter',
-    53181: 'ALetter',
-    53182: 'ALetter',
-    53183: 'ALetter',
-    53184: 'ALetter',
-    53185: 'ALetter',
-    53186: 'ALetter',
-    53187: 'ALetter',
-    53188: 'ALetter',
-    53189: 'ALetter',
-    53190: 'ALetter',
-    53191: 'ALetter',
-    53192: 'ALetter',
-    53193: 'ALetter',
-    53194: 'ALetter',
-    53195: 'ALetter',
-    53196: 'ALetter',
-    53197: 'ALetter',
-    53198: 'ALetter',
-    53199: 'ALetter',
-    53200: 'ALetter',
-    53201: 'ALetter',
-    53202: 'ALetter',
-    53203: 'ALetter',
-    53204: 'ALetter',
-    53205: 'ALetter',
-    53206: 'ALetter',
-    53207: 'ALetter',
-    53208: 'ALetter',
-    53209: 'ALetter',
-    53210: 'ALetter',
-    53211: 'ALetter',
-    53212: 'ALetter',
-    53213: 'ALetter',
-    53214: 'ALetter',
-    53215: 'ALetter',
-    53216: 'ALetter',
-    53217: 'ALetter',
-    53218: 'ALetter',
-    53219: 'ALetter',
-    53220: 'ALetter',
-    53221: 'ALetter',
-    53222: 'ALetter',
-    53223: 'ALetter',
-    53224: 'ALetter',
-    53225: 'ALetter',
-    53226: 'ALetter',
-    53227: 'ALetter',
-    53228: 'ALetter',
-    53229: 'ALetter',
-    53230: 'ALetter',
-    53231: 'ALetter',
-    53232: 'ALetter',
-    53233: 'ALetter',
-    53234: 'ALetter',
-    53235: 'ALetter',
-    53236: 'ALetter',
-    53237: 'ALetter',
-    53238: 'ALetter',
-    53239: 'ALetter',
-    53240: 'ALetter',
-    53241: 'ALetter',
-    53242: 'ALetter',
-    53243: 'ALetter',
-    53244: 'ALetter',
-    53245: 'ALetter',
-    53246: 'ALetter',
-    53247: 'ALetter',
-    53248: 'ALetter',
-    53249: 'ALetter',
-    53250: 'ALetter',
-    53251: 'ALetter',
-    53252: 'ALetter',
-    53253: 'ALetter',
-    53254: 'ALetter',
-    53255: 'ALetter',
-    53256: 'ALetter',
-    53257: 'ALetter',
-    53258: 'ALetter',
-    53259: 'ALetter',
-    53260: 'ALetter',
-    53261: 'ALetter',
-    53262: 'ALetter',
-    53263: 'ALetter',
-    53264: 'ALetter',
-    53265: 'ALetter',
-    53266: 'ALetter',
-    53267: 'ALetter',
-    53268: 'ALetter',
-    53269: 'ALetter',
-    53270: 'ALetter',
-    53271: 'ALetter',
-    53272: 'ALetter',
-    53273: 'ALetter',
-    53274: 'ALetter',
-    53275: 'ALetter',
-    53276: 'ALetter',
-    53277: 'ALetter',
-    53278: 'ALetter',
-    53279: 'ALetter',
-    53280: 'ALetter',
-    53281: 'ALetter',
-    53282: 'ALetter',
-    53283: 'ALetter',
-    53284: 'ALetter',
-    53285: 'ALetter',
-    53286: 'ALetter',
-    53287: 'ALetter',
-    53288: 'ALetter',
-    53289: 'ALetter',
-    53290: 'ALetter',
-    53291: 'ALetter',
-    53292: 'ALetter',
-    53293: 'ALetter',
-    53294: 'ALetter',
-    53295: 'ALetter',
-    53296: 'ALetter',
-    53297: 'ALetter',
-    53298: 'ALetter',
-    53299: 'ALetter',
-    53300: 'ALetter',
-    53301: 'ALetter',
-    53302: 'ALetter',
-    53303: 'ALetter',
-    53304: 'ALetter',
-    53305: 'ALetter',
-    53306: 'ALetter',
-    53307: 'ALetter',
-    53308: 'ALetter',
-    53309: 'ALetter',
-    53310: 'ALetter',
-    53311: 'ALetter',
-    53312: 'ALetter',
-    53313: 'ALetter',
-    53314: 'ALetter',
-    53315: 'ALetter',
-    53316: 'ALetter',
-    53317: 'ALetter',
-    53318: 'ALetter',
-    53319: 'ALetter',
-    53320: 'ALetter',
-    53321: 'ALetter',
-    53322: 'ALetter',
-    53323: 'ALetter',
-    53324: 'ALetter',
-    53325: 'ALetter',
-    53326: 'ALetter',
-    53327: 'ALetter',
-    53328: 'ALetter',
-    53329: 'ALetter',
-    53330: 'ALetter',
-    53331: 'ALetter',
-    53332: 'ALetter',
-    53333: 'ALetter',
-    53334: 'ALetter',
-    53335: 'ALetter',
-    53336: 'ALetter',
-    53337: 'ALetter',
-    53338: 'ALetter',
-    53339: 'ALetter',
-    53340: 'ALetter',
-    53341: 'ALetter',
-    53342: 'ALetter',
-    53343: 'ALetter',
-    53344: 'ALetter',
-    53345: 'ALetter',
-    53346: 'ALetter',
-    53347: 'ALetter',
-    53348: 'ALetter',
-    53349: 'ALetter',
-    53350: 'ALetter',
-    53351: 'ALetter',
-    53352: 'ALetter',
-    53353: 'ALetter',
-    53354: 'ALetter',
-    53355: 'ALetter',
-    53356: 'ALetter',
-    53357: 'ALetter',
-    53358: 'ALetter',
-    53359: 'ALetter',
-    53360: 'ALetter',
-    53361: 'ALetter',
-    53362: 'ALetter',
-    53363: 'ALetter',
-    53364: 'ALetter',
-    53365: 'ALetter',
-    53366: 'ALetter',
-    53367: 'ALetter',
-    53368: 'ALetter',
-    53369: 'ALetter',
-    53370: 'ALetter',
-    53371: 'ALetter',
-    53372: 'ALetter',
-    53373: 'ALetter',
-    53374: 'ALetter',
-    53375: 'ALetter',
-    53376: 'ALetter',
-    53377: 'ALetter',
-    53378: 'ALetter',
-    53379: 'ALetter',
-    53380: 'ALetter',
-    53381: 'ALetter',
-    53382: 'ALetter',
-    53383: 'ALetter',
-    53384: 'ALetter',
-    53385: 'ALetter',
-    53386: 'ALetter',
-    53387: 'ALetter',
-    53388: 'ALetter',
-    53389: 'ALetter',
-    53390: 'ALetter',
-    53391: 'ALetter',
-    53392: 'ALetter',
-    53393: 'ALetter',
-    53394: 'ALetter',
-    53395: 'ALetter',
-    53396: 'ALetter',
-    53397: 'ALetter',
-    53398: 'ALetter',
-    53399: 'ALetter',
-    53400: 'ALetter',
-    53401: 'ALetter',
-    53402: 'ALetter',
-    53403: 'ALetter',
-    53404: 'ALetter',
-    53405: 'ALetter',
-    53406: 'ALetter',
-    53407: 'ALetter',
-    53408: 'ALetter',
-    53409: 'ALetter',
-    53410: 'ALetter',
-    53411: 'ALetter',
-    53412: 'ALetter',
-    53413: 'ALetter',
-    53414: 'ALetter',
-    53415: 'ALetter',
-    53416: 'ALetter',
-    53417: 'ALetter',
-    53418: 'ALetter',
-    53419: 'ALetter',
-    53420: 'ALetter',
-    53421: 'ALetter',
-    53422: 'ALetter',
-    53423: 'ALetter',
-    53424: 'ALetter',
-    53425: 'ALetter',
-    53426: 'ALetter',
-    53427: 'ALetter',
-    53428: 'ALetter',
-    53429: 'ALetter',
-    53430: 'ALetter',
-    53431: 'ALetter',
-    53432: 'ALetter',
-    53433: 'ALetter',
-    53434: 'ALetter',
-    53435: 'ALetter',
-    53436: 'ALetter',
-    53437: 'ALetter',
-    53438: 'ALetter',
-    53439: 'ALetter',
-    53440: 'ALetter',
-    53441: 'ALetter',
-    53442: 'ALetter',
-    53443: 'ALetter',
-    53444: 'ALetter',
-    53445: 'ALetter',
-    53446: 'ALetter',
-    53447: 'ALetter',
-    53448: 'ALetter',
-    53449: 'ALetter',
-    53450: 'ALetter',
-    53451: 'ALetter',
-    53452: 'ALetter',
-    53453: 'ALetter',
-    53454: 'ALetter',
-    53455: 'ALetter',
-    53456: 'ALetter',
-    53457: 'ALetter',
-    53458: 'ALetter',
-    53459: 'ALetter',
-    53460: 'ALetter',
-    53461: 'ALetter',
-    53462: 'ALetter',
-    53463: 'ALetter',
-    53464: 'ALetter',
-    53465: 'ALetter',
-    53466: 'ALetter',
-    53467: 'ALetter',
-    53468: 'ALetter',
-    53469: 'ALetter',
-    53470: 'ALetter',
-    53471: 'ALetter',
-    53472: 'ALetter',
-    53473: 'ALetter',
-    53474: 'ALetter',
-    53475: 'ALetter',
-    53476: 'ALetter',
-    53477: 'ALetter',
-    53478: 'ALetter',
-    53479: 'ALetter',
-    53480: 'ALetter',
-    53481: 'ALetter',
-    53482: 'ALetter',
-    53483: 'ALetter',
-    53484: 'ALetter',
-    53485: 'ALetter',
-    53486: 'ALetter',
-    53487: 'ALetter',
-    53488: 'ALetter',
-    53489: 'ALetter',
-    53490: 'ALetter',
-    53491: 'ALetter',
-    53492: 'ALetter',
-    53493: 'ALetter',
-    53494: 'ALetter',
-    53495: 'ALetter',
-    53496: 'ALetter',
-    53497: 'ALetter',
-    53498: 'ALetter',
-    53499: 'ALetter',
-    53500: 'ALetter',
-    53501: 'ALetter',
-    53502: 'ALetter',
-    53503: 'ALetter',
-    53504: 'ALetter',
-    53505: 'ALetter',
-    53506: 'ALetter',
-    53507: 'ALetter',
-    53508: 'ALetter',
-    53509: 'ALetter',
-    53510: 'ALetter',
-    53511: 'ALetter',
-    53512: 'ALetter',
-    53513: 'ALetter',
-    53514: 'ALetter',
-    53515: 'ALetter',
-    53516: 'ALetter',
-    53517: 'ALetter',
-    53518: 'ALetter',
-    53519: 'ALetter',
-    53520: 'ALetter',
-    53521: 'ALetter',
-    53522: 'ALetter',
-    53523: 'ALetter',
-    53524: 'ALetter',
-    53525: 'ALetter',
-    53526: 'ALetter',
-    53527: 'ALetter',
-    53528: 'ALetter',
-    53529: 'ALetter',
-    53530: 'ALetter',
-    53531: 'ALetter',
-    53532: 'ALetter',
-    53533: 'ALetter',
-    53534: 'ALetter',
-    53535: 'ALetter',
-    53536: 'ALetter',
-    53537: 'ALetter',
-    53538: 'ALetter',
-    53539: 'ALetter',
-    53540: 'ALetter',
-    53541: 'ALetter',
-    53542: 'ALetter',
-    53543: 'ALetter',
-    53544: 'ALetter',
-    53545: 'ALetter',
-    53546: 'ALetter',
-    53547: 'ALetter',
-    53548: 'ALetter',
-    53549: 'ALetter',
-    53550: 'ALetter',
-    53551: 'ALetter',
-    53552: 'ALetter',
-    53553: 'ALetter',
-    53554: 'ALetter',
-    53555: 'ALetter',
-    53556: 'ALetter',
-    53557: 'ALetter',
-    53558: 'ALetter',
-    53559: 'ALetter',
-    53560: 'ALetter',
-    53561: 'ALetter',
-    53562: 'ALetter',
-    53563: 'ALetter',
-    53564: 'ALetter',
-    53565: 'ALetter',
-    53566: 'ALetter',
-    53567: 'ALetter',
-    53568: 'ALetter',
-    53569: 'ALetter',
-    53570: 'ALetter',
-    53571: 'ALetter',
-    53572: 'ALetter',
-    53573: 'ALetter',
-    53574: 'ALetter',
-    53575: 'ALetter',
-    53576: 'ALetter',
-    53577: 'ALetter',
-    53578: 'ALetter',
-    53579: 'ALetter',
-    53580: 'ALetter',
-    53581: 'ALetter',
-    53582: 'ALetter',
-    53583: 'ALetter',
-    53584: 'ALetter',
-    53585: 'ALetter',
-    53586: 'ALetter',
-    53587: 'ALetter',
-    53588: 'ALetter',
-    53589: 'ALetter',
-    53590: 'ALetter',
-    53591: 'ALetter',
-    53592: 'ALetter',
-    53593: 'ALetter',
-    53594: 'ALetter',
-    53595: 'ALetter',
-    53596: 'ALetter',
-    53597: 'ALetter',
-    53598: 'ALetter',
-    53599: 'ALetter',
-    53600: 'ALetter',
-    53601: 'ALetter',
-    53602: 'ALetter',
-    53603: 'ALetter',
-    53604: 'ALetter',
-    53605: 'ALetter',
-    53606: 'ALetter',
-    53607: 'ALetter',
-    53608: 'ALetter',
-    53609: 'ALetter',
-    53610: 'ALetter',
-    53611: 'ALetter',
-    53612: 'ALetter',
-    53613: 'ALetter',
-    53614: 'ALetter',
-    53615: 'ALetter',
-    53616: 'ALetter',
-    53617: 'ALetter',
-    53618: 'ALetter',
-    53619: 'ALetter',
-    53620: 'ALetter',
-    53621: 'ALetter',
-    53622: 'ALetter',
-    53623: 'ALetter',
-    53624: 'ALetter',
-    53625: 'ALetter',
-    53626: 'ALetter',
-    53627: 'ALetter',
-    53628: 'ALetter',
-    53629: 'ALetter',
-    53630: 'ALetter',
-    53631: 'ALetter',
-    53632: 'ALetter',
-    53633: 'ALetter',
-    53634: 'ALetter',
-    53635: 'ALetter',
-    53636: 'ALetter',
-    53637: 'ALetter',
-    53638: 'ALetter',
-    53639: 'ALetter',
-    53640: 'ALetter',
-    53641: 'ALetter',
-    53642: 'ALetter',
-    53643: 'ALetter',
-    53644: 'ALetter',
-    53645: 'ALetter',
-    53646: 'ALetter',
-    53647: 'ALetter',
-    53648: 'ALetter',
-    53649: 'ALetter',
-    53650: 'ALetter',
-    53651: 'ALetter',
-    53652: 'ALetter',
-    53653: 'ALetter',
-    53654: 'ALetter',
-    53655: 'ALetter',
-    53656: 'ALetter',
-    53657: 'ALetter',
-    53658: 'ALetter',
-    53659: 'ALetter',
-    53660: 'ALetter',
-    53661: 'ALetter',
-    53662: 'ALetter',
-    53663: 'ALetter',
-    53664: 'ALetter',
-    53665: 'ALetter',
-    53666: 'ALetter',
-    53667: 'ALetter',
-    53668: 'ALetter',
-    53669: 'ALetter',
-    53670: 'ALetter',
-    53671: 'ALetter',
-    53672: 'ALetter',
-    53673: 'ALetter',
-    53674: 'ALetter',
-    53675: 'ALetter',
-    53676: 'ALetter',
-    53677: 'ALetter',
-    53678: 'ALetter',
-    53679: 'ALetter',
-    53680: 'ALetter',
-    53681: 'ALetter',
-    53682: 'ALetter',
-    53683: 'ALetter',
-    53684: 'ALetter',
-    53685: 'ALetter',
-    53686: 'ALetter',
-    53687: 'ALetter',
-    53688: 'ALetter',
-    53689: 'ALetter',
-    53690: 'ALetter',
-    53691: 'ALetter',
-    53692: 'ALetter',
-    53693: 'ALetter',
-    53694: 'ALetter',
-    53695: 'ALetter',
-    53696: 'ALetter',
-    53697: 'ALetter',
-    53698: 'ALetter',
-    53699: 'ALetter',
-    53700: 'ALetter',
-    53701: 'ALetter',
-    53702: 'ALetter',
-    53703: 'ALetter',
-    53704: 'ALetter',
-    53705: 'ALetter',
-    53706: 'ALetter',
-    53707: 'ALetter',
-    53708: 'ALetter',
-    53709: 'ALetter',
-    53710: 'ALetter',
-    53711: 'ALetter',
-    53712: 'ALetter',
-    53713: 'ALetter',
-    53714: 'ALetter',
-    53715: 'ALetter',
-    53716: 'ALetter',
-    53717: 'ALetter',
-    53718: 'ALetter',
-    53719: 'ALetter',
-    53720: 'ALetter',
-    53721: 'ALetter',
-    53722: 'ALetter',
-    53723: 'ALetter',
-    53724: 'ALetter',
-    53725: 'ALetter',
-    53726: 'ALetter',
-    53727: 'ALetter',
-    53728: 'ALetter',
-    53729: 'ALetter',
-    53730: 'ALetter',
-    53731: 'ALetter',
-    53732: 'ALetter',
-    53733: 'ALetter',
-    53734: 'ALetter',
-    53735: 'ALetter',
-    53736: 'ALetter',
-    53737: 'ALetter',
-    53738: 'ALetter',
-    53739: 'ALetter',
-    53740: 'ALetter',
-    53741: 'ALetter',
-    53742: 'ALetter',
-    53743: 'ALetter',
-    53744: 'ALetter',
-    53745: 'ALetter',
-    53746: 'ALetter',
-    53747: 'ALetter',
-    53748: 'ALetter',
-    53749: 'ALetter',
-    53750: 'ALetter',
-    53751: 'ALetter',
-    53752: 'ALetter',
-    53753: 'ALetter',
-    53754: 'ALetter',
-    53755: 'ALetter',
-    53756: 'ALetter',
-    53757: 'ALetter',
-    53758: 'ALetter',
-    53759: 'ALetter',
-    53760: 'ALetter',
-    53761: 'ALetter',
-    53762: 'ALetter',
-    53763: 'ALetter',
-    53764: 'ALetter',
-    53765: 'ALetter',
-    53766: 'ALetter',
-    53767: 'ALetter',
-    53768: 'ALetter',
-    53769: 'ALetter',
-    53770: 'ALetter',
-    53771: 'ALetter',
-    53772: 'ALetter',
-    53773: 'ALetter',
-    53774: 'ALetter',
-    53775: 'ALetter',
-    53776: 'ALetter',
-    53777: 'ALetter',
-    53778: 'ALetter',
-    53779: 'ALetter',
-    53780: 'ALetter',
-    53781: 'ALetter',
-    53782: 'ALetter',
-    53783: 'ALetter',
-    53784: 'ALetter',
-    53785: 'ALetter',
-    53786: 'ALetter',
-    53787: 'ALetter',
-    53788: 'ALetter',
-    53789: 'ALetter',
-    53790: 'ALetter',
-    53791: 'ALetter',
-    53792: 'ALetter',
-    53793: 'ALetter',
-    53794: 'ALetter',
-    53795: 'ALetter',
-    53796: 'ALetter',
-    53797: 'ALetter',
-    53798: 'ALetter',
-    53799: 'ALetter',
-    53800: 'ALetter',
-    53801: 'ALetter',
-    53802: 'ALetter',
-    53803: 'ALetter',
-    53804: 'ALetter',
-    53805: 'ALetter',
-    53806: 'ALetter',
-    53807: 'ALetter',
-    53808: 'ALetter',
-    53809: 'ALetter',
-    53810: 'ALetter',
-    53811: 'ALetter',
-    53812: 'ALetter',
-    53813: 'ALetter',
-    53814: 'ALetter',
-    53815: 'ALetter',
-    53816: 'ALetter',
-    53817: 'ALetter',
-    53818: 'ALetter',
-    53819: 'ALetter',
-    53820: 'ALetter',
-    53821: 'ALetter',
-    53822: 'ALetter',
-    53823: 'ALetter',
-    53824: 'ALetter',
-    53825: 'ALetter',
-    53826: 'ALetter',
-    53827: 'ALetter',
-    53828: 'ALetter',
-    53829: 'ALetter',
-    53830: 'ALetter',
-    53831: 'ALetter',
-    53832: 'ALetter',
-    53833: 'ALetter',
-    53834: 'ALetter',
-    53835: 'ALetter',
-    53836: 'ALetter',
-    53837: 'ALetter',
-    53838: 'ALetter',
-    53839: 'ALetter',
-    53840: 'ALetter',
-    53841: 'ALetter',
-    53842: 'ALetter',
-    53843: 'ALetter',
-    53844: 'ALetter',
-    53845: 'ALetter',
-    53846: 'ALetter',
-    53847: 'ALetter',
-    53848: 'ALetter',
-    53849: 'ALetter',
-    53850: 'ALetter',
-    53851: 'ALetter',
-    53852: 'ALetter',
-    53853: 'ALetter',
-    53854: 'ALetter',
-    53855: 'ALetter',
-    53856: 'ALetter',
-    53857: 'ALetter',
-    53858: 'ALetter',
-    53859: 'ALetter',
-    53860: 'ALetter',
-    53861: 'ALetter',
-    53862: 'ALetter',
-    53863: 'ALetter',
-    53864: 'ALetter',
-    53865: 'ALetter',
-    53866: 'ALetter',
-    53867: 'ALetter',
-    53868: 'ALetter',
-    53869: 'ALetter',
-    53870: 'ALetter',
-    53871: 'ALetter',
-    53872: 'ALetter',
-    53873: 'ALetter',
-    53874: 'ALetter',
-    53875: 'ALetter',
-    53876: 'ALetter',
-    53877: 'ALetter',
-    53878: 'ALetter',
-    53879: 'ALetter',
-    53880: 'ALetter',
-    53881: 'ALetter',
-    53882: 'ALetter',
-    53883: 'ALetter',
-    53884: 'ALetter',
-    53885: 'ALetter',
-    53886: 'ALetter',
-    53887: 'ALetter',
-    53888: 'ALetter',
-    53889: 'ALetter',
-    53890: 'ALetter',
-    53891: 'ALetter',
-    53892: 'ALetter',
-    53893: 'ALetter',
-    53894: 'ALetter',
-    53895: 'ALetter',
-    53896: 'ALetter',
-    53897: 'ALetter',
-    53898: 'ALetter',
-    53899: 'ALetter',
-    53900: 'ALetter',
-    53901: 'ALetter',
-    53902: 'ALetter',
-    53903: 'ALetter',
-    53904: 'ALetter',
-    53905: 'ALetter',
-    53906: 'ALetter',
-    53907: 'ALetter',
-    53908: 'ALetter',
-    53909: 'ALetter',
-    53910: 'ALetter',
-    53911: 'ALetter',
-    53912: 'ALetter',
-    53913: 'ALetter',
-    53914: 'ALetter',
-    53915: 'ALetter',
-    53916: 'ALetter',
-    53917: 'ALetter',
-    53918: 'ALetter',
-    53919: 'ALetter',
-    53920: 'ALetter',
-    53921: 'ALetter',
-    53922: 'ALetter',
-    53923: 'ALetter',
-    53924: 'ALetter',
-    53925: 'ALetter',
-    53926: 'ALetter',
-    53927: 'ALetter',
-    53928: 'ALetter',
-    53929: 'ALetter',
-    53930: 'ALetter',
-    53931: 'ALetter',
-    53932: 'ALetter',
-    53933: 'ALetter',
-    53934: 'ALetter',
-    53935: 'ALetter',
-    53936: 'ALetter',
-    53937: 'ALetter',
-    53938: 'ALetter',
-    53939: 'ALetter',
-    53940: 'ALetter',
-    53941: 'ALetter',
-    53942: 'ALetter',
-    53943: 'ALetter',
-    53944: 'ALetter',
-    53945: 'ALetter',
-    53946: 'ALetter',
-    53947: 'ALetter',
-    53948: 'ALetter',
-    53949: 'ALetter',
-    53950: 'ALetter',
-    53951: 'ALetter',
-    53952: 'ALetter',
-    53953: 'ALetter',
-    53954: 'ALetter',
-    53955: 'ALetter',
-    53956: 'ALetter',
-    53957: 'ALetter',
-    53958: 'ALetter',
-    53959: 'ALetter',
-    53960: 'ALetter',
-    53961: 'ALetter',
-    53962: 'ALetter',
-    53963: 'ALetter',
-    53964: 'ALetter',
-    53965: 'ALetter',
-    53966: 'ALetter',
-    53967: 'ALetter',
-    53968: 'ALetter',
-    53969: 'ALetter',
-    53970: 'ALetter',
-    53971: 'ALetter',
-    53972: 'ALetter',
-    53973: 'ALetter',
-    53974: 'ALetter',
-    53975: 'ALetter',
-    53976: 'ALetter',
-    53977: 'ALetter',
-    53978: 'ALetter',
-    53979: 'ALetter',
-    53980: 'ALetter',
-    53981: 'ALetter',
-    53982: 'ALetter',
-    53983: 'ALetter',
-    53984: 'ALetter',
-    53985: 'ALetter',
-    53986: 'ALetter',
-    53987: 'ALetter',
-    53988: 'ALetter',
-    53989: 'ALetter',
-    53990: 'ALetter',
-    53991: 'ALetter',
-    53992: 'ALetter',
-    53993: 'ALetter',
-    53994: 'ALetter',
-    53995: 'ALetter',
-    53996: 'ALetter',
-    53997: 'ALetter',
-    53998: 'ALetter',
-    53999: 'ALetter',
-    54000: 'ALetter',
-    54001: 'ALetter',
-    54002: 'ALetter',
-    54003: 'ALetter',
-    54004: 'ALetter',
-    54005: 'ALetter',
-    54006: 'ALetter',
-    54007: 'ALetter',
-    54008: 'ALetter',
-    54009: 'ALetter',
-    54010: 'ALetter',
-    54011: 'ALetter',
-    54012: 'ALetter',
-    54013: 'ALetter',
-    54014: 'ALetter',
-    54015: 'ALetter',
-    54016: 'ALetter',
-    54017: 'ALetter',
-    54018: 'ALetter',
-    54019: 'ALetter',
-    54020: 'ALetter',
-    54021: 'ALetter',
-    54022: 'ALetter',
-    54023: 'ALetter',
-    54024: 'ALetter',
-    54025: 'ALetter',
-    54026: 'ALetter',
-    54027: 'ALetter',
-    54028: 'ALetter',
-    54029: 'ALetter',
-    54030: 'ALetter',
-    54031: 'ALetter',
-    54032: 'ALetter',
-    54033: 'ALetter',
-    54034: 'ALetter',
-    54035: 'ALetter',
-    54036: 'ALetter',
-    54037: 'ALetter',
-    54038: 'ALetter',
-    54039: 'ALetter',
-    54040: 'ALetter',
-    54041: 'ALetter',
-    54042: 'ALetter',
-    54043: 'ALetter',
-    54044: 'ALetter',
-    54045: 'ALetter',
-    54046: 'ALetter',
-    54047: 'ALetter',
-    54048: 'ALetter',
-    54049: 'ALetter',
-    54050: 'ALetter',
-    54051: 'ALetter',
-    54052: 'ALetter',
-    54053: 'ALetter',
-    54054: 'ALetter',
-    54055: 'ALetter',
-    54056: 'ALetter',
-    54057: 'ALetter',
-    54058: 'ALetter',
-    54059: 'ALetter',
-    54060: 'ALetter',
-    54061: 'ALetter',
-    54062: 'ALetter',
-    54063: 'ALetter',
-    54064: 'ALetter',
-    54065: 'ALetter',
-    54066: 'ALetter',
-    54067: 'ALetter',
-    54068: 'ALetter',
-    54069: 'ALetter',
-    54070: 'ALetter',
-    54071: 'ALetter',
-    54072: 'ALetter',
-    54073: 'ALetter',
-    54074: 'ALetter',
-    54075: 'ALetter',
-    54076: 'ALetter',
-    54077: 'ALetter',
-    54078: 'ALetter',
-    54079: 'ALetter',
-    54080: 'ALetter',
-    54081: 'ALetter',
-    54082: 'ALetter',
-    54083: 'ALetter',
-    54084: 'ALetter',
-    54085: 'ALetter',
-    54086: 'ALetter',
-    54087: 'ALetter',
-    54088: 'ALetter',
-    54089: 'ALetter',
-    54090: 'ALetter',
-    54091: 'ALetter',
-    54092: 'ALetter',
-    54093: 'ALetter',
-    54094: 'ALetter',
-    54095: 'ALetter',
-    54096: 'ALetter',
-    54097: 'ALetter',
-    54098: 'ALetter',
-    54099: 'ALetter',
-    54100: 'ALetter',
-    54101: 'ALetter',
-    54102: 'ALetter',
-    54103: 'ALetter',
-    54104: 'ALetter',
-    54105: 'ALetter',
-    54106: 'ALetter',
-    54107: 'ALetter',
-    54108: 'ALetter',
-    54109: 'ALetter',
-    54110: 'ALetter',
-    54111: 'ALetter',
-    54112: 'ALetter',
-    54113: 'ALetter',
-    54114: 'ALetter',
-    54115: 'ALetter',
-    54116: 'ALetter',
-    54117: 'ALetter',
-    54118: 'ALetter',
-    54119: 'ALetter',
-    54120: 'ALetter',
-    54121: 'ALetter',
-    54122: 'ALetter',
-    54123: 'ALetter',
-    54124: 'ALetter',
-    54125: 'ALetter',
-    54126: 'ALetter',
-    54127: 'ALetter',
-    54128: 'ALetter',
-    54129: 'ALetter',
-    54130: 'ALetter',
-    54131: 'ALetter',
-    54132: 'ALetter',
-    54133: 'ALetter',
-    54134: 'ALetter',
-    54135: 'ALetter',
-    54136: 'ALetter',
-    54137: 'ALetter',
-    54138: 'ALetter',
-    54139: 'ALetter',
-    54140: 'ALetter',
-    54141: 'ALetter',
-    54142: 'ALetter',
-    54143: 'ALetter',
-    54144: 'ALetter',
-    54145: 'ALetter',
-    54146: 'ALetter',
-    54147: 'ALetter',
-    54148: 'ALetter',
-    54149: 'ALetter',
-    54150: 'ALetter',
-    54151: 'ALetter',
-    54152: 'ALetter',
-    54153: 'ALetter',
-    54154: 'ALetter',
-    54155: 'ALetter',
-    54156: 'ALetter',
-    54157: 'ALetter',
-    54158: 'ALetter',
-    54159: 'ALetter',
-    54160: 'ALetter',
-    54161: 'ALetter',
-    54162: 'ALetter',
-    54163: 'ALetter',
-    54164: 'ALetter',
-    54165: 'ALetter',
-    54166: 'ALetter',
-    54167: 'ALetter',
-    54168: 'ALetter',
-    54169: 'ALetter',
-    54170: 'ALetter',
-    54171: 'ALetter',
-    54172: 'ALetter',
-    54173: 'ALetter',
-    54174: 'ALetter',
-    54175: 'ALetter',
-    54176: 'ALetter',
-    54177: 'ALetter',
-    54178: 'ALetter',
-    54179: 'ALetter',
-    54180: 'ALetter',
-    54181: 'ALetter',
-    54182: 'ALetter',
-    54183: 'ALetter',
-    54184: 'ALetter',
-    54185: 'ALetter',
-    54186: 'ALetter',
-    54187: 'ALetter',
-    54188: 'ALetter',
-    54189: 'ALetter',
-    54190: 'ALetter',
-    54191: 'ALetter',
-    54192: 'ALetter',
-    54193: 'ALetter',
-    54194: 'ALetter',
-    54195: 'ALetter',
-    54196: 'ALetter',
-    54197: 'ALetter',
-    54198: 'ALetter',
-    54199: 'ALetter',
-    54200: 'ALetter',
-    54201: 'ALetter',
-    54202: 'ALetter',
-    54203: 'ALetter',
-    54204: 'ALetter',
-    54205: 'ALetter',
-    54206: 'ALetter',
-    54207: 'ALetter',
-    54208: 'ALetter',
-    54209: 'ALetter',
-    54210: 'ALetter',
-    54211: 'ALetter',
-    54212: 'ALetter',
-    54213: 'ALetter',
-    54214: 'ALetter',
-    54215: 'ALetter',
-    54216: 'ALetter',
-    54217: 'ALetter',
-    54218: 'ALetter',
-    54219: 'ALetter',
-    54220: 'ALetter',
-    54221: 'ALetter',
-    54222: 'ALetter',
-    54223: 'ALetter',
-    54224: 'ALetter',
-    54225: 'ALetter',
-    54226: 'ALetter',
-    54227: 'ALetter',
-    54228: 'ALetter',
-    54229: 'ALetter',
-    54230: 'ALetter',
-    54231: 'ALetter',
-    54232: 'ALetter',
-    54233: 'ALetter',
-    54234: 'ALetter',
-    54235: 'ALetter',
-    54236: 'ALetter',
-    54237: 'ALetter',
-    54238: 'ALetter',
-    54239: 'ALetter',
-    54240: 'ALetter',
-    54241: 'ALetter',
-    54242: 'ALetter',
-    54243: 'ALetter',
-    54244: 'ALetter',
-    54245: 'ALetter',
-    54246: 'ALetter',
-    54247: 'ALetter',
-    54248: 'ALetter',
-    54249: 'ALetter',
-    54250: 'ALetter',
-    54251: 'ALetter',
-    54252: 'ALetter',
-    54253: 'ALetter',
-    54254: 'ALetter',
-    54255: 'ALetter',
-    54256: 'ALetter',
-    54257: 'ALetter',
-    54258: 'ALetter',
-    54259: 'ALetter',
-    54260: 'ALetter',
-    54261: 'ALetter',
-    54262: 'ALetter',
-    54263: 'ALetter',
-    54264: 'ALetter',
-    54265: 'ALetter',
-    54266: 'ALetter',
-    54267: 'ALetter',
-    54268: 'ALetter',
-    54269: 'ALetter',
-    54270: 'ALetter',
-    54271: 'ALetter',
-    54272: 'ALetter',
-    54273: 'ALetter',
-    54274: 'ALetter',
-    54275: 'ALetter',
-    54276: 'ALetter',
-    54277: 'ALetter',
-    54278: 'ALetter',
-    54279: 'ALetter',
-    54280: 'ALetter',
-    54281: 'ALetter',
-    54282: 'ALetter',
-    54283: 'ALetter',
-    54284: 'ALetter',
-    54285: 'ALetter',
-    54286: 'ALetter',
-    54287: 'ALetter',
-    54288: 'ALetter',
-    54289: 'ALetter',
-    54290: 'ALetter',
-    54291: 'ALetter',
-    54292: 'ALetter',
-    54293: 'ALetter',
-    54294: 'ALetter',
-    54295: 'ALetter',
-    54296: 'ALetter',
-    54297: 'ALetter',
-    54298: 'ALetter',
-    54299: 'ALetter',
-    54300: 'ALetter',
-    54301: 'ALetter',
-    54302: 'ALetter',
-    54303: 'ALetter',
-    54304: 'ALetter',
-    54305: 'ALetter',
-    54306: 'ALetter',
-    54307: 'ALetter',
-    54308: 'ALetter',
-    54309: 'ALetter',
-    54310: 'ALetter',
-    54311: 'ALetter',
-    54312: 'ALetter',
-    54313: 'ALetter',
-    54314: 'ALetter',
-    54315: 'ALetter',
-    54316: 'ALetter',
-    54317: 'ALetter',
-    54318: 'ALetter',
-    54319: 'ALetter',
-    54320: 'ALetter',
-    54321: 'ALetter',
-    54322: 'ALetter',
-    54323: 'ALetter',
-    54324: 'ALetter',
-    54325: 'ALetter',
-    54326: 'ALetter',
-    54327: 'ALetter',
-    54328: 'ALetter',
-    54329: 'ALetter',
-    54330: 'ALetter',
-    54331: 'ALetter',
-    54332: 'ALetter',
-    54333: 'ALetter',
-    54334: 'ALetter',
-    54335: 'ALetter',
-    54336: 'ALetter',
-    54337: 'ALetter',
-    54338: 'ALetter',
-    54339: 'ALetter',
-    54340: 'ALetter',
-    54341: 'ALetter',
-    54342: 'ALetter',
-    54343: 'ALetter',
-    54344: 'ALetter',
-    54345: 'ALetter',
-    54346: 'ALetter',
-    54347: 'ALetter',
-    54348: 'ALetter',
-    54349: 'ALetter',
-    54350: 'ALetter',
-    54351: 'ALetter',
-    54352: 'ALetter',
-    54353: 'ALetter',
-    54354: 'ALetter',
-    54355: 'ALetter',
-    54356: 'ALetter',
-    54357: 'ALetter',
-    54358: 'ALetter',
-    54359: 'ALetter',
-    54360: 'ALetter',
-    54361: 'ALetter',
-    54362: 'ALetter',
-    54363: 'ALetter',
-    54364: 'ALetter',
-    54365: 'ALetter',
-    54366: 'ALetter',
-    54367: 'ALetter',
-    54368: 'ALetter',
-    54369: 'ALetter',
-    54370: 'ALetter',
-    54371: 'ALetter',
-    54372: 'ALetter',
-    54373: 'ALetter',
-    54374: 'ALetter',
-    54375: 'ALetter',
-    54376: 'ALetter',
-    54377: 'ALetter',
-    54378: 'ALetter',
-    54379: 'ALetter',
-    54380: 'ALetter',
-    54381: 'ALetter',
-    54382: 'ALetter',
-    54383: 'ALetter',
-    54384: 'ALetter',
-    54385: 'ALetter',
-    54386: 'ALetter',
-    54387: 'ALetter',
-    54388: 'ALetter',
-    54389: 'ALetter',
-    54390: 'ALetter',
-    54391: 'ALetter',
-    54392: 'ALetter',
-    54393: 'ALetter',
-    54394: 'ALetter',
-    54395: 'ALetter',
-    54396: 'ALetter',
-    54397: 'ALetter',
-    54398: 'ALetter',
-    54399: 'ALetter',
-    54400: 'ALetter',
-    54401: 'ALetter',
-    54402: 'ALetter',
-    54403: 'ALetter',
-    54404: 'ALetter',
-    54405: 'ALetter',
-    54406: 'ALetter',
-    54407: 'ALetter',
-    54408: 'ALetter',
-    54409: 'ALetter',
-    54410: 'ALetter',
-    54411: 'ALetter',
-    54412: 'ALetter',
-    54413: 'ALetter',
-    54414: 'ALetter',
-    54415: 'ALetter',
-    54416: 'ALetter',
-    54417: 'ALetter',
-    54418: 'ALetter',
-    54419: 'ALetter',
-    54420: 'ALetter',
-    54421: 'ALetter',
-    54422: 'ALetter',
-    54423: 'ALetter',
-    54424: 'ALetter',
-    54425: 'ALetter',
-    54426: 'ALetter',
-    54427: 'ALetter',
-    54428: 'ALetter',
-    54429: 'ALetter',
-    54430: 'ALetter',
-    54431: 'ALetter',
-    54432: 'ALetter',
-    54433: 'ALetter',
-    54434: 'ALetter',
-    54435: 'ALetter',
-    54436: 'ALetter',
-    54437: 'ALetter',
-    54438: 'ALetter',
-    54439: 'ALetter',
-    54440: 'ALetter',
-    54441: 'ALetter',
-    54442: 'ALetter',
-    54443: 'ALetter',
-    54444: 'ALetter',
-    54445: 'ALetter',
-    54446: 'ALetter',
-    54447: 'ALetter',
-    54448: 'ALetter',
-    54449: 'ALetter',
-    54450: 'ALetter',
-    54451: 'ALetter',
-    54452: 'ALetter',
-    54453: 'ALetter',
-    54454: 'ALetter',
-    54455: 'ALetter',
-    54456: 'ALetter',
-    54457: 'ALetter',
-    54458: 'ALetter',
-    54459: 'ALetter',
-    54460: 'ALetter',
-    54461: 'ALetter',
-    54462: 'ALetter',
-    54463: 'ALetter',
-    54464: 'ALetter',
-    54465: 'ALetter',
-    54466: 'ALetter',
-    54467: 'ALetter',
-    54468: 'ALetter',
-    54469: 'ALetter',
-    54470: 'ALetter',
-    54471: 'ALetter',
-    54472: 'ALetter',
-    54473: 'ALetter',
-    54474: 'ALetter',
-    54475: 'ALetter',
-    54476: 'ALetter',
-    54477: 'ALetter',
-    54478: 'ALetter',
-    54479: 'ALetter',
-    54480: 'ALetter',
-    54481: 'ALetter',
-    54482: 'ALetter',
-    54483: 'ALetter',
-    54484: 'ALetter',
-    54485: 'ALetter',
-    54486: 'ALetter',
-    54487: 'ALetter',
-    54488: 'ALetter',
-    54489: 'ALetter',
-    54490: 'ALetter',
-    54491: 'ALetter',
-    54492: 'ALetter',
-    54493: 'ALetter',
-    54494: 'ALetter',
-    54495: 'ALetter',
-    54496: 'ALetter',
-    54497: 'ALetter',
-    54498: 'ALetter',
-    54499: 'ALetter',
-    54500: 'ALetter',
-    54501: 'ALetter',
-    54502: 'ALetter',
-    54503: 'ALetter',
-    54504: 'ALetter',
-    54505: 'ALetter',
-    54506: 'ALetter',
-    54507: 'ALetter',
-    54508: 'ALetter',
-    54509: 'ALetter',
-    54510: 'ALetter',
-    54511: 'ALetter',
-    54512: 'ALetter',
-    54513: 'ALetter',
-    54514: 'ALetter',
-    54515: 'ALetter',
-    54516: 'ALetter',
-    54517: 'ALetter',
-    54518: 'ALetter',
-    54519: 'ALetter',
-    54520: 'ALetter',
-    54521: 'ALetter',
-    54522: 'ALetter',
-    54523: 'ALetter',
-    54524: 'ALetter',
-    54525: 'ALetter',
-    54526: 'ALetter',
-    54527: 'ALetter',
-    54528: 'ALetter',
-    54529: 'ALetter',
-    54530: 'ALetter',
-    54531: 'ALetter',
-    54532: 'ALetter',
-    54533: 'ALetter',
-    54534: 'ALetter',
-    54535: 'ALetter',
-    54536: 'ALetter',
-    54537: 'ALetter',
-    54538: 'ALetter',
-    54539: 'ALetter',
-    54540: 'ALetter',
-    54541: 'ALetter',
-    54542: 'ALetter',
-    54543: 'ALetter',
-    54544: 'ALetter',
-    54545: 'ALetter',
-    54546: 'ALetter',
-    54547: 'ALetter',
-    54548: 'ALetter',
-    54549: 'ALetter',
-    54550: 'ALetter',
-    54551: 'ALetter',
-    54552: 'ALetter',
-    54553: 'ALetter',
-    54554: 'ALetter',
-    54555: 'ALetter',
-    54556: 'ALetter',
-    54557: 'ALetter',
-    54558: 'ALetter',
-    54559: 'ALetter',
-    54560: 'ALetter',
-    54561: 'ALetter',
-    54562: 'ALetter',
-    54563: 'ALetter',
-    54564: 'ALetter',
-    54565: 'ALetter',
-    54566: 'ALetter',
-    54567: 'ALetter',
-    54568: 'ALetter',
-    54569: 'ALetter',
-    54570: 'ALetter',
-    54571: 'ALetter',
-    54572: 'ALetter',
-    54573: 'ALetter',
-    54574: 'ALetter',
-    54575: 'ALetter',
-    54576: 'ALetter',
-    54577: 'ALetter',
-    54578: 'ALetter',
-    54579: 'ALetter',
-    54580: 'ALetter',
-    54581: 'ALetter',
-    54582: 'ALetter',
-    54583: 'ALetter',
-    54584: 'ALetter',
-    54585: 'ALetter',
-    54586: 'ALetter',
-    54587: 'ALetter',
-    54588: 'ALetter',
-    54589: 'ALetter',
-    54590: 'ALetter',
-    54591: 'ALetter',
-    54592: 'ALetter',
-    54593: 'ALetter',
-    54594: 'ALetter',
-    54595: 'ALetter',
-    54596: 'ALetter',
-    54597: 'ALetter',
-    54598: 'ALetter',
-    54599: 'ALetter',
-    54600: 'ALetter',
-    54601: 'ALetter',
-    54602: 'ALetter',
-    54603: 'ALetter',
-    54604: 'ALetter',
-    54605: 'ALetter',
-    54606: 'ALetter',
-    54607: 'ALetter',
-    54608: 'ALetter',
-    54609: 'ALetter',
-    54610: 'ALetter',
-    54611: 'ALetter',
-    54612: 'ALetter',
-    54613: 'ALetter',
-    54614: 'ALetter',
-    54615: 'ALetter',
-    54616: 'ALetter',
-    54617: 'ALetter',
-    54618: 'ALetter',
-    54619: 'ALetter',
-    54620: 'ALetter',
-    54621: 'ALetter',
-    54622: 'ALetter',
-    54623: 'ALetter',
-    54624: 'ALetter',
-    54625: 'ALetter',
-    54626: 'ALetter',
-    54627: 'ALetter',
-    54628: 'ALetter',
-    54629: 'ALetter',
-    54630: 'ALetter',
-    54631: 'ALetter',
-    54632: 'ALetter',
-    54633: 'ALetter',
-    54634: 'ALetter',
-    54635: 'ALetter',
-    54636: 'ALetter',
-    54637: 'ALetter',
-    54638: 'ALetter',
-    54639: 'ALetter',
-    54640: 'ALetter',
-    54641: 'ALetter',
-    54642: 'ALetter',
-    54643: 'ALetter',
-    54644: 'ALetter',
-    54645: 'ALetter',
-    54646: 'ALetter',
-    54647: 'ALetter',
-    54648: 'ALetter',
-    54649: 'ALetter',
-    54650: 'ALetter',
-    54651: 'ALetter',
-    54652: 'ALetter',
-    54653: 'ALetter',
-    54654: 'ALetter',
-    54655: 'ALetter',
-    54656: 'ALetter',
-    54657: 'ALetter',
-    54658: 'ALetter',
-    54659: 'ALetter',
-    54660: 'ALetter',
-    54661: 'ALetter',
-    54662: 'ALetter',
-    54663: 'ALetter',
-    54664: 'ALetter',
-    54665: 'ALetter',
-    54666: 'ALetter',
-    54667: 'ALetter',
-    54668: 'ALetter',
-    54669: 'ALetter',
-    54670: 'ALetter',
-    54671: 'ALetter',
-    54672: 'ALetter',
-    54673: 'ALetter',
-    54674: 'ALetter',
-    54675: 'ALetter',
-    54676: 'ALetter',
-    54677: 'ALetter',
-    54678: 'ALetter',
-    54679: 'ALetter',
-    54680: 'ALetter',
-    54681: 'ALetter',
-    54682: 'ALetter',
-    54683: 'ALetter',
-    54684: 'ALetter',
-    54685: 'ALetter',
-    54686: 'ALetter',
-    54687: 'ALetter',
-    54688: 'ALetter',
-    54689: 'ALetter',
-    54690: 'ALetter',
-    54691: 'ALetter',
-    54692: 'ALetter',
-    54693: 'ALetter',
-    54694: 'ALetter',
-    54695: 'ALetter',
-    54696: 'ALetter',
-    54697: 'ALetter',
-    54698: 'ALetter',
-    54699: 'ALetter',
-    54700: 'ALetter',
-    54701: 'ALetter',
-    54702: 'ALetter',
-    54703: 'ALetter',
-    54704: 'ALetter',
-    54705: 'ALetter',
-    54706: 'ALetter',
-    54707: 'ALetter',
-    54708: 'ALetter',
-    54709: 'ALetter',
-    54710: 'ALetter',
-    54711: 'ALetter',
-    54712: 'ALetter',
-    54713: 'ALetter',
-    54714: 'ALetter',
-    54715: 'ALetter',
-    54716: 'ALetter',
-    54717: 'ALetter',
-    54718: 'ALetter',
-    54719: 'ALetter',
-    54720: 'ALetter',
-    54721: 'ALetter',
-    54722: 'ALetter',
-    54723: 'ALetter',
-    54724: 'ALetter',
-    54725: 'ALetter',
-    54726: 'ALetter',
-    54727: 'ALetter',
-    54728: 'ALetter',
-    54729: 'ALetter',
-    54730: 'ALetter',
-    54731: 'ALetter',
-    54732: 'ALetter',
-    54733: 'ALetter',
-    54734: 'ALetter',
-    54735: 'ALetter',
-    54736: 'ALetter',
-    54737: 'ALetter',
-    54738: 'ALetter',
-    54739: 'ALetter',
-    54740: 'ALetter',
-    54741: 'ALetter',
-    54742: 'ALetter',
-    54743: 'ALetter',
-    54744: 'ALetter',
-    54745: 'ALetter',
-    54746: 'ALetter',
-    54747: 'ALetter',
-    54748: 'ALetter',
-    54749: 'ALetter',
-    54750: 'ALetter',
-    54751: 'ALetter',
-    54752: 'ALetter',
-    54753: 'ALetter',
-    54754: 'ALetter',
-    54755: 'ALetter',
-    54756: 'ALetter',
-    54757: 'ALetter',
-    54758: 'ALetter',
-    54759: 'ALetter',
-    54760: 'ALetter',
-    54761: 'ALetter',
-    54762: 'ALetter',
-    54763: 'ALetter',
-    54764: 'ALetter',
-    54765: 'ALetter',
-    54766: 'ALetter',
-    54767: 'ALetter',
-    54768: 'ALetter',
-    54769: 'ALetter',
-    54770: 'ALetter',
-    54771: 'ALetter',
-    54772: 'ALetter',
-    54773: 'ALetter',
-    54774: 'ALetter',
-    54775: 'ALetter',
-    54776: 'ALetter',
-    54777: 'ALetter',
-    54778: 'ALetter',
-    54779: 'ALetter',
-    54780: 'ALetter',
-    54781: 'ALetter',
-    54782: 'ALetter',
-    54783: 'ALetter',
-    54784: 'ALetter',
-    54785: 'ALetter',
-    54786: 'ALetter',
-    54787: 'ALetter',
-    54788: 'ALetter',
-    54789: 'ALetter',
-    54790: 'ALetter',
-    54791: 'ALetter',
-    54792: 'ALetter',
-    54793: 'ALetter',
-    54794: 'ALetter',
-    54795: 'ALetter',
-    54796: 'ALetter',
-    54797: 'ALetter',
-    54798: 'ALetter',
-    54799: 'ALetter',
-    54800: 'ALetter',
-    54801: 'ALetter',
-    54802: 'ALetter',
-    54803: 'ALetter',
-    54804: 'ALetter',
-    54805: 'ALetter',
-    54806: 'ALetter',
-    54807: 'ALetter',
-    54808: 'ALetter',
-    54809: 'ALetter',
-    54810: 'ALetter',
-    54811: 'ALetter',
-    54812: 'ALetter',
-    54813: 'ALetter',
-    54814: 'ALetter',
-    54815: 'ALetter',
-    54816: 'ALetter',
-    54817: 'ALetter',
-    54818: 'ALetter',
-    54819: 'ALetter',
-    54820: 'ALetter',
-    54821: 'ALetter',
-    54822: 'ALetter',
-    54823: 'ALetter',
-    54824: 'ALetter',
-    54825: 'ALetter',
-    54826: 'ALetter',
-    54827: 'ALetter',
-    54828: 'ALetter',
-    54829: 'ALetter',
-    54830: 'ALetter',
-    54831: 'ALetter',
-    54832: 'ALetter',
-    54833: 'ALetter',
-    54834: 'ALetter',
-    54835: 'ALetter',
-    54836: 'ALetter',
-    54837: 'ALetter',
-    54838: 'ALetter',
-    54839: 'ALetter',
-    54840: 'ALetter',
-    54841: 'ALetter',
-    54842: 'ALetter',
-    54843: 'ALetter',
-    54844: 'ALetter',
-    54845: 'ALetter',
-    54846: 'ALetter',
-    54847: 'ALetter',
-    54848: 'ALetter',
-    54849: 'ALetter',
-    54850: 'ALetter',
-    54851: 'ALetter',
-    54852: 'ALetter',
-    54853: 'ALetter',
-    54854: 'ALetter',
-    54855: 'ALetter',
-    54856: 'ALetter',
-    54857: 'ALetter',
-    54858: 'ALetter',
-    54859: 'ALetter',
-    54860: 'ALetter',
-    54861: 'ALetter',
-    54862: 'ALetter',
-    54863: 'ALetter',
-    54864: 'ALetter',
-    54865: 'ALetter',
-    54866: 'ALetter',
-    54867: 'ALetter',
-    54868: 'ALetter',
-    54869: 'ALetter',
-    54870: 'ALetter',
-    54871: 'ALetter',
-    54872: 'ALetter',
-    54873: 'ALetter',
-    54874: 'ALetter',
-    54875: 'ALetter',
-    54876: 'ALetter',
-    54877: 'ALetter',
-    54878: 'ALetter',
-    54879: 'ALetter',
-    54880: 'ALetter',
-    54881: 'ALetter',
-    54882: 'ALetter',
-    54883: 'ALetter',
-    54884: 'ALetter',
-    54885: 'ALetter',
-    54886: 'ALetter',
-    54887: 'ALetter',
-    54888: 'ALetter',
-    54889: 'ALetter',
-    54890: 'ALetter',
-    54891: 'ALetter',
-    54892: 'ALetter',
-    54893: 'ALetter',
-    54894: 'ALetter',
-    54895: 'ALetter',
-    54896: 'ALetter',
-    54897: 'ALetter',
-    54898: 'ALetter',
-    54899: 'ALetter',
-    54900: 'ALetter',
-    54901: 'ALetter',
-    54902: 'ALetter',
-    54903: 'ALetter',
-    54904: 'ALetter',
-    54905: 'ALetter',
-    54906: 'ALetter',
-    54907: 'ALetter',
-    54908: 'ALetter',
-    54909: 'ALetter',
-    54910: 'ALetter',
-    54911: 'ALetter',
-    54912: 'ALetter',
-    54913: 'ALetter',
-    54914: 'ALetter',
-    54915: 'ALetter',
-    54916: 'ALetter',
-    54917: 'ALetter',
-    54918: 'ALetter',
-    54919: 'ALetter',
-    54920: 'ALetter',
-    54921: 'ALetter',
-    54922: 'ALetter',
-    54923: 'ALetter',
-    54924: 'ALetter',
-    54925: 'ALetter',
-    54926: 'ALetter',
-    54927: 'ALetter',
-    54928: 'ALetter',
-    54929: 'ALetter',
-    54930: 'ALetter',
-    54931: 'ALetter',
-    54932: 'ALetter',
-    54933: 'ALetter',
-    54934: 'ALetter',
-    54935: 'ALetter',
-    54936: 'ALetter',
-    54937: 'ALetter',
-    54938: 'ALetter',
-    54939: 'ALetter',
-    54940: 'ALetter',
-    54941: 'ALetter',
-    54942: 'ALetter',
-    54943: 'ALetter',
-    54944: 'ALetter',
-    54945: 'ALetter',
-    54946: 'ALetter',
-    54947: 'ALetter',
-    54948: 'ALetter',
-    54949: 'ALetter',
-    54950: 'ALetter',
-    54951: 'ALetter',
-    54952: 'ALetter',
-    54953: 'ALetter',
-    54954: 'ALetter',
-    54955: 'ALetter',
-    54956: 'ALetter',
-    54957: 'ALetter',
-    54958: 'ALetter',
-    54959: 'ALetter',
-    54960: 'ALetter',
-    54961: 'ALetter',
-    54962: 'ALetter',
-    54963: 'ALetter',
-    54964: 'ALetter',
-    54965: 'ALetter',
-    54966: 'ALetter',
-    54967: 'ALetter',
-    54968: 'ALetter',
-    54969: 'ALetter',
-    54970: 'ALetter',
-    54971: 'ALetter',
-    54972: 'ALetter',
-    54973: 'ALetter',
-    54974: 'ALetter',
-    54975: 'ALetter',
-    54976: 'ALetter',
-    54977: 'ALetter',
-    54978: 'ALetter',
-    54979: 'ALetter',
-    54980: 'ALetter',
-    54981: 'ALetter',
-    54982: 'ALetter',
-    54983: 'ALetter',
-    54984: 'ALetter',
-    54985: 'ALetter',
-    54986: 'ALetter',
-    54987: 'ALetter',
-    54988: 'ALetter',
-    54989: 'ALetter',
-    54990: 'ALetter',
-    54991: 'ALetter',
-    54992: 'ALetter',
-    54993: 'ALetter',
-    54994: 'ALetter',
-    54995: 'ALetter',
-    54996: 'ALetter',
-    54997: 'ALetter',
-    54998: 'ALetter',
-    54999: 'ALetter',
-    55000: 'ALetter',
-    55001: 'ALetter',
-    55002: 'ALetter',
-    55003: 'ALetter',
-    55004: 'ALetter',
-    55005: 'ALetter',
-    55006: 'ALetter',
-    55007: 'ALetter',
-    55008: 'ALetter',
-    55009: 'ALetter',
-    55010: 'ALetter',
-    55011: 'ALetter',
-    55012: 'ALetter',
-    55013: 'ALetter',
-    55014: 'ALetter',
-    55015: 'ALetter',
-    55016: 'ALetter',
-    55017: 'ALetter',
-    55018: 'ALetter',
-    55019: 'ALetter',
-    55020: 'ALetter',
-    55021: 'ALetter',
-    55022: 'ALetter',
-    55023: 'ALetter',
-    55024: 'ALetter',
-    55025: 'ALetter',
-    55026: 'ALetter',
-    55027: 'ALetter',
-    55028: 'ALetter',
-    55029: 'ALetter',
-    55030: 'ALetter',
-    55031: 'ALetter',
-    55032: 'ALetter',
-    55033: 'ALetter',
-    55034: 'ALetter',
-    55035: 'ALetter',
-    55036: 'ALetter',
-    55037: 'ALetter',
-    55038: 'ALetter',
-    55039: 'ALetter',
-    55040: 'ALetter',
-    55041: 'ALetter',
-    55042: 'ALetter',
-    55043: 'ALetter',
-    55044: 'ALetter',
-    55045: 'ALetter',
-    55046: 'ALetter',
-    55047: 'ALetter',
-    55048: 'ALetter',
-    55049: 'ALetter',
-    55050: 'ALetter',
-    55051: 'ALetter',
-    55052: 'ALetter',
-    55053: 'ALetter',
-    55054: 'ALetter',
-    55055: 'ALetter',
-    55056: 'ALetter',
-    55057: 'ALetter',
-    55058: 'ALetter',
-    55059: 'ALetter',
-    55060: 'ALetter',
-    55061: 'ALetter',
-    55062: 'ALetter',
-    55063: 'ALetter',
-    55064: 'ALetter',
-    55065: 'ALetter',
-    55066: 'ALetter',
-    55067: 'ALetter',
-    55068: 'ALetter',
-    55069: 'ALetter',
-    55070: 'ALetter',
-    55071: 'ALetter',
-    55072: 'ALetter',
-    55073: 'ALetter',
-    55074: 'ALetter',
-    55075: 'ALetter',
-    55076: 'ALetter',
-    55077: 'ALetter',
-    55078: 'ALetter',
-    55079: 'ALetter',
-    55080: 'ALetter',
-    55081: 'ALetter',
-    55082: 'ALetter',
-    55083: 'ALetter',
-    55084: 'ALetter',
-    55085: 'ALetter',
-    55086: 'ALetter',
-    55087: 'ALetter',
-    55088: 'ALetter',
-    55089: 'ALetter',
-    55090: 'ALetter',
-    55091: 'ALetter',
-    55092: 'ALetter',
-    55093: 'ALetter',
-    55094: 'ALetter',
-    55095: 'ALetter',
-    55096: 'ALetter',
-    55097: 'ALetter',
-    55098: 'ALetter',
-    55099: 'ALetter',
-    55100: 'ALetter',
-    55101: 'ALetter',
-    55102: 'ALetter',
-    55103: 'ALetter',
-    55104: 'ALetter',
-    55105: 'ALetter',
-    55106: 'ALetter',
-    55107: 'ALetter',
-    55108: 'ALetter',
-    55109: 'ALetter',
-    55110: 'ALetter',
-    55111: 'ALetter',
-    55112: 'ALetter',
-    55113: 'ALetter',
-    55114: 'ALetter',
-    55115: 'ALetter',
-    55116: 'ALetter',
-    55117: 'ALetter',
-    55118: 'ALetter',
-    55119: 'ALetter',
-    55120: 'ALetter',
-    55121: 'ALetter',
-    55122: 'ALetter',
-    55123: 'ALetter',
-    55124: 'ALetter',
-    55125: 'ALetter',
-    55126: 'ALetter',
-    55127: 'ALetter',
-    55128: 'ALetter',
-    55129: 'ALetter',
-    55130: 'ALetter',
-    55131: 'ALetter',
-    55132: 'ALetter',
-    55133: 'ALetter',
-    55134: 'ALetter',
-    55135: 'ALetter',
-    55136: 'ALetter',
-    55137: 'ALetter',
-    55138: 'ALetter',
-    55139: 'ALetter',
-    55140: 'ALetter',
-    55141: 'ALetter',
-    55142: 'ALetter',
-    55143: 'ALetter',
-    55144: 'ALetter',
-    55145: 'ALetter',
-    55146: 'ALetter',
-    55147: 'ALetter',
-    55148: 'ALetter',
-    55149: 'ALetter',
-    55150: 'ALetter',
-    55151: 'ALetter',
-    55152: 'ALetter',
-    55153: 'ALetter',
-    55154: 'ALetter',
-    55155: 'ALetter',
-    55156: 'ALetter',
-    55157: 'ALetter',
-    55158: 'ALetter',
-    55159: 'ALetter',
-    55160: 'ALetter',
-    55161: 'ALetter',
-    55162: 'ALetter',
-    55163: 'ALetter',
-    55164: 'ALetter',
-    55165: 'ALetter',
-    55166: 'ALetter',
-    55167: 'ALetter',
-    55168: 'ALetter',
-    55169: 'ALetter',
-    55170: 'ALetter',
-    55171: 'ALetter',
-    55172: 'ALetter',
-    55173: 'ALetter',
-    55174: 'ALetter',
-    55175: 'ALetter',
-    55176: 'ALetter',
-    55177: 'ALetter',
-    55178: 'ALetter',
-    55179: 'ALetter',
-    55180: 'ALetter',
-    55181: 'ALetter',
-    55182: 'ALetter',
-    55183: 'ALetter',
-    55184: 'ALetter',
-    55185: 'ALetter',
-    55186: 'ALetter',
-    55187: 'ALetter',
-    55188: 'ALetter',
-    55189: 'ALetter',
-    55190: 'ALetter',
-    55191: 'ALetter',
-    55192: 'ALetter',
-    55193: 'ALetter',
-    55194: 'ALetter',
-    55195: 'ALetter',
-    55196: 'ALetter',
-    55197: 'ALetter',
-    55198: 'ALetter',
-    55199: 'ALetter',
-    55200: 'ALetter',
-    55201: 'ALetter',
-    55202: 'ALetter',
-    55203: 'ALetter',
-    64048: 'ALetter',
-    64049: 'ALetter',
-    64050: 'ALetter',
-    64051: 'ALetter',
-    64052: 'ALetter',
-    64053: 'ALetter',
-    64054: 'ALetter',
-    64055: 'ALetter',
-    64056: 'ALetter',
-    64057: 'ALetter',
-    64058: 'ALetter',
-    64059: 'ALetter',
-    64060: 'ALetter',
-    64061: 'ALetter',
-    64062: 'ALetter',
-    64063: 'ALetter',
-    64064: 'ALetter',
-    64065: 'ALetter',
-    64066: 'ALetter',
-    64067: 'ALetter',
-    64068: 'ALetter',
-    64069: 'ALetter',
-    64070: 'ALetter',
-    64071: 'ALetter',
-    64072: 'ALetter',
-    64073: 'ALetter',
-    64074: 'ALetter',
-    64075: 'ALetter',
-    64076: 'ALetter',
-    64077: 'ALetter',
-    64078: 'ALetter',
-    64079: 'ALetter',
-    64080: 'ALetter',
-    64081: 'ALetter',
-    64082: 'ALetter',
-    64083: 'ALetter',
-    64084: 'ALetter',
-    64085: 'ALetter',
-    64086: 'ALetter',
-    64087: 'ALetter',
-    64088: 'ALetter',
-    64089: 'ALetter',
-    64090: 'ALetter',
-    64091: 'ALetter',
-    64092: 'ALetter',
-    64093: 'ALetter',
-    64094: 'ALetter',
-    64095: 'ALetter',
-    64096: 'ALetter',
-    64097: 'ALetter',
-    64098: 'ALetter',
-    64099: 'ALetter',
-    64100: 'ALetter',
-    64101: 'ALetter',
-    64102: 'ALetter',
-    64103: 'ALetter',
-    64104: 'ALetter',
-    64105: 'ALetter',
-    64106: 'ALetter',
-    64256: 'ALetter',
-    64257: 'ALetter',
-    64258: 'ALetter',
-    64259: 'ALetter',
-    64260: 'ALetter',
-    64261: 'ALetter',
-    64262: 'ALetter',
-    64275: 'ALetter',
-    64276: 'ALetter',
-    64277: 'ALetter',
-    64278: 'ALetter',
-    64279: 'ALetter',
-    64285: 'ALetter',
-    64287: 'ALetter',
-    64288: 'ALetter',
-    64289: 'ALetter',
-    64290: 'ALetter',
-    64291: 'ALetter',
-    64292: 'ALetter',
-    64293: 'ALetter',
-    64294: 'ALetter',
-    64295: 'ALetter',
-    64296: 'ALetter',
-    64298: 'ALetter',
-    64299: 'ALetter',
-    64300: 'ALetter',
-    64301: 'ALetter',
-    64302: 'ALetter',
-    64303: 'ALetter',
-    64304: 'ALetter',
-    64305: 'ALetter',
-    64306: 'ALetter',
-    64307: 'ALetter',
-    64308: 'ALetter',
-    64309: 'ALetter',
-    64310: 'ALetter',
-    64312: 'ALetter',
-    64313: 'ALetter',
-    64314: 'ALetter',
-    64315: 'ALetter',
-    64316: 'ALetter',
-    64318: 'ALetter',
-    64320: 'ALetter',
-    64321: 'ALetter',
-    64323: 'ALetter',
-    64324: 'ALetter',
-    64326: 'ALetter',
-    64327: 'ALetter',
-    64328: 'ALetter',
-    64329: 'ALetter',
-    64330: 'ALetter',
-    64331: 'ALetter',
-    64332: 'ALetter',
-    64333: 'ALetter',
-    64334: 'ALetter',
-    64335: 'ALetter',
-    64336: 'ALetter',
-    64337: 'ALetter',
-    64338: 'ALetter',
-    64339: 'ALetter',
-    64340: 'ALetter',
-    64341: 'ALetter',
-    64342: 'ALetter',
-    64343: 'ALetter',
-    64344: 'ALetter',
-    64345: 'ALetter',
-    64346: 'ALetter',
-    64347: 'ALetter',
-    64348: 'ALetter',
-    64349: 'ALetter',
-    64350: 'ALetter',
-    64351: 'ALetter',
-    64352: 'ALetter',
-    64353: 'ALetter',
-    64354: 'ALetter',
-    64355: 'ALetter',
-    64356: 'ALetter',
-    64357: 'ALetter',
-    64358: 'ALetter',
-    64359: 'ALetter',
-    64360: 'ALetter',
-    64361: 'ALetter',
-    64362: 'ALetter',
-    64363: 'ALetter',
-    64364: 'ALetter',
-    64365: 'ALetter',
-    64366: 'ALetter',
-    64367: 'ALetter',
-    64368: 'ALetter',
-    64369: 'ALetter',
-    64370: 'ALetter',
-    64371: 'ALetter',
-    64372: 'ALetter',
-    64373: 'ALetter',
-    64374: 'ALetter',
-    64375: 'ALetter',
-    64376: 'ALetter',
-    64377: 'ALetter',
-    64378: 'ALetter',
-    64379: 'ALetter',
-    64380: 'ALetter',
-    64381: 'ALetter',
-    64382: 'ALetter',
-    64383: 'ALetter',
-    64384: 'ALetter',
-    64385: 'ALetter',
-    64386: 'ALetter',
-    64387: 'ALetter',
-    64388: 'ALetter',
-    64389: 'ALetter',
-    64390: 'ALetter',
-    64391: 'ALetter',
-    64392: 'ALetter',
-    64393: 'ALetter',
-    64394: 'ALetter',
-    64395: 'ALetter',
-    64396: 'ALetter',
-    64397: 'ALetter',
-    64398: 'ALetter',
-    64399: 'ALetter',
-    64400: 'ALetter',
-    64401: 'ALetter',
-    64402: 'ALetter',
-    64403: 'ALetter',
-    64404: 'ALetter',
-    64405: 'ALetter',
-    64406: 'ALetter',
-    64407: 'ALetter',
-    64408: 'ALetter',
-    64409: 'ALetter',
-    64410: 'ALetter',
-    64411: 'ALetter',
-    64412: 'ALetter',
-    64413: 'ALetter',
-    64414: 'ALetter',
-    64415: 'ALetter',
-    64416: 'ALetter',
-    64417: 'ALetter',
-    64418: 'ALetter',
-    64419: 'ALetter',
-    64420: 'ALetter',
-    64421: 'ALetter',
-    64422: 'ALetter',
-    64423: 'ALetter',
-    64424: 'ALetter',
-    64425: 'ALetter',
-    64426: 'ALetter',
-    64427: 'ALetter',
-    64428: 'ALetter',
-    64429: 'ALetter',
-    64430: 'ALetter',
-    64431: 'ALetter',
-    64432: 'ALetter',
-    64433: 'ALetter',
-    64467: 'ALetter',
-    64468: 'ALetter',
-    64469: 'ALetter',
-    64470: 'ALetter',
-    64471: 'ALetter',
-    64472: 'ALetter',
-    64473: 'ALetter',
-    64474: 'ALetter',
-    64475: 'ALetter',
-    64476: 'ALetter',
-    64477: 'ALetter',
-    64478: 'ALetter',
-    64479: 'ALetter',
-    64480: 'ALetter',
-    64481: 'ALetter',
-    64482: 'ALetter',
-    64483: 'ALetter',
-    64484: 'ALetter',
-    64485: 'ALetter',
-    64486: 'ALetter',
-    64487: 'ALetter',
-    64488: 'ALetter',
-    64489: 'ALetter',
-    64490: 'ALetter',
-    64491: 'ALetter',
-    64492: 'ALetter',
-    64493: 'ALetter',
-    64494: 'ALetter',
-    64495: 'ALetter',
-    64496: 'ALetter',
-    64497: 'ALetter',
-    64498: 'ALetter',
-    64499: 'ALetter',
-    64500: 'ALetter',
-    64501: 'ALetter',
-    64502: 'ALetter',
-    64503: 'ALetter',
-    64504: 'ALetter',
-    64505: 'ALetter',
-    64506: 'ALetter',
-    64507: 'ALetter',
-    64508: 'ALetter',
-    64509: 'ALetter',
-    64510: 'ALetter',
-    64511: 'ALetter',
-    64512: 'ALetter',
-    64513: 'ALetter',
-    64514: 'ALetter',
-    64515: 'ALetter',
-    64516: 'ALetter',
-    64517: 'ALetter',
-    64518: 'ALetter',
-    64519: 'ALetter',
-    64520: 'ALetter',
-    64521: 'ALetter',
-    64522: 'ALetter',
-    64523: 'ALetter',
-    64524: 'ALetter',
-    64525: 'ALetter',
-    64526: 'ALetter',
-    64527: 'ALetter',
-    64528: 'ALetter',
-    64529: 'ALetter',
-    64530: 'ALetter',
-    64531: 'ALetter',
-    64532: 'ALetter',
-    64533: 'ALetter',
-    64534: 'ALetter',
-    64535: 'ALetter',
-    64536: 'ALetter',
-    64537: 'ALetter',
-    64538: 'ALetter',
-    64539: 'ALetter',
-    64540: 'ALetter',
-    64541: 'ALetter',
-    64542: 'ALetter',
-    64543: 'ALetter',
-    64544: 'ALetter',
-    64545: 'ALetter',
-    64546: 'ALetter',
-    64547: 'ALetter',
-    64548: 'ALetter',
-    64549: 'ALetter',
-    64550: 'ALetter',
-    64551: 'ALetter',
-    64552: 'ALetter',
-    64553: 'ALetter',
-    64554: 'ALetter',
-    64555: 'ALetter',
-    64556: 'ALetter',
-    64557: 'ALetter',
-    64558: 'ALetter',
-    64559: 'ALetter',
-    64560: 'ALetter',
-    64561: 'ALetter',
-    64562: 'ALetter',
-    64563: 'ALetter',
-    64564: 'ALetter',
-    64565: 'ALetter',
-    64566: 'ALetter',
-    64567: 'ALetter',
-    64568: 'ALetter',
-    64569: 'ALetter',
-    64570: 'ALetter',
-    64571: 'ALetter',
-    64572: 'ALetter',
-    64573: 'ALetter',
-    64574: 'ALetter',
-    64575: 'ALetter',
-    64576: 'ALetter',
-    64577: 'ALetter',
-    64578: 'ALetter',
-    64579: 'ALetter',
-    64580: 'ALetter',
-    64581: 'ALetter',
-    64582: 'ALetter',
-    64583: 'ALetter',
-    64584: 'ALetter',
-    64585: 'ALetter',
-    64586: 'ALetter',
-    64587: 'ALetter',
-    64588: 'ALetter',
-    64589: 'ALetter',
-    64590: 'ALetter',
-    64591: 'ALetter',
-    64592: 'ALetter',
-    64593: 'ALetter',
-    64594: 'ALetter',
-    64595: 'ALetter',
-    64596: 'ALetter',
-    64597: 'ALetter',
-    64598: 'ALetter',
-    64599: 'ALetter',
-    64600: 'ALetter',
-    64601: 'ALetter',
-    64602: 'ALetter',
-    64603: 'ALetter',
-    64604: 'ALetter',
-    64605: 'ALetter',
-    64606: 'ALetter',
-    64607: 'ALetter',
-    64608: 'ALetter',
-    64609: 'ALetter',
-    64610: 'ALetter',
-    64611: 'ALetter',
-    64612: 'ALetter',
-    64613: 'ALetter',
-    64614: 'ALetter',
-    64615: 'ALetter',
-    64616: 'ALetter',
-    64617: 'ALetter',
-    64618: 'ALetter',
-    64619: 'ALetter',
-    64620: 'ALetter',
-    64621: 'ALetter',
-    64622: 'ALetter',
-    64623: 'ALetter',
-    64624: 'ALetter',
-    64625: 'ALetter',
-    64626: 'ALetter',
-    64627: 'ALetter',
-    64628: 'ALetter',
-    64629: 'ALetter',
-    64630: 'ALetter',
-    64631: 'ALetter',
-    64632: 'ALetter',
-    64633: 'ALetter',
-    64634: 'ALetter',
-    64635: 'ALetter',
-    64636: 'ALetter',
-    64637: 'ALetter',
-    64638: 'ALetter',
-    64639: 'ALetter',
-    64640: 'ALetter',
-    64641: 'ALetter',
-    64642: 'ALetter',
-    64643: 'ALetter',
-    64644: 'ALetter',
-    64645: 'ALetter',
-    64646: 'ALetter',
-    64647: 'ALetter',
-    64648: 'ALetter',
-    64649: 'ALetter',
-    64650: 'ALetter',
-    64651: 'ALetter',
-    64652: 'ALetter',
-    64653: 'ALetter',
-    64654: 'ALetter',
-    64655: 'ALetter',
-    64656: 'ALetter',
-    64657: 'ALetter',
-    64658: 'ALetter',
-    64659: 'ALetter',
-    64660: 'ALetter',
-    64661: 'ALetter',
-    64662: 'ALetter',
-    64663: 'ALetter',
-    64664: 'ALetter',
-    64665: 'ALetter',
-    64666: 'ALetter',
-    64667: 'ALetter',
-    64668: 'ALetter',
-    64669: 'ALetter',
-    64670: 'ALetter',
-    64671: 'ALetter',
-    64672: 'ALetter',
-    64673: 'ALetter',
-    64674: 'ALetter',
-    64675: 'ALetter',
-    64676: 'ALetter',
-    64677: 'ALetter',
-    64678: 'ALetter',
-    64679: 'ALetter',
-    64680: 'ALetter',
-    64681: 'ALetter',
-    64682: 'ALetter',
-    64683: 'ALetter',
-    64684: 'ALetter',
-    64685: 'ALetter',
-    64686: 'ALetter',
-    64687: 'ALetter',
-    64688: 'ALetter',
-    64689: 'ALetter',
-    64690: 'ALetter',
-    64691: 'ALetter',
-    64692: 'ALetter',
-    64693: 'ALetter',
-    64694: 'ALetter',
-    64695: 'ALetter',
-    64696: 'ALetter',
-    64697: 'ALetter',
-    64698: 'ALetter',
-    64699: 'ALetter',
-    64700: 'ALetter',
-    64701: 'ALetter',
-    64702: 'ALetter',
-    64703: 'ALetter',
-    64704: 'ALetter',
-    64705: 'ALetter',
-    64706: 'ALetter',
-    64707: 'ALetter',
-    64708: 'ALetter',
-    64709: 'ALetter',
-    64710: 'ALetter',
-    64711: 'ALetter',
-    64712: 'ALetter',
-    64713: 'ALetter',
-    64714: 'ALetter',
-    64715: 'ALetter',
-    64716: 'ALetter',
-    64717: 'ALetter',
-    64718: 'ALetter',
-    64719: 'ALetter',
-    64720: 'ALetter',
-    64721: 'ALetter',
-    64722: 'ALetter',
-    64723: 'ALetter',
-    64724: 'ALetter',
-    64725: 'ALetter',
-    64726: 'ALetter',
-    64727: 'ALetter',
-    64728: 'ALetter',
-    64729: 'ALetter',
-    64730: 'ALetter',
-    64731: 'ALetter',
-    64732: 'ALetter',
-    64733: 'ALetter',
-    64734: 'ALetter',
-    64735: 'ALetter',
-    64736: 'ALetter',
-    64737: 'ALetter',
-    64738: 'ALetter',
-    64739: 'ALetter',
-    64740: 'ALetter',
-    64741: 'ALetter',
-    64742: 'ALetter',
-    64743: 'ALetter',
-    64744: 'ALetter',
-    64745: 'ALetter',
-    64746: 'ALetter',
-    64747: 'ALetter',
-    64748: 'ALetter',
-    64749: 'ALetter',
-    64750: 'ALetter',
-    64751: 'ALetter',
-    64752: 'ALetter',
-    64753: 'ALetter',
-    64754: 'ALetter',
-    64755: 'ALetter',
-    64756: 'ALetter',
-    64757: 'ALetter',
-    64758: 'ALetter',
-    64759: 'ALetter',
-    64760: 'ALetter',
-    64761: 'ALetter',
-    64762: 'ALetter',
-    64763: 'ALetter',
-    64764: 'ALetter',
-    64765: 'ALetter',
-    64766: 'ALetter',
-    64767: 'ALetter',
-    64768: 'ALetter',
-    64769: 'ALetter',
-    64770: 'ALetter',
-    64771: 'ALetter',
-    64772: 'ALetter',
-    64773: 'ALetter',
-    64774: 'ALetter',
-    64775: 'ALetter',
-    64776: 'ALetter',
-    64777: 'ALetter',
-    64778: 'ALetter',
-    64779: 'ALetter',
-    64780: 'ALetter',
-    64781: 'ALetter',
-    64782: 'ALetter',
-    64783: 'ALetter',
-    64784: 'ALetter',
-    64785: 'ALetter',
-    64786: 'ALetter',
-    64787: 'ALetter',
-    64788: 'ALetter',
-    64789: 'ALetter',
-    64790: 'ALetter',
-    64791: 'ALetter',
-    64792: 'ALetter',
-    64793: 'ALetter',
-    64794: 'ALetter',
-    64795: 'ALetter',
-    64796: 'ALetter',
-    64797: 'ALetter',
-    64798: 'ALetter',
-    64799: 'ALetter',
-    64800: 'ALetter',
-    64801: 'ALetter',
-    64802: 'ALetter',
-    64803: 'ALetter',
-    64804: 'ALetter',
-    64805: 'ALetter',
-    64806: 'ALetter',
-    64807: 'ALetter',
-    64808: 'ALetter',
-    64809: 'ALetter',
-    64810: 'ALetter',
-    64811: 'ALetter',
-    64812: 'ALetter',
-    64813: 'ALetter',
-    64814: 'ALetter',
-    64815: 'ALetter',
-    64816: 'ALetter',
-    64817: 'ALetter',
-    64818: 'ALetter',
-    64819: 'ALetter',
-    64820: 'ALetter',
-    64821: 'ALetter',
-    64822: 'ALetter',
-    64823: 'ALetter',
-    64824: 'ALetter',
-    64825: 'ALetter',
-    64826: 'ALetter',
-    64827: 'ALetter',
-    64828: 'ALetter',
-    64829: 'ALetter',
-    64848: 'ALetter',
-    64849: 'ALetter',
-    64850: 'ALetter',
-    64851: 'ALetter',
-    64852: 'ALetter',
-    64853: 'ALetter',
-    64854: 'ALetter',
-    64855: 'ALetter',
-    64856: 'ALetter',
-    64857: 'ALetter',
-    64858: 'ALetter',
-    64859: 'ALetter',
-    64860: 'ALetter',
-    64861: 'ALetter',
-    64862: 'ALetter',
-    64863: 'ALetter',
-    64864: 'ALetter',
-    64865: 'ALetter',
-    64866: 'ALetter',
-    64867: 'ALetter',
-    64868: 'ALetter',
-    64869: 'ALetter',
-    64870: 'ALetter',
-    64871: 'ALetter',
-    64872: 'ALetter',
-    64873: 'ALetter',
-    64874: 'ALetter',
-    64875: 'ALetter',
-    64876: 'ALetter',
-    64877: 'ALetter',
-    64878: 'ALetter',
-    64879: 'ALetter',
-    64880: 'ALetter',
-    64881: 'ALetter',
-    64882: 'ALetter',
-    64883: 'ALetter',
-    64884: 'ALetter',
-    64885: 'ALetter',
-    64886: 'ALetter',
-    64887: 'ALetter',
-    64888: 'ALetter',
-    64889: 'ALetter',
-    64890: 'ALetter',
-    64891: 'ALetter',
-    64892: 'ALetter',
-    64893: 'ALetter',
-    64894: 'ALetter',
-    64895: 'ALetter',
-    64896: 'ALetter',
-    64897: 'ALetter',
-    64898: 'ALetter',
-    64899: 'ALetter',
-    64900: 'ALetter',
-    64901: 'ALetter',
-    64902: 'ALetter',
-    64903: 'ALetter',
-    64904: 'ALetter',
-    64905: 'ALetter',
-    64906: 'ALetter',
-    64907: 'ALetter',
-    64908: 'ALetter',
-    64909: 'ALetter',
-    64910: 'ALetter',
-    64911: 'ALetter',
-    64914: 'ALetter',
-    64915: 'ALetter',
-    64916: 'ALetter',
-    64917: 'ALetter',
-    64918: 'ALetter',
-    64919: 'ALetter',
-    64920: 'ALetter',
-    64921: 'ALetter',
-    64922: 'ALetter',
-    64923: 'ALetter',
-    64924: 'ALetter',
-    64925: 'ALetter',
-    64926: 'ALetter',
-    64927: 'ALetter',
-    64928: 'ALetter',
-    64929: 'ALetter',
-    64930: 'ALetter',
-    64931: 'ALetter',
-    64932: 'ALetter',
-    64933: 'ALetter',
-    64934: 'ALetter',
-    64935: 'ALetter',
-    64936: 'ALetter',
-    64937: 'ALetter',
-    64938: 'ALetter',
-    64939: 'ALetter',
-    64940: 'ALetter',
-    64941: 'ALetter',
-    64942: 'ALetter',
-    64943: 'ALetter',
-    64944: 'ALetter',
-    64945: 'ALetter',
-    64946: 'ALetter',
-    64947: 'ALetter',
-    64948: 'ALetter',
-    64949: 'ALetter',
-    64950: 'ALetter',
-    64951: 'ALetter',
-    64952: 'ALetter',
-    64953: 'ALetter',
-    64954: 'ALetter',
-    64955: 'ALetter',
-    64956: 'ALetter',
-    64957: 'ALetter',
-    64958: 'ALetter',
-    64959: 'ALetter',
-    64960: 'ALetter',
-    64961: 'ALetter',
-    64962: 'ALetter',
-    64963: 'ALetter',
-    64964: 'ALetter',
-    64965: 'ALetter',
-    64966: 'ALetter',
-    64967: 'ALetter',
-    65008: 'ALetter',
-    65009: 'ALetter',
-    65010: 'ALetter',
-    65011: 'ALetter',
-    65012: 'ALetter',
-    65013: 'ALetter',
-    65014: 'ALetter',
-    65015: 'ALetter',
-    65016: 'ALetter',
-    65017: 'ALetter',
-    65018: 'ALetter',
-    65019: 'ALetter',
-    65040: 'MidNum',
-    65043: 'MidNum',
-    65044: 'MidNum',
-    65075: 'ExtendNumLet',
-    65076: 'ExtendNumLet',
-    65101: 'ExtendNumLet',
-    65102: 'ExtendNumLet',
-    65103: 'ExtendNumLet',
-    65136: 'ALetter',
-    65137: 'ALetter',
-    65138: 'ALetter',
-    65139: 'ALetter',
-    65140: 'ALetter',
-    65142: 'ALetter',
-    65143: 'ALetter',
-    65144: 'ALetter',
-    65145: 'ALetter',
-    65146: 'ALetter',
-    65147: 'ALetter',
-    65148: 'ALetter',
-    65149: 'ALetter',
-    65150: 'ALetter',
-    65151: 'ALetter',
-    65152: 'ALetter',
-    65153: 'ALetter',
-    65154: 'ALetter',
-    65155: 'ALetter',
-    65156: 'ALetter',
-    65157: 'ALetter',
-    65158: 'ALetter',
-    65159: 'ALetter',
-    65160: 'ALetter',
-    65161: 'ALetter',
-    65162: 'ALetter',
-    65163: 'ALetter',
-    65164: 'ALetter',
-    65165: 'ALetter',
-    65166: 'ALetter',
-    65167: 'ALetter',
-    65168: 'ALetter',
-    65169: 'ALetter',
-    65170: 'ALetter',
-    65171: 'ALetter',
-    65172: 'ALetter',
-    65173: 'ALetter',
-    65174: 'ALetter',
-    65175: 'ALetter',
-    65176: 'ALetter',
-    65177: 'ALetter',
-    65178: 'ALetter',
-    65179: 'ALetter',
-    65180: 'ALetter',
-    65181: 'ALetter',
-    65182: 'ALetter',
-    65183: 'ALetter',
-    65184: 'ALetter',
-    65185: 'ALetter',
-    65186: 'ALetter',
-    65187: 'ALetter',
-    65188: 'ALetter',
-    65189: 'ALetter',
-    65190: 'ALetter',
-    65191: 'ALetter',
-    65192: 'ALetter',
-    65193: 'ALetter',
-    65194: 'ALetter',
-    65195: 'ALetter',
-    65196: 'ALetter',
-    65197: 'ALetter',
-    65198: 'ALetter',
-    65199: 'ALetter',
-    65200: 'ALetter',
-    65201: 'ALetter',
-    65202: 'ALetter',
-    65203: 'ALetter',
-    65204: 'ALetter',
-    65205: 'ALetter',
-    65206: 'ALetter',
-    65207: 'ALetter',
-    65208: 'ALetter',
-    65209: 'ALetter',
-    65210: 'ALetter',
-    65211: 'ALetter',
-    65212: 'ALetter',
-    65213: 'ALetter',
-    65214: 'ALetter',
-    65215: 'ALetter',
-    65216: 'ALetter',
-    65217: 'ALetter',
-    65218: 'ALetter',
-    65219: 'ALetter',
-    65220: 'ALetter',
-    65221: 'ALetter',
-    65222: 'ALetter',
-    65223: 'ALetter',
-    65224: 'ALetter',
-    65225: 'ALetter',
-    65226: 'ALetter',
-    65227: 'ALetter',
-    65228: 'ALetter',
-    65229: 'ALetter',
-    65230: 'ALetter',
-    65231: 'ALetter',
-    65232: 'ALetter',
-    65233: 'ALetter',
-    65234: 'ALetter',
-    65235: 'ALetter',
-    65236: 'ALetter',
-    65237: 'ALetter',
-    65238: 'ALetter',
-    65239: 'ALetter',
-    65240: 'ALetter',
-    65241: 'ALetter',
-    65242: 'ALetter',
-    65243: 'ALetter',
-    65244: 'ALetter',
-    65245: 'ALetter',
-    65246: 'ALetter',
-    65247: 'ALetter',
-    65248: 'ALetter',
-    65249: 'ALetter',
-    65250: 'ALetter',
-    65251: 'ALetter',
-    65252: 'ALetter',
-    65253: 'ALetter',
-    65254: 'ALetter',
-    65255: 'ALetter',
-    65256: 'ALetter',
-    65257: 'ALetter',
-    65258: 'ALetter',
-    65259: 'ALetter',
-    65260: 'ALetter',
-    65261: 'ALetter',
-    65262: 'ALetter',
-    65263: 'ALetter',
-    65264: 'ALetter',
-    65265: 'ALetter',
-    65266: 'ALetter',
-    65267: 'ALetter',
-    65268: 'ALetter',
-    65269: 'ALetter',
-    65270: 'ALetter',
-    65271: 'ALetter',
-    65272: 'ALetter',
-    65273: 'ALetter',
-    65274: 'ALetter',
-    65275: 'ALetter',
-    65276: 'ALetter',
-    65279: 'Format',
-    65313: 'ALetter',
-    65314: 'ALetter',
-    65315: 'ALetter',
-    65316: 'ALetter',
-    65317: 'ALetter',
-    65318: 'ALetter',
-    65319: 'ALetter',
-    65320: 'ALetter',
-    65321: 'ALetter',
-    65322: 'ALetter',
-    65323: 'ALetter',
-    65324: 'ALetter',
-    65325: 'ALetter',
-    65326: 'ALetter',
-    65327: 'ALetter',
-    65328: 'ALetter',
-    65329: 'ALetter',
-    65330: 'ALetter',
-    65331: 'ALetter',
-    65332: 'ALetter',
-    65333: 'ALetter',
-    65334: 'ALetter',
-    65335: 'ALetter',
-    65336: 'ALetter',
-    65337: 'ALetter',
-    65338: 'ALetter',
-    65343: 'ExtendNumLet',
-    65345: 'ALetter',
-    65346: 'ALetter',
-    65347: 'ALetter',
-    65348: 'ALetter',
-    65349: 'ALetter',
-    65350: 'ALetter',
-    65351: 'ALetter',
-    65352: 'ALetter',
-    65353: 'ALetter',
-    65354: 'ALetter',
-    65355: 'ALetter',
-    65356: 'ALetter',
-    65357: 'ALetter',
-    65358: 'ALetter',
-    65359: 'ALetter',
-    65360: 'ALetter',
-    65361: 'ALetter',
-    65362: 'ALetter',
-    65363: 'ALetter',
-    65364: 'ALetter',
-    65365: 'ALetter',
-    65366: 'ALetter',
-    65367: 'ALetter',
-    65368: 'ALetter',
-    65369: 'ALetter',
-    65370: 'ALetter',
-    65382: 'Katakana',
-    65383: 'Katakana',
-    65384: 'Katakana',
-    65385: 'Katakana',
-    65386: 'Katakana',
-    65387: 'Katakana',
-    65388: 'Katakana',
-    65389: 'Katakana',
-    65390: 'Katakana',
-    65391: 'Katakana',
-    65392: 'Katakana',
-    65393: 'Katakana',
-    65394: 'Katakana',
-    65395: 'Katakana',
-    65396: 'Katakana',
-    65397: 'Katakana',
-    65398: 'Katakana',
-    65399: 'Katakana',
-    65400: 'Katakana',
-    65401: 'Katakana',
-    65402: 'Katakana',
-    65403: 'Katakana',
-    65404: 'Katakana',
-    65405: 'Katakana',
-    65406: 'Katakana',
-    65407: 'Katakana',
-    65408: 'Katakana',
-    65409: 'Katakana',
-    65410: 'Katakana',
-    65411: 'Katakana',
-    65412: 'Katakana',
-    65413: 'Katakana',
-    65414: 'Katakana',
-    65415: 'Katakana',
-    65416: 'Katakana',
-    65417: 'Katakana',
-    65418: 'Katakana',
-    65419: 'Katakana',
-    65420: 'Katakana',
-    65421: 'Katakana',
-    65422: 'Katakana',
-    65423: 'Katakana',
-    65424: 'Katakana',
-    65425: 'Katakana',
-    65426: 'Katakana',
-    65427: 'Katakana',
-    65428: 'Katakana',
-    65429: 'Katakana',
-    65430: 'Katakana',
-    65431: 'Katakana',
-    65432: 'Katakana',
-    65433: 'Katakana',
-    65434: 'Katakana',
-    65435: 'Katakana',
-    65436: 'Katakana',
-    65437: 'Katakana',
-    65438: 'Katakana',
-    65439: 'Katakana',
-    65440: 'ALetter',
-    65441: 'ALetter',
-    65442: 'ALetter',
-    65443: 'ALetter',
-    65444: 'ALetter',
-    65445: 'ALetter',
-    65446: 'ALetter',
-    65447: 'ALetter',
-    65448: 'ALetter',
-    65449: 'ALetter',
-    65450: 'ALetter',
-    65451: 'ALetter',
-    65452: 'ALetter',
-    65453: 'ALetter',
-    65454: 'ALetter',
-    65455: 'ALetter',
-    65456: 'ALetter',
-    65457: 'ALetter',
-    65458: 'ALetter',
-    65459: 'ALetter',
-    65460: 'ALetter',
-    65461: 'ALetter',
-    65462: 'ALetter',
-    65463: 'ALetter',
-    65464: 'ALetter',
-    65465: 'ALetter',
-    65466: 'ALetter',
-    65467: 'ALetter',
-    65468: 'ALetter',
-    65469: 'ALetter',
-    65470: 'ALetter',
-    65474: 'ALetter',
-    65475: 'ALetter',
-    65476: 'ALetter',
-    65477: 'ALetter',
-    65478: 'ALetter',
-    65479: 'ALetter',
-    65482: 'ALetter',
-    65483: 'ALetter',
-    65484: 'ALetter',
-    65485: 'ALetter',
-    65486: 'ALetter',
-    65487: 'ALetter',
-    65490: 'ALetter',
-    65491: 'ALetter',
-    65492: 'ALetter',
-    65493: 'ALetter',
-    65494: 'ALetter',
-    65495: 'ALetter',
-    65498: 'ALetter',
-    65499: 'ALetter',
-    65500: 'ALetter',
-    65529: 'Format',
-    65530: 'Format',
-    65531: 'Format',
-    65536: 'ALetter',
-    65537: 'ALetter',
-    65538: 'ALetter',
-    65539: 'ALetter',
-    65540: 'ALetter',
-    65541: 'ALetter',
-    65542: 'ALetter',
-    65543: 'ALetter',
-    65544: 'ALetter',
-    65545: 'ALetter',
-    65546: 'ALetter',
-    65547: 'ALetter',
-    65549: 'ALetter',
-    65550: 'ALetter',
-    65551: 'ALetter',
-    65552: 'ALetter',
-    65553: 'ALetter',
-    65554: 'ALetter',
-    65555: 'ALetter',
-    65556: 'ALetter',
-    65557: 'ALetter',
-    65558: 'ALetter',
-    65559: 'ALetter',
-    65560: 'ALetter',
-    65561: 'ALetter',
-    65562: 'ALetter',
-    65563: 'ALetter',
-    65564: 'ALetter',
-    65565: 'ALetter',
-    65566: 'ALetter',
-    65567: 'ALetter',
-    65568: 'ALetter',
-    65569: 'ALetter',
-    65570: 'ALetter',
-    65571: 'ALetter',
-    65572: 'ALetter',
-    65573: 'ALetter',
-    65574: 'ALetter',
-    65576: 'ALetter',
-    65577: 'ALetter',
-    65578: 'ALetter',
-    65579: 'ALetter',
-    65580: 'ALetter',
-    65581: 'ALetter',
-    65582: 'ALetter',
-    65583: 'ALetter',
-    65584: 'ALetter',
-    65585: 'ALetter',
-    65586: 'ALetter',
-    65587: 'ALetter',
-    65588: 'ALetter',
-    65589: 'ALetter',
-    65590: 'ALetter',
-    65591: 'ALetter',
-    65592: 'ALetter',
-    65593: 'ALetter',
-    65594: 'ALetter',
-    65596: 'ALetter',
-    65597: 'ALetter',
-    65599: 'ALetter',
-    65600: 'ALetter',
-    65601: 'ALetter',
-    65602: 'ALetter',
-    65603: 'ALetter',
-    65604: 'ALetter',
-    65605: 'ALetter',
-    65606: 'ALetter',
-    65607: 'ALetter',
-    65608: 'ALetter',
-    65609: 'ALetter',
-    65610: 'ALetter',
-    65611: 'ALetter',
-    65612: 'ALetter',
-    65613: 'ALetter',
-    65616: 'ALetter',
-    65617: 'ALetter',
-    65618: 'ALetter',
-    65619: 'ALetter',
-    65620: 'ALetter',
-    65621: 'ALetter',
-    65622: 'ALetter',
-    65623: 'ALetter',
-    65624: 'ALetter',
-    65625: 'ALetter',
-    65626: 'ALetter',
-    65627: 'ALetter',
-    65628: 'ALetter',
-    65629: 'ALetter',
-    65664: 'ALetter',
-    65665: 'ALetter',
-    65666: 'ALetter',
-    65667: 'ALetter',
-    65668: 'ALetter',
-    65669: 'ALetter',
-    65670: 'ALetter',
-    65671: 'ALetter',
-    65672: 'ALetter',
-    65673: 'ALetter',
-    65674: 'ALetter',
-    65675: 'ALetter',
-    65676: 'ALetter',
-    65677: 'ALetter',
-    65678: 'ALetter',
-    65679: 'ALetter',
-    65680: 'ALetter',
-    65681: 'ALetter',
-    65682: 'ALetter',
-    65683: 'ALetter',
-    65684: 'ALetter',
-    65685: 'ALetter',
-    65686: 'ALetter',
-    65687: 'ALetter',
-    65688: 'ALetter',
-    65689: 'ALetter',
-    65690: 'ALetter',
-    65691: 'ALetter',
-    65692: 'ALetter',
-    65693: 'ALetter',
-    65694: 'ALetter',
-    65695: 'ALetter',
-    65696: 'ALetter',
-    65697: 'ALetter',
-    65698: 'ALetter',
-    65699: 'ALetter',
-    65700: 'ALetter',
-    65701: 'ALetter',
-    65702: 'ALetter',
-    65703: 'ALetter',
-    65704: 'ALetter',
-    65705: 'ALetter',
-    65706: 'ALetter',
-    65707: 'ALetter',
-    65708: 'ALetter',
-    65709: 'ALetter',
-    65710: 'ALetter',
-    65711: 'ALetter',
-    65712: 'ALetter',
-    65713: 'ALetter',
-    65714: 'ALetter',
-    65715: 'ALetter',
-    65716: 'ALetter',
-    65717: 'ALetter',
-    65718: 'ALetter',
-    65719: 'ALetter',
-    65720: 'ALetter',
-    65721: 'ALetter',
-    65722: 'ALetter',
-    65723: 'ALetter',
-    65724: 'ALetter',
-    65725: 'ALetter',
-    65726: 'ALetter',
-    65727: 'ALetter',
-    65728: 'ALetter',
-    65729: 'ALetter',
-    65730: 'ALetter',
-    65731: 'ALetter',
-    65732: 'ALetter',
-    65733: 'ALetter',
-    65734: 'ALetter',
-    65735: 'ALetter',
-    65736: 'ALetter',
-    65737: 'ALetter',
-    65738: 'ALetter',
-    65739: 'ALetter',
-    65740: 'ALetter',
-    65741: 'ALetter',
-    65742: 'ALetter',
-    65743: 'ALetter',
-    65744: 'ALetter',
-    65745: 'ALetter',
-    65746: 'ALetter',
-    65747: 'ALetter',
-    65748: 'ALetter',
-    65749: 'ALetter',
-    65750: 'ALetter',
-    65751: 'ALetter',
-    65752: 'ALetter',
-    65753: 'ALetter',
-    65754: 'ALetter',
-    65755: 'ALetter',
-    65756: 'ALetter',
-    65757: 'ALetter',
-    65758: 'ALetter',
-    65759: 'ALetter',
-    65760: 'ALetter',
-    65761: 'ALetter',
-    65762: 'ALetter',
-    65763: 'ALetter',
-    65764: 'ALetter',
-    65765: 'ALetter',
-    65766: 'ALetter',
-    65767: 'ALetter',
-    65768: 'ALetter',
-    65769: 'ALetter',
-    65770: 'ALetter',
-    65771: 'ALetter',
-    65772: 'ALetter',
-    65773: 'ALetter',
-    65774: 'ALetter',
-    65775: 'ALetter',
-    65776: 'ALetter',
-    65777: 'ALetter',
-    65778: 'ALetter',
-    65779: 'ALetter',
-    65780: 'ALetter',
-    65781: 'ALetter',
-    65782: 'ALetter',
-    65783: 'ALetter',
-    65784: 'ALetter',
-    65785: 'ALetter',
-    65786: 'ALetter',
-    65856: 'ALetter',
-    65857: 'ALetter',
-    65858: 'ALetter',
-    65859: 'ALetter',
-    65860: 'ALetter',
-    65861: 'ALetter',
-    65862: 'ALetter',
-    65863: 'ALetter',
-    65864: 'ALetter',
-    65865: 'ALetter',
-    65866: 'ALetter',
-    65867: 'ALetter',
-    65868: 'ALetter',
-    65869: 'ALetter',
-    65870: 'ALetter',
-    65871: 'ALetter',
-    65872: 'ALetter',
-    65873: 'ALetter',
-    65874: 'ALetter',
-    65875: 'ALetter',
-    65876: 'ALetter',
-    65877: 'ALetter',
-    65878: 'ALetter',
-    65879: 'ALetter',
-    65880: 'ALetter',
-    65881: 'ALetter',
-    65882: 'ALetter',
-    65883: 'ALetter',
-    65884: 'ALetter',
-    65885: 'ALetter',
-    65886: 'ALetter',
-    65887: 'ALetter',
-    65888: 'ALetter',
-    65889: 'ALetter',
-    65890: 'ALetter',
-    65891: 'ALetter',
-    65892: 'ALetter',
-    65893: 'ALetter',
-    65894: 'ALetter',
-    65895: 'ALetter',
-    65896: 'ALetter',
-    65897: 'ALetter',
-    65898: 'ALetter',
-    65899: 'ALetter',
-    65900: 'ALetter',
-    65901: 'ALetter',
-    65902: 'ALetter',
-    65903: 'ALetter',
-    65904: 'ALetter',
-    65905: 'ALetter',
-    65906: 'ALetter',
-    65907: 'ALetter',
-    65908: 'ALetter',
-    66304: 'ALetter',
-    66305: 'ALetter',
-    66306: 'ALetter',
-    66307: 'ALetter',
-    66308: 'ALetter',
-    66309: 'ALetter',
-    66310: 'ALetter',
-    66311: 'ALetter',
-    66312: 'ALetter',
-    66313: 'ALetter',
-    66314: 'ALetter',
-    66315: 'ALetter',
-    66316: 'ALetter',
-    66317: 'ALetter',
-    66318: 'ALetter',
-    66319: 'ALetter',
-    66320: 'ALetter',
-    66321: 'ALetter',
-    66322: 'ALetter',
-    66323: 'ALetter',
-    66324: 'ALetter',
-    66325: 'ALetter',
-    66326: 'ALetter',
-    66327: 'ALetter',
-    66328: 'ALetter',
-    66329: 'ALetter',
-    66330: 'ALetter',
-    66331: 'ALetter',
-    66332: 'ALetter',
-    66333: 'ALetter',
-    66334: 'ALetter',
-    66352: 'ALetter',
-    66353: 'ALetter',
-    66354: 'ALetter',
-    66355: 'ALetter',
-    66356: 'ALetter',
-    66357: 'ALetter',
-    66358: 'ALetter',
-    66359: 'ALetter',
-    66360: 'ALetter',
-    66361: 'ALetter',
-    66362: 'ALetter',
-    66363: 'ALetter',
-    66364: 'ALetter',
-    66365: 'ALetter',
-    66366: 'ALetter',
-    66367: 'ALetter',
-    66368: 'ALetter',
-    66369: 'ALetter',
-    66370: 'ALetter',
-    66371: 'ALetter',
-    66372: 'ALetter',
-    66373: 'ALetter',
-    66374: 'ALetter',
-    66375: 'ALetter',
-    66376: 'ALetter',
-    66377: 'ALetter',
-    66378: 'ALetter',
-    66432: 'ALetter',
-    66433: 'ALetter',
-    66434: 'ALetter',
-    66435: 'ALetter',
-    66436: 'ALetter',
-    66437: 'ALetter',
-    66438: 'ALetter',
-    66439: 'ALetter',
-    66440: 'ALetter',
-    66441: 'ALetter',
-    66442: 'ALetter',
-    66443: 'ALetter',
-    66444: 'ALetter',
-    66445: 'ALetter',
-    66446: 'ALetter',
-    66447: 'ALetter',
-    66448: 'ALetter',
-    66449: 'ALetter',
-    66450: 'ALetter',
-    66451: 'ALetter',
-    66452: 'ALetter',
-    66453: 'ALetter',
-    66454: 'ALetter',
-    66455: 'ALetter',
-    66456: 'ALetter',
-    66457: 'ALetter',
-    66458: 'ALetter',
-    66459: 'ALetter',
-    66460: 'ALetter',
-    66461: 'ALetter',
-    66464: 'ALetter',
-    66465: 'ALetter',
-    66466: 'ALetter',
-    66467: 'ALetter',
-    66468: 'ALetter',
-    66469: 'ALetter',
-    66470: 'ALetter',
-    66471: 'ALetter',
-    66472: 'ALetter',
-    66473: 'ALetter',
-    66474: 'ALetter',
-    66475: 'ALetter',
-    66476: 'ALetter',
-    66477: 'ALetter',
-    66478: 'ALetter',
-    66479: 'ALetter',
-    66480: 'ALetter',
-    66481: 'ALetter',
-    66482: 'ALetter',
-    66483: 'ALetter',
-    66484: 'ALetter',
-    66485: 'ALetter',
-    66486: 'ALetter',
-    66487: 'ALetter',
-    66488: 'ALetter',
-    66489: 'ALetter',
-    66490: 'ALetter',
-    66491: 'ALetter',
-    66492: 'ALetter',
-    66493: 'ALetter',
-    66494: 'ALetter',
-    66495: 'ALetter',
-    66496: 'ALetter',
-    66497: 'ALetter',
-    66498: 'ALetter',
-    66499: 'ALetter',
-    66504: 'ALetter',
-    66505: 'ALetter',
-    66506: 'ALetter',
-    66507: 'ALetter',
-    66508: 'ALetter',
-    66509: 'ALetter',
-    66510: 'ALetter',
-    66511: 'ALetter',
-    66513: 'ALetter',
-    66514: 'ALetter',
-    66515: 'ALetter',
-    66516: 'ALetter',
-    66517: 'ALetter',
-    66560: 'ALetter',
-    66561: 'ALetter',
-    66562: 'ALetter',
-    66563: 'ALetter',
-    66564: 'ALetter',
-    66565: 'ALetter',
-    66566: 'ALetter',
-    66567: 'ALetter',
-    66568: 'ALetter',
-    66569: 'ALetter',
-    66570: 'ALetter',
-    66571: 'ALetter',
-    66572: 'ALetter',
-    66573: 'ALetter',
-    66574: 'ALetter',
-    66575: 'ALetter',
-    66576: 'ALetter',
-    66577: 'ALetter',
-    66578: 'ALetter',
-    66579: 'ALetter',
-    66580: 'ALetter',
-    66581: 'ALetter',
-    66582: 'ALetter',
-    66583: 'ALetter',
-    66584: 'ALetter',
-    66585: 'ALetter',
-    66586: 'ALetter',
-    66587: 'ALetter',
-    66588: 'ALetter',
-    66589: 'ALetter',
-    66590: 'ALetter',
-    66591: 'ALetter',
-    66592: 'ALetter',
-    66593: 'ALetter',
-    66594: 'ALetter',
-    66595: 'ALetter',
-    66596: 'ALetter',
-    66597: 'ALetter',
-    66598: 'ALetter',
-    66599: 'ALetter',
-    66600: 'ALetter',
-    66601: 'ALetter',
-    66602: 'ALetter',
-    66603: 'ALetter',
-    66604: 'ALetter',
-    66605: 'ALetter',
-    66606: 'ALetter',
-    66607: 'ALetter',
-    66608: 'ALetter',
-    66609: 'ALetter',
-    66610: 'ALetter',
-    66611: 'ALetter',
-    66612: 'ALetter',
-    66613: 'ALetter',
-    66614: 'ALetter',
-    66615: 'ALetter',
-    66616: 'ALetter',
-    66617: 'ALetter',
-    66618: 'ALetter',
-    66619: 'ALetter',
-    66620: 'ALetter',
-    66621: 'ALetter',
-    66622: 'ALetter',
-    66623: 'ALetter',
-    66624: 'ALetter',
-    66625: 'ALetter',
-    66626: 'ALetter',
-    66627: 'ALetter',
-    66628: 'ALetter',
-    66629: 'ALetter',
-    66630: 'ALetter',
-    66631: 'ALetter',
-    66632: 'ALetter',
-    66633: 'ALetter',
-    66634: 'ALetter',
-    66635: 'ALetter',
-    66636: 'ALetter',
-    66637: 'ALetter',
-    66638: 'ALetter',
-    66639: 'ALetter',
-    66640: 'ALetter',
-    66641: 'ALetter',
-    66642: 'ALetter',
-    66643: 'ALetter',
-    66644: 'ALetter',
-    66645: 'ALetter',
-    66646: 'ALetter',
-    66647: 'ALetter',
-    66648: 'ALetter',
-    66649: 'ALetter',
-    66650: 'ALetter',
-    66651: 'ALetter',
-    66652: 'ALetter',
-    66653: 'ALetter',
-    66654: 'ALetter',
-    66655: 'ALetter',
-    66656: 'ALetter',
-    66657: 'ALetter',
-    66658: 'ALetter',
-    66659: 'ALetter',
-    66660: 'ALetter',
-    66661: 'ALetter',
-    66662: 'ALetter',
-    66663: 'ALetter',
-    66664: 'ALetter',
-    66665: 'ALetter',
-    66666: 'ALetter',
-    66667: 'ALetter',
-    66668: 'ALetter',
-    66669: 'ALetter',
-    66670: 'ALetter',
-    66671: 'ALetter',
-    66672: 'ALetter',
-    66673: 'ALetter',
-    66674: 'ALetter',
-    66675: 'ALetter',
-    66676: 'ALetter',
-    66677: 'ALetter',
-    66678: 'ALetter',
-    66679: 'ALetter',
-    66680: 'ALetter',
-    66681: 'ALetter',
-    66682: 'ALetter',
-    66683: 'ALetter',
-    66684: 'ALetter',
-    66685: 'ALetter',
-    66686: 'ALetter',
-    66687: 'ALetter',
-    66688: 'ALetter',
-    66689: 'ALetter',
-    66690: 'ALetter',
-    66691: 'ALetter',
-    66692: 'ALetter',
-    66693: 'ALetter',
-    66694: 'ALetter',
-    66695: 'ALetter',
-    66696: 'ALetter',
-    66697: 'ALetter',
-    66698: 'ALetter',
-    66699: 'ALetter',
-    66700: 'ALetter',
-    66701: 'ALetter',
-    66702: 'ALetter',
-    66703: 'ALetter',
-    66704: 'ALetter',
-    66705: 'ALetter',
-    66706: 'ALetter',
-    66707: 'ALetter',
-    66708: 'ALetter',
-    66709: 'ALetter',
-    66710: 'ALetter',
-    66711: 'ALetter',
-    66712: 'ALetter',
-    66713: 'ALetter',
-    66714: 'ALetter',
-    66715: 'ALetter',
-    66716: 'ALetter',
-    66717: 'ALetter',
-    66720: 'Numeric',
-    66721: 'Numeric',
-    66722: 'Numeric',
-    66723: 'Numeric',
-    66724: 'Numeric',
-    66725: 'Numeric',
-    66726: 'Numeric',
-    66727: 'Numeric',
-    66728: 'Numeric',
-    66729: 'Numeric',
-    67584: 'ALetter',
-    67585: 'ALetter',
-    67586: 'ALetter',
-    67587: 'ALetter',
-    67588: 'ALetter',
-    67589: 'ALetter',
-    67592: 'ALetter',
-    67594: 'ALetter',
-    67595: 'ALetter',
-    67596: 'ALetter',
-    67597: 'ALetter',
-    67598: 'ALetter',
-    67599: 'ALetter',
-    67600: 'ALetter',
-    67601: 'ALetter',
-    67602: 'ALetter',
-    67603: 'ALetter',
-    67604: 'ALetter',
-    67605: 'ALetter',
-    67606: 'ALetter',
-    67607: 'ALetter',
-    67608: 'ALetter',
-    67609: 'ALetter',
-    67610: 'ALetter',
-    67611: 'ALetter',
-    67612: 'ALetter',
-    67613: 'ALetter',
-    67614: 'ALetter',
-    67615: 'ALetter',
-    67616: 'ALetter',
-    67617: 'ALetter',
-    67618: 'ALetter',
-    67619: 'ALetter',
-    67620: 'ALetter',
-    67621: 'ALetter',
-    67622: 'ALetter',
-    67623: 'ALetter',
-    67624: 'ALetter',
-    67625: 'ALetter',
-    67626: 'ALetter',
-    67627: 'ALetter',
-    67628: 'ALetter',
-    67629: 'ALetter',
-    67630: 'ALetter',
-    67631: 'ALetter',
-    67632: 'ALetter',
-    67633: 'ALetter',
-    67634: 'ALetter',
-    67635: 'ALetter',
-    67636: 'ALetter',
-    67637: 'ALetter',
-    67639: 'ALetter',
-    67640: 'ALetter',
-    67644: 'ALetter',
-    67647: 'ALetter',
-    67840: 'ALetter',
-    67841: 'ALetter',
-    67842: 'ALetter',
-    67843: 'ALetter',
-    67844: 'ALetter',
-    67845: 'ALetter',
-    67846: 'ALetter',
-    67847: 'ALetter',
-    67848: 'ALetter',
-    67849: 'ALetter',
-    67850: 'ALetter',
-    67851: 'ALetter',
-    67852: 'ALetter',
-    67853: 'ALetter',
-    67854: 'ALetter',
-    67855: 'ALetter',
-    67856: 'ALetter',
-    67857: 'ALetter',
-    67858: 'ALetter',
-    67859: 'ALetter',
-    67860: 'ALetter',
-    67861: 'ALetter',
-    68096: 'ALetter',
-    68112: 'ALetter',
-    68113: 'ALetter',
-    68114: 'ALetter',
-    68115: 'ALetter',
-    68117: 'ALetter',
-    68118: 'ALetter',
-    68119: 'ALetter',
-    68121: 'ALetter',
-    68122: 'ALetter',
-    68123: 'ALetter',
-    68124: 'ALetter',
-    68125: 'ALetter',
-    68126: 'ALetter',
-    68127: 'ALetter',
-    68128: 'ALetter',
-    68129: 'ALetter',
-    68130: 'ALetter',
-    68131: 'ALetter',
-    68132: 'ALetter',
-    68133: 'ALetter',
-    68134: 'ALetter',
-    68135: 'ALetter',
-    68136: 'ALetter',
-    68137: 'ALetter',
-    68138: 'ALetter',
-    68139: 'ALetter',
-    68140: 'ALetter',
-    68141: 'ALetter',
-    68142: 'ALetter',
-    68143: 'ALetter',
-    68144: 'ALetter',
-    68145: 'ALetter',
-    68146: 'ALetter',
-    68147: 'ALetter',
-    73728: 'ALetter',
-    73729: 'ALetter',
-    73730: 'ALetter',
-    73731: 'ALetter',
-    73732: 'ALetter',
-    73733: 'ALetter',
-    73734: 'ALetter',
-    73735: 'ALetter',
-    73736: 'ALetter',
-    73737: 'ALetter',
-    73738: 'ALetter',
-    73739: 'ALetter',
-    73740: 'ALetter',
-    73741: 'ALetter',
-    73742: 'ALetter',
-    73743: 'ALetter',
-    73744: 'ALetter',
-    73745: 'ALetter',
-    73746: 'ALetter',
-    73747: 'ALetter',
-    73748: 'ALetter',
-    73749: 'ALetter',
-    73750: 'ALetter',
-    73751: 'ALetter',
-    73752: 'ALetter',
-    73753: 'ALetter',
-    73754: 'ALetter',
-    73755: 'ALetter',
-    73756: 'ALetter',
-    73757: 'ALetter',
-    73758: 'ALetter',
-    73759: 'ALetter',
-    73760: 'ALetter',
-    73761: 'ALetter',
-    73762: 'ALetter',
-    73763: 'ALetter',
-    73764: 'ALetter',
-    73765: 'ALetter',
-    73766: 'ALetter',
-    73767: 'ALetter',
-    73768: 'ALetter',
-    73769: 'ALetter',
-    73770: 'ALetter',
-    73771: 'ALetter',
-    73772: 'ALetter',
-    73773: 'ALetter',
-    73774: 'ALetter',
-    73775: 'ALetter',
-    73776: 'ALetter',
-    73777: 'ALetter',
-    73778: 'ALetter',
-    73779: 'ALetter',
-    73780: 'ALetter',
-    73781: 'ALetter',
-    73782: 'ALetter',
-    73783: 'ALetter',
-    73784: 'ALetter',
-    73785: 'ALetter',
-    73786: 'ALetter',
-    73787: 'ALetter',
-    73788: 'ALetter',
-    73789: 'ALetter',
-    73790: 'ALetter',
-    73791: 'ALetter',
-    73792: 'ALetter',
-    73793: 'ALetter',
-    73794: 'ALetter',
-    73795: 'ALetter',
-    73796: 'ALetter',
-    73797: 'ALetter',
-    73798: 'ALetter',
-    73799: 'ALetter',
-    73800: 'ALetter',
-    73801: 'ALetter',
-    73802: 'ALetter',
-    73803: 'ALetter',
-    73804: 'ALetter',
-    73805: 'ALetter',
-    73806: 'ALetter',
-    73807: 'ALetter',
-    73808: 'ALetter',
-    73809: 'ALetter',
-    73810: 'ALetter',
-    73811: 'ALetter',
-    73812: 'ALetter',
-    73813: 'ALetter',
-    73814: 'ALetter',
-    73815: 'ALetter',
-    73816: 'ALetter',
-    73817: 'ALetter',
-    73818: 'ALetter',
-    73819: 'ALetter',
-    73820: 'ALetter',
-    73821: 'ALetter',
-    73822: 'ALetter',
-    73823: 'ALetter',
-    73824: 'ALetter',
-    73825: 'ALetter',
-    73826: 'ALetter',
-    73827: 'ALetter',
-    73828: 'ALetter',
-    73829: 'ALetter',
-    73830: 'ALetter',
-    73831: 'ALetter',
-    73832: 'ALetter',
-    73833: 'ALetter',
-    73834: 'ALetter',
-    73835: 'ALetter',
-    73836: 'ALetter',
-    73837: 'ALetter',
-    73838: 'ALetter',
-    73839: 'ALetter',
-    73840: 'ALetter',
-    73841: 'ALetter',
-    73842: 'ALetter',
-    73843: 'ALetter',
-    73844: 'ALetter',
-    73845: 'ALetter',
-    73846: 'ALetter',
-    73847: 'ALetter',
-    73848: 'ALetter',
-    73849: 'ALetter',
-    73850: 'ALetter',
-    73851: 'ALetter',
-    73852: 'ALetter',
-    73853: 'ALetter',
-    73854: 'ALetter',
-    73855: 'ALetter',
-    73856: 'ALetter',
-    73857: 'ALetter',
-    73858: 'ALetter',
-    73859: 'ALetter',
-    73860: 'ALetter',
-    73861: 'ALetter',
-    73862: 'ALetter',
-    73863: 'ALetter',
-    73864: 'ALetter',
-    73865: 'ALetter',
-    73866: 'ALetter',
-    73867: 'ALetter',
-    73868: 'ALetter',
-    73869: 'ALetter',
-    73870: 'ALetter',
-    73871: 'ALetter',
-    73872: 'ALetter',
-    73873: 'ALetter',
-    73874: 'ALetter',
-    73875: 'ALetter',
-    73876: 'ALetter',
-    73877: 'ALetter',
-    73878: 'ALetter',
-    73879: 'ALetter',
-    73880: 'ALetter',
-    73881: 'ALetter',
-    73882: 'ALetter',
-    73883: 'ALetter',
-    73884: 'ALetter',
-    73885: 'ALetter',
-    73886: 'ALetter',
-    73887: 'ALetter',
-    73888: 'ALetter',
-    73889: 'ALetter',
-    73890: 'ALetter',
-    73891: 'ALetter',
-    73892: 'ALetter',
-    73893: 'ALetter',
-    73894: 'ALetter',
-    73895: 'ALetter',
-    73896: 'ALetter',
-    73897: 'ALetter',
-    73898: 'ALetter',
-    73899: 'ALetter',
-    73900: 'ALetter',
-    73901: 'ALetter',
-    73902: 'ALetter',
-    73903: 'ALetter',
-    73904: 'ALetter',
-    73905: 'ALetter',
-    73906: 'ALetter',
-    73907: 'ALetter',
-    73908: 'ALetter',
-    73909: 'ALetter',
-    73910: 'ALetter',
-    73911: 'ALetter',
-    73912: 'ALetter',
-    73913: 'ALetter',
-    73914: 'ALetter',
-    73915: 'ALetter',
-    73916: 'ALetter',
-    73917: 'ALetter',
-    73918: 'ALetter',
-    73919: 'ALetter',
-    73920: 'ALetter',
-    73921: 'ALetter',
-    73922: 'ALetter',
-    73923: 'ALetter',
-    73924: 'ALetter',
-    73925: 'ALetter',
-    73926: 'ALetter',
-    73927: 'ALetter',
-    73928: 'ALetter',
-    73929: 'ALetter',
-    73930: 'ALetter',
-    73931: 'ALetter',
-    73932: 'ALetter',
-    73933: 'ALetter',
-    73934: 'ALetter',
-    73935: 'ALetter',
-    73936: 'ALetter',
-    73937: 'ALetter',
-    73938: 'ALetter',
-    73939: 'ALetter',
-    73940: 'ALetter',
-    73941: 'ALetter',
-    73942: 'ALetter',
-    73943: 'ALetter',
-    73944: 'ALetter',
-    73945: 'ALetter',
-    73946: 'ALetter',
-    73947: 'ALetter',
-    73948: 'ALetter',
-    73949: 'ALetter',
-    73950: 'ALetter',
-    73951: 'ALetter',
-    73952: 'ALetter',
-    73953: 'ALetter',
-    73954: 'ALetter',
-    73955: 'ALetter',
-    73956: 'ALetter',
-    73957: 'ALetter',
-    73958: 'ALetter',
-    73959: 'ALetter',
-    73960: 'ALetter',
-    73961: 'ALetter',
-    73962: 'ALetter',
-    73963: 'ALetter',
-    73964: 'ALetter',
-    73965: 'ALetter',
-    73966: 'ALetter',
-    73967: 'ALetter',
-    73968: 'ALetter',
-    73969: 'ALetter',
-    73970: 'ALetter',
-    73971: 'ALetter',
-    73972: 'ALetter',
-    73973: 'ALetter',
-    73974: 'ALetter',
-    73975: 'ALetter',
-    73976: 'ALetter',
-    73977: 'ALetter',
-    73978: 'ALetter',
-    73979: 'ALetter',
-    73980: 'ALetter',
-    73981: 'ALetter',
-    73982: 'ALetter',
-    73983: 'ALetter',
-    73984: 'ALetter',
-    73985: 'ALetter',
-    73986: 'ALetter',
-    73987: 'ALetter',
-    73988: 'ALetter',
-    73989: 'ALetter',
-    73990: 'ALetter',
-    73991: 'ALetter',
-    73992: 'ALetter',
-    73993: 'ALetter',
-    73994: 'ALetter',
-    73995: 'ALetter',
-    73996: 'ALetter',
-    73997: 'ALetter',
-    73998: 'ALetter',
-    73999: 'ALetter',
-    74000: 'ALetter',
-    74001: 'ALetter',
-    74002: 'ALetter',
-    74003: 'ALetter',
-    74004: 'ALetter',
-    74005: 'ALetter',
-    74006: 'ALetter',
-    74007: 'ALetter',
-    74008: 'ALetter',
-    74009: 'ALetter',
-    74010: 'ALetter',
-    74011: 'ALetter',
-    74012: 'ALetter',
-    74013: 'ALetter',
-    74014: 'ALetter',
-    74015: 'ALetter',
-    74016: 'ALetter',
-    74017: 'ALetter',
-    74018: 'ALetter',
-    74019: 'ALetter',
-    74020: 'ALetter',
-    74021: 'ALetter',
-    74022: 'ALetter',
-    74023: 'ALetter',
-    74024: 'ALetter',
-    74025: 'ALetter',
-    74026: 'ALetter',
-    74027: 'ALetter',
-    74028: 'ALetter',
-    74029: 'ALetter',
-    74030: 'ALetter',
-    74031: 'ALetter',
-    74032: 'ALetter',
-    74033: 'ALetter',
-    74034: 'ALetter',
-    74035: 'ALetter',
-    74036: 'ALetter',
-    74037: 'ALetter',
-    74038: 'ALetter',
-    74039: 'ALetter',
-    74040: 'ALetter',
-    74041: 'ALetter',
-    74042: 'ALetter',
-    74043: 'ALetter',
-    74044: 'ALetter',
-    74045: 'ALetter',
-    74046: 'ALetter',
-    74047: 'ALetter',
-    74048: 'ALetter',
-    74049: 'ALetter',
-    74050: 'ALetter',
-    74051: 'ALetter',
-    74052: 'ALetter',
-    74053: 'ALetter',
-    74054: 'ALetter',
-    74055: 'ALetter',
-    74056: 'ALetter',
-    74057: 'ALetter',
-    74058: 'ALetter',
-    74059: 'ALetter',
-    74060: 'ALetter',
-    74061: 'ALetter',
-    74062: 'ALetter',
-    74063: 'ALetter',
-    74064: 'ALetter',
-    74065: 'ALetter',
-    74066: 'ALetter',
-    74067: 'ALetter',
-    74068: 'ALetter',
-    74069: 'ALetter',
-    74070: 'ALetter',
-    74071: 'ALetter',
-    74072: 'ALetter',
-    74073: 'ALetter',
-    74074: 'ALetter',
-    74075: 'ALetter',
-    74076: 'ALetter',
-    74077: 'ALetter',
-    74078: 'ALetter',
-    74079: 'ALetter',
-    74080: 'ALetter',
-    74081: 'ALetter',
-    74082: 'ALetter',
-    74083: 'ALetter',
-    74084: 'ALetter',
-    74085: 'ALetter',
-    74086: 'ALetter',
-    74087: 'ALetter',
-    74088: 'ALetter',
-    74089: 'ALetter',
-    74090: 'ALetter',
-    74091: 'ALetter',
-    74092: 'ALetter',
-    74093: 'ALetter',
-    74094: 'ALetter',
-    74095: 'ALetter',
-    74096: 'ALetter',
-    74097: 'ALetter',
-    74098: 'ALetter',
-    74099: 'ALetter',
-    74100: 'ALetter',
-    74101: 'ALetter',
-    74102: 'ALetter',
-    74103: 'ALetter',
-    74104: 'ALetter',
-    74105: 'ALetter',
-    74106: 'ALetter',
-    74107: 'ALetter',
-    74108: 'ALetter',
-    74109: 'ALetter',
-    74110: 'ALetter',
-    74111: 'ALetter',
-    74112: 'ALetter',
-    74113: 'ALetter',
-    74114: 'ALetter',
-    74115: 'ALetter',
-    74116: 'ALetter',
-    74117: 'ALetter',
-    74118: 'ALetter',
-    74119: 'ALetter',
-    74120: 'ALetter',
-    74121: 'ALetter',
-    74122: 'ALetter',
-    74123: 'ALetter',
-    74124: 'ALetter',
-    74125: 'ALetter',
-    74126: 'ALetter',
-    74127: 'ALetter',
-    74128: 'ALetter',
-    74129: 'ALetter',
-    74130: 'ALetter',
-    74131: 'ALetter',
-    74132: 'ALetter',
-    74133: 'ALetter',
-    74134: 'ALetter',
-    74135: 'ALetter',
-    74136: 'ALetter',
-    74137: 'ALetter',
-    74138: 'ALetter',
-    74139: 'ALetter',
-    74140: 'ALetter',
-    74141: 'ALetter',
-    74142: 'ALetter',
-    74143: 'ALetter',
-    74144: 'ALetter',
-    74145: 'ALetter',
-    74146: 'ALetter',
-    74147: 'ALetter',
-    74148: 'ALetter',
-    74149: 'ALetter',
-    74150: 'ALetter',
-    74151: 'ALetter',
-    74152: 'ALetter',
-    74153: 'ALetter',
-    74154: 'ALetter',
-    74155: 'ALetter',
-    74156: 'ALetter',
-    74157: 'ALetter',
-    74158: 'ALetter',
-    74159: 'ALetter',
-    74160: 'ALetter',
-    74161: 'ALetter',
-    74162: 'ALetter',
-    74163: 'ALetter',
-    74164: 'ALetter',
-    74165: 'ALetter',
-    74166: 'ALetter',
-    74167: 'ALetter',
-    74168: 'ALetter',
-    74169: 'ALetter',
-    74170: 'ALetter',
-    74171: 'ALetter',
-    74172: 'ALetter',
-    74173: 'ALetter',
-    74174: 'ALetter',
-    74175: 'ALetter',
-    74176: 'ALetter',
-    74177: 'ALetter',
-    74178: 'ALetter',
-    74179: 'ALetter',
-    74180: 'ALetter',
-    74181: 'ALetter',
-    74182: 'ALetter',
-    74183: 'ALetter',
-    74184: 'ALetter',
-    74185: 'ALetter',
-    74186: 'ALetter',
-    74187: 'ALetter',
-    74188: 'ALetter',
-    74189: 'ALetter',
-    74190: 'ALetter',
-    74191: 'ALetter',
-    74192: 'ALetter',
-    74193: 'ALetter',
-    74194: 'ALetter',
-    74195: 'ALetter',
-    74196: 'ALetter',
-    74197: 'ALetter',
-    74198: 'ALetter',
-    74199: 'ALetter',
-    74200: 'ALetter',
-    74201: 'ALetter',
-    74202: 'ALetter',
-    74203: 'ALetter',
-    74204: 'ALetter',
-    74205: 'ALetter',
-    74206: 'ALetter',
-    74207: 'ALetter',
-    74208: 'ALetter',
-    74209: 'ALetter',
-    74210: 'ALetter',
-    74211: 'ALetter',
-    74212: 'ALetter',
-    74213: 'ALetter',
-    74214: 'ALetter',
-    74215: 'ALetter',
-    74216: 'ALetter',
-    74217: 'ALetter',
-    74218: 'ALetter',
-    74219: 'ALetter',
-    74220: 'ALetter',
-    74221: 'ALetter',
-    74222: 'ALetter',
-    74223: 'ALetter',
-    74224: 'ALetter',
-    74225: 'ALetter',
-    74226: 'ALetter',
-    74227: 'ALetter',
-    74228: 'ALetter',
-    74229: 'ALetter',
-    74230: 'ALetter',
-    74231: 'ALetter',
-    74232: 'ALetter',
-    74233: 'ALetter',
-    74234: 'ALetter',
-    74235: 'ALetter',
-    74236: 'ALetter',
-    74237: 'ALetter',
-    74238: 'ALetter',
-    74239: 'ALetter',
-    74240: 'ALetter',
-    74241: 'ALetter',
-    74242: 'ALetter',
-    74243: 'ALetter',
-    74244: 'ALetter',
-    74245: 'ALetter',
-    74246: 'ALetter',
-    74247: 'ALetter',
-    74248: 'ALetter',
-    74249: 'ALetter',
-    74250: 'ALetter',
-    74251: 'ALetter',
-    74252: 'ALetter',
-    74253: 'ALetter',
-    74254: 'ALetter',
-    74255: 'ALetter',
-    74256: 'ALetter',
-    74257: 'ALetter',
-    74258: 'ALetter',
-    74259: 'ALetter',
-    74260: 'ALetter',
-    74261: 'ALetter',
-    74262: 'ALetter',
-    74263: 'ALetter',
-    74264: 'ALetter',
-    74265: 'ALetter',
-    74266: 'ALetter',
-    74267: 'ALetter',
-    74268: 'ALetter',
-    74269: 'ALetter',
-    74270: 'ALetter',
-    74271: 'ALetter',
-    74272: 'ALetter',
-    74273: 'ALetter',
-    74274: 'ALetter',
-    74275: 'ALetter',
-    74276: 'ALetter',
-    74277: 'ALetter',
-    74278: 'ALetter',
-    74279: 'ALetter',
-    74280: 'ALetter',
-    74281: 'ALetter',
-    74282: 'ALetter',
-    74283: 'ALetter',
-    74284: 'ALetter',
-    74285: 'ALetter',
-    74286: 'ALetter',
-    74287: 'ALetter',
-    74288: 'ALetter',
-    74289: 'ALetter',
-    74290: 'ALetter',
-    74291: 'ALetter',
-    74292: 'ALetter',
-    74293: 'ALetter',
-    74294: 'ALetter',
-    74295: 'ALetter',
-    74296: 'ALetter',
-    74297: 'ALetter',
-    74298: 'ALetter',
-    74299: 'ALetter',
-    74300: 'ALetter',
-    74301: 'ALetter',
-    74302: 'ALetter',
-    74303: 'ALetter',
-    74304: 'ALetter',
-    74305: 'ALetter',
-    74306: 'ALetter',
-    74307: 'ALetter',
-    74308: 'ALetter',
-    74309: 'ALetter',
-    74310: 'ALetter',
-    74311: 'ALetter',
-    74312: 'ALetter',
-    74313: 'ALetter',
-    74314: 'ALetter',
-    74315: 'ALetter',
-    74316: 'ALetter',
-    74317: 'ALetter',
-    74318: 'ALetter',
-    74319: 'ALetter',
-    74320: 'ALetter',
-    74321: 'ALetter',
-    74322: 'ALetter',
-    74323: 'ALetter',
-    74324: 'ALetter',
-    74325: 'ALetter',
-    74326: 'ALetter',
-    74327: 'ALetter',
-    74328: 'ALetter',
-    74329: 'ALetter',
-    74330: 'ALetter',
-    74331: 'ALetter',
-    74332: 'ALetter',
-    74333: 'ALetter',
-    74334: 'ALetter',
-    74335: 'ALetter',
-    74336: 'ALetter',
-    74337: 'ALetter',
-    74338: 'ALetter',
-    74339: 'ALetter',
-    74340: 'ALetter',
-    74341: 'ALetter',
-    74342: 'ALetter',
-    74343: 'ALetter',
-    74344: 'ALetter',
-    74345: 'ALetter',
-    74346: 'ALetter',
-    74347: 'ALetter',
-    74348: 'ALetter',
-    74349: 'ALetter',
-    74350: 'ALetter',
-    74351: 'ALetter',
-    74352: 'ALetter',
-    74353: 'ALetter',
-    74354: 'ALetter',
-    74355: 'ALetter',
-    74356: 'ALetter',
-    74357: 'ALetter',
-    74358: 'ALetter',
-    74359: 'ALetter',
-    74360: 'ALetter',
-    74361: 'ALetter',
-    74362: 'ALetter',
-    74363: 'ALetter',
-    74364: 'ALetter',
-    74365: 'ALetter',
-    74366: 'ALetter',
-    74367: 'ALetter',
-    74368: 'ALetter',
-    74369: 'ALetter',
-    74370: 'ALetter',
-    74371: 'ALetter',
-    74372: 'ALetter',
-    74373: 'ALetter',
-    74374: 'ALetter',
-    74375: 'ALetter',
-    74376: 'ALetter',
-    74377: 'ALetter',
-    74378: 'ALetter',
-    74379: 'ALetter',
-    74380: 'ALetter',
-    74381: 'ALetter',
-    74382: 'ALetter',
-    74383: 'ALetter',
-    74384: 'ALetter',
-    74385: 'ALetter',
-    74386: 'ALetter',
-    74387: 'ALetter',
-    74388: 'ALetter',
-    74389: 'ALetter',
-    74390: 'ALetter',
-    74391: 'ALetter',
-    74392: 'ALetter',
-    74393: 'ALetter',
-    74394: 'ALetter',
-    74395: 'ALetter',
-    74396: 'ALetter',
-    74397: 'ALetter',
-    74398: 'ALetter',
-    74399: 'ALetter',
-    74400: 'ALetter',
-    74401: 'ALetter',
-    74402: 'ALetter',
-    74403: 'ALetter',
-    74404: 'ALetter',
-    74405: 'ALetter',
-    74406: 'ALetter',
-    74407: 'ALetter',
-    74408: 'ALetter',
-    74409: 'ALetter',
-    74410: 'ALetter',
-    74411: 'ALetter',
-    74412: 'ALetter',
-    74413: 'ALetter',
-    74414: 'ALetter',
-    74415: 'ALetter',
-    74416: 'ALetter',
-    74417: 'ALetter',
-    74418: 'ALetter',
-    74419: 'ALetter',
-    74420: 'ALetter',
-    74421: 'ALetter',
-    74422: 'ALetter',
-    74423: 'ALetter',
-    74424: 'ALetter',
-    74425: 'ALetter',
-    74426: 'ALetter',
-    74427: 'ALetter',
-    74428: 'ALetter',
-    74429: 'ALetter',
-    74430: 'ALetter',
-    74431: 'ALetter',
-    74432: 'ALetter',
-    74433: 'ALetter',
-    74434: 'ALetter',
-    74435: 'ALetter',
-    74436: 'ALetter',
-    74437: 'ALetter',
-    74438: 'ALetter',
-    74439: 'ALetter',
-    74440: 'ALetter',
-    74441: 'ALetter',
-    74442: 'ALetter',
-    74443: 'ALetter',
-    74444: 'ALetter',
-    74445: 'ALetter',
-    74446: 'ALetter',
-    74447: 'ALetter',
-    74448: 'ALetter',
-    74449: 'ALetter',
-    74450: 'ALetter',
-    74451: 'ALetter',
-    74452: 'ALetter',
-    74453: 'ALetter',
-    74454: 'ALetter',
-    74455: 'ALetter',
-    74456: 'ALetter',
-    74457: 'ALetter',
-    74458: 'ALetter',
-    74459: 'ALetter',
-    74460: 'ALetter',
-    74461: 'ALetter',
-    74462: 'ALetter',
-    74463: 'ALetter',
-    74464: 'ALetter',
-    74465: 'ALetter',
-    74466: 'ALetter',
-    74467: 'ALetter',
-    74468: 'ALetter',
-    74469: 'ALetter',
-    74470: 'ALetter',
-    74471: 'ALetter',
-    74472: 'ALetter',
-    74473: 'ALetter',
-    74474: 'ALetter',
-    74475: 'ALetter',
-    74476: 'ALetter',
-    74477: 'ALetter',
-    74478: 'ALetter',
-    74479: 'ALetter',
-    74480: 'ALetter',
-    74481: 'ALetter',
-    74482: 'ALetter',
-    74483: 'ALetter',
-    74484: 'ALetter',
-    74485: 'ALetter',
-    74486: 'ALetter',
-    74487: 'ALetter',
-    74488: 'ALetter',
-    74489: 'ALetter',
-    74490: 'ALetter',
-    74491: 'ALetter',
-    74492: 'ALetter',
-    74493: 'ALetter',
-    74494: 'ALetter',
-    74495: 'ALetter',
-    74496: 'ALetter',
-    74497: 'ALetter',
-    74498: 'ALetter',
-    74499: 'ALetter',
-    74500: 'ALetter',
-    74501: 'ALetter',
-    74502: 'ALetter',
-    74503: 'ALetter',
-    74504: 'ALetter',
-    74505: 'ALetter',
-    74506: 'ALetter',
-    74507: 'ALetter',
-    74508: 'ALetter',
-    74509: 'ALetter',
-    74510: 'ALetter',
-    74511: 'ALetter',
-    74512: 'ALetter',
-    74513: 'ALetter',
-    74514: 'ALetter',
-    74515: 'ALetter',
-    74516: 'ALetter',
-    74517: 'ALetter',
-    74518: 'ALetter',
-    74519: 'ALetter',
-    74520: 'ALetter',
-    74521: 'ALetter',
-    74522: 'ALetter',
-    74523: 'ALetter',
-    74524: 'ALetter',
-    74525: 'ALetter',
-    74526: 'ALetter',
-    74527: 'ALetter',
-    74528: 'ALetter',
-    74529: 'ALetter',
-    74530: 'ALetter',
-    74531: 'ALetter',
-    74532: 'ALetter',
-    74533: 'ALetter',
-    74534: 'ALetter',
-    74535: 'ALetter',
-    74536: 'ALetter',
-    74537: 'ALetter',
-    74538: 'ALetter',
-    74539: 'ALetter',
-    74540: 'ALetter',
-    74541: 'ALetter',
-    74542: 'ALetter',
-    74543: 'ALetter',
-    74544: 'ALetter',
-    74545: 'ALetter',
-    74546: 'ALetter',
-    74547: 'ALetter',
-    74548: 'ALetter',
-    74549: 'ALetter',
-    74550: 'ALetter',
-    74551: 'ALetter',
-    74552: 'ALetter',
-    74553: 'ALetter',
-    74554: 'ALetter',
-    74555: 'ALetter',
-    74556: 'ALetter',
-    74557: 'ALetter',
-    74558: 'ALetter',
-    74559: 'ALetter',
-    74560: 'ALetter',
-    74561: 'ALetter',
-    74562: 'ALetter',
-    74563: 'ALetter',
-    74564: 'ALetter',
-    74565: 'ALetter',
-    74566: 'ALetter',
-    74567: 'ALetter',
-    74568: 'ALetter',
-    74569: 'ALetter',
-    74570: 'ALetter',
-    74571: 'ALetter',
-    74572: 'ALetter',
-    74573: 'ALetter',
-    74574: 'ALetter',
-    74575: 'ALetter',
-    74576: 'ALetter',
-    74577: 'ALetter',
-    74578: 'ALetter',
-    74579: 'ALetter',
-    74580: 'ALetter',
-    74581: 'ALetter',
-    74582: 'ALetter',
-    74583: 'ALetter',
-    74584: 'ALetter',
-    74585: 'ALetter',
-    74586: 'ALetter',
-    74587: 'ALetter',
-    74588: 'ALetter',
-    74589: 'ALetter',
-    74590: 'ALetter',
-    74591: 'ALetter',
-    74592: 'ALetter',
-    74593: 'ALetter',
-    74594: 'ALetter',
-    74595: 'ALetter',
-    74596: 'ALetter',
-    74597: 'ALetter',
-    74598: 'ALetter',
-    74599: 'ALetter',
-    74600: 'ALetter',
-    74601: 'ALetter',
-    74602: 'ALetter',
-    74603: 'ALetter',
-    74604: 'ALetter',
-    74605: 'ALetter',
-    74606: 'ALetter',
-    74752: 'ALetter',
-    74753: 'ALetter',
-    74754: 'ALetter',
-    74755: 'ALetter',
-    74756: 'ALetter',
-    74757: 'ALetter',
-    74758: 'ALetter',
-    74759: 'ALetter',
-    74760: 'ALetter',
-    74761: 'ALetter',
-    74762: 'ALetter',
-    74763: 'ALetter',
-    74764: 'ALetter',
-    74765: 'ALetter',
-    74766: 'ALetter',
-    74767: 'ALetter',
-    74768: 'ALetter',
-    74769: 'ALetter',
-    74770: 'ALetter',
-    74771: 'ALetter',
-    74772: 'ALetter',
-    74773: 'ALetter',
-    74774: 'ALetter',
-    74775: 'ALetter',
-    74776: 'ALetter',
-    74777: 'ALetter',
-    74778: 'ALetter',
-    74779: 'ALetter',
-    74780: 'ALetter',
-    74781: 'ALetter',
-    74782: 'ALetter',
-    74783: 'ALetter',
-    74784: 'ALetter',
-    74785: 'ALetter',
-    74786: 'ALetter',
-    74787: 'ALetter',
-    74788: 'ALetter',
-    74789: 'ALetter',
-    74790: 'ALetter',
-    74791: 'ALetter',
-    74792: 'ALetter',
-    74793: 'ALetter',
-    74794: 'ALetter',
-    74795: 'ALetter',
-    74796: 'ALetter',
-    74797: 'ALetter',
-    74798: 'ALetter',
-    74799: 'ALetter',
-    74800: 'ALetter',
-    74801: 'ALetter',
-    74802: 'ALetter',
-    74803: 'ALetter',
-    74804: 'ALetter',
-    74805: 'ALetter',
-    74806: 'ALetter',
-    74807: 'ALetter',
-    74808: 'ALetter',
-    74809: 'ALetter',
-    74810: 'ALetter',
-    74811: 'ALetter',
-    74812: 'ALetter',
-    74813: 'ALetter',
-    74814: 'ALetter',
-    74815: 'ALetter',
-    74816: 'ALetter',
-    74817: 'ALetter',
-    74818: 'ALetter',
-    74819: 'ALetter',
-    74820: 'ALetter',
-    74821: 'ALetter',
-    74822: 'ALetter',
-    74823: 'ALetter',
-    74824: 'ALetter',
-    74825: 'ALetter',
-    74826: 'ALetter',
-    74827: 'ALetter',
-    74828: 'ALetter',
-    74829: 'ALetter',
-    74830: 'ALetter',
-    74831: 'ALetter',
-    74832: 'ALetter',
-    74833: 'ALetter',
-    74834: 'ALetter',
-    74835: 'ALetter',
-    74836: 'ALetter',
-    74837: 'ALetter',
-    74838: 'ALetter',
-    74839: 'ALetter',
-    74840: 'ALetter',
-    74841: 'ALetter',
-    74842: 'ALetter',
-    74843: 'ALetter',
-    74844: 'ALetter',
-    74845: 'ALetter',
-    74846: 'ALetter',
-    74847: 'ALetter',
-    74848: 'ALetter',
-    74849: 'ALetter',
-    74850: 'ALetter',
-    119155: 'Format',
-    119156: 'Format',
-    119157: 'Format',
-    119158: 'Format',
-    119159: 'Format',
-    119160: 'Format',
-    119161: 'Format',
-    119162: 'Format',
-    119808: 'ALetter',
-    119809: 'ALetter',
-    119810: 'ALetter',
-    119811: 'ALetter',
-    119812: 'ALetter',
-    119813: 'ALetter',
-    119814: 'ALetter',
-    119815: 'ALetter',
-    119816: 'ALetter',
-    119817: 'ALetter',
-    119818: 'ALetter',
-    119819: 'ALetter',
-    119820: 'ALetter',
-    119821: 'ALetter',
-    119822: 'ALetter',
-    119823: 'ALetter',
-    119824: 'ALetter',
-    119825: 'ALetter',
-    119826: 'ALetter',
-    119827: 'ALetter',
-    119828: 'ALetter',
-    119829: 'ALetter',
-    119830: 'ALetter',
-    119831: 'ALetter',
-    119832: 'ALetter',
-    119833: 'ALetter',
-    119834: 'ALetter',
-    119835: 'ALetter',
-    119836: 'ALetter',
-    119837: 'ALetter',
-    119838: 'ALetter',
-    119839: 'ALetter',
-    119840: 'ALetter',
-    119841: 'ALetter',
-    119842: 'ALetter',
-    119843: 'ALetter',
-    119844: 'ALetter',
-    119845: 'ALetter',
-    119846: 'ALetter',
-    119847: 'ALetter',
-    119848: 'ALetter',
-    119849: 'ALetter',
-    119850: 'ALetter',
-    119851: 'ALetter',
-    119852: 'ALetter',
-    119853: 'ALetter',
-    119854: 'ALetter',
-    119855: 'ALetter',
-    119856: 'ALetter',
-    119857: 'ALetter',
-    119858: 'ALetter',
-    119859: 'ALetter',
-    119860: 'ALetter',
-    119861: 'ALetter',
-    119862: 'ALetter',
-    119863: 'ALetter',
-    119864: 'ALetter',
-    119865: 'ALetter',
-    119866: 'ALetter',
-    119867: 'ALetter',
-    119868: 'ALetter',
-    119869: 'ALetter',
-    119870: 'ALetter',
-    119871: 'ALetter',
-    119872: 'ALetter',
-    119873: 'ALetter',
-    119874: 'ALetter',
-    119875: 'ALetter',
-    119876: 'ALetter',
-    119877: 'ALetter',
-    119878: 'ALetter',
-    119879: 'ALetter',
-    119880: 'ALetter',
-    119881: 'ALetter',
-    119882: 'ALetter',
-    119883: 'ALetter',
-    119884: 'ALetter',
-    119885: 'ALetter',
-    119886: 'ALetter',
-    119887: 'ALetter',
-    119888: 'ALetter',
-    119889: 'ALetter',
-    119890: 'ALetter',
-    119891: 'ALetter',
-    119892: 'ALetter',
-    119894: 'ALetter',
-    119895: 'ALetter',
-    119896: 'ALetter',
-    119897: 'ALetter',
-    119898: 'ALetter',
-    119899: 'ALetter',
-    119900: 'ALetter',
-    119901: 'ALetter',
-    119902: 'ALetter',
-    119903: 'ALetter',
-    119904: 'ALetter',
-    119905: 'ALetter',
-    119906: 'ALetter',
-    119907: 'ALetter',
-    119908: 'ALetter',
-    119909: 'ALetter',
-    119910: 'ALetter',
-    119911: 'ALetter',
-    119912: 'ALetter',
-    119913: 'ALetter',
-    119914: 'ALetter',
-    119915: 'ALetter',
-    119916: 'ALetter',
-    119917: 'ALetter',
-    119918: 'ALetter',
-    119919: 'ALetter',
-    119920: 'ALetter',
-    119921: 'ALetter',
-    119922: 'ALetter',
-    119923: 'ALetter',
-    119924: 'ALetter',
-    119925: 'ALetter',
-    119926: 'ALetter',
-    119927: 'ALetter',
-    119928: 'ALetter',
-    119929: 'ALetter',
-    119930: 'ALetter',
-    119931: 'ALetter',
-    119932: 'ALetter',
-    119933: 'ALetter',
-    119934: 'ALetter',
-    119935: 'ALetter',
-    119936: 'ALetter',
-    119937: 'ALetter',
-    119938: 'ALetter',
-    119939: 'ALetter',
-    119940: 'ALetter',
-    119941: 'ALetter',
-    119942: 'ALetter',
-    119943: 'ALetter',
-    119944: 'ALetter',
-    119945: 'ALetter',
-    119946: 'ALetter',
-    119947: 'ALetter',
-    119948: 'ALetter',
-    119949: 'ALetter',
-    119950: 'ALetter',
-    119951: 'ALetter',
-    119952: 'ALetter',
-    119953: 'ALetter',
-    119954: 'ALetter',
-    119955: 'ALetter',
-    119956: 'ALetter',
-    119957: 'ALetter',
-    119958: 'ALetter',
-    119959: 'ALetter',
-    119960: 'ALetter',
-    119961: 'ALetter',
-    119962: 'ALetter',
-    119963: 'ALetter',
-    119964: 'ALetter',
-    119966: 'ALetter',
-    119967: 'ALetter',
-    119970: 'ALetter',
-    119973: 'ALetter',
-    119974: 'ALetter',
-    119977: 'ALetter',
-    119978: 'ALetter',
-    119979: 'ALetter',
-    119980: 'ALetter',
-    119982: 'ALetter',
-    119983: 'ALetter',
-    119984: 'ALetter',
-    119985: 'ALetter',
-    119986: 'ALetter',
-    119987: 'ALetter',
-    119988: 'ALetter',
-    119989: 'ALetter',
-    119990: 'ALetter',
-    119991: 'ALetter',
-    119992: 'ALetter',
-    119993: 'ALetter',
-    119995: 'ALetter',
-    119997: 'ALetter',
-    119998: 'ALetter',
-    119999: 'ALetter',
-    120000: 'ALetter',
-    120001: 'ALetter',
-    120002: 'ALetter',
-    120003: 'ALetter',
-    120005: 'ALetter',
-    120006: 'ALetter',
-    120007: 'ALetter',
-    120008: 'ALetter',
-    120009: 'ALetter',
-    120010: 'ALetter',
-    120011: 'ALetter',
-    120012: 'ALetter',
-    120013: 'ALetter',
-    120014: 'ALetter',
-    120015: 'ALetter',
-    120016: 'ALetter',
-    120017: 'ALetter',
-    120018: 'ALetter',
-    120019: 'ALetter',
-    120020: 'ALetter',
-    120021: 'ALetter',
-    120022: 'ALetter',
-    120023: 'ALetter',
-    120024: 'ALetter',
-    120025: 'ALetter',
-    120026: 'ALetter',
-    120027: 'ALetter',
-    120028: 'ALetter',
-    120029: 'ALetter',
-    120030: 'ALetter',
-    120031: 'ALetter',
-    120032: 'ALetter',
-    120033: 'ALetter',
-    120034: 'ALetter',
-    120035: 'ALetter',
-    120036: 'ALetter',
-    120037: 'ALetter',
-    120038: 'ALetter',
-    120039: 'ALetter',
-    120040: 'ALetter',
-    120041: 'ALetter',
-    120042: 'ALetter',
-    120043: 'ALetter',
-    120044: 'ALetter',
-    120045: 'ALetter',
-    120046: 'ALetter',
-    120047: 'ALetter',
-    120048: 'ALetter',
-    120049: 'ALetter',
-    120050: 'ALetter',
-    120051: 'ALetter',
-    120052: 'ALetter',
-    120053: 'ALetter',
-    120054: 'ALetter',
-    120055: 'ALetter',
-    120056: 'ALetter',
-    120057: 'ALetter',
-    120058: 'ALetter',
-    120059: 'ALetter',
-    120060: 'ALetter',
-    120061: 'ALetter',
-    120062: 'ALetter',
-    120063: 'ALetter',
-    120064: 'ALetter',
-    120065: 'ALetter',
-    120066: 'ALetter',
-    120067: 'ALetter',
-    120068: 'ALetter',
-    120069: 'ALetter',
-    120071: 'ALetter',
-    120072: 'ALetter',
-    120073: 'ALetter',
-    120074: 'ALetter',
-    120077: 'ALetter',
-    120078: 'ALetter',
-    120079: 'ALetter',
-    120080: 'ALetter',
-    120081: 'ALetter',
-    120082: 'ALetter',
-    120083: 'ALetter',
-    120084: 'ALetter',
-    120086: 'ALetter',
-    120087: 'ALetter',
-    120088: 'ALetter',
-    120089: 'ALetter',
-    120090: 'ALetter',
-    120091: 'ALetter',
-    120092: 'ALetter',
-    120094: 'ALetter',
-    120095: 'ALetter',
-    120096: 'ALetter',
-    120097: 'ALetter',
-    120098: 'ALetter',
-    120099: 'ALetter',
-    120100: 'ALetter',
-    120101: 'ALetter',
-    120102: 'ALetter',
-    120103: 'ALetter',
-    120104: 'ALetter',
-    120105: 'ALetter',
-    120106: 'ALetter',
-    120107: 'ALetter',
-    120108: 'ALetter',
-    120109: 'ALetter',
-    120110: 'ALetter',
-    120111: 'ALetter',
-    120112: 'ALetter',
-    120113: 'ALetter',
-    120114: 'ALetter',
-    120115: 'ALetter',
-    120116: 'ALetter',
-    120117: 'ALetter',
-    120118: 'ALetter',
-    120119: 'ALetter',
-    120120: 'ALetter',
-    120121: 'ALetter',
-    120123: 'ALetter',
-    120124: 'ALetter',
-    120125: 'ALetter',
-    120126: 'ALetter',
-    120128: 'ALetter',
-    120129: 'ALetter',
-    120130: 'ALetter',
-    120131: 'ALetter',
-    120132: 'ALetter',
-    120134: 'ALetter',
-    120138: 'ALetter',
-    120139: 'ALetter',
-    120140: 'ALetter',
-    120141: 'ALetter',
-    120142: 'ALetter',
-    120143: 'ALetter',
-    120144: 'ALetter',
-    120146: 'ALetter',
-    120147: 'ALetter',
-    120148: 'ALetter',
-    120149: 'ALetter',
-    120150: 'ALetter',
-    120151: 'ALetter',
-    120152: 'ALetter',
-    120153: 'ALetter',
-    120154: 'ALetter',
-    120155: 'ALetter',
-    120156: 'ALetter',
-    120157: 'ALetter',
-    120158: 'ALetter',
-    120159: 'ALetter',
-    120160: 'ALetter',
-    120161: 'ALetter',
-    120162: 'ALetter',
-    120163: 'ALetter',
-    120164: 'ALetter',
-    120165: 'ALetter',
-    120166: 'ALetter',
-    120167: 'ALetter',
-    120168: 'ALetter',
-    120169: 'ALetter',
-    120170: 'ALetter',
-    120171: 'ALetter',
-    120172: 'ALetter',
-    120173: 'ALetter',
-    120174: 'ALetter',
-    120175: 'ALetter',
-    120176: 'ALetter',
-    120177: 'ALetter',
-    120178: 'ALetter',
-    120179: 'ALetter',
-    120180: 'ALetter',
-    120181: 'ALetter',
-    120182: 'ALetter',
-    120183: 'ALetter',
-    120184: 'ALetter',
-    120185: 'ALetter',
-    120186: 'ALetter',
-    120187: 'ALetter',
-    120188: 'ALetter',
-    120189: 'ALetter',
-    120190: 'ALetter',
-    120191: 'ALetter',
-    120192: 'ALetter',
-    120193: 'ALetter',
-    120194: 'ALetter',
-    120195: 'ALetter',
-    120196: 'ALetter',
-    120197: 'ALetter',
-    120198: 'ALetter',
-    120199: 'ALetter',
-    120200: 'ALetter',
-    120201: 'ALetter',
-    120202: 'ALetter',
-    120203: 'ALetter',
-    120204: 'ALetter',
-    120205: 'ALetter',
-    120206: 'ALetter',
-    120207: 'ALetter',
-    120208: 'ALetter',
-    120209: 'ALetter',
-    120210: 'ALetter',
-    120211: 'ALetter',
-    120212: 'ALetter',
-    120213: 'ALetter',
-    120214: 'ALetter',
-    120215: 'ALetter',
-    120216: 'ALetter',
-    120217: 'ALetter',
-    120218: 'ALetter',
-    120219: 'ALetter',
-    120220: 'ALetter',
-    120221: 'ALetter',
-    120222: 'ALetter',
-    120223: 'ALetter',
-    120224: 'ALetter',
-    120225: 'ALetter',
-    120226: 'ALetter',
-    120227: 'ALetter',
-    120228: 'ALetter',
-    120229: 'ALetter',
-    120230: 'ALetter',
-    120231: 'ALetter',
-    120232: 'ALetter',
-    120233: 'ALetter',
-    120234: 'ALetter',
-    120235: 'ALetter',
-    120236: 'ALetter',
-    120237: 'ALetter',
-    120238: 'ALetter',
-    120239: 'ALetter',
-    120240: 'ALetter',
-    120241: 'ALetter',
-    120242: 'ALetter',
-    120243: 'ALetter',
-    120244: 'ALetter',
-    120245: 'ALetter',
-    120246: 'ALetter',
-    120247: 'ALetter',
-    120248: 'ALetter',
-    120249: 'ALetter',
-    120250: 'ALetter',
-    120251: 'ALetter',
-    120252: 'ALetter',
-    120253: 'ALetter',
-    120254: 'ALetter',
-    120255: 'ALetter',
-    120256: 'ALetter',
-    120257: 'ALetter',
-    120258: 'ALetter',
-    120259: 'ALetter',
-    120260: 'ALetter',
-    120261: 'ALetter',
-    120262: 'ALetter',
-    120263: 'ALetter',
-    120264: 'ALetter',
-    120265: 'ALetter',
-    120266: 'ALetter',
-    120267: 'ALetter',
-    120268: 'ALetter',
-    120269: 'ALetter',
-    120270: 'ALetter',
-    120271: 'ALetter',
-    120272: 'ALetter',
-    120273: 'ALetter',
-    120274: 'ALetter',
-    120275: 'ALetter',
-    120276: 'ALetter',
-    120277: 'ALetter',
-    120278: 'ALetter',
-    120279: 'ALetter',
-    120280: 'ALetter',
-    120281: 'ALetter',
-    120282: 'ALetter',
-    120283: 'ALetter',
-    120284: 'ALetter',
-    120285: 'ALetter',
-    120286: 'ALetter',
-    120287: 'ALetter',
-    120288: 'ALetter',
-    120289: 'ALetter',
-    120290: 'ALetter',
-    120291: 'ALetter',
-    120292: 'ALetter',
-    120293: 'ALetter',
-    120294: 'ALetter',
-    120295: 'ALetter',
-    120296: 'ALetter',
-    120297: 'ALetter',
-    120298: 'ALetter',
-    120299: 'ALetter',
-    120300: 'ALetter',
-    120301: 'ALetter',
-    120302: 'ALetter',
-    120303: 'ALetter',
-    120304: 'ALetter',
-    120305: 'ALetter',
-    120306: 'ALetter',
-    120307: 'ALetter',
-    120308: 'ALetter',
-    120309: 'ALetter',
-    120310: 'ALetter',
-    120311: 'ALetter',
-    120312: 'ALetter',
-    120313: 'ALetter',
-    120314: 'ALetter',
-    120315: 'ALetter',
-    120316: 'ALetter',
-    120317: 'ALetter',
-    120318: 'ALetter',
-    120319: 'ALetter',
-    120320: 'ALetter',
-    120321: 'ALetter',
-    120322: 'ALetter',
-    120323: 'ALetter',
-    120324: 'ALetter',
-    120325: 'ALetter',
-    120326: 'ALetter',
-    120327: 'ALetter',
-    120328: 'ALetter',
-    120329: 'ALetter',
-    120330: 'ALetter',
-    120331: 'ALetter',
-    120332: 'ALetter',
-    120333: 'ALetter',
-    120334: 'ALetter',
-    120335: 'ALetter',
-    120336: 'ALetter',
-    120337: 'ALetter',
-    120338: 'ALetter',
-    120339: 'ALetter',
-    120340: 'ALetter',
-    120341: 'ALetter',
-    120342: 'ALetter',
-    120343: 'ALetter',
-    120344: 'ALetter',
-    120345: 'ALetter',
-    120346: 'ALetter',
-    120347: 'ALetter',
-    120348: 'ALetter',
-    120349: 'ALetter',
-    120350: 'ALetter',
-    120351: 'ALetter',
-    120352: 'ALetter',
-    120353: 'ALetter',
-    120354: 'ALetter',
-    120355: 'ALetter',
-    120356: 'ALetter',
-    120357: 'ALetter',
-    120358: 'ALetter',
-    120359: 'ALetter',
-    120360: 'ALetter',
-    120361: 'ALetter',
-    120362: 'ALetter',
-    120363: 'ALetter',
-    120364: 'ALetter',
-    120365: 'ALetter',
-    120366: 'ALetter',
-    120367: 'ALetter',
-    120368: 'ALetter',
-    120369: 'ALetter',
-    120370: 'ALetter',
-    120371: 'ALetter',
-    120372: 'ALetter',
-    120373: 'ALetter',
-    120374: 'ALetter',
-    120375: 'ALetter',
-    120376: 'ALetter',
-    120377: 'ALetter',
-    120378: 'ALetter',
-    120379: 'ALetter',
-    120380: 'ALetter',
-    120381: 'ALetter',
-    120382: 'ALetter',
-    120383: 'ALetter',
-    120384: 'ALetter',
-    120385: 'ALetter',
-    120386: 'ALetter',
-    120387: 'ALetter',
-    120388: 'ALetter',
-    120389: 'ALetter',
-    120390: 'ALetter',
-    120391: 'ALetter',
-    120392: 'ALetter',
-    120393: 'ALetter',
-    120394: 'ALetter',
-    120395: 'ALetter',
-    120396: 'ALetter',
-    120397: 'ALetter',
-    120398: 'ALetter',
-    120399: 'ALetter',
-    120400: 'ALetter',
-    120401: 'ALetter',
-    120402: 'ALetter',
-    120403: 'ALetter',
-    120404: 'ALetter',
-    120405: 'ALetter',
-    120406: 'ALetter',
-    120407: 'ALetter',
-    120408: 'ALetter',
-    120409: 'ALetter',
-    120410: 'ALetter',
-    120411: 'ALetter',
-    120412: 'ALetter',
-    120413: 'ALetter',
-    120414: 'ALetter',
-    120415: 'ALetter',
-    120416: 'ALetter',
-    120417: 'ALetter',
-    120418: 'ALetter',
-    120419: 'ALetter',
-    120420: 'ALetter',
-    120421: 'ALetter',
-    120422: 'ALetter',
-    120423: 'ALetter',
-    120424: 'ALetter',
-    120425: 'ALetter',
-    120426: 'ALetter',
-    120427: 'ALetter',
-    120428: 'ALetter',
-    120429: 'ALetter',
-    120430: 'ALetter',
-    120431: 'ALetter',
-    120432: 'ALetter',
-    120433: 'ALetter',
-    120434: 'ALetter',
-    120435: 'ALetter',
-    120436: 'ALetter',
-    120437: 'ALetter',
-    120438: 'ALetter',
-    120439: 'ALetter',
-    120440: 'ALetter',
-    120441: 'ALetter',
-    120442: 'ALetter',
-    120443: 'ALetter',
-    120444: 'ALetter',
-    120445: 'ALetter',
-    120446: 'ALetter',
-    120447: 'ALetter',
-    120448: 'ALetter',
-    120449: 'ALetter',
-    120450: 'ALetter',
-    120451: 'ALetter',
-    120452: 'ALetter',
-    120453: 'ALetter',
-    120454: 'ALetter',
-    120455: 'ALetter',
-    120456: 'ALetter',
-    120457: 'ALetter',
-    120458: 'ALetter',
-    120459: 'ALetter',
-    120460: 'ALetter',
-    120461: 'ALetter',
-    120462: 'ALetter',
-    120463: 'ALetter',
-    120464: 'ALetter',
-    120465: 'ALetter',
-    120466: 'ALetter',
-    120467: 'ALetter',
-    120468: 'ALetter',
-    120469: 'ALetter',
-    120470: 'ALetter',
-    120471: 'ALetter',
-    120472: 'ALetter',
-    120473: 'ALetter',
-    120474: 'ALetter',
-    120475: 'ALetter',
-    120476: 'ALetter',
-    120477: 'ALetter',
-    120478: 'ALetter',
-    120479: 'ALetter',
-    120480: 'ALetter',
-    120481: 'ALetter',
-    120482: 'ALetter',
-    120483: 'ALetter',
-    120484: 'ALetter',
-    120485: 'ALetter',
-    120488: 'ALetter',
-    120489: 'ALetter',
-    120490: 'ALetter',
-    120491: 'ALetter',
-    120492: 'ALetter',
-    120493: 'ALetter',
-    120494: 'ALetter',
-    120495: 'ALetter',
-    120496: 'ALetter',
-    120497: 'ALetter',
-    120498: 'ALetter',
-    120499: 'ALetter',
-    120500: 'ALetter',
-    120501: 'ALetter',
-    120502: 'ALetter',
-    120503: 'ALetter',
-    120504: 'ALetter',
-    120505: 'ALetter',
-    120506: 'ALetter',
-    120507: 'ALetter',
-    120508: 'ALetter',
-    120509: 'ALetter',
-    120510: 'ALetter',
-    120511: 'ALetter',
-    120512: 'ALetter',
-    120514: 'ALetter',
-    120515: 'ALetter',
-    120516: 'ALetter',
-    120517: 'ALetter',
-    120518: 'ALetter',
-    120519: 'ALetter',
-    120520: 'ALetter',
-    120521: 'ALetter',
-    120522: 'ALetter',
-    120523: 'ALetter',
-    120524: 'ALetter',
-    120525: 'ALetter',
-    120526: 'ALetter',
-    120527: 'ALetter',
-    120528: 'ALetter',
-    120529: 'ALetter',
-    120530: 'ALetter',
-    120531: 'ALetter',
-    120532: 'ALetter',
-    120533: 'ALetter',
-    120534: 'ALetter',
-    120535: 'ALetter',
-    120536: 'ALetter',
-    120537: 'ALetter',
-    120538: 'ALetter',
-    120540: 'ALetter',
-    120541: 'ALetter',
-    120542: 'ALetter',
-    120543: 'ALetter',
-    120544: 'ALetter',
-    120545: 'ALetter',
-    120546: 'ALetter',
-    120547: 'ALetter',
-    120548: 'ALetter',
-    120549: 'ALetter',
-    120550: 'ALetter',
-    120551: 'ALetter',
-    120552: 'ALetter',
-    120553: 'ALetter',
-    120554: 'ALetter',
-    120555: 'ALetter',
-    120556: 'ALetter',
-    120557: 'ALetter',
-    120558: 'ALetter',
-    120559: 'ALetter',
-    120560: 'ALetter',
-    120561: 'ALetter',
-    120562: 'ALetter',
-    120563: 'ALetter',
-    120564: 'ALetter',
-    120565: 'ALetter',
-    120566: 'ALetter',
-    120567: 'ALetter',
-    120568: 'ALetter',
-    120569: 'ALetter',
-    120570: 'ALetter',
-    120572: 'ALetter',
-    120573: 'ALetter',
-    120574: 'ALetter',
-    120575: 'ALetter',
-    120576: 'ALetter',
-    120577: 'ALetter',
-    120578: 'ALetter',
-    120579: 'ALetter',
-    120580: 'ALetter',
-    120581: 'ALetter',
-    120582: 'ALetter',
-    120583: 'ALetter',
-    120584: 'ALetter',
-    120585: 'ALetter',
-    120586: 'ALetter',
-    120587: 'ALetter',
-    120588: 'ALetter',
-    120589: 'ALetter',
-    120590: 'ALetter',
-    120591: 'ALetter',
-    120592: 'ALetter',
-    120593: 'ALetter',
-    120594: 'ALetter',
-    120595: 'ALetter',
-    120596: 'ALetter',
-    120598: 'ALetter',
-    120599: 'ALetter',
-    120600: 'ALetter',
-    120601: 'ALetter',
-    120602: 'ALetter',
-    120603: 'ALetter',
-    120604: 'ALetter',
-    120605: 'ALetter',
-    120606: 'ALetter',
-    120607: 'ALetter',
-    120608: 'ALetter',
-    120609: 'ALetter',
-    120610: 'ALetter',
-    120611: 'ALetter',
-    120612: 'ALetter',
-    120613: 'ALetter',
-    120614: 'ALetter',
-    120615: 'ALetter',
-    120616: 'ALetter',
-    120617: 'ALetter',
-    120618: 'ALetter',
-    120619: 'ALetter',
-    120620: 'ALetter',
-    120621: 'ALetter',
-    120622: 'ALetter',
-    120623: 'ALetter',
-    120624: 'ALetter',
-    120625: 'ALetter',
-    120626: 'ALetter',
-    120627: 'ALetter',
-    120628: 'ALetter',
-    120630: 'ALetter',
-    120631: 'ALetter',
-    120632: 'ALetter',
-    120633: 'ALetter',
-    120634: 'ALetter',
-    120635: 'ALetter',
-    120636: 'ALetter',
-    120637: 'ALetter',
-    120638: 'ALetter',
-    120639: 'ALetter',
-    120640: 'ALetter',
-    120641: 'ALetter',
-    120642: 'ALetter',
-    120643: 'ALetter',
-    120644: 'ALetter',
-    120645: 'ALetter',
-    120646: 'ALetter',
-    120647: 'ALetter',
-    120648: 'ALetter',
-    120649: 'ALetter',
-    120650: 'ALetter',
-    120651: 'ALetter',
-    120652: 'ALetter',
-    120653: 'ALetter',
-    120654: 'ALetter',
-    120656: 'ALetter',
-    120657: 'ALetter',
-    120658: 'ALetter',
-    120659: 'ALetter',
-    120660: 'ALetter',
-    120661: 'ALetter',
-    120662: 'ALetter',
-    120663: 'ALetter',
-    120664: 'ALetter',
-    120665: 'ALetter',
-    120666: 'ALetter',
-    120667: 'ALetter',
-    120668: 'ALetter',
-    120669: 'ALetter',
-    120670: 'ALetter',
-    120671: 'ALetter',
-    120672: 'ALetter',
-    120673: 'ALetter',
-    120674: 'ALetter',
-    120675: 'ALetter',
-    120676: 'ALetter',
-    120677: 'ALetter',
-    120678: 'ALetter',
-    120679: 'ALetter',
-    120680: 'ALetter',
-    120681: 'ALetter',
-    120682: 'ALetter',
-    120683: 'ALetter',
-    120684: 'ALetter',
-    120685: 'ALetter',
-    120686: 'ALetter',
-    120688: 'ALetter',
-    120689: 'ALetter',
-    120690: 'ALetter',
-    120691: 'ALetter',
-    120692: 'ALetter',
-    120693: 'ALetter',
-    120694: 'ALetter',
-    120695: 'ALetter',
-    120696: 'ALetter',
-    120697: 'ALetter',
-    120698: 'ALetter',
-    120699: 'ALetter',
-    120700: 'ALetter',
-    120701: 'ALetter',
-    120702: 'ALetter',
-    120703: 'ALetter',
-    120704: 'ALetter',
-    120705: 'ALetter',
-    120706: 'ALetter',
-    120707: 'ALetter',
-    120708: 'ALetter',
-    120709: 'ALetter',
-    120710: 'ALetter',
-    120711: 'ALetter',
-    120712: 'ALetter',
-    120714: 'ALetter',
-    120715: 'ALetter',
-    120716: 'ALetter',
-    120717: 'ALetter',
-    120718: 'ALetter',
-    120719: 'ALetter',
-    120720: 'ALetter',
-    120721: 'ALetter',
-    120722: 'ALetter',
-    120723: 'ALetter',
-    120724: 'ALetter',
-    120725: 'ALetter',
-    120726: 'ALetter',
-    120727: 'ALetter',
-    120728: 'ALetter',
-    120729: 'ALetter',
-    120730: 'ALetter',
-    120731: 'ALetter',
-    120732: 'ALetter',
-    120733: 'ALetter',
-    120734: 'ALetter',
-    120735: 'ALetter',
-    120736: 'ALetter',
-    120737: 'ALetter',
-    120738: 'ALetter',
-    120739: 'ALetter',
-    120740: 'ALetter',
-    120741: 'ALetter',
-    120742: 'ALetter',
-    120743: 'ALetter',
-    120744: 'ALetter',
-    120746: 'ALetter',
-    120747: 'ALetter',
-    120748: 'ALetter',
-    120749: 'ALetter',
-    120750: 'ALetter',
-    120751: 'ALetter',
-    120752: 'ALetter',
-    120753: 'ALetter',
-    120754: 'ALetter',
-    120755: 'ALetter',
-    120756: 'ALetter',
-    120757: 'ALetter',
-    120758: 'ALetter',
-    120759: 'ALetter',
-    120760: 'ALetter',
-    120761: 'ALetter',
-    120762: 'ALetter',
-    120763: 'ALetter',
-    120764: 'ALetter',
-    120765: 'ALetter',
-    120766: 'ALetter',
-    120767: 'ALetter',
-    120768: 'ALetter',
-    120769: 'ALetter',
-    120770: 'ALetter',
-    120772: 'ALetter',
-    120773: 'ALetter',
-    120774: 'ALetter',
-    120775: 'ALetter',
-    120776: 'ALetter',
-    120777: 'ALetter',
-    120778: 'ALetter',
-    120779: 'ALetter',
-    120782: 'Numeric',
-    120783: 'Numeric',
-    120784: 'Numeric',
-    120785: 'Numeric',
-    120786: 'Numeric',
-    120787: 'Numeric',
-    120788: 'Numeric',
-    120789: 'Numeric',
-    120790: 'Numeric',
-    120791: 'Numeric',
-    120792: 'Numeric',
-    120793: 'Numeric',
-    120794: 'Numeric',
-    120795: 'Numeric',
-    120796: 'Numeric',
-    120797: 'Numeric',
-    120798: 'Numeric',
-    120799: 'Numeric',
-    120800: 'Numeric',
-    120801: 'Numeric',
-    120802: 'Numeric',
-    120803: 'Numeric',
-    120804: 'Numeric',
-    120805: 'Numeric',
-    120806: 'Numeric',
-    120807: 'Numeric',
-    120808: 'Numeric',
-    120809: 'Numeric',
-    120810: 'Numeric',
-    120811: 'Numeric',
-    120812: 'Numeric',
-    120813: 'Numeric',
-    120814: 'Numeric',
-    120815: 'Numeric',
-    120816: 'Numeric',
-    120817: 'Numeric',
-    120818: 'Numeric',
-    120819: 'Numeric',
-    120820: 'Numeric',
-    120821: 'Numeric',
-    120822: 'Numeric',
-    120823: 'Numeric',
-    120824: 'Numeric',
-    120825: 'Numeric',
-    120826: 'Numeric',
-    120827: 'Numeric',
-    120828: 'Numeric',
-    120829: 'Numeric',
-    120830: 'Numeric',
-    120831: 'Numeric',
-    917505: 'Format',
-    917536: 'Format',
-    917537: 'Format',
-    917538: 'Format',
-    917539: 'Format',
-    917540: 'Format',
-    917541: 'Format',
-    917542: 'Format',
-    917543: 'Format',
-    917544: 'Format',
-    917545: 'Format',
-    917546: 'Format',
-    917547: 'Format',
-    917548: 'Format',
-    917549: 'Format',
-    917550: 'Format',
-    917551: 'Format',
-    917552: 'Format',
-    917553: 'Format',
-    917554: 'Format',
-    917555: 'Format',
-    917556: 'Format',
-    917557: 'Format',
-    917558: 'Format',
-    917559: 'Format',
-    917560: 'Format',
-    917561: 'Format',
-    917562: 'Format',
-    917563: 'Format',
-    917564: 'Format',
-    917565: 'Format',
-    917566: 'Format',
-    917567: 'Format',
-    917568: 'Format',
-    917569: 'Format',
-    917570: 'Format',
-    917571: 'Format',
-    917572: 'Format',
-    917573: 'Format',
-    917574: 'Format',
-    917575: 'Format',
-    917576: 'Format',
-    917577: 'Format',
-    917578: 'Format',
-    917579: 'Format',
-    917580: 'Format',
-    917581: 'Format',
-    917582: 'Format',
-    917583: 'Format',
-    917584: 'Format',
-    917585: 'Format',
-    917586: 'Format',
-    917587: 'Format',
-    917588: 'Format',
-    917589: 'Format',
-    917590: 'Format',
-    917591: 'Format',
-    917592: 'Format',
-    917593: 'Format',
-    917594: 'Format',
-    917595: 'Format',
-    917596: 'Format',
-    917597: 'Format',
-    917598: 'Format',
-    917599: 'Format',
-    917600: 'Format',
-    917601: 'Format',
-    917602: 'Format',
-    917603: 'Format',
-    917604: 'Format',
-    917605: 'Format',
-    917606: 'Format',
-    917607: 'Format',
-    917608: 'Format',
-    917609: 'Format',
-    917610: 'Format',
-    917611: 'Format',
-    917612: 'Format',
-    917613: 'Format',
-    917614: 'Format',
-    917615: 'Format',
-    917616: 'Format',
-    917617: 'Format',
-    917618: 'Format',
-    917619: 'Format',
-    917620: 'Format',
-    917621: 'Format',
-    917622: 'Format',
-    917623: 'Format',
-    917624: 'Format',
-    917625: 'Format',
-    917626: 'Format',
-    917627: 'Format',
-    917628: 'Format',
-    917629: 'Format',
-    917630: 'Format',
-    917631: 'Format'}
\ No newline at end of file
+from array import array
+
+wordBreakPropertyNames = [   'ALetter',
+    'CR',
+    'Extend',
+    'ExtendNumLet',
+    'Format',
+    'Katakana',
+    'LF',
+    'MidLetter',
+    'MidNum',
+    'Newline',
+    'Numeric',
+    'Regional_Indicator',
+    'WSegSpace',
+    'ZWJ']
+
+wordBreakRangeStarts = array('L', [
+    10, 11, 13, 32, 39, 44, 46, 48, 58, 59, 65, 95, 97, 133, 170, 173, 181,
+    183, 186, 192, 216, 248, 710, 736, 750, 768, 890, 894, 902, 904, 908, 910,
+    931, 976, 1015, 1155, 1160, 1162, 1329, 1369, 1377, 1417, 1425, 1471, 1473,
+    1476, 1479, 1488, 1520, 1524, 1536, 1549, 1552, 1569, 1600, 1611, 1632,
+    1643, 1646, 1648, 1649, 1749, 1750, 1757, 1758, 1765, 1767, 1770, 1774,
+    1776, 1786, 1791, 1807, 1808, 1809, 1810, 1840, 1869, 1920, 1958, 1969,
+    1984, 1994, 2027, 2036, 2040, 2042, 2305, 2307, 2364, 2365, 2369, 2377,
+    2381, 2384, 2385, 2392, 2402, 2406, 2427, 2433, 2434, 2437, 2447, 2451,
+    2474, 2482, 2486, 2492, 2493, 2494, 2495, 2497, 2503, 2507, 2509, 2510,
+    2519, 2524, 2527, 2530, 2534, 2544, 2561, 2563, 2565, 2575, 2579, 2602,
+    2610, 2613, 2616, 2620, 2622, 2625, 2631, 2635, 2649, 2654, 2662, 2672,
+    2674, 2689, 2691, 2693, 2703, 2707, 2730, 2738, 2741, 2748, 2749, 2753,
+    2759, 2761, 2763, 2765, 2768, 2784, 2786, 2790, 2817, 2818, 2821, 2831,
+    2835, 2858, 2866, 2869, 2876, 2877, 2878, 2880, 2881, 2887, 2891, 2893,
+    2902, 2908, 2911, 2918, 2929, 2946, 2947, 2949, 2958, 2962, 2969, 2972,
+    2974, 2979, 2984, 2990, 3006, 3007, 3008, 3009, 3014, 3018, 3021, 3031,
+    3046, 3073, 3077, 3086, 3090, 3114, 3125, 3134, 3137, 3142, 3146, 3157,
+    3168, 3174, 3202, 3205, 3214, 3218, 3242, 3253, 3260, 3261, 3263, 3264,
+    3266, 3267, 3270, 3271, 3274, 3276, 3285, 3294, 3296, 3298, 3302, 3330,
+    3333, 3342, 3346, 3370, 3390, 3391, 3393, 3398, 3402, 3405, 3415, 3424,
+    3430, 3458, 3461, 3482, 3507, 3517, 3520, 3530, 3535, 3536, 3538, 3542,
+    3544, 3551, 3570, 3633, 3636, 3655, 3664, 3761, 3764, 3771, 3784, 3792,
+    3840, 3864, 3872, 3893, 3895, 3897, 3902, 3904, 3913, 3953, 3967, 3968,
+    3974, 3976, 3984, 3993, 4038, 4140, 4150, 4160, 4182, 4256, 4304, 4348,
+    4352, 4447, 4520, 4608, 4682, 4688, 4696, 4698, 4704, 4746, 4752, 4786,
+    4792, 4800, 4802, 4808, 4824, 4882, 4888, 4959, 4992, 5024, 5121, 5743,
+    5760, 5761, 5792, 5870, 5888, 5902, 5906, 5920, 5938, 5952, 5970, 5984,
+    5998, 6002, 6068, 6070, 6109, 6112, 6155, 6158, 6160, 6176, 6272, 6313,
+    6400, 6432, 6435, 6439, 6441, 6448, 6450, 6451, 6457, 6470, 6576, 6600,
+    6608, 6656, 6679, 6681, 6912, 6916, 6964, 6965, 6966, 6971, 6972, 6973,
+    6978, 6979, 6980, 6981, 6992, 7019, 7424, 7616, 7678, 7680, 7840, 7936,
+    7960, 7968, 8008, 8016, 8025, 8027, 8029, 8031, 8064, 8118, 8126, 8130,
+    8134, 8144, 8150, 8160, 8178, 8182, 8192, 8200, 8203, 8204, 8205, 8206,
+    8217, 8231, 8232, 8234, 8255, 8260, 8276, 8287, 8288, 8298, 8305, 8319,
+    8336, 8400, 8450, 8455, 8458, 8469, 8473, 8484, 8486, 8488, 8490, 8495,
+    8508, 8517, 8526, 8544, 9398, 11264, 11312, 11360, 11380, 11392, 11520,
+    11568, 11631, 11648, 11680, 11688, 11696, 11704, 11712, 11720, 11728,
+    11736, 12288, 12293, 12330, 12337, 12347, 12441, 12443, 12448, 12540,
+    12549, 12593, 12704, 12784, 40960, 42775, 43008, 43010, 43011, 43014,
+    43015, 43019, 43020, 43045, 43047, 43072, 44032, 64048, 64256, 64275,
+    64285, 64286, 64287, 64298, 64312, 64318, 64320, 64323, 64326, 64467,
+    64848, 64914, 65008, 65024, 65040, 65043, 65056, 65075, 65101, 65136,
+    65142, 65279, 65313, 65343, 65345, 65382, 65440, 65474, 65482, 65490,
+    65498, 65529, 65536, 65549, 65576, 65596, 65599, 65616, 65664, 65856,
+    66304, 66352, 66432, 66464, 66504, 66513, 66560, 66720, 67584, 67592,
+    67594, 67639, 67644, 67647, 67840, 68096, 68097, 68101, 68108, 68112,
+    68117, 68121, 68152, 68159, 73728, 74752, 119141, 119149, 119155, 119163,
+    119173, 119210, 119362, 119808, 119894, 119966, 119970, 119973, 119977,
+    119982, 119995, 119997, 120005, 120071, 120077, 120086, 120094, 120123,
+    120128, 120134, 120138, 120146, 120488, 120514, 120540, 120572, 120598,
+    120630, 120656, 120688, 120714, 120746, 120772, 120782, 127462, 917505,
+    917536, 917760,
+])
+
+wordBreakRangeEnds = array('L', [
+    10, 12, 13, 32, 39, 44, 46, 57, 58, 59, 90, 95, 122, 133, 170, 173, 181,
+    183, 186, 214, 246, 705, 721, 740, 750, 879, 893, 894, 902, 906, 908, 929,
+    974, 1013, 1153, 1158, 1161, 1299, 1366, 1369, 1415, 1417, 1469, 1471,
+    1474, 1477, 1479, 1514, 1523, 1524, 1539, 1549, 1557, 1594, 1610, 1630,
+    1641, 1644, 1647, 1648, 1747, 1749, 1756, 1757, 1764, 1766, 1768, 1773,
+    1775, 1785, 1788, 1791, 1807, 1808, 1809, 1839, 1866, 1901, 1957, 1968,
+    1969, 1993, 2026, 2035, 2037, 2040, 2042, 2306, 2361, 2364, 2368, 2376,
+    2380, 2381, 2384, 2388, 2401, 2403, 2415, 2431, 2433, 2435, 2444, 2448,
+    2472, 2480, 2482, 2489, 2492, 2493, 2494, 2496, 2500, 2504, 2508, 2509,
+    2510, 2519, 2525, 2529, 2531, 2543, 2545, 2562, 2563, 2570, 2576, 2600,
+    2608, 2611, 2614, 2617, 2620, 2624, 2626, 2632, 2637, 2652, 2654, 2671,
+    2673, 2676, 2690, 2691, 2701, 2705, 2728, 2736, 2739, 2745, 2748, 2752,
+    2757, 2760, 2761, 2764, 2765, 2768, 2785, 2787, 2799, 2817, 2819, 2828,
+    2832, 2856, 2864, 2867, 2873, 2876, 2877, 2879, 2880, 2883, 2888, 2892,
+    2893, 2903, 2909, 2913, 2927, 2929, 2946, 2947, 2954, 2960, 2965, 2970,
+    2972, 2975, 2980, 2986, 3001, 3006, 3007, 3008, 3010, 3016, 3020, 3021,
+    3031, 3055, 3075, 3084, 3088, 3112, 3123, 3129, 3136, 3140, 3144, 3149,
+    3158, 3169, 3183, 3203, 3212, 3216, 3240, 3251, 3257, 3260, 3262, 3263,
+    3265, 3266, 3268, 3270, 3272, 3275, 3277, 3286, 3294, 3297, 3299, 3311,
+    3331, 3340, 3344, 3368, 3385, 3390, 3392, 3395, 3400, 3404, 3405, 3415,
+    3425, 3439, 3459, 3478, 3505, 3515, 3517, 3526, 3530, 3535, 3537, 3540,
+    3542, 3550, 3551, 3571, 3633, 3642, 3662, 3673, 3761, 3769, 3772, 3789,
+    3801, 3840, 3865, 3881, 3893, 3895, 3897, 3903, 3911, 3946, 3966, 3967,
+    3972, 3975, 3979, 3991, 4028, 4038, 4146, 4153, 4169, 4185, 4293, 4346,
+    4348, 4441, 4514, 4601, 4680, 4685, 4694, 4696, 4701, 4744, 4749, 4784,
+    4789, 4798, 4800, 4805, 4822, 4880, 4885, 4954, 4959, 5007, 5108, 5740,
+    5750, 5760, 5786, 5866, 5872, 5900, 5905, 5908, 5937, 5940, 5969, 5971,
+    5996, 6000, 6003, 6069, 6099, 6109, 6121, 6157, 6158, 6169, 6263, 6312,
+    6313, 6428, 6434, 6438, 6440, 6443, 6449, 6450, 6456, 6459, 6479, 6592,
+    6601, 6617, 6678, 6680, 6683, 6915, 6963, 6964, 6965, 6970, 6971, 6972,
+    6977, 6978, 6979, 6980, 6987, 7001, 7027, 7615, 7626, 7679, 7835, 7929,
+    7957, 7965, 8005, 8013, 8023, 8025, 8027, 8029, 8061, 8116, 8124, 8126,
+    8132, 8140, 8147, 8155, 8172, 8180, 8188, 8198, 8202, 8203, 8204, 8205,
+    8207, 8217, 8231, 8233, 8238, 8256, 8260, 8276, 8287, 8291, 8303, 8305,
+    8319, 8340, 8431, 8450, 8455, 8467, 8469, 8477, 8484, 8486, 8488, 8493,
+    8505, 8511, 8521, 8526, 8580, 9449, 11310, 11358, 11372, 11383, 11492,
+    11557, 11621, 11631, 11670, 11686, 11694, 11702, 11710, 11718, 11726,
+    11734, 11742, 12288, 12293, 12335, 12341, 12348, 12442, 12444, 12538,
+    12543, 12588, 12686, 12727, 12799, 42124, 42778, 43009, 43010, 43013,
+    43014, 43018, 43019, 43044, 43046, 43047, 43123, 55203, 64106, 64262,
+    64279, 64285, 64286, 64296, 64310, 64316, 64318, 64321, 64324, 64433,
+    64829, 64911, 64967, 65019, 65039, 65040, 65044, 65059, 65076, 65103,
+    65140, 65276, 65279, 65338, 65343, 65370, 65439, 65470, 65479, 65487,
+    65495, 65500, 65531, 65547, 65574, 65594, 65597, 65613, 65629, 65786,
+    65908, 66334, 66378, 66461, 66499, 66511, 66517, 66717, 66729, 67589,
+    67592, 67637, 67640, 67644, 67647, 67861, 68096, 68099, 68102, 68111,
+    68115, 68119, 68147, 68154, 68159, 74606, 74850, 119145, 119154, 119162,
+    119170, 119179, 119213, 119364, 119892, 119964, 119967, 119970, 119974,
+    119980, 119993, 119995, 120003, 120069, 120074, 120084, 120092, 120121,
+    120126, 120132, 120134, 120144, 120485, 120512, 120538, 120570, 120596,
+    120628, 120654, 120686, 120712, 120744, 120770, 120779, 120831, 127487,
+    917505, 917631, 917999,
+])
+
+wordBreakRangeValues = array('B', [
+    6, 9, 1, 12, 7, 8, 8, 10, 7, 8, 0, 3, 0, 9, 0, 4, 0, 7, 0, 0, 0, 0, 0, 0,
+    0, 2, 0, 8, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0, 0, 0, 8, 2, 2, 2, 2, 2, 0, 0,
+    7, 4, 8, 2, 0, 0, 2, 10, 10, 0, 2, 0, 0, 2, 4, 2, 0, 2, 2, 0, 10, 0, 0, 4,
+    0, 2, 0, 2, 0, 0, 2, 0, 10, 0, 2, 0, 8, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2,
+    10, 0, 2, 0, 0, 0, 0, 0, 0, 0, 2, 0, 2, 0, 2, 0, 0, 2, 0, 2, 0, 0, 2, 10,
+    0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 2, 2, 2, 0, 0, 10, 2, 0, 2, 0, 0, 0, 0,
+    0, 0, 0, 2, 0, 2, 2, 0, 0, 2, 0, 0, 2, 10, 2, 0, 0, 0, 0, 0, 0, 0, 2, 0, 2,
+    0, 2, 0, 0, 2, 2, 0, 0, 10, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 2, 0,
+    0, 0, 2, 2, 10, 0, 0, 0, 0, 0, 0, 2, 0, 2, 2, 2, 0, 10, 0, 0, 0, 0, 0, 0,
+    2, 0, 2, 0, 2, 0, 2, 0, 0, 2, 2, 0, 0, 2, 10, 0, 0, 0, 0, 0, 2, 0, 2, 0, 0,
+    2, 2, 0, 10, 0, 0, 0, 0, 0, 0, 2, 2, 0, 2, 2, 0, 2, 0, 2, 2, 2, 10, 2, 2,
+    2, 2, 10, 0, 2, 10, 2, 2, 2, 2, 0, 0, 2, 0, 2, 2, 0, 2, 2, 2, 2, 2, 10, 2,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0,
+    0, 0, 12, 0, 0, 0, 0, 0, 2, 0, 2, 0, 2, 0, 0, 2, 4, 2, 2, 10, 2, 12, 10, 0,
+    0, 2, 0, 2, 0, 2, 0, 0, 2, 0, 2, 10, 2, 2, 10, 0, 2, 0, 2, 0, 2, 0, 2, 0,
+    2, 0, 2, 0, 2, 0, 10, 2, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 12, 12, 4, 2, 13, 4, 7, 7, 9, 4, 3, 8, 3, 12, 4, 4, 0,
+    0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12, 0, 2, 5, 0, 2, 5, 5, 5, 0, 0, 0, 5, 0, 0,
+    0, 2, 0, 2, 0, 2, 0, 2, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 2, 8, 8, 2, 3, 3, 0, 0, 4, 0, 3, 0, 5, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 0, 0,
+    0, 2, 2, 0, 0, 2, 2, 4, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10, 11, 4, 4, 2,
+])
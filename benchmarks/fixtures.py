@@ -0,0 +1,401 @@
+"""
+Synthetic fonts for the benchmarks.
+
+The fonts are built with fontTools' FontBuilder and the
+feature file compiler, so no binary fonts have to be kept
+in the repository. Each fixture is a dict with:
+- cmap
+  A dict of code point to glyph name.
+- glyphs
+  Glyph names that are not in the cmap.
+- marks
+  Glyph names that have no advance width.
+- features
+  The feature file source.
+- alphabet
+  The characters that sample text is made of.
+- marksAlphabet
+  Characters that are placed after the letters in
+  the sample text. Optional.
+- script
+- rightToLeft
+- enabledFeatures
+  Features that are off by default and have to be
+  turned on. Optional.
+"""
+
+import os
+import random
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+from fontTools.ttLib.tables import otTables
+
+# -----
+# Tools
+# -----
+
+def _drawBox(width):
+    pen = TTGlyphPen(None)
+    pen.moveTo((50, 0))
+    pen.lineTo((50, 700))
+    pen.lineTo((max(width - 50, 100), 700))
+    pen.lineTo((max(width - 50, 100), 0))
+    pen.closePath()
+    return pen.glyph()
+
+def buildFont(path, fixture, familyName="Compositor Benchmark"):
+    """
+    Build a TrueType font for a fixture at path.
+    """
+    glyphOrder = [".notdef"]
+    for glyphName in list(fixture["cmap"].values()) + list(fixture.get("glyphs", [])):
+        if glyphName not in glyphOrder:
+            glyphOrder.append(glyphName)
+    marks = set(fixture.get("marks", []))
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyphOrder)
+    builder.setupCharacterMap(fixture["cmap"])
+    glyphs = {}
+    metrics = {}
+    for glyphName in glyphOrder:
+        width = 0 if glyphName in marks else 500
+        glyphs[glyphName] = _drawBox(width or 200)
+        metrics[glyphName] = (width, 50)
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics(metrics)
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable(dict(familyName=familyName, styleName="Regular"))
+    builder.setupOS2()
+    builder.setupPost()
+    if fixture["features"]:
+        addOpenTypeFeaturesFromString(builder.font, fixture["features"])
+    if fixture.get("contextPositioning"):
+        _convertChainingContextPositioning(builder.font)
+    builder.save(path)
+    return path
+
+def _convertChainingContextPositioning(font):
+    """
+    The feature file compiler writes contextual positioning
+    as chaining context lookups. Convert the ones without
+    backtrack and lookahead to context lookups.
+    """
+    for lookup in font["GPOS"].table.LookupList.Lookup:
+        if lookup.LookupType != 8:
+            continue
+        subtables = []
+        for subtable in lookup.SubTable:
+            if subtable.Format != 3 or subtable.BacktrackGlyphCount or subtable.LookAheadGlyphCount:
+                break
+            converted = otTables.ContextPos()
+            converted.Format = 3
+            converted.GlyphCount = subtable.InputGlyphCount
+            converted.Coverage = subtable.InputCoverage
+            converted.PosCount = subtable.PosCount
+            converted.PosLookupRecord = subtable.PosLookupRecord
+            subtables.append(converted)
+        else:
+            lookup.LookupType = 7
+            lookup.SubTable = subtables
+
+def buildFonts(directory, fixtures):
+    """
+    Build the fonts for a dict of fixtures in directory.
+    Returns a dict of fixture name to font path.
+    """
+    paths = {}
+    for name, fixture in fixtures.items():
+        paths[name] = buildFont(os.path.join(directory, name + ".ttf"), fixture)
+    return paths
+
+def makeText(fixture, length, seed=0):
+    """
+    Make a string of words with about length characters
+    from the fixture's alphabet.
+    """
+    randomizer = random.Random(seed)
+    alphabet = fixture["alphabet"]
+    marksAlphabet = fixture.get("marksAlphabet")
+    text = []
+    count = 0
+    while count < length:
+        for i in range(randomizer.randint(2, 8)):
+            text.append(randomizer.choice(alphabet))
+            count += 1
+            if marksAlphabet:
+                for j in range(randomizer.randint(0, 2)):
+                    text.append(randomizer.choice(marksAlphabet))
+                    count += 1
+        text.append(" ")
+        count += 1
+    return "".join(text)[:length]
+
+def _glyphClass(glyphNames):
+    return "[%s]" % " ".join(glyphNames)
+
+_uppercase = [chr(i) for i in range(ord("A"), ord("Z") + 1)]
+_lowercase = [chr(i) for i in range(ord("a"), ord("z") + 1)]
+
+def _latinCMAP():
+    cmap = {ord(" "): "space", ord("."): "period", ord(","): "comma"}
+    for c in _uppercase + _lowercase:
+        cmap[ord(c)] = c
+    return cmap
+
+# --------
+# Fixtures
+# --------
+
+def kernFixture():
+    """
+    Latin with a kern feature made of glyph pairs
+    for every letter combination and class pairs.
+    """
+    lines = ["languagesystem DFLT dflt;", "languagesystem latn dflt;", ""]
+    lines.append("@UC = %s;" % _glyphClass(_uppercase))
+    lines.append("@LC = %s;" % _glyphClass(_lowercase))
+    lines.append("feature kern {")
+    letters = _uppercase + _lowercase
+    for index, left in enumerate(letters):
+        for right in letters:
+            lines.append("    pos %s %s %d;" % (left, right, -((index % 7) + 1) * 5))
+    lines.append("    subtable;")
+    lines.append("    pos @UC @LC -10;")
+    lines.append("    pos @LC @UC -15;")
+    lines.append("} kern;")
+    return dict(
+        cmap=_latinCMAP(),
+        features="\n".join(lines),
+        alphabet="".join(letters),
+        script="latn",
+        rightToLeft=False
+    )
+
+def ligatureFixture():
+    """
+    Latin with two and three letter ligatures.
+    """
+    letters = _lowercase[:12]
+    ligatures = []
+    lines = ["languagesystem DFLT dflt;", "languagesystem latn dflt;", "", "feature liga {"]
+    for first in letters:
+        for second in letters:
+            for third in letters[:4]:
+                ligature = "%s_%s_%s" % (first, second, third)
+                ligatures.append(ligature)
+                lines.append("    sub %s %s %s by %s;" % (first, second, third, ligature))
+            ligature = "%s_%s" % (first, second)
+            ligatures.append(ligature)
+            lines.append("    sub %s %s by %s;" % (first, second, ligature))
+    lines.append("} liga;")
+    return dict(
+        cmap=_latinCMAP(),
+        glyphs=ligatures,
+        features="\n".join(lines),
+        alphabet="".join(_lowercase),
+        script="latn",
+        rightToLeft=False
+    )
+
+_arabicLetters = list(range(0x0628, 0x063A + 1)) + list(range(0x0641, 0x064A + 1))
+
+def arabicFixture():
+    """
+    Arabic with init, medi and fina forms for every letter.
+    """
+    cmap = {ord(" "): "space"}
+    bases = []
+    for code in _arabicLetters:
+        glyphName = "uni%04X" % code
+        cmap[code] = glyphName
+        bases.append(glyphName)
+    lines = ["languagesystem DFLT dflt;", "languagesystem arab dflt;", ""]
+    glyphs = []
+    for feature in ("init", "medi", "fina"):
+        forms = ["%s.%s" % (glyphName, feature) for glyphName in bases]
+        glyphs.extend(forms)
+        lines.append("feature %s {" % feature)
+        lines.append("    sub %s by %s;" % (_glyphClass(bases), _glyphClass(forms)))
+        lines.append("} %s;" % feature)
+    return dict(
+        cmap=cmap,
+        glyphs=glyphs,
+        features="\n".join(lines),
+        alphabet="".join([chr(code) for code in _arabicLetters]),
+        script="arab",
+        rightToLeft=True
+    )
+
+_combiningMarks = list(range(0x0300, 0x0314 + 1))
+
+def markFixture():
+    """
+    Latin with combining marks attached with
+    mark to base and mark to mark positioning.
+    """
+    cmap = _latinCMAP()
+    marks = []
+    for code in _combiningMarks:
+        glyphName = "uni%04X" % code
+        cmap[code] = glyphName
+        marks.append(glyphName)
+    lines = ["languagesystem DFLT dflt;", "languagesystem latn dflt;", ""]
+    lines.append("markClass %s <anchor 100 700> @TOP;" % _glyphClass(marks))
+    lines.append("feature mark {")
+    for index, glyphName in enumerate(_uppercase + _lowercase):
+        lines.append("    pos base %s <anchor %d 750> mark @TOP;" % (glyphName, 200 + index))
+    lines.append("} mark;")
+    lines.append("feature mkmk {")
+    for index, glyphName in enumerate(marks):
+        lines.append("    pos mark %s <anchor 100 %d> mark @TOP;" % (glyphName, 900 + index))
+    lines.append("} mkmk;")
+    return dict(
+        cmap=cmap,
+        marks=marks,
+        features="\n".join(lines),
+        alphabet="".join(_uppercase + _lowercase),
+        marksAlphabet="".join([chr(code) for code in _combiningMarks]),
+        script="latn",
+        rightToLeft=False
+    )
+
+def contextualAlternatesFixture():
+    """
+    Latin with a large calt feature made of
+    chaining contextual substitutions.
+    """
+    alternates = ["%s.alt" % glyphName for glyphName in _lowercase]
+    lines = ["languagesystem DFLT dflt;", "languagesystem latn dflt;", ""]
+    lines.append("feature calt {")
+    for index, first in enumerate(_lowercase):
+        for second in _lowercase[index % 6::3]:
+            lines.append("    sub %s' %s by %s.alt;" % (first, second, first))
+    for index, first in enumerate(_lowercase):
+        for second in _lowercase[index % 5::5]:
+            lines.append("    sub %s %s' by %s.alt;" % (first, second, second))
+    lines.append("} calt;")
+    return dict(
+        cmap=_latinCMAP(),
+        glyphs=alternates,
+        features="\n".join(lines),
+        alphabet="".join(_lowercase),
+        script="latn",
+        rightToLeft=False
+    )
+
+fixtures = dict(
+    kern=kernFixture,
+    ligatures=ligatureFixture,
+    arabic=arabicFixture,
+    marks=markFixture,
+    contextualAlternates=contextualAlternatesFixture
+)
+
+# -------------------
+# Lookup Type Fixtures
+# -------------------
+# One font for each lookup type. The lookup applies at most
+# positions of the fixture's pattern, which is repeated to
+# make runs of any length.
+# The Boundary fixtures put ligature and multiple substitution
+# lookups in init, medi and fina, with long words in the pattern,
+# so that the word breaks are updated after length changes.
+
+def _lookupTypeFixture(features, pattern, glyphs=(), marks=(), cmap=None, enabledFeatures=(), contextPositioning=False):
+    if cmap is None:
+        cmap = _latinCMAP()
+    return dict(
+        cmap=cmap,
+        glyphs=list(glyphs),
+        marks=list(marks),
+        features="languagesystem DFLT dflt;\nlanguagesystem latn dflt;\n" + features,
+        pattern=pattern,
+        alphabet=pattern,
+        script="latn",
+        rightToLeft=False,
+        enabledFeatures=list(enabledFeatures),
+        contextPositioning=contextPositioning
+    )
+
+def _markCMAP():
+    cmap = _latinCMAP()
+    cmap[0x0300] = "gravecomb"
+    cmap[0x0301] = "acutecomb"
+    cmap[0x00E6] = "a_e"
+    return cmap
+
+lookupTypeFixtures = dict(
+    GSUB1=lambda: _lookupTypeFixture(
+        "feature salt { sub a by a.alt; sub b by b.alt; } salt;",
+        "ab ", glyphs=["a.alt", "b.alt"], enabledFeatures=["salt"]
+    ),
+    GSUB2=lambda: _lookupTypeFixture(
+        "feature ccmp { sub a by a.1 a.2; } ccmp;",
+        "ab ", glyphs=["a.1", "a.2"]
+    ),
+    GSUB2Boundary=lambda: _lookupTypeFixture(
+        "feature init { sub a by a.1 a.2; } init;\nfeature medi { sub b by b.1 b.2; } medi;\nfeature fina { sub a by a.1 a.2; } fina;",
+        "ab" * 12 + "a ", glyphs=["a.1", "a.2", "b.1", "b.2"]
+    ),
+    GSUB3=lambda: _lookupTypeFixture(
+        "feature salt { sub a from [a.alt1 a.alt2]; } salt;",
+        "ab ", glyphs=["a.alt1", "a.alt2"], enabledFeatures=["salt"]
+    ),
+    GSUB4=lambda: _lookupTypeFixture(
+        "feature liga { sub a b by a_b; sub a c by a_c; } liga;",
+        "abc ", glyphs=["a_b", "a_c"]
+    ),
+    GSUB4Boundary=lambda: _lookupTypeFixture(
+        "feature init { sub a b by a_b; } init;\nfeature medi { sub a b by a_b; } medi;\nfeature fina { sub b a by b_a; } fina;",
+        "ab" * 12 + "a ", glyphs=["a_b", "b_a"]
+    ),
+    GSUB5=lambda: _lookupTypeFixture(
+        "lookup SUB { sub a by a.alt; } SUB;\nfeature calt { sub a' lookup SUB b'; } calt;",
+        "ab ", glyphs=["a.alt"]
+    ),
+    GSUB6=lambda: _lookupTypeFixture(
+        "feature calt { sub c a' b by a.alt; } calt;",
+        "cab ", glyphs=["a.alt"]
+    ),
+    GSUB7=lambda: _lookupTypeFixture(
+        "lookup EXT useExtension { sub a b by a_b; } EXT;\nfeature liga { lookup EXT; } liga;",
+        "ab ", glyphs=["a_b"]
+    ),
+    GPOS1=lambda: _lookupTypeFixture(
+        "feature kern { pos a <10 0 -20 0>; pos b <0 5 -10 0>; } kern;",
+        "ab "
+    ),
+    GPOS2=lambda: _lookupTypeFixture(
+        "feature kern { pos a b -20; pos b a -10; subtable; pos [a b] [c space] -5; } kern;",
+        "abc "
+    ),
+    GPOS3=lambda: _lookupTypeFixture(
+        "feature curs { pos cursive a <anchor 0 0> <anchor 450 100>; pos cursive b <anchor 50 0> <anchor 500 0>; } curs;",
+        "ab", enabledFeatures=["curs"]
+    ),
+    GPOS4=lambda: _lookupTypeFixture(
+        "markClass [gravecomb acutecomb] <anchor 100 700> @TOP;\nfeature mark { pos base [a b] <anchor 250 750> mark @TOP; } mark;",
+        "a\u0300b\u0301 ", marks=["gravecomb", "acutecomb"], cmap=_markCMAP()
+    ),
+    GPOS5=lambda: _lookupTypeFixture(
+        "markClass [gravecomb acutecomb] <anchor 100 700> @TOP;\nfeature mark { pos ligature a_e <anchor 150 750> mark @TOP ligComponent <anchor 350 750> mark @TOP; } mark;",
+        "\u00e6\u0300 ", marks=["gravecomb", "acutecomb"], cmap=_markCMAP()
+    ),
+    GPOS6=lambda: _lookupTypeFixture(
+        "markClass [gravecomb acutecomb] <anchor 100 700> @TOP;\nfeature mkmk { pos mark [gravecomb acutecomb] <anchor 100 900> mark @TOP; } mkmk;",
+        "a\u0300\u0301 ", marks=["gravecomb", "acutecomb"], cmap=_markCMAP()
+    ),
+    GPOS7=lambda: _lookupTypeFixture(
+        "lookup K { pos a -10; } K;\nfeature kern { pos a' lookup K b'; } kern;",
+        "ab ", contextPositioning=True
+    ),
+    GPOS8=lambda: _lookupTypeFixture(
+        "lookup K { pos a -10; } K;\nfeature kern { pos c a' lookup K b; } kern;",
+        "cab "
+    ),
+    GPOS9=lambda: _lookupTypeFixture(
+        "lookup EXT useExtension { pos a b -20; } EXT;\nfeature kern { lookup EXT; } kern;",
+        "ab "
+    ),
+)
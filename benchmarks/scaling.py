@@ -0,0 +1,143 @@
+"""
+Scaling checks.
+
+This builds a font for each GSUB and GPOS lookup type,
+as defined in fixtures.py, and processes runs of text with
+n, 2n and 4n characters. The growth exponent of the
+processing time is estimated from the times and the check
+fails if it is larger than the maximum exponent. An
+exponent of 1 means that the time grows linearly with the
+length of the run, 2 means that it grows quadratically.
+
+Usage:
+
+    python benchmarks/scaling.py
+    python benchmarks/scaling.py GSUB4 GPOS2 --length 2000 --max-exponent 1.2
+
+The script exits with status 1 if any of the checks fail.
+"""
+
+import gc
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from compositor import Font
+from fixtures import lookupTypeFixtures, buildFont
+
+defaultLength = 1000
+defaultMaxExponent = 1.3
+defaultRepeat = 5
+
+def measureTime(font, fixture, text, repeat):
+    """
+    Returns the shortest time it took to process text.
+    The garbage collector is turned off while timing,
+    as timeit does, because the time of a collection
+    depends on everything else that is alive.
+    """
+    times = []
+    gcWasEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(repeat):
+            start = time.process_time()
+            font.process(text, script=fixture["script"], rightToLeft=fixture["rightToLeft"])
+            times.append(time.process_time() - start)
+    finally:
+        if gcWasEnabled:
+            gc.enable()
+    return min(times)
+
+def getGrowthExponent(lengths, times):
+    """
+    Fit time = c * length ** exponent to the
+    measurements and return the exponent.
+
+        >>> round(getGrowthExponent([1, 2, 4], [1, 2, 4]), 3)
+        1.0
+        >>> round(getGrowthExponent([1, 2, 4], [1, 4, 16]), 3)
+        2.0
+    """
+    xs = [math.log(length) for length in lengths]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    xMean = sum(xs) / len(xs)
+    yMean = sum(ys) / len(ys)
+    numerator = sum([(x - xMean) * (y - yMean) for x, y in zip(xs, ys)])
+    denominator = sum([(x - xMean) ** 2 for x in xs])
+    return numerator / denominator
+
+def checkScaling(names=None, length=defaultLength, maxExponent=defaultMaxExponent, repeat=defaultRepeat, directory=None):
+    """
+    Run the scaling checks for the named fixtures.
+    Returns a dict of fixture name to a dict with the
+    run lengths, times, exponent and a passed flag.
+    """
+    if names is None:
+        names = sorted(lookupTypeFixtures)
+    lengths = [length, length * 2, length * 4]
+    removeDirectory = directory is None
+    if directory is None:
+        directory = tempfile.mkdtemp()
+    results = {}
+    try:
+        for name in names:
+            fixture = lookupTypeFixtures[name]()
+            path = buildFont(os.path.join(directory, name + ".ttf"), fixture)
+            font = Font(path)
+            for featureTag in fixture["enabledFeatures"]:
+                font.setFeatureState(featureTag, True)
+            pattern = fixture["pattern"]
+            times = []
+            for l in lengths:
+                text = (pattern * (l // len(pattern) + 1))[:l]
+                # the first call fills the caches
+                font.process(text, script=fixture["script"], rightToLeft=fixture["rightToLeft"])
+                times.append(measureTime(font, fixture, text, repeat))
+            font.close()
+            exponent = getGrowthExponent(lengths, times)
+            results[name] = dict(
+                lengths=lengths,
+                times=times,
+                exponent=exponent,
+                passed=exponent <= maxExponent
+            )
+    finally:
+        if removeDirectory:
+            shutil.rmtree(directory)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that processing time grows linearly with the run length.")
+    parser.add_argument("fixtures", nargs="*", help="Fixture names. All fixtures are used if none are given: %s" % ", ".join(sorted(lookupTypeFixtures)))
+    parser.add_argument("--length", type=int, default=defaultLength, help="The shortest run length.")
+    parser.add_argument("--max-exponent", type=float, default=defaultMaxExponent, help="The largest acceptable growth exponent.")
+    parser.add_argument("--repeat", type=int, default=defaultRepeat, help="The number of times each run is processed.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+    results = checkScaling(args.fixtures or None, length=args.length, maxExponent=args.max_exponent, repeat=args.repeat)
+    failed = []
+    for name, result in sorted(results.items()):
+        status = "ok"
+        if not result["passed"]:
+            status = "FAILED"
+            failed.append(name)
+        times = " ".join(["%.2f ms" % (t * 1000) for t in result["times"]])
+        print("%-6s exponent %.2f (%s) %s" % (name, result["exponent"], times, status))
+    if args.output:
+        f = open(args.output, "w")
+        json.dump(results, f, indent=2)
+        f.close()
+    if failed:
+        print("")
+        print("Growth exponent above %.2f: %s" % (args.max_exponent, ", ".join(failed)))
+        sys.exit(1)
@@ -0,0 +1,193 @@
+"""
+Shaping benchmarks.
+
+This builds the synthetic fonts defined in fixtures.py and
+measures, for each of them:
+- the time it takes to load the font
+- the peak memory allocated while loading the font
+- the number of glyphs processed per second for
+  runs of text of different lengths
+- the peak memory allocated while processing the
+  longest run
+
+Usage:
+
+    python benchmarks/shaping.py --output results.json
+    python benchmarks/shaping.py --compare results.json
+
+The results are written as JSON. When a previous result
+file is given with --compare, the change of each number
+relative to that file is printed.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Lib"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from compositor import Font
+from fixtures import fixtures, buildFont, makeText
+
+defaultRunLengths = [10, 100, 1000]
+
+# -----
+# Tools
+# -----
+
+def getCommit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL).decode("ascii").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def measureLoad(path, repeat):
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        font = Font(path)
+        times.append(time.perf_counter() - start)
+        font.close()
+    tracemalloc.start()
+    font = Font(path)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(times), peak, font
+
+def measureProcessing(font, fixture, text, minTime):
+    script = fixture["script"]
+    rightToLeft = fixture["rightToLeft"]
+    # the first call fills the caches
+    font.process(text, script=script, rightToLeft=rightToLeft)
+    count = 0
+    glyphCount = 0
+    start = time.perf_counter()
+    while True:
+        glyphCount += len(font.process(text, script=script, rightToLeft=rightToLeft))
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= minTime:
+            break
+    return count, glyphCount / elapsed, len(text) * count / elapsed
+
+def measureProcessingMemory(font, fixture, text):
+    tracemalloc.start()
+    font.process(text, script=fixture["script"], rightToLeft=fixture["rightToLeft"])
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+# ---------
+# Benchmark
+# ---------
+
+def runBenchmarks(names=None, runLengths=defaultRunLengths, minTime=0.5, loadRepeat=3, directory=None):
+    """
+    Run the benchmarks for the named fixtures
+    and return the results as a dict.
+    """
+    if names is None:
+        names = sorted(fixtures)
+    removeDirectory = directory is None
+    if directory is None:
+        directory = tempfile.mkdtemp()
+    results = dict(
+        commit=getCommit(),
+        date=time.strftime("%Y-%m-%d %H:%M:%S"),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        fonts={}
+    )
+    try:
+        for name in names:
+            fixture = fixtures[name]()
+            path = buildFont(os.path.join(directory, name + ".ttf"), fixture)
+            loadTime, loadMemory, font = measureLoad(path, loadRepeat)
+            runs = []
+            for length in runLengths:
+                text = makeText(fixture, length)
+                count, glyphsPerSecond, charactersPerSecond = measureProcessing(font, fixture, text, minTime)
+                runs.append(dict(
+                    length=length,
+                    calls=count,
+                    glyphsPerSecond=glyphsPerSecond,
+                    charactersPerSecond=charactersPerSecond
+                ))
+            processMemory = measureProcessingMemory(font, fixture, makeText(fixture, max(runLengths)))
+            font.close()
+            results["fonts"][name] = dict(
+                loadTime=loadTime,
+                loadPeakMemory=loadMemory,
+                processPeakMemory=processMemory,
+                runs=runs
+            )
+    finally:
+        if removeDirectory:
+            shutil.rmtree(directory)
+    return results
+
+def compareResults(old, new):
+    """
+    Returns lines of text describing the change
+    of each number from old to new.
+    """
+    def change(oldValue, newValue):
+        if not oldValue:
+            return "n/a"
+        return "%+.1f%%" % ((newValue - oldValue) / oldValue * 100)
+    lines = []
+    for name, fontResult in sorted(new["fonts"].items()):
+        oldFontResult = old["fonts"].get(name)
+        if oldFontResult is None:
+            continue
+        lines.append(name)
+        for key in ("loadTime", "loadPeakMemory", "processPeakMemory"):
+            lines.append("    %s: %s" % (key, change(oldFontResult[key], fontResult[key])))
+        oldRuns = dict([(run["length"], run) for run in oldFontResult["runs"]])
+        for run in fontResult["runs"]:
+            oldRun = oldRuns.get(run["length"])
+            if oldRun is None:
+                continue
+            lines.append("    glyphsPerSecond (%d): %s" % (run["length"], change(oldRun["glyphsPerSecond"], run["glyphsPerSecond"])))
+    return lines
+
+def formatResults(results):
+    lines = []
+    for name, fontResult in sorted(results["fonts"].items()):
+        lines.append("%s: load %.1f ms, %.1f KB; process %.1f KB" % (name, fontResult["loadTime"] * 1000, fontResult["loadPeakMemory"] / 1024, fontResult["processPeakMemory"] / 1024))
+        for run in fontResult["runs"]:
+            lines.append("    %6d characters: %10.0f glyphs/s" % (run["length"], run["glyphsPerSecond"]))
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure compositor shaping performance.")
+    parser.add_argument("fonts", nargs="*", help="Fixture names. All fixtures are used if none are given: %s" % ", ".join(sorted(fixtures)))
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="Compare the results with this JSON file.")
+    parser.add_argument("--lengths", default=",".join([str(i) for i in defaultRunLengths]), help="Comma separated run lengths.")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum number of seconds to process each run.")
+    parser.add_argument("--font-directory", help="Keep the built fonts in this directory.")
+    args = parser.parse_args()
+    names = args.fonts or None
+    runLengths = [int(i) for i in args.lengths.split(",")]
+    results = runBenchmarks(names, runLengths=runLengths, minTime=args.min_time, directory=args.font_directory)
+    print("\n".join(formatResults(results)))
+    if args.output:
+        f = open(args.output, "w")
+        json.dump(results, f, indent=2)
+        f.close()
+    if args.compare:
+        f = open(args.compare, "r")
+        old = json.load(f)
+        f.close()
+        print("")
+        print("\n".join(compareResults(old, results)))
@@ -2,14 +2,6 @@ from AppKit import *
 from fontTools.pens.cocoaPen import CocoaPen
 from compositor import Font
 
-# a simple function that implements path caching
-def getCachedNSBezierPath(glyph, font):
-    if not hasattr(glyph, "nsBezierPath"):
-        pen = CocoaPen(font)
-        glyph.draw(pen)
-        glyph.nsBezierPath = pen.path
-    return glyph.nsBezierPath
-
 # a path to a font
 fontPath = aPathToYourFont
 
@@ -59,8 +51,8 @@ for record in glyphRecords:
     # otherwise, set the color to black
     else:
         NSColor.blackColor().set()
-    # get a NSBezierPath for the glyph and fill it
-    path = getCachedNSBezierPath(glyph, font)
+    # get a cached NSBezierPath for the glyph and fill it
+    path = font.getGlyphPath(record.glyphName, CocoaPen).path
     path.fill()
     # shift for the next glyph
     transform = NSAffineTransform.transform()
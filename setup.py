@@ -22,5 +22,8 @@ setup(
     url="https://github.com/robotools/compositor",
     license="MIT",
     packages=["compositor"],
-    package_dir={"":"Lib"}
+    package_dir={"":"Lib"},
+    extras_require={
+        "numpy": ["numpy"]
+    }
 )
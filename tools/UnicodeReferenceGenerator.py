@@ -5,12 +5,22 @@ It references the following Unicode files:
     SpecialCasing.txt
     UnicodeData.txt
     WordBreakProperty.txt
+
+Older versions of WordBreakProperty.txt don't list all of
+the properties used by the current word boundary rules. The
+missing ones are derived from UnicodeData.txt and PropList.txt
+following the definitions in UAX #29.
+
+The data is written as sorted ranges of code points
+in packed arrays. The compositor.textUtilities module
+searches them with bisect and expands them on first use.
 """
 
 import os
 import pprint
 import time
-import compositor
+
+modulesDirectory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Lib", "compositor")
 
 # -----
 # Tools
@@ -35,49 +45,158 @@ def convertCodeToInt(code):
         return tuple([convertCodeToInt(i) for i in code.split(" ")])
     return int(code, 16)
 
+def convertCodeRange(code):
+    if ".." in code:
+        start, end = code.split("..")
+        return convertCodeToInt(start), convertCodeToInt(end)
+    code = convertCodeToInt(code)
+    return code, code
+
+def mergeRanges(ranges):
+    """
+    Sort (start, end, value) ranges and merge
+    the adjacent ranges that share a value.
+    """
+    merged = []
+    for start, end, value in sorted(ranges):
+        if merged:
+            previousStart, previousEnd, previousValue = merged[-1]
+            assert start > previousEnd
+            if previousEnd + 1 == start and previousValue == value:
+                merged[-1] = (previousStart, end, value)
+                continue
+        merged.append((start, end, value))
+    return merged
+
+def compressMapping(mapping):
+    """
+    Compress a dict of code point to code point into
+    a flat list of (start, end, step, delta) runs.
+    """
+    runs = []
+    for code in sorted(mapping):
+        delta = mapping[code] - code
+        if runs:
+            start, end, step, runDelta = runs[-1]
+            if runDelta == delta:
+                if start == end and code - end in (1, 2):
+                    runs[-1] = (start, code, code - end, delta)
+                    continue
+                if start != end and code - end == step:
+                    runs[-1] = (start, code, step, delta)
+                    continue
+        runs.append((code, code, 1, delta))
+    flat = []
+    for run in runs:
+        flat.extend(run)
+    return flat
+
+def formatArray(name, typeCode, values):
+    text = ["%s = array(%r, [" % (name, typeCode)]
+    line = "   "
+    for value in values:
+        item = " %d," % value
+        if len(line) + len(item) > 79:
+            text.append(line)
+            line = "   "
+        line += item
+    if line.strip():
+        text.append(line)
+    text.append("])")
+    return "\n".join(text)
+
+def writeModule(fileName, sections):
+    text = [
+        "# ------------",
+        "# DO NOT EDIT!",
+        "# ------------",
+        "# This was generated by tools/%s" % os.path.basename(__file__),
+        "# Generated on: %s" % (time.strftime("%a, %d %b %Y %H:%M:%S", time.localtime())),
+        "",
+        "from array import array",
+        "",
+    ]
+    for section in sections:
+        text.append(section)
+        text.append("")
+    text = "\n".join(text)
+    path = os.path.join(modulesDirectory, fileName)
+    f = open(path, "w")
+    f.write(text)
+    f.close()
+
 # ----------------------
 # wordBreakProperties.py
 # ----------------------
 
 p = os.path.join(os.path.dirname(__file__), "WordBreakProperty.txt")
 
-wordBreakProperties = {}
+wordBreakRanges = []
 
 for line in filterLines(p):
     data = line.split(";")
     data = [i.split("#")[0].strip() for i in data]
     code, property = data
-    if ".." in code:
-        start, end = code.split("..")
-        start = convertCodeToInt(start)
-        end = convertCodeToInt(end)
-        codes = range(start, end+1)
-    else:
-        codes = [convertCodeToInt(code)]
-    for code in codes:
-        assert code not in wordBreakProperties
-        wordBreakProperties[code] = property
+    start, end = convertCodeRange(code)
+    wordBreakRanges.append((start, end, property))
 
-# Write the module
+# Derived properties
 
-text = [
-    "# ------------",
-    "# DO NOT EDIT!",
-    "# ------------",
-    "# This was generated by tools/%s" % os.path.basename(__file__),
-    "# Generated on: %s" % (time.strftime("%a, %d %b %Y %H:%M:%S", time.localtime())),
-    "",
+p = os.path.join(os.path.dirname(__file__), "UnicodeData.txt")
+
+generalCategories = {}
+
+for line in filterLines(p):
+    data = line.split(";")
+    generalCategories[convertCodeToInt(data[0])] = data[2]
+
+p = os.path.join(os.path.dirname(__file__),  "PropList.txt")
+
+otherGraphemeExtend = set()
+
+for line in filterLines(p):
+    code, prop = [i.strip() for i in line.split(";")]
+    prop = prop.split("#")[0].strip()
+    if prop != "Other_Grapheme_Extend":
+        continue
+    start, end = convertCodeRange(code)
+    otherGraphemeExtend.update(range(start, end + 1))
+
+derivedWordBreakProperties = [
+    ("CR", [0x000D]),
+    ("LF", [0x000A]),
+    ("Newline", [0x000B, 0x000C, 0x0085, 0x2028, 0x2029]),
+    ("ZWJ", [0x200D]),
+    ("Regional_Indicator", range(0x1F1E6, 0x1F1FF + 1)),
+    ("Extend", sorted([code for code, category in generalCategories.items() if category in ("Mn", "Me", "Mc") or code in otherGraphemeExtend])),
+    ("WSegSpace", sorted([code for code, category in generalCategories.items() if category == "Zs" and code not in (0x00A0, 0x2007, 0x202F)])),
 ]
 
-text.append("%s = %s" % ("wordBreakProperties", pprint.pformat(wordBreakProperties, indent=4)))
+listedProperties = set([property for start, end, property in wordBreakRanges])
+assigned = set()
+for start, end, property in wordBreakRanges:
+    assigned.update(range(start, end + 1))
 
-text = "\n".join(text)
+for property, codes in derivedWordBreakProperties:
+    if property in listedProperties:
+        continue
+    for code in codes:
+        if code in assigned:
+            continue
+        assigned.add(code)
+        wordBreakRanges.append((code, code, property))
 
-path = os.path.join(os.path.dirname(compositor.__file__), "wordBreakProperties.py")
+wordBreakRanges = mergeRanges(wordBreakRanges)
+wordBreakPropertyNames = sorted(set([property for start, end, property in wordBreakRanges]))
 
-f = open(path, "w")
-f.write(text)
-f.close()
+# Write the module
+
+writeModule("wordBreakProperties.py", [
+    "wordBreakPropertyNames = %s" % pprint.pformat(wordBreakPropertyNames, indent=4),
+    formatArray("wordBreakRangeStarts", "L", [start for start, end, property in wordBreakRanges]),
+    formatArray("wordBreakRangeEnds", "L", [end for start, end, property in wordBreakRanges]),
+    formatArray("wordBreakRangeValues", "B", [wordBreakPropertyNames.index(property) for start, end, property in wordBreakRanges]),
+])
 
 # ---------------------
 # caseConversionMaps.py
@@ -138,55 +257,31 @@ for line in filterLines(p):
 
 # Property List
 
-softDotted = {}
+softDottedRanges = []
 
 p = os.path.join(os.path.dirname(__file__),  "PropList.txt")
 
 for line in filterLines(p):
     code, prop = [i.strip() for i in line.split(";")]
     prop = prop.split("#")[0].strip()
-    s = None
-    if prop == "Soft_Dotted":
-        s = softDotted
-    if s is None:
+    if prop != "Soft_Dotted":
         continue
-    if ".." in code:
-        start, end = code.split("..")
-        start = convertCodeToInt(start)
-        end = convertCodeToInt(end)
-        codes = range(start, end+1)
-    else:
-        codes = [convertCodeToInt(code)]
-    for code in codes:
-        s[code] = None
+    start, end = convertCodeRange(code)
+    softDottedRanges.append((start, end, None))
 
-# Write the module
+softDottedRanges = mergeRanges(softDottedRanges)
 
-path = os.path.join(os.path.dirname(compositor.__file__), "caseConversionMaps.py")
+# Write the module
 
-text = [
-    "# ------------",
-    "# DO NOT EDIT!",
-    "# ------------",
-    "# This was generated by tools/%s" % os.path.basename(__file__),
-    "# Generated on: %s" % (time.strftime("%a, %d %b %Y %H:%M:%S", time.localtime())),
+writeModule("caseConversionMaps.py", [
+    "# (start, end, step, delta) runs",
+    formatArray("lowerToSingleUpperRuns", "l", compressMapping(lowerToSingleUpper)),
     "",
-]
-
-toWrite = [
-    ("lowerToSingleUpper", lowerToSingleUpper),
-    ("upperToSingleLower", upperToSingleLower),
-    ("specialCasing", specialCasing),
-    ("softDotted", softDotted)
-]
-
-for name, d in toWrite:
-    s = "%s = %s" % (name, pprint.pformat(d, indent=4))
-    text.append(s)
-    text.append("")
-
-text = "\n".join(text)
-
-f = open(path, "w")
-f.write(text)
-f.close()
+    "# (start, end, step, delta) runs",
+    formatArray("upperToSingleLowerRuns", "l", compressMapping(upperToSingleLower)),
+    "",
+    "specialCasing = %s" % pprint.pformat(specialCasing, indent=4),
+    "",
+    formatArray("softDottedRangeStarts", "L", [start for start, end, value in softDottedRanges]),
+    formatArray("softDottedRangeEnds", "L", [end for start, end, value in softDottedRanges]),
+])